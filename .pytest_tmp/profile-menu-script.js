@@ -0,0 +1,88 @@
+
+(() => {
+  const $ = id => document.getElementById(id);
+  const closeMenu = id => {
+    const menu = $(id === "settings" ? "cw-settings-menu" : "cw-about-menu");
+    const button = $(id === "settings" ? "tab-settings" : "tab-about");
+    menu?.classList.add("hidden");
+    button?.setAttribute("aria-expanded", "false");
+  };
+  const closeAll = () => { closeMenu("settings"); closeMenu("about"); };
+  const toggleMenu = (id, event) => {
+    event?.preventDefault?.();
+    event?.stopPropagation?.();
+    const menu = $(id === "settings" ? "cw-settings-menu" : "cw-about-menu");
+    const button = $(id === "settings" ? "tab-settings" : "tab-about");
+    if (!menu || !button) return;
+    const open = menu.classList.contains("hidden");
+    closeAll();
+    menu.classList.toggle("hidden", !open);
+    button.setAttribute("aria-expanded", String(open));
+  };
+  const setHelp = open => {
+    const overlay = $("cw-help-overlay");
+    if (!overlay) return;
+    if (open) {
+      const frame = $("cw-help-frame");
+      if (frame && !frame.src) frame.src = "https://wiki.crosswatch.app";
+      overlay.classList.remove("hidden");
+      overlay.setAttribute("aria-hidden", "false");
+    } else {
+      overlay.classList.add("hidden");
+      overlay.setAttribute("aria-hidden", "true");
+    }
+  };
+  const ensureModals = async () => {
+    if (typeof window.openAbout === "function") return true;
+    try {
+      const version = encodeURIComponent(String(window.APP_VERSION || window["__CW_" + "VERSION__"] || Date.now()));
+      await import(`/assets/js/modals.js?v=${version}`);
+      return typeof window.openAbout === "function";
+    } catch (error) {
+      console.warn("[profile] modals.js failed to load", error);
+      return false;
+    }
+  };
+  const openSettings = pane => {
+    const paths = {
+      overview: "settings",
+      providers: "settings/providers",
+      pairs: "settings/sync",
+      sync: "settings/sync",
+      scrobbler: "settings/scrobbler",
+      scheduling: "settings/scheduling",
+      app: "settings/app",
+      maintenance: "settings/maintenance"
+    };
+    window.location.href = "/#" + (paths[pane] || "settings");
+  };
+  window.CW_CURRENT_VERSION = "v0.11.3";
+  window.APP_VERSION = "v0.11.3.1792357881";
+  window["__CW_" + "VERSION__"] = window.APP_VERSION;
+  window.cwOpenHelp = () => setHelp(true);
+  window.cwCloseHelp = () => setHelp(false);
+  window.openHelp = () => window.cwOpenHelp?.();
+  window.cwToggleSettingsMenu = event => toggleMenu("settings", event);
+  window.cwToggleAboutMenu = event => toggleMenu("about", event);
+  window.cwSettingsMenuSelect = pane => { closeMenu("settings"); openSettings(pane); };
+  window.cwAboutMenuSelect = async what => {
+    closeMenu("about");
+    if (what === "help") window.openHelp?.();
+    else if (await ensureModals()) window.openAbout?.();
+  };
+  window.cwSettingsMenuLogout = async () => {
+    closeMenu("settings");
+    try { await fetch("/api/app-auth/logout", { method: "POST", credentials: "same-origin", cache: "no-store" }); } catch {}
+    window.location.href = "/login";
+  };
+  document.addEventListener("click", event => {
+    const overlay = $("cw-help-overlay");
+    const card = $("cw-help-card");
+    if (overlay && !overlay.classList.contains("hidden") && card && !card.contains(event.target)) window.cwCloseHelp?.();
+    if (!$("tab-settings-menu")?.contains(event.target)) closeMenu("settings");
+    if (!$("tab-about-menu")?.contains(event.target)) closeMenu("about");
+  }, true);
+  document.addEventListener("keydown", event => {
+    if (event.key === "Escape") { window.cwCloseHelp?.(); closeAll(); }
+  }, true);
+})();
@@ -26,13 +26,10 @@ def dashboard_widgets(
 ) -> JSONResponse:
     try:
         from cw_platform.config_base import CONFIG, load_config
-        from cw_platform.orchestrator._state_store import StateStore
         from api.appAuthAPI import COOKIE_NAME, effective_user_profile_id
         from cw_platform.provider_instances import instances_for_user_profile
 
         requested = {part.strip() for part in include.split(",") if part.strip()}
-        state_features = requested & {"history", "ratings", "progress"}
-        state = StateStore(CONFIG).load_state_features(state_features) if state_features else {}
         cfg = load_config() or {}
         token = request.cookies.get(COOKIE_NAME) if request is not None else None
         profile = effective_user_profile_id(cfg, token, user_profile)
@@ -41,7 +38,7 @@ def dashboard_widgets(
         if scoped and not user_filter:
             user_filter = {"__NONE__": ["__NONE__"]}
         payload = dashboard_widgets_payload(
-            state,
+            None,
             history_limit=history_limit,
             ratings_limit=ratings_limit,
             scrobble_limit=scrobble_limit,
@@ -49,6 +46,7 @@ def dashboard_widgets(
             playlists_limit=playlists_limit,
             include=requested,
             user_filter=user_filter,
+            base_path=CONFIG,
         )
         if scoped:
             payload["user_profile"] = str(profile or "").strip()
@@ -17,7 +17,9 @@ from cw_platform.access_policy import managed_profile_instances, request_user, u
 from cw_platform.config_base import CONFIG as CONFIG_DIR, load_config
 from cw_platform.history_events import history_sync_key, is_history_event_key, minimal_history_item
 from cw_platform.id_map import canonical_key, merge_ids, minimal
-from cw_platform.local_db import crosswatch_db_path, manual_policy as sqlite_manual_policy
+from cw_platform.local_db import baseline_query, crosswatch_db_path, manual_policy as sqlite_manual_policy
+from cw_platform.local_db import state as sqlite_state
+from cw_platform.local_db.frozen import mutable_copy
 from cw_platform.modules_registry import load_sync_ops, state_read_features, sync_provider_names
 from cw_platform.orchestrator._applier import apply_add
 from cw_platform.orchestrator._snapshots import module_checkpoint
@@ -40,6 +42,7 @@ from services.editor import (
 router = APIRouter(prefix="/api/editor", tags=["editor"])
 
 _STATE_BASE = Path(CONFIG_DIR)
+_MISSING = object()
 
 
 def _is_admin_request(request: Request | None) -> bool:
@@ -282,6 +285,53 @@ def _load_policy_manual(
     return adds_items, blocks
 
 
+def _policy_feature_node(raw: dict[str, Any], kind: Kind, provider: str, provider_instance: str | None = None) -> dict[str, Any]:
+    providers = raw.get("providers")
+    if not isinstance(providers, dict):
+        providers = {}
+        raw["providers"] = providers
+
+    key = None
+    if provider in providers:
+        key = provider
+    else:
+        pl = str(provider).lower()
+        for k in providers.keys():
+            if str(k).lower() == pl:
+                key = str(k)
+                break
+    if key is None:
+        key = provider
+        providers[key] = {}
+
+    node = providers.get(key)
+    if not isinstance(node, dict):
+        node = {}
+        providers[key] = node
+
+    inst = normalize_instance_id(provider_instance)
+    if inst != "default":
+        insts = node.get("instances")
+        if not isinstance(insts, dict):
+            insts = {}
+            node["instances"] = insts
+        in_node = insts.get(inst)
+        if not isinstance(in_node, dict):
+            in_node = {}
+            insts[inst] = in_node
+        node = in_node
+
+    f = node.get(kind)
+    if not isinstance(f, dict):
+        f = {}
+        node[kind] = f
+    adds = f.get("adds")
+    if not isinstance(adds, dict):
+        adds = {}
+        f["adds"] = adds
+    return f
+
+
 def _save_policy_manual(
     kind: Kind,
     provider: str,
@@ -292,54 +342,9 @@ def _save_policy_manual(
     adds_items = _canonicalize_manual_items(adds_items, kind)
 
     def _mutate(raw: dict[str, Any]) -> None:
-        providers = raw.get("providers")
-        if not isinstance(providers, dict):
-            providers = {}
-            raw["providers"] = providers
-
-        key = None
-        if provider in providers:
-            key = provider
-        else:
-            pl = str(provider).lower()
-            for k in providers.keys():
-                if str(k).lower() == pl:
-                    key = str(k)
-                    break
-        if key is None:
-            key = provider
-            providers[key] = {}
-
-        node = providers.get(key)
-        if not isinstance(node, dict):
-            node = {}
-            providers[key] = node
-
-        inst = normalize_instance_id(provider_instance)
-        if inst != "default":
-            insts = node.get("instances")
-            if not isinstance(insts, dict):
-                insts = {}
-                node["instances"] = insts
-            in_node = insts.get(inst)
-            if not isinstance(in_node, dict):
-                in_node = {}
-                insts[inst] = in_node
-            node = in_node
-
-        f = node.get(kind)
-        if not isinstance(f, dict):
-            f = {}
-            node[kind] = f
-
+        f = _policy_feature_node(raw, kind, provider, provider_instance)
         f["blocks"] = list(blocks or [])
-
-        adds = f.get("adds")
-        if not isinstance(adds, dict):
-            adds = {}
-            f["adds"] = adds
-        adds["items"] = dict(adds_items or {})
-
+        f["adds"]["items"] = dict(adds_items or {})
 
     try:
         sqlite_manual_policy.update_policy(_STATE_BASE, _mutate)
@@ -1093,6 +1098,270 @@ def api_editor_save_state(payload: dict[str, Any] = Body(...), request: Request
         }
     raise HTTPException(status_code=400, detail=f"Unsupported source: {src}")
 
+_PAGE_SORTS = ("key", "title", "year", "type", "added_at", "watched_at", "rated_at", "rating", "progress_at")
+_NUMERIC_SORTS = {"year", "rating"}
+_PAGE_LIMIT_MAX = 1000
+
+
+def _page_sort_key(sort: str, key: str, item: Any) -> Any:
+    if sort == "key":
+        return key.lower()
+    value = item.get(sort) if isinstance(item, Mapping) else None
+    if value in (None, ""):
+        return None
+    if sort in _NUMERIC_SORTS:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+    return str(value).lower()
+
+
+def _page_items(
+    items: Mapping[str, Any],
+    *,
+    q: str | None,
+    media_type: str | None,
+    sort: str,
+    descending: bool,
+    offset: int,
+    limit: int,
+) -> tuple[int, dict[str, Any]]:
+    needle = str(q or "").strip().lower()
+    wanted = str(media_type or "").strip().lower()
+    rows: list[tuple[str, Any]] = []
+    for k, item in items.items():
+        it = item if isinstance(item, Mapping) else {}
+        if wanted and str(it.get("type") or "").strip().lower() != wanted:
+            continue
+        if needle and needle not in str(k).lower() and needle not in str(it.get("title") or "").lower():
+            continue
+        rows.append((str(k), item))
+    # Rows without the sort value stay last in both directions.
+    ranked = [(_page_sort_key(sort, k, item), k, item) for k, item in rows]
+    present = sorted((r for r in ranked if r[0] is not None), key=lambda r: (r[0], r[1]), reverse=descending)
+    missing = sorted((r for r in ranked if r[0] is None), key=lambda r: r[1])
+    window = (present + missing)[offset : offset + limit]
+    return len(ranked), {k: item for _v, k, item in window}
+
+
+def _baseline_page(
+    kind: Kind,
+    provider: str,
+    provider_instance: str,
+    *,
+    media_type: str | None,
+    descending: bool,
+    cursor: str | None,
+    limit: int,
+) -> tuple[int, dict[str, Any], str | None] | None:
+    # Key-ordered pages come straight from baseline_items; None means the feature has no rows.
+    scope = {"provider": provider, "instance": provider_instance, "feature": kind}
+    if not baseline_query.count_items(_STATE_BASE, **scope):
+        return None
+    wanted = str(media_type or "").strip().lower() or None
+    try:
+        page = baseline_query.page_items(
+            _STATE_BASE, **scope, media_type=wanted, descending=descending, cursor=cursor, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    total = baseline_query.count_items(_STATE_BASE, **scope, media_type=wanted)
+    return total, {row["key"]: row["item"] for row in page["items"]}, page["next_cursor"]
+
+
+@router.get("/items")
+def api_editor_get_items(
+    kind: str = "watchlist",
+    source: str = "state",
+    provider: str | None = None,
+    provider_instance: str | None = None,
+    q: str | None = None,
+    media_type: str | None = Query(None, alias="type"),
+    sort: str = "key",
+    order: str = "asc",
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=_PAGE_LIMIT_MAX),
+    cursor: str | None = None,
+    request: Request = cast(Request, None),
+) -> dict[str, Any]:
+    k = _normalize_kind(kind)
+    src = (source or "state").strip().lower()
+    if src not in ("state", "current", "manual", "manual-overrides", "policy", "overrides"):
+        raise HTTPException(status_code=400, detail=f"Unsupported source: {src}")
+    sort_key = (sort or "key").strip().lower()
+    if sort_key not in _PAGE_SORTS:
+        raise HTTPException(status_code=400, detail=f"Unsupported sort: {sort_key}")
+    manual = src not in ("state", "current")
+
+    descending = str(order or "").strip().lower() == "desc"
+
+    cfg = load_config() or {}
+    raw_policy = _load_policy()
+    state_providers = StateStore(_STATE_BASE).provider_names({k})
+    providers = _union_providers({"providers": {name: {} for name in state_providers}}, raw_policy)
+    providers = _filter_provider_names_for_request(cfg, request, providers)
+    chosen = (provider or "").strip() or (providers[0] if providers else "")
+    out: dict[str, Any] = {
+        "kind": k,
+        "source": "manual" if manual else "state",
+        "provider": chosen or None,
+        "provider_instance": None,
+        "total": 0,
+        "offset": offset,
+        "limit": limit,
+        "items": {},
+        "next_cursor": None,
+    }
+    if not chosen:
+        return out
+
+    inst = _instance_for_request(cfg, request, chosen, provider_instance)
+    _require_instance_scope(cfg, request, chosen, inst)
+    pol_adds, pol_blocks = _load_policy_manual(k, chosen, inst, raw_policy=raw_policy)
+    paged = None
+    if manual:
+        if not pol_adds and not pol_blocks:
+            pol_adds, pol_blocks = _load_state_manual(k, chosen, inst)
+        items = pol_adds
+    elif sort_key == "key" and not (q or "").strip() and (cursor or not offset):
+        paged = _baseline_page(k, chosen, inst, media_type=media_type, descending=descending, cursor=cursor, limit=limit)
+    if paged is not None:
+        total, page, out["next_cursor"] = paged
+    else:
+        if not manual:
+            # Other sorts and text search rank one feature block in memory, never the whole state.
+            items = sqlite_state.load_feature_items(_STATE_BASE, chosen, inst, k) or _load_tracker_items(k, chosen, inst)
+        total, page = _page_items(
+            items,
+            q=q,
+            media_type=media_type,
+            sort=sort_key,
+            descending=descending,
+            offset=offset,
+            limit=limit,
+        )
+    out.update(
+        {
+            "provider_instance": inst,
+            "total": total,
+            "items": page,
+            "manual_count": len(pol_adds),
+            "manual_blocks": _normalize_blocks(pol_blocks),
+        }
+    )
+    return out
+
+
+def _patch_target(path: Any) -> tuple[str, str, str | None]:
+    parts = [p.replace("~1", "/").replace("~0", "~") for p in str(path or "").split("/")[1:]]
+    if len(parts) < 2 or parts[0] not in ("items", "blocks") or not parts[1].strip():
+        raise HTTPException(status_code=400, detail=f"Invalid patch path: {path!r}")
+    if parts[0] == "blocks" and len(parts) != 2:
+        raise HTTPException(status_code=400, detail=f"Invalid patch path: {path!r}")
+    if len(parts) > 3:
+        raise HTTPException(status_code=400, detail=f"Invalid patch path: {path!r}")
+    return parts[0], parts[1].strip(), parts[2] if len(parts) == 3 else None
+
+
+def _apply_editor_patch(items: dict[str, Any], blocks: list[str], ops: list[Any]) -> int:
+    applied = 0
+    for op_raw in ops:
+        if not isinstance(op_raw, Mapping):
+            raise HTTPException(status_code=400, detail="Patch operations must be objects")
+        op = str(op_raw.get("op") or "").strip().lower()
+        section, key, field = _patch_target(op_raw.get("path"))
+        value = op_raw.get("value")
+        if section == "blocks":
+            lowered = [b.lower() for b in blocks]
+            if op == "add":
+                if key.lower() not in lowered:
+                    blocks.append(key)
+            elif op == "remove":
+                if key.lower() not in lowered:
+                    raise HTTPException(status_code=409, detail=f"Block not found: {key}")
+                del blocks[lowered.index(key.lower())]
+            else:
+                raise HTTPException(status_code=400, detail=f"Unsupported op for blocks: {op!r}")
+        elif field is None:
+            if op in ("add", "replace"):
+                if not isinstance(value, Mapping):
+                    raise HTTPException(status_code=400, detail="Item value must be an object")
+                if op == "replace" and key not in items:
+                    raise HTTPException(status_code=409, detail=f"Item not found: {key}")
+                items[key] = dict(value)
+            elif op == "remove":
+                if items.pop(key, None) is None:
+                    raise HTTPException(status_code=409, detail=f"Item not found: {key}")
+            else:
+                raise HTTPException(status_code=400, detail=f"Unsupported op: {op!r}")
+        else:
+            current = items.get(key)
+            if not isinstance(current, Mapping):
+                raise HTTPException(status_code=409, detail=f"Item not found: {key}")
+            nxt = dict(current)
+            if op in ("add", "replace"):
+                if op == "replace" and field not in nxt:
+                    raise HTTPException(status_code=409, detail=f"Field not found: {key}/{field}")
+                nxt[field] = value
+            elif op == "remove":
+                if nxt.pop(field, _MISSING) is _MISSING:
+                    raise HTTPException(status_code=409, detail=f"Field not found: {key}/{field}")
+            else:
+                raise HTTPException(status_code=400, detail=f"Unsupported op: {op!r}")
+            items[key] = nxt
+        applied += 1
+    return applied
+
+
+@router.patch("")
+def api_editor_patch_state(payload: dict[str, Any] = Body(...), request: Request = cast(Request, None)) -> dict[str, Any]:
+    kind = _normalize_kind(str(payload.get("kind") or "watchlist"))
+    src = str(payload.get("source") or "state").strip().lower()
+    if src not in ("state", "current", "manual", "manual-overrides", "policy", "overrides"):
+        raise HTTPException(status_code=400, detail=f"Unsupported source: {src}")
+    ops = payload.get("ops")
+    if not isinstance(ops, list) or not ops:
+        raise HTTPException(status_code=400, detail="Missing patch operations")
+    provider = str(payload.get("provider") or "").strip()
+    if not provider:
+        raise HTTPException(status_code=400, detail=f"Missing provider for source={src}")
+    cfg = load_config() or {}
+    inst = _instance_for_request(cfg, request, provider, payload.get("provider_instance"))
+    _require_instance_scope(cfg, request, provider, inst)
+
+    def _mutate(raw: dict[str, Any]) -> dict[str, int]:
+        f = _policy_feature_node(raw, kind, provider, inst)
+        current = f["adds"].get("items")
+        items = {str(k): v for k, v in current.items()} if isinstance(current, dict) else {}
+        blocks = _normalize_blocks(f.get("blocks"))
+        applied = _apply_editor_patch(items, blocks, ops)
+        f["blocks"] = blocks
+        f["adds"]["items"] = _canonicalize_manual_items(items, kind)
+        return {"applied": applied, "count": len(f["adds"]["items"]), "blocks": len(blocks)}
+
+    try:
+        _raw, result = sqlite_manual_policy.update_policy(_STATE_BASE, _mutate)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to write policy: {e}")
+    ts = None
+    try:
+        ts = _policy_mtime()
+    except Exception:
+        ts = None
+    return {
+        "ok": True,
+        "kind": kind,
+        "source": "manual" if src not in ("state", "current") else "state",
+        "provider": provider,
+        "provider_instance": inst,
+        **result,
+        "ts": ts,
+    }
+
+
 @router.get("/state/manual/export")
 def api_editor_state_manual_export(request: Request = cast(Request, None)) -> StreamingResponse:
     if not _is_admin_request(request):
@@ -1600,7 +1869,7 @@ def api_editor_state_import(payload: dict[str, Any] = Body(...), request: Reques
     feats_supported = state_read_features(ops)
 
     store = _state_store()
-    state = store.load_state_features(set(features)) if not dry_run else {"providers": {}, "wall": [], "last_sync_epoch": None}
+    state = mutable_copy(store.load_state_features(set(features))) if not dry_run else {"providers": {}, "wall": [], "last_sync_epoch": None}
 
     providers_block = state.get("providers")
     if not isinstance(providers_block, dict):
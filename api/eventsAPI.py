@@ -38,6 +38,7 @@ from cw_platform.event_archive import (
     events_db_path,
 )
 from cw_platform.event_archive.groups import run_problem_items as _run_problem_items
+from cw_platform.event_archive import rollups as _rollups
 from cw_platform.access_policy import filter_pairs_for_user, pair_refs, request_user, user_can_access_instance
 from cw_platform.config_base import load_config
 from cw_platform.provider_instances import normalize_instance_id
@@ -726,6 +727,8 @@ def events_clear(payload: dict[str, Any] | None = Body(None), request: Request =
                 if domain == "sync":
                     conn.execute("DELETE FROM sync_runs")
                     conn.execute("DELETE FROM event_imports")
+            # Rollups are rebuilt from whatever survived on the next stats read.
+            _rollups.reset(conn)
         return _ok({"ok": True, "cleared": True, "domain": domain or "all"})
     except Exception:
         _LOG.exception("events clear failed")
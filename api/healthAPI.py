@@ -26,3 +26,10 @@ def api_health() -> JSONResponse:
 @router.get("/healthz", include_in_schema=False)
 def healthz() -> JSONResponse:
     return JSONResponse(_health_payload(), headers={"Cache-Control": "no-store"})
+
+
+@router.get("/api/health/startup")
+def api_health_startup() -> JSONResponse:
+    from cw_platform import startup_profile
+
+    return JSONResponse(startup_profile.report(), headers={"Cache-Control": "no-store"})
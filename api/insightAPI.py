@@ -319,6 +319,29 @@ def register_insights(app: FastAPI) -> None:
 
         return {"ok": True, **base}
 
+    @app.get("/api/insights/http", tags=["insight"])
+    def api_insights_http(
+        minutes: int = Query(60, ge=1, le=60 * 24 * 14),
+        provider: str = Query(""),
+        instance: str = Query(""),
+        by_minute: int = Query(0),
+    ) -> JSONResponse:
+        from cw_platform import http_metrics
+
+        try:
+            rows = http_metrics.summary(
+                minutes=minutes,
+                provider=provider or None,
+                instance=instance or None,
+                by_minute=bool(by_minute),
+            )
+        except Exception as e:
+            return JSONResponse({"ok": False, "error": str(e)}, status_code=500)
+        return JSONResponse(
+            {"ok": True, "minutes": minutes, "endpoints": rows},
+            headers={"Cache-Control": "no-store"},
+        )
+
     @app.post("/api/crosswatch/select-snapshot", tags=["insight"])
     def api_select_snapshot(
         feature: str = Query(..., pattern="^(watchlist|history|ratings|progress)$"),
@@ -20,6 +20,7 @@ from fastapi import APIRouter, Body, File, Query, UploadFile
 from fastapi.responses import StreamingResponse
 
 from cw_platform.local_db import crosswatch_db_path
+from cw_platform.local_db import guard_state
 from cw_platform.local_db.currently_watching import clear_streams as clear_currently_watching_streams
 from cw_platform.local_db.currently_watching import stream_count as currently_watching_stream_count
 from cw_platform.local_db.diagnostics import diagnostics as local_db_diagnostics
@@ -1086,12 +1087,14 @@ def clear_state_minimal() -> dict[str, Any]:
         for p in scoped:
             if _safe_remove_path(p):
                 removed_scoped.append(p.name)
+        guard_rows = guard_state.clear(CONFIG_DIR, [guard_state.TOMBSTONE, guard_state.UNRESOLVED])
         after_usage = _paths_usage(_sync_state_storage_paths(CONFIG_DIR))
         return {
             "ok": True,
             "path": str(state_path),
             "existed": bool(existed),
             "removed_sync_state": removed_scoped,
+            "removed_guard_rows": guard_rows,
             "summary": _cleanup_summary(before_usage, after_usage),
         }
     except Exception as e:
@@ -1338,7 +1341,7 @@ def crosswatch_tracker_clear(
 
 @router.post("/clear-cache")
 def clear_cache() -> dict[str, Any]:
-    _, _, CW_STATE_DIR, *_ = _cw()
+    _, CONFIG_DIR, CW_STATE_DIR, *_ = _cw()
 
     before = _scan_provider_cache()
     before_usage = {
@@ -1347,6 +1350,10 @@ def clear_cache() -> dict[str, Any]:
         "modified": None,
     }
     removed = _clear_cw_state_files()
+    try:
+        guard_rows = guard_state.clear(CONFIG_DIR, [guard_state.BLACKBOX, guard_state.FLAP, guard_state.PHANTOM, guard_state.LAST_SUCCESS])
+    except Exception:
+        guard_rows = 0
     after = _scan_provider_cache()
     after_usage = {
         "files": len(after.get("files") or []),
@@ -1358,6 +1365,7 @@ def clear_cache() -> dict[str, Any]:
         "ok": True,
         "root": str(CW_STATE_DIR),
         "removed": removed,
+        "removed_guard_rows": guard_rows,
         "before": before,
         "after": after,
         "summary": _cleanup_summary(before_usage, after_usage),
@@ -3,10 +3,12 @@
 # Copyright (c) 2025-2026 CrossWatch / Cenodude
 from __future__ import annotations
 
+import json
+from collections.abc import Iterator
 from typing import Any, cast
 
 from fastapi import APIRouter, Body, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from services.playback_progress import get_service
 from services.playback_progress.models import utc_now_iso
@@ -84,6 +86,46 @@ def api_playback_progress_items(
     )
 
 
+@router.get("/items/stream")
+def api_playback_progress_items_stream(
+    request: Request = cast(Request, None),
+    provider: str | None = Query(None),
+    instance_id: str | None = Query(None),
+    media_type: str | None = Query(None),
+    progress_min: float | None = Query(None, ge=0, le=100),
+    progress_max: float | None = Query(None, ge=0, le=100),
+    age: str | None = Query(None),
+    rating_min: float | None = Query(None, ge=0, le=10),
+    search: str | None = Query(None),
+    sort: str = Query("last_updated"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(50, ge=1, le=250),
+    force_refresh: bool = Query(False),
+    user_profile: str = Query(""),
+) -> StreamingResponse:
+    events = get_service().items_stream(
+        provider=provider,
+        instance_id=instance_id,
+        media_type=media_type,
+        progress_min=progress_min,
+        progress_max=progress_max,
+        age=age,
+        rating_min=rating_min,
+        search=search,
+        sort=sort,
+        page=page,
+        page_size=page_size,
+        force_refresh=force_refresh,
+        user_filter=_playback_user_filter(request, user_profile),
+    )
+
+    def _lines() -> Iterator[str]:
+        for event in events:
+            yield json.dumps(event, ensure_ascii=False, default=str) + "\n"
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson", headers={"Cache-Control": "no-store"})
+
+
 def _action_status(result: dict[str, Any]) -> int:
     if result.get("ok"):
         return 200
@@ -3,6 +3,7 @@
 # Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
 from __future__ import annotations
 
+import importlib.util
 import json
 import os
 import secrets
@@ -11,7 +12,9 @@ import time
 import urllib.error
 import urllib.parse
 import urllib.request
+import random
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeout
 from typing import Any, Callable, Mapping
 
 import requests
@@ -36,11 +39,7 @@ try:
 except Exception:
     TRAKT_AUTH_PROVIDER = None
 
-try:
-    from plexapi.myplex import MyPlexAccount
-    HAVE_PLEXAPI = True
-except Exception:
-    HAVE_PLEXAPI = False
+HAVE_PLEXAPI = importlib.util.find_spec("plexapi") is not None
 
 # env
 HTTP_TIMEOUT = int(os.environ.get("CW_PROBE_HTTP_TIMEOUT", "6"))
@@ -48,6 +47,10 @@ HTTP_RETRIES = int(os.environ.get("CW_PROBE_HTTP_RETRIES", "1"))
 STATUS_TTL = int(os.environ.get("CW_STATUS_TTL", "60"))
 PROBE_TTL = int(os.environ.get("CW_PROBE_TTL", "15"))
 USERINFO_TTL = int(os.environ.get("CW_USERINFO_TTL", "600"))
+STATUS_REFRESH_SECONDS = float(os.environ.get("CW_STATUS_REFRESH", str(max(15, STATUS_TTL // 2))))
+PROBE_DEADLINE = float(os.environ.get("CW_PROBE_DEADLINE", str(HTTP_TIMEOUT * (HTTP_RETRIES + 1) + 2)))
+PROBE_BUSY_RPM = int(os.environ.get("CW_PROBE_BUSY_RPM", "30"))
+BUSY_PROBE_MAX_AGE = 10**9
 PROVIDERS: tuple[str, ...] = (
     "crosswatch",
     "plex",
@@ -1491,6 +1494,8 @@ def plex_user_info(cfg: dict[str, Any], max_age_sec: int = USERINFO_TTL) -> dict
 
     if HAVE_PLEXAPI:
         try:
+            from plexapi.myplex import MyPlexAccount
+
             acc = MyPlexAccount(token=token)  # type: ignore[call-arg]
             plexpass = bool(getattr(acc, "subscriptionActive", None) or getattr(acc, "hasPlexPass", None))
             plan = getattr(acc, "subscriptionPlan", None) or None
@@ -2039,6 +2044,141 @@ def _safe_userinfo(
     except Exception:
         return {}
 
+def _last_probe_result(pkey: str, reason: str) -> tuple[bool, str]:
+    cached = PROBE_DETAIL_CACHE.get(pkey)
+    if cached:
+        return cached[1], cached[2]
+    return False, reason
+
+
+def _status_cached() -> tuple[dict[str, Any] | None, float]:
+    data, ts = STATUS_CACHE.get("data"), float(STATUS_CACHE.get("ts") or 0.0)
+    if not data:
+        return None, 1e9
+    return data, max(0.0, time.time() - ts)
+
+
+def _store_status(data: dict[str, Any]) -> None:
+    STATUS_CACHE["ts"] = time.time()
+    STATUS_CACHE["data"] = data
+
+
+def _busy_providers() -> frozenset[str]:
+    # Providers a running sync is already hitting hard; their probes reuse the last result.
+    try:
+        from api.syncAPI import _summary_snapshot
+
+        if not _summary_snapshot().get("running"):
+            return frozenset()
+        from cw_platform import http_metrics
+
+        counts = http_metrics.METRICS.recent_requests(within=60)
+    except Exception:
+        return frozenset()
+    return frozenset(p for p, n in counts.items() if n >= PROBE_BUSY_RPM)
+
+
+class StatusRefresher:
+    """Rebuilds the shared ``/api/status`` payload off the request path.
+
+    ``revalidate`` runs one build in the background when a caller was served
+    a stale cache; ``start`` adds a jittered periodic loop so the cache is
+    normally warm before anyone asks.
+    """
+
+    def __init__(self, interval: float = STATUS_REFRESH_SECONDS, jitter: float = 0.15) -> None:
+        self.interval = max(1.0, float(interval))
+        self.jitter = max(0.0, min(0.5, float(jitter)))
+        self.builder: Callable[[frozenset[str]], dict[str, Any]] | None = None
+        self._lock = threading.Lock()
+        self._inflight = False
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.runs = 0
+        self.failures = 0
+        self.skipped: dict[str, int] = {}
+        self.last_ms = 0
+        self.last_ts = 0.0
+
+    def refresh(self) -> dict[str, Any] | None:
+        builder = self.builder
+        if builder is None:
+            return None
+        busy = _busy_providers()
+        t0 = time.perf_counter()
+        try:
+            with STATUS_LOCK:
+                data = builder(busy)
+                _store_status(data)
+        except Exception:
+            self.failures += 1
+            return None
+        self.runs += 1
+        self.last_ms = int((time.perf_counter() - t0) * 1000)
+        self.last_ts = time.time()
+        for prov in busy:
+            self.skipped[prov] = self.skipped.get(prov, 0) + 1
+        return data
+
+    def _run_once(self) -> None:
+        try:
+            self.refresh()
+        finally:
+            with self._lock:
+                self._inflight = False
+
+    def revalidate(self) -> bool:
+        with self._lock:
+            if self._inflight or self.builder is None:
+                return False
+            self._inflight = True
+        threading.Thread(target=self._run_once, name="cw-status-revalidate", daemon=True).start()
+        return True
+
+    def _next_delay(self) -> float:
+        return self.interval * (1.0 + random.uniform(-self.jitter, self.jitter))
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self._next_delay()):
+            with self._lock:
+                if self._inflight:
+                    continue
+                self._inflight = True
+            self._run_once()
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="cw-status-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "running": bool(self._thread and self._thread.is_alive() and not self._stop.is_set()),
+            "interval": self.interval,
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped_busy": dict(self.skipped),
+            "last_ms": self.last_ms,
+            "last_ts": int(self.last_ts),
+        }
+
+
+STATUS_REFRESHER = StatusRefresher()
+
+
+def start_status_refresher() -> None:
+    STATUS_REFRESHER.start()
+
+
+def stop_status_refresher() -> None:
+    STATUS_REFRESHER.stop()
+
+
 # Connection status
 def connected_status(cfg: dict[str, Any]) -> tuple[bool, bool, bool, bool, bool, bool, bool]:
     plex_ok, _ = _safe_probe_detail(_probe_plex_detail, cfg, max_age_sec=PROBE_TTL)
@@ -2095,690 +2235,721 @@ def register_probes(app: FastAPI, load_config_fn: Callable[[], dict[str, Any]])
         except Exception:
             return ""
 
-    @app.get("/api/status", tags=["Probes"])
-    def api_status(request: Request, fresh: int = Query(0), user_profile: str = Query("")) -> JSONResponse:
-        cfg0 = load_config_fn() or {}
-        scoped_user = request_user(request)
-        scope_profile = _status_scope_profile(cfg0, request, user_profile)
-        managed_scope = bool(scope_profile) or bool(scoped_user and not scoped_user.get("is_admin"))
+    def _build_status(
+        cfg: dict[str, Any],
+        *,
+        scope_profile: str = "",
+        scoped_user: Any = None,
+        managed_scope: bool = False,
+        busy: frozenset[str] = frozenset(),
+    ) -> dict[str, Any]:
         now = time.time()
-        cached = STATUS_CACHE["data"]
-        age = (now - STATUS_CACHE["ts"]) if cached else 1e9
-        if not managed_scope and not fresh and cached and age < STATUS_TTL:
-            return JSONResponse(cached, headers={"Cache-Control": "no-store"})
+        pairs = cfg.get("pairs") or []
+        if scope_profile:
+            pairs = filter_pairs_for_profile(cfg, scope_profile, [p for p in pairs if isinstance(p, dict)])
+        elif managed_scope:
+            pairs = filter_pairs_for_user(cfg, scoped_user, [p for p in pairs if isinstance(p, dict)])
+        enabled_pairs = [p for p in pairs if isinstance(p, dict) and p.get("enabled", True) is not False]
+        any_pair_ready = any(_pair_ready(cfg, p) for p in enabled_pairs)
+
+        probe_age = PROBE_TTL
+        user_age = USERINFO_TTL
+
+        def _pair_targets() -> set[tuple[str, str]]:
+            used: set[tuple[str, str]] = set()
+
+            def _name(x: Any) -> str:
+                if isinstance(x, str):
+                    return x
+                if isinstance(x, dict):
+                    return x.get("provider") or x.get("name") or x.get("id") or x.get("type") or ""
+                return ""
 
-        with STATUS_LOCK:
-            now = time.time()
-            cached = STATUS_CACHE["data"]
-            age = (now - STATUS_CACHE["ts"]) if cached else 1e9
-            if not managed_scope and not fresh and cached and age < STATUS_TTL:
-                return JSONResponse(cached, headers={"Cache-Control": "no-store"})
-
-            cfg = cfg0 if managed_scope else (load_config_fn() or {})
-            pairs = cfg.get("pairs") or []
-            if scope_profile:
-                pairs = filter_pairs_for_profile(cfg, scope_profile, [p for p in pairs if isinstance(p, dict)])
-            elif managed_scope:
-                pairs = filter_pairs_for_user(cfg, scoped_user, [p for p in pairs if isinstance(p, dict)])
-            enabled_pairs = [p for p in pairs if isinstance(p, dict) and p.get("enabled", True) is not False]
-            any_pair_ready = any(_pair_ready(cfg, p) for p in enabled_pairs)
-
-            probe_age = PROBE_TTL
-            user_age = USERINFO_TTL
-
-            def _pair_targets() -> set[tuple[str, str]]:
-                used: set[tuple[str, str]] = set()
-
-                def _name(x: Any) -> str:
-                    if isinstance(x, str):
-                        return x
-                    if isinstance(x, dict):
-                        return x.get("provider") or x.get("name") or x.get("id") or x.get("type") or ""
-                    return ""
-
-                for p in enabled_pairs:
-                    a = _name(p.get("source") or p.get("a") or p.get("src") or p.get("from")).upper().strip()
-                    b = _name(p.get("target") or p.get("b") or p.get("dst") or p.get("to")).upper().strip()
-                    if a in DETAIL_PROBES:
-                        used.add((a, normalize_instance_id(p.get("source_instance") or "default")))
-                    if b in DETAIL_PROBES:
-                        used.add((b, normalize_instance_id(p.get("target_instance") or "default")))
-                return used
+            for p in enabled_pairs:
+                a = _name(p.get("source") or p.get("a") or p.get("src") or p.get("from")).upper().strip()
+                b = _name(p.get("target") or p.get("b") or p.get("dst") or p.get("to")).upper().strip()
+                if a in DETAIL_PROBES:
+                    used.add((a, normalize_instance_id(p.get("source_instance") or "default")))
+                if b in DETAIL_PROBES:
+                    used.add((b, normalize_instance_id(p.get("target_instance") or "default")))
+            return used
 
 
 
-            def _canon_probe_code(v: Any) -> str:
-                s = str(v or "").upper().strip()
-                if not s:
-                    return ""
-                if s in ("MDB", "MDB_LIST", "MDBLIST"):
-                    return "MDBLIST"
-                if s == "TMDB_SYNC":
-                    return "TMDB"
-                return s
-
-            def _watcher_targets(cfg0: dict[str, Any]) -> set[tuple[str, str]]:
-                out: set[tuple[str, str]] = set()
-                sc = cfg0.get("scrobble") or {}
-                w = (sc.get("watch") or {}) if isinstance(sc, dict) else {}
-                routes = w.get("routes") if isinstance(w, dict) else None
-                routes = routes if isinstance(routes, list) else []
-
-                def _add(code: Any, inst: Any) -> None:
-                    c = _canon_probe_code(code)
-                    if c and c in DETAIL_PROBES:
-                        out.add((c, normalize_instance_id(inst or "default")))
-
-                any_enabled_route = any(isinstance(r, dict) and r.get("enabled", True) is not False and (r.get("provider") or r.get("sink")) for r in routes)
-                if any_enabled_route:
-                    for r in routes:
-                        if not isinstance(r, dict) or r.get("enabled", True) is False:
-                            continue
-                        _add(r.get("provider"), r.get("provider_instance") or r.get("providerInstance") or r.get("source_instance") or "default")
-                        _add(r.get("sink"), r.get("sink_instance") or r.get("sinkInstance") or r.get("target_instance") or "default")
-                    return out
-
-                # Legacy watcher: only count it as configured when sinks are set.
-                provider = _canon_probe_code(w.get("provider")) if isinstance(w, dict) else ""
-                sinks_raw = (w.get("sink") or "") if isinstance(w, dict) else ""
-                sinks = [s.strip() for s in str(sinks_raw).split(",") if s.strip()]
-                if not sinks:
-                    return out
-
-                _add(provider, "default")
-                for s in sinks:
-                    _add(s, "default")
+        def _canon_probe_code(v: Any) -> str:
+            s = str(v or "").upper().strip()
+            if not s:
+                return ""
+            if s in ("MDB", "MDB_LIST", "MDBLIST"):
+                return "MDBLIST"
+            if s == "TMDB_SYNC":
+                return "TMDB"
+            return s
+
+        def _watcher_targets(cfg0: dict[str, Any]) -> set[tuple[str, str]]:
+            out: set[tuple[str, str]] = set()
+            sc = cfg0.get("scrobble") or {}
+            w = (sc.get("watch") or {}) if isinstance(sc, dict) else {}
+            routes = w.get("routes") if isinstance(w, dict) else None
+            routes = routes if isinstance(routes, list) else []
+
+            def _add(code: Any, inst: Any) -> None:
+                c = _canon_probe_code(code)
+                if c and c in DETAIL_PROBES:
+                    out.add((c, normalize_instance_id(inst or "default")))
+
+            any_enabled_route = any(isinstance(r, dict) and r.get("enabled", True) is not False and (r.get("provider") or r.get("sink")) for r in routes)
+            if any_enabled_route:
+                for r in routes:
+                    if not isinstance(r, dict) or r.get("enabled", True) is False:
+                        continue
+                    _add(r.get("provider"), r.get("provider_instance") or r.get("providerInstance") or r.get("source_instance") or "default")
+                    _add(r.get("sink"), r.get("sink_instance") or r.get("sinkInstance") or r.get("target_instance") or "default")
                 return out
 
-            allowed_instances = (
-                profile_instances_map(cfg, scope_profile)
-                if scope_profile
-                else (managed_profile_instances(cfg, scoped_user) if managed_scope else {})
-            )
+            # Legacy watcher: only count it as configured when sinks are set.
+            provider = _canon_probe_code(w.get("provider")) if isinstance(w, dict) else ""
+            sinks_raw = (w.get("sink") or "") if isinstance(w, dict) else ""
+            sinks = [s.strip() for s in str(sinks_raw).split(",") if s.strip()]
+            if not sinks:
+                return out
 
-            def _scope_allows(prov: str, inst: Any) -> bool:
-                if not managed_scope:
-                    return True
-                return normalize_instance_id(inst) in set(allowed_instances.get(prov) or [])
+            _add(provider, "default")
+            for s in sinks:
+                _add(s, "default")
+            return out
 
-            pair_targets = _pair_targets()
-            watcher_targets = _watcher_targets(cfg)
+        allowed_instances = (
+            profile_instances_map(cfg, scope_profile)
+            if scope_profile
+            else (managed_profile_instances(cfg, scoped_user) if managed_scope else {})
+        )
 
-            # Only probe things that are actually visible/used: enabled sync pairs and configured watcher routes.
-            targets: set[tuple[str, str]] = set()
-            prov_sources: dict[str, set[str]] = {}
-            used_instances: dict[str, set[str]] = {}
+        def _scope_allows(prov: str, inst: Any) -> bool:
+            if not managed_scope:
+                return True
+            return normalize_instance_id(inst) in set(allowed_instances.get(prov) or [])
 
-            for prov, inst in pair_targets:
-                c = _canon_probe_code(prov)
-                if not c or not _scope_allows(c, inst):
-                    continue
-                targets.add((c, inst))
-                prov_sources.setdefault(c, set()).add("pair")
-                used_instances.setdefault(c, set()).add(normalize_instance_id(inst))
+        pair_targets = _pair_targets()
+        watcher_targets = _watcher_targets(cfg)
 
-            for prov, inst in watcher_targets:
-                c = _canon_probe_code(prov)
-                if not c or not _scope_allows(c, inst):
-                    continue
-                targets.add((c, inst))
-                prov_sources.setdefault(c, set()).add("watcher")
-                used_instances.setdefault(c, set()).add(normalize_instance_id(inst))
+        # Only probe things that are actually visible/used: enabled sync pairs and configured watcher routes.
+        targets: set[tuple[str, str]] = set()
+        prov_sources: dict[str, set[str]] = {}
+        used_instances: dict[str, set[str]] = {}
+
+        for prov, inst in pair_targets:
+            c = _canon_probe_code(prov)
+            if not c or not _scope_allows(c, inst):
+                continue
+            targets.add((c, inst))
+            prov_sources.setdefault(c, set()).add("pair")
+            used_instances.setdefault(c, set()).add(normalize_instance_id(inst))
 
-            configured_instances: dict[str, set[str]] = {}
-            for prov in DETAIL_PROBES.keys():
-                ck = _cfg_key(prov)
+        for prov, inst in watcher_targets:
+            c = _canon_probe_code(prov)
+            if not c or not _scope_allows(c, inst):
+                continue
+            targets.add((c, inst))
+            prov_sources.setdefault(c, set()).add("watcher")
+            used_instances.setdefault(c, set()).add(normalize_instance_id(inst))
+
+        configured_instances: dict[str, set[str]] = {}
+        for prov in DETAIL_PROBES.keys():
+            ck = _cfg_key(prov)
+            insts = {
+                normalize_instance_id(inst)
+                for inst in list_instance_ids(cfg, ck)
+            }
+            if managed_scope:
+                insts &= set(allowed_instances.get(prov) or [])
+            if managed_scope or prov == "NUVIO":
                 insts = {
-                    normalize_instance_id(inst)
-                    for inst in list_instance_ids(cfg, ck)
+                    inst
+                    for inst in insts
+                    if _prov_configured(cfg, prov, inst)
                 }
-                if managed_scope:
-                    insts &= set(allowed_instances.get(prov) or [])
-                if managed_scope or prov == "NUVIO":
-                    insts = {
-                        inst
-                        for inst in insts
-                        if _prov_configured(cfg, prov, inst)
-                    }
-                else:
-                    insts = {
-                        inst
-                        for inst in insts
-                        if inst != "default" or _prov_configured(cfg, prov, inst)
-                    }
-                if insts:
-                    configured_instances[prov] = insts
-
-            def _probe_targets_for(prov: str) -> set[str]:
-                insts = configured_instances.get(prov) or set()
-                if not insts:
-                    return set()
-                if prov == "CROSSWATCH":
-                    return set(insts)
-                used = {
+            else:
+                insts = {
                     inst
-                    for inst in (used_instances.get(prov) or set())
-                    if inst in insts
+                    for inst in insts
+                    if inst != "default" or _prov_configured(cfg, prov, inst)
                 }
-                if used:
-                    return used
-                ready = {inst for inst in insts if _prov_configured(cfg, prov, inst)}
-                pool = ready or insts
-                if "default" in pool:
-                    return {"default"}
-                return {sorted(pool, key=lambda x: (x != "default", x))[0]}
-
-            for prov in DETAIL_PROBES.keys():
-                for inst in _probe_targets_for(prov):
-                    targets.add((prov, inst))
-
-            active_providers = {p for p, _ in targets}
-
-            debug = bool((cfg.get("runtime") or {}).get("debug"))
-
-            jobs_by_key: dict[str, tuple[str, dict[str, Any], Callable[..., tuple[bool, str]]]] = {}
-            refs: dict[tuple[str, str], str] = {}
-            for prov, inst in sorted(targets):
-                view = _cfg_view_for(cfg, prov, inst)
-                pid = _cfg_key(prov)
-                pkey = _probe_key(pid, view)
-                refs[(prov, inst)] = pkey
-                if pkey not in jobs_by_key:
-                    jobs_by_key[pkey] = (prov, view, DETAIL_PROBES[prov])
-
-            results_by_key: dict[str, tuple[bool, str]] = {}
-            with ThreadPoolExecutor(max_workers=max(1, min(12, len(jobs_by_key)))) as ex:
-                futs = {ex.submit(_safe_probe_detail, fn, view, probe_age): pkey for pkey, (prov, view, fn) in jobs_by_key.items()}
-                for f in as_completed(futs):
+            if insts:
+                configured_instances[prov] = insts
+
+        def _probe_targets_for(prov: str) -> set[str]:
+            insts = configured_instances.get(prov) or set()
+            if not insts:
+                return set()
+            if prov == "CROSSWATCH":
+                return set(insts)
+            used = {
+                inst
+                for inst in (used_instances.get(prov) or set())
+                if inst in insts
+            }
+            if used:
+                return used
+            ready = {inst for inst in insts if _prov_configured(cfg, prov, inst)}
+            pool = ready or insts
+            if "default" in pool:
+                return {"default"}
+            return {sorted(pool, key=lambda x: (x != "default", x))[0]}
+
+        for prov in DETAIL_PROBES.keys():
+            for inst in _probe_targets_for(prov):
+                targets.add((prov, inst))
+
+        active_providers = {p for p, _ in targets}
+
+        debug = bool((cfg.get("runtime") or {}).get("debug"))
+
+        jobs_by_key: dict[str, tuple[str, dict[str, Any], Callable[..., tuple[bool, str]]]] = {}
+        refs: dict[tuple[str, str], str] = {}
+        for prov, inst in sorted(targets):
+            view = _cfg_view_for(cfg, prov, inst)
+            pid = _cfg_key(prov)
+            pkey = _probe_key(pid, view)
+            refs[(prov, inst)] = pkey
+            if pkey not in jobs_by_key:
+                jobs_by_key[pkey] = (prov, view, DETAIL_PROBES[prov])
+
+        results_by_key: dict[str, tuple[bool, str]] = {}
+        ex = ThreadPoolExecutor(max_workers=max(1, min(12, len(jobs_by_key))))
+        try:
+            futs = {
+                ex.submit(_safe_probe_detail, fn, view, BUSY_PROBE_MAX_AGE if prov in busy else probe_age): pkey
+                for pkey, (prov, view, fn) in jobs_by_key.items()
+            }
+            try:
+                for f in as_completed(futs, timeout=PROBE_DEADLINE):
                     pkey = futs[f]
                     try:
                         results_by_key[pkey] = f.result()
                     except Exception as e:
                         results_by_key[pkey] = (False, f"probe failed: {e}")
+            except FuturesTimeout:
+                for pkey in futs.values():
+                    if pkey not in results_by_key:
+                        results_by_key[pkey] = _last_probe_result(pkey, "probe timed out")
+        finally:
+            ex.shutdown(wait=False, cancel_futures=True)
+
+        # Per-provider aggregation
+        per: dict[str, dict[str, tuple[bool, str, dict[str, Any]]]] = {}
+        for (prov, inst), pkey in refs.items():
+            ok, rsn = results_by_key.get(pkey, (False, ""))
+            per.setdefault(prov, {})[inst] = (ok, rsn, _cfg_view_for(cfg, prov, inst))
+
+        def _rep_instance(prov: str) -> str:
+            items = per.get(prov) or {}
+            used = {
+                inst
+                for inst in (used_instances.get(prov) or set())
+                if _prov_configured(cfg, prov, inst)
+            }
+            used_non_default = sorted([i for i in used if i != "default"])
 
-            # Per-provider aggregation
-            per: dict[str, dict[str, tuple[bool, str, dict[str, Any]]]] = {}
-            for (prov, inst), pkey in refs.items():
-                ok, rsn = results_by_key.get(pkey, (False, ""))
-                per.setdefault(prov, {})[inst] = (ok, rsn, _cfg_view_for(cfg, prov, inst))
-
-            def _rep_instance(prov: str) -> str:
-                items = per.get(prov) or {}
-                used = {
-                    inst
-                    for inst in (used_instances.get(prov) or set())
-                    if _prov_configured(cfg, prov, inst)
-                }
-                used_non_default = sorted([i for i in used if i != "default"])
-
-                for inst in used_non_default:
-                    if inst in items and items[inst][0]:
-                        return inst
-
-                if "default" in used and "default" in items and items["default"][0]:
-                    return "default"
-
-                if used_non_default:
-                    return used_non_default[0]
-
-                if "default" in used:
-                    return "default"
+            for inst in used_non_default:
+                if inst in items and items[inst][0]:
+                    return inst
 
-                if "default" in items and items["default"][0]:
-                    return "default"
+            if "default" in used and "default" in items and items["default"][0]:
+                return "default"
 
-                for inst, tup in items.items():
-                    if tup[0]:
-                        return inst
+            if used_non_default:
+                return used_non_default[0]
 
-                probed = sorted(
-                    [i for i in items if _prov_configured(cfg, prov, i)],
-                    key=lambda x: (x != "default", x),
-                )
-                if probed:
-                    return probed[0]
+            if "default" in used:
+                return "default"
 
-                if "default" in items:
-                    return "default"
+            if "default" in items and items["default"][0]:
+                return "default"
 
-                for inst in items.keys():
+            for inst, tup in items.items():
+                if tup[0]:
                     return inst
 
+            probed = sorted(
+                [i for i in items if _prov_configured(cfg, prov, i)],
+                key=lambda x: (x != "default", x),
+            )
+            if probed:
+                return probed[0]
+
+            if "default" in items:
                 return "default"
 
-            def _provider_tuple(prov: str) -> tuple[bool, str, dict[str, Any]]:
-                items = per.get(prov) or {}
-                if not items:
-                    return False, "not configured", _cfg_view_for(cfg, prov, "default")
-                rep_inst = _rep_instance(prov)
-                if rep_inst in items:
-                    return items[rep_inst]
-                if "default" in items:
-                    return items["default"]
-                inst = next(iter(items.keys()), "default")
-                return items.get(inst) or (False, "not configured", _cfg_view_for(cfg, prov, inst))
-
-            plex_ok, plex_reason, cfg_plex = _provider_tuple("PLEX")
-            simkl_ok, simkl_reason, cfg_simkl = _provider_tuple("SIMKL")
-            trakt_ok, trakt_reason, cfg_trakt = _provider_tuple("TRAKT")
-            jelly_ok, jelly_reason, cfg_jelly = _provider_tuple("JELLYFIN")
-            emby_ok, emby_reason, cfg_emby = _provider_tuple("EMBY")
-            kodi_ok, kodi_reason, cfg_kodi = _provider_tuple("KODI")
-            tmdb_ok, tmdb_reason, cfg_tmdb = _provider_tuple("TMDB")
-            crosswatch_ok, crosswatch_reason, cfg_crosswatch = _provider_tuple("CROSSWATCH")
-            mdbl_ok, mdbl_reason, cfg_mdbl = _provider_tuple("MDBLIST")
-            publicmetadb_ok, publicmetadb_reason, cfg_publicmetadb = _provider_tuple("PUBLICMETADB")
-            nuvio_ok, nuvio_reason, cfg_nuvio = _provider_tuple("NUVIO")
-            stremio_ok, stremio_reason, cfg_stremio = _provider_tuple("STREMIO")
-            floppy_ok, floppy_reason, cfg_floppy = _provider_tuple("FLOPPY")
-            punchplay_ok, punchplay_reason, cfg_punchplay = _provider_tuple("PUNCHPLAY")
-            bingebase_ok, bingebase_reason, cfg_bingebase = _provider_tuple("BINGEBASE")
-            scrob_ok, scrob_reason, cfg_scrob = _provider_tuple("SCROB")
-            taut_ok, taut_reason, cfg_taut = _provider_tuple("TAUTULLI")
-            anilist_ok, anilist_reason, cfg_anilist = _provider_tuple("ANILIST")
-
-            userinfo_jobs: dict[str, tuple[Callable[..., dict[str, Any]], dict[str, Any]]] = {}
-            if plex_ok:
-                userinfo_jobs["PLEX"] = (plex_user_info, cfg_plex)
-            if simkl_ok:
-                userinfo_jobs["SIMKL"] = (simkl_user_info, cfg_simkl)
-            if trakt_ok:
-                userinfo_jobs["TRAKT"] = (trakt_user_info, cfg_trakt)
-            if anilist_ok:
-                userinfo_jobs["ANILIST"] = (anilist_user_info, cfg_anilist)
-            if emby_ok:
-                userinfo_jobs["EMBY"] = (emby_user_info, cfg_emby)
-            if mdbl_ok:
-                userinfo_jobs["MDBLIST"] = (mdblist_user_info, cfg_mdbl)
-            if punchplay_ok:
-                userinfo_jobs["PUNCHPLAY"] = (punchplay_user_info, cfg_punchplay)
-            if bingebase_ok:
-                userinfo_jobs["BINGEBASE"] = (bingebase_user_info, cfg_bingebase)
-            if scrob_ok:
-                userinfo_jobs["SCROB"] = (scrob_user_info, cfg_scrob)
-
-            userinfo: dict[str, dict[str, Any]] = {}
-            if userinfo_jobs:
-                with ThreadPoolExecutor(max_workers=max(1, min(5, len(userinfo_jobs)))) as ex:
-                    futs = {
-                        ex.submit(_safe_userinfo, fn, view, user_age): prov
-                        for prov, (fn, view) in userinfo_jobs.items()
-                    }
-                    for f in as_completed(futs):
+            for inst in items.keys():
+                return inst
+
+            return "default"
+
+        def _provider_tuple(prov: str) -> tuple[bool, str, dict[str, Any]]:
+            items = per.get(prov) or {}
+            if not items:
+                return False, "not configured", _cfg_view_for(cfg, prov, "default")
+            rep_inst = _rep_instance(prov)
+            if rep_inst in items:
+                return items[rep_inst]
+            if "default" in items:
+                return items["default"]
+            inst = next(iter(items.keys()), "default")
+            return items.get(inst) or (False, "not configured", _cfg_view_for(cfg, prov, inst))
+
+        plex_ok, plex_reason, cfg_plex = _provider_tuple("PLEX")
+        simkl_ok, simkl_reason, cfg_simkl = _provider_tuple("SIMKL")
+        trakt_ok, trakt_reason, cfg_trakt = _provider_tuple("TRAKT")
+        jelly_ok, jelly_reason, cfg_jelly = _provider_tuple("JELLYFIN")
+        emby_ok, emby_reason, cfg_emby = _provider_tuple("EMBY")
+        kodi_ok, kodi_reason, cfg_kodi = _provider_tuple("KODI")
+        tmdb_ok, tmdb_reason, cfg_tmdb = _provider_tuple("TMDB")
+        crosswatch_ok, crosswatch_reason, cfg_crosswatch = _provider_tuple("CROSSWATCH")
+        mdbl_ok, mdbl_reason, cfg_mdbl = _provider_tuple("MDBLIST")
+        publicmetadb_ok, publicmetadb_reason, cfg_publicmetadb = _provider_tuple("PUBLICMETADB")
+        nuvio_ok, nuvio_reason, cfg_nuvio = _provider_tuple("NUVIO")
+        stremio_ok, stremio_reason, cfg_stremio = _provider_tuple("STREMIO")
+        floppy_ok, floppy_reason, cfg_floppy = _provider_tuple("FLOPPY")
+        punchplay_ok, punchplay_reason, cfg_punchplay = _provider_tuple("PUNCHPLAY")
+        bingebase_ok, bingebase_reason, cfg_bingebase = _provider_tuple("BINGEBASE")
+        scrob_ok, scrob_reason, cfg_scrob = _provider_tuple("SCROB")
+        taut_ok, taut_reason, cfg_taut = _provider_tuple("TAUTULLI")
+        anilist_ok, anilist_reason, cfg_anilist = _provider_tuple("ANILIST")
+
+        userinfo_jobs: dict[str, tuple[Callable[..., dict[str, Any]], dict[str, Any]]] = {}
+        if plex_ok:
+            userinfo_jobs["PLEX"] = (plex_user_info, cfg_plex)
+        if simkl_ok:
+            userinfo_jobs["SIMKL"] = (simkl_user_info, cfg_simkl)
+        if trakt_ok:
+            userinfo_jobs["TRAKT"] = (trakt_user_info, cfg_trakt)
+        if anilist_ok:
+            userinfo_jobs["ANILIST"] = (anilist_user_info, cfg_anilist)
+        if emby_ok:
+            userinfo_jobs["EMBY"] = (emby_user_info, cfg_emby)
+        if mdbl_ok:
+            userinfo_jobs["MDBLIST"] = (mdblist_user_info, cfg_mdbl)
+        if punchplay_ok:
+            userinfo_jobs["PUNCHPLAY"] = (punchplay_user_info, cfg_punchplay)
+        if bingebase_ok:
+            userinfo_jobs["BINGEBASE"] = (bingebase_user_info, cfg_bingebase)
+        if scrob_ok:
+            userinfo_jobs["SCROB"] = (scrob_user_info, cfg_scrob)
+
+        userinfo: dict[str, dict[str, Any]] = {}
+        if userinfo_jobs:
+            ex = ThreadPoolExecutor(max_workers=max(1, min(5, len(userinfo_jobs))))
+            try:
+                futs = {
+                    ex.submit(_safe_userinfo, fn, view, BUSY_PROBE_MAX_AGE if prov in busy else user_age): prov
+                    for prov, (fn, view) in userinfo_jobs.items()
+                }
+                try:
+                    for f in as_completed(futs, timeout=PROBE_DEADLINE):
                         prov = futs[f]
                         try:
                             userinfo[prov] = f.result() or {}
                         except Exception:
                             userinfo[prov] = {}
+                except FuturesTimeout:
+                    pass
+            finally:
+                ex.shutdown(wait=False, cancel_futures=True)
+
+        info_plex = userinfo.get("PLEX", {})
+        info_simkl = userinfo.get("SIMKL", {})
+        info_trakt = userinfo.get("TRAKT", {})
+        info_anilist = userinfo.get("ANILIST", {})
+        info_emby = userinfo.get("EMBY", {})
+        info_mdbl = userinfo.get("MDBLIST", {})
+        info_bingebase = userinfo.get("BINGEBASE", {})
+
+        trakt_block: dict[str, Any] = {"connected": trakt_ok}
+        if not trakt_ok:
+            trakt_block["reason"] = trakt_reason
+        if info_trakt:
+            trakt_block["vip"] = bool(info_trakt.get("vip"))
+            trakt_block["vip_type"] = info_trakt.get("vip_type")
+
+            limits_info = info_trakt.get("limits") or {}
+            if isinstance(limits_info, dict) and limits_info:
+                watchlist = limits_info.get("watchlist") or {}
+                collection = limits_info.get("collection") or {}
+                if watchlist or collection:
+                    trakt_block["limits"] = {}
+                    if watchlist:
+                        trakt_block["limits"]["watchlist"] = {"item_count": int((watchlist.get("item_count") or 0)), "used": int((watchlist.get("used") or 0))}
+                    if collection:
+                        trakt_block["limits"]["collection"] = {"item_count": int((collection.get("item_count") or 0)), "used": int((collection.get("used") or 0))}
+
+            last_err = info_trakt.get("last_limit_error")
+            if isinstance(last_err, dict) and last_err.get("feature") and last_err.get("ts"):
+                trakt_block["last_limit_error"] = {"feature": str(last_err.get("feature")), "ts": str(last_err.get("ts"))}
+
+        providers_out: dict[str, Any] = {}
+
+        def _instances_payload(prov: str) -> tuple[dict[str, Any], dict[str, Any]]:
+            items = per.get(prov) or {}
+            inst_ids = sorted(
+                set(configured_instances.get(prov) or set()) | set(items.keys()),
+                key=lambda x: (x != "default", x),
+            )
+            used = used_instances.get(prov) or set()
+            inst_map: dict[str, Any] = {}
+            ok_count = 0
+            probed_count = 0
+            for inst in inst_ids:
+                payload: dict[str, Any] = {"configured": bool(_prov_configured(cfg, prov, inst)), "probed": False}
+                if inst in items:
+                    ok, rsn, _ = items.get(inst) or (False, "", {})
+                    payload["connected"] = bool(ok)
+                    payload["probed"] = True
+                    probed_count += 1
+                    if ok:
+                        ok_count += 1
+                    elif rsn:
+                        payload["reason"] = rsn
+                if inst in used:
+                    payload["used"] = True
+                inst_map[inst] = payload
+            rep_inst = _rep_instance(prov)
+            if rep_inst not in inst_map and inst_ids:
+                rep_inst = inst_ids[0]
+            summary: dict[str, Any] = {
+                "ok": int(ok_count),
+                "probed": int(probed_count),
+                "total": int(len(inst_ids)),
+                "rep": rep_inst,
+                "used": sorted(used, key=lambda x: (x != "default", x)),
+            }
+            return inst_map, summary
+        if "PLEX" in active_providers:
+            inst_map, inst_sum = _instances_payload("PLEX")
+            providers_out["PLEX"] = {
+                "connected": plex_ok,
+                **({} if plex_ok else {"reason": plex_reason}),
+                **({} if not info_plex else {"plexpass": bool(info_plex.get("plexpass")), "subscription": info_plex.get("subscription") or {}}),
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
+        if "CROSSWATCH" in active_providers:
+            inst_map, inst_sum = _instances_payload("CROSSWATCH")
+            cw_block = (cfg_crosswatch.get("crosswatch") or {}) if isinstance(cfg_crosswatch.get("crosswatch"), Mapping) else {}
+            providers_out["CROSSWATCH"] = {
+                "connected": crosswatch_ok,
+                **({} if crosswatch_ok else {"reason": crosswatch_reason}),
+                "vip": True,
+                "vip_type": "crown",
+                "vip_text": "You've earned it",
+                **({"root_dir": cw_block.get("root_dir")} if cw_block.get("root_dir") else {}),
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
+        if "SIMKL" in active_providers:
+            inst_map, inst_sum = _instances_payload("SIMKL")
+            providers_out["SIMKL"] = {
+                "connected": simkl_ok,
+                **({} if simkl_ok else {"reason": simkl_reason}),
+                **(
+                    {}
+                    if not info_simkl
+                    else {
+                        "vip": bool(info_simkl.get("vip")),
+                        "vip_type": info_simkl.get("vip_type"),
+                        "account_type": info_simkl.get("account_type"),
+                        "plan_type": info_simkl.get("plan_type"),
+                        **({"account_id": info_simkl.get("account_id")} if info_simkl.get("account_id") is not None else {}),
+                        **({"username": info_simkl.get("username")} if info_simkl.get("username") else {}),
+                    }
+                ),
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
+        if "ANILIST" in active_providers:
+            inst_map, inst_sum = _instances_payload("ANILIST")
+            providers_out["ANILIST"] = {
+                "connected": anilist_ok,
+                **({} if anilist_ok else {"reason": anilist_reason}),
+                **({} if not info_anilist else {"user": (info_anilist.get("user") or {})}),
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
+        if "TRAKT" in active_providers:
+            inst_map, inst_sum = _instances_payload("TRAKT")
+            providers_out["TRAKT"] = {
+                **trakt_block,
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
+        if "JELLYFIN" in active_providers:
+            inst_map, inst_sum = _instances_payload("JELLYFIN")
+            providers_out["JELLYFIN"] = {
+                "connected": jelly_ok,
+                **({} if jelly_ok else {"reason": jelly_reason}),
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
+        if "EMBY" in active_providers:
+            inst_map, inst_sum = _instances_payload("EMBY")
+            providers_out["EMBY"] = {
+                "connected": emby_ok,
+                **({} if emby_ok else {"reason": emby_reason}),
+                **({} if not info_emby else {"premiere": bool(info_emby.get("premiere"))}),
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
+        if "KODI" in active_providers:
+            inst_map, inst_sum = _instances_payload("KODI")
+            k_block = (cfg_kodi.get("kodi") or {}) if isinstance(cfg_kodi.get("kodi"), Mapping) else {}
+            providers_out["KODI"] = {
+                "connected": kodi_ok,
+                **({} if kodi_ok else {"reason": kodi_reason}),
+                **({"kodi_version": k_block.get("kodi_version")} if k_block.get("kodi_version") else {}),
+                **({"jsonrpc_version": k_block.get("jsonrpc_version")} if k_block.get("jsonrpc_version") else {}),
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
+        if "TMDB" in active_providers:
+            inst_map, inst_sum = _instances_payload("TMDB")
+            providers_out["TMDB"] = {
+                "connected": tmdb_ok,
+                **({} if tmdb_ok else {"reason": tmdb_reason}),
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
+        if "TAUTULLI" in active_providers:
+            inst_map, inst_sum = _instances_payload("TAUTULLI")
+            providers_out["TAUTULLI"] = {
+                "connected": taut_ok,
+                **({} if taut_ok else {"reason": taut_reason}),
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
+        if "MDBLIST" in active_providers:
+            inst_map, inst_sum = _instances_payload("MDBLIST")
+            providers_out["MDBLIST"] = {
+                "connected": mdbl_ok,
+                **({} if mdbl_ok else {"reason": mdbl_reason}),
+                **(
+                    {}
+                    if not info_mdbl
+                    else {
+                        "vip": bool(info_mdbl.get("vip")),
+                        "vip_type": info_mdbl.get("vip_type"),
+                        "patron_status": info_mdbl.get("patron_status"),
+                        "limits": {
+                            "api_requests": int(((info_mdbl.get("limits") or {}).get("api_requests") or 0)),
+                            "api_requests_count": int(((info_mdbl.get("limits") or {}).get("api_requests_count") or 0)),
+                        },
+                    }
+                ),
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
+        if "PUBLICMETADB" in active_providers:
+            inst_map, inst_sum = _instances_payload("PUBLICMETADB")
+            providers_out["PUBLICMETADB"] = {
+                "connected": publicmetadb_ok,
+                **({} if publicmetadb_ok else {"reason": publicmetadb_reason}),
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
+        if "NUVIO" in active_providers:
+            inst_map, inst_sum = _instances_payload("NUVIO")
+            n_block = (cfg_nuvio.get("nuvio") or {}) if isinstance(cfg_nuvio.get("nuvio"), Mapping) else {}
+            n_profile_name = str(n_block.get("profile_name") or "").strip()
+            n_profile_id = str(n_block.get("profile_id") or "").strip()
+            providers_out["NUVIO"] = {
+                "connected": nuvio_ok,
+                **({} if nuvio_ok else {"reason": nuvio_reason}),
+                **({"profile_name": n_profile_name} if n_profile_name else {}),
+                **({"profile_id": n_profile_id} if n_profile_id else {}),
+                **({"nuvio_profile_name": n_profile_name} if n_profile_name else {}),
+                **({"nuvio_profile_id": n_profile_id} if n_profile_id else {}),
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
 
-            info_plex = userinfo.get("PLEX", {})
-            info_simkl = userinfo.get("SIMKL", {})
-            info_trakt = userinfo.get("TRAKT", {})
-            info_anilist = userinfo.get("ANILIST", {})
-            info_emby = userinfo.get("EMBY", {})
-            info_mdbl = userinfo.get("MDBLIST", {})
-            info_bingebase = userinfo.get("BINGEBASE", {})
-
-            trakt_block: dict[str, Any] = {"connected": trakt_ok}
-            if not trakt_ok:
-                trakt_block["reason"] = trakt_reason
-            if info_trakt:
-                trakt_block["vip"] = bool(info_trakt.get("vip"))
-                trakt_block["vip_type"] = info_trakt.get("vip_type")
-
-                limits_info = info_trakt.get("limits") or {}
-                if isinstance(limits_info, dict) and limits_info:
-                    watchlist = limits_info.get("watchlist") or {}
-                    collection = limits_info.get("collection") or {}
-                    if watchlist or collection:
-                        trakt_block["limits"] = {}
-                        if watchlist:
-                            trakt_block["limits"]["watchlist"] = {"item_count": int((watchlist.get("item_count") or 0)), "used": int((watchlist.get("used") or 0))}
-                        if collection:
-                            trakt_block["limits"]["collection"] = {"item_count": int((collection.get("item_count") or 0)), "used": int((collection.get("used") or 0))}
-
-                last_err = info_trakt.get("last_limit_error")
-                if isinstance(last_err, dict) and last_err.get("feature") and last_err.get("ts"):
-                    trakt_block["last_limit_error"] = {"feature": str(last_err.get("feature")), "ts": str(last_err.get("ts"))}
-
-            providers_out: dict[str, Any] = {}
-
-            def _instances_payload(prov: str) -> tuple[dict[str, Any], dict[str, Any]]:
-                items = per.get(prov) or {}
-                inst_ids = sorted(
-                    set(configured_instances.get(prov) or set()) | set(items.keys()),
-                    key=lambda x: (x != "default", x),
-                )
-                used = used_instances.get(prov) or set()
-                inst_map: dict[str, Any] = {}
-                ok_count = 0
-                probed_count = 0
-                for inst in inst_ids:
-                    payload: dict[str, Any] = {"configured": bool(_prov_configured(cfg, prov, inst)), "probed": False}
-                    if inst in items:
-                        ok, rsn, _ = items.get(inst) or (False, "", {})
-                        payload["connected"] = bool(ok)
-                        payload["probed"] = True
-                        probed_count += 1
-                        if ok:
-                            ok_count += 1
-                        elif rsn:
-                            payload["reason"] = rsn
-                    if inst in used:
-                        payload["used"] = True
-                    inst_map[inst] = payload
-                rep_inst = _rep_instance(prov)
-                if rep_inst not in inst_map and inst_ids:
-                    rep_inst = inst_ids[0]
-                summary: dict[str, Any] = {
-                    "ok": int(ok_count),
-                    "probed": int(probed_count),
-                    "total": int(len(inst_ids)),
-                    "rep": rep_inst,
-                    "used": sorted(used, key=lambda x: (x != "default", x)),
-                }
-                return inst_map, summary
-            if "PLEX" in active_providers:
-                inst_map, inst_sum = _instances_payload("PLEX")
-                providers_out["PLEX"] = {
-                    "connected": plex_ok,
-                    **({} if plex_ok else {"reason": plex_reason}),
-                    **({} if not info_plex else {"plexpass": bool(info_plex.get("plexpass")), "subscription": info_plex.get("subscription") or {}}),
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
-            if "CROSSWATCH" in active_providers:
-                inst_map, inst_sum = _instances_payload("CROSSWATCH")
-                cw_block = (cfg_crosswatch.get("crosswatch") or {}) if isinstance(cfg_crosswatch.get("crosswatch"), Mapping) else {}
-                providers_out["CROSSWATCH"] = {
-                    "connected": crosswatch_ok,
-                    **({} if crosswatch_ok else {"reason": crosswatch_reason}),
-                    "vip": True,
-                    "vip_type": "crown",
-                    "vip_text": "You've earned it",
-                    **({"root_dir": cw_block.get("root_dir")} if cw_block.get("root_dir") else {}),
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
-            if "SIMKL" in active_providers:
-                inst_map, inst_sum = _instances_payload("SIMKL")
-                providers_out["SIMKL"] = {
-                    "connected": simkl_ok,
-                    **({} if simkl_ok else {"reason": simkl_reason}),
-                    **(
-                        {}
-                        if not info_simkl
-                        else {
-                            "vip": bool(info_simkl.get("vip")),
-                            "vip_type": info_simkl.get("vip_type"),
-                            "account_type": info_simkl.get("account_type"),
-                            "plan_type": info_simkl.get("plan_type"),
-                            **({"account_id": info_simkl.get("account_id")} if info_simkl.get("account_id") is not None else {}),
-                            **({"username": info_simkl.get("username")} if info_simkl.get("username") else {}),
-                        }
-                    ),
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
-            if "ANILIST" in active_providers:
-                inst_map, inst_sum = _instances_payload("ANILIST")
-                providers_out["ANILIST"] = {
-                    "connected": anilist_ok,
-                    **({} if anilist_ok else {"reason": anilist_reason}),
-                    **({} if not info_anilist else {"user": (info_anilist.get("user") or {})}),
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
-            if "TRAKT" in active_providers:
-                inst_map, inst_sum = _instances_payload("TRAKT")
-                providers_out["TRAKT"] = {
-                    **trakt_block,
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
-            if "JELLYFIN" in active_providers:
-                inst_map, inst_sum = _instances_payload("JELLYFIN")
-                providers_out["JELLYFIN"] = {
-                    "connected": jelly_ok,
-                    **({} if jelly_ok else {"reason": jelly_reason}),
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
-            if "EMBY" in active_providers:
-                inst_map, inst_sum = _instances_payload("EMBY")
-                providers_out["EMBY"] = {
-                    "connected": emby_ok,
-                    **({} if emby_ok else {"reason": emby_reason}),
-                    **({} if not info_emby else {"premiere": bool(info_emby.get("premiere"))}),
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
-            if "KODI" in active_providers:
-                inst_map, inst_sum = _instances_payload("KODI")
-                k_block = (cfg_kodi.get("kodi") or {}) if isinstance(cfg_kodi.get("kodi"), Mapping) else {}
-                providers_out["KODI"] = {
-                    "connected": kodi_ok,
-                    **({} if kodi_ok else {"reason": kodi_reason}),
-                    **({"kodi_version": k_block.get("kodi_version")} if k_block.get("kodi_version") else {}),
-                    **({"jsonrpc_version": k_block.get("jsonrpc_version")} if k_block.get("jsonrpc_version") else {}),
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
-            if "TMDB" in active_providers:
-                inst_map, inst_sum = _instances_payload("TMDB")
-                providers_out["TMDB"] = {
-                    "connected": tmdb_ok,
-                    **({} if tmdb_ok else {"reason": tmdb_reason}),
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
-            if "TAUTULLI" in active_providers:
-                inst_map, inst_sum = _instances_payload("TAUTULLI")
-                providers_out["TAUTULLI"] = {
-                    "connected": taut_ok,
-                    **({} if taut_ok else {"reason": taut_reason}),
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
-            if "MDBLIST" in active_providers:
-                inst_map, inst_sum = _instances_payload("MDBLIST")
-                providers_out["MDBLIST"] = {
-                    "connected": mdbl_ok,
-                    **({} if mdbl_ok else {"reason": mdbl_reason}),
-                    **(
-                        {}
-                        if not info_mdbl
-                        else {
-                            "vip": bool(info_mdbl.get("vip")),
-                            "vip_type": info_mdbl.get("vip_type"),
-                            "patron_status": info_mdbl.get("patron_status"),
-                            "limits": {
-                                "api_requests": int(((info_mdbl.get("limits") or {}).get("api_requests") or 0)),
-                                "api_requests_count": int(((info_mdbl.get("limits") or {}).get("api_requests_count") or 0)),
-                            },
-                        }
-                    ),
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
-            if "PUBLICMETADB" in active_providers:
-                inst_map, inst_sum = _instances_payload("PUBLICMETADB")
-                providers_out["PUBLICMETADB"] = {
-                    "connected": publicmetadb_ok,
-                    **({} if publicmetadb_ok else {"reason": publicmetadb_reason}),
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
-            if "NUVIO" in active_providers:
-                inst_map, inst_sum = _instances_payload("NUVIO")
-                n_block = (cfg_nuvio.get("nuvio") or {}) if isinstance(cfg_nuvio.get("nuvio"), Mapping) else {}
-                n_profile_name = str(n_block.get("profile_name") or "").strip()
-                n_profile_id = str(n_block.get("profile_id") or "").strip()
-                providers_out["NUVIO"] = {
-                    "connected": nuvio_ok,
-                    **({} if nuvio_ok else {"reason": nuvio_reason}),
-                    **({"profile_name": n_profile_name} if n_profile_name else {}),
-                    **({"profile_id": n_profile_id} if n_profile_id else {}),
-                    **({"nuvio_profile_name": n_profile_name} if n_profile_name else {}),
-                    **({"nuvio_profile_id": n_profile_id} if n_profile_id else {}),
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
-
-            if "STREMIO" in active_providers:
-                inst_map, inst_sum = _instances_payload("STREMIO")
-                providers_out["STREMIO"] = {
-                    "connected": stremio_ok,
-                    **({} if stremio_ok else {"reason": stremio_reason}),
-                    "experimental": True,
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
+        if "STREMIO" in active_providers:
+            inst_map, inst_sum = _instances_payload("STREMIO")
+            providers_out["STREMIO"] = {
+                "connected": stremio_ok,
+                **({} if stremio_ok else {"reason": stremio_reason}),
+                "experimental": True,
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
 
-            if "FLOPPY" in active_providers:
-                inst_map, inst_sum = _instances_payload("FLOPPY")
-                f_block = (cfg_floppy.get("floppy") or {}) if isinstance(cfg_floppy.get("floppy"), Mapping) else {}
-                providers_out["FLOPPY"] = {
-                    "connected": floppy_ok,
-                    **({} if floppy_ok else {"reason": floppy_reason}),
-                    "experimental": True,
-                    **({"server_url": f_block.get("server_url")} if f_block.get("server_url") else {}),
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
+        if "FLOPPY" in active_providers:
+            inst_map, inst_sum = _instances_payload("FLOPPY")
+            f_block = (cfg_floppy.get("floppy") or {}) if isinstance(cfg_floppy.get("floppy"), Mapping) else {}
+            providers_out["FLOPPY"] = {
+                "connected": floppy_ok,
+                **({} if floppy_ok else {"reason": floppy_reason}),
+                "experimental": True,
+                **({"server_url": f_block.get("server_url")} if f_block.get("server_url") else {}),
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
 
-            if "SCROB" in active_providers:
-                inst_map, inst_sum = _instances_payload("SCROB")
-                s_block = (cfg_scrob.get("scrob") or {}) if isinstance(cfg_scrob.get("scrob"), Mapping) else {}
-                providers_out["SCROB"] = {
-                    "connected": scrob_ok,
-                    **({} if scrob_ok else {"reason": scrob_reason}),
-                    **(
-                        {"reauth_required": True, "notice": "Scrob 2FA session expired. Reads and scrobbling continue; enter a new code to resume writes."}
-                        if s_block.get("reauth_required")
-                        else {}
-                    ),
-                    "experimental": True,
-                    **({"server_url": s_block.get("server_url")} if s_block.get("server_url") else {}),
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
+        if "SCROB" in active_providers:
+            inst_map, inst_sum = _instances_payload("SCROB")
+            s_block = (cfg_scrob.get("scrob") or {}) if isinstance(cfg_scrob.get("scrob"), Mapping) else {}
+            providers_out["SCROB"] = {
+                "connected": scrob_ok,
+                **({} if scrob_ok else {"reason": scrob_reason}),
+                **(
+                    {"reauth_required": True, "notice": "Scrob 2FA session expired. Reads and scrobbling continue; enter a new code to resume writes."}
+                    if s_block.get("reauth_required")
+                    else {}
+                ),
+                "experimental": True,
+                **({"server_url": s_block.get("server_url")} if s_block.get("server_url") else {}),
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
 
-            if "PUNCHPLAY" in active_providers:
-                inst_map, inst_sum = _instances_payload("PUNCHPLAY")
-                providers_out["PUNCHPLAY"] = {
-                    "connected": punchplay_ok,
-                    **({} if punchplay_ok else {"reason": punchplay_reason}),
-                    "experimental": True,
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
+        if "PUNCHPLAY" in active_providers:
+            inst_map, inst_sum = _instances_payload("PUNCHPLAY")
+            providers_out["PUNCHPLAY"] = {
+                "connected": punchplay_ok,
+                **({} if punchplay_ok else {"reason": punchplay_reason}),
+                "experimental": True,
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
 
-            if "BINGEBASE" in active_providers:
-                inst_map, inst_sum = _instances_payload("BINGEBASE")
-                providers_out["BINGEBASE"] = {
-                    "connected": bingebase_ok,
-                    **({} if bingebase_ok else {"reason": bingebase_reason}),
-                    **(
-                        {}
-                        if not info_bingebase
-                        else {
-                            **({"username": info_bingebase.get("username")} if info_bingebase.get("username") else {}),
-                            **({"user_id": info_bingebase.get("user_id")} if info_bingebase.get("user_id") else {}),
-                            "auth_configured": bool(info_bingebase.get("auth_configured")),
-                            "webhook_configured": bool(info_bingebase.get("webhook_configured")),
-                            "api_key_configured": bool(info_bingebase.get("api_key_configured")),
-                        }
-                    ),
-                    "experimental": True,
-                    "instances": inst_map,
-                    "instances_summary": inst_sum,
-                    "rep_instance": inst_sum.get("rep"),
-                }
+        if "BINGEBASE" in active_providers:
+            inst_map, inst_sum = _instances_payload("BINGEBASE")
+            providers_out["BINGEBASE"] = {
+                "connected": bingebase_ok,
+                **({} if bingebase_ok else {"reason": bingebase_reason}),
+                **(
+                    {}
+                    if not info_bingebase
+                    else {
+                        **({"username": info_bingebase.get("username")} if info_bingebase.get("username") else {}),
+                        **({"user_id": info_bingebase.get("user_id")} if info_bingebase.get("user_id") else {}),
+                        "auth_configured": bool(info_bingebase.get("auth_configured")),
+                        "webhook_configured": bool(info_bingebase.get("webhook_configured")),
+                        "api_key_configured": bool(info_bingebase.get("api_key_configured")),
+                    }
+                ),
+                "experimental": True,
+                "instances": inst_map,
+                "instances_summary": inst_sum,
+                "rep_instance": inst_sum.get("rep"),
+            }
 
-            def _scope_for(prov: str) -> str:
-                ss = prov_sources.get(prov) or set()
-                if "pair" in ss:
-                    return "pair"
-                if "watcher" in ss:
-                    return "watcher"
+        def _scope_for(prov: str) -> str:
+            ss = prov_sources.get(prov) or set()
+            if "pair" in ss:
                 return "pair"
+            if "watcher" in ss:
+                return "watcher"
+            return "pair"
+
+        def _used_by_for(prov: str) -> list[str]:
+            ss = prov_sources.get(prov) or set()
+            out: list[str] = []
+            if "pair" in ss:
+                out.append("pair")
+            if "watcher" in ss:
+                out.append("watcher")
+            return out
+
+        def _usage_hint(prov: str) -> str:
+            ss = prov_sources.get(prov) or set()
+            if "pair" in ss and "watcher" in ss:
+                return "Used by: Sync + Watcher"
+            if "watcher" in ss:
+                return "Used by: Watcher"
+            if "pair" in ss:
+                return "Used by: Sync"
+            return ""
 
-            def _used_by_for(prov: str) -> list[str]:
-                ss = prov_sources.get(prov) or set()
-                out: list[str] = []
-                if "pair" in ss:
-                    out.append("pair")
-                if "watcher" in ss:
-                    out.append("watcher")
-                return out
+        for k in list(providers_out.keys()):
+            used_by = _used_by_for(k)
+            providers_out[k]["scope"] = _scope_for(k)
+            providers_out[k]["used_by"] = used_by
+            providers_out[k]["used_in_pairs"] = "pair" in used_by
+            providers_out[k]["used_in_watcher"] = "watcher" in used_by
+            hint = _usage_hint(k)
+            if hint:
+                providers_out[k]["usage_hint"] = hint
+
+        data: dict[str, Any] = {
+            "plex_connected": plex_ok,
+            "simkl_connected": simkl_ok,
+            "trakt_connected": trakt_ok,
+            "anilist_connected": anilist_ok,
+            "jellyfin_connected": jelly_ok,
+            "emby_connected": emby_ok,
+            "kodi_connected": kodi_ok,
+            "tmdb_connected": tmdb_ok,
+            "crosswatch_connected": crosswatch_ok,
+            "mdblist_connected": mdbl_ok,
+            "publicmetadb_connected": publicmetadb_ok,
+            "nuvio_connected": nuvio_ok,
+            "stremio_connected": stremio_ok,
+            "floppy_connected": floppy_ok,
+            "punchplay_connected": punchplay_ok,
+            "bingebase_connected": bingebase_ok,
+            "scrob_connected": scrob_ok,
+            "tautulli_connected": taut_ok,
+            "debug": debug,
+            "can_run": bool(any_pair_ready),
+            "ts": int(now),
+            "providers": providers_out,
+        }
+        return data
 
-            def _usage_hint(prov: str) -> str:
-                ss = prov_sources.get(prov) or set()
-                if "pair" in ss and "watcher" in ss:
-                    return "Used by: Sync + Watcher"
-                if "watcher" in ss:
-                    return "Used by: Watcher"
-                if "pair" in ss:
-                    return "Used by: Sync"
-                return ""
 
-            for k in list(providers_out.keys()):
-                used_by = _used_by_for(k)
-                providers_out[k]["scope"] = _scope_for(k)
-                providers_out[k]["used_by"] = used_by
-                providers_out[k]["used_in_pairs"] = "pair" in used_by
-                providers_out[k]["used_in_watcher"] = "watcher" in used_by
-                hint = _usage_hint(k)
-                if hint:
-                    providers_out[k]["usage_hint"] = hint
-
-            data: dict[str, Any] = {
-                "plex_connected": plex_ok,
-                "simkl_connected": simkl_ok,
-                "trakt_connected": trakt_ok,
-                "anilist_connected": anilist_ok,
-                "jellyfin_connected": jelly_ok,
-                "emby_connected": emby_ok,
-                "kodi_connected": kodi_ok,
-                "tmdb_connected": tmdb_ok,
-                "crosswatch_connected": crosswatch_ok,
-                "mdblist_connected": mdbl_ok,
-                "publicmetadb_connected": publicmetadb_ok,
-                "nuvio_connected": nuvio_ok,
-                "stremio_connected": stremio_ok,
-                "floppy_connected": floppy_ok,
-                "punchplay_connected": punchplay_ok,
-                "bingebase_connected": bingebase_ok,
-                "scrob_connected": scrob_ok,
-                "tautulli_connected": taut_ok,
-                "debug": debug,
-                "can_run": bool(any_pair_ready),
-                "ts": int(now),
-                "providers": providers_out,
-            }
+    @app.get("/api/status", tags=["Probes"])
+    def api_status(request: Request, fresh: int = Query(0), user_profile: str = Query("")) -> JSONResponse:
+        cfg0 = load_config_fn() or {}
+        scoped_user = request_user(request)
+        scope_profile = _status_scope_profile(cfg0, request, user_profile)
+        managed_scope = bool(scope_profile) or bool(scoped_user and not scoped_user.get("is_admin"))
+        if not managed_scope and not fresh:
+            cached, age = _status_cached()
+            if cached:
+                # Stale-while-revalidate: never make the caller wait for probes.
+                if age >= STATUS_TTL:
+                    STATUS_REFRESHER.revalidate()
+                return JSONResponse(cached, headers={"Cache-Control": "no-store", "X-CW-Status-Age": str(int(age))})
 
-            if not managed_scope:
-                STATUS_CACHE["ts"] = now
-                STATUS_CACHE["data"] = data
-            return JSONResponse(data, headers={"Cache-Control": "no-store"})
+        with STATUS_LOCK:
+            if not managed_scope and not fresh:
+                cached, age = _status_cached()
+                if cached:
+                    return JSONResponse(cached, headers={"Cache-Control": "no-store", "X-CW-Status-Age": str(int(age))})
+            if managed_scope:
+                data = _build_status(cfg0, scope_profile=scope_profile, scoped_user=scoped_user, managed_scope=True)
+            else:
+                data = _build_status(load_config_fn() or {})
+                _store_status(data)
+        return JSONResponse(data, headers={"Cache-Control": "no-store"})
+
+    STATUS_REFRESHER.builder = lambda busy: _build_status(load_config_fn() or {}, busy=busy)
 
     @app.post("/api/debug/clear_probe_cache", tags=["Probes"])
     def clear_probe_cache() -> dict[str, Any]:
@@ -2797,3 +2968,4 @@ def register_probes(app: FastAPI, load_config_fn: Callable[[], dict[str, Any]])
     app.state.PROBE_CACHE = PROBE_CACHE
     app.state.PROBE_DETAIL_CACHE = PROBE_DETAIL_CACHE
     app.state.USERINFO_CACHE = _USERINFO_CACHE
+    app.state.STATUS_REFRESHER = STATUS_REFRESHER
@@ -3,10 +3,12 @@
 # Copyright (c) 2025-2026 CrossWatch / Cenodude
 from __future__ import annotations
 
+import copy
 import json
 import time
 import secrets
 import hmac
+import importlib.util
 import urllib.parse
 import xml.etree.ElementTree as ET
 from typing import Any, cast
@@ -17,10 +19,12 @@ from urllib.parse import parse_qs
 
 from cw_platform.account_match import media_account_allowed
 from cw_platform.access_policy import media_account_allowlist_for_profile
-from cw_platform.config_base import load_config, save_config
+from cw_platform.config_base import config_generation, load_config, save_config
 from cw_platform.provider_instances import build_provider_config_view, instances_for_user_profile, list_instance_ids, normalize_instance_id
 from cw_platform.provider_usage import webhook_source_enabled
+from cw_platform.ttl_cache import TTLCache
 from providers.webhooks.config import apply_webhook_settings, media_source_connected, webhook_sinks
+from providers.webhooks.ingest import WEBHOOK_QUEUE, plex_session_key
 from providers.scrobble.routes import build_route_cfg_by_id, normalize_route_options, normalize_routes
 from providers.scrobble.scrobble import mask_account as _mask_account
 from providers.scrobble.sources import scrobble_sources
@@ -56,12 +60,7 @@ try:
 except Exception:
     BASE_LOG = None
 
-try:
-    from plexapi.myplex import MyPlexAccount
-    HAVE_PLEXAPI = True
-except Exception:
-    MyPlexAccount = None  # type: ignore[assignment]
-    HAVE_PLEXAPI = False
+HAVE_PLEXAPI = importlib.util.find_spec("plexapi") is not None
 
 router = APIRouter(tags=["scrobbler"])
 
@@ -294,6 +293,23 @@ def _resolve_media_webhook_request(request: Request, provider: str, legacy_key:
     return apply_webhook_settings(cfg, provider_lc, "default"), "default", None
 
 
+# Resolved webhook targets per config save; a save (or on-disk edit) starts a new table.
+_WEBHOOK_ROUTES: TTLCache[tuple[dict[str, Any] | None, str, dict[str, Any] | None]] = TTLCache(maxsize=64)
+_DEBUG_FLAG: TTLCache[bool] = TTLCache(maxsize=4)
+
+
+def _cached_media_webhook_route(request: Request, provider: str, legacy_key: str) -> tuple[dict[str, Any] | None, str, dict[str, Any] | None]:
+    params = _extract_url_params(request)
+    key = (config_generation(), provider, legacy_key, params.get("profile"), _extract_url_token(request))
+    hit = _WEBHOOK_ROUTES.get(key)
+    if hit is None:
+        hit = _resolve_media_webhook_request(request, provider, legacy_key)
+        # Resolving can save generated webhook ids; key on the generation it produced.
+        _WEBHOOK_ROUTES.set((config_generation(), *key[1:]), hit)
+    target_cfg, inst, error = hit
+    return copy.deepcopy(target_cfg) if target_cfg is not None else None, inst, error
+
+
 _WEBHOOK_IGNORE_REASONS: dict[str, tuple[str, str]] = {
     "profile_disabled": ("profile is disabled for webhooks", "INFO"),
     "webhook_disabled": ("webhook source is disabled", "INFO"),
@@ -421,6 +437,14 @@ async def api_webhook_urls() -> JSONResponse:
     return JSONResponse({"ok": True, "ids": ids, "route_hooks": route_hooks, "profile_hooks": profile_hooks}, status_code=200)
 
 
+@router.get("/api/webhooks/metrics")
+async def api_webhook_metrics() -> JSONResponse:
+    return JSONResponse(
+        {"ok": True, "queue": WEBHOOK_QUEUE.stats(), "routes": _WEBHOOK_ROUTES.stats()},
+        headers={"Cache-Control": "no-store"},
+    )
+
+
 @router.post("/api/webhooks/regenerate")
 async def api_webhook_regenerate(payload: dict[str, Any] | None = Body(default=None)) -> JSONResponse:
     cfg = load_config() or {}
@@ -508,9 +532,14 @@ def _env_logs(request: Request = cast(Request, None)) -> tuple[dict[str, list[st
 
 def _debug_on() -> bool:
     try:
-        cfg = load_config() or {}
-        rt = (cfg.get("runtime") or {}) or {}
-        return bool(rt.get("debug") or rt.get("debug_mods"))
+        gen = config_generation()
+        hit = _DEBUG_FLAG.get(gen)
+        if hit is None:
+            cfg = load_config() or {}
+            rt = (cfg.get("runtime") or {}) or {}
+            hit = bool(rt.get("debug") or rt.get("debug_mods"))
+            _DEBUG_FLAG.set(gen, hit)
+        return hit
     except Exception:
         return False
 
@@ -725,6 +754,8 @@ def _account(cfg: dict[str, Any]) -> Any:
     if not HAVE_PLEXAPI or not tok:
         return None
     try:
+        from plexapi.myplex import MyPlexAccount
+
         return MyPlexAccount(token=tok)  # type: ignore[call-arg]
     except Exception:
         return None
@@ -1383,7 +1414,7 @@ async def webhook_jellyfintrakt(request: Request) -> JSONResponse:
         except Exception:
             pass
 
-    target_cfg, provider_instance, target_error = _resolve_media_webhook_request(request, "jellyfin", "jellyfintrakt")
+    target_cfg, provider_instance, target_error = _cached_media_webhook_route(request, "jellyfin", "jellyfintrakt")
     if target_error:
         log(*_webhook_ignore_log("jf-webhook", target_error))
         return JSONResponse(target_error, status_code=200)
@@ -1542,7 +1573,7 @@ async def webhook_embytrakt(request: Request) -> JSONResponse:
         except Exception:
             pass
 
-    target_cfg, provider_instance, target_error = _resolve_media_webhook_request(request, "emby", "embytrakt")
+    target_cfg, provider_instance, target_error = _cached_media_webhook_route(request, "emby", "embytrakt")
     if target_error:
         log(*_webhook_ignore_log("emby-webhook", target_error))
         return JSONResponse(target_error, status_code=200)
@@ -1659,13 +1690,17 @@ async def webhook_embytrakt(request: Request) -> JSONResponse:
 @router.post("/webhook/plex")
 @router.post("/webhook/plextrakt")
 async def webhook_trakt(request: Request) -> JSONResponse:
+    started = time.monotonic()
     from crosswatch import _UIHostLogger
 
     try:
-        from providers.webhooks.plex import process_webhook
+        from providers.webhooks.plex import precheck_webhook, process_webhook
     except Exception:
         from crosswatch import process_webhook
 
+        def precheck_webhook(*_a: Any, **_k: Any) -> dict[str, Any] | None:
+            return None
+
     logger = _UIHostLogger("WEBHOOK", "SCROBBLE")
 
     def log(msg: str, level: str = "INFO") -> None:
@@ -1698,7 +1733,7 @@ async def webhook_trakt(request: Request) -> JSONResponse:
         except Exception:
             pass
 
-    target_cfg, provider_instance, target_error = _resolve_media_webhook_request(request, "plex", "plextrakt")
+    target_cfg, provider_instance, target_error = _cached_media_webhook_route(request, "plex", "plextrakt")
     if target_error:
         log(*_webhook_ignore_log("plex-webhook", target_error))
         return JSONResponse(target_error, status_code=200)
@@ -1751,40 +1786,59 @@ async def webhook_trakt(request: Request) -> JSONResponse:
         "DEBUG",
     )
 
-    try:
-        res = process_webhook(
-            payload=payload,
-            headers=dict(request.headers),
-            raw=raw,
-            logger=log,
-            cfg=target_cfg,
-            provider_instance=provider_instance,
+    def finish(res: dict[str, Any]) -> None:
+        if res.get("error"):
+            log(f"plex-webhook: result error={res['error']}", "WARN")
+        elif res.get("ignored"):
+            log("plex-webhook: ignored by filters/rules", "DEBUG")
+        elif res.get("debounced"):
+            log("plex-webhook: debounced pause", "DEBUG")
+        elif res.get("suppressed"):
+            log("plex-webhook: event suppressed by scrobble rules", "DEBUG")
+        elif res.get("dedup"):
+            log("plex-webhook: duplicate event suppressed", "DEBUG")
+
+        log(
+            f"plex-webhook: done action={res.get('action')} status={res.get('status')}",
+            "DEBUG",
+        )
+        _emit_scheduler_webhook_event("plex", payload, res)
+        _emit_activity_webhook_event("plex", payload, res)
+
+    headers = dict(request.headers)
+    early = precheck_webhook(payload, headers, raw, logger=log, cfg=target_cfg)
+    if early is not None:
+        finish(early)
+        return JSONResponse(
+            {"ok": True, **{k: v for k, v in early.items() if k != "error"}},
+            status_code=200,
         )
-    except Exception as e:
-        log(f"webhook: process_webhook raised: {e}", "ERROR")
-        return JSONResponse({"ok": True, "error": "internal"}, status_code=200)
 
-    if res.get("error"):
-        log(f"plex-webhook: result error={res['error']}", "WARN")
-    elif res.get("ignored"):
-        log("plex-webhook: ignored by filters/rules", "DEBUG")
-    elif res.get("debounced"):
-        log("plex-webhook: debounced pause", "DEBUG")
-    elif res.get("suppressed"):
-        log("plex-webhook: event suppressed by scrobble rules", "DEBUG")
-    elif res.get("dedup"):
-        log("plex-webhook: duplicate event suppressed", "DEBUG")
+    # Sinks (Trakt 429 back-off included) run on the ingest worker; the request is acked here.
+    def job() -> None:
+        try:
+            res = process_webhook(
+                payload=payload,
+                headers=headers,
+                raw=raw,
+                logger=log,
+                cfg=target_cfg,
+                provider_instance=provider_instance,
+            )
+        except Exception as e:
+            log(f"webhook: process_webhook raised: {e}", "ERROR")
+            return
+        finish(res)
+
+    session, coalesce = plex_session_key(payload, provider_instance)
+    queued = WEBHOOK_QUEUE.submit(job, session=session, coalesce=coalesce)
+    WEBHOOK_QUEUE.record_ack(started)
+    if queued == "rejected":
+        log(f"plex-webhook: ingest queue full, refused event='{payload.get('event')}'", "WARN")
+        return JSONResponse({"ok": False, "error": "queue_full"}, status_code=503, headers={"Retry-After": "5"})
+    log(f"plex-webhook: {queued} event='{payload.get('event')}'", "DEBUG")
+    return JSONResponse({"ok": True, "queued": queued}, status_code=200)
 
-    log(
-        f"plex-webhook: done action={res.get('action')} status={res.get('status')}",
-        "DEBUG",
-    )
-    _emit_scheduler_webhook_event("plex", payload, res)
-    _emit_activity_webhook_event("plex", payload, res)
-    return JSONResponse(
-        {"ok": True, **{k: v for k, v in res.items() if k != "error"}},
-        status_code=200,
-    )
 
 @router.post("/webhook/plexwatcher")
 async def webhook_plexwatcher(request: Request) -> JSONResponse:
@@ -4,12 +4,12 @@
 from __future__ import annotations
 
 from typing import Any, cast
-from collections.abc import Iterator, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from pathlib import Path
 from datetime import datetime, timezone, date
 from contextlib import contextmanager
 
-import dataclasses as _dc, importlib, inspect, json, os, re, shlex, shutil, threading, time, uuid
+import dataclasses as _dc, importlib, inspect, json, os, re, shutil, threading, time, uuid
 import asyncio
 
 from fastapi import APIRouter, Body, Request
@@ -247,6 +247,47 @@ def _norm_instance_id(v: Any) -> str:
 # Orchestrator state loading
 SUMMARY_LOCK = threading.Lock()
 SUMMARY: dict[str, Any] = {}
+# Published copy of SUMMARY; replaced wholesale so readers never take the lock.
+_SUMMARY_VIEW: tuple[int, dict[str, Any]] = (0, {})
+_RUN_TOTALS: dict[str, int] = {}
+_APPLY_LIVE: dict[tuple[str, str, str], int] = {}
+
+_TOTAL_KEYS = ("attempted", "added", "removed", "updated", "skipped", "unresolved", "errors", "blocked")
+
+
+def _copy_summary_value(v: Any) -> Any:
+    if isinstance(v, dict):
+        return {k: _copy_summary_value(x) for k, x in v.items()}
+    if isinstance(v, list):
+        return [_copy_summary_value(x) for x in v]
+    return v
+
+
+def _copy_summary_field(k: str, v: Any) -> Any:
+    # Unresolved records are append-only, so a shallow copy of that list is enough.
+    return list(v) if k == "unresolved_items" and isinstance(v, list) else _copy_summary_value(v)
+
+
+def _copy_summary(src: Mapping[str, Any]) -> dict[str, Any]:
+    return {k: _copy_summary_field(k, v) for k, v in src.items()}
+
+
+def _summary_publish_locked(changed: Iterable[str] | None = None) -> None:
+    global _SUMMARY_VIEW
+    seq, prev = _SUMMARY_VIEW
+    if changed is None:
+        view = _copy_summary(SUMMARY)
+    else:
+        # Published views are never mutated, so untouched fields can be shared.
+        view = dict(prev)
+        for k in changed:
+            if k in SUMMARY:
+                view[k] = _copy_summary_field(k, SUMMARY[k])
+            else:
+                view.pop(k, None)
+    view["seq"] = seq + 1
+    _SUMMARY_VIEW = (seq + 1, view)
+
 
 def _summary_reset() -> None:
     with SUMMARY_LOCK:
@@ -289,19 +330,31 @@ def _summary_reset() -> None:
                 },
             }
         )
+        _RUN_TOTALS.clear()
+        _RUN_TOTALS.update({k: 0 for k in _TOTAL_KEYS})
+        _APPLY_LIVE.clear()
+        _summary_publish_locked()
 
 def _summary_set(k: str, v: Any) -> None:
     with SUMMARY_LOCK:
         SUMMARY[k] = v
+        _summary_publish_locked((k,))
 
 def _summary_set_timeline(flag: str, value: bool = True) -> None:
     with SUMMARY_LOCK:
         SUMMARY.setdefault("timeline", {})
         SUMMARY["timeline"][flag] = value
+        _summary_publish_locked(("timeline",))
 
 def _summary_snapshot() -> dict[str, Any]:
+    return _copy_summary(_SUMMARY_VIEW[1])
+
+def _summary_version() -> int:
+    return _SUMMARY_VIEW[0]
+
+def _run_totals() -> dict[str, int]:
     with SUMMARY_LOCK:
-        return dict(SUMMARY)
+        return dict(_RUN_TOTALS)
 
 # Provider counts (pre/post) seeding for UI/report parity
 def _seed_summary_provider_counts(phase: str) -> None:
@@ -416,13 +469,8 @@ def _slim_sync_log_line(line: str) -> str:
         return s
 
 def _sync_progress_ui(msg: str):
-    rt = _rt()
-    strip_ansi, _append_log = rt[7], rt[8]
+    _append_log = _rt()[8]
     try:
-        try:
-            _parse_sync_line(strip_ansi(msg))
-        except Exception as e:
-            _append_log("SYNC", f"[!] progress-parse failed: {e}")
         slim = _slim_sync_log_line(msg)
         if str(slim or "").strip():
             _append_log("SYNC", slim)
@@ -524,7 +572,7 @@ def _emit_unresolved_details(total_unresolved: int | None = None) -> None:
 
 def _run_pairs_thread(run_id: str, overrides: dict | None = None) -> None:
     rt = _rt()
-    LOG_BUFFERS, RUNNING_PROCS, _append_log, strip_ansi = rt[0], rt[1], rt[8], rt[7]
+    LOG_BUFFERS, RUNNING_PROCS, _append_log = rt[0], rt[1], rt[8]
     overrides = overrides or {}
     scheduler_context = dict(overrides)
     scheduler_context["run_id"] = str(run_id)
@@ -538,6 +586,7 @@ def _run_pairs_thread(run_id: str, overrides: dict | None = None) -> None:
     os.environ["CW_RUN_ID"] = str(run_id)
     _sync_progress_ui("::CLEAR::")
     _sync_progress_ui(f"SYNC start: orchestrator pairs run_id={run_id}")
+    _summary_mark_started("orchestrator")
 
     pair_scope = (
         os.getenv("CW_PAIR_KEY")
@@ -578,56 +627,6 @@ def _run_pairs_thread(run_id: str, overrides: dict | None = None) -> None:
                 else:
                     os.environ[k] = v
 
-    def _totals_from_log(buf: list[str]) -> dict:
-        t = {"attempted": 0, "added": 0, "removed": 0, "updated": 0, "skipped": 0, "unresolved": 0, "errors": 0, "blocked": 0}
-        for line in buf or []:
-            s = strip_ansi(line).strip()
-            if not s.startswith("{"):
-                continue
-            try:
-                o = json.loads(s)
-            except Exception:
-                continue
-
-            ev = str(o.get("event") or "")
-            if ev == "apply:add:done":
-                t["attempted"] += int(o.get("attempted", 0))
-                t["skipped"] += int(o.get("skipped", 0))
-                t["unresolved"] += int(o.get("unresolved", 0))
-                t["errors"] += int(o.get("errors", 0))
-                t["added"] += int(o.get("added", o.get("count", 0)) or 0)
-
-            elif ev == "apply:remove:done":
-                t["attempted"] += int(o.get("attempted", 0))
-                t["skipped"] += int(o.get("skipped", 0))
-                t["unresolved"] += int(o.get("unresolved", 0))
-                t["errors"] += int(o.get("errors", 0))
-                t["removed"] += int(o.get("removed", o.get("count", 0)) or 0)
-
-            elif ev == "apply:update:done":
-                t["attempted"] += int(o.get("attempted", 0))
-                t["skipped"] += int(o.get("skipped", 0))
-                t["unresolved"] += int(o.get("unresolved", 0))
-                t["errors"] += int(o.get("errors", 0))
-                t["updated"] += int(o.get("updated", o.get("count", 0)) or 0)
-
-            elif ev == "debug":
-                msg = str(o.get("msg") or "")
-                if msg == "manual.blocks":
-                    t["blocked"] += int(o.get("adds_blocked", 0) or 0) + int(o.get("removes_blocked", 0) or 0)
-                elif msg == "blocked.manual":
-                    t["blocked"] += int(o.get("blocked_items", o.get("blocked_keys", 0)) or 0)
-                elif msg == "blocked.counts":
-                    t["blocked"] += int(o.get("blocked_blackbox", 0) or 0) + int(o.get("blocked_manual", 0) or 0)
-
-            elif ev == "blocked.counts":
-                t["blocked"] += int(o.get("blocked_blackbox", 0) or 0) + int(o.get("blocked_manual", 0) or 0)
-
-            elif ev == "run:done":
-                t["blocked"] = max(t["blocked"], int(o.get("blocked", 0) or 0))
-                t["updated"] = max(t["updated"], int(o.get("updated", 0) or 0))
-        return t
-
     try:
         load_config, _save = _env()
         cfg = load_config()
@@ -666,7 +665,7 @@ def _run_pairs_thread(run_id: str, overrides: dict | None = None) -> None:
             pair = next((p for p in (cfg.get("pairs") or []) if str(p.get("id") or "") == req_pair_id), None)
             if not pair or not coerce_bool(pair.get("enabled", True), True):
                 _sync_progress_ui(f"[!] Pair not found or disabled: {req_pair_id}")
-                _sync_progress_ui("[SYNC] exit code: 1")
+                _sync_exit(1)
                 return
             cfg = dict(cfg)
             cfg["pairs"] = [pair]
@@ -714,12 +713,36 @@ def _run_pairs_thread(run_id: str, overrides: dict | None = None) -> None:
                 sync_cfg.get("write_state_json", runtime_cfg.get("write_state_json", True)),
                 True,
             )
-            result = mgr.run_pairs(
-                dry_run=dry,
-                progress=_sync_progress_ui,
-                write_state_json=write_state_json,
-                use_snapshot=True,
-            )
+            from cw_platform.orchestrator._events import ProgressChannel
+
+            channel = ProgressChannel(_on_sync_events).start()
+            structured = {"seen": False}
+
+            def _on_event(event: str, data: dict[str, Any]) -> None:
+                structured["seen"] = True
+                channel.put(event, data)
+
+            def _on_line(msg: str) -> None:
+                # Orchestrators without an event sink only report JSON lines.
+                if not structured["seen"] and msg.lstrip().startswith("{"):
+                    try:
+                        obj = json.loads(msg)
+                        if isinstance(obj, dict) and obj.get("event"):
+                            channel.put(str(obj.pop("event")), obj)
+                    except Exception:
+                        pass
+                _sync_progress_ui(msg)
+
+            try:
+                result = mgr.run_pairs(
+                    dry_run=dry,
+                    progress=_on_line,
+                    events=_on_event,
+                    write_state_json=write_state_json,
+                    use_snapshot=True,
+                )
+            finally:
+                channel.close()
 
         if coerce_bool(result.get("cancelled")) or cancel_requested(run_id):
             was_cancelled = True
@@ -750,8 +773,15 @@ def _run_pairs_thread(run_id: str, overrides: dict | None = None) -> None:
                 _append_log("SYNC", "[i] State persistence disabled; state-backed stats skipped.")
         except Exception as e:
             _append_log("SYNC", f"[!] Stats update failed: {e}")
+        if write_state_json:
+            try:
+                from services.dashboard_widgets import refresh_dashboard_views
 
-        totals = _totals_from_log(list(LOG_BUFFERS.get("SYNC") or []))
+                refresh_dashboard_views()
+            except Exception as e:
+                _append_log("SYNC", f"[!] Dashboard views refresh failed: {e}")
+
+        totals = _run_totals()
 
         def _merge_total(key: str) -> int:
             v_result = int(result.get(key) or 0)
@@ -778,10 +808,10 @@ def _run_pairs_thread(run_id: str, overrides: dict | None = None) -> None:
                 _emit_unresolved_details(unresolved)
             except Exception:
                 pass
-        _sync_progress_ui("[SYNC] exit code: 0")
+        _sync_exit(0)
     except Exception as e:
         _sync_progress_ui(f"[!] Sync error: {e}")
-        _sync_progress_ui("[SYNC] exit code: 1")
+        _sync_exit(1)
     finally:
         try:
             load_config, _ = _env()
@@ -822,271 +852,221 @@ def _run_pairs_thread(run_id: str, overrides: dict | None = None) -> None:
 def _lanes_enabled_defaults() -> dict[str, bool]:
     return {"watchlist": True, "ratings": True, "history": True, "progress": True, "playlists": True}
 
-def _parse_sync_line(line: str) -> None:
-    s = _rt()[7](line).strip()
+def _lane_locked(feat: str) -> dict[str, Any]:
+    F = SUMMARY.setdefault("features", {})
+    lane = F.get(feat)
+    if not isinstance(lane, dict):
+        lane = F[feat] = {
+            "added": 0,
+            "removed": 0,
+            "updated": 0,
+            "spotlight_add": [],
+            "spotlight_remove": [],
+            "spotlight_update": [],
+        }
+    return lane
+
+
+def _apply_phase_locked() -> dict[str, Any]:
+    phase = SUMMARY.setdefault("_phase", {})
+    return phase.setdefault("apply", {"total": 0, "done": 0, "final": False})
+
+
+def _int(v: Any) -> int:
     try:
-        o = json.loads(s)
-        if isinstance(o, dict) and o.get("event"):
-            ev = str(o.get("event") or "")
-            
-            if ev in ("one:plan", "two:plan"):
-                phase = SUMMARY.setdefault("_phase", {})
-                apply_phase = phase.setdefault(
-                    "apply", {"total": 0, "done": 0, "final": False}
-                )
+        return int(v or 0)
+    except Exception:
+        return 0
 
-                if ev == "one:plan":
-                    adds = int(o.get("adds") or 0)
-                    rems = int(o.get("removes") or 0)
-                    upds = int(o.get("updates") or 0)
-                    delta = max(0, adds) + max(0, rems) + max(0, upds)
-                else:
-                    delta = 0
-                    for k in ("add_to_A", "add_to_B", "upd_to_A", "upd_to_B", "rem_from_A", "rem_from_B"):
-                        try:
-                            delta += max(0, int(o.get(k) or 0))
-                        except Exception:
-                            pass
 
-                apply_phase["total"] = int(apply_phase.get("total") or 0) + delta
-                _summary_set("_phase", phase)
-                return
+_APPLY_DONE = {"apply:add:done": "added", "apply:remove:done": "removed", "apply:update:done": "updated"}
+_SPOT_BUCKET = {"add": "spotlight_add", "remove": "spotlight_remove"}
+_REDUCED_KEYS = ("_phase", "features", "unresolved_items")
 
-            if ev == "apply:unresolved":
-                raw_items = o.get("items")
-                if isinstance(raw_items, list) and raw_items:
-                    feat_u = str(o.get("feature") or "")
-                    prov_u = str(o.get("provider") or "")
-                    with SUMMARY_LOCK:
-                        bucket = SUMMARY.setdefault("unresolved_items", [])
-                        for it in raw_items:
-                            if isinstance(it, dict):
-                                rec = dict(it)
-                                rec.setdefault("feature", feat_u)
-                                rec.setdefault("provider", prov_u)
-                                bucket.append(rec)
-                return
 
-            feat = str(o.get("feature") or "").lower()
-            if feat in ("watchlist", "history", "ratings", "progress", "playlists"):
-                F = SUMMARY.setdefault("features", {})
-                if feat not in F:
-                    F[feat] = {
-                        "added": 0,
-                        "removed": 0,
-                        "updated": 0,
-                        "spotlight_add": [],
-                        "spotlight_remove": [],
-                        "spotlight_update": [],
-                    }
-                if ev == "ui:spotlight":
-                    try:
-                        action = str(o.get("action") or "").lower()
-                        bucket = (
-                            "spotlight_add"
-                            if action == "add"
-                            else "spotlight_remove"
-                            if action == "remove"
-                            else "spotlight_update"
-                        )
-                        cur_bucket = F[feat].get(bucket)
-                        if not isinstance(cur_bucket, list):
-                            cur_bucket = []
-                            F[feat][bucket] = cur_bucket
-                        items = o.get("items")
-                        if isinstance(items, list) and items:
-                            _merge_spotlight_items(cur_bucket, items, limit=25)
-                            _summary_set("features", F)
-                    except Exception:
-                        pass
-                    return
-                getc = lambda obj: int(
-                    (
-                        (obj.get("result") or {}).get("count")
-                        if isinstance(obj.get("result"), dict)
-                        else None
-                    )
-                    or obj.get("count")
-                    or 0
-                )
-                if ev in ("apply:add:done", "apply:remove:done", "apply:update:done"):
-                    cnt = getc(o)
-                    if ev == "apply:add:done":
-                        F[feat]["added"] += cnt
-                    elif ev == "apply:remove:done":
-                        F[feat]["removed"] += cnt
-                    else:
-                        F[feat]["updated"] += cnt
-                    _summary_set("features", F)
+def _reduce_sync_event_locked(ev: str, o: Mapping[str, Any]) -> tuple[str, ...]:
+    """Fold one orchestrator event into SUMMARY; returns the top-level keys it touched."""
+    if ev in ("one:plan", "two:plan"):
+        if ev == "one:plan":
+            delta = sum(max(0, _int(o.get(k))) for k in ("adds", "removes", "updates"))
+        else:
+            delta = sum(max(0, _int(o.get(k))) for k in ("add_to_A", "add_to_B", "upd_to_A", "upd_to_B", "rem_from_A", "rem_from_B"))
+        ap = _apply_phase_locked()
+        ap["total"] = _int(ap.get("total")) + delta
+        return ("_phase",)
 
-                    try:
-                        result_obj = o.get("result")
-                        res: dict[str, Any] = result_obj if isinstance(result_obj, dict) else {}
-                        bucket = (
-                            "spotlight_add"
-                            if ev == "apply:add:done"
-                            else "spotlight_remove"
-                            if ev == "apply:remove:done"
-                            else "spotlight_update"
-                        )
-                        cur_bucket = F[feat].get(bucket)
-                        if not isinstance(cur_bucket, list):
-                            cur_bucket = []
-                            F[feat][bucket] = cur_bucket
-                        spotlight = o.get("spotlight")
-                        if not isinstance(spotlight, list) or not spotlight:
-                            ckeys = res.get("confirmed_keys") or o.get("confirmed_keys") or []
-                            spotlight = _spotlight_items_from_keys(ckeys) if isinstance(ckeys, list) and ckeys else []
-                        _merge_spotlight_items(cur_bucket, spotlight, limit=25)
-                    except Exception:
-                        pass
+    if ev == "apply:unresolved":
+        raw_items = o.get("items")
+        if isinstance(raw_items, list) and raw_items:
+            feat_u = str(o.get("feature") or "")
+            prov_u = str(o.get("provider") or "")
+            bucket = SUMMARY.setdefault("unresolved_items", [])
+            for it in raw_items:
+                if isinstance(it, dict):
+                    rec = dict(it)
+                    rec.setdefault("feature", feat_u)
+                    rec.setdefault("provider", prov_u)
+                    bucket.append(rec)
+            return ("unresolved_items",)
+        return ()
+
+    if ev in ("debug", "blocked.counts"):
+        msg = str(o.get("msg") or "") if ev == "debug" else "blocked.counts"
+        if msg == "manual.blocks":
+            _RUN_TOTALS["blocked"] += _int(o.get("adds_blocked")) + _int(o.get("removes_blocked"))
+        elif msg == "blocked.manual":
+            _RUN_TOTALS["blocked"] += _int(o.get("blocked_items", o.get("blocked_keys")))
+        elif msg == "blocked.counts":
+            _RUN_TOTALS["blocked"] += _int(o.get("blocked_blackbox")) + _int(o.get("blocked_manual"))
+
+    if ev == "run:done":
+        _RUN_TOTALS["blocked"] = max(_RUN_TOTALS["blocked"], _int(o.get("blocked")))
+        _RUN_TOTALS["updated"] = max(_RUN_TOTALS["updated"], _int(o.get("updated")))
+        return ()
+
+    if ev in _APPLY_DONE:
+        for k in ("attempted", "skipped", "unresolved", "errors"):
+            _RUN_TOTALS[k] += _int(o.get(k))
+        kind = _APPLY_DONE[ev]
+        _RUN_TOTALS[kind] += _int(o.get(kind, o.get("count")))
+
+    feat = str(o.get("feature") or "").lower()
+    if ev.startswith("apply:") and ev.endswith(":progress"):
+        _APPLY_LIVE[(ev, str(o.get("dst") or ""), feat)] = _int(o.get("done"))
+        ap = _apply_phase_locked()
+        ap["live"] = sum(_APPLY_LIVE.values())
+        return ("_phase",)
+
+    touched: tuple[str, ...] = ()
+    if ev in _APPLY_DONE:
+        # Clear the in-flight count even for lanes the summary does not track.
+        _APPLY_LIVE.pop((ev.replace(":done", ":progress"), str(o.get("dst") or ""), feat), None)
+        ap = _apply_phase_locked()
+        ap["live"] = sum(_APPLY_LIVE.values())
+        touched = ("_phase",)
+
+    if feat not in FEATURE_KEYS:
+        return touched
+    lane = _lane_locked(feat)
 
-                    phase = SUMMARY.setdefault("_phase", {})
-                    apply_phase = phase.setdefault(
-                        "apply", {"total": 0, "done": 0, "final": False}
-                    )
-                    apply_phase["done"] = int(apply_phase.get("done") or 0) + cnt
-                    _summary_set("_phase", phase)
-                    return
-
-                if ev == "debug" and str(o.get("msg") or "") == "apply:add:corrected":
-                    eff = int(o.get("effective") or 0)
-                    if eff > int(F[feat].get("added") or 0):
-                        F[feat]["added"] = eff
-                    _summary_set("features", F)
-                    return
-    except Exception:
-        pass
+    if ev == "ui:spotlight":
+        action = str(o.get("action") or "").lower()
+        cur = lane.setdefault(_SPOT_BUCKET.get(action, "spotlight_update"), [])
+        items = o.get("items")
+        if isinstance(items, list) and items:
+            try:
+                _merge_spotlight_items(cur, items, limit=25)
+            except Exception:
+                pass
+        return ("features",)
 
-    m = re.match(r"^(?:>\s*)?SYNC start:\s+(?P<cmd>.+)$", s)
-    if m:
-        if not SUMMARY.get("running"):
-            _summary_set("running", True)
-            SUMMARY["raw_started_ts"] = time.time()
-            _summary_set("started_at", datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
-        cmd_str = m.group("cmd")
-        short_cmd = cmd_str
-        try:
-            parts = shlex.split(cmd_str)
-            script = next((os.path.basename(p) for p in reversed(parts) if p.endswith(".py")), None)
-            if script:
-                short_cmd = script
-            elif parts:
-                short_cmd = os.path.basename(parts[0])
-        except Exception:
-            pass
-        _summary_set("cmd", short_cmd)
-        _summary_set_timeline("start", True)
+    if ev in _APPLY_DONE:
+        res_obj = o.get("result")
+        res: Mapping[str, Any] = res_obj if isinstance(res_obj, Mapping) else {}
+        cnt = _int(res.get("count") or o.get("count"))
+        lane[_APPLY_DONE[ev]] = _int(lane.get(_APPLY_DONE[ev])) + cnt
         try:
-            if SUMMARY.get("plex_pre") is None:
-                _seed_summary_provider_counts("pre")
+            cur = lane.setdefault(_SPOT_BUCKET.get(ev.split(":")[1], "spotlight_update"), [])
+            spotlight = o.get("spotlight")
+            if not isinstance(spotlight, list) or not spotlight:
+                ckeys = res.get("confirmed_keys") or o.get("confirmed_keys") or []
+                spotlight = _spotlight_items_from_keys(ckeys) if isinstance(ckeys, list) and ckeys else []
+            _merge_spotlight_items(cur, spotlight, limit=25)
         except Exception:
             pass
-        return
+        ap = _apply_phase_locked()
+        ap["done"] = _int(ap.get("done")) + cnt
+        return ("features", "_phase")
 
-    m = re.search(r"Pre-sync counts:\s*(?P<pairs>.+)$", s, re.IGNORECASE)
-    if m:
-        pairs = re.findall(r"\b([A-Za-z][A-Za-z0-9_-]*)\s*=\s*(\d+)", m.group("pairs"))
-        for name, val in pairs:
-            key = name.lower()
-            try:
-                val_i = int(val)
-            except Exception:
-                continue
-            if key in ("plex", "simkl", "trakt", "jellyfin", "emby", "mdblist", "publicmetadb", "tmdb", "crosswatch"):
-                _summary_set(f"{key}_pre", val_i)
-        _summary_set_timeline("pre", True)
-        return
+    if ev == "debug" and str(o.get("msg") or "") == "apply:add:corrected":
+        eff = _int(o.get("effective"))
+        if eff > _int(lane.get("added")):
+            lane["added"] = eff
+            return ("features",)
+    return touched
 
-    m = re.search(r"Post-sync:\s*(?P<rest>.+)$", s, re.IGNORECASE)
-    if m:
-        rest = m.group("rest")
-        pairs = re.findall(r"\b([A-Za-z][A-Za-z0-9_-]*)\s*=\s*(\d+)", rest)
-        for name, val in pairs:
-            key = name.lower()
+
+def _on_sync_events(batch: Sequence[Any]) -> None:
+    with SUMMARY_LOCK:
+        changed: set[str] = set()
+        for item in batch:
             try:
-                val_i = int(val)
+                changed.update(_reduce_sync_event_locked(str(item.event or ""), item.data))
             except Exception:
-                continue
-            if key in ("plex", "simkl", "trakt", "jellyfin", "emby", "mdblist", "publicmetadb", "tmdb", "crosswatch"):
-                _summary_set(f"{key}_post", val_i)
-        mres = re.search(r"(?:→|->|=>)\s*([A-Za-z]+)", rest)
-        if mres:
-            _summary_set("result", mres.group(1).upper())
-        _summary_set_timeline("post", True)
-        return
+                changed.update(_REDUCED_KEYS)
+        if changed:
+            _summary_publish_locked(changed)
 
-    m = re.search(r"\[SYNC\]\s+exit code:\s+(?P<code>\d+)", s)
-    if m:
-        code = int(m.group("code"))
-        _summary_set("exit_code", code)
+
+def _summary_mark_started(cmd: str) -> None:
+    with SUMMARY_LOCK:
+        if not SUMMARY.get("running"):
+            SUMMARY["running"] = True
+            SUMMARY["raw_started_ts"] = time.time()
+            SUMMARY["started_at"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        SUMMARY["cmd"] = cmd
+        SUMMARY.setdefault("timeline", {})["start"] = True
+        _summary_publish_locked(("running", "raw_started_ts", "started_at", "cmd", "timeline"))
+    try:
+        if _summary_snapshot().get("plex_pre") is None:
+            _seed_summary_provider_counts("pre")
+    except Exception:
+        pass
+
+
+def _summary_mark_finished(code: int) -> None:
+    with SUMMARY_LOCK:
+        SUMMARY["exit_code"] = int(code)
         started = SUMMARY.get("raw_started_ts")
         if started:
-            dur = max(0.0, time.time() - float(started))
-            _summary_set("duration_sec", round(dur, 2))
-        _summary_set("finished_at", datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
-        _summary_set("running", False)
-        _summary_set_timeline("done", True)
-        try:
-            _seed_summary_provider_counts("post")
-        except Exception:
-            pass
-        try:
-            phase = SUMMARY.setdefault("_phase", {})
-            prev_apply = phase.get("apply") or {}
-            snap_phase = phase.setdefault(
-                "snapshot",
-                {"total": 1, "done": 1, "final": True},
-            )
-            apply_phase = phase.setdefault(
-                "apply",
-                {
-                    "total": int(prev_apply.get("total") or 0),
-                    "done": int(prev_apply.get("done") or 0),
-                    "final": True,
-                },
-            )
-            apply_phase["final"] = True
-            snap_phase["final"] = True
-            if not snap_phase.get("total"):
-                snap_phase["total"] = 1
-            snap_phase["done"] = snap_phase.get("total")
-            _summary_set("_phase", phase)
-        except Exception:
-            pass
-        try:
-            tl = SUMMARY.get("timeline") or {}
-            if tl.get("done"):
-                if not tl.get("pre"):
-                    _summary_set_timeline("pre", True)
-                if not tl.get("post"):
-                    _summary_set_timeline("post", True)
-        except Exception:
-            pass
+            SUMMARY["duration_sec"] = round(max(0.0, time.time() - float(started)), 2)
+        SUMMARY["finished_at"] = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        SUMMARY["running"] = False
+        SUMMARY.setdefault("timeline", {})["done"] = True
+        _summary_publish_locked(("exit_code", "duration_sec", "finished_at", "running", "timeline"))
+    try:
+        _seed_summary_provider_counts("post")
+    except Exception:
+        pass
+    with SUMMARY_LOCK:
+        phase = SUMMARY.setdefault("_phase", {})
+        snap_phase = phase.setdefault("snapshot", {"total": 1, "done": 1, "final": True})
+        apply_phase = _apply_phase_locked()
+        apply_phase["final"] = True
+        apply_phase.pop("live", None)
+        snap_phase["final"] = True
+        if not snap_phase.get("total"):
+            snap_phase["total"] = 1
+        snap_phase["done"] = snap_phase.get("total")
+        tl = SUMMARY.setdefault("timeline", {})
+        tl["pre"] = True
+        tl["post"] = True
 
-        try:
-            snap = _summary_snapshot()
-            lanes = snap.get("features") or {}
-            enabled = snap.get("enabled") or _lanes_enabled_defaults()
-            a = r = u = 0
-            for name, lane in (lanes or {}).items():
-                if isinstance(enabled, dict) and enabled.get(name) is False:
-                    continue
-                a += int((lane or {}).get("added") or 0)
-                r += int((lane or {}).get("removed") or 0)
-                u += int((lane or {}).get("updated") or 0)
-            _summary_set("added_last", a)
-            _summary_set("removed_last", r)
-            _summary_set("updated_last", u)
-        except Exception:
-            pass
-        try:
-            REPORT_DIR = _rt()[6]
-            from cw_platform.local_db.sync_reports import base_path_from_report_dir, save_report
+        lanes = SUMMARY.get("features") or {}
+        enabled = SUMMARY.get("enabled") or _lanes_enabled_defaults()
+        a = r = u = 0
+        for name, lane in (lanes or {}).items():
+            if isinstance(enabled, dict) and enabled.get(name) is False:
+                continue
+            a += _int((lane or {}).get("added"))
+            r += _int((lane or {}).get("removed"))
+            u += _int((lane or {}).get("updated"))
+        SUMMARY["added_last"] = a
+        SUMMARY["removed_last"] = r
+        SUMMARY["updated_last"] = u
+        _summary_publish_locked(("_phase", "timeline", "added_last", "removed_last", "updated_last"))
+    try:
+        REPORT_DIR = _rt()[6]
+        from cw_platform.local_db.sync_reports import base_path_from_report_dir, save_report
 
-            save_report(base_path_from_report_dir(REPORT_DIR), _summary_snapshot())
-        except Exception:
-            pass
+        save_report(base_path_from_report_dir(REPORT_DIR), _summary_snapshot())
+    except Exception:
+        pass
+
+
+def _sync_exit(code: int) -> None:
+    _summary_mark_finished(code)
+    _sync_progress_ui(f"[SYNC] exit code: {int(code)}")
 
 # State file helpers
 def _find_state_path() -> Path | None:
@@ -1503,67 +1483,6 @@ def _merge_spotlight_items(dst: list[Any], items: list[Any], *, limit: int = 25)
                     cur_sig = str(cur)
                 by_sig[cur_sig] = i
 
-def _hydrate_summary_spotlights_from_log(summary_obj: dict[str, Any], *, max_lines: int = 800) -> None:
-    feats = summary_obj.get("features")
-    if not isinstance(feats, dict):
-        return
-
-    try:
-        buf = _rt()[0].get("SYNC") or []
-    except Exception:
-        buf = []
-    if not isinstance(buf, list) or not buf:
-        return
-
-    lines = buf[-max_lines:] if len(buf) > max_lines else buf
-    for raw in lines:
-        try:
-            s = str(raw or "").strip()
-            if not s.startswith("{"):
-                continue
-            obj = json.loads(s)
-        except Exception:
-            continue
-
-        ev = str(obj.get("event") or "")
-        if ev not in ("apply:add:done", "apply:remove:done", "apply:update:done"):
-            continue
-        feat = str(obj.get("feature") or "").lower()
-        if feat not in ("watchlist", "history", "ratings", "progress", "playlists"):
-            continue
-
-        lane = feats.get(feat)
-        if not isinstance(lane, dict):
-            continue
-
-        bucket = (
-            "spotlight_add"
-            if ev == "apply:add:done"
-            else "spotlight_remove"
-            if ev == "apply:remove:done"
-            else "spotlight_update"
-        )
-        cur = lane.get(bucket)
-        if not isinstance(cur, list):
-            cur = []
-            lane[bucket] = cur
-
-        spotlight = obj.get("spotlight")
-        if not isinstance(spotlight, list) or not spotlight:
-            result_obj = obj.get("result")
-            res = result_obj if isinstance(result_obj, dict) else {}
-            spotlight = _spotlight_items_from_keys(
-                (res.get("confirmed_keys") if isinstance(res, dict) else None)
-                or obj.get("confirmed_keys")
-                or [],
-                limit=3,
-            )
-        if not spotlight:
-            continue
-
-        _merge_spotlight_items(cur, spotlight, limit=25)
-
-
 def _ensure_series_title(
     e: dict[str, Any],
     slim: dict[str, Any],
@@ -2468,7 +2387,7 @@ def api_run_sync(payload: dict | None = Body(None), request: Request = cast(Requ
             _summary_set("started_at", datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
             _summary_set_timeline("start", True)
             _sync_progress_ui("[i] No pairs configured - skipping sync. Configure/Enable one or more pairs to enable syncing.")
-            _sync_progress_ui("[SYNC] exit code: 0")
+            _sync_exit(0)
 
             return {"ok": True, "skipped": "no_pairs_configured"}
         if str((payload or {}).get("source") or "").strip().lower() != "scheduler":
@@ -2566,11 +2485,6 @@ def api_run_summary(request: Request = cast(Request, None)) -> JSONResponse:
     except Exception:
         snap["provider_counts"] = _provider_count_defaults()
 
-    try:
-        _hydrate_summary_spotlights_from_log(snap)
-    except Exception:
-        pass
-
     return JSONResponse(_scope_summary_for_user(cfg, user, snap))
 
 @router.get("/run/unresolved")
@@ -2704,10 +2618,16 @@ async def api_run_summary_stream(request: Request) -> StreamingResponse:
             return tuple(sorted((str(k).upper(), int(v or 0)) for k, v in counts.items()))
         except Exception:
             return ()
+    def _apply_phase_key(phase: Any) -> tuple[Any, ...]:
+        ap = phase.get("apply") if isinstance(phase, Mapping) else None
+        if not isinstance(ap, Mapping):
+            return ()
+        return (ap.get("total"), ap.get("done"), ap.get("live"), ap.get("final"))
+
     async def agen():
         last_key = None
         last_idx = 0
-        last_hydrate_sig = None
+        last_seq = -1
         last_emit = time.monotonic()
         LOG_BUFFERS = _rt()[0]
 
@@ -2715,11 +2635,9 @@ async def api_run_summary_stream(request: Request) -> StreamingResponse:
             if await request.is_disconnected():
                 break
             emitted = False
-            buf_len = 0
             log_visible = (not managed_scope) or run_log_visible_to_user(cfg_for_scope, user_for_scope)
             try:
                 buf = LOG_BUFFERS.get("SYNC") or []
-                buf_len = len(buf)
                 if last_idx > len(buf):
                     last_idx = 0
                 if last_idx < len(buf):
@@ -2739,35 +2657,31 @@ async def api_run_summary_stream(request: Request) -> StreamingResponse:
             except Exception:
                 pass
 
-            snap = dict(_summary_snapshot() or {})
-            snap.setdefault("features", {})
-            snap.setdefault("enabled", _lanes_enabled_defaults())
-            hydrate_sig = (buf_len, (snap.get("timeline", {}) or {}).get("done"))
-            if hydrate_sig != last_hydrate_sig:
-                last_hydrate_sig = hydrate_sig
-                try:
-                    _hydrate_summary_spotlights_from_log(snap)
-                except Exception:
-                    pass
-
-            snap = _scope_summary_for_user(cfg_for_scope, user_for_scope, snap)
-            key = (
-                snap.get("running"),
-                snap.get("exit_code"),
-                snap.get("cancel_requested"),
-                snap.get("cancelled"),
-                _provider_counts_key(snap.get("provider_counts") or snap.get("provider_counts_post")),
-                snap.get("result"),
-                snap.get("duration_sec"),
-                (snap.get("timeline", {}) or {}).get("done"),
-                _lane_key(snap.get("features")),
-                _enabled_key(snap.get("enabled")),
-            )
+            seq = _summary_version()
+            if seq != last_seq:
+                last_seq = seq
+                snap = _summary_snapshot()
+                snap.setdefault("features", {})
+                snap.setdefault("enabled", _lanes_enabled_defaults())
+                snap = _scope_summary_for_user(cfg_for_scope, user_for_scope, snap)
+                key = (
+                    snap.get("running"),
+                    snap.get("exit_code"),
+                    snap.get("cancel_requested"),
+                    snap.get("cancelled"),
+                    _provider_counts_key(snap.get("provider_counts") or snap.get("provider_counts_post")),
+                    snap.get("result"),
+                    snap.get("duration_sec"),
+                    (snap.get("timeline", {}) or {}).get("done"),
+                    _lane_key(snap.get("features")),
+                    _enabled_key(snap.get("enabled")),
+                    _apply_phase_key(snap.get("_phase")),
+                )
 
-            if key != last_key:
-                last_key = key
-                yield f"data: {json.dumps(snap, separators=(',',':'))}\n\n"
-                emitted = True
+                if key != last_key:
+                    last_key = key
+                    yield f"data: {json.dumps(snap, separators=(',',':'))}\n\n"
+                    emitted = True
 
             now = time.monotonic()
             if emitted:
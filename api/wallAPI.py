@@ -5,15 +5,23 @@ from __future__ import annotations
 
 import threading
 from typing import Any, cast
-from fastapi import FastAPI, Query, Request
+from fastapi import FastAPI, Query, Request, Response
 
 from cw_platform.config_base import CONFIG, config_path, load_config
 from cw_platform.local_db import manual_policy as sqlite_manual_policy
 from cw_platform.local_db import state as sqlite_state
 from cw_platform.local_db import watchlist_hide as sqlite_watchlist_hide
+from cw_platform.local_db.frozen import mutable_copy
 from cw_platform.orchestrator._state_store import StateStore
 from cw_platform.provider_instances import instances_for_user_profile, normalize_instance_id, provider_display_key
-from services.watchlist import build_watchlist, detect_available_watchlist_providers
+from services.watchlist import (
+    build_watchlist,
+    detect_available_watchlist_providers,
+    materialized_watchlist,
+    page_watchlist,
+    watchlist_etag,
+    watchlist_projection,
+)
 
 
 _WALL_CACHE_LOCK = threading.Lock()
@@ -30,7 +38,7 @@ def _path_key(path: Any) -> tuple[str, int, int]:
         return (str(path or ""), 0, 0)
 
 
-def _cache_key(*, both_only: bool, active_only: bool, limit: int, user_profile: str = "") -> tuple[Any, ...]:
+def _cache_key(*, both_only: bool, active_only: bool, limit: int, user_profile: str = "", offset: int = 0) -> tuple[Any, ...]:
     return (
         sqlite_state.fingerprint(CONFIG, {"watchlist"}),
         sqlite_manual_policy.fingerprint(CONFIG, {"watchlist"}),
@@ -40,6 +48,7 @@ def _cache_key(*, both_only: bool, active_only: bool, limit: int, user_profile:
         bool(active_only),
         int(limit or 0),
         str(user_profile or "").strip(),
+        int(offset or 0),
     )
 
 
@@ -84,7 +93,7 @@ def _load_wall_snapshot() -> list[dict[str, Any]]:
 
 def refresh_wall() -> list[dict[str, Any]]:
     try:
-        return build_watchlist(_load_state(), tmdb_ok=True)
+        return mutable_copy(materialized_watchlist(_load_state, build_watchlist, tmdb_ok=True)["items"])
     except Exception:
         return []
 
@@ -162,29 +171,37 @@ def register_wall(app: FastAPI) -> None:
     @app.get("/api/state/wall", tags=["wall"])
     def api_state_wall(
         request: Request = cast(Request, None),
+        response: Response = cast(Response, None),
         both_only: bool = Query(False, description="Keep only items present on multiple providers"),
         active_only: bool = Query(False, description="Keep only items from configured providers"),
         limit: int = Query(0, ge=0, le=100, description="Optional item limit"),
+        offset: int = Query(0, ge=0, description="Skip this many filtered items"),
         user_profile: str = Query("", description="Optional user profile id to scope provider instances"),
-    ) -> dict[str, Any]:
+    ) -> Any:
         from api.appAuthAPI import COOKIE_NAME, effective_user_profile_id
 
         cfg = load_config() or {}
         token = request.cookies.get(COOKIE_NAME) if request is not None else None
         profile = effective_user_profile_id(cfg, token, user_profile)
-        key = _cache_key(both_only=both_only, active_only=active_only, limit=limit, user_profile=profile)
+        start = offset if isinstance(offset, int) else 0
+        key = _cache_key(both_only=both_only, active_only=active_only, limit=limit, user_profile=profile, offset=start)
+        if_none_match = request.headers.get("if-none-match") if request is not None else None
         with _WALL_CACHE_LOCK:
             if _WALL_CACHE.get("key") == key and isinstance(_WALL_CACHE.get("data"), dict):
-                return dict(_WALL_CACHE["data"])
+                cached = dict(_WALL_CACHE["data"])
+                if if_none_match and if_none_match == cached.get("etag"):
+                    return Response(status_code=304, headers={"ETag": if_none_match})
+                if response is not None:
+                    response.headers["ETag"] = str(cached.get("etag") or "")
+                return cached
 
-        st = _load_state()
         api_key = _tmdb_api_key(cfg)
         scoped = bool(str(profile or "").strip())
         user_filter = instances_for_user_profile(cfg, profile) if scoped else {}
         if scoped and not user_filter:
             user_filter = {"__NONE__": ["__NONE__"]}
 
-        items = build_watchlist(st, tmdb_ok=bool(api_key)) or []
+        view = materialized_watchlist(_load_state, build_watchlist, tmdb_ok=bool(api_key))
         active = {pid.lower(): True for pid in _configured_provider_ids(cfg)}
 
         def keep(it: dict[str, Any]) -> bool:
@@ -199,25 +216,40 @@ def register_wall(app: FastAPI) -> None:
                 return False
             return True
 
-        items = [
-            scoped
-            for it in items
-            if keep(it)
-            for scoped in [_item_for_user_filter(it, user_filter)]
-            if scoped is not None
-        ]
+        scope = (
+            bool(both_only),
+            bool(active_only),
+            tuple(sorted(active)) if active_only else (),
+            tuple(sorted((str(p), tuple(map(str, v))) for p, v in user_filter.items())),
+        )
+        items = watchlist_projection(
+            view,
+            ("wall", scope),
+            lambda rows: [
+                scoped
+                for it in rows
+                if keep(it)
+                for scoped in [_item_for_user_filter(it, user_filter)]
+                if scoped is not None
+            ],
+        )
         total = len(items)
-        if limit:
-            items = items[:limit]
+        etag = watchlist_etag(view, "wall", scope, start, limit)
+        if if_none_match and if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag})
 
         data = {
             "ok": True,
-            "items": items,
+            "items": page_watchlist(items, start, limit),
             "total": total,
+            "offset": start,
+            "etag": etag,
             "missing_tmdb_key": not bool(api_key),
-            "last_sync_epoch": st.get("last_sync_epoch") if isinstance(st, dict) else None,
+            "last_sync_epoch": view["last_sync_epoch"],
         }
         with _WALL_CACHE_LOCK:
             _WALL_CACHE["key"] = key
             _WALL_CACHE["data"] = data
+        if response is not None:
+            response.headers["ETag"] = etag
         return data
@@ -7,8 +7,9 @@ import urllib.parse
 from typing import Any, Literal, cast
 
 from fastapi import APIRouter, Body, Path as FPath, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
+from cw_platform.local_db.frozen import mutable_copy
 from cw_platform.provider_instances import instances_for_user_profile, normalize_instance_id, provider_display_key
 from services.watchlist import (
     _feat_enabled,
@@ -18,6 +19,10 @@ from services.watchlist import (
     delete_watchlist_batch,
     delete_watchlist_item,
     detect_available_watchlist_providers,
+    materialized_watchlist,
+    page_watchlist,
+    watchlist_etag,
+    watchlist_projection,
 )
 
 router = APIRouter(prefix="/api/watchlist", tags=["watchlist"])
@@ -175,6 +180,10 @@ def _item_for_user_filter(item: dict[str, Any], user_filter: dict[str, list[str]
     return out
 
 
+def _user_filter_key(user_filter: dict[str, list[str]]) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    return tuple(sorted((str(p), tuple(str(i) for i in (v if isinstance(v, list) else [v]))) for p, v in (user_filter or {}).items()))
+
+
 def _effective_user_filter(cfg: dict[str, Any], request: Request | None, requested_profile: str) -> tuple[str, dict[str, list[str]]]:
     try:
         from api.appAuthAPI import COOKIE_NAME, effective_user_profile_id
@@ -309,7 +318,7 @@ def _bulk_delete(provider: str, keys_raw: list[Any], provider_instance: str | No
         specs.append(spec)
 
     cfg = load_config()
-    state = _load_watchlist_state()
+    state = mutable_copy(_load_watchlist_state())
     active = _active_providers(cfg)
     prov = (provider or "ALL").upper().strip()
     inst_p = provider_instance if prov != "ALL" else None
@@ -423,7 +432,7 @@ def remove_across_providers_by_ids(
     from crosswatch import _append_log
 
     cfg = load_config()
-    state = _load_watchlist_state()
+    state = mutable_copy(_load_watchlist_state())
     if not ids or not isinstance(ids, dict):
         return {"ok": False, "error": "missing ids"}
 
@@ -503,7 +512,7 @@ def remove_from_provider_by_ids(
     from crosswatch import _append_log
 
     cfg = load_config()
-    state = _load_watchlist_state()
+    state = mutable_copy(_load_watchlist_state())
     prov = (provider or "").strip().upper()
     if not prov:
         return {"ok": False, "error": "missing provider"}
@@ -572,6 +581,11 @@ def api_watchlist(
         le=5000,
         description="Slice the list",
     ),
+    offset: int = Query(
+        0,
+        ge=0,
+        description="Skip this many items before slicing",
+    ),
     max_meta: int = Query(
         250,
         ge=0,
@@ -579,7 +593,7 @@ def api_watchlist(
         description="Cap enriched items",
     ),
     user_profile: str = Query("", description="Optional user profile id to scope provider instances"),
-) -> JSONResponse:
+) -> Response:
 
     try:
         from cw_platform.config_base import load_config
@@ -589,33 +603,36 @@ def api_watchlist(
         return JSONResponse({"ok": False, "error": "server import failed"}, status_code=200)
 
     cfg = load_config()
-    st = _load_watchlist_state()
     api_key = _tmdb_api_key(cfg)
     has_key = bool(api_key)
 
-    if not st:
-        return JSONResponse(
-            {"ok": False, "error": "No snapshot found or empty.", "missing_tmdb_key": not has_key},
-            status_code=200,
-        )
-
     try:
-        items = build_watchlist(st, tmdb_ok=has_key) or []
+        view = materialized_watchlist(_load_watchlist_state, build_watchlist, tmdb_ok=has_key)
     except Exception:
         return JSONResponse(
             {"ok": False, "error": "watchlist build failed", "missing_tmdb_key": not has_key},
             status_code=200,
         )
+    if view["empty"]:
+        return JSONResponse(
+            {"ok": False, "error": "No snapshot found or empty.", "missing_tmdb_key": not has_key},
+            status_code=200,
+        )
 
     profile, user_filter = _effective_user_filter(cfg, request, user_profile)
+    items = view["items"]
     if user_filter:
-        items = [
-            scoped
-            for it in items
-            if isinstance(it, dict)
-            for scoped in [_item_for_user_filter(it, user_filter)]
-            if scoped is not None
-        ]
+        items = watchlist_projection(
+            view,
+            ("user", _user_filter_key(user_filter)),
+            lambda rows: [
+                scoped
+                for it in rows
+                if isinstance(it, dict)
+                for scoped in [_item_for_user_filter(it, user_filter)]
+                if scoped is not None
+            ],
+        )
 
     if not items:
         return JSONResponse(
@@ -624,17 +641,22 @@ def api_watchlist(
                 "items": [],
                 "error": "" if profile else "No snapshot data found.",
                 "missing_tmdb_key": not has_key,
-                "last_sync_epoch": st.get("last_sync_epoch"),
+                "last_sync_epoch": view["last_sync_epoch"],
                 "meta_enriched": 0,
             },
             status_code=200,
         )
 
-    if limit:
-        items = items[:limit]
+    total = len(items)
+    start = offset if isinstance(offset, int) else 0
+    eff_overview = overview if (overview != "none" and has_key) else "none"
+    etag = watchlist_etag(view, _user_filter_key(user_filter), start, limit, eff_overview, locale, max_meta)
+    if eff_overview == "none" and request is not None and request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    items = [dict(it) for it in page_watchlist(items, start, limit)]
 
     enriched = 0
-    eff_overview = overview if (overview != "none" and has_key) else "none"
 
     if eff_overview != "none":
         eff_locale = (
@@ -693,11 +715,15 @@ def api_watchlist(
         {
             "ok": True,
             "items": items,
+            "total": total,
+            "offset": start,
+            "etag": etag,
             "missing_tmdb_key": not has_key,
-            "last_sync_epoch": st.get("last_sync_epoch"),
+            "last_sync_epoch": view["last_sync_epoch"],
             "meta_enriched": enriched,
         },
         status_code=200,
+        headers={"ETag": etag},
     )
 
 @router.delete("/{key}")
@@ -235,16 +235,37 @@ export default {
         im.state.total=0; im.state.ready=0; im.state.exists=0; im.state.filteredTotal=0; im.state.offset=0; refreshImportCount();
       }
     };
+    const IMPORT_STAGES={upload:"Uploading",parsing:"Parsing",indexing:"Indexing library",matching:"Matching",writing:"Importing",done:"Done",error:"Error"};
+    const newProgressId=()=>`imp-${Date.now().toString(36)}-${Math.random().toString(36).slice(2,10)}`;
+    const watchImportProgress=id=>{
+      let stop=false;
+      const tick=async()=>{
+        if(stop) return;
+        try{
+          const p=await fjson(`/api/import/progress/${encodeURIComponent(id)}`);
+          if(stop||p.done) return;
+          const stage=IMPORT_STAGES[p.stage]||p.stage||"Working";
+          const files=p.files_total?`${p.files_done||0}/${p.files_total} file(s)`:"";
+          const sub=p.kind==="commit"?`${stage} ${p.current_feature||""}`.trim():[stage,files].filter(Boolean).join(" - ");
+          setProgress(progressPct,stage,sub,`${p.kind==="commit"?(p.applied||0):(p.rows||0)}`);
+        }catch{}
+        if(!stop) setTimeout(tick,700);
+      };
+      setTimeout(tick,700);
+      return()=>{stop=true};
+    };
     const uploadImport=async()=>{
       const file=im.state.file||im.file.files?.[0];
       if(!file){im.tbody.innerHTML=`<tr><td colspan="6" class="hint">Choose a ZIP, JSON or CSV file first.</td></tr>`;return}
       showWait("Parsing import...");
       im.upload.disabled=true;
+      const progressId=newProgressId(), stopProgress=watchImportProgress(progressId);
       try{
         const body=new FormData();
         body.append("file",file);
         body.append("source",im.source.value);
         body.append("target_instance",im.target.value||"default");
+        body.append("progress_id",progressId);
         const data=await fjson("/api/import/preview",{method:"POST",body});
         im.state.importId=data.import_id||""; im.state.mode="ready"; im.state.selected.clear(); im.state.offset=0; im.allReady.checked=true;
         im.state.total=data.total||0; im.state.ready=data.summary?.ready||0; im.state.exists=data.summary?.exists||0; im.state.filteredTotal=data.filtered_total||0;
@@ -261,7 +282,7 @@ export default {
         setImportGuideVisible(true);
         refreshImportCount();
         finishProgress(false,reasonLabel(code));
-      }finally{im.upload.disabled=false;hideWait()}
+      }finally{stopProgress();im.upload.disabled=false;hideWait()}
     };
     const commitImport=async()=>{
       if(!im.state.importId) return;
@@ -272,8 +293,9 @@ export default {
       im.commit.textContent="Importing...";
       showWait(`Importing ${rows} row(s)...`);
       prog.rows.textContent=`${rows}`;
+      const progressId=newProgressId(), stopProgress=watchImportProgress(progressId);
       try{
-        const payload={import_id:im.state.importId,target_instance:im.target.value||"default",mode:im.state.mode,row_ids:[...im.state.selected],features:imFeatures(),media_types:imMedia(),include_existing:imIncludeExisting()};
+        const payload={import_id:im.state.importId,target_instance:im.target.value||"default",mode:im.state.mode,row_ids:[...im.state.selected],features:imFeatures(),media_types:imMedia(),include_existing:imIncludeExisting(),progress_id:progressId};
         const data=await fjson("/api/import/commit",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(payload)});
         prog.rows.textContent=`${data.applied||0}`;
         im.tbody.innerHTML=`<tr><td colspan="6" class="hint">Imported ${esc(data.applied||0)} item(s) into CrossWatch.</td></tr>`;
@@ -286,7 +308,7 @@ export default {
         im.tbody.innerHTML=`<tr><td colspan="6" class="hint">${esc(reasonLabel(e?.payload?.detail?.code||e.message||"Import failed"))}</td></tr>`;
         refreshImportCount();
         finishProgress(false,reasonLabel(e?.payload?.detail?.code||e.message||"Import failed"));
-      }finally{im.commit.textContent=oldLabel;hideWait()}
+      }finally{stopProgress();im.commit.textContent=oldLabel;hideWait()}
     };
 
     const ex={
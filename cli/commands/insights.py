@@ -87,6 +87,23 @@ def activity_clear(
     state.out.success("Activity history cleared.")
 
 
+def _ms(value: Any) -> str:
+    return "-" if value is None else f"{int(value)}ms"
+
+
+HTTP_COLUMNS = [
+    ("PROVIDER", lambda r: f"{r.get('provider') or '-'}" + (f"/{r['instance']}" if r.get("instance") not in (None, "", "default") else "")),
+    ("METHOD", lambda r: str(r.get("method") or "-")),
+    ("ROUTE", lambda r: str(r.get("route") or "-")[:48]),
+    ("STATUS", lambda r: str(r.get("status_class") or "-")),
+    ("COUNT", lambda r: str(r.get("count") or 0)),
+    ("P50", lambda r: _ms(r.get("p50_ms"))),
+    ("P95", lambda r: _ms(r.get("p95_ms"))),
+    ("P99", lambda r: _ms(r.get("p99_ms"))),
+    ("RETRIES", lambda r: str(r.get("retries") or 0)),
+]
+
+
 def register(app: typer.Typer) -> None:
     app.add_typer(activity_app, name="activity")
 
@@ -127,3 +144,32 @@ def register(app: typer.Typer) -> None:
             if block and all(not isinstance(v, (dict, list)) for v in block.values()):
                 state.out.print()
                 state.out.kv(_flat_kv(block), title=key)
+
+    @app.command("http-latency")
+    def http_latency_cmd(
+        ctx: typer.Context,
+        minutes: int = typer.Option(60, "--minutes", "-m", help="Look back this many minutes."),
+        provider: str = typer.Option("", "--provider", "-p", help="Only this provider."),
+        instance: str = typer.Option("", "--instance", help="Only this provider instance."),
+        by_minute: bool = typer.Option(False, "--by-minute", help="One row per minute instead of per endpoint."),
+        limit: int = typer.Option(30, "--limit", "-n", help="Maximum rows."),
+    ) -> None:
+        """Show provider HTTP latency percentiles per endpoint."""
+        state: Ctx = ctx.obj
+        params: dict[str, Any] = {"minutes": minutes, "by_minute": 1 if by_minute else 0}
+        if provider.strip():
+            params["provider"] = provider.strip().upper()
+        if instance.strip():
+            params["instance"] = instance.strip()
+        payload = as_dict(state.get("/api/insights/http", params=params))
+        if state.out.json_mode:
+            state.out.data(payload)
+            return
+        rows = _rows(payload, "endpoints")
+        if by_minute:
+            columns = [("WHEN", lambda r: fmt_ts(r.get("ts"))), *HTTP_COLUMNS]
+            rows = rows[-limit:] if limit > 0 else rows
+        else:
+            columns = HTTP_COLUMNS
+            rows = rows[:limit] if limit > 0 else rows
+        state.out.records(rows, columns, title=f"HTTP latency, last {minutes} min", empty="No requests recorded.")
@@ -143,6 +143,44 @@ def register(app: typer.Typer) -> None:
                 title="Pairs",
             )
 
+    @app.command("startup-profile")
+    def startup_profile_cmd(
+        ctx: typer.Context,
+        top: int = typer.Option(12, "--top", "-n", min=1, help="Rows per table."),
+        imports: bool = typer.Option(True, "--imports/--no-imports", help="Time a cold `import crosswatch` in a fresh interpreter."),
+    ) -> None:
+        """Show the cold-start breakdown: import time per package and lifespan steps."""
+        state: Ctx = ctx.obj
+        breakdown: dict[str, Any] = {}
+        if imports:
+            _ = state.local
+            from cw_platform import startup_profile
+
+            breakdown = startup_profile.import_breakdown(top=top)
+        boot = as_dict(_safe(state, "/api/health/startup", {}) if not state.force_local else {})
+        out = state.out
+        if out.json_mode:
+            out.data({"imports": breakdown, "boot": boot})
+            return
+
+        if breakdown:
+            if not breakdown.get("ok"):
+                out.warn(f"import crosswatch failed: {breakdown.get('error') or 'unknown error'}")
+            out.kv(
+                [("Import total", f"{breakdown.get('total_ms', 0)} ms"), ("Modules", str(breakdown.get("modules", 0)))],
+                title="Cold import",
+            )
+            out.print()
+            out.table(["PACKAGE", "SELF MS", "MODULES"], [[g["group"], g["ms"], g["modules"]] for g in breakdown.get("groups") or []], title="By package")
+            out.print()
+            out.table(["MODULE", "CUMULATIVE MS"], [[m["module"], m["ms"]] for m in breakdown.get("slowest") or []], title="Slowest imports")
+        if boot.get("steps"):
+            out.print()
+            out.table(["STEP", "MS"], [[s.get("step"), s.get("ms")] for s in boot["steps"]], title=f"Running service boot ({boot.get('total_ms', 0)} ms)")
+            out.kv([("Sync modules loaded", ", ".join(boot.get("sync_modules_loaded") or []) or "none")])
+        elif not state.force_local:
+            out.info("Boot steps need the running service; start CrossWatch to include them.")
+
     @app.command("version")
     def version_cmd(
         ctx: typer.Context,
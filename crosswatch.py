@@ -18,6 +18,7 @@ import re
 import socket
 import threading
 import time
+_BOOT_T0 = time.perf_counter()
 import uvicorn
 import asyncio
 
@@ -50,6 +51,7 @@ from api.apiTokensAPI import (
     touch_api_token as app_touch_api_token,
     register_api_tokens,
 )
+from cw_platform import startup_profile as _startup
 from cw_platform.access_policy import clean_managed_permissions
 from cw_platform.event_archive.audit import record_audit
 
@@ -113,7 +115,6 @@ STATE_DIR.mkdir(parents=True, exist_ok=True)
 REPORT_DIR = CONFIG_DIR / "sync_reports"
 CACHE_DIR  = (CONFIG_DIR / "cache");        CACHE_DIR.mkdir(parents=True, exist_ok=True)
 CW_STATE_DIR = (CONFIG_DIR / ".cw_state"); CW_STATE_DIR.mkdir(parents=True, exist_ok=True)
-TOMBSTONES_PATH = (CW_STATE_DIR / "tombstones.json").resolve()
 
 _METADATA: Any = None
 scheduler: Optional[SyncScheduler] = None
@@ -949,15 +950,42 @@ def _get_orchestrator() -> Orchestrator:
     cfg = load_config()
     return Orchestrator(cfg)
 
+# Startup profile, logged when CW_STARTUP_PROFILE=1
+def _log_startup_profile() -> None:
+    prof = _startup.report()
+    parts = ", ".join(f"{s['step']}={s['ms']:.0f}ms" for s in prof["steps"])
+    LOG(
+        f"startup: {prof['total_ms']:.0f}ms ({parts}); "
+        f"sync modules loaded: {', '.join(prof['sync_modules_loaded']) or 'none'}",
+        level="INFO",
+        module="STARTUP",
+    )
+
 # Startup sequence
 @asynccontextmanager
 async def _lifespan(app: Any) -> AsyncIterator[None]:
     app.state.watch_groups = {}
     app.state.watch_manager = None
-    _apply_debug_env_from_config()
-    _install_ui_log_forwarder()
+    with _startup.step("logging"):
+        _apply_debug_env_from_config()
+        _install_ui_log_forwarder()
+    try:
+        with _startup.step("http_metrics"):
+            from cw_platform import http_metrics as _http_metrics
+
+            _http_metrics.enable_persistence()
+    except Exception:
+        pass
+    try:
+        with _startup.step("status_refresher"):
+            from api.probesAPI import start_status_refresher as _start_status_refresher
+
+            _start_status_refresher()
+    except Exception:
+        pass
 
     started = False
+    watch_t0 = time.perf_counter()
     try:
         cfg = load_config() or {}
         sc = (cfg.get("scrobble") or {}) or {}
@@ -1004,33 +1032,38 @@ async def _lifespan(app: Any) -> AsyncIterator[None]:
             _UIHostLogger("WATCH", "WATCH")(f"watch autostart check failed: {e}", level="ERROR")
         except Exception:
             pass
-
+    finally:
+        _startup.record("watch_autostart", watch_t0)
 
     try:
         global scheduler
-        if scheduler is not None:
-            cfg_sched = (load_config() or {}).get("scheduling") or {}
-            effective_enabled = bool(
-                cfg_sched.get("enabled") or ((cfg_sched.get("advanced") or {}).get("enabled"))
-            )
-            if effective_enabled:
-                scheduler.start()
-                if hasattr(scheduler, "refresh"):
-                    scheduler.refresh()
+        with _startup.step("scheduler"):
+            if scheduler is not None:
+                cfg_sched = (load_config() or {}).get("scheduling") or {}
+                effective_enabled = bool(
+                    cfg_sched.get("enabled") or ((cfg_sched.get("advanced") or {}).get("enabled"))
+                )
+                if effective_enabled:
+                    scheduler.start()
+                    if hasattr(scheduler, "refresh"):
+                        scheduler.refresh()
     except Exception as e:
         try:
             _UIHostLogger("SYNC")(f"scheduler startup error: {e}", level="ERROR")
         except Exception:
             pass
     try:
-        from cw_platform.anime_mapping.auto_update import refresh_from_config as _anime_mapping_refresh_auto_update
+        with _startup.step("anime_mapping"):
+            from cw_platform.anime_mapping.auto_update import refresh_from_config as _anime_mapping_refresh_auto_update
 
-        _anime_mapping_refresh_auto_update(load_config)
+            _anime_mapping_refresh_auto_update(load_config)
     except Exception as e:
         try:
             _UIHostLogger("SYNC")(f"anime mapping auto-update startup error: {e}", level="ERROR")
         except Exception:
             pass
+    if _startup.enabled():
+        _log_startup_profile()
     try:
         yield
     finally:
@@ -1045,8 +1078,21 @@ async def _lifespan(app: Any) -> AsyncIterator[None]:
             _wm_stop(app)
         except Exception:
             pass
+        try:
+            from api.probesAPI import stop_status_refresher as _stop_status_refresher
+
+            _stop_status_refresher()
+        except Exception:
+            pass
+        try:
+            from cw_platform import http_metrics as _http_metrics
+
+            _http_metrics.METRICS.flush(include_current=True)
+        except Exception:
+            pass
 
 app.router.lifespan_context = _lifespan
+_startup.record("import", _BOOT_T0)
 
 # Middleware: disable caching for API responses
 @app.middleware("http")
@@ -1495,7 +1541,6 @@ def main(host: str = "0.0.0.0", port: int = 8787) -> None:
     boot.info("")
     boot.info(f"  {_c('Cache:', DIM)}      {CACHE_DIR}")
     boot.info(f"  {_c('CW_STATE:', DIM)}   {CW_STATE_DIR}")
-    boot.info(f"  {_c('Tombstones:', DIM)} {TOMBSTONES_PATH} (JSON)")
     boot.info(f"  {_c('Config:', DIM)}     {CONFIG_DIR / 'config.json'} (JSON)")
 
     db_path: Any = None
@@ -10,6 +10,7 @@ import tempfile
 import threading
 import time
 import uuid
+from bisect import bisect_right
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
@@ -23,7 +24,7 @@ MEDIA_TYPES = ("show", "movie")
 _ID_RE = re.compile(r"^[A-Za-z0-9._:-]{1,64}$")
 _LOCK = threading.Lock()
 _MAX_OVERRIDES = 5000
-_CACHE: dict[str, Any] = {"key": "", "rows": []}
+_CACHE: dict[str, Any] = {"key": "", "rows": [], "index": None}
 
 
 class OverrideError(ValueError):
@@ -198,20 +199,29 @@ def _cache_key(path: Path) -> str:
     return f"{path}|{st.st_mtime_ns}|{st.st_size}"
 
 
+def overrides_version() -> str:
+    return _cache_key(overrides_path())
+
+
 def invalidate_cache() -> None:
     _CACHE["key"] = ""
     _CACHE["rows"] = []
+    _CACHE["index"] = None
 
 
-def load_overrides() -> list[dict[str, Any]]:
+def _cached_rows() -> list[dict[str, Any]]:
     path = overrides_path()
     key = _cache_key(path)
-    if key == _CACHE["key"]:
-        return list(_CACHE["rows"])
-    rows = _parse_overrides(path)
-    _CACHE["key"] = key
-    _CACHE["rows"] = rows
-    return list(rows)
+    if key != _CACHE["key"]:
+        rows = _parse_overrides(path)
+        _CACHE["key"] = key
+        _CACHE["rows"] = rows
+        _CACHE["index"] = None
+    return _CACHE["rows"]
+
+
+def load_overrides() -> list[dict[str, Any]]:
+    return list(_cached_rows())
 
 
 def _parse_overrides(path: Path) -> list[dict[str, Any]]:
@@ -356,10 +366,85 @@ def _ids_of(item: Mapping[str, Any]) -> dict[str, str]:
     return out
 
 
-def _matches_ids(row: Mapping[str, Any], ids: Mapping[str, str]) -> bool:
-    provider = str(row.get("match_provider") or "")
-    value = str(row.get("match_id") or "")
-    return bool(value) and str(ids.get(provider) or "") == value
+class _OverrideIndex:
+    """Enabled show/identity rules bucketed by ID token; ``pos`` keeps file order for precedence."""
+
+    def __init__(self, rows: Sequence[Mapping[str, Any]]):
+        self.identity: dict[tuple[str, str], list[tuple[int, str, str, str]]] = {}
+        self.episodes: dict[tuple[str, str], dict[int | None, tuple[list[int], list[tuple[int, int, int | None, Mapping[str, Any]]]]]] = {}
+        self.sources: dict[tuple[str, str], list[Mapping[str, Any]]] = {}
+        spans: dict[tuple[str, str], dict[int | None, list[tuple[int, int, int | None, Mapping[str, Any]]]]] = {}
+        for pos, row in enumerate(rows):
+            if not row.get("enabled", True):
+                continue
+            token = (str(row.get("match_provider") or ""), str(row.get("match_id") or ""))
+            if token[1]:
+                self.identity.setdefault(token, []).append(
+                    (pos, str(row.get("media_type") or ""), str(row.get("target_namespace") or ""), str(row.get("target_id") or ""))
+                )
+            if row.get("media_type") != "show" or row.get("episode_from") is None or row.get("episode_start_at") is None:
+                continue
+            target = (str(row.get("target_namespace") or ""), str(row.get("target_id") or ""))
+            self.sources.setdefault(target, []).append(row)
+            if token[1]:
+                season = int(row["match_season"]) if row.get("match_season") is not None else None
+                ep_to = int(row["episode_to"]) if row.get("episode_to") is not None else None
+                spans.setdefault(token, {}).setdefault(season, []).append((int(row["episode_from"]), pos, ep_to, row))
+        for token, seasons in spans.items():
+            self.episodes[token] = {}
+            for season, items in seasons.items():
+                items.sort(key=lambda it: (it[0], it[1]))
+                self.episodes[token][season] = ([it[0] for it in items], items)
+
+    def _tokens(self, ids: Mapping[str, str]) -> list[tuple[str, str]]:
+        out: list[tuple[str, str]] = []
+        for key, value in ids.items():
+            text = str(value or "")
+            if isinstance(key, str) and text:
+                out.append((key, text))
+        return out
+
+    def episode(self, ids: Mapping[str, str], s_num: int, e_num: int) -> Mapping[str, Any] | None:
+        best: tuple[int, Mapping[str, Any]] | None = None
+        for token in self._tokens(ids):
+            seasons = self.episodes.get(token)
+            if not seasons:
+                continue
+            for season in (s_num, None):
+                bucket = seasons.get(season)
+                if bucket is None:
+                    continue
+                starts, items = bucket
+                for ep_from, pos, ep_to, row in items[: bisect_right(starts, e_num)]:
+                    if ep_to is not None and e_num > ep_to:
+                        continue
+                    if best is None or pos < best[0]:
+                        best = (pos, row)
+        return best[1] if best else None
+
+    def identity_targets(self, ids: Mapping[str, str], wanted: str) -> dict[str, str]:
+        hits: list[tuple[int, str, str]] = []
+        for token in self._tokens(ids):
+            for pos, media_type, namespace, target_id in self.identity.get(token, ()):
+                if wanted in MEDIA_TYPES and media_type != wanted:
+                    continue
+                hits.append((pos, namespace, target_id))
+        out: dict[str, str] = {}
+        for _pos, namespace, target_id in sorted(hits):
+            if namespace and namespace not in out:
+                out[namespace] = target_id
+        return out
+
+
+def _override_index(rows: list[dict[str, Any]] | None) -> _OverrideIndex:
+    if rows is not None:
+        return _OverrideIndex(rows)
+    current = _cached_rows()
+    index = _CACHE["index"]
+    if index is None or index[0] is not current:
+        index = (current, _OverrideIndex(current))
+        _CACHE["index"] = index
+    return index[1]
 
 
 def find_episode_override(
@@ -373,27 +458,15 @@ def find_episode_override(
     e_num = _as_int(episode)
     if s_num is None or e_num is None or e_num <= 0:
         return None
-    for row in rows if rows is not None else load_overrides():
-        if not row.get("enabled", True) or row.get("media_type") != "show":
-            continue
-        if not _matches_ids(row, ids):
-            continue
-        if row.get("match_season") is not None and int(row["match_season"]) != s_num:
-            continue
-        ep_from = row.get("episode_from")
-        ep_start = row.get("episode_start_at")
-        if ep_from is None or ep_start is None:
-            continue
-        ep_to = row.get("episode_to")
-        if e_num < int(ep_from) or (ep_to is not None and e_num > int(ep_to)):
-            continue
-        return EpisodeOverride(
-            absolute=int(ep_start) + (e_num - int(ep_from)),
-            namespace=str(row.get("target_namespace") or ""),
-            target_id=str(row.get("target_id") or ""),
-            rule_id=str(row.get("id") or ""),
-        )
-    return None
+    row = _override_index(rows).episode(ids, s_num, e_num)
+    if row is None:
+        return None
+    return EpisodeOverride(
+        absolute=int(row["episode_start_at"]) + (e_num - int(row["episode_from"])),
+        namespace=str(row.get("target_namespace") or ""),
+        target_id=str(row.get("target_id") or ""),
+        rule_id=str(row.get("id") or ""),
+    )
 
 
 def find_source_override(
@@ -410,11 +483,7 @@ def find_source_override(
         return None
 
     found: SourceOverride | None = None
-    for row in rows if rows is not None else load_overrides():
-        if not row.get("enabled", True) or row.get("media_type") != "show":
-            continue
-        if str(row.get("target_namespace") or "") != ns or str(row.get("target_id") or "") != tid:
-            continue
+    for row in _override_index(rows).sources.get((ns, tid), ()):
         ep_from = row.get("episode_from")
         ep_start = row.get("episode_start_at")
         season = row.get("match_season")
@@ -456,18 +525,7 @@ def find_identity_overrides(
     rows: list[dict[str, Any]] | None = None,
 ) -> dict[str, str]:
     wanted = str(media_type or "").strip().lower()
-    out: dict[str, str] = {}
-    for row in rows if rows is not None else load_overrides():
-        if not row.get("enabled", True):
-            continue
-        if wanted in MEDIA_TYPES and row.get("media_type") != wanted:
-            continue
-        if not _matches_ids(row, ids):
-            continue
-        namespace = str(row.get("target_namespace") or "")
-        if namespace and namespace not in out:
-            out[namespace] = str(row.get("target_id") or "")
-    return out
+    return _override_index(rows).identity_targets(ids, wanted)
 
 
 def override_for_item(item: Mapping[str, Any]) -> EpisodeOverride | None:
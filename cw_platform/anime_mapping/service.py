@@ -3,14 +3,17 @@
 # Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
 from __future__ import annotations
 
+import copy
+import threading
+import time
 from collections.abc import Mapping
 from typing import Any
 
 from cw_platform.id_map import canonical_key, ids_from, merge_ids, minimal
 
 from .descriptors import descriptor_candidates_for_id, parse_descriptor
-from .overrides import find_identity_overrides
-from .storage import index_ready, query_edges, query_identity_natives
+from .overrides import find_identity_overrides, overrides_version
+from .storage import index_ready, index_version, query_edges_many, query_identity_natives
 
 ANIME_NATIVE_PROVIDERS = {"anilist", "simkl"}
 DEFAULT_FEATURES = {"watchlist", "ratings"}
@@ -167,6 +170,32 @@ def mapped_or_default_media_type(item: Mapping[str, Any]) -> str:
 
 
 _SIDE_ENTRY_SCOPES = {"s0", "s", "o"}
+_ENRICH_CACHE_LIMIT = 50_000
+_ENRICH_LOCK = threading.Lock()
+_ENRICH_CACHE: dict[str, Any] = {"scope": None, "entries": {}}
+
+
+def clear_enrich_cache() -> None:
+    with _ENRICH_LOCK:
+        _ENRICH_CACHE["scope"] = None
+        _ENRICH_CACHE["entries"] = {}
+
+
+def _enrich_entries(scope: tuple[Any, ...]) -> dict[Any, dict[str, Any]]:
+    with _ENRICH_LOCK:
+        if _ENRICH_CACHE["scope"] != scope or len(_ENRICH_CACHE["entries"]) > _ENRICH_CACHE_LIMIT:
+            _ENRICH_CACHE["scope"] = scope
+            _ENRICH_CACHE["entries"] = {}
+        return _ENRICH_CACHE["entries"]
+
+
+def _copy_result(res: Mapping[str, Any]) -> dict[str, Any]:
+    detail = res.get("detail") or {}
+    return {
+        "ids": dict(res.get("ids") or {}),
+        "detail": copy.deepcopy(detail) if detail else {},
+        "changed": bool(res.get("changed")),
+    }
 
 
 def _is_side_entry(row: Mapping[str, Any]) -> bool:
@@ -191,6 +220,7 @@ class AnimeMappingService:
         block = block if isinstance(block, Mapping) else {}
         self.release_tag = str(block.get("release_tag") or "v3").strip() or "v3"
         self._ready: bool | None = None
+        self.counters: dict[str, int] = {"cache_hits": 0, "cache_misses": 0, "edge_queries": 0, "edge_cache_hits": 0}
 
     def ready(self) -> bool:
         if self._ready is None:
@@ -215,10 +245,30 @@ class AnimeMappingService:
                 return natives
         return {}
 
+    def _cache_scope(self) -> tuple[Any, ...]:
+        # Two stats per lookup; a rebuilt db or an edited overrides file starts a fresh cache.
+        return (self.release_tag, index_version(self.release_tag), overrides_version(), self.ready())
+
     def enrich_ids(self, ids: Mapping[str, Any] | None, *, media_type: str | None = None) -> dict[str, Any]:
         ids0 = {str(k).lower(): v for k, v in dict(ids or {}).items() if v not in (None, "")}
         if not ids0:
             return {"ids": dict(ids0), "detail": {}, "changed": False}
+        try:
+            key: Any = (media_type, frozenset(ids0.items()))
+            hash(key)
+        except TypeError:
+            return self._enrich_ids(ids0, media_type)
+        entries = _enrich_entries(self._cache_scope())
+        hit = entries.get(key)
+        if hit is not None:
+            self.counters["cache_hits"] += 1
+            return _copy_result(hit)
+        self.counters["cache_misses"] += 1
+        res = self._enrich_ids(ids0, media_type)
+        entries[key] = _copy_result(res)
+        return res
+
+    def _enrich_ids(self, ids0: dict[str, Any], media_type: str | None) -> dict[str, Any]:
 
         try:
             ruled = find_identity_overrides({k: str(v) for k, v in ids0.items()}, media_type=media_type)
@@ -241,43 +291,51 @@ class AnimeMappingService:
         seen_sources: set[tuple[str, str]] = set()
         rows: list[dict[str, Any]] = []
         source_descriptors: list[str] = []
-        queue: list[tuple[int, str]] = []
+        level: list[str] = []
 
         for key, value in seed_ids.items():
-            for raw_desc in descriptor_candidates_for_id(key, value, media_type=media_type):
-                queue.append((0, raw_desc))
+            level.extend(descriptor_candidates_for_id(key, value, media_type=media_type))
 
         max_depth = 2
         max_queries = 40
-        while queue and len(seen_sources) < max_queries:
-            depth, raw_desc = queue.pop(0)
-            desc = parse_descriptor(raw_desc)
-            if desc is None:
-                continue
-            source_descriptors.append(raw_desc)
-            skey = (desc.provider, desc.id)
-            if skey in seen_sources:
-                continue
-            seen_sources.add(skey)
+        depth = 0
+        while level and len(seen_sources) < max_queries:
+            # Same visiting order and source cap as a FIFO walk; each level is fetched in one batch.
+            picked: list[tuple[str, str]] = []
+            for raw_desc in level:
+                if len(seen_sources) >= max_queries:
+                    break
+                desc = parse_descriptor(raw_desc)
+                if desc is None:
+                    continue
+                source_descriptors.append(raw_desc)
+                skey = (desc.provider, desc.id)
+                if skey in seen_sources:
+                    continue
+                seen_sources.add(skey)
+                picked.append(skey)
             try:
-                next_rows = query_edges(self.release_tag, desc.provider, desc.id)
+                edges = query_edges_many(self.release_tag, picked, stats=self.counters)
             except Exception:
-                continue
-            for row in next_rows:
-                row["_depth"] = depth
-            rows.extend(next_rows)
-            if depth >= max_depth:
-                continue
-            for row in next_rows:
-                tp = str(row.get("target_provider") or "").strip().lower()
-                tid = str(row.get("target_id") or "").strip()
-                if tp not in OUTPUT_KEYS or not tid:
+                edges = {}
+            level = []
+            for skey in picked:
+                next_rows = edges.get(skey) or []
+                for row in next_rows:
+                    row["_depth"] = depth
+                rows.extend(next_rows)
+                if depth >= max_depth:
                     continue
-                kind = str(row.get("target_kind") or "").strip().lower()
-                scope = str(row.get("target_scope") or "").strip()
-                prefix = f"{tp}_{kind}" if kind else tp
-                next_desc = f"{prefix}:{tid}:{scope}" if scope else f"{prefix}:{tid}"
-                queue.append((depth + 1, next_desc))
+                for row in next_rows:
+                    tp = str(row.get("target_provider") or "").strip().lower()
+                    tid = str(row.get("target_id") or "").strip()
+                    if tp not in OUTPUT_KEYS or not tid:
+                        continue
+                    kind = str(row.get("target_kind") or "").strip().lower()
+                    scope = str(row.get("target_scope") or "").strip()
+                    prefix = f"{tp}_{kind}" if kind else tp
+                    level.append(f"{prefix}:{tid}:{scope}" if scope else f"{prefix}:{tid}")
+            depth += 1
 
         if not rows and not ruled and not identity_seeds:
             return {"ids": dict(ids0), "detail": {}, "changed": False}
@@ -369,7 +427,21 @@ def enrich_item(item: Mapping[str, Any], cfg: Mapping[str, Any] | None = None) -
 
 
 def new_enrich_stats() -> dict[str, int]:
-    return {"items": 0, "seeded": 0, "enriched": 0, "dead_end": 0, "rekeyed": 0, "merged": 0, "failed": 0}
+    return {
+        "items": 0,
+        "seeded": 0,
+        "enriched": 0,
+        "dead_end": 0,
+        "rekeyed": 0,
+        "merged": 0,
+        "failed": 0,
+        "cache_hits": 0,
+        "cache_misses": 0,
+        "cache_hit_pct": 0,
+        "edge_queries": 0,
+        "edge_cache_hits": 0,
+        "ms": 0,
+    }
 
 
 def _seed_status(item: Mapping[str, Any], enriched: Mapping[str, Any]) -> tuple[bool, bool]:
@@ -399,6 +471,7 @@ def enrich_index_for_pair(
     counts = stats if isinstance(stats, dict) else None
     if counts is not None:
         counts.update(new_enrich_stats())
+    started = time.perf_counter()
     out: dict[str, Any] = {}
     for key, value in (index or {}).items():
         if not isinstance(value, Mapping):
@@ -433,4 +506,9 @@ def enrich_index_for_pair(
             if counts is not None:
                 counts["failed"] += 1
             out[str(key)] = value
+    if counts is not None:
+        counts.update(svc.counters)
+        lookups = svc.counters["cache_hits"] + svc.counters["cache_misses"]
+        counts["cache_hit_pct"] = round(100 * svc.counters["cache_hits"] / lookups) if lookups else 0
+        counts["ms"] = int((time.perf_counter() - started) * 1000)
     return out
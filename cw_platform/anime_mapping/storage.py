@@ -22,7 +22,11 @@ SCHEMA_VERSION = 4
 _RELEASE_TAG_RE = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
 _PROVIDER = "anibridge"
 _EDGE_FANOUT_LIMIT = 5000
+_EDGE_BATCH = 400
+_ADJACENCY_LIMIT = 200_000
 _READERS = threading.local()
+_ADJACENCY_LOCK = threading.Lock()
+_ADJACENCY: dict[str, Any] = {"key": None, "edges": {}, "natives": {}}
 _PATHS_CACHE: dict[tuple[str, str], dict[str, Path]] = {}
 IDENTITY_NAMESPACES = ("anidb", "mal", "anilist")
 _IDENTITY_COLUMNS = {"anidb": "anidb", "mal": "myanimelist", "anilist": "anilist"}
@@ -152,6 +156,7 @@ def _reader(db_path: Path) -> sqlite3.Connection | None:
 
 
 def close_readers() -> None:
+    clear_adjacency_cache()
     cached = getattr(_READERS, "entry", None)
     if cached is None:
         return
@@ -457,6 +462,96 @@ def query_show_pair(release_tag: str, provider: str, ident: str) -> str | None:
         return None
 
 
+def index_version(release_tag: str = "v3") -> tuple[str, int, int] | None:
+    db = paths(release_tag)["db"]
+    try:
+        st = db.stat()
+    except OSError:
+        return None
+    return (str(db), st.st_mtime_ns, st.st_size)
+
+
+def clear_adjacency_cache() -> None:
+    with _ADJACENCY_LOCK:
+        _ADJACENCY["key"] = None
+        _ADJACENCY["edges"] = {}
+        _ADJACENCY["natives"] = {}
+
+
+def _adjacency(version: tuple[str, int, int]) -> dict[str, Any]:
+    # Edges are immutable for one build of the db; a rebuild changes the stat key.
+    with _ADJACENCY_LOCK:
+        if _ADJACENCY["key"] != version:
+            _ADJACENCY["key"] = version
+            _ADJACENCY["edges"] = {}
+            _ADJACENCY["natives"] = {}
+        elif len(_ADJACENCY["edges"]) + len(_ADJACENCY["natives"]) > _ADJACENCY_LIMIT:
+            _ADJACENCY["edges"] = {}
+            _ADJACENCY["natives"] = {}
+        return _ADJACENCY
+
+
+def query_edges_many(
+    release_tag: str,
+    sources: list[tuple[str, str]],
+    *,
+    stats: dict[str, int] | None = None,
+) -> dict[tuple[str, str], list[dict[str, Any]]]:
+    """Unscoped edges for many (provider, id) sources, one ``IN (...)`` query per provider chunk.
+
+    Results come from an in-memory adjacency cache tied to the current db file;
+    every call returns fresh row dicts.
+    """
+    normalized = {src: (str(src[0] or "").strip().lower(), str(src[1] or "").strip()) for src in sources}
+    wanted = [key for key in dict.fromkeys(normalized.values()) if key[0] and key[1]]
+    version = index_version(release_tag) if wanted else None
+    if version is None:
+        return {src: [] for src in normalized}
+    cache = _adjacency(version)["edges"]
+    missing: dict[str, list[str]] = {}
+    for provider, ident in wanted:
+        if (provider, ident) not in cache:
+            missing.setdefault(provider, []).append(ident)
+    if stats is not None:
+        hits = len(wanted) - sum(len(ids) for ids in missing.values())
+        stats["edge_cache_hits"] = stats.get("edge_cache_hits", 0) + hits
+    if missing:
+        con = _reader(paths(release_tag)["db"])
+        if con is None:
+            return {src: [] for src in normalized}
+        fetched: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        for provider, idents in missing.items():
+            for start in range(0, len(idents), _EDGE_BATCH):
+                chunk = idents[start : start + _EDGE_BATCH]
+                for ident in chunk:
+                    fetched[(provider, ident)] = []
+                try:
+                    rows = con.execute(
+                        f"""
+                        SELECT source_provider, source_id, source_scope, source_kind,
+                               target_provider, target_id, target_scope, target_kind,
+                               source_range, target_range, reverse
+                        FROM mapping_edges
+                        WHERE source_provider = ? AND source_id IN ({",".join("?" for _ in chunk)})
+                        """,
+                        [provider, *chunk],
+                    ).fetchall()
+                except sqlite3.Error:
+                    for ident in chunk:
+                        fetched.pop((provider, ident), None)
+                    continue
+                if stats is not None:
+                    stats["edge_queries"] = stats.get("edge_queries", 0) + 1
+                for r in rows:
+                    bucket = fetched.setdefault((provider, str(r["source_id"])), [])
+                    if len(bucket) < _EDGE_FANOUT_LIMIT:
+                        bucket.append(dict(r))
+        with _ADJACENCY_LOCK:
+            for key, rows in fetched.items():
+                cache[key] = tuple(rows)
+    return {src: [dict(r) for r in cache.get(key, ())] for src, key in normalized.items()}
+
+
 def query_edges(release_tag: str, provider: str, ident: str, *, scope: str | None = None) -> list[dict[str, Any]]:
     db = paths(release_tag)["db"]
     p = str(provider or "").strip().lower()
@@ -517,6 +612,12 @@ def query_identity_natives(release_tag: str, namespace: str, ident: str) -> dict
     column = _IDENTITY_TARGET_COLUMNS.get(ns)
     if not column or not value:
         return {}
+    version = index_version(release_tag)
+    if version is None:
+        return {}
+    cache = _adjacency(version)["natives"]
+    if (ns, value) in cache:
+        return dict(cache[(ns, value)])
     con = _reader(db)
     if con is None:
         return {}
@@ -538,7 +639,9 @@ def query_identity_natives(release_tag: str, namespace: str, ident: str) -> dict
             found[row_ns] = native
         elif current != native:
             found[row_ns] = ""
-    return {k: v for k, v in found.items() if v}
+    out = {k: v for k, v in found.items() if v}
+    cache[(ns, value)] = out
+    return dict(out)
 
 
 def index_schema_ok(release_tag: str = "v3") -> bool:
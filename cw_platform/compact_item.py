@@ -0,0 +1,159 @@
+# cw_platform/compact_item.py
+# Slot-based read-only media items with shared key layouts.
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterator, Mapping
+from typing import Any, NoReturn
+
+__all__ = ["CompactItem", "compact", "compact_index", "json_default", "plain"]
+
+_MAX_SHAPES = 4096
+_INTERN_MAX_LEN = 64
+# Values repeated across items and providers; timestamps and free text are left alone.
+_INTERN_KEYS = frozenset(
+    (
+        "tmdb", "imdb", "tvdb", "trakt", "simkl", "mal", "anilist", "kitsu", "anidb",
+        "plex", "jellyfin", "mdblist", "emby", "guid", "slug",
+        "type", "title", "series_title", "show_title", "provider", "source", "library_id", "simkl_bucket", "anime_type",
+    )
+)
+_SHAPES: dict[tuple[str, ...], "_Shape"] = {}
+# Value types stored as-is; anything else is checked for nested mappings.
+_FLAT_TYPES = frozenset((str, int, float, bool, type(None), list, tuple))
+
+
+class _Shape:
+    __slots__ = ("keys", "index", "interned")
+
+    def __init__(self, keys: tuple[str, ...]) -> None:
+        self.keys = keys
+        self.index = {k: i for i, k in enumerate(keys)}
+        self.interned = tuple(i for i, k in enumerate(keys) if k in _INTERN_KEYS)
+
+
+def _shape_for(keys: tuple[str, ...]) -> _Shape:
+    shape = _SHAPES.get(keys)
+    if shape is None:
+        shape = _Shape(tuple(sys.intern(k) for k in keys))
+        if len(_SHAPES) < _MAX_SHAPES:
+            _SHAPES[shape.keys] = shape
+    return shape
+
+
+
+
+def _unpack(value: Any) -> Any:
+    t = type(value)
+    if t is CompactItem:
+        return value.to_dict()
+    if t is list:
+        return [_unpack(v) for v in value]
+    return value
+
+
+def _read_only(*_a: Any, **_k: Any) -> NoReturn:
+    raise TypeError("compact items are read-only; take mutable_copy() or to_dict() first")
+
+
+class CompactItem(Mapping[str, Any]):
+    """Read-only item stored as one value tuple plus a key layout shared by every item with the same keys.
+
+    Nested mappings (``ids``, ``show_ids``) are compacted too and short strings
+    are interned, so IDs and titles seen by several providers are held once.
+    ``id_map`` caches the normalized ids and canonical key on the item.
+    ``copy``/``deepcopy``/pickle and ``to_dict()`` give plain dicts.
+    """
+
+    __slots__ = ("_shape", "_vals", "norm_ids", "ckey")
+
+    def __init__(self, item: Mapping[str, Any]) -> None:
+        if type(item) is CompactItem:
+            self._shape, self._vals = item._shape, item._vals
+        else:
+            keys = tuple(item)
+            shape = _SHAPES.get(keys) or _shape_for(keys)
+            vals = list(item.values())
+            for i in shape.interned:
+                v = vals[i]
+                if type(v) is str and len(v) <= _INTERN_MAX_LEN:
+                    vals[i] = sys.intern(v)
+            # Type scan runs in C; the per-value loop only runs for items with nested mappings.
+            if not _FLAT_TYPES.issuperset(map(type, vals)):
+                for i, v in enumerate(vals):
+                    if type(v) is dict or (type(v) not in _FLAT_TYPES and type(v) is not CompactItem and isinstance(v, Mapping)):
+                        vals[i] = CompactItem(v)
+            self._shape = shape
+            self._vals = tuple(vals)
+        self.norm_ids: CompactItem | None = None
+        self.ckey: str | None = None
+
+    def __getitem__(self, key: str) -> Any:
+        i = self._shape.index.get(key)
+        if i is None:
+            raise KeyError(key)
+        return self._vals[i]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        i = self._shape.index.get(key)
+        return default if i is None else self._vals[i]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._shape.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._shape.keys)
+
+    def __len__(self) -> int:
+        return len(self._vals)
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __or__(self, other: Any) -> Any:
+        return {**self.to_dict(), **other} if isinstance(other, Mapping) else NotImplemented
+
+    def __ror__(self, other: Any) -> Any:
+        return {**other, **self.to_dict()} if isinstance(other, Mapping) else NotImplemented
+
+    def copy(self) -> dict[str, Any]:
+        return self.to_dict()
+
+    def to_dict(self) -> dict[str, Any]:
+        out = dict(zip(self._shape.keys, self._vals))
+        for k, v in out.items():
+            if type(v) is CompactItem or type(v) is list:
+                out[k] = _unpack(v)
+        return out
+
+    def __repr__(self) -> str:
+        return f"CompactItem({self.to_dict()!r})"
+
+    def __reduce__(self) -> Any:
+        return (dict, (self.to_dict(),))
+
+
+def plain(obj: Any) -> Any:
+    """``obj`` with compact items swapped for dicts; untouched (same object) when it holds none."""
+    if isinstance(obj, CompactItem):
+        return obj.to_dict()
+    if isinstance(obj, dict) and any(isinstance(v, CompactItem) for v in obj.values()):
+        return {k: plain(v) for k, v in obj.items()}
+    return obj
+
+
+def json_default(obj: Any) -> Any:
+    if isinstance(obj, CompactItem):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def compact(item: Any) -> Any:
+    if isinstance(item, CompactItem) or not isinstance(item, Mapping):
+        return item
+    return CompactItem(item)
+
+
+def compact_index(idx: Mapping[str, Any]) -> dict[str, Any]:
+    return {sys.intern(str(k)) if len(str(k)) <= _INTERN_MAX_LEN else str(k): compact(v) for k, v in idx.items()}
@@ -59,6 +59,7 @@ DEFAULT_SCHEDULER_WEBHOOKS: dict[str, Any] = {
 _ENC_PREFIX = "enc:v1:"
 _CONFIG_LOCK = threading.RLock()
 _CONFIG_FILE_LOCK_STATE = threading.local()
+_SAVE_GENERATION = 0
 
 def _config_key_file() -> Path:
     return CONFIG / ".cw_master_key"
@@ -492,6 +493,7 @@ DEFAULT_CFG: dict[str, Any] = {
             "get_per_sec": 3.33,
             "post_per_sec": 1,
         },
+        "page_concurrency": 4,                          # Pages fetched in parallel when indexing (1 = sequential, max 8)
 
         # Watchlist
         "watchlist_use_etag": True,                     # Use ETag + local shadow to skip unchanged lists
@@ -544,7 +546,8 @@ DEFAULT_CFG: dict[str, Any] = {
         "max_retries": 3,                               # Retry budget for API calls
 
         "scrobble": {
-            "libraries": []                             # whitelist of library GUIDs; empty = all
+            "libraries": [],                            # whitelist of library GUIDs; empty = all
+            "watch_transport": "auto",                  # "auto" (session websocket, falls back to polling) | "websocket" | "poll"
         },
 
         # Watchlist settings
@@ -593,7 +596,8 @@ DEFAULT_CFG: dict[str, Any] = {
         "max_retries": 3,                               # Retry budget for API calls
 
         "scrobble": {
-            "libraries": []                             # whitelist of library GUIDs; empty = all
+            "libraries": [],                            # whitelist of library GUIDs; empty = all
+            "watch_transport": "auto",                  # "auto" (session websocket, falls back to polling) | "websocket" | "poll"
         },
 
         # Watchlist settings
@@ -640,6 +644,8 @@ DEFAULT_CFG: dict[str, Any] = {
         "jsonrpc_version": "",                          # Detected JSON-RPC version; 13.5.0+ required
         "connection_verified": False,                   # True after JSON-RPC verification succeeds
         "timeout": 12.0,                                # HTTP timeout (seconds)
+        "watch_transport": "auto",                      # "auto" (JSON-RPC notifications, falls back to polling) | "websocket" | "poll"
+        "notification_port": 9090,                      # Kodi JSON-RPC websocket/TCP port
     },
 
     "crosswatch": {
@@ -705,6 +711,10 @@ DEFAULT_CFG: dict[str, Any] = {
         "snapshot_ttl_sec": 300,                        # Reuse snapshots within 5 min
         "apply_chunk_size": 100,                        # Sweet spot for apply chunking
         "apply_chunk_pause_ms": 50,                     # Small pause between chunks
+        "apply_chunk_adaptive": True,                   # Shrink/recover chunks per provider+feature from observed latency and throttling
+        "apply_chunk_min": 10,                          # Adaptive floor
+        "apply_chunk_max": 1000,                        # Adaptive ceiling; chunks only grow past the configured size up to a provider-declared max_chunk
+        "apply_chunk_target_ms": 3000,                  # Chunks slower than this shrink instead of grow
         "apply_chunk_size_by_provider": {               # Provider-specific apply chunk overrides
             "SIMKL": 500,
             "MDBLIST": 500,
@@ -1136,6 +1146,16 @@ def _config_io_lock() -> Iterator[None]:
             yield
 
 
+def config_generation() -> tuple[int, str, int]:
+    # Changes on every save here and whenever the file is replaced on disk.
+    p = _cfg_file()
+    try:
+        mtime = p.stat().st_mtime_ns
+    except OSError:
+        mtime = 0
+    return _SAVE_GENERATION, str(p), mtime
+
+
 def config_path() -> Path:
     return _cfg_file()
 
@@ -2876,6 +2896,8 @@ def save_config(cfg: dict[str, Any]) -> None:
 
     final_data = _order_config_for_write(cast(dict[str, Any], _encrypt_secret_tree_stable(data, prev_raw)))
     _write_json_atomic(_cfg_file(), final_data)
+    global _SAVE_GENERATION
+    _SAVE_GENERATION += 1
 
 
 def update_config(mutator: Any) -> tuple[dict[str, Any], Any]:
@@ -46,6 +46,7 @@ MIGRATION_OVERRIDE_KEYS: tuple[str, ...] = (
     # Trakt
     "trakt.rate_limit.get_per_sec",
     "trakt.rate_limit.post_per_sec",
+    "trakt.page_concurrency",
     "trakt.watchlist_batch_size",
     "trakt.ratings_per_page",
     "trakt.ratings_max_pages",
@@ -76,5 +77,9 @@ MIGRATION_OVERRIDE_KEYS: tuple[str, ...] = (
     "runtime.snapshot_ttl_sec",
     "runtime.apply_chunk_size",
     "runtime.apply_chunk_pause_ms",
+    "runtime.apply_chunk_adaptive",
+    "runtime.apply_chunk_min",
+    "runtime.apply_chunk_max",
+    "runtime.apply_chunk_target_ms",
     "runtime.apply_chunk_size_by_provider",
 )
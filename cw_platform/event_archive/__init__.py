@@ -13,6 +13,7 @@ from .recorder import (
     record_run_finished,
     RunRecorder,
 )
+from .writer import EventWriter, default_writer, writer_stats
 from .audit import record_audit
 from .importer import import_all
 from .scrobble_recorder import record_watch, record_webhook
@@ -46,6 +47,9 @@ __all__ = [
     "record_run_started",
     "record_run_finished",
     "RunRecorder",
+    "EventWriter",
+    "default_writer",
+    "writer_stats",
     "import_all",
     "record_watch",
     "record_webhook",
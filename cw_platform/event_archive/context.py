@@ -207,7 +207,15 @@ def build_group_context(
     return out
 
 
+def _guard_base() -> Path:
+    from ..local_db import guard_state
+    base = _config_base()
+    guard_state.import_legacy_files(base, _state_dir())
+    return base
+
+
 def current_unresolved(dst: str | None, feature: str | None, item_key: str | None) -> dict[str, Any]:
+    from ..local_db import guard_state
     if not dst or not feature:
         return {"present": False}
     m: dict[str, Any] = {}
@@ -216,25 +224,28 @@ def current_unresolved(dst: str | None, feature: str | None, item_key: str | Non
         if isinstance(d, Mapping):
             for k, v in d.items():
                 m[str(k)] = v
-    for p in _iter_state_files(dst, feature, "unresolved.pending"):
-        d = _read_json_file(p)
-        if isinstance(d, Mapping):
-            hints = d.get("hints") if isinstance(d.get("hints"), Mapping) else {}
-            for k in (d.get("keys") or []):
-                m.setdefault(str(k), (hints.get(str(k)) if isinstance(hints, Mapping) else None) or {})
+    base = _guard_base()
+    where = {"provider": str(dst).strip().lower(), "feature": str(feature).strip().lower()}
+    total = len(set(m) | guard_state.load_keys(base, guard_state.UNRESOLVED, **where))
     meta = m.get(str(item_key)) if item_key else None
-    return {"present": bool(item_key and str(item_key) in m), "meta": meta, "total": len(m)}
+    present = bool(item_key and str(item_key) in m)
+    if item_key and not present:
+        hit = guard_state.entries(base, guard_state.UNRESOLVED, keys=[str(item_key)], **where)
+        if hit:
+            data = hit[0].get("data")
+            meta = (data.get("hint") if isinstance(data, Mapping) else None) or {}
+            present = True
+    return {"present": present, "meta": meta, "total": total}
 
 
 def current_blackbox(dst: str | None, feature: str | None, pair_key: str | None, item_key: str | None) -> dict[str, Any]:
+    from ..local_db import guard_state
     if not dst or not feature:
         return {"present": False}
-    keys: set[str] = set()
-    for p in _iter_state_files(dst, feature, ".blackbox."):
-        d = _read_json_file(p)
-        if isinstance(d, Mapping):
-            keys |= {str(k) for k in d.keys()}
-    return {"present": bool(item_key and str(item_key) in keys), "total": len(keys)}
+    base = _guard_base()
+    where = {"provider": str(dst).strip().lower(), "feature": str(feature).strip().lower()}
+    present = bool(item_key and guard_state.entries(base, guard_state.BLACKBOX, keys=[str(item_key)], **where))
+    return {"present": present, "total": guard_state.count_keys(base, guard_state.BLACKBOX, **where)}
 
 
 def current_tombstone(feature: str | None, pair_key: str | None, item_key: str | None) -> dict[str, Any]:
@@ -576,12 +587,25 @@ def _title_index() -> dict[str, dict[str, Any]]:
         d = _read_json_file(p)
         if isinstance(d, Mapping):
             _ingest_items(d.get("items"))
+    pending = _safe(lambda: _guard_pending_items()) or {}
+    _ingest_items(pending)
 
     _TITLE_CACHE["index"] = idx
     _TITLE_CACHE["ts"] = now
     return idx
 
 
+def _guard_pending_items() -> dict[str, Any]:
+    from ..local_db import guard_state
+    out: dict[str, Any] = {}
+    for e in guard_state.entries(_guard_base(), guard_state.UNRESOLVED):
+        data = e.get("data")
+        item = data.get("item") if isinstance(data, Mapping) else None
+        if isinstance(item, Mapping):
+            out.setdefault(e["key"], item)
+    return out
+
+
 def resolve_title(item_key: Any, media_type: Any = None) -> dict[str, Any] | None:
     if not item_key:
         return None
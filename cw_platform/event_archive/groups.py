@@ -64,6 +64,7 @@ _SEVERITY = {
     "failed": "error", "running": "info", "pending": "info", "informational": "info",
 }
 _PROBLEM_TYPES_SQL = "('write_failed','unresolved_recorded','blackbox_promoted','blackbox_blocked')"
+_UNRESOLVED_TYPES = ("write_failed", "unresolved_recorded")
 _UNRESOLVED_TYPES_SQL = "('write_failed','unresolved_recorded')"
 
 # DO NOT FORGET to update the version when the correlation key/status/summary logic
@@ -164,65 +165,23 @@ def group_hash(r: Any) -> str:
     return hashlib.sha256("\x1f".join(parts).encode("utf-8", "replace")).hexdigest()
 
 
-def _derive_status(events: list[dict[str, Any]], extra_problems: int = 0) -> str:
-    types = {e.get("event_type") for e in events}
-
-    if any(str(e.get("domain") or "").strip().lower() == "audit" for e in events):
-        best, best_ts = "informational", -1
-        for e in events:
-            st = _AUDIT_STATUS.get(str(e.get("event_type") or ""))
-            if st is None:
-                reason = str(e.get("reason_code") or "").strip().lower()
-                st = "failed" if reason in {"failed", "blocked", "denied"} else "completed"
-            ts = int(e.get("created_at") or 0)
-            if ts >= best_ts:
-                best_ts, best = ts, st
-        return best
-
-    if types & set(_SCROBBLE_STATUS):
-        best, best_ts = None, -1
-        for e in events:
-            st = _SCROBBLE_STATUS.get(str(e.get("event_type") or ""))
-            if st is None:
-                continue
-            ts = int(e.get("created_at") or 0)
-            if ts >= best_ts:
-                best_ts, best = ts, st
-        return best or "informational"
-
-    # status reflects the run's completion
-    if "sync_run_finished" in types:
-        fin = next((e for e in reversed(events) if e.get("event_type") == "sync_run_finished"), {})
-        d = _detail(fin)
-        if int(d.get("errors") or 0) > 0:
-            return "failed"
-        if int(d.get("unresolved") or 0) > 0 or extra_problems > 0:
-            return "warning"
-        return "completed"
-    if "sync_run_started" in types:
-        return "running"
-
- 
-    status_by_type = {
-        "write_succeeded": "resolved",
-        "unresolved_cleared": "resolved",
-        "blackbox_promoted": "blackboxed",
-        "blackbox_blocked": "blackboxed",
-        "unresolved_recorded": "unresolved",
-        "write_failed": "failed",
-        "write_attempted": "pending",
-    }
-    best_status = None
-    best_ts = -1
-    for e in events:
-        st = status_by_type.get(str(e.get("event_type") or ""))
-        if st is None:
-            continue
-        ts = int(e.get("created_at") or 0)
-        if ts >= best_ts:
-            best_ts = ts
-            best_status = st
-    return best_status or "informational"
+_WRITE_STATUS = {
+    "write_succeeded": "resolved",
+    "unresolved_cleared": "resolved",
+    "blackbox_promoted": "blackboxed",
+    "blackbox_blocked": "blackboxed",
+    "unresolved_recorded": "unresolved",
+    "write_failed": "failed",
+    "write_attempted": "pending",
+}
+_PICK_COLUMNS = (
+    "domain", "run_id", "feature", "operation", "source_provider", "source_instance",
+    "destination_provider", "destination_instance", "origin_provider", "origin_instance",
+    "pair_key", "direction", "item_key", "title", "year", "media_type", "season", "episode",
+    "reason_code", "reason",
+)
+# Bump when the stored aggregate shape changes; stale aggregates are rebuilt from events.
+AGGREGATE_VERSION = 1
 
 
 def _detail(e: dict[str, Any]) -> dict[str, Any]:
@@ -238,15 +197,120 @@ def _detail(e: dict[str, Any]) -> dict[str, Any]:
     return {}
 
 
-def _summarize(status: str, events: list[dict[str, Any]], feature: str, dst: str, norm_op: str, reason_code: str, feat_issues: dict[str, int] | None = None) -> str:
+def _new_aggregate() -> dict[str, Any]:
+    return {
+        "v": AGGREGATE_VERSION, "count": 0, "first_ts": None, "last_ts": None,
+        "types": {}, "audit": False, "rating_thread": False, "picks": {}, "last": None,
+        "audit_status": None, "scrobble_status": None, "write_status": None,
+        "finished": None, "fail": None, "rating": None,
+        "plans": 0, "plan_pairs": [], "plan_features": {}, "blocked": 0,
+    }
+
+
+def _newer(slot: Any, key: list[int]) -> bool:
+    return slot is None or key > slot[0]
+
+
+def _fold(agg: dict[str, Any], e: dict[str, Any]) -> None:
+    """Fold one event into a group aggregate; arrival order does not matter."""
+    key = [int(e.get("created_at") or 0), int(e.get("id") or 0)]
+    et = str(e.get("event_type") or "")
+    agg["count"] += 1
+    agg["first_ts"] = key[0] if agg["first_ts"] is None else min(agg["first_ts"], key[0])
+    agg["last_ts"] = key[0] if agg["last_ts"] is None else max(agg["last_ts"], key[0])
+    seen = agg["types"].get(et)
+    agg["types"][et] = [min(seen[0], key), seen[1] + 1] if seen else [key, 1]
+    if str(e.get("domain") or "").strip().lower() == "audit":
+        agg["audit"] = True
+    if str(e.get("feature") or "") == "ratings":
+        agg["rating_thread"] = True
+    picks = agg["picks"]
+    for col in _PICK_COLUMNS:
+        v = e.get(col)
+        if v not in (None, "") and _newer(picks.get(col), key):
+            picks[col] = [key, v]
+    if _newer(agg["last"], key):
+        agg["last"] = [key, {
+            "event_type": e.get("event_type"), "operation": e.get("operation"), "severity": e.get("severity"),
+            "title": e.get("title"), "item_key": e.get("item_key"), "season": e.get("season"),
+            "episode": e.get("episode"), "detail": _detail(e),
+        }]
+    st = _AUDIT_STATUS.get(et)
+    if st is None:
+        st = "failed" if str(e.get("reason_code") or "").strip().lower() in {"failed", "blocked", "denied"} else "completed"
+    if _newer(agg["audit_status"], key):
+        agg["audit_status"] = [key, st]
+    if et in _SCROBBLE_STATUS and _newer(agg["scrobble_status"], key):
+        agg["scrobble_status"] = [key, _SCROBBLE_STATUS[et]]
+    if et in _WRITE_STATUS and _newer(agg["write_status"], key):
+        agg["write_status"] = [key, _WRITE_STATUS[et]]
+    if et == "sync_run_finished" and _newer(agg["finished"], key):
+        d = _detail(e)
+        agg["finished"] = [key, int(d.get("errors") or 0), int(d.get("unresolved") or 0)]
+    if et in _FAIL_TYPES and _newer(agg["fail"], key):
+        agg["fail"] = [key, e.get("reason_code"), e.get("reason")]
+    if (e.get("old_value") is not None or e.get("new_value") is not None) and _newer(agg["rating"], key):
+        agg["rating"] = [key, e.get("old_value"), e.get("new_value"), e.get("origin_provider")]
+    if et == "plan_created":
+        agg["plans"] += 1
+        pk = str(e.get("pair_key") or "").strip().upper()
+        if pk and pk not in agg["plan_pairs"]:
+            agg["plan_pairs"].append(pk)
+        fe = str(e.get("feature") or "").strip().lower()
+        if fe and (fe not in agg["plan_features"] or key < agg["plan_features"][fe]):
+            agg["plan_features"][fe] = key
+    if et == "blackbox_blocked":
+        agg["blocked"] += int(_detail(e).get("blocked") or 0)
+
+
+def _aggregate(events: list[dict[str, Any]]) -> dict[str, Any]:
+    agg = _new_aggregate()
+    for e in events:
+        _fold(agg, e)
+    return agg
+
+
+def _pick(agg: dict[str, Any], key: str) -> Any:
+    slot = agg["picks"].get(key)
+    return slot[1] if slot else None
+
+
+def _last(agg: dict[str, Any]) -> dict[str, Any]:
+    return agg["last"][1] if agg["last"] else {}
+
+
+def _derive_status(agg: dict[str, Any], extra_problems: int = 0) -> str:
+    types = set(agg["types"])
+
+    if agg["audit"]:
+        return agg["audit_status"][1] if agg["audit_status"] else "informational"
+
+    if types & set(_SCROBBLE_STATUS):
+        return agg["scrobble_status"][1] if agg["scrobble_status"] else "informational"
+
+    # status reflects the run's completion
+    if agg["finished"]:
+        _, errors, unresolved = agg["finished"]
+        if errors > 0:
+            return "failed"
+        if unresolved > 0 or extra_problems > 0:
+            return "warning"
+        return "completed"
+    if "sync_run_started" in types:
+        return "running"
+
+    return agg["write_status"][1] if agg["write_status"] else "informational"
+
+
+def _summarize(status: str, agg: dict[str, Any], feature: str, dst: str, norm_op: str, reason_code: str, feat_issues: dict[str, int] | None = None) -> str:
     verb = norm_op or "update"
     past = _PAST.get(norm_op, "updated")
 
-    types = {e.get("event_type") for e in events}
-    last = events[-1] if events else {}
+    types = set(agg["types"])
+    last = _last(agg)
     feat_disp = str(feature or "").title()
 
-    if any(str(e.get("domain") or "").strip().lower() == "audit" for e in events):
+    if agg["audit"]:
         d = _detail(last)
         actor_raw = d.get("actor")
         target_raw = d.get("target")
@@ -265,30 +329,21 @@ def _summarize(status: str, events: list[dict[str, Any]], feature: str, dst: str
         return text[:1].upper() + text[1:]
 
     if types & set(_SCROBBLE_STATUS):
-        return _summarize_scrobble(status, events, dst)
+        return _summarize_scrobble(status, agg, dst)
 
     # one sync run with its pair/feature jobs and health checks
     if types & {"sync_run_started", "sync_run_finished"}:
-        plan_events = [e for e in events if e.get("event_type") == "plan_created"]
-        pair_keys = {str(e.get("pair_key") or "").strip().upper() for e in plan_events}
-        pair_keys.discard("")
-        pairs = len(pair_keys) or len(plan_events)
-        feats: list[str] = []
-        for e in plan_events:
-            fe = str(e.get("feature") or "").strip().lower()
-            if fe and fe not in feats:
-                feats.append(fe)
+        pairs = len(agg["plan_pairs"]) or agg["plans"]
+        feats = sorted(agg["plan_features"], key=lambda f: agg["plan_features"][f])
         feat_disp = ", ".join(f.title() for f in feats)
         tail = f", {pairs} {'pair' if pairs == 1 else 'pairs'}" if pairs else ""
         if tail and feat_disp:
             tail += f" ({feat_disp})"
-        if "sync_run_finished" in types:
-            fin = next((e for e in reversed(events) if e.get("event_type") == "sync_run_finished"), last)
-            d = _detail(fin)
-            errs = int(d.get("errors") or 0)
+        if agg["finished"]:
+            _, errs, unresolved = agg["finished"]
             issues = {f: n for f, n in (feat_issues or {}).items() if n}
-            unres = sum(issues.values()) or int(d.get("unresolved") or 0)
-            blocked = sum(int(_detail(e).get("blocked") or 0) for e in events if e.get("event_type") == "blackbox_blocked")
+            unres = sum(issues.values()) or unresolved
+            blocked = agg["blocked"]
             if errs > 0:
                 head = "Sync run completed with errors"
             elif unres > 0:
@@ -309,7 +364,7 @@ def _summarize(status: str, events: list[dict[str, Any]], feature: str, dst: str
 
     # provider health thread
     if types == {"provider_health"}:
-        prov = _P(_pick(events, "source_provider")) or "Provider"
+        prov = _P(_pick(agg, "source_provider")) or "Provider"
         ok = str(last.get("severity") or "").lower() in ("info", "ok")
         return f"{prov} health check OK" if ok else f"{prov} health check reported an issue"
 
@@ -318,23 +373,17 @@ def _summarize(status: str, events: list[dict[str, Any]], feature: str, dst: str
         d = _detail(last)
         changes = sum(int(d.get(k) or 0) for k in ("adds", "removes", "updates"))
         if changes == 0:
-            src = _P(_pick(events, "source_provider"))
+            src = _P(_pick(agg, "source_provider"))
             route = f"{src} → {dst}" if (src and dst) else (dst or src or "")
             left = f"{route}, " if route else ""
             return f"{left}{feat_disp or 'Feature'} aligned, no changes needed"
 
-    if str(feature or "").lower() == "ratings":
-        rat = None
-        for e in events:
-            if e.get("old_value") is not None or e.get("new_value") is not None:
-                rat = e
-        if rat is not None:
-            s = f"Rating changed from {rat.get('old_value') if rat.get('old_value') is not None else '–'} to {rat.get('new_value') if rat.get('new_value') is not None else '–'}"
-            origin = rat.get("origin_provider")
-            return s + (f", origin {origin}" if origin else "")
-
-    fail_events = [e for e in events if e.get("event_type") == "write_failed"]
-    if status == "failed" and len(events) == 1 and fail_events:
+    if str(feature or "").lower() == "ratings" and agg["rating"]:
+        _, old, new, origin = agg["rating"]
+        s = f"Rating changed from {old if old is not None else '–'} to {new if new is not None else '–'}"
+        return s + (f", origin {origin}" if origin else "")
+
+    if status == "failed" and agg["count"] == 1 and "write_failed" in types:
         return f"Provider rejected item, {reason_code}" if reason_code else "Provider rejected item"
 
     phrases: list[str] = []
@@ -343,8 +392,7 @@ def _summarize(status: str, events: list[dict[str, Any]], feature: str, dst: str
         if p and p not in phrases:
             phrases.append(p)
 
-    for e in events:
-        t = e.get("event_type")
+    for t in sorted(agg["types"], key=lambda t: agg["types"][t][0]):
         if t == "write_failed":
             add(f"{dst} {verb} failed" if dst else f"{verb} failed")
         elif t == "unresolved_recorded":
@@ -366,7 +414,7 @@ def _summarize(status: str, events: list[dict[str, Any]], feature: str, dst: str
         elif t == "provider_health":
             add("provider health change")
     if not phrases:
-        et = (events[-1].get("event_type") if events else "") or "event"
+        et = last.get("event_type") or "event"
         phrases = [str(et).replace("_", " ")]
 
     tail = {"unresolved": "recorded unresolved", "blackboxed": "blackboxed"}.get(status)
@@ -391,19 +439,18 @@ def _title_of(e: dict[str, Any]) -> str:
     return t
 
 
-def _summarize_scrobble(status: str, events: list[dict[str, Any]], dst: str) -> str:
-    last = events[-1] if events else {}
+def _summarize_scrobble(status: str, agg: dict[str, Any], dst: str) -> str:
+    last = _last(agg)
     name = _title_of(last) or "item"
-    target = dst or _P(_pick(events, "destination_provider"))
+    target = dst or _P(_pick(agg, "destination_provider"))
     to = f" → {target}" if target else ""
     if status == "rated":
         d = _detail(last)
         rating = d.get("rating")
         return f"Rated {name} {rating}/10{to}" if rating not in (None, "") else f"Rated {name}{to}"
     if status == "failed":
-        rating_thread = any(str(e.get("feature") or "") == "ratings" for e in events)
-        reason = str(_pick(events, "reason_code") or _pick(events, "reason") or "")
-        head = "Rating forward failed" if rating_thread else "Scrobble failed"
+        reason = str(_pick(agg, "reason_code") or _pick(agg, "reason") or "")
+        head = "Rating forward failed" if agg["rating_thread"] else "Scrobble failed"
         return f"{head}{to}, {reason}" if reason else f"{head}{to}"
     prog = _detail(last).get("progress")
     tail = f", {prog}%" if prog not in (None, "") else ""
@@ -412,14 +459,6 @@ def _summarize_scrobble(status: str, events: list[dict[str, Any]], dst: str) ->
     return f"Watching {name}{to}{tail}"
 
 
-def _pick(events: list[dict[str, Any]], key: str) -> Any:
-    for e in reversed(events):
-        v = e.get(key)
-        if v not in (None, ""):
-            return v
-    return None
-
-
 def _run_feature_issues(conn: sqlite3.Connection, run_id: Any) -> dict[str, int]:
     rid = str(run_id or "").strip()
     if not rid:
@@ -435,60 +474,85 @@ def _run_feature_issues(conn: sqlite3.Connection, run_id: Any) -> dict[str, int]
     return {str(r["feature"] or "").strip().lower(): int(r["c"]) for r in rows if int(r["c"] or 0)}
 
 
-def _recompute(conn: sqlite3.Connection, group_id: int, now: int) -> None:
-    rows = conn.execute(
-        f"SELECT {','.join(_query._COLUMNS)} FROM events WHERE group_id=? ORDER BY created_at ASC, id ASC",
-        (group_id,),
-    ).fetchall()
-    events = [dict(r) for r in rows]
-    if not events:
+def _store_aggregate(conn: sqlite3.Connection, group_id: int, agg: dict[str, Any], now: int) -> None:
+    if not agg["count"]:
         return
-    ts = [int(e.get("created_at") or 0) for e in events]
-    types = {e.get("event_type") for e in events}
-    is_run = bool(types & set(_RUN_TYPES))
-    feature = str(_pick(events, "feature") or "")
-    norm_op = _norm_op(_pick(events, "operation"))
-    dst = _P(_pick(events, "destination_provider"))
-    feat_issues = _run_feature_issues(conn, _pick(events, "run_id")) if is_run else {}
-    status = _derive_status(events, sum(feat_issues.values()))
+    is_run = bool(set(agg["types"]) & set(_RUN_TYPES))
+    feature = str(_pick(agg, "feature") or "")
+    norm_op = _norm_op(_pick(agg, "operation"))
+    dst = _P(_pick(agg, "destination_provider"))
+    feat_issues = _run_feature_issues(conn, _pick(agg, "run_id")) if is_run else {}
+    status = _derive_status(agg, sum(feat_issues.values()))
     severity = _SEVERITY.get(status, "info")
-    fail_evt = None
-    for e in events:
-        if e.get("event_type") in _FAIL_TYPES:
-            fail_evt = e
-    reason_code = str((fail_evt or {}).get("reason_code") or _pick(events, "reason_code") or "")
-    reason = str((fail_evt or {}).get("reason") or _pick(events, "reason") or "")
-    summary = _summarize(status, events, feature, dst, norm_op, reason_code, feat_issues)
-    domain = str(_pick(events, "domain") or "sync")
+    fail = agg["fail"] or [None, None, None]
+    reason_code = str(fail[1] or _pick(agg, "reason_code") or "")
+    reason = str(fail[2] or _pick(agg, "reason") or "")
+    summary = _summarize(status, agg, feature, dst, norm_op, reason_code, feat_issues)
+    domain = str(_pick(agg, "domain") or "sync")
+    state = json.dumps(agg, ensure_ascii=False, separators=(",", ":"), default=str)
 
     if is_run:
         vals = (
-            domain, now, min(ts), max(ts), len(events), status, severity,
+            domain, now, agg["first_ts"], agg["last_ts"], agg["count"], status, severity,
             None, "run", None, None, None, None, None, None, None, None,
-            None, None, None, None, None, None, None, None, summary, group_id,
+            None, None, None, None, None, None, None, None, summary, state, group_id,
         )
     else:
         vals = (
-            domain, now, min(ts), max(ts), len(events), status, severity,
+            domain, now, agg["first_ts"], agg["last_ts"], agg["count"], status, severity,
             feature or None, norm_op or None,
-            _pick(events, "source_provider"), _pick(events, "source_instance"),
-            _pick(events, "destination_provider"), _pick(events, "destination_instance"),
-            _pick(events, "origin_provider"), _pick(events, "origin_instance"),
-            _pick(events, "pair_key"), _pick(events, "direction"),
-            _pick(events, "item_key"), _pick(events, "title"), _pick(events, "year"),
-            _pick(events, "media_type"), _pick(events, "season"), _pick(events, "episode"),
-            reason_code or None, reason or None, summary, group_id,
+            _pick(agg, "source_provider"), _pick(agg, "source_instance"),
+            _pick(agg, "destination_provider"), _pick(agg, "destination_instance"),
+            _pick(agg, "origin_provider"), _pick(agg, "origin_instance"),
+            _pick(agg, "pair_key"), _pick(agg, "direction"),
+            _pick(agg, "item_key"), _pick(agg, "title"), _pick(agg, "year"),
+            _pick(agg, "media_type"), _pick(agg, "season"), _pick(agg, "episode"),
+            reason_code or None, reason or None, summary, state, group_id,
         )
     conn.execute(
         "UPDATE event_groups SET domain=?, updated_at=?, first_event_at=?, last_event_at=?, event_count=?, "
         "status=?, severity=?, feature=?, operation=?, source_provider=?, source_instance=?, "
         "destination_provider=?, destination_instance=?, origin_provider=?, origin_instance=?, "
         "pair_key=?, direction=?, item_key=?, title=?, year=?, media_type=?, season=?, episode=?, "
-        "reason_code=?, reason=?, summary=? WHERE id=?",
+        "reason_code=?, reason=?, summary=?, aggregate=? WHERE id=?",
         vals,
     )
 
 
+def _recompute(conn: sqlite3.Connection, group_id: int, now: int) -> None:
+    """Rebuild a group from all of its events; the repair path for incremental folds."""
+    rows = conn.execute(
+        f"SELECT {','.join(_query._COLUMNS)} FROM events WHERE group_id=? ORDER BY created_at ASC, id ASC",
+        (group_id,),
+    ).fetchall()
+    _store_aggregate(conn, group_id, _aggregate([dict(r) for r in rows]), now)
+
+
+def _load_aggregate(conn: sqlite3.Connection, group_id: int) -> dict[str, Any] | None:
+    row = conn.execute("SELECT aggregate FROM event_groups WHERE id=?", (group_id,)).fetchone()
+    if row is None or not row[0]:
+        return None
+    try:
+        agg = json.loads(row[0])
+    except Exception:
+        return None
+    return agg if isinstance(agg, dict) and agg.get("v") == AGGREGATE_VERSION else None
+
+
+def _fold_new(conn: sqlite3.Connection, group_id: int, ids: list[int], now: int) -> None:
+    agg = _load_aggregate(conn, group_id)
+    if agg is None:
+        _recompute(conn, group_id, now)
+        return
+    CHUNK = 400
+    for i in range(0, len(ids), CHUNK):
+        chunk = ids[i:i + CHUNK]
+        qm = ",".join("?" for _ in chunk)
+        for r in conn.execute(f"SELECT {','.join(_query._COLUMNS)} FROM events WHERE id IN ({qm})", chunk).fetchall():
+            _fold(agg, dict(r))
+    _store_aggregate(conn, group_id, agg, now)
+
+
 def _persist_titles(conn: sqlite3.Connection, ids: list[int]) -> None:
     if not ids:
         return
@@ -547,7 +611,7 @@ def correlate(*, conn: sqlite3.Connection | None = None, reset: bool = False) ->
         rows = c.execute(
             "SELECT id, event_hash, domain, feature, operation, item_key, title, season, episode, created_at, "
             "source_kind, session_key, source_provider, source_instance, destination_provider, destination_instance, "
-            "pair_key, run_id FROM events WHERE group_id IS NULL"
+            "pair_key, run_id, event_type FROM events WHERE group_id IS NULL"
         ).fetchall()
     except Exception as exc:
         _LOG.warning("event correlation query failed: %s", exc)
@@ -561,21 +625,31 @@ def correlate(*, conn: sqlite3.Connection | None = None, reset: bool = False) ->
     for r in rows:
         buckets.setdefault(group_hash(r), []).append(int(r["id"]))
 
-    touched: set[int] = set()
+    touched: dict[int, list[int]] = {}
+    empty = json.dumps(_new_aggregate(), separators=(",", ":"))
     try:
         with c:
             _persist_titles(c, all_ids)
             for gh, ids in buckets.items():
                 c.execute(
-                    "INSERT INTO event_groups (group_hash, created_at, updated_at) VALUES (?,?,?) "
+                    "INSERT INTO event_groups (group_hash, created_at, updated_at, aggregate) VALUES (?,?,?,?) "
                     "ON CONFLICT(group_hash) DO NOTHING",
-                    (gh, now, now),
+                    (gh, now, now, empty),
                 )
                 gid = int(c.execute("SELECT id FROM event_groups WHERE group_hash=?", (gh,)).fetchone()[0])
                 c.executemany("UPDATE events SET group_id=? WHERE id=?", [(gid, i) for i in ids])
-                touched.add(gid)
-            for gid in touched:
-                _recompute(c, gid, now)
+                touched.setdefault(gid, []).extend(ids)
+            # run summaries count unresolved items recorded in their item groups
+            issue_runs = {str(r["run_id"]) for r in rows if r["run_id"] and r["event_type"] in _UNRESOLVED_TYPES}
+            for run_id in issue_runs:
+                for (gid,) in c.execute(
+                    "SELECT DISTINCT group_id FROM events WHERE run_id=? AND event_type IN ('sync_run_started','sync_run_finished') "
+                    "AND group_id IS NOT NULL",
+                    (run_id,),
+                ).fetchall():
+                    touched.setdefault(int(gid), [])
+            for gid, ids in touched.items():
+                _fold_new(c, gid, ids, now)
     except Exception as exc:
         _LOG.warning("event correlation failed: %s", exc)
         return {"ok": False, "error": "internal_error", "grouped": 0}
@@ -15,6 +15,7 @@ _LOG = logging.getLogger("crosswatch.event_archive")
 from .schema import SCHEMA_VERSION
 from .importer import import_all
 from .query import status
+from .writer import recover
 
 
 def _file_size(p: Path) -> int:
@@ -57,6 +58,7 @@ def health(*, conn: sqlite3.Connection | None = None) -> dict[str, Any]:
             "first_event": st.get("first_event"),
             "last_event": st.get("last_event"),
             "last_import": st.get("last_import"),
+            "writer": st.get("writer"),
             "size_bytes": _db_size(p),
             "wal_size_bytes": _file_size(Path(str(p) + "-wal")),
         })
@@ -113,6 +115,11 @@ def boot_check(*, auto_repair: bool = True, state_dir: str | Path | None = None,
     if c is None:
         return {"ok": False, "status": "error", "message": "Unavailable — cannot open database", "path": str(path)}
 
+    try:
+        recover()
+    except Exception as exc:
+        _LOG.warning("event archive journal recovery failed: %s", exc)
+
     h = health(conn=c)
     if h.get("healthy"):
         ver, events, size = h.get("schema_version"), int(h.get("events") or 0), _fmt_size(h.get("size_bytes"))
@@ -10,6 +10,7 @@ from typing import Any
 
 from .db import get_conn, events_db_path
 from ..reason_labels import friendly_reason
+from .writer import writer_stats
 
 _LOG = logging.getLogger("crosswatch.event_archive")
 
@@ -241,4 +242,5 @@ def status(*, conn: sqlite3.Connection | None = None) -> dict[str, Any]:
         out["by_type"] = {str(r[0] or ""): int(r[1]) for r in by_type}
     except Exception:
         out["available"] = False
+    out["writer"] = writer_stats()
     return out
@@ -12,6 +12,8 @@ import time
 from collections.abc import Iterable, Mapping
 from typing import Any
 
+from ..compact_item import json_default
+from . import rollups
 from .db import get_conn
 
 _LOG = logging.getLogger("crosswatch.event_archive")
@@ -72,7 +74,7 @@ def make_event(*, hash_extra: Any = None, **kwargs: Any) -> dict[str, Any]:
     detail = row.get("detail")
     if detail is not None and not isinstance(detail, str):
         try:
-            row["detail"] = json.dumps(detail, ensure_ascii=False, sort_keys=True)[:4000]
+            row["detail"] = json.dumps(detail, ensure_ascii=False, sort_keys=True, default=json_default)[:4000]
         except Exception:
             row["detail"] = None
     if not row.get("event_hash"):
@@ -80,6 +82,87 @@ def make_event(*, hash_extra: Any = None, **kwargs: Any) -> dict[str, Any]:
     return row
 
 
+def _fold_rollups(c: sqlite3.Connection, started: Iterable[Any] | None = None) -> None:
+    # Rollups are derived data: a failure here must not cost the raw write, and
+    # stats.statistics() folds any stragglers on its next read. The savepoint
+    # drops a half-applied fold so the caller's commit never persists it.
+    c.execute("SAVEPOINT cw_fold_rollups")
+    try:
+        if started is None:
+            rollups.fold_new_events(c)
+        else:
+            rollups.refresh_runs(c, started)
+    except Exception as exc:
+        c.execute("ROLLBACK TO SAVEPOINT cw_fold_rollups")
+        _LOG.debug("event archive rollup update failed: %s", exc)
+    c.execute("RELEASE SAVEPOINT cw_fold_rollups")
+
+
+def _started_at(c: sqlite3.Connection, run_id: str) -> int | None:
+    row = c.execute("SELECT started_at FROM sync_runs WHERE run_id=?", (run_id,)).fetchone()
+    return int(row[0]) if row is not None and row[0] is not None else None
+
+
+_INSERT_SQL = f"INSERT OR IGNORE INTO events ({','.join(FIELDS)}) VALUES ({','.join('?' for _ in FIELDS)})"
+
+
+def prepare_rows(rows: Iterable[Mapping[str, Any]]) -> list[tuple[Any, ...]]:
+    prepared: list[tuple[Any, ...]] = []
+    for r in rows:
+        if not r.get("event_hash"):
+            r = make_event(**r)
+        prepared.append(tuple(r.get(k) for k in FIELDS))
+    return prepared
+
+
+def insert_events(c: sqlite3.Connection, prepared: list[tuple[Any, ...]]) -> int:
+    """Insert prepared rows inside the caller's transaction."""
+    cur = c.executemany(_INSERT_SQL, prepared)
+    return int(cur.rowcount if cur.rowcount is not None and cur.rowcount >= 0 else len(prepared))
+
+
+def upsert_run_started(
+    c: sqlite3.Connection, run_id: str, *, started_at: int | None = None, mode: str | None = None, dry_run: bool = False,
+) -> tuple[int | None, int]:
+    """Upsert a run start inside the caller's transaction; returns ``(previous, new)`` start times."""
+    ts = int(started_at or time.time())
+    prev = _started_at(c, str(run_id))
+    c.execute(
+        "INSERT INTO sync_runs (run_id, started_at, mode, dry_run, status) VALUES (?,?,?,?,?) "
+        "ON CONFLICT(run_id) DO UPDATE SET started_at=excluded.started_at, mode=excluded.mode, "
+        "dry_run=excluded.dry_run, status=excluded.status",
+        (str(run_id), ts, mode, 1 if dry_run else 0, "running"),
+    )
+    return prev, ts
+
+
+def upsert_run_finished(
+    c: sqlite3.Connection,
+    run_id: str,
+    *,
+    finished_at: int | None = None,
+    status: str = "done",
+    pairs: int = 0,
+    summary: Mapping[str, Any] | None = None,
+) -> int | None:
+    """Upsert a run finish inside the caller's transaction; returns the run's start time."""
+    s = dict(summary or {})
+    c.execute(
+        "INSERT INTO sync_runs (run_id, finished_at, status, pairs, added, removed, updated, unresolved, blocked, errors, summary) "
+        "VALUES (?,?,?,?,?,?,?,?,?,?,?) "
+        "ON CONFLICT(run_id) DO UPDATE SET finished_at=excluded.finished_at, status=excluded.status, "
+        "pairs=excluded.pairs, added=excluded.added, removed=excluded.removed, updated=excluded.updated, "
+        "unresolved=excluded.unresolved, blocked=excluded.blocked, errors=excluded.errors, summary=excluded.summary",
+        (
+            str(run_id), int(finished_at or time.time()), status, int(pairs),
+            int(s.get("added") or 0), int(s.get("removed") or 0), int(s.get("updated") or 0),
+            int(s.get("unresolved") or 0), int(s.get("blocked") or 0), int(s.get("errors") or 0),
+            json.dumps(s, ensure_ascii=False, sort_keys=True)[:4000] if s else None,
+        ),
+    )
+    return _started_at(c, str(run_id))
+
+
 def record_events(rows: Iterable[Mapping[str, Any]], *, conn: sqlite3.Connection | None = None) -> int:
     try:
         materialized = [dict(r) for r in (rows or [])]
@@ -90,17 +173,12 @@ def record_events(rows: Iterable[Mapping[str, Any]], *, conn: sqlite3.Connection
     c = conn or get_conn()
     if c is None:
         return 0
-    prepared: list[tuple[Any, ...]] = []
-    for r in materialized:
-        if not r.get("event_hash"):
-            r = make_event(**r)
-        prepared.append(tuple(r.get(k) for k in FIELDS))
-    placeholders = ",".join("?" for _ in FIELDS)
-    sql = f"INSERT OR IGNORE INTO events ({','.join(FIELDS)}) VALUES ({placeholders})"
+    prepared = prepare_rows(materialized)
     try:
         with c:
-            cur = c.executemany(sql, prepared)
-            return int(cur.rowcount if cur.rowcount is not None and cur.rowcount >= 0 else len(prepared))
+            n = insert_events(c, prepared)
+            _fold_rollups(c)
+            return n
     except Exception as exc:
         _LOG.warning("event archive write failed: %s", exc)
         return 0
@@ -119,12 +197,8 @@ def record_run_started(
         return
     try:
         with c:
-            c.execute(
-                "INSERT INTO sync_runs (run_id, started_at, mode, dry_run, status) VALUES (?,?,?,?,?) "
-                "ON CONFLICT(run_id) DO UPDATE SET started_at=excluded.started_at, mode=excluded.mode, "
-                "dry_run=excluded.dry_run, status=excluded.status",
-                (str(run_id), int(started_at or time.time()), mode, 1 if dry_run else 0, "running"),
-            )
+            prev, ts = upsert_run_started(c, str(run_id), started_at=started_at, mode=mode, dry_run=dry_run)
+            _fold_rollups(c, (prev, ts))
     except Exception as exc:
         _LOG.warning("event archive run start failed: %s", exc)
 
@@ -141,22 +215,12 @@ def record_run_finished(
     c = conn or get_conn()
     if c is None:
         return
-    s = dict(summary or {})
     try:
         with c:
-            c.execute(
-                "INSERT INTO sync_runs (run_id, finished_at, status, pairs, added, removed, updated, unresolved, blocked, errors, summary) "
-                "VALUES (?,?,?,?,?,?,?,?,?,?,?) "
-                "ON CONFLICT(run_id) DO UPDATE SET finished_at=excluded.finished_at, status=excluded.status, "
-                "pairs=excluded.pairs, added=excluded.added, removed=excluded.removed, updated=excluded.updated, "
-                "unresolved=excluded.unresolved, blocked=excluded.blocked, errors=excluded.errors, summary=excluded.summary",
-                (
-                    str(run_id), int(finished_at or time.time()), status, int(pairs),
-                    int(s.get("added") or 0), int(s.get("removed") or 0), int(s.get("updated") or 0),
-                    int(s.get("unresolved") or 0), int(s.get("blocked") or 0), int(s.get("errors") or 0),
-                    json.dumps(s, ensure_ascii=False, sort_keys=True)[:4000] if s else None,
-                ),
+            started = upsert_run_finished(
+                c, str(run_id), finished_at=finished_at, status=status, pairs=pairs, summary=summary,
             )
+            _fold_rollups(c, (started,))
     except Exception as exc:
         _LOG.warning("event archive run finish failed: %s", exc)
 
@@ -170,11 +234,20 @@ def _pair_key(a: str, b: str) -> str:
 
 
 class RunRecorder:
+    """Archive observer around the orchestrator's emit.
+
+    Rows go to an ``EventWriter`` so archive inserts stay off the sync path:
+    the shared archive writer by default, or a private one bound to ``conn``.
+    """
+
+    def __init__(self, inner_emit, *, run_id: str, conn: sqlite3.Connection | None = None, writer: Any = None):
+        from .writer import EventWriter, default_writer
 
-    def __init__(self, inner_emit, *, run_id: str, conn: sqlite3.Connection | None = None):
         self._inner = inner_emit
         self._run_id = str(run_id)
         self._conn = conn
+        self._own_writer = writer is None and conn is not None
+        self._writer = writer or (EventWriter(conn=conn) if conn is not None else default_writer())
         self._buf: list[dict[str, Any]] = []
         self._src = ""
         self._dst = ""
@@ -202,7 +275,7 @@ class RunRecorder:
         if not force and len(self._buf) < 100:
             return
         batch, self._buf = self._buf, []
-        record_events(batch, conn=self._conn)
+        self._writer.events(batch)
 
     def _ctx_providers(self) -> tuple[str, str]:
         if self._two:
@@ -219,25 +292,20 @@ class RunRecorder:
     def _observe(self, event: str, f: Mapping[str, Any]) -> None:
         if event == "run:start":
             self._started = True
-            record_run_started(
-                self._run_id,
-                mode=f.get("mode"),
-                dry_run=bool(f.get("dry_run")),
-                conn=self._conn,
-            )
+            self._writer.run_started(self._run_id, mode=f.get("mode"), dry_run=bool(f.get("dry_run")))
             self._add(event_type="sync_run_started", operation="run", detail=dict(f))
             return
 
         if event == "run:done":
             self._add(event_type="sync_run_finished", operation="run", detail=dict(f))
             self._flush(force=True)
-            record_run_finished(
+            self._writer.run_finished(
                 self._run_id,
                 status="done",
                 pairs=int(f.get("pairs") or 0),
                 summary={k: f.get(k) for k in ("added", "removed", "updated", "unresolved", "blocked", "errors")},
-                conn=self._conn,
             )
+            self._writer.flush(wait=False)
             return
 
         if event in ("health", "provider_health"):
@@ -431,8 +499,13 @@ class RunRecorder:
     def close(self) -> None:
         try:
             self._flush(force=True)
+            if self._own_writer:
+                self._writer.close()
+            else:
+                self._writer.flush(wait=True)
         except Exception:
             pass
+        # Correlation is deferred to here so it reads the run's rows once, after the final flush.
         try:
             from .groups import correlate
             correlate(conn=self._conn)
@@ -0,0 +1,260 @@
+# cw_platform/event_archive/rollups.py
+# CrossWatch - Hourly/daily statistics rollups
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import json
+import math
+import sqlite3
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+HOUR = 3600
+DAY = 86400
+GRAINS = (HOUR, DAY)
+
+# Durations below _EXACT_MAX seconds get their own sketch bin; longer ones share
+# log-spaced bins, which keeps percentiles within ~1% of the exact value.
+_EXACT_MAX = 64
+_GAMMA = 1.02
+
+_EVENTS_MARK = "events_max_id"
+_RUNS_MARK = "runs_built"
+
+_EVENT_COLUMNS = "id, created_at, event_type, domain, source_kind, severity, reason_code"
+
+
+def sketch_bin(seconds: Any) -> int:
+    d = max(0, int(seconds or 0))
+    if d <= _EXACT_MAX:
+        return d
+    return _EXACT_MAX + int(math.ceil(math.log(d / _EXACT_MAX, _GAMMA)))
+
+
+def sketch_value(b: int) -> int:
+    if b <= _EXACT_MAX:
+        return b
+    hi = _EXACT_MAX * _GAMMA ** (b - _EXACT_MAX)
+    return int(round(hi * 2 / (1 + _GAMMA)))
+
+
+def sketch_percentile(sketch: Counter[int], p: float) -> int | None:
+    """Nearest-rank percentile at ``floor(p * (n - 1))``, like an ``ORDER BY ... OFFSET`` probe."""
+    n = sum(sketch.values())
+    if n <= 0:
+        return None
+    rank = min(n - 1, int(math.floor(p * (n - 1))))
+    seen = 0
+    for b in sorted(sketch):
+        seen += sketch[b]
+        if seen > rank:
+            return sketch_value(b)
+    return None
+
+
+def event_metrics(r: Any) -> list[str]:
+    et, domain, kind = r["event_type"], r["domain"], r["source_kind"]
+    delivered = et in ("scrobble_completed", "rating_applied")
+    out = ["events"]
+    if et == "scrobble_completed":
+        out.append("scrobbles")
+    if delivered:
+        out.append("delivered")
+    if et in ("scrobble_failed", "rating_failed"):
+        out.append("delivery_failed")
+    if et == "sync_run_finished":
+        out.append("sync_finished")
+    if kind is not None:
+        if domain == "scrobble":
+            out.append("webhook_events" if kind == "webhook" else "watcher_events")
+        if delivered and kind == "webhook":
+            out.append("delivered_webhook")
+        elif delivered and domain == "scrobble":
+            out.append("delivered_watcher")
+    if r["severity"] == "error" and r["reason_code"]:
+        out.append(f"reason:{r['reason_code']}")
+    return out
+
+
+class RunAgg:
+    __slots__ = ("runs", "error_runs", "finished", "duration_sum", "sketch")
+
+    def __init__(self) -> None:
+        self.runs = 0
+        self.error_runs = 0
+        self.finished = 0
+        self.duration_sum = 0
+        self.sketch: Counter[int] = Counter()
+
+    def fold(self, started_at: Any, finished_at: Any, errors: Any) -> None:
+        self.runs += 1
+        if int(errors or 0) > 0:
+            self.error_runs += 1
+        if finished_at is not None and started_at is not None and int(finished_at) >= int(started_at):
+            d = int(finished_at) - int(started_at)
+            self.finished += 1
+            self.duration_sum += d
+            self.sketch[sketch_bin(d)] += 1
+
+    def merge(self, other: "RunAgg") -> None:
+        self.runs += other.runs
+        self.error_runs += other.error_runs
+        self.finished += other.finished
+        self.duration_sum += other.duration_sum
+        self.sketch.update(other.sketch)
+
+
+def _mark(conn: sqlite3.Connection, key: str) -> int | None:
+    row = conn.execute("SELECT value FROM stats_rollup_state WHERE key=?", (key,)).fetchone()
+    return int(row[0]) if row is not None else None
+
+
+def _set_mark(conn: sqlite3.Connection, key: str, value: int) -> None:
+    conn.execute(
+        "INSERT INTO stats_rollup_state(key, value) VALUES(?,?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+        (key, int(value)),
+    )
+
+
+def fold_new_events(conn: sqlite3.Connection) -> int:
+    """Add events past the watermark to the rollups; runs inside the caller's transaction."""
+    mark = _mark(conn, _EVENTS_MARK) or 0
+    deltas: Counter[tuple[int, int, str]] = Counter()
+    top = mark
+    for r in conn.execute(f"SELECT {_EVENT_COLUMNS} FROM events WHERE id>? ORDER BY id", (mark,)):
+        top = int(r["id"])
+        if r["created_at"] is None:
+            continue
+        ts = int(r["created_at"])
+        for metric in event_metrics(r):
+            for grain in GRAINS:
+                deltas[(grain, ts - ts % grain, metric)] += 1
+    if top == mark:
+        return 0
+    if deltas:
+        conn.executemany(
+            "INSERT INTO stats_event_rollups(grain, bucket, metric, value) VALUES(?,?,?,?) "
+            "ON CONFLICT(grain, bucket, metric) DO UPDATE SET value=value+excluded.value",
+            [(g, b, m, n) for (g, b, m), n in deltas.items()],
+        )
+    _set_mark(conn, _EVENTS_MARK, top)
+    return top - mark
+
+
+def _store_runs(conn: sqlite3.Connection, grain: int, aggs: dict[int, RunAgg]) -> None:
+    conn.executemany(
+        "INSERT INTO stats_run_rollups(grain, bucket, runs, error_runs, finished, duration_sum, sketch) VALUES(?,?,?,?,?,?,?) "
+        "ON CONFLICT(grain, bucket) DO UPDATE SET runs=excluded.runs, error_runs=excluded.error_runs, "
+        "finished=excluded.finished, duration_sum=excluded.duration_sum, sketch=excluded.sketch",
+        [
+            (grain, b, a.runs, a.error_runs, a.finished, a.duration_sum, json.dumps({str(k): v for k, v in sorted(a.sketch.items())}))
+            for b, a in aggs.items()
+        ],
+    )
+
+
+def refresh_runs(conn: sqlite3.Connection, started: Iterable[Any] = ()) -> None:
+    """Rebuild the run rollup buckets holding ``started``; the first call builds every bucket."""
+    if _mark(conn, _RUNS_MARK) is None:
+        conn.execute("DELETE FROM stats_run_rollups")
+        for grain in GRAINS:
+            aggs: dict[int, RunAgg] = {}
+            for r in conn.execute("SELECT started_at, finished_at, errors FROM sync_runs WHERE started_at IS NOT NULL"):
+                ts = int(r["started_at"])
+                aggs.setdefault(ts - ts % grain, RunAgg()).fold(r["started_at"], r["finished_at"], r["errors"])
+            _store_runs(conn, grain, aggs)
+        _set_mark(conn, _RUNS_MARK, 1)
+        return
+    for ts in {int(t) for t in started if t is not None}:
+        for grain in GRAINS:
+            b = ts - ts % grain
+            agg = RunAgg()
+            for r in conn.execute(
+                "SELECT started_at, finished_at, errors FROM sync_runs WHERE started_at>=? AND started_at<?", (b, b + grain)
+            ):
+                agg.fold(r["started_at"], r["finished_at"], r["errors"])
+            if agg.runs:
+                _store_runs(conn, grain, {b: agg})
+            else:
+                conn.execute("DELETE FROM stats_run_rollups WHERE grain=? AND bucket=?", (grain, b))
+
+
+def sync(conn: sqlite3.Connection) -> None:
+    with conn:
+        refresh_runs(conn)
+        fold_new_events(conn)
+
+
+def reset(conn: sqlite3.Connection) -> None:
+    conn.execute("DELETE FROM stats_event_rollups")
+    conn.execute("DELETE FROM stats_run_rollups")
+    conn.execute("DELETE FROM stats_rollup_state")
+
+
+def windows(since: int, until: int, bucket: int | None = None) -> list[tuple[int, int, int]]:
+    """Split ``[since, until)`` into ``(grain, a, b)`` spans; grain 0 marks raw edges.
+
+    A grain is only used when it divides ``bucket`` so rollup rows never straddle
+    a trend bucket.
+    """
+    grains = [g for g in sorted(GRAINS, reverse=True) if not bucket or bucket % g == 0]
+
+    def split(a: int, b: int, usable: list[int]) -> list[tuple[int, int, int]]:
+        if a >= b:
+            return []
+        for i, g in enumerate(usable):
+            lo, hi = -(-a // g) * g, b - b % g
+            if lo < hi:
+                rest = usable[i + 1:]
+                return [*split(a, lo, rest), (g, lo, hi), *split(hi, b, rest)]
+        return [(0, a, b)]
+
+    return split(int(since), int(until), grains)
+
+
+def event_buckets(conn: sqlite3.Connection, since: int, until: int, bucket: int | None = None) -> dict[int, Counter[str]]:
+    """Event metric counts per ``ts // bucket`` (a single key 0 without a bucket)."""
+    out: dict[int, Counter[str]] = {}
+    for grain, a, b in windows(since, until, bucket):
+        if grain:
+            for r in conn.execute(
+                "SELECT bucket, metric, value FROM stats_event_rollups WHERE grain=? AND bucket>=? AND bucket<?", (grain, a, b)
+            ):
+                out.setdefault(int(r["bucket"]) // bucket if bucket else 0, Counter())[str(r["metric"])] += int(r["value"])
+            continue
+        for r in conn.execute(f"SELECT {_EVENT_COLUMNS} FROM events WHERE created_at>=? AND created_at<?", (a, b)):
+            c = out.setdefault(int(r["created_at"]) // bucket if bucket else 0, Counter())
+            for metric in event_metrics(r):
+                c[metric] += 1
+    return out
+
+
+def run_buckets(conn: sqlite3.Connection, since: int, until: int, bucket: int | None = None) -> dict[int, RunAgg]:
+    out: dict[int, RunAgg] = {}
+    for grain, a, b in windows(since, until, bucket):
+        if grain:
+            for r in conn.execute(
+                "SELECT bucket, runs, error_runs, finished, duration_sum, sketch FROM stats_run_rollups "
+                "WHERE grain=? AND bucket>=? AND bucket<?",
+                (grain, a, b),
+            ):
+                agg = RunAgg()
+                agg.runs, agg.error_runs = int(r["runs"]), int(r["error_runs"])
+                agg.finished, agg.duration_sum = int(r["finished"]), int(r["duration_sum"])
+                agg.sketch = Counter({int(k): int(v) for k, v in json.loads(r["sketch"] or "{}").items()})
+                out.setdefault(int(r["bucket"]) // bucket if bucket else 0, RunAgg()).merge(agg)
+            continue
+        for r in conn.execute("SELECT started_at, finished_at, errors FROM sync_runs WHERE started_at>=? AND started_at<?", (a, b)):
+            out.setdefault(int(r["started_at"]) // bucket if bucket else 0, RunAgg()).fold(r["started_at"], r["finished_at"], r["errors"])
+    return out
+
+
+def total(buckets: dict[int, Any], factory: Any) -> Any:
+    acc = factory()
+    for v in buckets.values():
+        if isinstance(acc, RunAgg):
+            acc.merge(v)
+        else:
+            acc.update(v)
+    return acc
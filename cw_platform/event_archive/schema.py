@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import sqlite3
 
-SCHEMA_VERSION = 6
+SCHEMA_VERSION = 8
 
 _CREATE_SYNC_RUNS = """
 CREATE TABLE IF NOT EXISTS sync_runs (
@@ -101,7 +101,8 @@ CREATE TABLE IF NOT EXISTS event_groups (
     reason                 TEXT,
     summary                TEXT,
     acknowledged_at        INTEGER,
-    acknowledged_by        TEXT
+    acknowledged_by        TEXT,
+    aggregate              TEXT
 )
 """
 
@@ -115,6 +116,36 @@ CREATE TABLE IF NOT EXISTS event_imports (
 )
 """
 
+_CREATE_STATS_EVENT_ROLLUPS = """
+CREATE TABLE IF NOT EXISTS stats_event_rollups (
+    grain    INTEGER NOT NULL,
+    bucket   INTEGER NOT NULL,
+    metric   TEXT NOT NULL,
+    value    INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (grain, bucket, metric)
+) WITHOUT ROWID
+"""
+
+_CREATE_STATS_RUN_ROLLUPS = """
+CREATE TABLE IF NOT EXISTS stats_run_rollups (
+    grain          INTEGER NOT NULL,
+    bucket         INTEGER NOT NULL,
+    runs           INTEGER NOT NULL DEFAULT 0,
+    error_runs     INTEGER NOT NULL DEFAULT 0,
+    finished       INTEGER NOT NULL DEFAULT 0,
+    duration_sum   INTEGER NOT NULL DEFAULT 0,
+    sketch         TEXT,
+    PRIMARY KEY (grain, bucket)
+) WITHOUT ROWID
+"""
+
+_CREATE_STATS_ROLLUP_STATE = """
+CREATE TABLE IF NOT EXISTS stats_rollup_state (
+    key     TEXT PRIMARY KEY,
+    value   INTEGER
+)
+"""
+
 _INDEXES = (
     "CREATE INDEX IF NOT EXISTS idx_events_created_at ON events(created_at)",
     "CREATE INDEX IF NOT EXISTS idx_events_run_id ON events(run_id)",
@@ -154,6 +185,7 @@ _ADD_COLUMNS = (
     ("events", "domain", "TEXT DEFAULT 'sync'"),
     ("events", "session_key", "TEXT"),
     ("event_groups", "domain", "TEXT DEFAULT 'sync'"),
+    ("event_groups", "aggregate", "TEXT"),
 )
 
 _EXTRA_INDEXES = (
@@ -165,7 +197,8 @@ _EXTRA_INDEXES = (
 
 
 def _create_tables(conn: sqlite3.Connection) -> None:
-    for stmt in (_CREATE_SYNC_RUNS, _CREATE_EVENTS, _CREATE_EVENT_GROUPS, _CREATE_EVENT_IMPORTS):
+    for stmt in (_CREATE_SYNC_RUNS, _CREATE_EVENTS, _CREATE_EVENT_GROUPS, _CREATE_EVENT_IMPORTS,
+                 _CREATE_STATS_EVENT_ROLLUPS, _CREATE_STATS_RUN_ROLLUPS, _CREATE_STATS_ROLLUP_STATE):
         conn.execute(stmt)
 
 
@@ -3,11 +3,12 @@
 # Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
 from __future__ import annotations
 
-import math
 import threading
 import time
+from collections import Counter
 from typing import Any
 
+from . import rollups
 from .db import get_conn
 from ..reason_labels import friendly_reason
 
@@ -68,54 +69,17 @@ def _blocked_items(conn: Any, since: int, until: int) -> int:
     return int(row[0] or 0) if row else 0
 
 
-def _percentile(conn: Any, since: int, until: int, p: float) -> int | None:
-    n = int(conn.execute(
-        "SELECT COUNT(*) FROM sync_runs WHERE started_at>=? AND started_at<? AND finished_at IS NOT NULL AND finished_at>=started_at",
-        (since, until),
-    ).fetchone()[0])
-    if n <= 0:
-        return None
-    off = min(n - 1, int(math.floor(p * (n - 1))))
-    row = conn.execute(
-        "SELECT finished_at-started_at FROM sync_runs WHERE started_at>=? AND started_at<? "
-        "AND finished_at IS NOT NULL AND finished_at>=started_at ORDER BY finished_at-started_at LIMIT 1 OFFSET ?",
-        (since, until, off),
-    ).fetchone()
-    return int(row[0]) if row else None
-
-
 def _compute(conn: Any, since: int, until: int, bucket: int) -> dict[str, Any]:
     span = max(1, until - since)
     prev_since = since - span
     p = {"s": since, "u": until, "ps": prev_since, "bs": max(60, int(bucket))}
 
-    ev = conn.execute(
-        """
-        SELECT
-          COALESCE(SUM(CASE WHEN created_at>=:s AND event_type='scrobble_completed' THEN 1 END),0) scrob_c,
-          COALESCE(SUM(CASE WHEN created_at< :s AND event_type='scrobble_completed' THEN 1 END),0) scrob_p,
-          COALESCE(SUM(CASE WHEN created_at>=:s AND event_type IN ('scrobble_completed','rating_applied') THEN 1 END),0) dok_c,
-          COALESCE(SUM(CASE WHEN created_at< :s AND event_type IN ('scrobble_completed','rating_applied') THEN 1 END),0) dok_p,
-          COALESCE(SUM(CASE WHEN created_at>=:s AND event_type IN ('scrobble_failed','rating_failed') THEN 1 END),0) dfail_c,
-          COALESCE(SUM(CASE WHEN created_at< :s AND event_type IN ('scrobble_failed','rating_failed') THEN 1 END),0) dfail_p,
-          COALESCE(SUM(CASE WHEN created_at>=:s AND domain='scrobble' AND source_kind='webhook' THEN 1 END),0) wh_c,
-          COALESCE(SUM(CASE WHEN created_at>=:s AND domain='scrobble' AND source_kind<>'webhook' THEN 1 END),0) watch_c
-        FROM events WHERE created_at>=:ps AND created_at<:u
-        """,
-        p,
-    ).fetchone()
-
-    rn = conn.execute(
-        """
-        SELECT
-          COALESCE(SUM(CASE WHEN started_at>=:s THEN 1 END),0) runs_c,
-          COALESCE(SUM(CASE WHEN started_at< :s THEN 1 END),0) runs_p,
-          AVG(CASE WHEN started_at>=:s AND finished_at IS NOT NULL AND finished_at>=started_at THEN finished_at-started_at END) dur_c,
-          AVG(CASE WHEN started_at< :s AND finished_at IS NOT NULL AND finished_at>=started_at THEN finished_at-started_at END) dur_p
-        FROM sync_runs WHERE started_at>=:ps AND started_at<:u
-        """,
-        p,
-    ).fetchone()
+    rollups.sync(conn)
+    cur_ev = rollups.event_buckets(conn, since, until, p["bs"])
+    cur_rn = rollups.run_buckets(conn, since, until, p["bs"])
+    ev_c, rn_c = rollups.total(cur_ev, Counter), rollups.total(cur_rn, rollups.RunAgg)
+    ev_p = rollups.total(rollups.event_buckets(conn, prev_since, since), Counter)
+    rn_p = rollups.total(rollups.run_buckets(conn, prev_since, since), rollups.RunAgg)
 
     def _run_states(a: int, b: int) -> tuple[int, int]:
         err = {row[0] for row in conn.execute(
@@ -129,64 +93,45 @@ def _compute(conn: Any, since: int, until: int, bucket: int) -> dict[str, Any]:
         ok, tot = float(ok or 0), float(tot or 0)
         return round(ok / tot * 100.0, 1) if tot > 0 else 0.0
 
-    runs_c, runs_p = int(rn["runs_c"]), int(rn["runs_p"])
+    def _avg(rn: rollups.RunAgg) -> float:
+        return round(rn.duration_sum / rn.finished, 2) if rn.finished else 0.0
+
+    runs_c, runs_p = rn_c.runs, rn_p.runs
     failrun_c, warnrun_c = _run_states(since, until)
     failrun_p, warnrun_p = _run_states(prev_since, since)
     okrun_c = max(0, runs_c - failrun_c - warnrun_c)
     okrun_p = max(0, runs_p - failrun_p - warnrun_p)
-    dok_c, dfail_c = int(ev["dok_c"]), int(ev["dfail_c"])
-    dok_p, dfail_p = int(ev["dok_p"]), int(ev["dfail_p"])
+    dok_c, dfail_c = ev_c["delivered"], ev_c["delivery_failed"]
+    dok_p, dfail_p = ev_p["delivered"], ev_p["delivery_failed"]
     ops_c, ops_p = runs_c + dok_c + dfail_c, runs_p + dok_p + dfail_p
     okops_c, okops_p = okrun_c + dok_c, okrun_p + dok_p
 
     kpis = {
         "sync_runs": _kpi(runs_c, runs_p),
-        "scrobbles": _kpi(ev["scrob_c"], ev["scrob_p"]),
-        "avg_duration": _kpi(round(float(rn["dur_c"] or 0), 2), round(float(rn["dur_p"] or 0), 2)),
+        "scrobbles": _kpi(ev_c["scrobbles"], ev_p["scrobbles"]),
+        "avg_duration": _kpi(_avg(rn_c), _avg(rn_p)),
         "failures": _kpi(failrun_c + warnrun_c + dfail_c, failrun_p + warnrun_p + dfail_p),
         "blocked": _kpi(_blocked_items(conn, since, until), _blocked_items(conn, prev_since, since)),
         "success_rate": _kpi(_rate(okops_c, ops_c), _rate(okops_p, ops_p)),
     }
 
-    trend_rows = conn.execute(
-        """
-        SELECT created_at/:bs AS b,
-          COALESCE(SUM(CASE WHEN event_type='sync_run_finished' THEN 1 END),0) sync,
-          COALESCE(SUM(CASE WHEN event_type IN ('scrobble_completed','rating_applied') AND source_kind='webhook' THEN 1 END),0) webhook,
-          COALESCE(SUM(CASE WHEN event_type IN ('scrobble_completed','rating_applied') AND source_kind<>'webhook' AND domain='scrobble' THEN 1 END),0) watcher,
-          COALESCE(SUM(CASE WHEN event_type IN ('scrobble_failed','rating_failed') THEN 1 END),0) sfail
-        FROM events WHERE created_at>=:s AND created_at<:u GROUP BY b
-        """,
-        p,
-    ).fetchall()
-    frun_rows = conn.execute(
-        "SELECT started_at/:bs AS b, COALESCE(SUM(CASE WHEN COALESCE(errors,0)>0 THEN 1 END),0) frun "
-        "FROM sync_runs WHERE started_at>=:s AND started_at<:u GROUP BY b",
-        p,
-    ).fetchall()
-    frun_by_b = {int(r["b"]): int(r["frun"]) for r in frun_rows}
     tmap: dict[int, dict[str, Any]] = {}
-    for r in trend_rows:
-        b = int(r["b"])
-        failed = int(r["sfail"]) + frun_by_b.get(b, 0)
-        ok = int(r["sync"]) + int(r["webhook"]) + int(r["watcher"])
+    for b in sorted(set(cur_ev) | set(cur_rn)):
+        c, frun = cur_ev.get(b, Counter()), cur_rn[b].error_runs if b in cur_rn else 0
+        if not c["events"]:
+            if frun:
+                tmap[b] = {"t": b * p["bs"], "sync": 0, "webhook": 0, "watcher": 0, "failed": frun, "rate": 0.0}
+            continue
+        failed = c["delivery_failed"] + frun
+        ok = c["sync_finished"] + c["delivered_webhook"] + c["delivered_watcher"]
         tot = ok + failed
-        tmap[b] = {"t": b * p["bs"], "sync": int(r["sync"]), "webhook": int(r["webhook"]),
-                   "watcher": int(r["watcher"]), "failed": failed, "rate": round(ok / tot * 100.0, 1) if tot > 0 else None}
-    for b, frun in frun_by_b.items():
-        if b not in tmap and frun:
-            tmap[b] = {"t": b * p["bs"], "sync": 0, "webhook": 0, "watcher": 0, "failed": frun, "rate": 0.0}
+        tmap[b] = {"t": b * p["bs"], "sync": c["sync_finished"], "webhook": c["delivered_webhook"],
+                   "watcher": c["delivered_watcher"], "failed": failed, "rate": round(ok / tot * 100.0, 1) if tot > 0 else None}
     trend = [tmap[b] for b in sorted(tmap)]
 
-    dur_rows = conn.execute(
-        """
-        SELECT started_at/:bs AS b, AVG(finished_at-started_at) avg, COUNT(*) n
-        FROM sync_runs WHERE started_at>=:s AND started_at<:u AND finished_at IS NOT NULL AND finished_at>=started_at
-        GROUP BY b ORDER BY b
-        """,
-        p,
-    ).fetchall()
-    duration_series = [{"t": int(r["b"]) * p["bs"], "avg": round(float(r["avg"] or 0), 2), "n": int(r["n"])} for r in dur_rows]
+    duration_series = [
+        {"t": b * p["bs"], "avg": _avg(cur_rn[b]), "n": cur_rn[b].finished} for b in sorted(cur_rn) if cur_rn[b].finished
+    ]
 
     sc_rows = conn.execute(
         "SELECT status, COUNT(*) c FROM event_groups WHERE domain='scrobble' AND last_event_at>=:s AND last_event_at<:u GROUP BY status",
@@ -208,8 +153,8 @@ def _compute(conn: Any, since: int, until: int, bucket: int) -> dict[str, Any]:
 
     types = [
         {"key": "sync", "label": "Sync runs", "value": runs_c},
-        {"key": "watcher", "label": "Watcher", "value": int(ev["watch_c"])},
-        {"key": "webhook", "label": "Webhooks", "value": int(ev["wh_c"])},
+        {"key": "watcher", "label": "Watcher", "value": ev_c["watcher_events"]},
+        {"key": "webhook", "label": "Webhooks", "value": ev_c["webhook_events"]},
     ]
 
     rmap: dict[tuple[Any, Any], dict[str, int]] = {}
@@ -251,16 +196,12 @@ def _compute(conn: Any, since: int, until: int, bucket: int) -> dict[str, Any]:
     routes.sort(key=lambda x: x["volume"], reverse=True)
     routes = routes[:8]
 
-    def _fail_map(a: int, b: int) -> dict[str, int]:
-        rows = conn.execute(
-            "SELECT reason_code, COUNT(*) c FROM events WHERE created_at>=? AND created_at<? "
-            "AND severity='error' AND reason_code IS NOT NULL AND reason_code<>'' GROUP BY reason_code ORDER BY c DESC LIMIT 12",
-            (a, b),
-        ).fetchall()
-        return {str(r["reason_code"]): int(r["c"]) for r in rows}
+    def _fail_map(c: Counter[str]) -> dict[str, int]:
+        reasons = [(k[7:], v) for k, v in c.items() if k.startswith("reason:") and v]
+        return dict(sorted(reasons, key=lambda x: (-x[1], x[0]))[:12])
 
-    cur_fails = _fail_map(since, until)
-    prev_fails = _fail_map(prev_since, since)
+    cur_fails = _fail_map(ev_c)
+    prev_fails = _fail_map(ev_p)
     total_fail = sum(cur_fails.values()) or 1
     failure_reasons = [{
         "reason": k, "label": friendly_reason(k), "count": v, "prev": prev_fails.get(k, 0),
@@ -268,9 +209,9 @@ def _compute(conn: Any, since: int, until: int, bucket: int) -> dict[str, Any]:
     } for k, v in sorted(cur_fails.items(), key=lambda x: x[1], reverse=True)[:8]]
 
     percentiles = {
-        "p50": _percentile(conn, since, until, 0.5),
-        "p90": _percentile(conn, since, until, 0.9),
-        "p99": _percentile(conn, since, until, 0.99),
+        "p50": rollups.sketch_percentile(rn_c.sketch, 0.5),
+        "p90": rollups.sketch_percentile(rn_c.sketch, 0.9),
+        "p99": rollups.sketch_percentile(rn_c.sketch, 0.99),
     }
 
     return {
@@ -0,0 +1,542 @@
+# cw_platform/event_archive/writer.py
+# CrossWatch - Write-behind queue for runtime event recording
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any, TextIO
+
+from ..compact_item import json_default
+from .db import connect, events_db_path
+from .recorder import (
+    _fold_rollups,
+    insert_events,
+    make_event,
+    prepare_rows,
+    upsert_run_finished,
+    upsert_run_started,
+)
+
+_LOG = logging.getLogger("crosswatch.event_archive")
+
+__all__ = ["EventWriter", "default_writer", "journal_path", "recover", "writer_stats", "shutdown"]
+
+MAX_QUEUE = 20000
+BATCH_SIZE = 500
+INTERVAL = 0.5
+MAX_ATTEMPTS = 3
+# Queued ops are journaled (and fsynced) by the writer thread in batches of
+# this size, once the oldest unjournaled op has waited JOURNAL_INTERVAL
+# seconds, or right before they are applied, whichever comes first.
+JOURNAL_BATCH = 64
+JOURNAL_INTERVAL = 0.05
+
+
+def journal_path(db_path: str | os.PathLike[str] | None = None) -> Path:
+    return Path(str(db_path or events_db_path()) + ".queue")
+
+
+def _held_path(journal: Path) -> Path:
+    return Path(str(journal) + ".failed")
+
+
+class EventWriter:
+    """Bounded write-behind queue for archive rows.
+
+    Producers append ``("events" | "run_started" | "run_finished", payload)``
+    ops and return; a background thread applies them in one transaction once
+    ``batch_size`` ops are queued or the oldest has waited ``interval``
+    seconds. The same thread appends queued ops to a line journal within
+    ``JOURNAL_INTERVAL`` and before applying them; after a commit the journal
+    is cut down to the ops still queued. Batches dropped after repeated
+    failures are moved to a ``.failed`` file so compaction cannot lose them.
+    Both files are replayed on start. Replaying already applied ops is
+    harmless because every write is an idempotent upsert. With ``conn=None``
+    the writer owns a connection to the archive.
+    """
+
+    def __init__(
+        self,
+        *,
+        conn: sqlite3.Connection | None = None,
+        journal: str | os.PathLike[str] | None = None,
+        max_queue: int = MAX_QUEUE,
+        batch_size: int = BATCH_SIZE,
+        interval: float = INTERVAL,
+        start: bool = True,
+    ) -> None:
+        self._conn = conn
+        self._own_conn: sqlite3.Connection | None = None
+        self._own_path = ""
+        self._journal_path = Path(journal) if journal is not None else (journal_path() if conn is None else None)
+        self._journal: TextIO | None = None
+        self._journal_lock = threading.Lock()
+        self._to_journal: list[tuple[str, Any]] = []
+        self._journal_since = 0.0
+        self._journal_lines = 0
+        self.max_queue = max(1, int(max_queue))
+        self.batch_size = max(1, int(batch_size))
+        self.interval = max(0.0, float(interval))
+        self._autostart = start
+        self._queue: deque[tuple[float, str, Any]] = deque()
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closing = False
+        self._submitted = 0
+        self._applied = 0
+        self._flush_to = 0
+        self._attempts = 0
+        self._m: dict[str, Any] = {
+            "flushes": 0, "rows": 0, "dropped": 0, "errors": 0, "replayed": 0,
+            "max_depth": 0, "last_flush_ms": 0.0, "max_flush_ms": 0.0, "total_flush_ms": 0.0, "blocked_ms": 0.0,
+        }
+        self._replay()
+
+    # producers
+
+    def events(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        n = 0
+        for r in rows or ():
+            row = dict(r)
+            if not row.get("event_hash"):
+                row = make_event(**row)
+            self._submit("events", row)
+            n += 1
+        return n
+
+    def run_started(self, run_id: str, *, started_at: int | None = None, mode: str | None = None, dry_run: bool = False) -> None:
+        self._submit("run_started", {
+            "run_id": str(run_id), "started_at": int(started_at or time.time()), "mode": mode, "dry_run": bool(dry_run),
+        })
+
+    def run_finished(
+        self,
+        run_id: str,
+        *,
+        finished_at: int | None = None,
+        status: str = "done",
+        pairs: int = 0,
+        summary: Mapping[str, Any] | None = None,
+    ) -> None:
+        self._submit("run_finished", {
+            "run_id": str(run_id), "finished_at": int(finished_at or time.time()), "status": status,
+            "pairs": int(pairs), "summary": dict(summary or {}),
+        })
+
+    def _submit(self, op: str, payload: Any) -> None:
+        with self._cond:
+            if len(self._queue) >= self.max_queue and self._running():
+                t0 = time.perf_counter()
+                self._cond.notify_all()
+                while len(self._queue) >= self.max_queue and self._running():
+                    self._cond.wait(0.5)
+                self._m["blocked_ms"] += (time.perf_counter() - t0) * 1000.0
+            self._queue.append((time.monotonic(), op, payload))
+            first = False
+            if self._journal_path is not None:
+                first = not self._to_journal
+                if first:
+                    self._journal_since = time.monotonic()
+                self._to_journal.append((op, payload))
+            self._submitted += 1
+            depth = len(self._queue)
+            if depth > self._m["max_depth"]:
+                self._m["max_depth"] = depth
+            if first or depth >= self.batch_size or len(self._to_journal) >= JOURNAL_BATCH:
+                self._cond.notify_all()
+        self._ensure_thread()
+
+    def flush(self, *, wait: bool = True, timeout: float = 30.0) -> bool:
+        """Ask the writer to drain now; with ``wait`` block until every op queued so far is applied."""
+        with self._cond:
+            target = self._submitted
+            self._flush_to = max(self._flush_to, target)
+            self._cond.notify_all()
+        if not self._ensure_thread():
+            self.drain()
+            return True
+        if not wait:
+            return True
+        deadline = time.monotonic() + max(0.0, timeout)
+        with self._cond:
+            while self._applied < target:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    return False
+                self._cond.wait(min(left, 0.5))
+        return True
+
+    def close(self, *, timeout: float = 30.0) -> bool:
+        ok = self.flush(wait=True, timeout=timeout)
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        t = self._thread
+        if t is not None and t is not threading.current_thread():
+            t.join(timeout)
+        self._journal_pending()
+        with self._journal_lock, self._cond:
+            if self._journal is not None:
+                try:
+                    self._journal.close()
+                except Exception:
+                    pass
+                self._journal = None
+            if self._own_conn is not None:
+                try:
+                    self._own_conn.close()
+                except Exception:
+                    pass
+                self._own_conn = None
+        return ok
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            m = dict(self._m)
+            depth = len(self._queue)
+            oldest = self._queue[0][0] if self._queue else None
+        flushes = int(m["flushes"])
+        return {
+            "queue_depth": depth,
+            "max_queue": self.max_queue,
+            "oldest_age_ms": round((time.monotonic() - oldest) * 1000.0, 1) if oldest is not None else 0.0,
+            "avg_flush_ms": round(m["total_flush_ms"] / flushes, 2) if flushes else 0.0,
+            "last_flush_ms": round(m["last_flush_ms"], 2),
+            "max_flush_ms": round(m["max_flush_ms"], 2),
+            "blocked_ms": round(m["blocked_ms"], 2),
+            **{k: int(m[k]) for k in ("flushes", "rows", "dropped", "errors", "replayed", "max_depth")},
+            "running": self._running(),
+        }
+
+    # background thread
+
+    def _running(self) -> bool:
+        t = self._thread
+        return t is not None and t.is_alive()
+
+    def _ensure_thread(self) -> bool:
+        if not self._autostart:
+            return False
+        if self._running():
+            return True
+        with self._cond:
+            if self._closing:
+                return False
+            if not self._running():
+                self._thread = threading.Thread(target=self._loop, name="cw-event-writer", daemon=True)
+                self._thread.start()
+        return True
+
+    def _due(self) -> bool:
+        if not self._queue:
+            return False
+        if self._closing or self._flush_to > self._applied:
+            return True
+        return len(self._queue) >= self.batch_size or time.monotonic() - self._queue[0][0] >= self.interval
+
+    def _journal_due(self) -> bool:
+        if not self._to_journal:
+            return False
+        return len(self._to_journal) >= JOURNAL_BATCH or time.monotonic() - self._journal_since >= JOURNAL_INTERVAL
+
+    def _wait_for(self) -> float | None:
+        now = time.monotonic()
+        waits = []
+        if self._queue:
+            waits.append(self.interval - (now - self._queue[0][0]))
+        if self._to_journal:
+            waits.append(JOURNAL_INTERVAL - (now - self._journal_since))
+        return max(0.0, min(waits)) if waits else None
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closing and not self._due() and not self._journal_due():
+                    self._cond.wait(self._wait_for())
+                if self._closing and not self._queue:
+                    return
+                due = self._due()
+            if not due:
+                self._journal_pending()
+                continue
+            self.drain()
+            if self._attempts:
+                time.sleep(min(5.0, self.interval * (2 ** self._attempts)))
+
+    def drain(self) -> int:
+        """Apply everything queued so far in one transaction; returns the ops applied."""
+        self._journal_pending()
+        with self._cond:
+            batch = list(self._queue)
+        return self._apply(batch) if batch else 0
+
+    def _apply(self, batch: list[tuple[float, str, Any]]) -> int:
+        t0 = time.perf_counter()
+        c = self._connection()
+        if c is None:
+            self._journal_hold(batch)
+            self._done(len(batch), dropped=True)
+            _LOG.warning("event archive unavailable; dropped %d queued op(s)", len(batch))
+            return 0
+        rows = 0
+        try:
+            with c:
+                pending: list[Mapping[str, Any]] = []
+                started: list[Any] = []
+                for _ts, op, payload in batch:
+                    if op == "events":
+                        pending.append(payload)
+                        continue
+                    if pending:
+                        rows += insert_events(c, prepare_rows(pending))
+                        pending = []
+                    if op == "run_started":
+                        started.extend(upsert_run_started(
+                            c, payload["run_id"], started_at=payload.get("started_at"),
+                            mode=payload.get("mode"), dry_run=bool(payload.get("dry_run")),
+                        ))
+                    elif op == "run_finished":
+                        started.append(upsert_run_finished(
+                            c, payload["run_id"], finished_at=payload.get("finished_at"), status=payload.get("status") or "done",
+                            pairs=int(payload.get("pairs") or 0), summary=payload.get("summary"),
+                        ))
+                if pending:
+                    rows += insert_events(c, prepare_rows(pending))
+                _fold_rollups(c)
+                if started:
+                    _fold_rollups(c, started)
+        except Exception as exc:
+            self._attempts += 1
+            with self._cond:
+                self._m["errors"] += 1
+            if self._attempts < MAX_ATTEMPTS:
+                _LOG.warning("event archive batch write failed (attempt %d): %s", self._attempts, exc)
+                return 0
+            _LOG.warning("event archive batch write failed; dropped %d queued op(s): %s", len(batch), exc)
+            self._journal_hold(batch)
+            self._done(len(batch), dropped=True)
+            return 0
+        ms = (time.perf_counter() - t0) * 1000.0
+        self._done(len(batch), rows=rows, ms=ms)
+        return len(batch)
+
+    def _done(self, n: int, *, rows: int = 0, ms: float = 0.0, dropped: bool = False) -> None:
+        with self._cond:
+            for _ in range(min(n, len(self._queue))):
+                self._queue.popleft()
+            if dropped:
+                self._m["dropped"] += n
+            else:
+                self._m["flushes"] += 1
+                self._m["rows"] += rows
+                self._m["last_flush_ms"] = ms
+                self._m["total_flush_ms"] += ms
+                self._m["max_flush_ms"] = max(self._m["max_flush_ms"], ms)
+        self._journal_compact()
+        with self._cond:
+            self._applied += n
+            self._attempts = 0
+            self._cond.notify_all()
+
+    def _connection(self) -> sqlite3.Connection | None:
+        if self._conn is not None:
+            return self._conn
+        want = str(events_db_path())
+        if self._own_conn is not None and self._own_path == want and Path(want).exists():
+            return self._own_conn
+        if self._own_conn is not None:
+            try:
+                self._own_conn.close()
+            except Exception:
+                pass
+            self._own_conn = None
+        try:
+            self._own_conn = connect(want)
+            self._own_path = want
+        except Exception as exc:
+            _LOG.warning("event archive writer cannot open %s: %s", want, exc)
+            self._own_conn = None
+        return self._own_conn
+
+    # journal
+
+    def _journal_file(self) -> TextIO | None:
+        if self._journal_path is None:
+            return None
+        if self._journal is None:
+            try:
+                self._journal_path.parent.mkdir(parents=True, exist_ok=True)
+                self._journal = open(self._journal_path, "a+", encoding="utf-8")
+            except Exception as exc:
+                _LOG.warning("event archive journal unavailable: %s", exc)
+                self._journal_path = None
+                return None
+        return self._journal
+
+    @staticmethod
+    def _journal_line(op: str, payload: Any) -> str:
+        return json.dumps([op, payload], ensure_ascii=False, separators=(",", ":"), default=json_default) + "\n"
+
+    def _journal_pending(self) -> None:
+        with self._journal_lock:
+            with self._cond:
+                ops, self._to_journal = self._to_journal, []
+            if not ops:
+                return
+            f = self._journal_file()
+            if f is None:
+                return
+            try:
+                f.write("".join(self._journal_line(op, payload) for op, payload in ops))
+                f.flush()
+                os.fsync(f.fileno())
+                self._journal_lines += len(ops)
+            except Exception as exc:
+                _LOG.debug("event archive journal append failed: %s", exc)
+
+    def _journal_hold(self, batch: list[tuple[float, str, Any]]) -> None:
+        # Dropped ops leave the queue, so the next compaction would cut them
+        # from the journal; park them where only a replay picks them up.
+        p = self._journal_path
+        if p is None or not batch:
+            return
+        with self._journal_lock:
+            try:
+                with open(_held_path(p), "a", encoding="utf-8") as f:
+                    f.write("".join(self._journal_line(op, payload) for _ts, op, payload in batch))
+                    f.flush()
+                    os.fsync(f.fileno())
+            except Exception as exc:
+                _LOG.warning("event archive could not keep %d dropped op(s) for replay: %s", len(batch), exc)
+
+    def _journal_rewrite(self, ops: list[tuple[str, Any]]) -> None:
+        # Caller holds _journal_lock. Ops still queued are written to a side
+        # file and swapped in, so a crash mid-rewrite keeps the old journal.
+        p = self._journal_path
+        if p is None:
+            return
+        if not ops:
+            f = self._journal_file()
+            if f is None:
+                return
+            f.seek(0)
+            f.truncate()
+            f.flush()
+            os.fsync(f.fileno())
+            self._journal_lines = 0
+            return
+        tmp = p.with_name(p.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("".join(self._journal_line(op, payload) for op, payload in ops))
+            f.flush()
+            os.fsync(f.fileno())
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        os.replace(tmp, p)
+        self._journal_lines = len(ops)
+
+    def _journal_compact(self) -> None:
+        # Called after every commit or drop. An empty queue truncates the
+        # journal; otherwise it is rewritten once applied lines dominate it.
+        with self._journal_lock:
+            with self._cond:
+                if self._queue and self._journal_lines < max(JOURNAL_BATCH, 4 * len(self._queue)):
+                    return
+                # Ops not yet journaled are part of the rewrite.
+                pending = [(op, payload) for _ts, op, payload in self._queue]
+                self._to_journal = []
+            try:
+                self._journal_rewrite(pending)
+            except Exception as exc:
+                _LOG.debug("event archive journal compaction failed: %s", exc)
+
+    @staticmethod
+    def _read_journal(p: Path) -> list[tuple[str, Any]]:
+        ops: list[tuple[str, Any]] = []
+        with open(p, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    op, payload = json.loads(line)
+                except Exception:
+                    continue
+                if op in ("events", "run_started", "run_finished") and isinstance(payload, dict):
+                    ops.append((op, payload))
+        return ops
+
+    def _replay(self) -> None:
+        p = self._journal_path
+        if p is None:
+            return
+        held = _held_path(p)
+        try:
+            ops = self._read_journal(held) if held.exists() else []
+            n_held = len(ops)
+            if p.exists():
+                ops.extend(self._read_journal(p))
+        except Exception as exc:
+            _LOG.warning("event archive journal replay failed: %s", exc)
+            return
+        if held.exists():
+            # Fold held ops back into the journal before the held file goes away.
+            try:
+                with self._journal_lock:
+                    self._journal_rewrite(ops)
+                held.unlink()
+            except Exception as exc:
+                _LOG.warning("event archive could not merge held ops into the journal: %s", exc)
+                return
+        if not ops:
+            return
+        now = time.monotonic()
+        self._queue.extend((now, op, payload) for op, payload in ops)
+        n = len(ops)
+        self._submitted += n
+        self._journal_lines = n
+        self._m["replayed"] += n
+        _LOG.info("event archive: replaying %d journaled op(s), %d from failed batches", n, n_held)
+        self._ensure_thread()
+
+
+_DEFAULT: EventWriter | None = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_writer() -> EventWriter:
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            _DEFAULT = EventWriter()
+        return _DEFAULT
+
+
+def recover() -> int:
+    """Start the shared writer when a journal from a previous process is waiting."""
+    if _DEFAULT is None and not journal_path().exists() and not _held_path(journal_path()).exists():
+        return 0
+    return int(default_writer().stats()["replayed"])
+
+
+def writer_stats() -> dict[str, Any] | None:
+    w = _DEFAULT
+    return w.stats() if w is not None else None
+
+
+def shutdown(timeout: float = 10.0) -> None:
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        w, _DEFAULT = _DEFAULT, None
+    if w is not None:
+        w.close(timeout=timeout)
+
+
+atexit.register(shutdown)
@@ -0,0 +1,455 @@
+# cw_platform/http_metrics.py
+# Streaming per-endpoint HTTP latency histograms for provider sessions.
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import atexit
+import math
+import re
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+__all__ = [
+    "LatencyHistogram",
+    "HttpMetrics",
+    "METRICS",
+    "route_template",
+    "status_class",
+    "instrument_session",
+    "record",
+    "note_retry",
+    "enable_persistence",
+    "summary",
+]
+
+_STEPS_PER_DOUBLING = 4
+_MAX_BUCKET = _STEPS_PER_DOUBLING * 21
+_MEMORY_MINUTES = 180
+_MAX_SERIES = 20_000
+
+_HOST_PROVIDERS: dict[str, str] = {
+    "api.trakt.tv": "TRAKT",
+    "api.simkl.com": "SIMKL",
+    "api.themoviedb.org": "TMDB",
+    "api.mdblist.com": "MDBLIST",
+    "mdblist.com": "MDBLIST",
+    "graphql.anilist.co": "ANILIST",
+    "plex.tv": "PLEX",
+    "discover.provider.plex.tv": "PLEX",
+    "metadata.provider.plex.tv": "PLEX",
+    "api.punchplay.tv": "PUNCHPLAY",
+}
+
+_ID_SEGMENT = re.compile(
+    r"^(?:\d+|tt\d+|[0-9a-f]{16,}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[A-Za-z0-9_-]{24,})$",
+    re.IGNORECASE,
+)
+
+
+def _bucket(ms: float) -> int:
+    if ms < 1.0:
+        return 0
+    return min(_MAX_BUCKET, int(math.log2(ms) * _STEPS_PER_DOUBLING) + 1)
+
+
+def _bucket_upper(b: int) -> float:
+    return 1.0 if b <= 0 else 2.0 ** (b / _STEPS_PER_DOUBLING)
+
+
+class LatencyHistogram:
+    __slots__ = ("counts", "n", "sum_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.n = 0
+        self.sum_ms = 0
+        self.max_ms = 0
+
+    def add(self, ms: float) -> None:
+        b = _bucket(ms)
+        self.counts[b] = self.counts.get(b, 0) + 1
+        self.n += 1
+        self.sum_ms += int(ms)
+        if ms > self.max_ms:
+            self.max_ms = int(ms)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for b, c in other.counts.items():
+            self.counts[b] = self.counts.get(b, 0) + c
+        self.n += other.n
+        self.sum_ms += other.sum_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+
+    def quantile(self, q: float) -> int | None:
+        if self.n <= 0:
+            return None
+        rank = max(1, math.ceil(self.n * min(max(q, 0.0), 1.0)))
+        seen = 0
+        for b in sorted(self.counts):
+            seen += self.counts[b]
+            if seen >= rank:
+                return int(round(min(_bucket_upper(b), float(self.max_ms or _bucket_upper(b)))))
+        return self.max_ms
+
+    def encode(self) -> str:
+        return ",".join(f"{b}:{c}" for b, c in sorted(self.counts.items()))
+
+    @classmethod
+    def decode(cls, raw: str | None, *, n: int = 0, sum_ms: int = 0, max_ms: int = 0) -> "LatencyHistogram":
+        h = cls()
+        for part in str(raw or "").split(","):
+            b, _, c = part.partition(":")
+            try:
+                h.counts[int(b)] = h.counts.get(int(b), 0) + int(c)
+            except ValueError:
+                continue
+        h.n = int(n or sum(h.counts.values()))
+        h.sum_ms = int(sum_ms or 0)
+        h.max_ms = int(max_ms or 0)
+        return h
+
+
+class _Series:
+    __slots__ = ("hist", "errors", "retries", "bytes_in", "bytes_out")
+
+    def __init__(self) -> None:
+        self.hist = LatencyHistogram()
+        self.errors = 0
+        self.retries = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def merge_row(self, row: Mapping[str, Any]) -> None:
+        self.hist.merge(
+            LatencyHistogram.decode(
+                row.get("buckets"),
+                n=int(row.get("count") or 0),
+                sum_ms=int(row.get("ms_sum") or 0),
+                max_ms=int(row.get("ms_max") or 0),
+            )
+        )
+        self.errors += int(row.get("errors") or 0)
+        self.retries += int(row.get("retries") or 0)
+        self.bytes_in += int(row.get("bytes_in") or 0)
+        self.bytes_out += int(row.get("bytes_out") or 0)
+
+
+_Key = tuple[int, str, str, str, str, str]
+
+
+def route_template(url: str) -> str:
+    try:
+        path = urlsplit(str(url or "")).path or "/"
+    except Exception:
+        return "/"
+    segs = path.split("/")
+    # Leading version segments like TMDB's "/3/" are part of the route, not an id.
+    parts = [seg if (i == 1 and len(seg) == 1) or not _ID_SEGMENT.match(seg) else ":id" for i, seg in enumerate(segs)]
+    out = "/".join(parts) or "/"
+    return out[:160]
+
+
+def status_class(status: int | None) -> str:
+    try:
+        s = int(status or 0)
+    except Exception:
+        s = 0
+    return f"{s // 100}xx" if 100 <= s < 600 else "err"
+
+
+def _provider_for(url: str, fallback: str) -> str:
+    try:
+        host = (urlsplit(str(url or "")).hostname or "").lower()
+    except Exception:
+        host = ""
+    return _HOST_PROVIDERS.get(host) or str(fallback or "UNKNOWN").upper()
+
+
+class HttpMetrics:
+    def __init__(self, *, flush_interval: float = 60.0, retention_days: int = 14) -> None:
+        self.flush_interval = float(flush_interval)
+        self.retention_days = int(retention_days)
+        self._lock = threading.Lock()
+        self._series: dict[_Key, _Series] = {}
+        self._base_path: Path | None = None
+        self._persist = False
+        self._flusher: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def record(
+        self,
+        provider: str,
+        *,
+        method: str,
+        url: str | None = None,
+        route: str | None = None,
+        status: int | None = None,
+        ms: float = 0.0,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        retries: int = 0,
+        instance: str | None = None,
+        ts: float | None = None,
+    ) -> None:
+        key: _Key = (
+            int((ts if ts is not None else time.time()) // 60),
+            str(provider or "UNKNOWN").upper(),
+            str(instance or "default"),
+            str(method or "GET").upper(),
+            route or route_template(url or ""),
+            status_class(status),
+        )
+        with self._lock:
+            s = self._series.get(key)
+            if s is None:
+                if len(self._series) >= _MAX_SERIES:
+                    self._evict_locked()
+                s = self._series[key] = _Series()
+            s.hist.add(max(0.0, float(ms or 0.0)))
+            if key[5] in ("5xx", "err") or key[5] == "4xx" and int(status or 0) == 429:
+                s.errors += 1
+            s.retries += int(retries or 0)
+            s.bytes_in += int(bytes_in or 0)
+            s.bytes_out += int(bytes_out or 0)
+
+    def note_retry(self, provider: str, *, method: str, url: str, status: int | None, instance: str | None = None) -> None:
+        key: _Key = (
+            int(time.time() // 60),
+            str(provider or "UNKNOWN").upper(),
+            str(instance or "default"),
+            str(method or "GET").upper(),
+            route_template(url),
+            status_class(status),
+        )
+        with self._lock:
+            s = self._series.get(key)
+            if s is None:
+                if len(self._series) >= _MAX_SERIES:
+                    self._evict_locked()
+                s = self._series[key] = _Series()
+            s.retries += 1
+
+    def recent_requests(self, *, within: float = 60.0) -> dict[str, int]:
+        since = int((time.time() - max(1.0, float(within))) // 60)
+        out: dict[str, int] = {}
+        with self._lock:
+            for k, s in self._series.items():
+                if k[0] >= since:
+                    out[k[1]] = out.get(k[1], 0) + s.hist.n
+        return out
+
+    def _evict_locked(self) -> None:
+        oldest = min(k[0] for k in self._series)
+        for k in [k for k in self._series if k[0] == oldest]:
+            self._series.pop(k, None)
+
+    def _take(self, *, include_current: bool) -> dict[_Key, _Series]:
+        now_minute = int(time.time() // 60)
+        with self._lock:
+            keys = [k for k in self._series if include_current or k[0] < now_minute]
+            return {k: self._series.pop(k) for k in keys}
+
+    def flush(self, *, include_current: bool = False) -> int:
+        if not self._persist:
+            cutoff = int(time.time() // 60) - _MEMORY_MINUTES
+            with self._lock:
+                for k in [k for k in self._series if k[0] < cutoff]:
+                    self._series.pop(k, None)
+            return 0
+        taken = self._take(include_current=include_current)
+        if not taken:
+            return 0
+        rows = [_row(k, s) for k, s in taken.items()]
+        try:
+            from .local_db.http_latency import merge_http_latency, prune_http_latency
+
+            merge_http_latency(self._base_path, rows)
+            prune_http_latency(self._base_path, before_minute=int(time.time() // 60) - self.retention_days * 1440)
+        except Exception:
+            with self._lock:
+                for k, s in taken.items():
+                    cur = self._series.setdefault(k, _Series())
+                    cur.merge_row(_row(k, s))
+            return 0
+        return len(rows)
+
+    def enable_persistence(self, base_path: str | Path | None = None, *, background: bool = True) -> None:
+        self._base_path = Path(base_path) if base_path is not None else None
+        if self._persist:
+            return
+        self._persist = True
+        atexit.register(self.flush, include_current=True)
+        if background and self._flusher is None:
+            self._flusher = threading.Thread(target=self._run_flusher, name="cw-http-metrics", daemon=True)
+            self._flusher.start()
+
+    def _run_flusher(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                pass
+
+    def rows(
+        self,
+        *,
+        minutes: int = 60,
+        provider: str | None = None,
+        instance: str | None = None,
+    ) -> list[dict[str, Any]]:
+        since = int(time.time() // 60) - max(1, int(minutes)) + 1
+        prov = str(provider or "").upper() or None
+        out: list[dict[str, Any]] = []
+        if self._persist:
+            try:
+                from .local_db.http_latency import load_http_latency
+
+                out.extend(load_http_latency(self._base_path, since_minute=since, provider=prov, instance=instance))
+            except Exception:
+                pass
+        with self._lock:
+            snap = [(k, s) for k, s in self._series.items() if k[0] >= since]
+        for k, s in snap:
+            if prov and k[1] != prov:
+                continue
+            if instance and k[2] != instance:
+                continue
+            out.append(_row(k, s))
+        return out
+
+
+def _row(key: _Key, s: _Series) -> dict[str, Any]:
+    return {
+        "minute": key[0],
+        "provider": key[1],
+        "instance": key[2],
+        "method": key[3],
+        "route": key[4],
+        "status_class": key[5],
+        "count": s.hist.n,
+        "errors": s.errors,
+        "retries": s.retries,
+        "bytes_in": s.bytes_in,
+        "bytes_out": s.bytes_out,
+        "ms_sum": s.hist.sum_ms,
+        "ms_max": s.hist.max_ms,
+        "buckets": s.hist.encode(),
+    }
+
+
+def summarize(rows: Iterable[Mapping[str, Any]], *, by_minute: bool = False) -> list[dict[str, Any]]:
+    groups: dict[tuple[Any, ...], _Series] = {}
+    for row in rows:
+        key: tuple[Any, ...] = (row.get("provider"), row.get("instance"), row.get("method"), row.get("route"), row.get("status_class"))
+        if by_minute:
+            key = (int(row.get("minute") or 0),) + key
+        groups.setdefault(key, _Series()).merge_row(row)
+    out: list[dict[str, Any]] = []
+    for key, s in groups.items():
+        base = dict(zip(("provider", "instance", "method", "route", "status_class"), key[-5:]))
+        if by_minute:
+            base["minute"] = key[0]
+            base["ts"] = key[0] * 60
+        n = s.hist.n
+        base.update(
+            {
+                "count": n,
+                "errors": s.errors,
+                "retries": s.retries,
+                "bytes_in": s.bytes_in,
+                "bytes_out": s.bytes_out,
+                "avg_ms": int(s.hist.sum_ms / n) if n else None,
+                "p50_ms": s.hist.quantile(0.50),
+                "p95_ms": s.hist.quantile(0.95),
+                "p99_ms": s.hist.quantile(0.99),
+                "max_ms": s.hist.max_ms if n else None,
+            }
+        )
+        out.append(base)
+    if by_minute:
+        out.sort(key=lambda r: (r["minute"], r["provider"], r["route"]))
+    else:
+        out.sort(key=lambda r: (-int(r["count"] or 0), r["provider"], r["route"]))
+    return out
+
+
+METRICS = HttpMetrics()
+
+
+def record(provider: str, **kw: Any) -> None:
+    try:
+        METRICS.record(provider, **kw)
+    except Exception:
+        pass
+
+
+def note_retry(session: Any, method: str, url: str, status: int | None = None) -> None:
+    meta = getattr(session, "_cw_http_metrics", None)
+    if not meta:
+        return
+    try:
+        METRICS.note_retry(_provider_for(url, meta[0]), method=method, url=url, status=status, instance=meta[1])
+    except Exception:
+        pass
+
+
+def enable_persistence(base_path: str | Path | None = None, *, background: bool = True) -> None:
+    METRICS.enable_persistence(base_path, background=background)
+
+
+def summary(*, minutes: int = 60, provider: str | None = None, instance: str | None = None, by_minute: bool = False) -> list[dict[str, Any]]:
+    return summarize(METRICS.rows(minutes=minutes, provider=provider, instance=instance), by_minute=by_minute)
+
+
+def _body_len(body: Any) -> int:
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode("utf-8", "ignore"))
+    return 0
+
+
+def observe_response(resp: Any, provider: str, instance: str | None = None) -> None:
+    try:
+        req = getattr(resp, "request", None)
+        url = str(getattr(req, "url", None) or getattr(resp, "url", "") or "")
+        elapsed = getattr(resp, "elapsed", None)
+        ms = elapsed.total_seconds() * 1000.0 if elapsed is not None else 0.0
+        try:
+            bytes_in = int((resp.headers or {}).get("Content-Length") or 0)
+        except Exception:
+            bytes_in = 0
+        METRICS.record(
+            _provider_for(url, provider),
+            method=str(getattr(req, "method", None) or "GET"),
+            url=url,
+            status=getattr(resp, "status_code", None),
+            ms=ms,
+            bytes_in=bytes_in,
+            bytes_out=_body_len(getattr(req, "body", None)),
+            instance=instance,
+        )
+    except Exception:
+        pass
+
+
+def instrument_session(session: Any, provider: str, instance: str | None = None) -> Any:
+    if getattr(session, "_cw_http_metrics", None):
+        session._cw_http_metrics = (str(provider).upper(), instance)
+        return session
+    session._cw_http_metrics = (str(provider).upper(), instance)
+
+    def _hook(resp: Any, *args: Any, **kwargs: Any) -> Any:
+        meta = getattr(session, "_cw_http_metrics", None) or (provider, instance)
+        observe_response(resp, meta[0], meta[1])
+        return resp
+
+    try:
+        session.hooks.setdefault("response", []).append(_hook)
+    except Exception:
+        pass
+    return session
@@ -9,6 +9,8 @@ from collections.abc import Iterable, Mapping
 from itertools import chain
 from typing import Any
 
+from .compact_item import CompactItem
+
 # Policy
 ID_KEYS: tuple[str, ...] = (
     "tmdb",
@@ -187,15 +189,38 @@ def coalesce_ids(*many: Mapping[str, Any]) -> dict[str, str]:
         if not isinstance(ids, Mapping):
             continue
         for k in ID_KEYS:
-            n = _normalize_id(k, ids.get(k))
+            v = ids.get(k)
+            if v is None:
+                continue
+            n = _normalize_id(k, v)
             if n:
                 out[k] = n
     return out
 
 
 def ids_from(item: Mapping[str, Any]) -> dict[str, str]:
+    if type(item) is CompactItem:
+        cached = item.norm_ids
+        if cached is None:
+            # One dict copy keeps the many lookups below at C speed.
+            cached = _cache_ids(item, _ids_from(item.to_dict()))
+        return dict(cached)
+    return _ids_from(item)
+
+
+def _cache_ids(item: CompactItem, ids: dict[str, str]) -> CompactItem:
+    raw = item.get("ids")
+    # Most stored ids are already normalized; share them instead of keeping a second copy.
+    if isinstance(raw, CompactItem) and tuple(raw.items()) == tuple(ids.items()):
+        item.norm_ids = raw
+    else:
+        item.norm_ids = CompactItem(ids)
+    return item.norm_ids
+
+
+def _ids_from(item: Mapping[str, Any]) -> dict[str, str]:
     base = item.get("ids") if isinstance(item.get("ids"), Mapping) else {}
-    top = {k: item.get(k) for k in ID_KEYS if item.get(k) is not None}
+    top = {k: v for k in ID_KEYS if (v := item.get(k)) is not None}
     guid_val = item.get("guid") or (base.get("guid") if isinstance(base, Mapping) else None)
     from_guid = ids_from_guid(str(guid_val)) if guid_val else {}
     return coalesce_ids(top, base or {}, from_guid)
@@ -273,6 +298,15 @@ def _se_fragment(item: Mapping[str, Any]) -> str | None:
 
 
 def canonical_key(item: Mapping[str, Any]) -> str:
+    # Capture mode changes the preferred key per run, so only cache outside it.
+    if type(item) is CompactItem and _capture_prefer_id_key() is None:
+        if item.ckey is None:
+            item.ckey = _canonical_key(item.to_dict())
+        return item.ckey
+    return _canonical_key(item)
+
+
+def _canonical_key(item: Mapping[str, Any]) -> str:
     typ = _norm_type(item.get("type"))
     if typ in ("season", "episode"):
         show_id = _show_id_from(item)
@@ -374,7 +408,8 @@ def minimal(item: Mapping[str, Any]) -> dict[str, Any]:
         "_cw_anime_map",
     ):
         if opt in item and item.get(opt) not in (None, ""):
-            out[opt] = item.get(opt)
+            v = item.get(opt)
+            out[opt] = v.to_dict() if isinstance(v, CompactItem) else v
 
     abs_raw = item.get("_trakt_number_abs")
     if isinstance(abs_raw, (int, str)) and str(abs_raw).strip():
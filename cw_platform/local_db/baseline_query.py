@@ -0,0 +1,314 @@
+# cw_platform/local_db/baseline_query.py
+# CrossWatch - Filtered, paginated reads over baseline_items
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import base64
+import json
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from .db import get_conn
+from .schema import ID_KEYS
+from .state import _LOCK, _row_to_item
+
+# Orders a query can walk; "key" groups rows by feature block, then item key.
+ORDERS = ("key", "watched_at", "rated_at", "progress_at", "updated_at")
+GROUP_COLUMNS = {
+    "provider": "p.provider",
+    "instance": "p.instance",
+    "feature": "p.feature",
+    "media_type": "b.media_type",
+}
+
+_SELECT = (
+    "SELECT p.provider AS q_provider,p.instance AS q_instance,p.feature AS q_feature,b.* "
+    "FROM baseline_items b JOIN provider_feature_state p ON p.id=b.provider_state_id"
+)
+
+
+def _values(value: str | Iterable[str] | None, case: str | None = None) -> list[str]:
+    if value is None:
+        return []
+    raw = [value] if isinstance(value, str) else list(value)
+    out = [str(v or "").strip() for v in raw]
+    if case == "upper":
+        return [v.upper() for v in out if v]
+    if case == "lower":
+        return [v.lower() for v in out if v]
+    return [v for v in out if v]
+
+
+def _in(column: str, values: list[str], where: list[str], params: list[Any]) -> None:
+    if len(values) == 1:
+        where.append(f"{column}=?")
+    else:
+        where.append(f"{column} IN ({','.join('?' for _ in values)})")
+    params.extend(values)
+
+
+def _filters(
+    *,
+    provider: str | Iterable[str] | None,
+    instance: str | Iterable[str] | None,
+    feature: str | Iterable[str] | None,
+    media_type: str | Iterable[str] | None,
+    id_token: str | None,
+) -> tuple[list[str], list[Any]]:
+    where: list[str] = []
+    params: list[Any] = []
+    for column, values in (
+        ("p.provider", _values(provider, "upper")),
+        ("p.instance", _values(instance)),
+        ("p.feature", _values(feature, "lower")),
+        ("b.media_type", _values(media_type)),
+    ):
+        if values:
+            _in(column, values, where, params)
+    if id_token:
+        ns, _, value = str(id_token).partition(":")
+        ns = ns.strip().lower()
+        if ns not in ID_KEYS or not value.strip():
+            raise ValueError(f"unsupported id token: {id_token!r}")
+        where.append(f"b.ids_{ns}=?")
+        params.append(value.strip())
+    return where, params
+
+
+def _order(order: str) -> str:
+    key = str(order or "key").strip().lower()
+    if key not in ORDERS:
+        raise ValueError(f"unsupported order: {order!r}")
+    return key
+
+
+def encode_cursor(values: tuple[Any, Any]) -> str:
+    raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any, Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        first, second = json.loads(raw)
+    except Exception as exc:
+        raise ValueError("invalid cursor") from exc
+    return first, second
+
+
+def _page_rows(
+    conn: sqlite3.Connection,
+    where: list[str],
+    params: list[Any],
+    *,
+    order: str,
+    descending: bool,
+    since: Any,
+    until: Any,
+    after: tuple[Any, Any] | None,
+    limit: int,
+) -> list[sqlite3.Row]:
+    clauses = list(where)
+    args = list(params)
+    cmp = "<" if descending else ">"
+    direction = "DESC" if descending else "ASC"
+    if order == "key":
+        seek = ("b.provider_state_id", "b.item_key")
+    else:
+        column = f"b.{order}"
+        clauses.append(f"{column} IS NOT NULL")
+        if since is not None:
+            clauses.append(f"{column}>=?")
+            args.append(since)
+        if until is not None:
+            clauses.append(f"{column}<?")
+            args.append(until)
+        seek = (column, "b.id")
+    if after is not None:
+        clauses.append(f"({seek[0]},{seek[1]}){cmp}(?,?)")
+        args.extend(after)
+    sql = _SELECT
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += f" ORDER BY {seek[0]} {direction},{seek[1]} {direction} LIMIT ?"
+    args.append(int(limit))
+    return conn.execute(sql, args).fetchall()
+
+
+def _seek_value(row: sqlite3.Row, order: str) -> tuple[Any, Any]:
+    if order == "key":
+        return int(row["provider_state_id"]), str(row["item_key"])
+    return row[order], int(row["id"])
+
+
+def _out(row: sqlite3.Row) -> dict[str, Any]:
+    return {
+        "provider": str(row["q_provider"] or "").upper(),
+        "instance": str(row["q_instance"] or "default"),
+        "feature": str(row["q_feature"] or "").lower(),
+        "key": str(row["item_key"]),
+        "item": _row_to_item(row),
+    }
+
+
+def page_items(
+    base_path: str | Path | None,
+    *,
+    provider: str | Iterable[str] | None = None,
+    instance: str | Iterable[str] | None = None,
+    feature: str | Iterable[str] | None = None,
+    media_type: str | Iterable[str] | None = None,
+    id_token: str | None = None,
+    order: str = "key",
+    descending: bool = False,
+    since: Any = None,
+    until: Any = None,
+    cursor: str | None = None,
+    limit: int = 100,
+) -> dict[str, Any]:
+    """One page of baseline rows plus an opaque ``next_cursor`` (None on the last page).
+
+    Pass the cursor back with the same filters and order to continue. Timestamp
+    orders skip rows without that timestamp; ``since``/``until`` bound it.
+    """
+    key = _order(order)
+    where, params = _filters(provider=provider, instance=instance, feature=feature, media_type=media_type, id_token=id_token)
+    size = max(1, int(limit or 100))
+    after = decode_cursor(cursor) if cursor else None
+    with _LOCK:
+        conn = get_conn(base_path)
+        if conn is None:
+            return {"items": [], "next_cursor": None}
+        rows = _page_rows(
+            conn,
+            where,
+            params,
+            order=key,
+            descending=descending,
+            since=since,
+            until=until,
+            after=after,
+            limit=size + 1,
+        )
+    more = len(rows) > size
+    rows = rows[:size]
+    return {
+        "items": [_out(row) for row in rows],
+        "next_cursor": encode_cursor(_seek_value(rows[-1], key)) if more and rows else None,
+    }
+
+
+def iter_items(
+    base_path: str | Path | None,
+    *,
+    provider: str | Iterable[str] | None = None,
+    instance: str | Iterable[str] | None = None,
+    feature: str | Iterable[str] | None = None,
+    media_type: str | Iterable[str] | None = None,
+    id_token: str | None = None,
+    order: str = "key",
+    descending: bool = False,
+    since: Any = None,
+    until: Any = None,
+    batch_size: int = 500,
+) -> Iterator[dict[str, Any]]:
+    """Stream matching rows in keyset batches; nothing is held open between batches.
+
+    Each batch is read under the state lock, so it never sees a half-applied save,
+    but a save may commit between batches. Callers that need one consistent walk
+    hold ``state._LOCK`` around the whole iteration (see ``load_feature_items``).
+    """
+    key = _order(order)
+    where, params = _filters(provider=provider, instance=instance, feature=feature, media_type=media_type, id_token=id_token)
+    size = max(1, int(batch_size or 500))
+    after: tuple[Any, Any] | None = None
+    while True:
+        with _LOCK:
+            conn = get_conn(base_path)
+            if conn is None:
+                return
+            rows = _page_rows(
+                conn,
+                where,
+                params,
+                order=key,
+                descending=descending,
+                since=since,
+                until=until,
+                after=after,
+                limit=size,
+            )
+        for row in rows:
+            yield _out(row)
+        if len(rows) < size:
+            return
+        after = _seek_value(rows[-1], key)
+
+
+def newest_items(
+    base_path: str | Path | None,
+    feature: str,
+    *,
+    order: str = "watched_at",
+    limit: int = 10,
+    **filters: Any,
+) -> list[dict[str, Any]]:
+    return page_items(base_path, feature=feature, order=order, descending=True, limit=limit, **filters)["items"]
+
+
+def count_items(
+    base_path: str | Path | None,
+    *,
+    provider: str | Iterable[str] | None = None,
+    instance: str | Iterable[str] | None = None,
+    feature: str | Iterable[str] | None = None,
+    media_type: str | Iterable[str] | None = None,
+    id_token: str | None = None,
+) -> int:
+    where, params = _filters(provider=provider, instance=instance, feature=feature, media_type=media_type, id_token=id_token)
+    sql = "SELECT COUNT(*) FROM baseline_items b JOIN provider_feature_state p ON p.id=b.provider_state_id"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    with _LOCK:
+        conn = get_conn(base_path)
+        if conn is None:
+            return 0
+        row = conn.execute(sql, params).fetchone()
+    return int(row[0] or 0) if row else 0
+
+
+def count_by(
+    base_path: str | Path | None,
+    group_by: Iterable[str] = ("provider", "instance", "feature"),
+    *,
+    span: str | None = None,
+    provider: str | Iterable[str] | None = None,
+    instance: str | Iterable[str] | None = None,
+    feature: str | Iterable[str] | None = None,
+    media_type: str | Iterable[str] | None = None,
+    id_token: str | None = None,
+) -> list[dict[str, Any]]:
+    """Row counts per group; ``span`` adds the oldest/newest value of one timestamp column."""
+    groups = [str(g).strip().lower() for g in group_by]
+    unknown = [g for g in groups if g not in GROUP_COLUMNS]
+    if unknown or not groups:
+        raise ValueError(f"unsupported group_by: {unknown or groups!r}")
+    span_col = _order(span) if span else None
+    if span_col == "key":
+        raise ValueError("span needs a timestamp column")
+    where, params = _filters(provider=provider, instance=instance, feature=feature, media_type=media_type, id_token=id_token)
+    cols = ",".join(f"{GROUP_COLUMNS[g]} AS {g}" for g in groups)
+    sql = f"SELECT {cols},COUNT(*) AS count"
+    if span_col:
+        sql += f",MIN(b.{span_col}) AS oldest,MAX(b.{span_col}) AS newest"
+    sql += " FROM baseline_items b JOIN provider_feature_state p ON p.id=b.provider_state_id"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += f" GROUP BY {','.join(GROUP_COLUMNS[g] for g in groups)} ORDER BY {','.join(GROUP_COLUMNS[g] for g in groups)}"
+    with _LOCK:
+        conn = get_conn(base_path)
+        if conn is None:
+            return []
+        return [dict(row) for row in conn.execute(sql, params).fetchall()]
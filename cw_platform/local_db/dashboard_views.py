@@ -0,0 +1,223 @@
+# cw_platform/local_db/dashboard_views.py
+# CrossWatch - SQLite-backed top-K dashboard widget views
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from .db import get_conn
+
+# Bump when the stored row shape changes; every view is then rebuilt once.
+VIEW_SCHEMA = 1
+VIEW_DEPTH = 64
+WIDGETS = ("history", "ratings", "progress")
+
+_SCHEMA_KEY = "dashboard_views_schema"
+_VERSION_KEY = "dashboard_views_version"
+
+
+def _now() -> int:
+    return int(time.time_ns())
+
+
+def _meta_int(conn: sqlite3.Connection, key: str) -> int | None:
+    row = conn.execute("SELECT value_int FROM local_meta WHERE key=?", (key,)).fetchone()
+    return int(row["value_int"]) if row is not None and row["value_int"] is not None else None
+
+
+def _set_meta_int(conn: sqlite3.Connection, key: str, value: int, ts: int) -> None:
+    conn.execute(
+        "INSERT INTO local_meta(key,value_int,value_type,updated_at) VALUES(?,?,'int',?) "
+        "ON CONFLICT(key) DO UPDATE SET value_int=excluded.value_int,value_text=NULL,value_real=NULL,"
+        "value_type='int',updated_at=excluded.updated_at",
+        (key, int(value), ts),
+    )
+
+
+def touch(conn: sqlite3.Connection, widget: str, origin: str, provider: str, instance: str = "default") -> None:
+    """Mark one view segment stale; runs inside the caller's transaction."""
+    if widget not in WIDGETS:
+        return
+    ts = _now()
+    conn.execute(
+        "INSERT INTO dashboard_view_segments(widget,origin,provider,instance,source_version,updated_at) "
+        "VALUES(?,?,?,?,?,?) ON CONFLICT(widget,origin,provider,instance) DO UPDATE SET "
+        "source_version=excluded.source_version,updated_at=excluded.updated_at",
+        (widget, origin, provider, instance or "default", str(ts), ts),
+    )
+
+
+def touch_origin(conn: sqlite3.Connection, origin: str) -> None:
+    ts = _now()
+    conn.execute(
+        "UPDATE dashboard_view_segments SET source_version=?,updated_at=? WHERE origin=?",
+        (str(ts), ts, origin),
+    )
+
+
+def ensure_schema(base_path: str | Path | None) -> bool:
+    """Drop and reschedule every view when the stored schema is outdated."""
+    conn = get_conn(base_path)
+    if conn is None:
+        return False
+    if _meta_int(conn, _SCHEMA_KEY) == VIEW_SCHEMA:
+        return False
+    placeholders = ",".join("?" for _ in WIDGETS)
+    with conn:
+        conn.execute("DELETE FROM dashboard_view_segments")
+        rows = conn.execute(
+            f"SELECT provider,instance,feature FROM provider_feature_state WHERE feature IN ({placeholders})",
+            WIDGETS,
+        ).fetchall()
+        for row in rows:
+            touch(conn, str(row["feature"]), "state", str(row["provider"]), str(row["instance"] or "default"))
+        _set_meta_int(conn, _SCHEMA_KEY, VIEW_SCHEMA, _now())
+    return True
+
+
+def stale_segments(base_path: str | Path | None, origin: str | None = None) -> list[dict[str, Any]]:
+    conn = get_conn(base_path)
+    if conn is None:
+        return []
+    sql = (
+        "SELECT widget,origin,provider,instance,source_version FROM dashboard_view_segments "
+        "WHERE built_version IS NULL OR built_version IS NOT source_version"
+    )
+    params: tuple[Any, ...] = ()
+    if origin:
+        sql += " AND origin=?"
+        params = (origin,)
+    return [dict(row) for row in conn.execute(sql + " ORDER BY id", params).fetchall()]
+
+
+def built_version(base_path: str | Path | None, widget: str, origin: str, provider: str, instance: str = "default") -> str | None:
+    conn = get_conn(base_path)
+    if conn is None:
+        return None
+    row = conn.execute(
+        "SELECT built_version FROM dashboard_view_segments WHERE widget=? AND origin=? AND provider=? AND instance=?",
+        (widget, origin, provider, instance or "default"),
+    ).fetchone()
+    return str(row["built_version"]) if row is not None and row["built_version"] is not None else None
+
+
+def replace_segment(
+    base_path: str | Path | None,
+    widget: str,
+    origin: str,
+    provider: str,
+    instance: str,
+    *,
+    rows: Iterable[tuple[str, str, str, Mapping[str, Any]]],
+    totals: Mapping[tuple[str, str], int],
+    version: str | None,
+) -> bool:
+    """Store the ranked rows of one segment as ``(provider, instance, key, row)``.
+
+    ``rows`` must already be ordered best-first per endpoint; only the first
+    ``VIEW_DEPTH`` of each endpoint are kept. The segment is marked built at
+    ``version`` so a touch that raced the rebuild keeps it stale.
+    """
+    conn = get_conn(base_path)
+    if conn is None:
+        return False
+    ts = _now()
+    ranks: dict[tuple[str, str], int] = {}
+    values: list[tuple[Any, ...]] = []
+    seen: set[tuple[str, str, str]] = set()
+    for prov, inst, key, row in rows:
+        endpoint = (str(prov), str(inst))
+        rank = ranks.get(endpoint, 0)
+        if rank >= VIEW_DEPTH or (endpoint[0], endpoint[1], key) in seen:
+            continue
+        seen.add((endpoint[0], endpoint[1], key))
+        ranks[endpoint] = rank + 1
+        values.append((endpoint[0], endpoint[1], str(key), rank, json.dumps(row, ensure_ascii=False, default=str)))
+    with conn:
+        conn.execute(
+            "INSERT INTO dashboard_view_segments(widget,origin,provider,instance,source_version,built_version,updated_at) "
+            "VALUES(?,?,?,?,?,?,?) ON CONFLICT(widget,origin,provider,instance) DO UPDATE SET "
+            "built_version=excluded.built_version,updated_at=excluded.updated_at",
+            (widget, origin, provider, instance or "default", version, version, ts),
+        )
+        seg = conn.execute(
+            "SELECT id FROM dashboard_view_segments WHERE widget=? AND origin=? AND provider=? AND instance=?",
+            (widget, origin, provider, instance or "default"),
+        ).fetchone()
+        seg_id = int(seg["id"])
+        conn.execute("DELETE FROM dashboard_view_rows WHERE segment_id=?", (seg_id,))
+        conn.execute("DELETE FROM dashboard_view_endpoints WHERE segment_id=?", (seg_id,))
+        if values:
+            conn.executemany(
+                "INSERT INTO dashboard_view_rows(segment_id,provider,instance,row_key,rank,row_json) VALUES(?,?,?,?,?,?)",
+                [(seg_id, *v) for v in values],
+            )
+        if totals:
+            conn.executemany(
+                "INSERT INTO dashboard_view_endpoints(segment_id,provider,instance,total) VALUES(?,?,?,?)",
+                [(seg_id, str(p), str(i), int(n or 0)) for (p, i), n in totals.items()],
+            )
+        _set_meta_int(conn, _VERSION_KEY, (_meta_int(conn, _VERSION_KEY) or 0) + 1, ts)
+    return True
+
+
+def view_version(base_path: str | Path | None) -> int | None:
+    conn = get_conn(base_path)
+    if conn is None:
+        return None
+    return _meta_int(conn, _VERSION_KEY) or 0
+
+
+def load_rows(base_path: str | Path | None, widget: str) -> list[dict[str, Any]] | None:
+    conn = get_conn(base_path)
+    if conn is None:
+        return None
+    rows = conn.execute(
+        "SELECT s.origin AS origin,r.provider AS provider,r.instance AS instance,r.row_key AS row_key,r.row_json AS row_json "
+        "FROM dashboard_view_rows r JOIN dashboard_view_segments s ON s.id=r.segment_id "
+        "WHERE s.widget=? ORDER BY s.origin DESC,s.provider,s.instance<>'default',s.instance,r.provider,r.instance,r.rank",
+        (widget,),
+    ).fetchall()
+    out: list[dict[str, Any]] = []
+    for row in rows:
+        try:
+            data = json.loads(row["row_json"])
+        except Exception:
+            continue
+        if isinstance(data, dict):
+            out.append(
+                {
+                    "origin": str(row["origin"]),
+                    "provider": str(row["provider"]),
+                    "instance": str(row["instance"]),
+                    "key": str(row["row_key"]),
+                    "row": data,
+                }
+            )
+    return out
+
+
+def load_totals(base_path: str | Path | None, widget: str) -> list[dict[str, Any]]:
+    conn = get_conn(base_path)
+    if conn is None:
+        return []
+    rows = conn.execute(
+        "SELECT s.origin AS origin,e.provider AS provider,e.instance AS instance,e.total AS total "
+        "FROM dashboard_view_endpoints e JOIN dashboard_view_segments s ON s.id=e.segment_id WHERE s.widget=?",
+        (widget,),
+    ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def clear_views(base_path: str | Path | None) -> None:
+    conn = get_conn(base_path)
+    if conn is None:
+        return
+    with conn:
+        conn.execute("DELETE FROM dashboard_view_segments")
+        conn.execute("DELETE FROM local_meta WHERE key IN (?,?)", (_SCHEMA_KEY, _VERSION_KEY))
@@ -47,6 +47,10 @@ _ORPHAN_QUERIES = {
         "SELECT COUNT(*) FROM sync_run_spotlight_items i "
         "LEFT JOIN sync_run_reports r ON r.run_id=i.run_id WHERE r.run_id IS NULL"
     ),
+    "dashboard_view_rows_missing_segment": (
+        "SELECT COUNT(*) FROM dashboard_view_rows r "
+        "LEFT JOIN dashboard_view_segments s ON s.id=r.segment_id WHERE s.id IS NULL"
+    ),
     "statistics_current_providers_missing_item": (
         "SELECT COUNT(*) FROM statistics_current_providers p "
         "LEFT JOIN statistics_current_items i ON i.feature=p.feature AND i.item_key=p.item_key "
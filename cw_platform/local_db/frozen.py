@@ -0,0 +1,87 @@
+# cw_platform/local_db/frozen.py
+# CrossWatch - Read-only state views shared between readers
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+from typing import Any, NoReturn
+
+from ..compact_item import CompactItem
+
+__all__ = ["FrozenDict", "FrozenList", "freeze", "mutable_copy"]
+
+_MSG = "state views are read-only; take mutable_copy() first"
+
+
+def _read_only(*_a: Any, **_k: Any) -> NoReturn:
+    raise TypeError(_MSG)
+
+
+class FrozenDict(dict):
+    """A ``dict`` that refuses writes, so one cached state can be handed to every reader.
+
+    ``isinstance(view, dict)`` and JSON encoding keep working. ``copy()`` and
+    ``dict(view)`` give a shallow mutable dict; ``copy.deepcopy`` gives a full
+    ``mutable_copy``.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = update = __ior__ = _read_only  # type: ignore[assignment]
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        _read_only()
+
+    def copy(self) -> dict[str, Any]:  # type: ignore[override]
+        return dict(self)
+
+    def __copy__(self) -> dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Any:
+        return mutable_copy(self)
+
+    def __reduce__(self) -> Any:
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only  # type: ignore[assignment]
+
+    def copy(self) -> list[Any]:  # type: ignore[override]
+        return list(self)
+
+    def __copy__(self) -> list[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Any:
+        return mutable_copy(self)
+
+    def __reduce__(self) -> Any:
+        return (list, (list(self),))
+
+
+def freeze(obj: Any) -> Any:
+    if isinstance(obj, FrozenDict | FrozenList):
+        return obj
+    if isinstance(obj, dict):
+        return FrozenDict((k, freeze(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return FrozenList(freeze(v) for v in obj)
+    return obj
+
+
+def mutable_copy(obj: Any) -> Any:
+    """Deep copy of a state view (or any dict/list tree) into plain mutable containers."""
+    if isinstance(obj, CompactItem):
+        return obj.to_dict()
+    if isinstance(obj, dict):
+        return {k: mutable_copy(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [mutable_copy(v) for v in obj]
+    return obj
@@ -0,0 +1,497 @@
+# cw_platform/local_db/guard_state.py
+# CrossWatch - SQLite-backed orchestrator guard state (tombstones, blackbox, phantoms, unresolved)
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from ..compact_item import json_default
+from .db import get_conn
+from .legacy_files import _move_artifact, legacy_root
+
+TOMBSTONE = "tombstone"
+BLACKBOX = "blackbox"
+FLAP = "flap"
+PHANTOM = "phantom"
+LAST_SUCCESS = "last_success"
+UNRESOLVED = "unresolved"
+KINDS = (TOMBSTONE, BLACKBOX, FLAP, PHANTOM, LAST_SUCCESS, UNRESOLVED)
+
+_CHUNK = 400
+_TOMB_PRUNED_KEY = "guard_tombstones_pruned_at"
+_IMPORT_LOCK = threading.Lock()
+_IMPORTED: dict[str, int] = {}
+# Orchestrator guard files are named {dst}_{feature}[.{scope}].{kind}.json. The Jellyfin and Emby
+# history modules keep their own {p}_history.{p}[...].blackbox.json in the same directory and still use it.
+_GUARD_FEATURES = frozenset({"watchlist", "ratings", "history", "progress", "playlists"})
+_PROVIDER_OWNED = re.compile(r"^(?P<p>[a-z0-9]+)_history\.(?P=p)(?:[.-][^/]*)?\.blackbox\.json$")
+
+
+def _now_ns() -> int:
+    return int(time.time_ns())
+
+
+def _dumps(data: Any) -> str | None:
+    if data is None:
+        return None
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=json_default)
+
+
+def _loads(text: Any) -> Any:
+    if not text:
+        return None
+    try:
+        return json.loads(text)
+    except Exception:
+        return None
+
+
+def _values(value: str | Iterable[str] | None) -> list[str] | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return [value]
+    return [str(v) for v in value]
+
+
+def _chunks(keys: list[str]) -> Iterable[list[str]]:
+    for i in range(0, len(keys), _CHUNK):
+        yield keys[i : i + _CHUNK]
+
+
+def _where(
+    kind: str,
+    provider: str | None,
+    feature: str | None,
+    scopes: list[str] | None,
+    since: int | None,
+    now: int | None,
+) -> tuple[str, list[Any]]:
+    sql = ["kind=?"]
+    args: list[Any] = [kind]
+    if provider is not None:
+        sql.append("provider=?")
+        args.append(provider)
+    if feature is not None:
+        sql.append("feature=?")
+        args.append(feature)
+    if scopes is not None:
+        sql.append(f"scope IN ({','.join('?' * len(scopes))})")
+        args.extend(scopes)
+    if since is not None:
+        sql.append("ts>=?")
+        args.append(int(since))
+    if now is not None:
+        sql.append("(expires_at IS NULL OR expires_at>?)")
+        args.append(int(now))
+    return " AND ".join(sql), args
+
+
+def _entry(row: sqlite3.Row) -> dict[str, Any]:
+    return {
+        "key": str(row["item_key"]),
+        "provider": str(row["provider"]),
+        "feature": str(row["feature"]),
+        "scope": str(row["scope"]),
+        "ts": int(row["ts"] or 0),
+        "expires_at": row["expires_at"],
+        "data": _loads(row["data_json"]),
+    }
+
+
+def entries(
+    base_path: str | Path | None,
+    kind: str,
+    *,
+    provider: str | None = None,
+    feature: str | None = None,
+    scopes: str | Iterable[str] | None = None,
+    keys: Iterable[str] | None = None,
+    since: int | None = None,
+    now: int | None = None,
+) -> list[dict[str, Any]]:
+    """Rows of one kind; `keys` turns the read into chunked point lookups on the primary key."""
+    conn = get_conn(base_path)
+    if conn is None:
+        return []
+    scope_list = _values(scopes)
+    if scope_list == []:
+        return []
+    where, args = _where(kind, provider, feature, scope_list, since, now)
+    cols = "SELECT provider,feature,scope,item_key,ts,expires_at,data_json FROM sync_guard_entries WHERE "
+    if keys is None:
+        return [_entry(r) for r in conn.execute(cols + where + " ORDER BY rowid", args)]
+    wanted = list(dict.fromkeys(str(k) for k in keys if k))
+    out: list[dict[str, Any]] = []
+    for chunk in _chunks(wanted):
+        sql = f"{cols}{where} AND item_key IN ({','.join('?' * len(chunk))}) ORDER BY rowid"
+        out.extend(_entry(r) for r in conn.execute(sql, [*args, *chunk]))
+    return out
+
+
+def load(base_path: str | Path | None, kind: str, **kw: Any) -> dict[str, dict[str, Any]]:
+    return {e["key"]: e for e in entries(base_path, kind, **kw)}
+
+
+def load_keys(base_path: str | Path | None, kind: str, **kw: Any) -> set[str]:
+    return {e["key"] for e in entries(base_path, kind, **kw)}
+
+
+def upsert(
+    base_path: str | Path | None,
+    kind: str,
+    provider: str,
+    feature: str,
+    scope: str,
+    rows: Mapping[str, Any],
+    *,
+    ts: int | None = None,
+    expires_at: int | None = None,
+    keep_existing: bool = False,
+) -> int:
+    """Write `rows` (key -> data) in one transaction; `keep_existing` leaves present keys untouched."""
+    if not rows:
+        return 0
+    conn = get_conn(base_path)
+    if conn is None:
+        return 0
+    stamp = int(ts if ts is not None else time.time())
+    updated = _now_ns()
+    params = [
+        (kind, provider, feature, scope, str(k), stamp, expires_at, _dumps(v), updated)
+        for k, v in rows.items()
+        if k
+    ]
+    sql = (
+        "INSERT INTO sync_guard_entries(kind,provider,feature,scope,item_key,ts,expires_at,data_json,updated_at) "
+        "VALUES(?,?,?,?,?,?,?,?,?) "
+    )
+    if keep_existing:
+        sql += "ON CONFLICT(kind,provider,feature,scope,item_key) DO NOTHING"
+    else:
+        sql += (
+            "ON CONFLICT(kind,provider,feature,scope,item_key) DO UPDATE SET ts=excluded.ts,"
+            "expires_at=excluded.expires_at,data_json=excluded.data_json,updated_at=excluded.updated_at"
+        )
+    with conn:
+        cur = conn.executemany(sql, params)
+    return max(0, int(cur.rowcount or 0))
+
+
+def delete(
+    base_path: str | Path | None,
+    kind: str,
+    provider: str,
+    feature: str,
+    scope: str,
+    keys: Iterable[str],
+) -> int:
+    wanted = list(dict.fromkeys(str(k) for k in keys if k))
+    if not wanted:
+        return 0
+    conn = get_conn(base_path)
+    if conn is None:
+        return 0
+    sql = "DELETE FROM sync_guard_entries WHERE kind=? AND provider=? AND feature=? AND scope=? AND item_key=?"
+    with conn:
+        cur = conn.executemany(sql, [(kind, provider, feature, scope, k) for k in wanted])
+    return max(0, int(cur.rowcount or 0))
+
+
+def prune_before(base_path: str | Path | None, kind: str, cutoff: int) -> int:
+    """Drop rows of `kind` stamped before `cutoff` (rows stamped 0 never age out)."""
+    conn = get_conn(base_path)
+    if conn is None:
+        return 0
+    with conn:
+        cur = conn.execute("DELETE FROM sync_guard_entries WHERE kind=? AND ts>0 AND ts<?", (kind, int(cutoff)))
+    return max(0, int(cur.rowcount or 0))
+
+
+def purge_expired(base_path: str | Path | None, now: int | None = None) -> int:
+    conn = get_conn(base_path)
+    if conn is None:
+        return 0
+    with conn:
+        cur = conn.execute(
+            "DELETE FROM sync_guard_entries WHERE expires_at IS NOT NULL AND expires_at<=?",
+            (int(now if now is not None else time.time()),),
+        )
+    return max(0, int(cur.rowcount or 0))
+
+
+def count_keys(
+    base_path: str | Path | None,
+    kind: str,
+    *,
+    provider: str | None = None,
+    feature: str | None = None,
+    scopes: str | Iterable[str] | None = None,
+) -> int:
+    conn = get_conn(base_path)
+    if conn is None:
+        return 0
+    where, args = _where(kind, provider, feature, _values(scopes), None, None)
+    row = conn.execute(f"SELECT COUNT(DISTINCT item_key) AS c FROM sync_guard_entries WHERE {where}", args).fetchone()
+    return int(row["c"] or 0) if row is not None else 0
+
+
+def count_groups(base_path: str | Path | None, kind: str) -> int:
+    conn = get_conn(base_path)
+    if conn is None:
+        return 0
+    row = conn.execute(
+        "SELECT COUNT(*) AS c FROM (SELECT DISTINCT provider,feature,scope FROM sync_guard_entries WHERE kind=?)",
+        (kind,),
+    ).fetchone()
+    return int(row["c"] or 0) if row is not None else 0
+
+
+def clear(base_path: str | Path | None, kinds: Iterable[str] | None = None) -> int:
+    conn = get_conn(base_path)
+    if conn is None:
+        return 0
+    wanted = list(kinds) if kinds is not None else list(KINDS)
+    if not wanted:
+        return 0
+    marks = ",".join("?" * len(wanted))
+    with conn:
+        cur = conn.execute(f"DELETE FROM sync_guard_entries WHERE kind IN ({marks})", wanted)
+    return max(0, int(cur.rowcount or 0))
+
+
+def tombstones_pruned_at(base_path: str | Path | None) -> int | None:
+    conn = get_conn(base_path)
+    if conn is None:
+        return None
+    row = conn.execute("SELECT value_int FROM local_meta WHERE key=?", (_TOMB_PRUNED_KEY,)).fetchone()
+    return int(row["value_int"]) if row is not None and row["value_int"] is not None else None
+
+
+def set_tombstones_pruned_at(base_path: str | Path | None, value: int) -> None:
+    conn = get_conn(base_path)
+    if conn is None:
+        return
+    with conn:
+        conn.execute(
+            "INSERT INTO local_meta(key,value_int,value_type,updated_at) VALUES(?,?,'int',?) "
+            "ON CONFLICT(key) DO UPDATE SET value_int=excluded.value_int,value_text=NULL,value_real=NULL,"
+            "value_type='int',updated_at=excluded.updated_at",
+            (_TOMB_PRUNED_KEY, int(value), _now_ns()),
+        )
+
+
+def legacy_views(base_path: str | Path | None, kind: str) -> list[tuple[str, dict[str, Any]]]:
+    """Rows of `kind` regrouped into the legacy per-file shape, keyed by the legacy file name."""
+    groups: dict[tuple[str, str, str], dict[str, Any]] = {}
+    for e in entries(base_path, kind):
+        data = e["data"] if isinstance(e["data"], Mapping) else {}
+        group = groups.setdefault((e["provider"], e["feature"], e["scope"]), {})
+        if kind == BLACKBOX:
+            group[e["key"]] = {**data, "since": e["ts"]}
+        elif kind == UNRESOLVED:
+            group.setdefault("keys", []).append(e["key"])
+            if isinstance(data.get("item"), Mapping):
+                group.setdefault("items", {})[e["key"]] = data["item"]
+            if isinstance(data.get("hint"), Mapping):
+                group.setdefault("hints", {})[e["key"]] = data["hint"]
+        else:
+            group[e["key"]] = dict(data) if data else e["ts"]
+    out: list[tuple[str, dict[str, Any]]] = []
+    for (prov, feat, scope), data in groups.items():
+        if kind == UNRESOLVED:
+            name = f"{prov}_{feat}.unresolved.pending.{scope}.json"
+        elif kind in (PHANTOM, LAST_SUCCESS):
+            name = f"{feat}.{prov}.{scope}.{kind}{'s' if kind == PHANTOM else ''}.json"
+        elif kind == TOMBSTONE:
+            continue
+        else:
+            name = f"{prov}_{feat}.{scope}.{kind}.json"
+        out.append((name, data))
+    return out
+
+
+# Legacy JSON import
+def _read_json(path: Path) -> Any:
+    try:
+        return json.loads(path.read_text("utf-8"))
+    except Exception:
+        return None
+
+
+def _int(value: Any) -> int:
+    try:
+        return int(value or 0)
+    except Exception:
+        return 0
+
+
+def _split_dst_feature(head: str) -> tuple[str, str] | None:
+    dst, sep, feature = head.partition("_")
+    return (dst, feature) if sep and dst.isalnum() and feature in _GUARD_FEATURES else None
+
+
+def _tomb_rows(data: Any, mtime: int) -> list[tuple]:
+    raw = data.get("keys") if isinstance(data, Mapping) else None
+    if not isinstance(raw, Mapping):
+        return []
+    rows: list[tuple] = []
+    for k, ts in raw.items():
+        scoped, sep, token = str(k).partition("|")
+        feature, sep2, pair = scoped.partition(":")
+        if sep and sep2 and token:
+            rows.append((TOMBSTONE, "", feature.lower(), pair.upper(), token, _int(ts) or mtime, None))
+    return rows
+
+
+def _bb_rows(kind: str, name: str, suffix: str, data: Any) -> list[tuple] | None:
+    head, _, scope = name[: -len(suffix)].partition(".")
+    parts = _split_dst_feature(head)
+    if parts is None:
+        return None
+    if not isinstance(data, Mapping):
+        return []
+    dst, feature = parts
+    rows: list[tuple] = []
+    for k, v in data.items():
+        row = dict(v) if isinstance(v, Mapping) else {}
+        if kind == BLACKBOX:
+            ts = _int(row.pop("since", 0))
+        else:
+            ts = max(_int(row.get("last_attempt_ts")), _int(row.get("last_success_ts")))
+        rows.append((kind, dst, feature, scope or "unscoped", str(k), ts, row))
+    return rows
+
+
+def _phantom_rows(kind: str, name: str, suffix: str, data: Any, mtime: int) -> list[tuple] | None:
+    parts = name[: -len(suffix)].split(".", 2)
+    if len(parts) < 2 or parts[0] not in _GUARD_FEATURES:
+        return None
+    feature, route = parts[0], parts[1]
+    scope = parts[2] if len(parts) > 2 else "unscoped"
+    found: dict[str, tuple[int, Any]] = {}
+    if isinstance(data, Mapping) and isinstance(data.get("keys"), list):
+        found = {str(k): (mtime, None) for k in data["keys"] if k}
+    elif isinstance(data, Mapping):
+        found = {str(k): (_int(ts), None) for k, ts in data.items() if k}
+    elif isinstance(data, list):
+        try:
+            from ..id_map import canonical_key
+        except Exception:
+            canonical_key = None  # type: ignore[assignment]
+        for it in data:
+            if isinstance(it, str) and it:
+                found[it] = (mtime, None)
+            elif isinstance(it, Mapping) and canonical_key is not None:
+                ck = canonical_key(it)
+                if ck:
+                    found[str(ck)] = (mtime, dict(it))
+    return [(kind, route, feature, scope, k, ts, row) for k, (ts, row) in found.items()]
+
+
+def _pending_rows(name: str, data: Any, mtime: int) -> list[tuple] | None:
+    head, _, tail = name[: -len(".json")].partition(".unresolved.pending")
+    head, _, scope = head.partition(".")
+    scope = scope or tail.lstrip(".") or "unscoped"
+    parts = _split_dst_feature(head)
+    if parts is None:
+        return None
+    if not isinstance(data, Mapping):
+        return []
+    dst, feature = parts
+    items = data.get("items") if isinstance(data.get("items"), Mapping) else {}
+    hints = data.get("hints") if isinstance(data.get("hints"), Mapping) else {}
+    keys = data.get("keys") if isinstance(data.get("keys"), list) else list(items.keys())
+    rows: list[tuple] = []
+    for k in dict.fromkeys(str(x) for x in keys if x):
+        hint = hints.get(k) if isinstance(hints.get(k), Mapping) else None
+        item = items.get(k) if isinstance(items.get(k), Mapping) else None
+        ts = _int(hint.get("ts")) if hint else 0
+        rows.append((UNRESOLVED, dst, feature, scope, k, ts or mtime, {"item": item, "hint": hint}))
+    return rows
+
+
+def legacy_rows(path: Path) -> list[tuple] | None:
+    """Rows for one legacy guard file, or None when the file is not an orchestrator guard artifact."""
+    name = path.name
+    if not name.endswith(".json") or _PROVIDER_OWNED.match(name):
+        return None
+    try:
+        mtime = int(path.stat().st_mtime)
+    except OSError:
+        return None
+    if name == "tombstones.json":
+        return _tomb_rows(_read_json(path), mtime)
+    if name.endswith(".blackbox.json"):
+        return _bb_rows(BLACKBOX, name, ".blackbox.json", _read_json(path))
+    if name.endswith(".flap.json"):
+        return _bb_rows(FLAP, name, ".flap.json", _read_json(path))
+    if name.endswith(".phantoms.json"):
+        return _phantom_rows(PHANTOM, name, ".phantoms.json", _read_json(path), mtime)
+    if name.endswith(".last_success.json"):
+        return _phantom_rows(LAST_SUCCESS, name, ".last_success.json", _read_json(path), mtime)
+    if ".unresolved.pending" in name:
+        return _pending_rows(name, _read_json(path), mtime)
+    return None
+
+
+def import_legacy_files(base_path: str | Path | None, state_dir: str | Path | None, *, force: bool = False) -> int:
+    """Import guard JSON files from `state_dir` and move them under legacy/.cw_state.
+
+    Re-runs only when the directory mtime changes, so callers can invoke it before every access.
+    """
+    if base_path is None or state_dir is None:
+        return 0
+    root = Path(state_dir)
+    try:
+        mtime = root.stat().st_mtime_ns
+    except OSError:
+        return 0
+    key = str(root)
+    with _IMPORT_LOCK:
+        if not force and _IMPORTED.get(key) == mtime:
+            return 0
+        found: list[tuple[Path, list[tuple]]] = []
+        for path in sorted(root.iterdir()):
+            if not path.is_file():
+                continue
+            rows = legacy_rows(path)
+            if rows is not None:
+                found.append((path, rows))
+        imported = 0
+        if found:
+            conn = get_conn(base_path)
+            if conn is None:
+                return 0
+            updated = _now_ns()
+            params = [
+                (kind, prov, feat, scope, k, ts, None, _dumps(data), updated)
+                for _, rows in found
+                for kind, prov, feat, scope, k, ts, data in rows
+            ]
+            with conn:
+                cur = conn.executemany(
+                    "INSERT INTO sync_guard_entries(kind,provider,feature,scope,item_key,ts,expires_at,data_json,updated_at) "
+                    "VALUES(?,?,?,?,?,?,?,?,?) ON CONFLICT(kind,provider,feature,scope,item_key) DO NOTHING",
+                    params,
+                )
+            imported = max(0, int(cur.rowcount or 0))
+            legacy = legacy_root(base_path) / ".cw_state"
+            for path, _ in found:
+                try:
+                    _move_artifact(path, legacy / path.name)
+                except Exception:
+                    pass
+            try:
+                mtime = root.stat().st_mtime_ns
+            except OSError:
+                pass
+        _IMPORTED[key] = mtime
+        return imported
@@ -0,0 +1,97 @@
+# cw_platform/local_db/http_latency.py
+# CrossWatch - SQLite-backed per-minute HTTP latency rollups
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from .db import get_conn
+
+_KEY_COLUMNS = ("minute", "provider", "instance", "method", "route", "status_class")
+_SUM_COLUMNS = ("count", "errors", "retries", "bytes_in", "bytes_out", "ms_sum")
+
+
+def _merge_buckets(a: str | None, b: str | None) -> str:
+    counts: dict[int, int] = {}
+    for raw in (a, b):
+        for part in str(raw or "").split(","):
+            k, _, v = part.partition(":")
+            try:
+                counts[int(k)] = counts.get(int(k), 0) + int(v)
+            except ValueError:
+                continue
+    return ",".join(f"{k}:{v}" for k, v in sorted(counts.items()))
+
+
+def merge_http_latency(base_path: str | Path | None, rows: Iterable[Mapping[str, Any]]) -> int:
+    conn = get_conn(base_path)
+    if conn is None:
+        return 0
+    batch = [(tuple(row.get(c) for c in _KEY_COLUMNS), row) for row in rows]
+    if not batch:
+        return 0
+    now = int(time.time_ns())
+    cols = _KEY_COLUMNS + _SUM_COLUMNS + ("ms_max", "buckets", "updated_at")
+    insert = (
+        f"INSERT INTO statistics_http_latency({','.join(cols)}) VALUES({','.join('?' for _ in cols)}) "
+        f"ON CONFLICT({','.join(_KEY_COLUMNS)}) DO UPDATE SET "
+        + ",".join(f"{c}={c}+excluded.{c}" for c in _SUM_COLUMNS)
+        + ",ms_max=MAX(ms_max,excluded.ms_max),buckets=?,updated_at=excluded.updated_at"
+    )
+    minutes = [int(key[0] or 0) for key, _ in batch]
+    with conn:
+        # One read for the flushed minute range; flushes only span the last few minutes.
+        cur = conn.execute(
+            f"SELECT {','.join(_KEY_COLUMNS)},buckets FROM statistics_http_latency WHERE minute BETWEEN ? AND ?",
+            (min(minutes), max(minutes)),
+        )
+        prev = {tuple(r[c] for c in _KEY_COLUMNS): r["buckets"] for r in cur.fetchall()}
+        values: list[tuple[Any, ...]] = []
+        for key, row in batch:
+            merged = _merge_buckets(prev.get(key), row.get("buckets"))
+            prev[key] = merged
+            sums = tuple(int(row.get(c) or 0) for c in _SUM_COLUMNS)
+            values.append(key + sums + (int(row.get("ms_max") or 0), merged, now, merged))
+        conn.executemany(insert, values)
+    return len(values)
+
+
+def load_http_latency(
+    base_path: str | Path | None,
+    *,
+    since_minute: int = 0,
+    provider: str | None = None,
+    instance: str | None = None,
+) -> list[dict[str, Any]]:
+    conn = get_conn(base_path)
+    if conn is None:
+        return []
+    sql = "SELECT * FROM statistics_http_latency WHERE minute>=?"
+    args: list[Any] = [int(since_minute)]
+    if provider:
+        sql += " AND provider=?"
+        args.append(str(provider).upper())
+    if instance:
+        sql += " AND instance=?"
+        args.append(str(instance))
+    return [dict(r) for r in conn.execute(sql + " ORDER BY minute", args).fetchall()]
+
+
+def prune_http_latency(base_path: str | Path | None, *, before_minute: int) -> int:
+    conn = get_conn(base_path)
+    if conn is None:
+        return 0
+    with conn:
+        cur = conn.execute("DELETE FROM statistics_http_latency WHERE minute<?", (int(before_minute),))
+    return int(cur.rowcount or 0)
+
+
+def clear_http_latency(base_path: str | Path | None) -> None:
+    conn = get_conn(base_path)
+    if conn is None:
+        return
+    with conn:
+        conn.execute("DELETE FROM statistics_http_latency")
@@ -0,0 +1,116 @@
+# cw_platform/local_db/playback_progress.py
+# CrossWatch - SQLite-backed playback progress list cache
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from .db import get_conn
+
+
+def _now() -> int:
+    return int(time.time_ns())
+
+
+def _json(value: Any) -> str | None:
+    if value is None:
+        return None
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _loads(value: Any) -> Any:
+    if not value:
+        return None
+    try:
+        return json.loads(value)
+    except Exception:
+        return None
+
+
+def load_entries(base_path: str | Path | None) -> list[dict[str, Any]]:
+    conn = get_conn(base_path)
+    if conn is None:
+        return []
+    rows = conn.execute(
+        "SELECT provider,instance,profile,payload_json,last_error_json,activity_marker,refreshed_at,fetched_at,latency_ms "
+        "FROM playback_progress_cache ORDER BY provider,instance,profile"
+    ).fetchall()
+    out: list[dict[str, Any]] = []
+    for row in rows:
+        payload = _loads(row["payload_json"])
+        if not isinstance(payload, dict):
+            continue
+        error = _loads(row["last_error_json"])
+        out.append(
+            {
+                "provider": str(row["provider"]),
+                "instance": str(row["instance"]),
+                "profile": str(row["profile"]),
+                "payload": payload,
+                "error": error if isinstance(error, dict) else None,
+                "activity_marker": str(row["activity_marker"] or ""),
+                "refreshed_at": row["refreshed_at"],
+                "fetched_at": float(row["fetched_at"] or 0),
+                "latency_ms": int(row["latency_ms"]) if row["latency_ms"] is not None else None,
+            }
+        )
+    return out
+
+
+def save_entry(
+    base_path: str | Path | None,
+    provider: str,
+    instance: str,
+    profile: str,
+    *,
+    payload: Mapping[str, Any],
+    error: Mapping[str, Any] | None,
+    activity_marker: str,
+    refreshed_at: str | None,
+    fetched_at: float,
+    latency_ms: int | None,
+) -> None:
+    conn = get_conn(base_path)
+    if conn is None:
+        return
+    with conn:
+        conn.execute(
+            "INSERT INTO playback_progress_cache(provider,instance,profile,payload_json,last_error_json,activity_marker,"
+            "refreshed_at,fetched_at,latency_ms,updated_at) VALUES(?,?,?,?,?,?,?,?,?,?) "
+            "ON CONFLICT(provider,instance,profile) DO UPDATE SET payload_json=excluded.payload_json,"
+            "last_error_json=excluded.last_error_json,activity_marker=excluded.activity_marker,"
+            "refreshed_at=excluded.refreshed_at,fetched_at=excluded.fetched_at,latency_ms=excluded.latency_ms,"
+            "updated_at=excluded.updated_at",
+            (
+                provider,
+                instance or "default",
+                profile or "default",
+                _json(dict(payload)),
+                _json(dict(error) if error else None),
+                activity_marker or "",
+                refreshed_at,
+                float(fetched_at),
+                latency_ms,
+                _now(),
+            ),
+        )
+
+
+def delete_entries(base_path: str | Path | None, provider: str, instance: str) -> None:
+    conn = get_conn(base_path)
+    if conn is None:
+        return
+    with conn:
+        conn.execute("DELETE FROM playback_progress_cache WHERE provider=? AND instance=?", (provider, instance or "default"))
+
+
+def clear_entries(base_path: str | Path | None) -> None:
+    conn = get_conn(base_path)
+    if conn is None:
+        return
+    with conn:
+        conn.execute("DELETE FROM playback_progress_cache")
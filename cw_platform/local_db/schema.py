@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import sqlite3
 import time
+import uuid
 
 SCHEMA_VERSION = 1
 
@@ -279,6 +280,27 @@ CREATE TABLE IF NOT EXISTS statistics_http_events (
 )
 """
 
+_CREATE_STATISTICS_HTTP_LATENCY = """
+CREATE TABLE IF NOT EXISTS statistics_http_latency (
+    minute        INTEGER NOT NULL,
+    provider      TEXT NOT NULL,
+    instance      TEXT NOT NULL DEFAULT 'default',
+    method        TEXT NOT NULL,
+    route         TEXT NOT NULL,
+    status_class  TEXT NOT NULL,
+    count         INTEGER NOT NULL DEFAULT 0,
+    errors        INTEGER NOT NULL DEFAULT 0,
+    retries       INTEGER NOT NULL DEFAULT 0,
+    bytes_in      INTEGER NOT NULL DEFAULT 0,
+    bytes_out     INTEGER NOT NULL DEFAULT 0,
+    ms_sum        INTEGER NOT NULL DEFAULT 0,
+    ms_max        INTEGER NOT NULL DEFAULT 0,
+    buckets       TEXT NOT NULL DEFAULT '',
+    updated_at    INTEGER NOT NULL,
+    PRIMARY KEY(minute, provider, instance, method, route, status_class)
+) WITHOUT ROWID
+"""
+
 _CREATE_STATISTICS_HTTP_COUNTERS = """
 CREATE TABLE IF NOT EXISTS statistics_http_counters (
     provider             TEXT PRIMARY KEY,
@@ -483,6 +505,21 @@ CREATE TABLE IF NOT EXISTS ttl_dedupe_entries (
 )
 """
 
+_CREATE_SYNC_GUARD_ENTRIES = """
+CREATE TABLE IF NOT EXISTS sync_guard_entries (
+    kind        TEXT NOT NULL,
+    provider    TEXT NOT NULL DEFAULT '',
+    feature     TEXT NOT NULL,
+    scope       TEXT NOT NULL,
+    item_key    TEXT NOT NULL,
+    ts          INTEGER NOT NULL,
+    expires_at  INTEGER,
+    data_json   TEXT,
+    updated_at  INTEGER NOT NULL,
+    PRIMARY KEY(kind, provider, feature, scope, item_key)
+)
+"""
+
 _CREATE_SYNC_RUN_REPORTS = """
 CREATE TABLE IF NOT EXISTS sync_run_reports (
     run_id          TEXT PRIMARY KEY,
@@ -565,16 +602,80 @@ CREATE TABLE IF NOT EXISTS sync_run_spotlight_items (
 )
 """
 
+_CREATE_DASHBOARD_VIEW_SEGMENTS = """
+CREATE TABLE IF NOT EXISTS dashboard_view_segments (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    widget          TEXT NOT NULL,
+    origin          TEXT NOT NULL,
+    provider        TEXT NOT NULL,
+    instance        TEXT NOT NULL DEFAULT 'default',
+    source_version  TEXT,
+    built_version   TEXT,
+    updated_at      INTEGER NOT NULL,
+    UNIQUE(widget, origin, provider, instance)
+)
+"""
+
+_CREATE_DASHBOARD_VIEW_ENDPOINTS = """
+CREATE TABLE IF NOT EXISTS dashboard_view_endpoints (
+    segment_id  INTEGER NOT NULL,
+    provider    TEXT NOT NULL,
+    instance    TEXT NOT NULL,
+    total       INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY(segment_id, provider, instance),
+    FOREIGN KEY(segment_id) REFERENCES dashboard_view_segments(id) ON DELETE CASCADE
+)
+"""
+
+_CREATE_DASHBOARD_VIEW_ROWS = """
+CREATE TABLE IF NOT EXISTS dashboard_view_rows (
+    segment_id  INTEGER NOT NULL,
+    provider    TEXT NOT NULL,
+    instance    TEXT NOT NULL,
+    row_key     TEXT NOT NULL,
+    rank        INTEGER NOT NULL,
+    row_json    TEXT NOT NULL,
+    PRIMARY KEY(segment_id, provider, instance, row_key),
+    FOREIGN KEY(segment_id) REFERENCES dashboard_view_segments(id) ON DELETE CASCADE
+)
+"""
+
+_CREATE_PLAYBACK_PROGRESS_CACHE = """
+CREATE TABLE IF NOT EXISTS playback_progress_cache (
+    provider         TEXT NOT NULL,
+    instance         TEXT NOT NULL DEFAULT 'default',
+    profile          TEXT NOT NULL DEFAULT 'default',
+    payload_json     TEXT NOT NULL,
+    last_error_json  TEXT,
+    activity_marker  TEXT,
+    refreshed_at     TEXT,
+    fetched_at       REAL NOT NULL,
+    latency_ms       INTEGER,
+    updated_at       INTEGER NOT NULL,
+    PRIMARY KEY(provider, instance, profile)
+)
+"""
+
 _INDEXES = (
     "CREATE INDEX IF NOT EXISTS idx_pfs_provider_feature ON provider_feature_state(provider, instance, feature)",
     "CREATE INDEX IF NOT EXISTS idx_bi_state_key ON baseline_items(provider_state_id, item_key)",
     "CREATE INDEX IF NOT EXISTS idx_bi_state_base ON baseline_items(provider_state_id, base_key)",
     "CREATE INDEX IF NOT EXISTS idx_bi_state_event ON baseline_items(provider_state_id, event_key)",
     "CREATE INDEX IF NOT EXISTS idx_bi_state_watched ON baseline_items(provider_state_id, watched_at)",
+    "CREATE INDEX IF NOT EXISTS idx_pfs_feature ON provider_feature_state(feature, provider, instance)",
+    "CREATE INDEX IF NOT EXISTS idx_bi_state_rated ON baseline_items(provider_state_id, rated_at)",
+    "CREATE INDEX IF NOT EXISTS idx_bi_state_progress ON baseline_items(provider_state_id, progress_at)",
+    "CREATE INDEX IF NOT EXISTS idx_bi_state_updated ON baseline_items(provider_state_id, updated_at)",
+    "CREATE INDEX IF NOT EXISTS idx_bi_state_type ON baseline_items(provider_state_id, media_type, item_key)",
+    "CREATE INDEX IF NOT EXISTS idx_bi_ids_imdb ON baseline_items(ids_imdb, provider_state_id) WHERE ids_imdb IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS idx_bi_ids_tmdb ON baseline_items(ids_tmdb, provider_state_id) WHERE ids_tmdb IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS idx_bi_ids_tvdb ON baseline_items(ids_tvdb, provider_state_id) WHERE ids_tvdb IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS idx_bi_ids_trakt ON baseline_items(ids_trakt, provider_state_id) WHERE ids_trakt IS NOT NULL",
     "CREATE INDEX IF NOT EXISTS idx_stats_events_ts ON statistics_events(ts)",
     "CREATE INDEX IF NOT EXISTS idx_stats_events_feature_ts ON statistics_events(feature, ts)",
     "CREATE INDEX IF NOT EXISTS idx_stats_samples_feature_ts ON statistics_samples(feature, ts)",
     "CREATE INDEX IF NOT EXISTS idx_stats_http_events_provider_ts ON statistics_http_events(provider, ts)",
+    "CREATE INDEX IF NOT EXISTS idx_stats_http_latency_provider ON statistics_http_latency(provider, minute)",
     "CREATE INDEX IF NOT EXISTS idx_stats_feature_totals_ts ON statistics_feature_totals(ts)",
     "CREATE INDEX IF NOT EXISTS idx_manual_policy_feature ON manual_policy_features(provider, instance, feature)",
     "CREATE INDEX IF NOT EXISTS idx_manual_policy_blocks_key ON manual_policy_blocks(item_key)",
@@ -591,9 +692,13 @@ _INDEXES = (
     "CREATE INDEX IF NOT EXISTS idx_activity_ids_type_value ON activity_event_ids(id_type, id_value)",
     "CREATE INDEX IF NOT EXISTS idx_ttl_dedupe_expires ON ttl_dedupe_entries(expires_at)",
     "CREATE INDEX IF NOT EXISTS idx_ttl_dedupe_namespace_seen ON ttl_dedupe_entries(namespace, seen_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_sync_guard_kind_ts ON sync_guard_entries(kind, ts)",
+    "CREATE INDEX IF NOT EXISTS idx_sync_guard_expires ON sync_guard_entries(expires_at) WHERE expires_at IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS idx_sync_guard_key ON sync_guard_entries(item_key, kind)",
     "CREATE INDEX IF NOT EXISTS idx_sync_reports_created ON sync_run_reports(created_at DESC)",
     "CREATE INDEX IF NOT EXISTS idx_sync_feature_run ON sync_run_feature_lanes(feature, run_id)",
     "CREATE INDEX IF NOT EXISTS idx_sync_spotlight_run_feature ON sync_run_spotlight_items(run_id, feature, bucket, ordinal)",
+    "CREATE INDEX IF NOT EXISTS idx_dashboard_view_rows_rank ON dashboard_view_rows(segment_id, provider, instance, rank)",
 )
 
 
@@ -616,6 +721,7 @@ def apply_schema(conn: sqlite3.Connection) -> int:
         conn.execute(_CREATE_STATISTICS_COUNTERS)
         conn.execute(_CREATE_STATISTICS_LAST_RUN)
         conn.execute(_CREATE_STATISTICS_HTTP_EVENTS)
+        conn.execute(_CREATE_STATISTICS_HTTP_LATENCY)
         conn.execute(_CREATE_STATISTICS_HTTP_COUNTERS)
         conn.execute(_CREATE_STATISTICS_HTTP_LAST)
         conn.execute(_CREATE_STATISTICS_FEATURE_TOTALS)
@@ -629,15 +735,25 @@ def apply_schema(conn: sqlite3.Connection) -> int:
         conn.execute(_CREATE_ACTIVITY_EVENTS)
         conn.execute(_CREATE_ACTIVITY_EVENT_IDS)
         conn.execute(_CREATE_TTL_DEDUPE_ENTRIES)
+        conn.execute(_CREATE_SYNC_GUARD_ENTRIES)
         conn.execute(_CREATE_SYNC_RUN_REPORTS)
         conn.execute(_CREATE_SYNC_RUN_TIMELINE)
         conn.execute(_CREATE_SYNC_RUN_PROVIDER_COUNTS)
         conn.execute(_CREATE_SYNC_RUN_FEATURE_LANES)
         conn.execute(_CREATE_SYNC_RUN_SPOTLIGHT_ITEMS)
+        conn.execute(_CREATE_DASHBOARD_VIEW_SEGMENTS)
+        conn.execute(_CREATE_DASHBOARD_VIEW_ENDPOINTS)
+        conn.execute(_CREATE_DASHBOARD_VIEW_ROWS)
+        conn.execute(_CREATE_PLAYBACK_PROGRESS_CACHE)
         for stmt in _INDEXES:
             conn.execute(stmt)
         conn.execute(
             "INSERT OR IGNORE INTO schema_migrations(version, applied_at, name) VALUES(?,?,?)",
             (SCHEMA_VERSION, int(time.time()), "local_state"),
         )
+        # State readers compare against this generation row; the token tells databases apart.
+        conn.execute(
+            "INSERT OR IGNORE INTO state_meta(key,value_text,value_int,value_real,value_type,updated_at) VALUES(?,?,0,NULL,'int',?)",
+            ("state_generation", uuid.uuid4().hex, int(time.time())),
+        )
     return SCHEMA_VERSION
@@ -3,22 +3,27 @@
 # Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
 from __future__ import annotations
 
-import copy
 import re
 import sqlite3
 import threading
 import time
+import uuid
 from collections.abc import Mapping
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from . import dashboard_views
 from .db import get_conn
+from .frozen import freeze
 from .schema import ID_KEYS
 
 _LOCK = threading.RLock()
 _EVENT_KEY_RE = re.compile(r"^(?P<base>.+)@(?P<event>(?:\d{7,}|id:.+))$")
-_CACHE: dict[str, Any] = {"path": None, "fingerprint": None, "state": None}
+_CACHE: dict[str, Any] = {"path": None, "generation": None, "state": None, "features": {}, "token": None, "nodes": {}}
+_CACHE_FEATURE_SETS = 32
+_CACHE_NODES = 1024
+_GENERATION_KEY = "state_generation"
 _BASELINE_ITEM_COLUMNS = [
     "provider_state_id",
     "item_key",
@@ -385,6 +390,7 @@ def _replace_feature(
                 _BASELINE_ITEM_INSERT_SQL,
                 [(pfs_id, *row[1:-1], ts) for row in rows],
             )
+        dashboard_views.touch(conn, feature, "state", provider, instance)
         return True
 
     pfs_id = int(pfs["id"])
@@ -431,14 +437,26 @@ def _replace_feature(
             _BASELINE_ITEM_UPDATE_SQL,
             [(*row[2:-1], ts, pfs_id, str(row[1])) for row in update_rows],
         )
+    dashboard_views.touch(conn, feature, "state", provider, instance)
     return True
 
 
-def _fingerprint(conn: sqlite3.Connection) -> tuple[Any, ...]:
-    a = conn.execute("SELECT COUNT(*), COALESCE(MAX(updated_at),0) FROM provider_feature_state").fetchone()
-    b = conn.execute("SELECT COUNT(*), COALESCE(MAX(updated_at),0) FROM baseline_items").fetchone()
-    c = conn.execute("SELECT value_int,value_text,updated_at FROM state_meta WHERE key='last_sync_epoch'").fetchone()
-    return (a[0], a[1], b[0], b[1], tuple(c) if c else None)
+def _bump_generation(conn: sqlite3.Connection, ts: int) -> None:
+    # Runs inside the writer's transaction, so readers see the new generation
+    # together with the rows it describes. The token tells databases apart.
+    conn.execute(
+        "INSERT INTO state_meta(key,value_text,value_int,value_real,value_type,updated_at) VALUES(?,?,1,NULL,'int',?) "
+        "ON CONFLICT(key) DO UPDATE SET value_int=COALESCE(state_meta.value_int,0)+1,updated_at=excluded.updated_at",
+        (_GENERATION_KEY, uuid.uuid4().hex, ts),
+    )
+
+
+def _generation(conn: sqlite3.Connection) -> tuple[str, int]:
+    # apply_schema seeds the row; reads never write it.
+    row = conn.execute("SELECT value_text,value_int FROM state_meta WHERE key=?", (_GENERATION_KEY,)).fetchone()
+    if row is None:
+        return ("", 0)
+    return (str(row[0] or ""), int(row[1] or 0))
 
 
 def fingerprint(base_path: str | Path, features: set[str] | list[str] | tuple[str, ...] | None = None) -> tuple[Any, ...] | None:
@@ -448,26 +466,33 @@ def fingerprint(base_path: str | Path, features: set[str] | list[str] | tuple[st
         if conn is None:
             return None
         if not wanted:
-            return _fingerprint(conn)
-        placeholders = ",".join("?" for _ in wanted)
-        a = conn.execute(
-            f"SELECT COUNT(*), COALESCE(MAX(updated_at),0) FROM provider_feature_state WHERE feature IN ({placeholders})",
-            wanted,
-        ).fetchone()
-        b = conn.execute(
-            "SELECT COUNT(*), COALESCE(MAX(b.updated_at),0) "
-            "FROM baseline_items b "
-            "JOIN provider_feature_state p ON p.id=b.provider_state_id "
-            f"WHERE p.feature IN ({placeholders})",
-            wanted,
-        ).fetchone()
-        c = conn.execute("SELECT value_int,value_text,updated_at FROM state_meta WHERE key='last_sync_epoch'").fetchone()
-        return (tuple(wanted), a[0], a[1], b[0], b[1], tuple(c) if c else None)
+            return _generation(conn)
+        return (tuple(wanted), *_generation(conn))
+
+
+def generation(base_path: str | Path) -> tuple[str, int] | None:
+    """``(token, counter)`` bumped by every state write; equal values mean unchanged state."""
+    with _LOCK:
+        conn = get_conn(base_path)
+        return _generation(conn) if conn is not None else None
 
 
 def _invalidate() -> None:
-    _CACHE["fingerprint"] = None
+    _CACHE["generation"] = None
     _CACHE["state"] = None
+    _CACHE["features"] = {}
+
+
+def _cache_for(path_key: str, gen: tuple[str, int]) -> dict[str, Any]:
+    if _CACHE.get("path") != path_key or _CACHE.get("generation") != gen:
+        if _CACHE.get("path") != path_key or _CACHE.get("token") != gen[0]:
+            _CACHE["token"] = gen[0]
+            _CACHE["nodes"] = {}
+        _CACHE["path"] = path_key
+        _CACHE["generation"] = gen
+        _CACHE["state"] = None
+        _CACHE["features"] = {}
+    return _CACHE
 
 
 def has_state(base_path: str | Path) -> bool:
@@ -478,7 +503,14 @@ def has_state(base_path: str | Path) -> bool:
     return bool(row and int(row[0] or 0) > 0)
 
 
-def _build_state_from_feature_rows(conn: sqlite3.Connection, rows: list[sqlite3.Row]) -> dict[str, Any]:
+def _build_state_from_feature_rows(
+    conn: sqlite3.Connection,
+    rows: list[sqlite3.Row],
+    nodes: dict[int, tuple[Any, Any]] | None = None,
+) -> dict[str, Any]:
+    # ``nodes`` keeps frozen feature nodes across generations: a row whose
+    # updated_at did not move is handed out again as the same object, so
+    # readers can tell which providers actually changed.
     providers: dict[str, Any] = {}
     wall: list[dict[str, Any]] = []
     for pfs in rows:
@@ -489,19 +521,28 @@ def _build_state_from_feature_rows(conn: sqlite3.Connection, rows: list[sqlite3.
             insts = pnode.setdefault("instances", {})
             target = insts.setdefault(inst, {})
         feature = str(pfs["feature"])
-        feat_node: dict[str, Any] = {"baseline": {"items": {}}}
-        checkpoint = _scalar_from_row(pfs, "checkpoint")
-        if checkpoint is not None:
-            feat_node["checkpoint"] = checkpoint
-        items = conn.execute(
-            "SELECT * FROM baseline_items WHERE provider_state_id=? ORDER BY item_key",
-            (int(pfs["id"]),),
-        ).fetchall()
-        for row in items:
-            item = _row_to_item(row)
-            feat_node["baseline"]["items"][str(row["item_key"])] = item
-            if feature == "watchlist":
-                wall.append(item)
+        pfs_id = int(pfs["id"])
+        hit = nodes.get(pfs_id) if nodes is not None else None
+        if hit is not None and hit[0] == pfs["updated_at"]:
+            feat_node = hit[1]
+        else:
+            feat_node = {"baseline": {"items": {}}}
+            checkpoint = _scalar_from_row(pfs, "checkpoint")
+            if checkpoint is not None:
+                feat_node["checkpoint"] = checkpoint
+            items = conn.execute(
+                "SELECT * FROM baseline_items WHERE provider_state_id=? ORDER BY item_key",
+                (pfs_id,),
+            ).fetchall()
+            for row in items:
+                feat_node["baseline"]["items"][str(row["item_key"])] = _row_to_item(row)
+            feat_node = freeze(feat_node)
+            if nodes is not None:
+                if len(nodes) >= _CACHE_NODES:
+                    nodes.clear()
+                nodes[pfs_id] = (pfs["updated_at"], feat_node)
+        if feature == "watchlist":
+            wall.extend(feat_node["baseline"]["items"].values())
         target[feature] = feat_node
     return {
         "providers": providers,
@@ -511,25 +552,25 @@ def _build_state_from_feature_rows(conn: sqlite3.Connection, rows: list[sqlite3.
 
 
 def load_state(base_path: str | Path) -> dict[str, Any]:
+    """Full state as a read-only view shared by every caller until the next write.
+
+    Callers that need to edit the result take ``mutable_copy()`` of it.
+    """
     with _LOCK:
         conn = get_conn(base_path)
         if conn is None:
             return {"providers": {}, "wall": [], "last_sync_epoch": None}
-        path_key = str(Path(base_path).resolve())
-        fp = _fingerprint(conn)
-        if _CACHE.get("path") == path_key and _CACHE.get("fingerprint") == fp and isinstance(_CACHE.get("state"), dict):
-            return copy.deepcopy(_CACHE["state"])
-        rows = conn.execute(
-            "SELECT * FROM provider_feature_state ORDER BY provider, instance, feature"
-        ).fetchall()
-        state = _build_state_from_feature_rows(conn, rows)
-        _CACHE["path"] = path_key
-        _CACHE["fingerprint"] = fp
-        _CACHE["state"] = copy.deepcopy(state)
-        return state
+        cache = _cache_for(str(Path(base_path).resolve()), _generation(conn))
+        if cache["state"] is None:
+            rows = conn.execute(
+                "SELECT * FROM provider_feature_state ORDER BY provider, instance, feature"
+            ).fetchall()
+            cache["state"] = freeze(_build_state_from_feature_rows(conn, rows, cache["nodes"]))
+        return cache["state"]
 
 
 def load_state_features(base_path: str | Path, features: set[str] | list[str] | tuple[str, ...]) -> dict[str, Any]:
+    """Like ``load_state`` for a subset of features; also a shared read-only view."""
     wanted = sorted({str(feature or "").strip().lower() for feature in features or [] if str(feature or "").strip()})
     if not wanted:
         return {"providers": {}, "wall": [], "last_sync_epoch": None}
@@ -537,29 +578,49 @@ def load_state_features(base_path: str | Path, features: set[str] | list[str] |
         conn = get_conn(base_path)
         if conn is None:
             return {"providers": {}, "wall": [], "last_sync_epoch": None}
-        placeholders = ",".join("?" for _ in wanted)
-        rows = conn.execute(
-            f"SELECT * FROM provider_feature_state WHERE feature IN ({placeholders}) ORDER BY provider, instance, feature",
-            wanted,
-        ).fetchall()
-        return _build_state_from_feature_rows(conn, rows)
+        cache = _cache_for(str(Path(base_path).resolve()), _generation(conn))
+        views: dict[tuple[str, ...], Any] = cache["features"]
+        key = tuple(wanted)
+        view = views.get(key)
+        if view is None:
+            placeholders = ",".join("?" for _ in wanted)
+            rows = conn.execute(
+                f"SELECT * FROM provider_feature_state WHERE feature IN ({placeholders}) ORDER BY provider, instance, feature",
+                wanted,
+            ).fetchall()
+            view = freeze(_build_state_from_feature_rows(conn, rows, cache["nodes"]))
+            if len(views) >= _CACHE_FEATURE_SETS:
+                views.clear()
+            views[key] = view
+        return view
+
+
+def load_feature_items(base_path: str | Path, provider: str, instance: str, feature: str) -> dict[str, Any]:
+    from .baseline_query import iter_items
+
+    provider, instance, feature = _feature_key(provider, instance, feature)
+    # One lock across every batch: a save cannot land between two pages of the walk.
+    with _LOCK:
+        rows = iter_items(base_path, provider=provider, instance=instance, feature=feature, batch_size=2000)
+        return {row["key"]: row["item"] for row in rows}
 
 
 def provider_feature_counts(base_path: str | Path, feature: str = "watchlist") -> dict[str, int]:
     feat = str(feature or "").strip().lower()
     if not feat:
         return {}
-    conn = get_conn(base_path)
-    if conn is None:
-        return {}
-    rows = conn.execute(
-        "SELECT p.provider AS provider, COUNT(DISTINCT b.item_key) AS count "
-        "FROM provider_feature_state p "
-        "LEFT JOIN baseline_items b ON b.provider_state_id=p.id "
-        "WHERE p.feature=? "
-        "GROUP BY p.provider",
-        (feat,),
-    ).fetchall()
+    with _LOCK:
+        conn = get_conn(base_path)
+        if conn is None:
+            return {}
+        rows = conn.execute(
+            "SELECT p.provider AS provider, COUNT(DISTINCT b.item_key) AS count "
+            "FROM provider_feature_state p "
+            "LEFT JOIN baseline_items b ON b.provider_state_id=p.id "
+            "WHERE p.feature=? "
+            "GROUP BY p.provider",
+            (feat,),
+        ).fetchall()
     return {
         str(row["provider"] or "").upper(): int(row["count"] or 0)
         for row in rows
@@ -568,34 +629,36 @@ def provider_feature_counts(base_path: str | Path, feature: str = "watchlist") -
 
 
 def provider_names(base_path: str | Path, features: set[str] | list[str] | tuple[str, ...] | None = None) -> list[str]:
-    conn = get_conn(base_path)
-    if conn is None:
-        return []
     wanted = sorted({str(feature or "").strip().lower() for feature in features or [] if str(feature or "").strip()})
-    if wanted:
-        placeholders = ",".join("?" for _ in wanted)
-        rows = conn.execute(
-            f"SELECT DISTINCT provider FROM provider_feature_state WHERE feature IN ({placeholders}) ORDER BY provider",
-            wanted,
-        ).fetchall()
-    else:
-        rows = conn.execute("SELECT DISTINCT provider FROM provider_feature_state ORDER BY provider").fetchall()
+    with _LOCK:
+        conn = get_conn(base_path)
+        if conn is None:
+            return []
+        if wanted:
+            placeholders = ",".join("?" for _ in wanted)
+            rows = conn.execute(
+                f"SELECT DISTINCT provider FROM provider_feature_state WHERE feature IN ({placeholders}) ORDER BY provider",
+                wanted,
+            ).fetchall()
+        else:
+            rows = conn.execute("SELECT DISTINCT provider FROM provider_feature_state ORDER BY provider").fetchall()
     return [str(row["provider"] or "").upper() for row in rows if str(row["provider"] or "").strip()]
 
 
 def feature_inventory(base_path: str | Path) -> list[dict[str, Any]]:
-    conn = get_conn(base_path)
-    if conn is None:
-        return []
-    rows = conn.execute(
-        "SELECT p.provider AS provider,p.instance AS instance,p.feature AS feature,p.mode AS mode,"
-        "p.checkpoint_text AS checkpoint_text,p.checkpoint_int AS checkpoint_int,"
-        "p.checkpoint_real AS checkpoint_real,p.checkpoint_type AS checkpoint_type,"
-        "p.updated_at AS updated_at,COUNT(b.item_key) AS items "
-        "FROM provider_feature_state p "
-        "LEFT JOIN baseline_items b ON b.provider_state_id=p.id "
-        "GROUP BY p.id ORDER BY p.provider,p.instance,p.feature"
-    ).fetchall()
+    with _LOCK:
+        conn = get_conn(base_path)
+        if conn is None:
+            return []
+        rows = conn.execute(
+            "SELECT p.provider AS provider,p.instance AS instance,p.feature AS feature,p.mode AS mode,"
+            "p.checkpoint_text AS checkpoint_text,p.checkpoint_int AS checkpoint_int,"
+            "p.checkpoint_real AS checkpoint_real,p.checkpoint_type AS checkpoint_type,"
+            "p.updated_at AS updated_at,COUNT(b.item_key) AS items "
+            "FROM provider_feature_state p "
+            "LEFT JOIN baseline_items b ON b.provider_state_id=p.id "
+            "GROUP BY p.id ORDER BY p.provider,p.instance,p.feature"
+        ).fetchall()
     return [
         {
             "provider": str(row["provider"] or "").upper(),
@@ -632,11 +695,14 @@ def save_state(base_path: str | Path, state: Mapping[str, Any]) -> None:
             existing = conn.execute(
                 "SELECT id,provider,instance,feature FROM provider_feature_state"
             ).fetchall()
-            stale_ids = [
-                int(row["id"])
+            stale = [
+                row
                 for row in existing
                 if _feature_key(row["provider"], row["instance"], row["feature"]) not in incoming
             ]
+            stale_ids = [int(row["id"]) for row in stale]
+            for row in stale:
+                dashboard_views.touch(conn, str(row["feature"]), "state", str(row["provider"]), str(row["instance"]))
             if stale_ids:
                 placeholders = ",".join("?" for _ in stale_ids)
                 conn.execute(
@@ -645,6 +711,7 @@ def save_state(base_path: str | Path, state: Mapping[str, Any]) -> None:
                 )
             if isinstance(state, Mapping):
                 _set_meta(conn, "last_sync_epoch", state.get("last_sync_epoch"), ts)
+            _bump_generation(conn, ts)
         _invalidate()
 
 
@@ -668,6 +735,7 @@ def save_feature_baseline(
             _replace_feature(conn, provider, instance, feature, block, ts)
             if last_sync_epoch is not None:
                 _set_meta(conn, "last_sync_epoch", last_sync_epoch, ts)
+            _bump_generation(conn, ts)
         _invalidate()
 
 
@@ -690,6 +758,7 @@ def save_feature_blocks(
                 _replace_feature(conn, provider, instance, feature, block, ts)
             if last_sync_epoch is not None:
                 _set_meta(conn, "last_sync_epoch", last_sync_epoch, ts)
+            _bump_generation(conn, ts)
         _invalidate()
 
 
@@ -698,8 +767,10 @@ def set_last_sync_epoch(base_path: str | Path, value: Any) -> None:
         conn = get_conn(base_path)
         if conn is None:
             return
+        ts = _now()
         with conn:
-            _set_meta(conn, "last_sync_epoch", value, _now())
+            _set_meta(conn, "last_sync_epoch", value, ts)
+            _bump_generation(conn, ts)
         _invalidate()
 
 
@@ -711,7 +782,9 @@ def clear_state(base_path: str | Path) -> None:
         with conn:
             conn.execute("DELETE FROM baseline_items")
             conn.execute("DELETE FROM provider_feature_state")
-            conn.execute("DELETE FROM state_meta")
+            conn.execute("DELETE FROM state_meta WHERE key<>?", (_GENERATION_KEY,))
+            _bump_generation(conn, _now())
+            dashboard_views.touch_origin(conn, "state")
         _invalidate()
 
 
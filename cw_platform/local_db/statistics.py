@@ -558,6 +558,7 @@ def clear_statistics(base_path: str | Path) -> None:
                 "statistics_http_events",
                 "statistics_http_counters",
                 "statistics_http_last",
+                "statistics_http_latency",
                 "statistics_feature_totals",
                 "statistics_ingested_runs",
                 "statistics_meta",
@@ -6,6 +6,7 @@ from __future__ import annotations
 import importlib
 import json
 import pkgutil
+import threading
 from typing import Any, Callable, Mapping, Optional, cast
 
 try:
@@ -99,7 +100,23 @@ class MetadataManager:
     ) -> None:
         self.load_cfg = load_cfg
         self.save_cfg = save_cfg
-        self.providers: dict[str, Any] = self._discover()
+        self._providers: dict[str, Any] | None = None
+        self._providers_lock = threading.Lock()
+
+    # Providers are discovered on first use so importing the manager stays cheap.
+    @property
+    def providers(self) -> dict[str, Any]:
+        found = self._providers
+        if found is None:
+            with self._providers_lock:
+                if self._providers is None:
+                    self._providers = self._discover()
+                found = self._providers
+        return found
+
+    @providers.setter
+    def providers(self, value: dict[str, Any]) -> None:
+        self._providers = value
 
     # Discovery
     def _discover(self) -> dict[str, Any]:
@@ -2,9 +2,12 @@
 # Applier logic for adding/removing items in destination services.
 # Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
 from __future__ import annotations
+import time
 from collections.abc import Sequence, Mapping
 from typing import Any, Callable, cast
 from . import _unresolved as _unresolved_mod
+from ._chunking import AdaptiveChunker, is_throttle_error
+from ..compact_item import plain
 from ..run_control import cancel_requested
 record_unresolved = cast(Callable[..., dict[str, Any]], getattr(_unresolved_mod, "record_unresolved"))
 
@@ -22,13 +25,32 @@ _PASSTHROUGH_KEY_LISTS = (
 
 _PASSTHROUGH_KEY_MAPS = ("confirmed_destinations",)
 
-def _retry(fn: Callable[[], Any], *, attempts: int = 3, base_sleep: float = 0.5) -> Any:
+def _retry_after(exc: BaseException) -> float | None:
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        raw = str(headers.get("Retry-After") or "").strip()
+        return min(float(raw), 30.0) if raw else None
+    except Exception:
+        return None
+
+
+def _retry(
+    fn: Callable[[], Any],
+    *,
+    attempts: int = 3,
+    base_sleep: float = 0.5,
+    on_error: Callable[[BaseException], None] | None = None,
+) -> Any:
     last = None
     for i in range(attempts):
         try: return fn()
         except Exception as e:
             last = e
-            __import__("time").sleep(base_sleep * (2 ** i))
+            if on_error:
+                on_error(e)
+            if i + 1 < attempts:
+                wait = _retry_after(e)
+                time.sleep(wait if wait is not None else base_sleep * (2 ** i))
     raise last  # type: ignore
 
 
@@ -373,6 +395,7 @@ def _apply_chunked(
     dbg,
     chunk_size: int,
     chunk_pause_ms: int,
+    adaptive: AdaptiveChunker | None = None,
 ) -> dict[str, Any]:
     total = len(items)
     if total == 0:
@@ -380,10 +403,37 @@ def _apply_chunked(
     if cancel_requested():
         emit(f"{tag}:cancelled", dst=dst, feature=feature, done=0, total=total)
         return {"ok": True, "attempted": 0, "confirmed": 0, "skipped": 0, "unresolved": 0, "errors": 0, "count": 0, "cancelled": True}
-    csize = int(chunk_size or 0)
+    throttles = 0
+
+    def _on_error(exc: BaseException) -> None:
+        nonlocal throttles
+        if is_throttle_error(exc):
+            throttles += 1
+
+    def _timed(chunk: Sequence[Mapping[str, Any]]) -> dict[str, Any]:
+        nonlocal throttles
+        throttles = 0
+        t0 = time.monotonic()
+        raw = _retry(lambda: call(chunk), on_error=_on_error if adaptive else None)
+        res = _normalize(raw, chunk, tag, dst=dst, feature=feature, emit=emit)
+        if adaptive is not None:
+            ms = int((time.monotonic() - t0) * 1000)
+            size = len(chunk)
+            cooldown = adaptive.observe(size, ms, ok=res["ok"], errors=res["errors"], throttled=throttles > 0)
+            emit(f"{tag}:chunk", dst=dst, feature=feature, size=size, ms=ms, next_size=adaptive.size, throttled=throttles > 0)
+            if cooldown:
+                time.sleep(cooldown / 1000.0)
+        return res
+
+    def _finish(res: dict[str, Any]) -> dict[str, Any]:
+        if adaptive is not None and adaptive.chunks:
+            adaptive.save()
+            res["chunking"] = {**adaptive.summary(), "per_chunk": list(adaptive.chunks[-50:])}
+        return res
+
+    csize = int(adaptive.size if adaptive is not None else (chunk_size or 0))
     if csize <= 0 or total <= csize:
-        raw = _retry(lambda: call(items))
-        return _normalize(raw, items, tag, dst=dst, feature=feature, emit=emit)
+        return _finish(_timed(items))
 
     done = 0
     agg: dict[str, Any] = {
@@ -401,14 +451,17 @@ def _apply_chunked(
         "unresolved_keys": [],
         "errors": 0,
     }
-    for i in range(0, total, csize):
+    i = 0
+    while i < total:
         if cancel_requested():
             agg["cancelled"] = True
             emit(f"{tag}:cancelled", dst=dst, feature=feature, done=done, total=total)
             break
+        if adaptive is not None:
+            csize = adaptive.size
         chunk = items[i : i + csize]
-        raw = _retry(lambda: call(chunk))
-        res = _normalize(raw, chunk, tag, dst=dst, feature=feature, emit=emit)
+        i += len(chunk)
+        res = _timed(chunk)
         agg["ok"] = agg["ok"] and res["ok"]
         agg["attempted"] += res["attempted"]
         agg["confirmed"] += res["confirmed"]
@@ -445,11 +498,11 @@ def _apply_chunked(
         pause = int(chunk_pause_ms or 0)
         if pause:
             try:
-                __import__("time").sleep(pause / 1000.0)
+                time.sleep(pause / 1000.0)
             except Exception:
                 pass
     agg["count"] = agg["confirmed"]
-    return agg
+    return _finish(agg)
 
 def _mark_dry_run(res: dict[str, Any]) -> dict[str, Any]:
     res["dry_run"] = True
@@ -470,6 +523,7 @@ def apply_add(
     dbg,
     chunk_size: int,
     chunk_pause_ms: int,
+    adaptive: AdaptiveChunker | None = None,
 ) -> dict[str, Any]:
     emit("apply:add:start", dst=dst_name, feature=feature, count=len(items))
     res = _apply_chunked(
@@ -477,11 +531,12 @@ def apply_add(
         dst=dst_name,
         feature=feature,
         items=items,
-        call=lambda ch: dst_ops.add(cfg, ch, feature=feature, dry_run=dry_run),
+        call=lambda ch: dst_ops.add(cfg, [plain(it) for it in ch], feature=feature, dry_run=dry_run),
         emit=emit,
         dbg=dbg,
         chunk_size=chunk_size,
         chunk_pause_ms=chunk_pause_ms,
+        adaptive=None if dry_run else adaptive,
     )
     if dry_run:
         _mark_dry_run(res)
@@ -500,6 +555,8 @@ def apply_add(
         "unresolved": int(res.get("unresolved", 0)),
         "errors": int(res.get("errors", 0)),
     }
+    if res.get("chunking"):
+        payload["chunking"] = {k: v for k, v in res["chunking"].items() if k != "per_chunk"}
     emit("apply:add:done", **payload)
     try:
         spotlight = _ui_spotlight_items(
@@ -525,6 +582,7 @@ def apply_update(
     dbg,
     chunk_size: int,
     chunk_pause_ms: int,
+    adaptive: AdaptiveChunker | None = None,
 ) -> dict[str, Any]:
     emit("apply:update:start", dst=dst_name, feature=feature, count=len(items))
     res = _apply_chunked(
@@ -532,11 +590,12 @@ def apply_update(
         dst=dst_name,
         feature=feature,
         items=items,
-        call=lambda ch: dst_ops.add(cfg, ch, feature=feature, dry_run=dry_run),
+        call=lambda ch: dst_ops.add(cfg, [plain(it) for it in ch], feature=feature, dry_run=dry_run),
         emit=emit,
         dbg=dbg,
         chunk_size=chunk_size,
         chunk_pause_ms=chunk_pause_ms,
+        adaptive=None if dry_run else adaptive,
     )
     if dry_run:
         _mark_dry_run(res)
@@ -555,6 +614,8 @@ def apply_update(
         "unresolved": int(res.get("unresolved", 0)),
         "errors": int(res.get("errors", 0)),
     }
+    if res.get("chunking"):
+        payload["chunking"] = {k: v for k, v in res["chunking"].items() if k != "per_chunk"}
     emit("apply:update:done", **payload)
     try:
         spotlight = _ui_spotlight_items(
@@ -580,6 +641,7 @@ def apply_remove(
     dbg,
     chunk_size: int,
     chunk_pause_ms: int,
+    adaptive: AdaptiveChunker | None = None,
 ) -> dict[str, Any]:
     emit("apply:remove:start", dst=dst_name, feature=feature, count=len(items))
     res = _apply_chunked(
@@ -587,11 +649,12 @@ def apply_remove(
         dst=dst_name,
         feature=feature,
         items=items,
-        call=lambda ch: dst_ops.remove(cfg, ch, feature=feature, dry_run=dry_run),
+        call=lambda ch: dst_ops.remove(cfg, [plain(it) for it in ch], feature=feature, dry_run=dry_run),
         emit=emit,
         dbg=dbg,
         chunk_size=chunk_size,
         chunk_pause_ms=chunk_pause_ms,
+        adaptive=None if dry_run else adaptive,
     )
     if dry_run:
         _mark_dry_run(res)
@@ -610,6 +673,8 @@ def apply_remove(
         "unresolved": int(res.get("unresolved", 0)),
         "errors": int(res.get("errors", 0)),
     }
+    if res.get("chunking"):
+        payload["chunking"] = {k: v for k, v in res["chunking"].items() if k != "per_chunk"}
     emit("apply:remove:done", **payload)
     try:
         spotlight = _ui_spotlight_items(
@@ -6,55 +6,40 @@ from pathlib import Path
 from collections.abc import Mapping, Iterable
 from typing import Any
 import json, time
-import shutil
 
+from ..local_db import guard_state
+from ..local_db.ttl_dedupe import base_path_from_state_dir
 from ._scope import scope_safe
 
 STATE_DIR = Path("/config/.cw_state")
 
-def _read_json(p: Path) -> dict[str, Any]:
+def _base() -> Path | None:
+    base = base_path_from_state_dir(STATE_DIR)
     try:
-        if not p.exists():
-            return {}
-        return json.loads(p.read_text("utf-8")) or {}
+        guard_state.import_legacy_files(base, STATE_DIR)
+    except Exception:
+        pass
+    return base
+
+def _group(dst: str, feature: str, pair: str | None = None) -> tuple[str, str, str]:
+    scope = str(pair).strip().lower() if pair else scope_safe()
+    return str(dst).strip().lower(), str(feature).strip().lower(), scope
+
+def _flap_rows(base: Path | None, dst: str, feature: str, keys: Iterable[str] | None = None) -> dict[str, dict[str, Any]]:
+    prov, feat, scope = _group(dst, feature)
+    try:
+        got = guard_state.entries(base, guard_state.FLAP, provider=prov, feature=feat, scopes=scope, keys=keys)
     except Exception:
         return {}
+    return {e["key"]: dict(e["data"] or {}) for e in got}
 
-def _write_json(p: Path, obj: dict[str, Any]) -> None:
+def _write_flaps(base: Path | None, dst: str, feature: str, rows: Mapping[str, Mapping[str, Any]], ts: int) -> None:
+    prov, feat, scope = _group(dst, feature)
     try:
-        p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(json.dumps(obj, indent=2, sort_keys=True), encoding="utf-8")
+        guard_state.upsert(base, guard_state.FLAP, prov, feat, scope, rows, ts=ts)
     except Exception:
         pass
 
-def _bb_path(dst: str, feature: str, pair: str | None = None) -> Path:
-    dst = str(dst).strip().lower()
-    feature = str(feature).strip().lower()
-    scope = str(pair).strip().lower() if pair else scope_safe()
-    scoped = STATE_DIR / f"{dst}_{feature}.{scope}.blackbox.json"
-    legacy = STATE_DIR / f"{dst}_{feature}.blackbox.json"
-    if not scoped.exists() and legacy.exists():
-        try:
-            STATE_DIR.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(legacy, scoped)
-        except Exception:
-            pass
-    return scoped
-
-def _flap_path(dst: str, feature: str, pair: str | None = None) -> Path:
-    dst = str(dst).strip().lower()
-    feature = str(feature).strip().lower()
-    scope = str(pair).strip().lower() if pair else scope_safe()
-    scoped = STATE_DIR / f"{dst}_{feature}.{scope}.flap.json"
-    legacy = STATE_DIR / f"{dst}_{feature}.flap.json"
-    if not scoped.exists() and legacy.exists():
-        try:
-            STATE_DIR.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(legacy, scoped)
-        except Exception:
-            pass
-    return scoped
-
 _DEFAULT_BB: dict[str, Any] = {
     "enabled": True,
     "promote_after": 3,
@@ -82,46 +67,41 @@ def _load_bb_cfg(cfg: Mapping[str, Any] | None) -> dict[str, Any]:
     return dict(_DEFAULT_BB)
 
 def load_blackbox_keys(dst: str, feature: str, pair: str | None = None) -> set[str]:
-    keys: set[str] = set()
-    glob = _read_json(_bb_path(dst, feature))
-    keys |= set(glob.keys())
+    prov, feat, scope = _group(dst, feature)
+    scopes = [scope]
     if pair:
-        prs = _read_json(_bb_path(dst, feature, pair))
-        keys |= set(prs.keys())
-    return keys
+        scopes.append(_group(dst, feature, pair)[2])
+    try:
+        return guard_state.load_keys(_base(), guard_state.BLACKBOX, provider=prov, feature=feat, scopes=scopes)
+    except Exception:
+        return set()
 
 def load_flap_counters(dst: str, feature: str) -> dict[str, dict[str, Any]]:
-    return _read_json(_flap_path(dst, feature))
+    return _flap_rows(_base(), dst, feature)
 
 def inc_flap(dst: str, feature: str, key: str, *, reason: str, op: str, ts: int | None = None) -> int:
     ts = int(ts or time.time())
-    path = _flap_path(dst, feature)
-    m = _read_json(path)
-    row = m.setdefault(key, {})
+    base = _base()
+    row = _flap_rows(base, dst, feature, [key]).get(key, {})
     row["consecutive"] = int(row.get("consecutive") or 0) + 1
     row["last_reason"] = str(reason or "")
     row["last_op"] = str(op or "")
     row["last_attempt_ts"] = ts
-    _write_json(path, m)
+    _write_flaps(base, dst, feature, {key: row}, ts)
     return int(row["consecutive"])
 
 def reset_flap(dst: str, feature: str, key: str, *, ts: int | None = None) -> None:
-    ts = int(ts or time.time())
-    path = _flap_path(dst, feature)
-    m = _read_json(path)
-    row = m.setdefault(key, {})
-    row["consecutive"] = 0
-    row["last_reason"] = "ok"
-    row["last_op"] = str(row.get("last_op") or "")
-    row["last_success_ts"] = ts
-    _write_json(path, m)
+    record_success(dst, feature, [key], ts=ts)
 
 def _promote(dst: str, feature: str, key: str, *, reason: str, ts: int, pair: str | None) -> None:
-    path = _bb_path(dst, feature, pair)
-    data = _read_json(path)
-    if key not in data:
-        data[key] = {"reason": str(reason or "flapper"), "since": int(ts)}
-        _write_json(path, data)
+    prov, feat, scope = _group(dst, feature, pair)
+    try:
+        guard_state.upsert(
+            _base(), guard_state.BLACKBOX, prov, feat, scope,
+            {key: {"reason": str(reason or "flapper")}}, ts=int(ts), keep_existing=True,
+        )
+    except Exception:
+        pass
 
 def _normalize_keys(keys: Iterable[str] | None) -> tuple[list[str], list[str]]:
     ordered: list[str] = []
@@ -164,45 +144,37 @@ def record_attempts(
         }
 
     ts = int(time.time())
-    flap_path = _flap_path(dst, feature)
-    flap_data = _read_json(flap_path)
-
+    base = _base()
+    flap_data = _flap_rows(base, dst, feature, unique_keys)
     promote_after = int(bb.get("promote_after", 3) or 3)
-    bb_path = _bb_path(dst, feature, scoped_pair)
-    bb_data = _read_json(bb_path)
-
-    flap_changed = False
-    bb_changed = False
-    promoted = 0
-    promoted_keys: list[str] = []
+    promote_reason = f"flapper:consecutive>={promote_after}"
 
+    due: list[str] = []
     for key in unique_keys:
         row = flap_data.setdefault(key, {})
         row["consecutive"] = int(row.get("consecutive") or 0) + 1
         row["last_reason"] = str(reason or "")
         row["last_op"] = str(op or "")
         row["last_attempt_ts"] = ts
-        flap_changed = True
+        if int(row.get("consecutive") or 0) >= promote_after:
+            due.append(key)
 
-        should_promote = False
-        promote_reason = ""
-        cons = int(row.get("consecutive") or 0)
-        if cons >= promote_after:
-            should_promote = True
-            promote_reason = f"flapper:consecutive>={promote_after}"
+    _write_flaps(base, dst, feature, flap_data, ts)
 
-        if should_promote and key not in bb_data:
-            bb_data[key] = {"reason": promote_reason or str(reason or "flapper"), "since": int(ts)}
-            bb_changed = True
-            promoted += 1
-            promoted_keys.append(key)
-
-    if flap_changed:
-        _write_json(flap_path, flap_data)
-    if bb_changed:
-        _write_json(bb_path, bb_data)
+    promoted_keys: list[str] = []
+    if due:
+        prov, feat, scope = _group(dst, feature, scoped_pair)
+        try:
+            present = guard_state.load_keys(base, guard_state.BLACKBOX, provider=prov, feature=feat, scopes=scope, keys=due)
+            promoted_keys = [k for k in due if k not in present]
+            guard_state.upsert(
+                base, guard_state.BLACKBOX, prov, feat, scope,
+                {k: {"reason": promote_reason} for k in promoted_keys}, ts=ts, keep_existing=True,
+            )
+        except Exception:
+            promoted_keys = []
 
-    return {"ok": True, "count": len(ordered_keys), "promoted": promoted, "promoted_keys": promoted_keys, "pair": scoped_pair or "global"}
+    return {"ok": True, "count": len(ordered_keys), "promoted": len(promoted_keys), "promoted_keys": promoted_keys, "pair": scoped_pair or "global"}
 
 
 def record_success(
@@ -212,50 +184,30 @@ def record_success(
     *,
     pair: str | None = None,
     cfg: Mapping[str, Any] | None = None,
+    ts: int | None = None,
 ) -> dict[str, Any]:
-    ts = int(time.time())
+    ts = int(ts or time.time())
     ordered_keys, unique_keys = _normalize_keys(keys)
     if not unique_keys:
         return {"ok": True, "count": 0}
 
-    flap_path = _flap_path(dst, feature)
-    flap_data = _read_json(flap_path)
-    changed = False
-
+    base = _base()
+    flap_data = _flap_rows(base, dst, feature, unique_keys)
     for key in unique_keys:
         row = flap_data.setdefault(key, {})
         row["consecutive"] = 0
         row["last_reason"] = "ok"
         row["last_op"] = str(row.get("last_op") or "")
         row["last_success_ts"] = ts
-        changed = True
-
-    if changed:
-        _write_json(flap_path, flap_data)
+    _write_flaps(base, dst, feature, flap_data, ts)
 
     return {"ok": True, "count": len(ordered_keys)}
 
 def prune_blackbox(*, cooldown_days: int = 30) -> tuple[int, int]:
-    scanned = 0
-    removed = 0
-    now = int(time.time())
-    if not STATE_DIR.exists():
+    base = _base()
+    try:
+        scanned = guard_state.count_groups(base, guard_state.BLACKBOX)
+        removed = guard_state.prune_before(base, guard_state.BLACKBOX, int(time.time()) - cooldown_days * 86400)
+    except Exception:
         return (0, 0)
-    for p in STATE_DIR.iterdir():
-        if not p.is_file():
-            continue
-        name = p.name
-        if not name.endswith(".blackbox.json"):
-            continue
-        scanned += 1
-        data = _read_json(p)
-        changed = False
-        for k in list(data.keys()):
-            since = int((data.get(k) or {}).get("since") or 0)
-            if since and (now - since) > (cooldown_days * 86400):
-                data.pop(k, None)
-                changed = True
-                removed += 1
-        if changed:
-            _write_json(p, data)
     return (scanned, removed)
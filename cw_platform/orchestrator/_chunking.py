@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import json
+import threading
+import time
 from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 
@@ -21,3 +26,177 @@ def effective_chunk_size(ctx: Any, provider_name: str) -> int:
     except Exception:
         n = 0
     return n if n > 0 else base
+
+
+STATE_DIR = Path("/config/.cw_state")
+_STATE_NAME = "apply_chunks.json"
+_LOCK = threading.Lock()
+
+_THROTTLE_STATUS = frozenset({429, 502, 503, 504})
+
+try:
+    from requests.exceptions import Timeout as _RequestsTimeout
+except Exception:  # pragma: no cover - requests is a hard dependency of the providers
+    _RequestsTimeout = TimeoutError  # type: ignore[misc,assignment]
+
+
+def _read_state() -> dict[str, Any]:
+    p = STATE_DIR / _STATE_NAME
+    try:
+        if not p.exists():
+            return {}
+        data = json.loads(p.read_text("utf-8") or "{}")
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _write_state(data: Mapping[str, Any]) -> None:
+    p = STATE_DIR / _STATE_NAME
+    try:
+        p.parent.mkdir(parents=True, exist_ok=True)
+        tmp = p.with_suffix(p.suffix + ".tmp")
+        tmp.write_text(json.dumps(data, indent=2, sort_keys=True), "utf-8")
+        tmp.replace(p)
+    except Exception:
+        pass
+
+
+def is_throttle_error(exc: BaseException) -> bool:
+    seen = 0
+    cur: BaseException | None = exc
+    while cur is not None and seen < 5:
+        if isinstance(cur, (TimeoutError, _RequestsTimeout)):
+            return True
+        status = getattr(cur, "status_code", None)
+        if status is None:
+            status = getattr(getattr(cur, "response", None), "status_code", None)
+        try:
+            if status is not None and int(status) in _THROTTLE_STATUS:
+                return True
+        except (TypeError, ValueError):
+            pass
+        cur = cur.__cause__ or cur.__context__
+        seen += 1
+    return False
+
+
+def _declared_max(caps: Any, feature: str) -> int:
+    if not isinstance(caps, Mapping):
+        return 0
+    for block in (caps.get(feature), caps.get("apply")):
+        if isinstance(block, Mapping):
+            try:
+                n = int(block.get("max_chunk") or 0)
+            except Exception:
+                n = 0
+            if n > 0:
+                return n
+    return 0
+
+
+@dataclass
+class AdaptiveChunker:
+    provider: str
+    feature: str
+    size: int
+    min_size: int = 10
+    max_size: int = 1000
+    target_ms: int = 3000
+    step: int = 0
+    persist: bool = True
+    throttle_streak: int = 0
+    chunks: list[dict[str, Any]] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.provider = str(self.provider or "").upper()
+        self.feature = str(self.feature or "").lower()
+        self.min_size = max(1, int(self.min_size))
+        self.max_size = max(self.min_size, int(self.max_size))
+        self.size = self._clamp(self.size)
+        if self.step <= 0:
+            self.step = max(1, self.size // 4)
+
+    @property
+    def key(self) -> str:
+        return f"{self.provider}:{self.feature}"
+
+    def _clamp(self, n: int) -> int:
+        return max(self.min_size, min(self.max_size, int(n or self.min_size)))
+
+    def observe(self, size: int, ms: int, *, ok: bool = True, errors: int = 0, throttled: bool = False) -> int:
+        before = self.size
+        cooldown_ms = 0
+        if throttled:
+            self.throttle_streak += 1
+            self.size = self._clamp(self.size // 2)
+            cooldown_ms = min(30_000, 1000 * (2 ** (self.throttle_streak - 1)))
+            verdict = "throttled"
+        elif errors or not ok or ms > self.target_ms:
+            self.throttle_streak = 0
+            self.size = self._clamp(int(self.size * 0.75))
+            verdict = "slow" if ms > self.target_ms else "errors"
+        else:
+            self.throttle_streak = 0
+            if size >= before:
+                self.size = self._clamp(self.size + self.step)
+            verdict = "healthy"
+        self.chunks.append({"size": int(size), "ms": int(ms), "verdict": verdict, "next": self.size})
+        return cooldown_ms
+
+    def summary(self) -> dict[str, Any]:
+        lat = [c["ms"] for c in self.chunks]
+        return {
+            "provider": self.provider,
+            "feature": self.feature,
+            "chunks": len(self.chunks),
+            "learned_size": self.size,
+            "latency_ms_avg": int(sum(lat) / len(lat)) if lat else None,
+            "latency_ms_max": max(lat) if lat else None,
+            "throttled": sum(1 for c in self.chunks if c["verdict"] == "throttled"),
+        }
+
+    def save(self) -> None:
+        if not self.persist or not self.chunks:
+            return
+        with _LOCK:
+            data = _read_state()
+            data[self.key] = {"size": self.size, "updated_at": int(time.time())}
+            _write_state(data)
+
+
+def adaptive_chunker(ctx: Any, provider_name: str, feature: str, *, ops: Any = None) -> AdaptiveChunker | None:
+    base = effective_chunk_size(ctx, provider_name)
+    rt = dict((getattr(ctx, "config", None) or {}).get("runtime") or {})
+    if base <= 0 or not bool(rt.get("apply_chunk_adaptive", True)):
+        return None
+    try:
+        lo = int(rt.get("apply_chunk_min") or 10)
+        hi = int(rt.get("apply_chunk_max") or max(base * 4, 1000))
+        target = int(rt.get("apply_chunk_target_ms") or 3000)
+    except Exception:
+        lo, hi, target = 10, max(base * 4, 1000), 3000
+    declared = 0
+    if ops is not None:
+        try:
+            declared = _declared_max(ops.capabilities() or {}, str(feature or "").lower())
+        except Exception:
+            declared = 0
+    # Only a provider that declares max_chunk may grow past its configured chunk size.
+    hi = min(hi, declared or base)
+    lo = min(lo, hi)
+    key = f"{str(provider_name or '').upper()}:{str(feature or '').lower()}"
+    learned = (_read_state().get(key) or {}).get("size")
+    try:
+        start = int(learned) if learned else base
+    except Exception:
+        start = base
+    return AdaptiveChunker(
+        provider=provider_name,
+        feature=feature,
+        size=start,
+        min_size=min(lo, base),
+        max_size=hi,
+        target_ms=target,
+        step=max(1, base // 4),
+    )
@@ -0,0 +1,165 @@
+# cw_platform/orchestrator/_events.py
+# Structured progress event channel between the orchestrator and its consumers.
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+__all__ = ["ProgressEvent", "ProgressChannel", "is_tick"]
+
+_TICK_SUFFIXES = (":progress", ":chunk")
+_TICK_EVENTS = frozenset({"api:hit"})
+
+
+def is_tick(event: str) -> bool:
+    return event in _TICK_EVENTS or event.endswith(_TICK_SUFFIXES)
+
+
+@dataclass(frozen=True, slots=True)
+class ProgressEvent:
+    event: str
+    data: Mapping[str, Any] = field(default_factory=dict)
+    ts: float = 0.0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+
+def _tick_key(event: str, data: Mapping[str, Any]) -> tuple[Any, ...]:
+    return (event, data.get("dst") or data.get("provider"), data.get("feature"), data.get("endpoint"))
+
+
+class ProgressChannel:
+    """Bounded queue from the sync thread to a single reducer.
+
+    Progress ticks (``apply:*:progress``, ``apply:*:chunk``, ``api:hit``) are
+    coalesced per key so only the latest one is kept, until a regular event
+    arrives behind them. Other events are never dropped; when the queue is
+    full the producer waits for the reducer.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[ProgressEvent]], None],
+        *,
+        maxsize: int = 2048,
+        tick_interval: float = 0.25,
+        put_timeout: float = 5.0,
+    ) -> None:
+        self.handler = handler
+        self.maxsize = max(1, int(maxsize))
+        self.tick_interval = max(0.0, float(tick_interval))
+        self.put_timeout = float(put_timeout)
+        self._cond = threading.Condition()
+        self._queue: deque[ProgressEvent] = deque()
+        self._ticks: dict[tuple[Any, ...], ProgressEvent] = {}
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self.received = 0
+        self.coalesced = 0
+        self.delivered = 0
+        self.batches = 0
+
+    def start(self) -> "ProgressChannel":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="cw-sync-events", daemon=True)
+            self._thread.start()
+        return self
+
+    def put(self, event: str, data: Mapping[str, Any] | None = None) -> None:
+        ev = ProgressEvent(str(event or ""), dict(data or {}), time.time())
+        with self._cond:
+            if self._closed:
+                return
+            self.received += 1
+            if is_tick(ev.event):
+                key = _tick_key(ev.event, ev.data)
+                if key in self._ticks:
+                    self.coalesced += 1
+                elif not self._ticks:
+                    self._cond.notify_all()
+                self._ticks[key] = ev
+                return
+            if self._ticks:
+                # Keep ticks ahead of the event that follows them, e.g. a final
+                # ``:progress`` must not land after its ``:done``.
+                self._queue.extend(self._ticks.values())
+                self._ticks.clear()
+            deadline = time.monotonic() + self.put_timeout
+            while len(self._queue) >= self.maxsize and self._thread is not None and not self._closed:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    break
+                self._cond.notify_all()
+                self._cond.wait(left)
+            self._queue.append(ev)
+            inline = self._thread is None and len(self._queue) >= self.maxsize
+            self._cond.notify_all()
+        if inline:
+            self.drain()
+
+    __call__ = put
+
+    def _take_locked(self) -> list[ProgressEvent]:
+        batch = list(self._queue)
+        self._queue.clear()
+        if self._ticks:
+            batch.extend(self._ticks.values())
+            self._ticks.clear()
+        return batch
+
+    def drain(self) -> int:
+        with self._cond:
+            batch = self._take_locked()
+            self._cond.notify_all()
+        return self._deliver(batch)
+
+    def _deliver(self, batch: list[ProgressEvent]) -> int:
+        if not batch:
+            return 0
+        try:
+            self.handler(batch)
+        except Exception:
+            pass
+        self.delivered += len(batch)
+        self.batches += 1
+        return len(batch)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._ticks and not self._closed:
+                    self._cond.wait()
+                if not self._queue and not self._closed and self.tick_interval:
+                    self._cond.wait(self.tick_interval)
+                closed = self._closed
+                batch = self._take_locked()
+                self._cond.notify_all()
+            self._deliver(batch)
+            if closed:
+                with self._cond:
+                    batch = self._take_locked()
+                self._deliver(batch)
+                return
+
+    def close(self, timeout: float = 10.0) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        th = self._thread
+        if th is not None:
+            th.join(timeout)
+        self.drain()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "received": self.received,
+            "coalesced": self.coalesced,
+            "delivered": self.delivered,
+            "batches": self.batches,
+        }
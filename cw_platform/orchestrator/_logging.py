@@ -3,18 +3,31 @@
 # Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
 from __future__ import annotations
 from collections.abc import Callable
+from typing import Any
+
+from ..compact_item import CompactItem
+
+
+def _event_default(obj: Any) -> Any:
+    return obj.to_dict() if isinstance(obj, CompactItem) else str(obj)
 
 class Emitter:
-    def __init__(self, cb: Callable[[str], None] | None):
+    def __init__(self, cb: Callable[[str], None] | None, sink: Callable[[str, dict], None] | None = None):
         self.cb = cb
+        self.sink = sink
 
     def emit(self, event: str, **data):
+        if self.sink:
+            try:
+                self.sink(event, data)
+            except Exception:
+                pass
         if not self.cb:
             return
         try:
             payload = {"event": event}
             payload.update(data)
-            self.cb(__import__("json").dumps(payload, separators=(",", ":")))
+            self.cb(__import__("json").dumps(payload, separators=(",", ":"), default=_event_default))
         except Exception:
             pass
 
@@ -595,6 +595,11 @@ def run_pairs(ctx) -> dict[str, Any]:
     except Exception:
         pass
 
+    try:
+        apply_chunks = metrics.chunking()
+    except Exception:
+        apply_chunks = {}
+
     # restore original emitter
     try:
         ctx.emit = metrics._orig_emit  # type: ignore[attr-defined]
@@ -615,6 +620,7 @@ def run_pairs(ctx) -> dict[str, Any]:
         errors=errors_total,
         pairs=len(pairs),
         cancelled=cancelled,
+        apply_chunks=apply_chunks,
         mode="v3",
     )
     if cancelled:
@@ -634,4 +640,5 @@ def run_pairs(ctx) -> dict[str, Any]:
         "errors": errors_total,
         "pairs": len(pairs),
         "cancelled": cancelled,
+        "apply_chunks": apply_chunks,
     }
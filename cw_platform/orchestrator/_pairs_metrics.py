@@ -9,6 +9,7 @@ class ApiMetrics:
     def __init__(self, emit: Callable[..., Any]) -> None:
         self._orig_emit = emit
         self._hits: dict[str, dict[str, Any]] = {}
+        self._chunks: dict[str, dict[str, Any]] = {}
 
     @property
     def hits(self) -> dict[str, dict[str, Any]]:
@@ -20,6 +21,8 @@ class ApiMetrics:
                 self._on_api_hit(kwargs)
             elif event == "api:totals":
                 self._on_api_totals(kwargs.get("totals"))
+            elif event.startswith("apply:") and event.endswith(":chunk"):
+                self._on_apply_chunk(kwargs)
         except Exception:
             pass
         return self._orig_emit(event, **kwargs)
@@ -43,6 +46,42 @@ class ApiMetrics:
             out["total"] += total
         return out
 
+    def chunking(self) -> dict[str, Any]:
+        out: dict[str, Any] = {}
+        for key, data in self._chunks.items():
+            n = int(data.get("chunks") or 0)
+            out[key] = {
+                "chunks": n,
+                "items": int(data.get("items") or 0),
+                "latency_ms_avg": int(data["latency_ms_sum"] / n) if n else None,
+                "latency_ms_max": data.get("latency_ms_max"),
+                "throttled": int(data.get("throttled") or 0),
+                "size_last": data.get("size_last"),
+                "learned_size": data.get("learned_size"),
+                "per_chunk": list(data.get("per_chunk") or []),
+            }
+        return out
+
+    def _on_apply_chunk(self, kw: Mapping[str, Any]) -> None:
+        key = f"{str(kw.get('dst') or 'UNKNOWN').upper()}:{str(kw.get('feature') or '').lower()}"
+        ent = self._chunks.setdefault(
+            key,
+            {"chunks": 0, "items": 0, "latency_ms_sum": 0, "latency_ms_max": 0, "throttled": 0, "per_chunk": []},
+        )
+        size = int(kw.get("size") or 0)
+        ms = int(kw.get("ms") or 0)
+        ent["chunks"] += 1
+        ent["items"] += size
+        ent["latency_ms_sum"] += ms
+        ent["latency_ms_max"] = max(int(ent["latency_ms_max"] or 0), ms)
+        if kw.get("throttled"):
+            ent["throttled"] += 1
+        ent["size_last"] = size
+        ent["learned_size"] = kw.get("next_size")
+        ent["per_chunk"].append({"size": size, "ms": ms})
+        if len(ent["per_chunk"]) > 50:
+            del ent["per_chunk"][:-50]
+
     def _prov_entry(self, p: str) -> dict[str, Any]:
         p = str(p or "UNKNOWN").upper()
         ent = self._hits.setdefault(
@@ -9,18 +9,30 @@ import os
 import re
 import datetime as _dt
 
+from ..compact_item import compact_index, plain
+from ..local_db.frozen import mutable_copy
 from ._progress_completion import fcfg_for_progress_target
 
 
+def _runner_copy(obj: Any, key: str = "", parent: str = "") -> Any:
+    if isinstance(obj, dict):
+        if key == "items" and parent == "baseline":
+            return compact_index(obj)
+        return {k: _runner_copy(v, k, key) for k, v in obj.items()}
+    return mutable_copy(obj)
+
+
 def load_feature_state(state_store: Any, feature: str) -> dict[str, Any]:
+    # Pair runs get their own containers around the shared view; baseline items
+    # are only read, so they are kept as CompactItem instead of deep copies.
     load_features = getattr(state_store, "load_state_features", None)
     if callable(load_features):
         state = load_features({feature})
-        return state if isinstance(state, dict) else {}
+        return _runner_copy(state) if isinstance(state, dict) else {}
     load_all = getattr(state_store, "load_state", None)
     if callable(load_all):
         state = load_all()
-        return state if isinstance(state, dict) else {}
+        return _runner_copy(state) if isinstance(state, dict) else {}
     return {}
 
 
@@ -223,7 +235,7 @@ from ._snapshots import (
     refresh_destination_after_apply,
 )
 from ._applier import apply_add, apply_remove, apply_update
-from ._chunking import effective_chunk_size
+from ._chunking import adaptive_chunker, effective_chunk_size
 from ._unresolved import load_unresolved_keys, load_unresolved_map, load_unresolved_pending, record_unresolved, clear_unresolved
 from ._planner import diff, diff_ratings, diff_progress, _pick_rating
 from ._phantoms import PhantomGuard
@@ -1202,7 +1214,7 @@ def run_one_way_feature(  # pyright: ignore[reportGeneralTypeIssues]
         try:
             _view_hook = getattr(dst_ops, "destination_comparison_view", None)
             if callable(_view_hook):
-                _view = _view_hook(provider_cfg, feature=feature, index=dst_full)
+                _view = _view_hook(provider_cfg, feature=feature, index={k: plain(v) for k, v in dst_full.items()})
                 if isinstance(_view, Mapping) and _view:
                     if len(_view) != len(dst_full) or set(_view) != set(dst_full):
                         dbg("destination_comparison_view", feature=feature, dst=dst, before=len(dst_full), after=len(_view))
@@ -1664,6 +1676,7 @@ def run_one_way_feature(  # pyright: ignore[reportGeneralTypeIssues]
                 dbg=dbg,
                 chunk_size=effective_chunk_size(ctx, dst),
                 chunk_pause_ms=_pause_for(dst),
+                adaptive=adaptive_chunker(ctx, dst, feature, ops=dst_ops),
             )
             unresolved_after = set(load_unresolved_keys(dst, feature, cross_features=_cross_feature_unresolved(feature)) or [])
             res_update = {
@@ -1715,6 +1728,7 @@ def run_one_way_feature(  # pyright: ignore[reportGeneralTypeIssues]
                 dbg=dbg,
                 chunk_size=effective_chunk_size(ctx, dst),
                 chunk_pause_ms=_pause_for(dst),
+                adaptive=adaptive_chunker(ctx, dst, feature, ops=dst_ops),
             )
             unresolved_after = set(load_unresolved_keys(dst, feature, cross_features=_cross_feature_unresolved(feature)) or [])
             res_add = {
@@ -1890,6 +1904,7 @@ def run_one_way_feature(  # pyright: ignore[reportGeneralTypeIssues]
                 dbg=dbg,
                 chunk_size=effective_chunk_size(ctx, dst),
                 chunk_pause_ms=_pause_for(dst),
+                adaptive=adaptive_chunker(ctx, dst, feature, ops=dst_ops),
             )
             _rem_decision = compute_effective_remove(
                 attempted_keys=rem_keys_attempted,
@@ -75,6 +75,7 @@ except Exception:
     def _rate_filter(idx: dict[str, Any], fcfg: Mapping[str, Any]) -> dict[str, Any]:
         return idx
 
+from ..compact_item import plain
 from ..id_map import minimal as _minimal, canonical_key as _ck, merge_ids as _merge_ids
 from ..history_events import history_sync_key, minimal_history_item
 from ..anime_mapping.service import (
@@ -95,7 +96,7 @@ from ._snapshots import (
     refresh_destination_after_apply,
 )
 from ._applier import apply_add, apply_remove, apply_update
-from ._chunking import effective_chunk_size
+from ._chunking import adaptive_chunker, effective_chunk_size
 from ._tombstones import clear_items_for_feature, keys_for_feature
 from ._unresolved import load_unresolved_keys, load_unresolved_pending, record_unresolved, clear_unresolved
 from ._phantoms import PhantomGuard  # type: ignore[attr-defined]
@@ -150,7 +151,7 @@ def _comparison_view(
         hook = getattr(ops, "destination_comparison_view", None)
         if not callable(hook):
             return index
-        view = hook(cfg, feature=feature, index=index)
+        view = hook(cfg, feature=feature, index={k: plain(v) for k, v in index.items()})
         if not isinstance(view, Mapping) or not view:
             return index
         if len(view) != len(index) or set(view) != set(index):
@@ -1891,6 +1892,7 @@ def _two_way_sync(  # pyright: ignore[reportGeneralTypeIssues]
                 dst_ops=aops, cfg=provider_cfg, dst_name=a, feature=feature, items=rem_from_A,
                 dry_run=dry_run_flag, emit=emit, dbg=dbg,
                 chunk_size=effective_chunk_size(ctx, a), chunk_pause_ms=_pause_for(a),
+                adaptive=adaptive_chunker(ctx, a, feature, ops=aops),
             )
             decA_rem = compute_effective_remove(
                 attempted_keys=remA_keys,
@@ -1937,6 +1939,7 @@ def _two_way_sync(  # pyright: ignore[reportGeneralTypeIssues]
                 dst_ops=bops, cfg=provider_cfg, dst_name=b, feature=feature, items=rem_from_B,
                 dry_run=dry_run_flag, emit=emit, dbg=dbg,
                 chunk_size=effective_chunk_size(ctx, b), chunk_pause_ms=_pause_for(b),
+                adaptive=adaptive_chunker(ctx, b, feature, ops=bops),
             )
             decB_rem = compute_effective_remove(
                 attempted_keys=remB_keys,
@@ -1997,6 +2000,7 @@ def _two_way_sync(  # pyright: ignore[reportGeneralTypeIssues]
                 dst_ops=aops, cfg=provider_cfg, dst_name=a, feature=feature, items=upd_to_A,
                 dry_run=dry_run_flag, emit=emit, dbg=dbg,
                 chunk_size=effective_chunk_size(ctx, a), chunk_pause_ms=_pause_for(a),
+                adaptive=adaptive_chunker(ctx, a, feature, ops=aops),
             )
             unresolved_after_A = set(load_unresolved_keys(a, feature, cross_features=_cross_feature_unresolved(feature)) or [])
             prov_unresolved_keys_A_raw = (resA_upd or {}).get("unresolved_keys")
@@ -2037,6 +2041,7 @@ def _two_way_sync(  # pyright: ignore[reportGeneralTypeIssues]
                 dst_ops=bops, cfg=provider_cfg, dst_name=b, feature=feature, items=upd_to_B,
                 dry_run=dry_run_flag, emit=emit, dbg=dbg,
                 chunk_size=effective_chunk_size(ctx, b), chunk_pause_ms=_pause_for(b),
+                adaptive=adaptive_chunker(ctx, b, feature, ops=bops),
             )
             unresolved_after_B = set(load_unresolved_keys(b, feature, cross_features=_cross_feature_unresolved(feature)) or [])
             prov_unresolved_keys_B_raw = (resB_upd or {}).get("unresolved_keys")
@@ -2089,6 +2094,7 @@ def _two_way_sync(  # pyright: ignore[reportGeneralTypeIssues]
                 dst_ops=aops, cfg=provider_cfg, dst_name=a, feature=feature, items=add_to_A,
                 dry_run=dry_run_flag, emit=emit, dbg=dbg,
                 chunk_size=effective_chunk_size(ctx, a), chunk_pause_ms=_pause_for(a),
+                adaptive=adaptive_chunker(ctx, a, feature, ops=aops),
             )
             unresolved_after_A = set(load_unresolved_keys(a, feature, cross_features=_cross_feature_unresolved(feature)) or [])
             prov_unresolved_keys_A_raw = (resA_add or {}).get("unresolved_keys")
@@ -2222,6 +2228,7 @@ def _two_way_sync(  # pyright: ignore[reportGeneralTypeIssues]
                 dst_ops=bops, cfg=provider_cfg, dst_name=b, feature=feature, items=add_to_B,
                 dry_run=dry_run_flag, emit=emit, dbg=dbg,
                 chunk_size=effective_chunk_size(ctx, b), chunk_pause_ms=_pause_for(b),
+                adaptive=adaptive_chunker(ctx, b, feature, ops=bops),
             )
             unresolved_after_B = set(load_unresolved_keys(b, feature, cross_features=_cross_feature_unresolved(feature)) or [])
             prov_unresolved_keys_B_raw = (resB_add or {}).get("unresolved_keys")
@@ -2,12 +2,12 @@
 # phantom item management for orchestrator.
 # Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
 from __future__ import annotations
-from pathlib import Path
 from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, TypeVar
-import json, os, time
-import shutil
+import time
 
+from ..local_db import guard_state
+from ..local_db.ttl_dedupe import base_path_from_state_dir
 from ._scope import scope_safe
 
 _DIR = "/config/.cw_state"
@@ -15,77 +15,33 @@ T = TypeVar("T", bound=Mapping[str, Any])
 
 class PhantomGuard:
     def __init__(self, src: str, dst: str, feature: str, ttl_days: int | None = None, enabled: bool = True):
-        legacy_base = f"{feature.lower()}.{src.lower()}-{dst.lower()}"
-        scope = scope_safe()
-        base = f"{legacy_base}.{scope}"
-        self._pf = Path(_DIR) / f"{base}.phantoms.json"
-        self._lf = Path(_DIR) / f"{base}.last_success.json"
-        legacy_pf = Path(_DIR) / f"{legacy_base}.phantoms.json"
-        legacy_lf = Path(_DIR) / f"{legacy_base}.last_success.json"
-        if not self._pf.exists() and legacy_pf.exists():
-            try:
-                Path(_DIR).mkdir(parents=True, exist_ok=True)
-                shutil.copy2(legacy_pf, self._pf)
-            except Exception:
-                pass
-        if not self._lf.exists() and legacy_lf.exists():
+        self._route = f"{src.lower()}-{dst.lower()}"
+        self._feature = feature.lower()
+        self._scope = scope_safe()
+        self._base = base_path_from_state_dir(_DIR)
+        self._ttl = int(ttl_days) if ttl_days else None
+        self._enabled = bool(enabled)
+        if self._enabled:
             try:
-                Path(_DIR).mkdir(parents=True, exist_ok=True)
-                shutil.copy2(legacy_lf, self._lf)
+                guard_state.import_legacy_files(self._base, _DIR)
             except Exception:
                 pass
-        self._ttl = int(ttl_days) if ttl_days else None
-        self._enabled = bool(enabled)
     def _now(self) -> int: return int(time.time())
 
-    def _read_keys(self, p: Path) -> set[str]:
-        try:
-            obj = json.loads(p.read_text("utf-8"))
-            if isinstance(obj, list):
-                return set(obj)
-            if isinstance(obj, dict):
-                if isinstance(obj.get("keys"), list):
-                    return set(obj["keys"])
-                cutoff = (self._now() - self._ttl * 86400) if self._ttl else None
-                out: set[str] = set()
-                for k, ts in obj.items():
-                    if cutoff is None or int(ts or 0) >= cutoff:
-                        out.add(k)
-                return out
-        except Exception:
-            pass
-        return set()
-
-    def _read_map(self, p: Path) -> dict[str, int]:
-        try:
-            obj = json.loads(p.read_text("utf-8"))
-            if isinstance(obj, dict) and not isinstance(obj.get("keys"), list):
-                return {str(k): int(obj[k] or 0) for k in obj.keys()}
-            if isinstance(obj, dict) and isinstance(obj.get("keys"), list):
-                now = self._now()
-                return {str(k): now for k in obj["keys"]}
-            if isinstance(obj, list):
-                now = self._now()
-                return {str(k): now for k in obj}
-        except Exception:
-            pass
-        return {}
+    def _where(self) -> dict[str, Any]:
+        return {"provider": self._route, "feature": self._feature, "scopes": self._scope}
 
-    def _write_map(self, p: Path, m: Mapping[str, int]) -> None:
+    def _last_ok(self, keys: Iterable[str]) -> set[str]:
+        cutoff = (self._now() - self._ttl * 86400) if self._ttl else None
         try:
-            p.parent.mkdir(parents=True, exist_ok=True)
-            tmp = p.with_suffix(".tmp")
-            tmp.write_text(json.dumps(m, ensure_ascii=False, indent=2), "utf-8")
-            os.replace(tmp, p)
+            return guard_state.load_keys(self._base, guard_state.LAST_SUCCESS, keys=keys, since=cutoff, **self._where())
         except Exception:
-            pass
+            return set()
 
-    def _save_minimals(self, items: Iterable[Mapping[str, Any]], minimal) -> None:
+    def _save_minimals(self, items: Iterable[Mapping[str, Any]], keyfn, minimal) -> None:
         try:
-            self._pf.parent.mkdir(parents=True, exist_ok=True)
-            tmp = self._pf.with_suffix(".tmp")
-            tmp.write_text(json.dumps([minimal(it) for it in items], ensure_ascii=False, indent=2), "utf-8")
-            os.replace(tmp, self._pf)
+            rows = {str(keyfn(it)): minimal(it) for it in items}
+            guard_state.upsert(self._base, guard_state.PHANTOM, self._route, self._feature, self._scope, rows, ts=self._now())
         except Exception:
             pass
 
@@ -101,15 +57,13 @@ class PhantomGuard:
     ) -> tuple[list[T], int]:
         if not self._enabled or not adds:
             return list(adds), 0
-        last_ok = self._read_keys(self._lf)
-        ph_file = self._read_keys(self._pf)
         planned = [keyfn(it) for it in adds]
-        phantoms = (set(planned) & last_ok) | ph_file
+        phantoms = self._last_ok(planned)
         if not phantoms:
             return list(adds), 0
         blocked: list[T] = [it for it in adds if keyfn(it) in phantoms]
         keep: list[T] = [it for it in adds if keyfn(it) not in phantoms]
-        self._save_minimals(blocked, minimal)
+        self._save_minimals(blocked, keyfn, minimal)
         try:
             for k in {keyfn(it) for it in blocked}:
                 state_store.blackbox_put(pair_key, k, reason="phantom-replan")
@@ -131,9 +85,13 @@ class PhantomGuard:
     def record_success(self, successful_keys: Iterable[str]) -> None:
         if not self._enabled:
             return
-        cur = self._read_map(self._lf)
         now = self._now()
-        for k in successful_keys or []:
-            cur[str(k)] = now
-        self._write_map(self._lf, cur)
+        expires = now + self._ttl * 86400 if self._ttl else None
+        rows = {str(k): None for k in successful_keys or []}
+        try:
+            guard_state.upsert(self._base, guard_state.LAST_SUCCESS, self._route, self._feature, self._scope, rows, ts=now, expires_at=expires)
+            if expires is not None:
+                guard_state.purge_expired(self._base, now)
+        except Exception:
+            pass
         
\ No newline at end of file
@@ -143,7 +143,7 @@ def _norm_rating(v: Any) -> int | None:
 
 
 def _pick_rating(d: Any) -> int | None:
-    if not isinstance(d, dict):
+    if not isinstance(d, Mapping):
         return None
 
     for k in ("rating", "user_rating", "score", "value"):
@@ -153,7 +153,7 @@ def _pick_rating(d: Any) -> int | None:
 
 
 def _pick_rated_at(d: Any) -> str | None:
-    if not isinstance(d, dict):
+    if not isinstance(d, Mapping):
         return None
     v = (d.get("rated_at") or d.get("ratedAt") or d.get("user_rated_at") or "").strip()
     return v or None
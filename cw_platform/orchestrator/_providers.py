@@ -3,21 +3,73 @@
 # Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
 from __future__ import annotations
 
+import threading
+from collections.abc import ItemsView, Iterator, Mapping
+
 from cw_platform.modules_registry import load_sync_ops, sync_provider_names
 from ._types import InventoryOps
 
+_NEEDED = ("name", "label", "features", "capabilities", "build_index", "add", "remove")
+
+
+def _valid_ops(name: str) -> InventoryOps | None:
+    ops = load_sync_ops(name)
+    if not ops or not all(hasattr(ops, fn) for fn in _NEEDED):
+        return None
+    try:
+        if str(ops.name()).upper() != name:
+            return None
+    except Exception:
+        return None
+    return ops  # type: ignore[return-value]
+
+
+class SyncProviders(Mapping[str, InventoryOps]):
+    """Sync provider ops keyed by name; a provider module is imported on first lookup.
+
+    Keys are the registered provider names and ``in`` checks registration only,
+    without importing anything. Names whose module fails to load or lacks the
+    sync surface behave as missing on lookup: ``get`` returns None and ``items``
+    skips them.
+    """
+
+    def __init__(self, names: list[str] | None = None) -> None:
+        self._names = list(names if names is not None else sync_provider_names(upper=True))
+        self._ops: dict[str, InventoryOps | None] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, name: str) -> InventoryOps | None:
+        if name in self._ops:
+            return self._ops[name]
+        with self._lock:
+            if name not in self._ops:
+                self._ops[name] = _valid_ops(name) if name in self._names else None
+            return self._ops[name]
+
+    def __getitem__(self, name: str) -> InventoryOps:
+        ops = self._load(str(name).upper())
+        if ops is None:
+            raise KeyError(name)
+        return ops
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and name.upper() in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def items(self) -> ItemsView[str, InventoryOps]:
+        return {n: ops for n in self._names if (ops := self._load(n)) is not None}.items()
+
+    def loaded(self) -> list[str]:
+        return [n for n, ops in self._ops.items() if ops is not None]
+
+    def __repr__(self) -> str:
+        return f"<SyncProviders loaded={self.loaded()!r}>"
+
 
-def load_sync_providers() -> dict[str, InventoryOps]:
-    out: dict[str, InventoryOps] = {}
-    needed = ("name", "label", "features", "capabilities", "build_index", "add", "remove")
-    for name in sync_provider_names(upper=True):
-        ops = load_sync_ops(name)
-        if not ops:
-            continue
-        if not all(hasattr(ops, fn) for fn in needed):
-            continue
-        try:
-            out[str(ops.name()).upper()] = ops  # type: ignore[assignment]
-        except Exception:
-            continue
-    return out
+def load_sync_providers() -> Mapping[str, InventoryOps]:
+    return SyncProviders()
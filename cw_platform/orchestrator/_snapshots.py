@@ -3,7 +3,7 @@
 # Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from typing import Any, Callable
 
 import json
@@ -18,7 +18,7 @@ from ..id_map import canonical_key, KEY_PRIORITY
 from ..history_events import history_event_key, is_history_event_key
 from ..provider_instances import normalize_instance_id
 from ..run_control import raise_if_cancelled
-from ._types import InventoryOps
+from ._types import InventoryOps, StreamingInventoryOps
 from ..modules_registry import load_sync_ops
 
 SnapIndex = dict[str, dict[str, Any]]
@@ -37,8 +37,7 @@ def bust_snapshot_cache(snap_cache: Any, provider: str, feature: str) -> None:
         snap_cache.pop(key, None)
 
 
-def canonicalize_index(idx_raw: Any, *, feature: str) -> "SnapIndex":
-    canon: SnapIndex = {}
+def _canonical_entries(idx_raw: Any, *, feature: str) -> Iterator[tuple[str, dict[str, Any]]]:
     if isinstance(idx_raw, list):
         for raw in idx_raw:
             if not isinstance(raw, Mapping):
@@ -46,7 +45,7 @@ def canonicalize_index(idx_raw: Any, *, feature: str) -> "SnapIndex":
             item = dict(raw)
             key = canonical_key(item)
             if key:
-                canon[key] = item
+                yield key, item
     elif isinstance(idx_raw, Mapping):
         for k, raw in idx_raw.items():
             if not isinstance(raw, Mapping):
@@ -60,7 +59,11 @@ def canonicalize_index(idx_raw: Any, *, feature: str) -> "SnapIndex":
                 provider_key = provider_key.split("@", 1)[0] if provider_key else ""
                 key = _pick_key(provider_key, computed)
             if key:
-                canon[key] = item
+                yield key, item
+
+
+def canonicalize_index(idx_raw: Any, *, feature: str) -> "SnapIndex":
+    canon: SnapIndex = dict(_canonical_entries(idx_raw, feature=feature))
     return _coalesce_by_shared_ids(canon, feature=feature)
 
 
@@ -158,10 +161,28 @@ def _pick_key(provider_key: str, computed_key: str) -> str:
 
 _ID_COALESCE_KEYS = ("tmdb", "imdb", "tvdb", "trakt", "simkl", "mal", "anilist", "kitsu", "anidb")
 
-def _coalesce_by_shared_ids(idx: SnapIndex, *, feature: str) -> SnapIndex:
-    if str(feature or "").lower() != "watchlist" or not idx:
-        return dict(idx)
+def _id_token(idk: str, idv: Any) -> str | None:
+    if idv is None:
+        return None
+    s = str(idv).strip().lower()
+    if not s:
+        return None
+    return f"{str(idk).strip().lower()}:{s}"
+
+def _coalesce_tokens(it: Any) -> list[str]:
+    ids = it.get("ids") if isinstance(it, Mapping) else None
+    if not isinstance(ids, Mapping):
+        return []
+    out: list[str] = []
+    for idk in _ID_COALESCE_KEYS:
+        if idk not in ids:
+            continue
+        t = _id_token(idk, ids.get(idk))
+        if t:
+            out.append(t)
+    return out
 
+def _shared_id_groups(idx: Mapping[str, Any]) -> list[list[str]]:
     parent: dict[str, str] = {}
     rank: dict[str, int] = {}
     seen: dict[str, str] = {}
@@ -183,30 +204,12 @@ def _coalesce_by_shared_ids(idx: SnapIndex, *, feature: str) -> SnapIndex:
         if rank.get(ra, 0) == rank.get(rb, 0):
             rank[ra] = rank.get(ra, 0) + 1
 
-    def _tok(idk: str, idv: Any) -> str | None:
-        if idv is None:
-            return None
-        s = str(idv).strip().lower()
-        if not s:
-            return None
-        return f"{str(idk).strip().lower()}:{s}"
-
     for ck in idx.keys():
         parent[ck] = ck
         rank[ck] = 0
 
     for ck, it in idx.items():
-        if not isinstance(it, Mapping):
-            continue
-        ids = it.get("ids")
-        if not isinstance(ids, Mapping):
-            continue
-        for idk in _ID_COALESCE_KEYS:
-            if idk not in ids:
-                continue
-            t = _tok(idk, ids.get(idk))
-            if not t:
-                continue
+        for t in _coalesce_tokens(it):
             other = seen.get(t)
             if other and other != ck:
                 _union(ck, other)
@@ -217,7 +220,9 @@ def _coalesce_by_shared_ids(idx: SnapIndex, *, feature: str) -> SnapIndex:
     for ck in idx.keys():
         root = _find(ck)
         groups.setdefault(root, []).append(ck)
+    return list(groups.values())
 
+def _merge_group(idx: Mapping[str, Any], keys: list[str]) -> tuple[str, dict[str, Any]]:
     def _ids_count(v: Mapping[str, Any]) -> int:
         ids = v.get("ids")
         return len(ids) if isinstance(ids, Mapping) else 0
@@ -259,42 +264,77 @@ def _coalesce_by_shared_ids(idx: SnapIndex, *, feature: str) -> SnapIndex:
             if sk not in dst_ids or not str(dst_ids.get(sk) or "").strip():
                 dst_ids[sk] = sv
 
+    chosen = _best_key(keys)
+    chosen_item = idx.get(chosen)
+    if not isinstance(chosen_item, Mapping):
+        chosen = next((k for k in keys if isinstance(idx.get(k), Mapping)), chosen)
+        chosen_item = idx.get(chosen) or {}
+
+    base: dict[str, Any] = dict(chosen_item) if isinstance(chosen_item, Mapping) else {}
+    base_ids: dict[str, str] = {}
+    if isinstance(base.get("ids"), Mapping):
+        base_ids = {str(k).strip(): str(v).strip() for k, v in base.get("ids", {}).items() if v is not None and str(v).strip()}
+    base["ids"] = base_ids
+
+    for k in keys:
+        if k == chosen:
+            continue
+        other = idx.get(k)
+        if not isinstance(other, Mapping):
+            continue
+        oids = other.get("ids")
+        if isinstance(oids, Mapping):
+            _merge_ids(base_ids, oids)
+        _merge_dict(base, other)
+
+    base["ids"] = base_ids
+    return str(chosen), base
+
+def _coalesce_by_shared_ids(idx: SnapIndex, *, feature: str) -> SnapIndex:
+    if str(feature or "").lower() != "watchlist" or not idx:
+        return dict(idx)
+
     out: SnapIndex = {}
-    for root, keys in groups.items():
+    for keys in _shared_id_groups(idx):
         if len(keys) == 1:
             k = keys[0]
             v = idx.get(k)
             if isinstance(v, Mapping):
                 out[k] = dict(v)
             continue
+        chosen, base = _merge_group(idx, keys)
+        out[chosen] = base
 
-        chosen = _best_key(keys)
-        chosen_item = idx.get(chosen)
-        if not isinstance(chosen_item, Mapping):
-            chosen = next((k for k in keys if isinstance(idx.get(k), Mapping)), chosen)
-            chosen_item = idx.get(chosen) or {}
+    return out
 
-        base: dict[str, Any] = dict(chosen_item) if isinstance(chosen_item, Mapping) else {}
-        base_ids: dict[str, str] = {}
-        if isinstance(base.get("ids"), Mapping):
-            base_ids = {str(k).strip(): str(v).strip() for k, v in base.get("ids", {}).items() if v is not None and str(v).strip()}
-        base["ids"] = base_ids
+_STREAM_BATCH = 5000
 
-        for k in keys:
-            if k == chosen:
-                continue
-            other = idx.get(k)
-            if not isinstance(other, Mapping):
-                continue
-            oids = other.get("ids")
-            if isinstance(oids, Mapping):
-                _merge_ids(base_ids, oids)
-            _merge_dict(base, other)
 
-        base["ids"] = base_ids
-        out[str(chosen)] = base
+def _index_batches(ops: Any, config: Mapping[str, Any], *, feature: str, batch_size: int) -> Iterable[Any]:
+    stream = getattr(ops, "iter_index", None)
+    if callable(stream):
+        return stream(config, feature=feature, batch_size=batch_size)
+    return (ops.build_index(config, feature=feature),)
 
-    return out
+
+def stream_canonical_index(
+    ops: "InventoryOps | StreamingInventoryOps",
+    config: Mapping[str, Any],
+    *,
+    feature: str,
+    batch_size: int | None = None,
+) -> SnapIndex:
+    """Canonicalize a provider index batch by batch.
+
+    Uses ``iter_index`` when the provider offers it, so the raw index is never
+    held in full next to its canonical copy. The result is still a full
+    in-memory dict; this trims one copy, it does not bound peak memory.
+    """
+    canon: SnapIndex = {}
+    for batch in _index_batches(ops, config, feature=feature, batch_size=batch_size or _STREAM_BATCH):
+        raise_if_cancelled()
+        canon.update(_canonical_entries(batch, feature=feature))
+    return _coalesce_by_shared_ids(canon, feature=feature)
 
 def allowed_providers_for_feature(config: Mapping[str, Any], feature: str) -> set[str]:
     allowed: set[str] = set()
@@ -693,19 +733,18 @@ def build_snapshots_for_feature(
     now = time.time()
     allowed = allowed_providers_for_feature(config, feature)
 
-    ordered: list[tuple[str, InventoryOps]] = []
-    if build_order:
-        seen: set[str] = set()
-        for want in build_order:
-            if want in providers and want not in seen:
-                seen.add(want)
-                ordered.append((want, providers[want]))
-        ordered.extend((n, o) for n, o in providers.items() if n not in seen)
-    else:
-        ordered = list(providers.items())
+    # Walk names and filter on the pair config before touching ops, so providers
+    # outside every pair are never imported.
+    names: list[str] = [w for w in dict.fromkeys(build_order or ()) if w in providers]
+    names.extend(n for n in providers if n not in names)
 
-    for name, ops in ordered:
+    for name in names:
         raise_if_cancelled()
+        if allowed and name.upper() not in allowed:
+            continue
+        ops = providers.get(name)
+        if ops is None:
+            continue
         try:
             feats_raw = ops.features()  # type: ignore[call-arg]
         except Exception:
@@ -720,9 +759,6 @@ def build_snapshots_for_feature(
         if not bool(feats.get(feature, False)):
             continue
 
-        if allowed and name.upper() not in allowed:
-            continue
-
         if not provider_configured(config, name):
             continue
 
@@ -741,7 +777,7 @@ def build_snapshots_for_feature(
                     continue
 
         try:
-            idx_raw = ops.build_index(config, feature=feature)  # type: ignore[call-arg]
+            canon = stream_canonical_index(ops, config, feature=feature)
         except Exception as e:
             emit_info(
                 f"[!] snapshot.failed provider={name} feature={feature} error={e}"
@@ -749,7 +785,6 @@ def build_snapshots_for_feature(
             dbg("snapshot.failed", provider=name, feature=feature)
             raise
 
-        canon = canonicalize_index(idx_raw, feature=feature)
         snaps[name] = canon
 
         if snap_ttl_sec > 0:
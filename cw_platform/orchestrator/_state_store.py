@@ -4,11 +4,14 @@
 from __future__ import annotations
 
 import json
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any
 
+from ..compact_item import json_default
+from ..local_db import guard_state as sqlite_guard_state
 from ..local_db import last_sync as sqlite_last_sync
 from ..local_db import manual_policy as sqlite_manual_policy
 from ..local_db import state as sqlite_state
@@ -27,61 +30,46 @@ class StateStore:
             pass
         return p
 
-    @property
-    def tomb(self) -> Path:
-        return self.cw_state_dir / "tombstones.json"
-
     @property
     def ratings_changes(self) -> Path:
         return self.base_path / "ratings_changes.json"
 
-    def _read(self, p: Path, default: Any) -> Any:
-        if not p.exists():
-            return default
-        try:
-            return json.loads(p.read_text("utf-8"))
-        except Exception:
-            return default
-
     def _write_atomic(self, p: Path, data: Any) -> None:
         try:
             p.parent.mkdir(parents=True, exist_ok=True)
         except Exception:
             pass
         tmp = p.with_suffix(p.suffix + ".tmp")
-        text = json.dumps(data, ensure_ascii=False, indent=2)
+        text = json.dumps(data, ensure_ascii=False, indent=2, default=json_default)
         tmp.write_text(text, "utf-8")
         tmp.replace(p)
 
 
     def _merge_policy(self, state: dict[str, Any], policy: Any) -> dict[str, Any]:
+        # State from sqlite_state is a shared read-only view; copy only the nodes the policy touches.
         if not isinstance(state, dict):
             state = {"providers": {}, "wall": [], "last_sync_epoch": None}
-        provs = state.get("providers")
-        if not isinstance(provs, dict):
-            provs = {}
-            state["providers"] = provs
         if not isinstance(policy, dict):
             return state
         p_provs = policy.get("providers")
-        if not isinstance(p_provs, dict):
+        if not isinstance(p_provs, dict) or not p_provs:
             return state
+        provs = state.get("providers")
+        provs = dict(provs) if isinstance(provs, dict) else {}
+        state = {**state, "providers": provs}
+
+        def _own(parent: dict[str, Any], key: str) -> dict[str, Any]:
+            node = parent.get(key)
+            node = dict(node) if isinstance(node, dict) else {}
+            parent[key] = node
+            return node
 
         def _merge_feature(p_node: dict[str, Any], feature: str, f_node: Any) -> None:
             if not isinstance(f_node, dict):
                 return
-            s_node = provs.get(p_node["__prov_key__"])
-            if not isinstance(s_node, dict):
-                s_node = {}
-                provs[p_node["__prov_key__"]] = s_node
-            s_manual = s_node.get("manual")
-            if not isinstance(s_manual, dict):
-                s_manual = {}
-                s_node["manual"] = s_manual
-            s_feat = s_manual.get(feature)
-            if not isinstance(s_feat, dict):
-                s_feat = {}
-                s_manual[feature] = s_feat
+            s_node = _own(provs, p_node["__prov_key__"])
+            s_manual = _own(s_node, "manual")
+            s_feat = _own(s_manual, feature)
 
             p_blocks = f_node.get("blocks")
             if isinstance(p_blocks, list):
@@ -94,17 +82,11 @@ class StateStore:
             if isinstance(p_adds, dict):
                 p_items = p_adds.get("items")
                 if isinstance(p_items, dict):
-                    s_adds = s_feat.get("adds")
-                    if not isinstance(s_adds, dict):
-                        s_adds = {}
-                    s_items = s_adds.get("items")
-                    if not isinstance(s_items, dict):
-                        s_items = {}
+                    s_adds = _own(s_feat, "adds")
+                    s_items = _own(s_adds, "items")
                     for k, v in p_items.items():
                         if k not in s_items:
                             s_items[k] = v
-                    s_adds["items"] = s_items
-                    s_feat["adds"] = s_adds
 
         for prov, p_node_any in p_provs.items():
             if not isinstance(p_node_any, dict):
@@ -212,14 +194,63 @@ class StateStore:
     def clear_state(self) -> None:
         sqlite_state.clear_state(self.base_path)
 
+    def _guard_base(self) -> Path:
+        try:
+            sqlite_guard_state.import_legacy_files(self.base_path, self.base_path / ".cw_state")
+        except Exception:
+            pass
+        return self.base_path
+
     def load_tomb(self) -> dict[str, Any]:
-        t = self._read(self.tomb, {"keys": {}, "pruned_at": None})
-        if "ttl_sec" not in t:
-            t["ttl_sec"] = None
-        return t
+        base = self._guard_base()
+        keys = {
+            f"{e['feature']}:{e['scope']}|{e['key']}": e["ts"]
+            for e in sqlite_guard_state.entries(base, sqlite_guard_state.TOMBSTONE)
+        }
+        return {"keys": keys, "pruned_at": sqlite_guard_state.tombstones_pruned_at(base), "ttl_sec": None}
 
     def save_tomb(self, data: Mapping[str, Any]) -> None:
-        self._write_atomic(self.tomb, data)
+        # Whole-map rewrite for callers holding a load_tomb() dict; the tomb_* methods stay row-level.
+        base = self._guard_base()
+        rows: dict[tuple[str, str], dict[str, int]] = {}
+        raw = data.get("keys") if isinstance(data, Mapping) else None
+        for k, ts in (raw or {}).items():
+            scoped, _, token = str(k).partition("|")
+            feature, _, pair = scoped.partition(":")
+            if token:
+                rows.setdefault((feature.lower(), pair.upper()), {})[token] = int(ts or 0)
+        sqlite_guard_state.clear(base, [sqlite_guard_state.TOMBSTONE])
+        for (feature, pair), group in rows.items():
+            for ts in set(group.values()):
+                keys = {k: None for k, v in group.items() if v == ts}
+                sqlite_guard_state.upsert(base, sqlite_guard_state.TOMBSTONE, "", feature, pair, keys, ts=ts)
+        pruned_at = data.get("pruned_at") if isinstance(data, Mapping) else None
+        if pruned_at:
+            sqlite_guard_state.set_tombstones_pruned_at(base, int(pruned_at))
+
+    def tomb_add(self, feature: str, pair: str, keys: Iterable[str]) -> int:
+        rows = {str(k): None for k in keys if k}
+        return sqlite_guard_state.upsert(
+            self._guard_base(), sqlite_guard_state.TOMBSTONE, "", str(feature).lower(), str(pair).upper(), rows, keep_existing=True
+        )
+
+    def tomb_keys(self, feature: str, pair: str, keys: Iterable[str] | None = None) -> dict[str, int]:
+        got = sqlite_guard_state.entries(
+            self._guard_base(), sqlite_guard_state.TOMBSTONE, provider="", feature=str(feature).lower(), scopes=str(pair).upper(), keys=keys
+        )
+        return {e["key"]: e["ts"] for e in got}
+
+    def tomb_remove(self, feature: str, pair: str, keys: Iterable[str]) -> int:
+        return sqlite_guard_state.delete(
+            self._guard_base(), sqlite_guard_state.TOMBSTONE, "", str(feature).lower(), str(pair).upper(), keys
+        )
+
+    def tomb_prune(self, older_than_secs: int) -> int:
+        base = self._guard_base()
+        now = int(time.time())
+        removed = sqlite_guard_state.prune_before(base, sqlite_guard_state.TOMBSTONE, now - int(older_than_secs))
+        sqlite_guard_state.set_tombstones_pruned_at(base, now)
+        return removed
 
     def save_last(self, data: Mapping[str, Any]) -> None:
         sqlite_last_sync.save_last_sync(self.base_path, data or {})
@@ -23,6 +23,17 @@ def add_keys_for_feature(
     *,
     pair: str | None = None,
 ) -> int:
+    if not pair:
+        dbg("tombstones.marked", feature=feature, added=0, scope="none")
+        return 0
+
+    scope = str(pair).upper()
+    tomb_add = getattr(store, "tomb_add", None)
+    if callable(tomb_add):
+        added = int(tomb_add(feature, scope, keys) or 0)
+        dbg("tombstones.marked", feature=feature, added=added, pair=scope, scope="pair")
+        return added
+
     tomb = store.load_tomb()
     raw = tomb.setdefault("keys", {})
     if not isinstance(raw, dict):
@@ -32,12 +43,6 @@ def add_keys_for_feature(
     ks: dict[str, Any] = raw
     now = int(time.time())
     added = 0
-
-    if not pair:
-        dbg("tombstones.marked", feature=feature, added=0, scope="none")
-        return 0
-
-    scope = str(pair).upper()
     prefix = f"{str(feature).lower()}:{scope}"
 
     for k in keys:
@@ -64,6 +69,10 @@ def keys_for_feature(
     pair: str | None = None,
     include_global: bool = True,
 ) -> dict[str, int]:
+    tomb_keys = getattr(store, "tomb_keys", None)
+    if callable(tomb_keys):
+        return dict(tomb_keys(feature, str(pair).upper())) if pair else {}
+
     tomb = store.load_tomb()
     raw = tomb.get("keys") or {}
     if isinstance(raw, Mapping):
@@ -99,15 +108,7 @@ def clear_items_for_feature(
     if not pair:
         return 0
 
-    tomb = store.load_tomb()
-    raw = tomb.get("keys") or {}
-    if not isinstance(raw, Mapping):
-        return 0
-
-    ks: dict[str, Any] = dict(raw)
     scope = str(pair).upper()
-    prefix = f"{str(feature).lower()}:{scope}|"
-
     tokens: set[str] = set()
     for item in items or []:
         if not isinstance(item, Mapping):
@@ -136,6 +137,20 @@ def clear_items_for_feature(
     if not tokens:
         return 0
 
+    tomb_remove = getattr(store, "tomb_remove", None)
+    if callable(tomb_remove):
+        removed = int(tomb_remove(feature, scope, tokens) or 0)
+        if removed:
+            dbg("tombstones.cleared", feature=feature, removed=removed, pair=scope, scope="pair")
+        return removed
+
+    tomb = store.load_tomb()
+    raw = tomb.get("keys") or {}
+    if not isinstance(raw, Mapping):
+        return 0
+
+    ks: dict[str, Any] = dict(raw)
+    prefix = f"{str(feature).lower()}:{scope}|"
     removed = 0
     for tok in tokens:
         k = f"{prefix}{tok}"
@@ -156,6 +171,13 @@ def prune(
     *,
     older_than_secs: int,
 ) -> int:
+    tomb_prune = getattr(store, "tomb_prune", None)
+    if callable(tomb_prune):
+        removed = int(tomb_prune(older_than_secs) or 0)
+        if removed:
+            dbg("tombstones.pruned", removed=removed)
+        return removed
+
     tomb = store.load_tomb()
     raw = tomb.get("keys") or {}
     if not isinstance(raw, Mapping):
@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from typing import Any, Protocol
 
 
@@ -37,6 +37,18 @@ class InventoryOps(Protocol):
         dry_run: bool = False,
     ) -> dict[str, Any]: ...
 
+# Optional: yields the provider index in batches so snapshot building never
+# holds the raw index next to its canonical copy. It does not bound memory;
+# snapshots, baselines and plans stay in-memory dicts.
+class StreamingInventoryOps(InventoryOps, Protocol):
+    def iter_index(
+        self,
+        cfg: Mapping[str, Any],
+        *,
+        feature: str,
+        batch_size: int,
+    ) -> Iterator[Mapping[str, dict[str, Any]]]: ...
+
 @dataclass
 class ConflictPolicy:
     prefer: str = "source"
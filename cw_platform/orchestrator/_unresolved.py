@@ -26,6 +26,9 @@ _GENERIC_FAILURE_HINTS = {
     "two:apply:add:failed",
 }
 
+from ..local_db import guard_state
+from ..local_db.db import crosswatch_db_path
+from ..local_db.ttl_dedupe import base_path_from_state_dir
 from ._scope import scoped_file, scope_safe
 
 try:
@@ -68,10 +71,60 @@ def _blocking_path(dst: str, feature: str) -> Path:
     return scoped_file(STATE_DIR, f"{dst_lower}_{feat_lower}.unresolved.json")
 
 
-def _pending_path(dst: str, feature: str) -> Path:
-    dst_lower = str(dst).strip().lower()
-    feat_lower = str(feature).strip().lower()
-    return scoped_file(STATE_DIR, f"{dst_lower}_{feat_lower}.unresolved.pending.json")
+def _base() -> Path | None:
+    base = base_path_from_state_dir(STATE_DIR)
+    try:
+        guard_state.import_legacy_files(base, STATE_DIR)
+    except Exception:
+        pass
+    return base
+
+
+def _pending(
+    dst: str,
+    feature: str | None = None,
+    *,
+    scoped: bool = True,
+    keys: Iterable[str] | None = None,
+) -> list[dict[str, Any]]:
+    prov = str(dst).strip().lower()
+    feat = str(feature).strip().lower() if feature else None
+    try:
+        return guard_state.entries(
+            _base(), guard_state.UNRESOLVED, provider=prov, feature=feat,
+            scopes=scope_safe() if scoped else None, keys=keys,
+        )
+    except Exception:
+        return []
+
+
+def _pending_hint(entry: Mapping[str, Any]) -> dict[str, Any]:
+    data = entry.get("data")
+    hint = data.get("hint") if isinstance(data, Mapping) else None
+    return dict(hint) if isinstance(hint, Mapping) else {}
+
+
+def _blocking_files(dst_lower: str) -> list[Path]:
+    if not STATE_DIR.exists():
+        return []
+    scope = scope_safe()
+    prefix = f"{dst_lower}_"
+    suffix = ".unresolved.json"
+    scoped1 = f".unresolved.{scope}.json"
+    scoped2 = f".{scope}.unresolved.json"
+    out: list[Path] = []
+    for p in STATE_DIR.iterdir():
+        if not p.is_file():
+            continue
+        name = p.name
+        if not name.startswith(prefix) or ".unresolved.pending" in name:
+            continue
+        if name.endswith(scoped1) or name.endswith(scoped2):
+            out.append(p)
+        elif name.endswith(suffix):
+            # Migrate legacy (unscoped) files to scoped when needed.
+            out.append(scoped_file(STATE_DIR, name))
+    return out
 
 
 # Blocking
@@ -86,7 +139,6 @@ def load_unresolved_keys(
         return keys
 
     dst_lower = str(dst).strip().lower()
-    scope = scope_safe()
 
     if feature and not cross_features:
         p = _blocking_path(dst_lower, feature)
@@ -94,45 +146,9 @@ def load_unresolved_keys(
             keys |= set(_read_json(p).keys())
         return keys
 
-    if not STATE_DIR.exists():
-        return keys
-
-    prefix = f"{dst_lower}_"
-    suffix = ".unresolved.json"
-    pending_suffix = ".unresolved.pending.json"
-    scoped1 = f".unresolved.{scope}.json"
-    scoped2 = f".{scope}.unresolved.json"
-    scopedp1 = f".unresolved.pending.{scope}.json"
-    scopedp2 = f".{scope}.unresolved.pending.json"
-    for p in STATE_DIR.iterdir():
-        if p.is_file():
-            name = p.name
-            if not name.startswith(prefix):
-                continue
-            is_blocking = (name.endswith(scoped1) or name.endswith(scoped2) or name.endswith(suffix))
-            is_pending = (name.endswith(scopedp1) or name.endswith(scopedp2) or name.endswith(pending_suffix))
-            if not (is_blocking or is_pending):
-                continue
-
-            # Migrate legacy (unscoped) files to scoped when needed.
-            rp = p
-            if (name.endswith(suffix) or name.endswith(pending_suffix)) and not (
-                name.endswith(scoped1) or name.endswith(scoped2) or name.endswith(scopedp1) or name.endswith(scopedp2)
-            ):
-                rp = scoped_file(STATE_DIR, name)
-
-            data = _read_json(rp)
-
-            if is_pending and isinstance(data, dict):
-                lst = data.get("keys")
-                if isinstance(lst, list):
-                    keys |= {str(x) for x in lst if x}
-                else:
-                    im = data.get("items")
-                    if isinstance(im, dict):
-                        keys |= {str(k) for k in im.keys()}
-            else:
-                keys |= {str(k) for k in (data or {}).keys()}
+    for p in _blocking_files(dst_lower):
+        keys |= {str(k) for k in _read_json(p).keys()}
+    keys |= {e["key"] for e in _pending(dst_lower)}
     return keys
 
 
@@ -147,78 +163,31 @@ def load_unresolved_map(
         return out
 
     dst_lower = str(dst).strip().lower()
-    scope = scope_safe()
 
     if feature and not cross_features:
         blocking = _read_json(_blocking_path(dst_lower, feature))
         for k, v in blocking.items():
             out[str(k)] = v if isinstance(v, dict) else {}
-
-        pending = _read_json(_pending_path(dst_lower, feature))
-        raw_hints = pending.get("hints") if isinstance(pending, dict) else None
-        hints = raw_hints if isinstance(raw_hints, dict) else {}
-        raw_keys = pending.get("keys") if isinstance(pending, dict) else None
-        keys = raw_keys if isinstance(raw_keys, list) else []
-        for k in keys:
-            if not k:
-                continue
-            v = hints.get(k) or {}
-            out[str(k)] = v if isinstance(v, dict) else {}
-        return out
-
-    if not STATE_DIR.exists():
+        for e in _pending(dst_lower, feature):
+            out[e["key"]] = _pending_hint(e)
         return out
 
-    prefix = f"{dst_lower}_"
-    suffix = ".unresolved.json"
-    pending_suffix = ".unresolved.pending.json"
-    scoped1 = f".unresolved.{scope}.json"
-    scoped2 = f".{scope}.unresolved.json"
-    scopedp1 = f".unresolved.pending.{scope}.json"
-    scopedp2 = f".{scope}.unresolved.pending.json"
-    for p in STATE_DIR.iterdir():
-        if p.is_file():
-            name = p.name
-            if not name.startswith(prefix):
-                continue
-            is_blocking = (name.endswith(scoped1) or name.endswith(scoped2) or name.endswith(suffix))
-            is_pending = (name.endswith(scopedp1) or name.endswith(scopedp2) or name.endswith(pending_suffix))
-            if not (is_blocking or is_pending):
-                continue
-
-            rp = p
-            if (name.endswith(suffix) or name.endswith(pending_suffix)) and not (
-                name.endswith(scoped1) or name.endswith(scoped2) or name.endswith(scopedp1) or name.endswith(scopedp2)
-            ):
-                rp = scoped_file(STATE_DIR, name)
-
-            data = _read_json(rp)
-            if is_pending and isinstance(data, dict):
-                raw_hints = data.get("hints")
-                hints = raw_hints if isinstance(raw_hints, dict) else {}
-                raw_keys = data.get("keys")
-                keys = raw_keys if isinstance(raw_keys, list) else []
-                for k in keys:
-                    if not k:
-                        continue
-                    v = (hints or {}).get(k) or {}
-                    out[str(k)] = v if isinstance(v, dict) else {}
-            else:
-                for k, v in (data or {}).items():
-                    out[str(k)] = v if isinstance(v, dict) else {}
+    for p in _blocking_files(dst_lower):
+        for k, v in _read_json(p).items():
+            out[str(k)] = v if isinstance(v, dict) else {}
+    for e in _pending(dst_lower):
+        out[e["key"]] = _pending_hint(e)
     return out
 
 
 def load_unresolved_items(dst: str | None = None) -> list[dict[str, Any]]:
     out: dict[str, dict[str, Any]] = {}
-    if not STATE_DIR.exists():
-        return []
     dst_lower = str(dst or "").strip().lower()
-    for p in sorted(STATE_DIR.iterdir()):
+    for p in (sorted(STATE_DIR.iterdir()) if STATE_DIR.exists() else []):
         if not p.is_file():
             continue
         name = p.name
-        if ".unresolved" not in name or not name.endswith(".json"):
+        if ".unresolved" not in name or ".unresolved.pending" in name or not name.endswith(".json"):
             continue
         if dst_lower and not name.startswith(f"{dst_lower}_"):
             continue
@@ -252,37 +221,35 @@ def load_unresolved_items(dst: str | None = None) -> list[dict[str, Any]]:
             if isinstance(item, Mapping):
                 rec["item"] = dict(item)
             out[ck] = rec
+
+    for e in (_pending(dst_lower, scoped=False) if dst_lower else _pending_all()):
+        if e["key"] in out:
+            continue
+        out[e["key"]] = _pending_record(e)
     return list(out.values())
 
 
+def _pending_all() -> list[dict[str, Any]]:
+    try:
+        return guard_state.entries(_base(), guard_state.UNRESOLVED)
+    except Exception:
+        return []
+
+
+def _pending_record(entry: Mapping[str, Any]) -> dict[str, Any]:
+    reason = str(_pending_hint(entry).get("reason") or "").strip()
+    rec: dict[str, Any] = {"key": entry["key"], "reason": reason, "feature": entry["feature"]}
+    data = entry.get("data")
+    item = data.get("item") if isinstance(data, Mapping) else None
+    if isinstance(item, Mapping):
+        rec["item"] = dict(item)
+    return rec
+
+
 def load_unresolved_pending(dst: str, feature: str) -> list[dict[str, Any]]:
     if not dst or not feature:
         return []
-    data = _read_json(_pending_path(dst, feature))
-    if not isinstance(data, dict):
-        return []
-    raw_items = data.get("items")
-    items: dict[str, Any] = raw_items if isinstance(raw_items, dict) else {}
-    raw_hints = data.get("hints")
-    hints: dict[str, Any] = raw_hints if isinstance(raw_hints, dict) else {}
-    keys = data.get("keys")
-    key_iter = keys if isinstance(keys, list) else list(items.keys())
-
-    out: list[dict[str, Any]] = []
-    seen: set[str] = set()
-    for raw_ck in key_iter:
-        ck = str(raw_ck or "").strip()
-        if not ck or ck in seen:
-            continue
-        seen.add(ck)
-        hint = hints.get(ck)
-        reason = str(hint.get("reason") or "").strip() if isinstance(hint, Mapping) else ""
-        rec: dict[str, Any] = {"key": ck, "reason": reason, "feature": str(feature).strip().lower()}
-        item = items.get(ck)
-        if isinstance(item, Mapping):
-            rec["item"] = dict(item)
-        out.append(rec)
-    return out
+    return [_pending_record(e) for e in _pending(dst, feature)]
 
 
 # Write helpers
@@ -332,22 +299,13 @@ def record_unresolved(
     *,
     hint: str = "provider_down",
 ) -> dict[str, Any]:
-    path = _pending_path(dst, feature)
+    prov = str(dst).strip().lower()
+    feat = str(feature).strip().lower()
+    scope = scope_safe()
+    base = _base()
     now = int(time.time())
 
-    data: dict[str, Any] = {"keys": [], "items": {}, "hints": {}}
-    cur = _read_json(path)
-    if cur:
-        try:
-            data["keys"] = list(set(cur.get("keys") or []))
-            data["items"] = dict(cur.get("items") or {})
-            data["hints"] = dict(cur.get("hints") or {})
-        except Exception:
-            pass
-
-    existing: set[str] = set(data["keys"])
-    added = 0
-
+    incoming: dict[str, tuple[dict[str, Any] | None, str | None]] = {}
     for it in (items or []):
         item_hint = None
         if isinstance(it, Mapping):
@@ -356,31 +314,41 @@ def record_unresolved(
         ck, min_item = _to_ck_and_min(it)
         if not ck:
             continue
-        if ck not in existing:
-            data["keys"].append(ck)
-            existing.add(ck)
+        prev_item, _ = incoming.get(ck, (None, None))
+        incoming[ck] = (min_item if min_item is not None else prev_item, item_hint or hint)
+
+    existing = {e["key"]: e.get("data") or {} for e in _pending(prov, feat, keys=incoming)}
+    rows: dict[str, dict[str, Any]] = {}
+    added = 0
+    for ck, (min_item, effective_hint) in incoming.items():
+        cur = existing.get(ck)
+        if cur is None:
             added += 1
+        data: dict[str, Any] = dict(cur or {"item": None, "hint": None})
         if min_item is not None:
-            data["items"][ck] = min_item
-
-        effective_hint = item_hint or hint
+            data["item"] = min_item
         if effective_hint:
-            hints = data.setdefault("hints", {})
-            existing_hint = hints.get(ck) if isinstance(hints, dict) else None
+            existing_hint = data.get("hint")
             existing_reason = ""
             if isinstance(existing_hint, Mapping):
                 existing_reason = str(existing_hint.get("reason") or "").strip()
             new_reason = str(effective_hint).strip()
-            if (
+            if not (
                 existing_reason
                 and existing_reason not in _GENERIC_FAILURE_HINTS
                 and new_reason in _GENERIC_FAILURE_HINTS
             ):
-                continue
-            hints[ck] = {"reason": new_reason, "ts": now}
+                data["hint"] = {"reason": new_reason, "ts": now}
+        rows[ck] = data
 
-    ok, error = _atomic_write(path, data)
-    return {"ok": ok, "count": added if ok else 0, "path": str(path), **({"error": error} if error else {})}
+    path = str(crosswatch_db_path(base))
+    try:
+        guard_state.upsert(base, guard_state.UNRESOLVED, prov, feat, scope, rows, ts=now)
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+        _LOG.error("unresolved_state_write_failed path=%s error=%s", path, error)
+        return {"ok": False, "count": 0, "path": path, "error": error}
+    return {"ok": True, "count": added, "path": path}
 
 
 def clear_unresolved(
@@ -393,26 +361,12 @@ def clear_unresolved(
         return {"ok": True, "count": 0}
 
     removed = 0
-
-    pend = _pending_path(dst, feature)
-    pdata = _read_json(pend)
-    if pdata:
-        pchanged = False
-        klist = pdata.get("keys")
-        if isinstance(klist, list):
-            kept = [k for k in klist if str(k) not in key_set]
-            if len(kept) != len(klist):
-                removed += len(klist) - len(kept)
-                pdata["keys"] = kept
-                pchanged = True
-        for bucket in ("items", "hints"):
-            sub = pdata.get(bucket)
-            if isinstance(sub, dict):
-                for k in [k for k in sub.keys() if str(k) in key_set]:
-                    sub.pop(k, None)
-                    pchanged = True
-        if pchanged:
-            _atomic_write(pend, pdata)
+    try:
+        removed += guard_state.delete(
+            _base(), guard_state.UNRESOLVED, str(dst).strip().lower(), str(feature).strip().lower(), scope_safe(), key_set,
+        )
+    except Exception:
+        pass
 
     blk = _blocking_path(dst, feature)
     bdata = _read_json(blk)
@@ -55,6 +55,7 @@ class Orchestrator:
     only_feature: str | None = None
     write_state_json: bool = True
     state_path: Path | None = None
+    on_event: Callable[[str, dict[str, Any]], None] | None = None
 
     files: StateStore | None = field(init=False, default=None)
     providers: dict[str, InventoryOps] = field(init=False, default_factory=dict)
@@ -78,7 +79,7 @@ class Orchestrator:
         rt = dict(self.cfg.get("runtime") or {})
         self.debug = bool(rt.get("debug", False))
 
-        self.emitter = Emitter(self.on_progress)
+        self.emitter = Emitter(self.on_progress, self.on_event)
         self.emit = self.emitter.emit
         self.emit_info = self.emitter.info
         self.dbg = lambda *a, **k: self.emitter.dbg(self.debug, *a, **k)
@@ -159,11 +160,15 @@ class Orchestrator:
         write_state_json: bool = True,
         state_path: str | None = None,
         progress: Callable[[str], None] | bool | None = None,
+        events: Callable[[str, dict[str, Any]], None] | None = None,
         **kwargs: Any,
     ) -> dict[str, Any]:
         prev_cb = self.emitter.cb
         prev_on = self.on_progress
+        prev_sink = self.emitter.sink
         try:
+            if events is not None:
+                self.emitter.sink = events
             if progress is not None:
                 if callable(progress):
                     cb: Callable[[str], None] = progress  # type: ignore[assignment]
@@ -223,6 +228,7 @@ class Orchestrator:
             return summary
         finally:
             self.emitter.cb = prev_cb
+            self.emitter.sink = prev_sink
             self.on_progress = prev_on
 
     def run_pairs(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
@@ -446,7 +452,7 @@ class Orchestrator:
         if not self.write_state_json:
             return {}
 
-        state: dict[str, Any] = self.state_store.load_state_features({feature}) or {}
+        state: dict[str, Any] = dict(self.state_store.load_state_features({feature}) or {})
         providers = dict(state.get("providers") or {})
         wall: list[dict[str, Any]] = []
 
@@ -386,7 +386,7 @@ class PlaylistPlan:
         }
 
 
-def _providers() -> dict[str, Any]:
+def _providers() -> Mapping[str, Any]:
     from .orchestrator._providers import load_sync_providers
 
     return load_sync_providers()
@@ -0,0 +1,123 @@
+# cw_platform/startup_profile.py
+# Cold-start profile: lifespan step timings and an import-time breakdown.
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+__all__ = ["enabled", "record", "step", "steps", "reset", "group_of", "parse_importtime", "import_breakdown", "report"]
+
+ENV_FLAG = "CW_STARTUP_PROFILE"
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Packages that are broken down one level deeper so provider and API costs stand apart.
+_SPLIT = ("api", "providers", "cw_platform", "services")
+
+_lock = threading.Lock()
+_steps: list[tuple[str, float]] = []
+
+
+def enabled() -> bool:
+    return str(os.environ.get(ENV_FLAG) or "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def record(name: str, since: float) -> None:
+    """Record a step that started at ``since`` (a ``time.perf_counter()`` value)."""
+    ms = (time.perf_counter() - since) * 1000.0
+    with _lock:
+        _steps.append((str(name), ms))
+
+
+@contextmanager
+def step(name: str) -> Iterator[None]:
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, t0)
+
+
+def steps() -> list[dict[str, Any]]:
+    with _lock:
+        return [{"step": n, "ms": round(ms, 2)} for n, ms in _steps]
+
+
+def reset() -> None:
+    with _lock:
+        _steps.clear()
+
+
+def group_of(module: str) -> str:
+    parts = module.split(".")
+    if parts[0] in _SPLIT and len(parts) > 1:
+        return ".".join(parts[:2])
+    return parts[0]
+
+
+def parse_importtime(text: str) -> list[tuple[str, int, int]]:
+    """Rows of ``(module, self_us, cumulative_us)`` from ``python -X importtime`` output."""
+    rows: list[tuple[str, int, int]] = []
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cum_us = int(fields[0].strip()), int(fields[1].strip())
+        except ValueError:
+            continue
+        rows.append((fields[2].strip(), self_us, cum_us))
+    return rows
+
+
+def import_breakdown(module: str = "crosswatch", *, top: int = 15, python: str | None = None, timeout: float = 120.0) -> dict[str, Any]:
+    """Import ``module`` in a fresh interpreter and group self time by package."""
+    proc = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(REPO_ROOT),
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        env={**os.environ, ENV_FLAG: "0"},
+    )
+    rows = parse_importtime(proc.stderr)
+    groups: dict[str, list[int]] = {}
+    for name, self_us, _cum in rows:
+        g = groups.setdefault(group_of(name), [0, 0])
+        g[0] += self_us
+        g[1] += 1
+    total_us = sum(self_us for _n, self_us, _c in rows)
+    by_group = sorted(groups.items(), key=lambda kv: (-kv[1][0], kv[0]))
+    slowest = sorted(rows, key=lambda r: (-r[2], r[0]))
+    return {
+        "module": module,
+        "ok": proc.returncode == 0,
+        "error": (proc.stderr.strip().splitlines() or [""])[-1] if proc.returncode else "",
+        "total_ms": round(total_us / 1000.0, 1),
+        "modules": len(rows),
+        "groups": [{"group": g, "ms": round(us / 1000.0, 1), "modules": n} for g, (us, n) in by_group[: max(1, top)]],
+        "slowest": [{"module": n, "ms": round(cum / 1000.0, 1)} for n, _s, cum in slowest[: max(1, top)]],
+    }
+
+
+def report() -> dict[str, Any]:
+    recorded = steps()
+    loaded = sorted(
+        name.rsplit("_mod_", 1)[-1]
+        for name in list(sys.modules)
+        if name.startswith("providers.sync._mod_") and name.count(".") == 2
+    )
+    return {
+        "steps": recorded,
+        "total_ms": round(sum(s["ms"] for s in recorded), 2),
+        "sync_modules_loaded": loaded,
+    }
@@ -0,0 +1,115 @@
+# cw_platform/ttl_cache.py
+# Bounded LRU map with idle expiry and eviction counters.
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from typing import Any, Generic, TypeVar
+
+__all__ = ["TTLCache"]
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[V]):
+    """Least-recently-used map capped at ``maxsize`` entries.
+
+    Entries untouched for ``ttl`` seconds are dropped on access or during the
+    periodic sweep that runs on writes. ``ttl <= 0`` disables expiry.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 0.0, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self.maxsize = max(1, int(maxsize))
+        self.ttl = max(0.0, float(ttl))
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._data: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._next_sweep = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.evicted_lru = 0
+        self.evicted_ttl = 0
+
+    def _expired(self, ts: float, now: float) -> bool:
+        return bool(self.ttl) and now - ts >= self.ttl
+
+    def _sweep_locked(self, now: float) -> None:
+        if not self.ttl or now < self._next_sweep:
+            return
+        self._next_sweep = now + max(1.0, self.ttl / 4.0)
+        while self._data:
+            key, (ts, _) = next(iter(self._data.items()))
+            if not self._expired(ts, now):
+                break
+            del self._data[key]
+            self.evicted_ttl += 1
+
+    def get(self, key: Hashable, default: Any = None) -> V | Any:
+        with self._lock:
+            hit = self._data.get(key, _MISSING)
+            if hit is _MISSING:
+                self.misses += 1
+                return default
+            ts, value = hit  # type: ignore[misc]
+            now = self._clock()
+            if self._expired(ts, now):
+                del self._data[key]
+                self.evicted_ttl += 1
+                self.misses += 1
+                return default
+            self._data[key] = (now, value)
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        with self._lock:
+            now = self._clock()
+            self._data[key] = (now, value)
+            self._data.move_to_end(key)
+            self._sweep_locked(now)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evicted_lru += 1
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], V]) -> V:
+        with self._lock:
+            value = self.get(key, _MISSING)
+            if value is _MISSING:
+                value = factory()
+                self.set(key, value)
+            return value
+
+    def pop(self, key: Hashable, default: Any = None) -> V | Any:
+        with self._lock:
+            hit = self._data.pop(key, _MISSING)
+            return default if hit is _MISSING else hit[1]  # type: ignore[index]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def keys(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._data.keys()))
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evicted_lru": self.evicted_lru,
+            "evicted_ttl": self.evicted_ttl,
+        }
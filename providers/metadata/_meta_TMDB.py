@@ -17,6 +17,7 @@ from typing import Any, Callable
 import requests
 
 from cw_platform.metadata_cache import normalize_title
+from cw_platform.http_metrics import instrument_session
 
 try:
     from _logging import log as _real_log
@@ -33,6 +34,7 @@ def log(msg: str, level: str = "INFO", module: str = "META", **_: Any) -> None:
         pass
 
 IMG_BASE = "https://image.tmdb.org/t/p"
+_HTTP = instrument_session(requests.Session(), "TMDB")
 
 class TmdbProvider:
     name = "TMDB"
@@ -218,7 +220,7 @@ class TmdbProvider:
         attempt = 0
         while True:
             try:
-                r = requests.get(
+                r = _HTTP.get(
                     url,
                     params=q,
                     headers={"User-Agent": self.UA, "Accept": "application/json"},
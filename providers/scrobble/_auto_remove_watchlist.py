@@ -91,11 +91,12 @@ def remove_across_providers_by_ids(
         _log(f"auto-remove failed via _watchlistAPI: {e}", "WARN")
         try:
             from cw_platform.config_base import CONFIG, load_config
+            from cw_platform.local_db.frozen import mutable_copy
             from cw_platform.orchestrator._state_store import StateStore
             from services.watchlist import delete_watchlist_batch
 
             cfg = load_config()
-            st = StateStore(CONFIG).load_state_features({"watchlist"}) or {}
+            st = mutable_copy(StateStore(CONFIG).load_state_features({"watchlist"}) or {})
             keys: list[str] = []
             for k in ("tmdb", "imdb", "tvdb", "trakt"):
                 v = norm.get(k)
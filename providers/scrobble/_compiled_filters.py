@@ -0,0 +1,200 @@
+# providers/scrobble/_compiled_filters.py
+# CrossWatch - precompiled scrobble route filters and one-pass payload field extraction
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from cw_platform.ttl_cache import TTLCache
+from providers.scrobble.media_filters import _EDITION_KEYS, _PATH_KEYS, MediaFilterSpec
+
+_USER_KEYS = frozenset({"userid", "user_id"})
+_PSN_KEY = "playsessionstatenotification"
+
+_COMPILED: TTLCache["CompiledFilter"] = TTLCache(maxsize=64)
+_FIELDS: TTLCache[tuple[Any, "PayloadFields"]] = TTLCache(maxsize=256, ttl=600.0)
+
+
+@dataclass(frozen=True, slots=True)
+class PayloadFields:
+    user_id: str = ""
+    account_id: str = ""
+    account_uuid: str = ""
+    paths: tuple[str, ...] = ()
+    editions: tuple[str, ...] = ()
+
+
+_EMPTY_FIELDS = PayloadFields()
+
+
+def extract_payload_fields(raw: Mapping[str, Any]) -> PayloadFields:
+    """Single walk over a raw provider payload.
+
+    A mapping's own keys are checked before its children, so ``UserId`` and
+    ``PlaySessionStateNotification`` resolve to the shallowest match along the
+    first branch that has one, as the old per-field lookups did.
+    """
+    found: dict[str, Any] = {}
+    paths: list[str] = []
+    editions: list[str] = []
+
+    def add_many(value: Any, out: list[str]) -> None:
+        if isinstance(value, Mapping):
+            walk(value)
+        elif isinstance(value, (list, tuple, set)):
+            for item in value:
+                add_many(item, out)
+        else:
+            text = str(value or "").strip()
+            if text:
+                out.append(text)
+
+    def walk(value: Any) -> None:
+        if isinstance(value, Mapping):
+            if "user" not in found or "psn" not in found:
+                for key, item in value.items():
+                    if not isinstance(key, str):
+                        continue
+                    lk = key.lower()
+                    if lk in _USER_KEYS and "user" not in found:
+                        uid = str(item or "").strip().lower()
+                        if uid:
+                            found["user"] = uid
+                    elif lk == _PSN_KEY and "psn" not in found:
+                        first = (item or [None])[0] if isinstance(item, list) else item
+                        if isinstance(first, Mapping):
+                            found["psn"] = first
+            for key, item in value.items():
+                lk = str(key or "").strip().lower()
+                if lk in _PATH_KEYS:
+                    add_many(item, paths)
+                elif lk in _EDITION_KEYS:
+                    add_many(item, editions)
+                else:
+                    walk(item)
+        elif isinstance(value, (list, tuple, set)):
+            for item in value:
+                walk(item)
+
+    walk(raw)
+    psn = found.get("psn") or {}
+    return PayloadFields(
+        user_id=found.get("user", ""),
+        account_id=str(psn.get("accountID") or ""),
+        account_uuid=str(psn.get("accountUUID") or "").lower(),
+        paths=tuple(paths),
+        editions=tuple(editions),
+    )
+
+
+def event_fields(ev: Any) -> PayloadFields:
+    raw = getattr(ev, "raw", None)
+    if not isinstance(raw, Mapping) or not raw:
+        return _EMPTY_FIELDS
+    # Events are re-wrapped with the same raw dict (progress/account tweaks, one
+    # dispatcher per route), so the walk is shared across all of them.
+    hit = _FIELDS.get(id(raw))
+    if hit is not None and hit[0] is raw:
+        return hit[1]
+    fields = extract_payload_fields(raw)
+    _FIELDS.set(id(raw), (raw, fields))
+    return fields
+
+
+def _filter_set(value: Any) -> frozenset[str]:
+    if value is None:
+        return frozenset()
+    items = list(value) if isinstance(value, (list, tuple, set)) else [value]
+    out: set[str] = set()
+    for item in items:
+        if item is None:
+            continue
+        out.update(part.strip() for part in re.split(r"[\s,]+", str(item)) if part.strip())
+    return frozenset(out)
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledFilter:
+    key: str
+    media: MediaFilterSpec
+    want_user: str
+    server_allow: frozenset[str]
+    server_block: frozenset[str]
+    whitelist: Any
+    scoped: bool
+    route_id: str
+    suppress_start_at: int
+    pause_debounce: float
+
+    def server_allowed(self, server_uuid: str | None) -> bool:
+        got = str(server_uuid or "").strip()
+        if got and got in self.server_block:
+            return False
+        if self.server_allow and (not got or got not in self.server_allow):
+            return False
+        return True
+
+    def ignore_reason(self, fields: PayloadFields) -> str | None:
+        if not self.media:
+            return None
+        return self.media.ignore_reason(list(fields.paths), list(fields.editions))
+
+
+def _version_key(watch: Mapping[str, Any], filt: Mapping[str, Any]) -> str:
+    parts = [
+        filt,
+        watch.get("route_id"),
+        watch.get("route_profile_id"),
+        watch.get("suppress_start_at"),
+        watch.get("pause_debounce_seconds"),
+    ]
+    try:
+        return json.dumps(parts, sort_keys=True, default=str)
+    except Exception:
+        return repr(parts)
+
+
+def compile_filters(cfg: Mapping[str, Any] | None) -> CompiledFilter:
+    """Compiled view of ``scrobble.watch`` filters, cached per config version."""
+    watch = ((cfg or {}).get("scrobble") or {}).get("watch") or {}
+    if not isinstance(watch, Mapping):
+        watch = {}
+    filt = watch.get("filters") or {}
+    if not isinstance(filt, Mapping):
+        filt = {}
+    key = _version_key(watch, filt)
+    hit = _COMPILED.get(key)
+    if hit is not None:
+        return hit
+
+    allow = set(_filter_set(filt.get("server_uuid_whitelist")))
+    legacy = str(filt.get("server_uuid") or "").strip()
+    if legacy:
+        allow.add(legacy)
+    try:
+        sup = int(watch.get("suppress_start_at", 99))
+        pause_db = float(watch.get("pause_debounce_seconds", 5))
+    except Exception:
+        sup, pause_db = 99, 5.0
+    wl = filt.get("username_whitelist")
+    compiled = CompiledFilter(
+        key=key,
+        media=MediaFilterSpec.from_filters(filt),
+        want_user=str(filt.get("user_id") or "").strip().lower(),
+        server_allow=frozenset(allow),
+        server_block=_filter_set(filt.get("server_uuid_blacklist")),
+        whitelist=list(wl) if isinstance(wl, (list, tuple)) else wl,
+        scoped=bool(str(watch.get("route_profile_id") or "").strip()),
+        route_id=str(watch.get("route_id") or "?"),
+        suppress_start_at=sup,
+        pause_debounce=pause_db,
+    )
+    _COMPILED.set(key, compiled)
+    return compiled
+
+
+__all__ = ["CompiledFilter", "PayloadFields", "compile_filters", "event_fields", "extract_payload_fields"]
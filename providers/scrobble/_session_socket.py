@@ -0,0 +1,184 @@
+# providers/scrobble/_session_socket.py
+# CrossWatch - shared Jellyfin/Emby session websocket client
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, Mapping
+from urllib.parse import urlencode, urlsplit, urlunsplit
+
+try:
+    import websocket as _ws  # websocket-client
+except Exception:  # pragma: no cover
+    _ws = None
+
+TRANSPORTS = ("auto", "websocket", "poll")
+PUSH_TYPES = ("Sessions", "PlaybackStart", "PlaybackProgress", "PlaybackStopped")
+RECONNECT_INITIAL_SECONDS = 2.0
+RECONNECT_MAX_SECONDS = 120.0
+
+
+def available() -> bool:
+    return _ws is not None
+
+
+def watch_transport(block: Mapping[str, Any] | None) -> str:
+    raw = ((block or {}).get("scrobble") or {}).get("watch_transport") if isinstance(block, Mapping) else None
+    val = str(raw or "auto").strip().lower()
+    return val if val in TRANSPORTS else "auto"
+
+
+def socket_url(base: str, token: str, path: str, device_id: str = "crosswatch") -> str:
+    parts = urlsplit(str(base or "").rstrip("/"))
+    scheme = "wss" if parts.scheme == "https" else "ws"
+    query = urlencode({"api_key": token, "deviceId": device_id or "crosswatch"})
+    return urlunsplit((scheme, parts.netloc, f"{parts.path}{path}", query, ""))
+
+
+class SessionSocket:
+    """Thin websocket client for the MediaBrowser ``SessionsStart`` feed.
+
+    ``recv`` answers keep-alives itself and only returns push messages the
+    watchers care about; it returns ``None`` when nothing arrived in time and
+    raises ``ConnectionError`` once the socket is gone.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        interval_ms: int = 1500,
+        timeout: float = 6.0,
+        verify_ssl: bool = True,
+    ) -> None:
+        self.url = url
+        self.headers = dict(headers or {})
+        self.interval_ms = max(250, int(interval_ms))
+        self.timeout = float(timeout)
+        self.verify_ssl = bool(verify_ssl)
+        self._conn: Any = None
+        self._keepalive = 0.0
+        self._last_keepalive = 0.0
+        self.messages = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._conn is not None
+
+    def connect(self) -> None:
+        if _ws is None:
+            raise ConnectionError("websocket-client not installed")
+        sslopt = None if self.verify_ssl else {"cert_reqs": 0}
+        try:
+            self._conn = _ws.create_connection(
+                self.url,
+                timeout=self.timeout,
+                header=[f"{k}: {v}" for k, v in self.headers.items()],
+                sslopt=sslopt,
+            )
+        except Exception as e:
+            self._conn = None
+            raise ConnectionError(str(e) or type(e).__name__) from e
+        self._last_keepalive = time.monotonic()
+        self.send("SessionsStart", f"0,{self.interval_ms}")
+
+    def send(self, message_type: str, data: Any = None) -> None:
+        if self._conn is None:
+            raise ConnectionError("not connected")
+        msg: dict[str, Any] = {"MessageType": message_type}
+        if data is not None:
+            msg["Data"] = data
+        try:
+            self._conn.send(json.dumps(msg))
+        except Exception as e:
+            self.close(abort=True)
+            raise ConnectionError(str(e) or type(e).__name__) from e
+
+    def _maybe_keepalive(self) -> None:
+        if self._keepalive and time.monotonic() - self._last_keepalive >= self._keepalive:
+            self._last_keepalive = time.monotonic()
+            self.send("KeepAlive")
+
+    def recv(self, timeout: float) -> dict[str, Any] | None:
+        if self._conn is None:
+            raise ConnectionError("not connected")
+        self._maybe_keepalive()
+        try:
+            self._conn.settimeout(max(0.05, float(timeout)))
+            raw = self._conn.recv()
+        except Exception as e:
+            if _ws is not None and isinstance(e, _ws.WebSocketTimeoutException):
+                return None
+            self.close(abort=True)
+            raise ConnectionError(str(e) or type(e).__name__) from e
+        if raw in (None, "", b""):
+            self.close(abort=True)
+            raise ConnectionError("socket closed")
+        try:
+            msg = json.loads(raw)
+        except Exception:
+            return None
+        if not isinstance(msg, dict):
+            return None
+        kind = str(msg.get("MessageType") or "")
+        if kind == "ForceKeepAlive":
+            try:
+                self._keepalive = max(5.0, float(msg.get("Data") or 60) / 2.0)
+            except Exception:
+                self._keepalive = 30.0
+            self.send("KeepAlive")
+            return None
+        if kind not in PUSH_TYPES:
+            return None
+        self.messages += 1
+        return msg
+
+    def close(self, *, abort: bool = False) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            if abort:
+                conn.shutdown()
+                return
+            conn.send(json.dumps({"MessageType": "SessionsStop"}))
+            conn.close(timeout=1)
+        except Exception:
+            try:
+                conn.shutdown()
+            except Exception:
+                pass
+
+
+class SessionCache:
+    """Latest known playing sessions, rebuilt from push messages."""
+
+    def __init__(self) -> None:
+        self.sessions: dict[str, dict[str, Any]] = {}
+
+    def apply(self, msg: Mapping[str, Any]) -> bool:
+        kind = str(msg.get("MessageType") or "")
+        data = msg.get("Data")
+        if kind == "Sessions":
+            if not isinstance(data, list):
+                return False
+            self.sessions = {
+                str(s.get("Id")): s
+                for s in data
+                if isinstance(s, dict) and s.get("Id") and (s.get("NowPlayingItem") or {})
+            }
+            return True
+        if not isinstance(data, dict):
+            return False
+        sid = str(data.get("Id") or data.get("SessionId") or "")
+        if not sid:
+            return False
+        if kind == "PlaybackStopped" or not (data.get("NowPlayingItem") or {}):
+            return self.sessions.pop(sid, None) is not None
+        self.sessions[sid] = dict(data)
+        return True
+
+    def playing(self) -> list[dict[str, Any]]:
+        return list(self.sessions.values())
@@ -10,6 +10,7 @@ from urllib.parse import urlsplit, urlunsplit
 import requests
 
 from cw_platform.config_base import load_config
+from cw_platform.http_metrics import instrument_session
 from cw_platform.provider_instances import normalize_instance_id, resolve_provider_block
 from providers.scrobble._watched_gate import resolve_stop_action
 from services.activity import record_scrobble_event
@@ -195,7 +196,7 @@ class BingeBaseSink(ScrobbleSink):
     def __init__(self, cfg_provider: Callable[[], dict[str, Any]] | None = None, instance_id: Any = None) -> None:
         self._cfg_provider = cfg_provider
         self.instance_id = normalize_instance_id(instance_id)
-        self.session = requests.Session()
+        self.session = instrument_session(requests.Session(), "BINGEBASE")
         self._completed: dict[str, float] = {}
         try:
             self.session.headers.setdefault("Accept", "application/json")
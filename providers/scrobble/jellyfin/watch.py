@@ -14,13 +14,15 @@ except Exception:
     BASE_LOG = None
 
 from cw_platform.config_base import load_config
+from cw_platform.http_metrics import instrument_session
 from providers.scrobble.scrobble import Dispatcher, ScrobbleSink, ScrobbleEvent, MediaType, mask_account as _mask_account
 from providers.scrobble.currently_watching import update_from_event as _cw_update, update_from_payload as _cw_update_payload
 from providers.scrobble.media_filters import event_ignore_reason, log_media_filter_drop
 from providers.scrobble.sources import source_enabled
+from providers.scrobble import _session_socket as session_socket
 
 TRAKT_API = "https://api.trakt.tv"
-_HTTP = requests.Session()
+_HTTP = instrument_session(requests.Session(), "JELLYFIN")
 
 _CFG_CACHE: dict[str, Any] = {"ts": 0.0, "cfg": {}}
 _CFG_TTL_SEC = 2.0
@@ -579,6 +581,10 @@ class JellyfinWatchService:
         self._offline = False
         self._offline_failures = 0
         self._offline_retry = OFFLINE_INITIAL_RETRY_SECONDS
+        self._socket_backoff = session_socket.RECONNECT_INITIAL_SECONDS
+        self._socket_retry_at = 0.0
+        self._socket_failures = 0
+        self.transport = "poll"
 
         lvl = "DEBUG" if self._quiet_startup else "INFO"
         self._log(f"Ensuring Watcher is running; inst={self._instance_id} | wired sinks: {self.sinks_count()}", lvl)
@@ -1004,11 +1010,14 @@ class JellyfinWatchService:
             pass
 
     def _tick(self) -> bool:
-        now = time.time()
         cfg = self._active_cfg()
         cur = self._current_sessions(cfg)
         if cur is None:
             return False
+        return self._process_sessions(cur, cfg)
+
+    def _process_sessions(self, cur: list[dict[str, Any]], cfg: dict[str, Any]) -> bool:
+        now = time.time()
         seen: set[str] = set()
 
         try:
@@ -1262,6 +1271,16 @@ class JellyfinWatchService:
         lvl = "DEBUG" if self._quiet_startup else "INFO"
         self._log(f"Watcher connected; inst={self._instance_id}", lvl)
         while not self._stop.is_set():
+            cfg = self._active_cfg() or {}
+            mode = session_socket.watch_transport(cfg.get("jellyfin"))
+            if mode != "poll" and session_socket.available():
+                if time.monotonic() >= self._socket_retry_at:
+                    self._run_socket()
+                    continue
+                if mode == "websocket":
+                    self._stop.wait(max(0.0, min(self._socket_retry_at - time.monotonic(), self._max_idle_sleep)))
+                    continue
+            self.transport = "poll"
             active = self._tick()
             if active:
                 self._idle_steps = 0
@@ -1273,6 +1292,52 @@ class JellyfinWatchService:
                 sleep_for = self._offline_retry
             self._stop.wait(sleep_for)
 
+    def _socket_failed(self, exc: Exception) -> None:
+        self._socket_failures += 1
+        self._socket_retry_at = time.monotonic() + self._socket_backoff
+        lvl = "WARNING" if self._socket_failures == 1 else "DEBUG"
+        self._log(f"Jellyfin session socket unavailable: {exc}; polling for {int(self._socket_backoff)}s", lvl)
+        self._socket_backoff = min(session_socket.RECONNECT_MAX_SECONDS, self._socket_backoff * 2.0)
+
+    def _run_socket(self) -> None:
+        cfg = self._active_cfg()
+        block = cfg.get("jellyfin") or {}
+        sock = session_socket.SessionSocket(
+            session_socket.socket_url(self._base, self._tok, "/socket", str(block.get("device_id") or "crosswatch")),
+            headers=_hdr(self._tok, cfg),
+            interval_ms=int(self._poll * 1000),
+            timeout=self._request_timeout(cfg),
+            verify_ssl=bool(block.get("verify_ssl", True)),
+        )
+        try:
+            sock.connect()
+        except ConnectionError as e:
+            self._socket_failed(e)
+            return
+        if self._socket_failures:
+            self._log(f"Jellyfin session socket connected; inst={self._instance_id}", "INFO")
+        self._socket_failures = 0
+        self._socket_backoff = session_socket.RECONNECT_INITIAL_SECONDS
+        self.transport = "websocket"
+        self._mark_online()
+        cache = session_socket.SessionCache()
+        primed = False
+        try:
+            while not self._stop.is_set():
+                msg = sock.recv(self._poll)
+                if msg is not None:
+                    primed = cache.apply(msg) or primed
+                cfg = self._active_cfg()
+                if session_socket.watch_transport(cfg.get("jellyfin")) == "poll":
+                    break
+                if primed:
+                    self._process_sessions(cache.playing(), cfg)
+        except ConnectionError as e:
+            self._socket_failed(e)
+        finally:
+            sock.close()
+            self.transport = "poll"
+
     def stop(self) -> None:
         self._stop.set()
         lvl = "DEBUG" if self._quiet_startup else "INFO"
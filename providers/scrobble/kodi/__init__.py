@@ -1,2 +1,2 @@
-"""Kodi HTTP polling watcher."""
+"""Kodi JSON-RPC watcher (notification socket with HTTP polling fallback)."""
 
@@ -1,19 +1,26 @@
 # providers/scrobble/kodi/watch.py
-# CrossWatch - Kodi HTTP JSON-RPC Watcher Service
+# CrossWatch - Kodi JSON-RPC Watcher Service (notifications, HTTP polling fallback)
 # Copyright (c) 2025-2026 CrossWatch / Cenodude
 from __future__ import annotations
 
 import hashlib
+import json
 import threading
 import time
 from collections.abc import Callable, Mapping
 from typing import Any
+from urllib.parse import urlsplit
 
 try:
     from _logging import log as BASE_LOG
 except Exception:
     BASE_LOG = None
 
+try:
+    import websocket as _ws  # websocket-client
+except Exception:  # pragma: no cover
+    _ws = None
+
 from cw_platform.config_base import load_config
 from providers.auth._auth_KODI import KodiAuthError, clean_base, jsonrpc_call
 from providers.scrobble.currently_watching import update_from_event as _cw_update
@@ -31,6 +38,12 @@ OFFLINE_MAX_RETRY_SECONDS = 300.0
 OFFLINE_TIMEOUT_SECONDS = 2.0
 PROFILE_CACHE_SECONDS = 60.0
 SEEK_JUMP_PERCENT = 10.0
+NOTIFY_PORT = 9090
+NOTIFY_TRANSPORTS = ("auto", "websocket", "poll")
+NOTIFY_PROGRESS_REFRESH_SECONDS = 30.0
+NOTIFY_RECONNECT_INITIAL_SECONDS = 5.0
+NOTIFY_RECONNECT_MAX_SECONDS = 300.0
+PLAY_NOTIFICATIONS = frozenset({"Player.OnPlay", "Player.OnAVStart", "Player.OnResume"})
 
 
 def _log(msg: str, level: str = "INFO") -> None:
@@ -179,6 +192,74 @@ def _metadata_from_item(item: Mapping[str, Any], props: Mapping[str, Any]) -> di
     }
 
 
+def _notify_url(server: str, port: Any) -> str:
+    parts = urlsplit(clean_base(server))
+    if not parts.hostname:
+        return ""
+    host = f"[{parts.hostname}]" if ":" in parts.hostname else parts.hostname
+    scheme = "wss" if parts.scheme == "https" else "ws"
+    return f"{scheme}://{host}:{_to_int(port) or NOTIFY_PORT}/jsonrpc"
+
+
+class KodiNotificationSocket:
+    """Kodi JSON-RPC websocket (port 9090 unless ``kodi.notification_port`` is set).
+
+    Only notifications are read from it; ``recv`` returns ``None`` on timeout
+    or for non-notification frames and raises ``ConnectionError`` once the
+    socket is gone.
+    """
+
+    def __init__(self, url: str, *, timeout: float = 6.0, verify_ssl: bool = False) -> None:
+        self.url = url
+        self.timeout = float(timeout)
+        self.verify_ssl = bool(verify_ssl)
+        self._conn: Any = None
+        self.messages = 0
+
+    def connect(self) -> None:
+        if _ws is None:
+            raise ConnectionError("websocket-client not installed")
+        if not self.url:
+            raise ConnectionError("missing Kodi server URL")
+        try:
+            self._conn = _ws.create_connection(self.url, timeout=self.timeout, sslopt=None if self.verify_ssl else {"cert_reqs": 0})
+        except Exception as e:
+            self._conn = None
+            raise ConnectionError(str(e) or type(e).__name__) from e
+
+    def recv(self, timeout: float) -> tuple[str, dict[str, Any]] | None:
+        if self._conn is None:
+            raise ConnectionError("not connected")
+        try:
+            self._conn.settimeout(max(0.05, float(timeout)))
+            raw = self._conn.recv()
+        except Exception as e:
+            if _ws is not None and isinstance(e, _ws.WebSocketTimeoutException):
+                return None
+            self.close()
+            raise ConnectionError(str(e) or type(e).__name__) from e
+        if raw in (None, "", b""):
+            self.close()
+            raise ConnectionError("socket closed")
+        try:
+            msg = json.loads(raw)
+        except Exception:
+            return None
+        if not isinstance(msg, Mapping) or "id" in msg or not msg.get("method"):
+            return None
+        self.messages += 1
+        return str(msg.get("method")), _dict(_dict(msg.get("params")).get("data"))
+
+    def close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            conn.shutdown()
+        except Exception:
+            pass
+
+
 class KodiWatchService:
     def __init__(
         self,
@@ -208,6 +289,10 @@ class KodiWatchService:
         self._offline = False
         self._offline_failures = 0
         self._offline_retry = OFFLINE_INITIAL_RETRY_SECONDS
+        self._notify_backoff = NOTIFY_RECONNECT_INITIAL_SECONDS
+        self._notify_retry_at = 0.0
+        self._notify_failures = 0
+        self.transport = "poll"
 
     def _active_cfg(self) -> dict[str, Any]:
         if self._cfg_provider:
@@ -536,6 +621,28 @@ class KodiWatchService:
             self._sessions.pop(sk, None)
         self._player_session.clear()
 
+    def _refresh_player(self, player: Mapping[str, Any]) -> bool:
+        player_id = int(player.get("playerid") or 0)
+        sk = self._player_session.get(player_id)
+        session = self._sessions.get(sk or "")
+        try:
+            if session is None:
+                item = self._player_item(player_id)
+                props = self._player_props(player_id)
+                session = self._create_session(player, item, props)
+                if session is None:
+                    return False
+            else:
+                props = self._player_props(player_id)
+                if bool(props.get("live")):
+                    return False
+            self._maybe_dispatch_progress(session, props)
+            session["last_properties"] = props
+            return True
+        except Exception as exc:
+            self._log_error_limited(f"{type(exc).__name__}:{player_id}", f"Kodi player {player_id} poll failed: {exc}")
+            return False
+
     def _tick(self) -> bool:
         cfg = self._active_cfg()
         if not self._configured(cfg):
@@ -562,28 +669,8 @@ class KodiWatchService:
         for player in video_players:
             player_id = int(player.get("playerid") or 0)
             seen_player_ids.add(player_id)
-            sk = self._player_session.get(player_id)
-            session = self._sessions.get(sk or "")
-            try:
-                if session is None:
-                    item = self._player_item(player_id)
-                    props = self._player_props(player_id)
-                    session = self._create_session(player, item, props)
-                    if session is None:
-                        continue
-                    active_supported = True
-                    self._maybe_dispatch_progress(session, props)
-                    session["last_properties"] = props
-                else:
-                    props = self._player_props(player_id)
-                    if bool(props.get("live")):
-                        continue
-                    active_supported = True
-                    self._maybe_dispatch_progress(session, props)
-                    session["last_properties"] = props
-            except Exception as exc:
-                self._log_error_limited(f"{type(exc).__name__}:{player_id}", f"Kodi player {player_id} poll failed: {exc}")
-                continue
+            if self._refresh_player(player):
+                active_supported = True
 
         for player_id, sk in list(self._player_session.items()):
             if player_id not in seen_player_ids:
@@ -602,6 +689,15 @@ class KodiWatchService:
             return
         self._stop.clear()
         while not self._stop.is_set():
+            mode = self._notify_transport(self._active_cfg())
+            if mode != "poll" and _ws is not None:
+                if time.monotonic() >= self._notify_retry_at:
+                    self._run_notifications()
+                    continue
+                if mode == "websocket":
+                    self._stop.wait(max(0.0, min(self._notify_retry_at - time.monotonic(), MAX_IDLE_POLL_SECONDS)))
+                    continue
+            self.transport = "poll"
             active = self._tick()
             if self._offline:
                 self._stop.wait(self._offline_retry)
@@ -612,6 +708,97 @@ class KodiWatchService:
                 self._idle_poll = min(MAX_IDLE_POLL_SECONDS, max(self._base_poll, self._idle_poll + 0.75))
             self._stop.wait(self._idle_poll)
 
+    def _notify_transport(self, cfg: Mapping[str, Any]) -> str:
+        val = str(self._kodi_cfg(cfg).get("watch_transport") or "auto").strip().lower()
+        return val if val in NOTIFY_TRANSPORTS else "auto"
+
+    def _notify_failed(self, exc: Exception) -> None:
+        self._notify_failures += 1
+        self._notify_retry_at = time.monotonic() + self._notify_backoff
+        lvl = "WARNING" if self._notify_failures == 1 else "DEBUG"
+        _log(f"Kodi notification socket unavailable: {exc}; polling for {int(self._notify_backoff)}s", lvl)
+        self._notify_backoff = min(NOTIFY_RECONNECT_MAX_SECONDS, self._notify_backoff * 2.0)
+
+    def _stop_player(self, player_id: int) -> None:
+        sk = self._player_session.pop(player_id, None)
+        session = self._sessions.pop(sk or "", None)
+        if session is None:
+            return
+        pct = float(session.get("last_progress") or 0.0)
+        self._dispatch_event(self._event(session, "stop", pct, _dict(session.get("last_properties"))), session.get("duration_ms"))
+
+    def _on_notification(self, method: str, data: Mapping[str, Any]) -> None:
+        player = _dict(data.get("player"))
+        player_id = _to_int(player.get("playerid"))
+        if method == "Player.OnStop":
+            # OnStop carries no player id; one GetActivePlayers tells which sessions ended.
+            try:
+                players = self._active_players()
+            except Exception as exc:
+                self._mark_offline(exc)
+                return
+            alive = {int(p.get("playerid") or 0) for p in players if str(p.get("type") or "").lower() == "video"}
+            for pid in list(self._player_session):
+                if pid not in alive:
+                    self._stop_player(pid)
+            return
+        if player_id is None or player_id < 0:
+            return
+        if method in PLAY_NOTIFICATIONS:
+            item = _dict(data.get("item"))
+            session = self._sessions.get(self._player_session.get(player_id) or "")
+            item_id = item.get("id")
+            if session is not None and item_id not in (None, "", -1) and _dict(session.get("item")).get("id") != item_id:
+                self._stop_player(player_id)
+        elif method not in ("Player.OnPause", "Player.OnSeek", "Player.OnSpeedChanged"):
+            return
+        if method != "Player.OnSpeedChanged" or player_id in self._player_session:
+            self._refresh_player({"playerid": player_id, "type": "video"})
+
+    def _run_notifications(self) -> None:
+        cfg = self._active_cfg()
+        kodi = self._kodi_cfg(cfg)
+        sock = KodiNotificationSocket(
+            _notify_url(str(kodi.get("server") or ""), kodi.get("notification_port")),
+            timeout=min(float(kodi.get("timeout", 6.0) or 6.0), 6.0),
+            verify_ssl=bool(kodi.get("verify_ssl", False)),
+        )
+        try:
+            sock.connect()
+        except ConnectionError as e:
+            self._notify_failed(e)
+            return
+        if self._notify_failures:
+            _log(f"Kodi notification socket connected; inst={self._instance_id}", "INFO")
+        self._notify_failures = 0
+        self._notify_backoff = NOTIFY_RECONNECT_INITIAL_SECONDS
+        self.transport = "websocket"
+        try:
+            # Resync once so playback that started while disconnected is picked up.
+            self._tick()
+            refreshed = time.monotonic()
+            while not self._stop.is_set():
+                playing = [s for s in self._sessions.values() if s.get("state") == "playing"]
+                wait = NOTIFY_PROGRESS_REFRESH_SECONDS - (time.monotonic() - refreshed) if playing else self._base_poll
+                msg = sock.recv(max(0.05, min(wait, self._base_poll)))
+                if self._notify_transport(self._active_cfg()) == "poll":
+                    break
+                if msg is not None:
+                    self._on_notification(*msg)
+                    refreshed = time.monotonic()
+                    continue
+                if not playing or time.monotonic() - refreshed < NOTIFY_PROGRESS_REFRESH_SECONDS:
+                    continue
+                refreshed = time.monotonic()
+                for session in playing:
+                    if session.get("session_key") in self._sessions:
+                        self._refresh_player({"playerid": session.get("playerid"), "type": "video"})
+        except ConnectionError as e:
+            self._notify_failed(e)
+        finally:
+            sock.close()
+            self.transport = "poll"
+
     def start_async(self) -> None:
         if self._bg and self._bg.is_alive():
             return
@@ -12,6 +12,7 @@ from typing import Any
 import requests
 
 from cw_platform.config_base import load_config
+from cw_platform.http_metrics import instrument_session
 from cw_platform.local_db.ttl_dedupe import once_per_ttl
 from cw_platform.provider_instances import normalize_instance_id
 from services.activity import record_scrobble_event
@@ -532,7 +533,7 @@ class MDBListSink(ScrobbleSink):
 
     def _post(self, path: str, body: dict[str, Any], api_key: str, cfg: dict[str, Any]) -> requests.Response:
         headers = {"Accept": "application/json", "Content-Type": "application/json", "User-Agent": APP_AGENT}
-        session = requests.Session()
+        session = instrument_session(requests.Session(), "MDBLIST")
         return _provider_auth().request_with_auth(
             "mdblist",
             session,
@@ -2,6 +2,7 @@
 # CrossWatch - Scrobble media-level filters
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Mapping
 
@@ -169,41 +170,55 @@ def _marker_file_exists(paths: list[str], markers: list[str]) -> str | None:
     return None
 
 
+@dataclass(frozen=True, slots=True)
+class MediaFilterSpec:
+    prefixes: tuple[str, ...] = ()
+    patterns: tuple[str, ...] = ()
+    editions: tuple[str, ...] = ()
+    markers: tuple[str, ...] = ()
+
+    @classmethod
+    def from_filters(cls, filters: Mapping[str, Any] | None) -> "MediaFilterSpec":
+        filt = filters if isinstance(filters, Mapping) else {}
+        patterns = _as_list(filt.get("ignored_filename_patterns"))
+        editions = _as_list(filt.get("ignored_editions"))
+        markers = _as_list(filt.get("ignored_marker_files"))
+        if bool(filt.get("ignore_agregarr_trailers")):
+            patterns = [*DEFAULT_AGREGARR_FILENAME_PATTERNS, *patterns]
+            editions = [*DEFAULT_AGREGARR_EDITIONS, *editions]
+            markers = [*DEFAULT_AGREGARR_MARKER_FILES, *markers]
+        return cls(
+            prefixes=tuple(_as_list(filt.get("ignored_path_prefixes"))),
+            patterns=tuple(patterns),
+            editions=tuple(editions),
+            markers=tuple(markers),
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.prefixes or self.patterns or self.editions or self.markers)
+
+    def ignore_reason(self, paths: list[str], editions: list[str]) -> str | None:
+        if not self:
+            return None
+        return (
+            _path_matches_prefix(paths, list(self.prefixes))
+            or _path_matches_pattern(paths, list(self.patterns))
+            or _edition_matches(editions, list(self.editions))
+            or _marker_file_exists(paths, list(self.markers))
+        )
+
+
 def media_filter_ignore_reason(
     filters: Mapping[str, Any] | None,
     raw: Mapping[str, Any] | None,
     *,
     title: Any = None,
 ) -> str | None:
-    filt = filters if isinstance(filters, Mapping) else {}
+    spec = MediaFilterSpec.from_filters(filters)
+    if not spec:
+        return None
     raw_map = raw if isinstance(raw, Mapping) else {}
-    paths, editions = _walk_media_values(raw_map)
-
-    custom_prefixes = _as_list(filt.get("ignored_path_prefixes"))
-    custom_patterns = _as_list(filt.get("ignored_filename_patterns"))
-    custom_editions = _as_list(filt.get("ignored_editions"))
-    custom_markers = _as_list(filt.get("ignored_marker_files"))
-
-    agregarr_on = bool(filt.get("ignore_agregarr_trailers"))
-    if agregarr_on:
-        custom_patterns = [*DEFAULT_AGREGARR_FILENAME_PATTERNS, *custom_patterns]
-        custom_editions = [*DEFAULT_AGREGARR_EDITIONS, *custom_editions]
-        custom_markers = [*DEFAULT_AGREGARR_MARKER_FILES, *custom_markers]
-
-    reason = _path_matches_prefix(paths, custom_prefixes)
-    if reason:
-        return reason
-    reason = _path_matches_pattern(paths, custom_patterns)
-    if reason:
-        return reason
-    reason = _edition_matches(editions, custom_editions)
-    if reason:
-        return reason
-    reason = _marker_file_exists(paths, custom_markers)
-    if reason:
-        return reason
-
-    return None
+    return spec.ignore_reason(*_walk_media_values(raw_map))
 
 
 def event_ignore_reason(event: Any, cfg: Mapping[str, Any] | None) -> str | None:
@@ -19,6 +19,7 @@ except Exception:
     BASE_LOG = None
 
 from cw_platform.config_base import load_config, save_config
+from cw_platform.http_metrics import instrument_session
 from cw_platform.account_match import media_account_allowed, normalize_media_account_name
 from cw_platform.provider_instances import ensure_instance_block, normalize_instance_id
 from providers.scrobble.scrobble import (
@@ -36,6 +37,7 @@ from providers.scrobble.sources import source_enabled
 
 _CFG_CACHE: dict[str, Any] = {"ts": 0.0, "cfg": {}}
 _CFG_TTL_SEC = 2.0
+_HTTP = instrument_session(requests.Session(), "PLEX")
 OFFLINE_INITIAL_RETRY_SECONDS = 30.0
 OFFLINE_MAX_RETRY_SECONDS = 300.0
 
@@ -127,7 +129,7 @@ def _try_discover_pms_token(cfg: dict[str, Any], baseurl: str, cloud_token: str,
     }
 
     try:
-        r = requests.get(
+        r = _HTTP.get(
             "https://plex.tv/api/resources",
             params={"includeHttps": 1, "includeRelay": 1, "includeIPv6": 1},
             headers=headers,
@@ -185,7 +187,7 @@ def _try_discover_pms_token(cfg: dict[str, Any], baseurl: str, cloud_token: str,
             verify_ssl = True
             if isinstance(px, dict) and "verify_ssl" in px:
                 verify_ssl = bool(px.get("verify_ssl") is not False)
-            r2 = requests.get(
+            r2 = _HTTP.get(
                 base.rstrip("/") + "/identity",
                 headers={"X-Plex-Token": tok, "Accept": "application/xml"},
                 timeout=6,
@@ -1690,7 +1692,7 @@ def _mdblist_send_rating(media_type: str, ids: dict[str, Any], rating: int, cfg:
     r: requests.Response | None = None
     for attempt in range(max_retries):
         try:
-            sess = requests.Session()
+            sess = instrument_session(requests.Session(), "MDBLIST")
             r = provider_auth.request_with_auth(
                 "mdblist",
                 sess,
@@ -13,6 +13,7 @@ from typing import Any
 import requests
 
 from cw_platform.config_base import load_config
+from cw_platform.http_metrics import instrument_session
 from cw_platform.event_archive import record_watch
 from cw_platform.local_db.ttl_dedupe import once_per_ttl
 from cw_platform.provider_instances import normalize_instance_id, resolve_provider_block
@@ -190,7 +191,7 @@ class PunchPlaySink(ScrobbleSink):
     def __init__(self, cfg_provider: Callable[[], dict[str, Any]] | None = None, instance_id: Any = None) -> None:
         self._cfg_provider = cfg_provider
         self.instance_id = normalize_instance_id(instance_id)
-        self.session = requests.Session()
+        self.session = instrument_session(requests.Session(), "PUNCHPLAY")
         try:
             self.session.headers.setdefault("Accept", "application/json")
             self.session.headers.setdefault("User-Agent", APP_AGENT)
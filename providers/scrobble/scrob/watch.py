@@ -17,6 +17,7 @@ except Exception:
     BASE_LOG = None
 
 from cw_platform.config_base import load_config
+from cw_platform.http_metrics import instrument_session
 from cw_platform.provider_instances import normalize_instance_id, resolve_provider_block
 from providers.scrobble.currently_watching import update_from_event as _cw_update
 from providers.scrobble.currently_watching import update_from_payload as _cw_update_payload
@@ -156,7 +157,7 @@ class ScrobWatchService:
         self._quiet_startup = bool(quiet_startup)
         self._offline = False
         self._offline_retry = OFFLINE_INITIAL_RETRY_SECONDS
-        self.session = requests.Session()
+        self.session = instrument_session(requests.Session(), "SCROB")
         try:
             self.session.headers.setdefault("Accept", "application/json")
             self.session.headers.setdefault("User-Agent", "CrossWatch/Watcher/1.0")
@@ -12,7 +12,9 @@ from pathlib import Path
 from typing import Any, Iterable, Literal, Protocol
 
 from cw_platform.account_match import media_account_allowed, normalize_media_account_name
-from providers.scrobble.media_filters import event_ignore_reason, log_media_filter_drop
+from cw_platform.ttl_cache import TTLCache
+from providers.scrobble._compiled_filters import compile_filters, event_fields
+from providers.scrobble.media_filters import log_media_filter_drop
 
 try:
     from _logging import log as BASE_LOG
@@ -30,6 +32,10 @@ def _log(msg: str, lvl: str = "INFO") -> None:
     print(f"[SCROBBLE:{(lvl or 'INFO').upper()}] {msg}")
 
 
+SESSION_STATE_MAX = 2048
+SESSION_STATE_TTL_SECONDS = 6 * 3600.0
+
+
 def _load_config() -> dict[str, Any]:
     try:
         from cw_platform.config_base import load_config as _load_cfg
@@ -75,35 +81,6 @@ def _norm_user(s: str) -> str:
     return normalize_media_account_name(s)
 
 
-def _as_filter_set(value: Any) -> set[str]:
-    if value is None:
-        return set()
-    items = list(value) if isinstance(value, (list, tuple, set)) else [value]
-    out: set[str] = set()
-    for item in items:
-        if item is None:
-            continue
-        for part in re.split(r"[\s,]+", str(item)):
-            clean = part.strip()
-            if clean:
-                out.add(clean)
-    return out
-
-
-def _server_uuid_allowed(filt: dict[str, Any], server_uuid: str | None) -> bool:
-    got = str(server_uuid or "").strip()
-    allow = _as_filter_set(filt.get("server_uuid_whitelist"))
-    legacy = str(filt.get("server_uuid") or "").strip()
-    if legacy:
-        allow.add(legacy)
-    block = _as_filter_set(filt.get("server_uuid_blacklist"))
-    if got and got in block:
-        return False
-    if allow and (not got or got not in allow):
-        return False
-    return True
-
-
 def mask_account(value: Any) -> str:
     s = str(value or "").strip()
     if not s:
@@ -351,14 +328,19 @@ def from_plex_flat_playing(payload: dict[str, Any], defaults: dict[str, Any] | N
     return _event_from_meta(meta, payload)
 
 
+@dataclass(slots=True)
+class _SessionState:
+    action: str | None = None
+    progress: float = -1.0
+    pause_at: float = 0.0
+
+
 class Dispatcher:
     def __init__(self, sinks: Iterable[ScrobbleSink], cfg_provider=None) -> None:
         self._sinks = list(sinks or [])
         self._cfg_provider = cfg_provider or _load_config
-        self._session_ok: set[str] = set()
-        self._debounce: dict[str, float] = {}
-        self._last_action: dict[str, str] = {}
-        self._last_progress: dict[str, float] = {}
+        self._session_ok: TTLCache[bool] = TTLCache(SESSION_STATE_MAX, SESSION_STATE_TTL_SECONDS)
+        self._sessions: TTLCache[_SessionState] = TTLCache(SESSION_STATE_MAX, SESSION_STATE_TTL_SECONDS)
         self._sink_accepts_cfg: dict[int, bool] = {}
 
     def _send_sink(self, sink: Any, ev: ScrobbleEvent, cfg: dict[str, Any]) -> None:
@@ -382,114 +364,69 @@ class Dispatcher:
             sink.send(ev, cfg)
 
     def _passes_filters(self, ev: ScrobbleEvent, cfg: dict[str, Any]) -> bool:
-        cache_key: str | None = None
-        if ev.session_key:
-            cache_key = f"{ev.session_key}|{_norm_user(ev.account or '')}|{str(ev.server_uuid or '').strip().lower()}"
+        flt = compile_filters(cfg)
+        fields = event_fields(ev)
 
-        ignore_reason = event_ignore_reason(ev, cfg)
+        ignore_reason = flt.ignore_reason(fields)
         if ignore_reason:
             log_media_filter_drop(ev, ignore_reason)
             return False
 
-        if cache_key:
-            if cache_key in self._session_ok:
+        cache_key: tuple[str, str] | None = None
+        if ev.session_key:
+            cache_key = (flt.key, f"{ev.session_key}|{_norm_user(ev.account or '')}|{str(ev.server_uuid or '').strip().lower()}")
+            if self._session_ok.get(cache_key):
                 return True
 
-        filt = (((cfg.get("scrobble") or {}).get("watch") or {}).get("filters") or {})
-        if not isinstance(filt, dict):
-            filt = {}
-
-        wl = filt.get("username_whitelist")
-        want_user = str(filt.get("user_id") or "").strip().lower()
-        if not _server_uuid_allowed(filt, ev.server_uuid):
+        if not flt.server_allowed(ev.server_uuid):
+            return False
+        if flt.want_user and flt.want_user != fields.user_id:
             return False
 
-        def find_user_id(o: Any) -> str:
-            if isinstance(o, dict):
-                for k, v in o.items():
-                    if isinstance(k, str) and k.lower() in ("userid", "user_id"):
-                        return str(v or "").strip().lower()
-                for v in o.values():
-                    uid = find_user_id(v)
-                    if uid:
-                        return uid
-            elif isinstance(o, list):
-                for v in o:
-                    uid = find_user_id(v)
-                    if uid:
-                        return uid
-            return ""
-
-        def find_psn(o: Any) -> list[dict[str, Any]] | None:
-            if isinstance(o, dict):
-                for k, v in o.items():
-                    if isinstance(k, str) and k.lower() == "playsessionstatenotification":
-                        return v if isinstance(v, list) else [v]
-                for v in o.values():
-                    r = find_psn(v)
-                    if r:
-                        return r
-            elif isinstance(o, list):
-                for v in o:
-                    r = find_psn(v)
-                    if r:
-                        return r
-            return None
-
-        n = (find_psn(ev.raw or {}) or [None])[0] or {}
-        acc_id = str(n.get("accountID") or "")
-        acc_uuid = str(n.get("accountUUID") or "").lower()
-        user_id = find_user_id(ev.raw or {})
-
-        def _allow() -> bool:
-            if cache_key:
-                self._session_ok.add(cache_key)
-            return True
-
-        if want_user:
-            if not user_id:
-                return False
-            if want_user != user_id:
-                return False
-
-        scoped = bool(str(((cfg.get("scrobble") or {}).get("watch") or {}).get("route_profile_id") or "").strip())
-        if not wl and scoped:
-            rid = str(((cfg.get("scrobble") or {}).get("watch") or {}).get("route_id") or "?")
-            _log(f"route {rid}: blocked account '{ev.account or '?'}' - profile-scoped route has no username whitelist", "WARNING")
+        if not flt.whitelist and flt.scoped:
+            _log(f"route {flt.route_id}: blocked account '{ev.account or '?'}' - profile-scoped route has no username whitelist", "WARNING")
             return False
 
-        if not media_account_allowed(wl, ev.account or "", account_id=acc_id, account_uuid=acc_uuid, user_id=user_id, default_allow=not scoped):
+        if not media_account_allowed(
+            flt.whitelist,
+            ev.account or "",
+            account_id=fields.account_id,
+            account_uuid=fields.account_uuid,
+            user_id=fields.user_id,
+            default_allow=not flt.scoped,
+        ):
             return False
-        return _allow()
+        if cache_key:
+            self._session_ok.set(cache_key, True)
+        return True
 
     def _should_send(self, ev: ScrobbleEvent, cfg: dict[str, Any]) -> bool:
-        sk = ev.session_key or "?"
-        last_a = self._last_action.get(sk)
-        last_p = self._last_progress.get(sk, -1)
-        try:
-            sup = int(((cfg.get("scrobble") or {}).get("watch") or {}).get("suppress_start_at", 99))
-            pause_db = float(((cfg.get("scrobble") or {}).get("watch") or {}).get("pause_debounce_seconds", 5))
-        except Exception:
-            sup, pause_db = 99, 5.0
+        flt = compile_filters(cfg)
+        st = self._sessions.get_or_create(ev.session_key or "?", _SessionState)
+        last_a = st.action
+        last_p = st.progress
+        sup = flt.suppress_start_at
 
-        if ev.action == "start" and last_p is not None and last_p >= sup and ev.progress >= sup:
+        if ev.action == "start" and last_p >= sup and ev.progress >= sup:
             return False
 
         changed = (ev.action != last_a) or (abs(ev.progress - (last_p or -1)) >= 1)
 
         if ev.action == "pause":
             now = time.time()
-            k = f"{sk}|pause"
-            if now - self._debounce.get(k, 0.0) < pause_db and ev.action == last_a:
+            if now - st.pause_at < flt.pause_debounce and ev.action == last_a:
                 return False
-            self._debounce[k] = now
+            st.pause_at = now
 
         if changed:
-            self._last_action[sk] = ev.action
-            self._last_progress[sk] = ev.progress
+            st.action = ev.action
+            st.progress = ev.progress
             return True
         return False
 
+    def stats(self) -> dict[str, Any]:
+        return {"sessions": self._sessions.stats(), "filter_ok": self._session_ok.stats()}
+
     def accepts(self, ev: ScrobbleEvent) -> bool:
         cfg = self._cfg_provider() or {}
         return self._passes_filters(ev, cfg)
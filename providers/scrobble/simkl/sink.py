@@ -11,6 +11,7 @@ from typing import Any
 import requests
 
 from cw_platform.config_base import load_config
+from cw_platform.http_metrics import instrument_session
 from cw_platform.local_db.ttl_dedupe import once_per_ttl
 from cw_platform.provider_instances import normalize_instance_id
 from services.activity import record_scrobble_event
@@ -44,6 +45,7 @@ except ImportError:
 
 
 SIMKL_API = "https://api.simkl.com"
+_HTTP = instrument_session(requests.Session(), "SIMKL")
 APP_AGENT = "CrossWatch/Watcher/1.0"
 _AR_TTL = 60
 
@@ -127,7 +129,7 @@ def _hdr(cfg: dict[str, Any]) -> dict[str, str]:
 
 
 def _post(path: str, body: dict[str, Any], cfg: dict[str, Any]) -> requests.Response:
-    return requests.post(f"{SIMKL_API}{path}", headers=_hdr(cfg), json=body, timeout=10)
+    return _HTTP.post(f"{SIMKL_API}{path}", headers=_hdr(cfg), json=body, timeout=10)
 
 
 def _stop_pause_threshold(cfg: dict[str, Any]) -> int:
@@ -14,6 +14,7 @@ from typing import Any
 import requests
 
 from cw_platform.config_base import load_config
+from cw_platform.http_metrics import instrument_session
 from cw_platform.local_db.ttl_dedupe import once_per_ttl
 from cw_platform.provider_instances import normalize_instance_id
 
@@ -38,6 +39,7 @@ except ImportError:
 
 
 TRAKT_API = "https://api.trakt.tv"
+_HTTP = instrument_session(requests.Session(), "TRAKT")
 APP_AGENT = "CrossWatch/Watcher/1.0"
 _TOKEN_OVERRIDE: dict[str, str] = {}
 _AR_TTL = 60
@@ -152,11 +154,11 @@ def _hdr(cfg: dict[str, Any], instance_id: Any = None) -> dict[str, str]:
 
 
 def _get(path: str, cfg: dict[str, Any], instance_id: Any = None) -> requests.Response:
-    return requests.get(f"{TRAKT_API}{path}", headers=_hdr(cfg, instance_id), timeout=10)
+    return _HTTP.get(f"{TRAKT_API}{path}", headers=_hdr(cfg, instance_id), timeout=10)
 
 
 def _post(path: str, body: dict[str, Any], cfg: dict[str, Any], instance_id: Any = None) -> requests.Response:
-    return requests.post(f"{TRAKT_API}{path}", headers=_hdr(cfg, instance_id), json=body, timeout=10)
+    return _HTTP.post(f"{TRAKT_API}{path}", headers=_hdr(cfg, instance_id), json=body, timeout=10)
 
 
 def _tok_refresh(instance_id: Any = None) -> bool:
@@ -374,6 +374,7 @@ class WatchManager:
                         "sink_instance": str(r.get("sink_instance") or "default"),
                         "enabled": bool(r.get("enabled", True)),
                         "running": bool(alive) and bool(r.get("enabled", True)),
+                        "dispatch": rr.dispatcher.stats() if hasattr(rr.dispatcher, "stats") else {},
                     }
                 )
 
@@ -9,7 +9,7 @@ import time
 from dataclasses import dataclass
 from typing import Any, Iterable, Mapping
 
-from ._mod_common import build_session, make_snapshot_progress, request_with_retries
+from ._mod_common import build_session, pick_instance_id, make_snapshot_progress, request_with_retries, lazy_module
 from ._log import log as cw_log
 from cw_platform.id_map import canonical_key, minimal as id_minimal
 
@@ -72,7 +72,7 @@ if "ctx" not in globals():
 
 
 try:
-    from .anilist import _watchlist as feat_watchlist
+    feat_watchlist = lazy_module(".anilist._watchlist", __package__)
 except Exception as e:
     feat_watchlist = None
     # NOTE: 'feature' is reserved in cw_log; use a different field key.
@@ -87,7 +87,7 @@ except Exception as e:
     )
 
 try:
-    from .anilist import _ratings as feat_ratings
+    feat_ratings = lazy_module(".anilist._ratings", __package__)
 except Exception as e:
     feat_ratings = None
     cw_log(
@@ -174,7 +174,9 @@ class ANILISTClient:
     def __init__(self, cfg: ANILISTConfig, raw_cfg: Mapping[str, Any]):
         self.cfg = cfg
         self.raw_cfg = raw_cfg
-        self.session = build_session("ANILIST", ctx, feature_label=label_anilist)
+        self.session = build_session(
+            "ANILIST", ctx, feature_label=label_anilist, instance=pick_instance_id("ANILIST")
+        )
         self._apply_headers(cfg.access_token)
         self._viewer_cache: dict[str, Any] | None = None
 
@@ -251,7 +253,7 @@ class ANILISTClient:
 
 
 def supported_features() -> dict[str, bool]:
-    return {"watchlist": bool(feat_watchlist), "ratings": bool(feat_ratings), "history": False, "playlists": False}
+    return {"watchlist": feat_watchlist is not None, "ratings": feat_ratings is not None, "history": False, "playlists": False}
 
 
 def get_manifest() -> Mapping[str, Any]:
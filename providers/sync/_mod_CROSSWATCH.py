@@ -73,26 +73,28 @@ try:  # type: ignore[name-defined]
 except Exception:
     ctx = None  # type: ignore[assignment]
 
+from ._mod_common import lazy_module
+
 try:
-    from .crosswatch import _watchlist as feat_watchlist
+    feat_watchlist = lazy_module(".crosswatch._watchlist", __package__)
 except Exception as e:
     feat_watchlist = None
     cw_log("CROSSWATCH", "module", "warn", "feature_import_failed", import_feature="watchlist", error=str(e))
 
 try:
-    from .crosswatch import _history as feat_history
+    feat_history = lazy_module(".crosswatch._history", __package__)
 except Exception as e:
     feat_history = None
     cw_log("CROSSWATCH", "module", "warn", "feature_import_failed", import_feature="history", error=str(e))
 
 try:
-    from .crosswatch import _ratings as feat_ratings
+    feat_ratings = lazy_module(".crosswatch._ratings", __package__)
 except Exception as e:
     feat_ratings = None
     cw_log("CROSSWATCH", "module", "warn", "feature_import_failed", import_feature="ratings", error=str(e))
 
 try:
-    from .crosswatch import _progress as feat_progress
+    feat_progress = lazy_module(".crosswatch._progress", __package__)
 except Exception as e:
     feat_progress = None
     cw_log("CROSSWATCH", "module", "warn", "feature_import_failed", import_feature="progress", error=str(e))
@@ -106,13 +108,13 @@ __VERSION__ = "1.0"
 __all__ = ["get_manifest", "CROSSWATCHModule", "OPS"]
 
 _FEATURES: dict[str, Any] = {}
-if feat_watchlist:
+if feat_watchlist is not None:
     _FEATURES["watchlist"] = feat_watchlist
-if feat_history:
+if feat_history is not None:
     _FEATURES["history"] = feat_history
-if feat_ratings:
+if feat_ratings is not None:
     _FEATURES["ratings"] = feat_ratings
-if feat_progress:
+if feat_progress is not None:
     _FEATURES["progress"] = feat_progress
 
 
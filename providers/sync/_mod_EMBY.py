@@ -18,17 +18,6 @@ from ._log import log as cw_log
 
 from .emby._common import normalize as emby_normalize, key_of as emby_key_of
 from .emby._common import _pair_scope as _emby_pair_scope, state_file as _emby_state_file, _is_capture_mode as _emby_capture_mode
-from .emby import _watchlist as feat_watchlist
-from .emby import _history as feat_history
-from .emby import _ratings as feat_ratings
-from .emby import _progress as feat_progress
-try:
-    from .emby import _playlists as feat_playlists
-except Exception as e:
-    feat_playlists = None
-    if os.environ.get("CW_DEBUG") or os.environ.get("CW_EMBY_DEBUG"):
-        cw_log("EMBY", "playlists", "warn", "feature_import_failed", error=str(e))
-
 from ._mod_common import (
     build_session,
     request_with_retries,
@@ -37,8 +26,20 @@ from ._mod_common import (
     make_snapshot_progress,
     unresolved_keys as _unresolved_keys,
     build_op_result,
+    lazy_module,
 )
 
+feat_watchlist = lazy_module(".emby._watchlist", __package__, required=True)
+feat_history = lazy_module(".emby._history", __package__, required=True)
+feat_ratings = lazy_module(".emby._ratings", __package__, required=True)
+feat_progress = lazy_module(".emby._progress", __package__, required=True)
+try:
+    feat_playlists = lazy_module(".emby._playlists", __package__)
+except Exception as e:
+    feat_playlists = None
+    if os.environ.get("CW_DEBUG") or os.environ.get("CW_EMBY_DEBUG"):
+        cw_log("EMBY", "playlists", "warn", "feature_import_failed", error=str(e))
+
 _HISTORY_META_FIELDS = ("confirmed_keys", "unresolved_keys", "results", "reason_counts")
 
 
@@ -446,6 +447,7 @@ class EMBYModule:
             history_backdate_tolerance_s=bd_tolerance,
         )
         self.client = EMBYClient(self.cfg)
+        self.client.session.cw_instance = inst
 
         def _mk_prog(feature: str):
             try:
@@ -763,7 +765,7 @@ class _EmbyOPS:
         return self._adapter(cfg).health()
 
     def _pl(self) -> Any:
-        if feat_playlists is None:
+        if not feat_playlists:
             raise RuntimeError("Emby playlists feature is unavailable")
         return feat_playlists
 
@@ -776,7 +778,7 @@ class _EmbyOPS:
         return ad
 
     def list_playlist_resources(self, cfg: Mapping[str, Any], *, instance: str | None = None):
-        if feat_playlists is None:
+        if not feat_playlists:
             return []
         return list(self._pl().list_resources(self._playlist_adapter(cfg, instance)))
 
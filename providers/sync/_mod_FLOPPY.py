@@ -10,13 +10,14 @@ from typing import Any
 
 from cw_platform.provider_instances import normalize_instance_id
 from providers.auth._auth_FLOPPY import FloppyAuthError, FloppyClient
-from providers.sync._mod_common import SimpleRateLimiter, build_op_result, build_session
-from providers.sync.floppy import _history as feat_history
-from providers.sync.floppy import _progress as feat_progress
-from providers.sync.floppy import _ratings as feat_ratings
-from providers.sync.floppy import _watchlist as feat_watchlist
+from providers.sync._mod_common import SimpleRateLimiter, build_op_result, build_session, lazy_module
 from providers.sync.floppy._common import api_delete, api_get, configured_block, is_configured, media_parts_from_item_id, paged
 
+feat_history = lazy_module(".floppy._history", __package__, required=True)
+feat_progress = lazy_module(".floppy._progress", __package__, required=True)
+feat_ratings = lazy_module(".floppy._ratings", __package__, required=True)
+feat_watchlist = lazy_module(".floppy._watchlist", __package__, required=True)
+
 __VERSION__ = "0.3"
 __all__ = ["get_manifest", "FLOPPYModule", "OPS"]
 
@@ -92,7 +93,7 @@ class FLOPPYModule:
         self.config = cfg or {}
         self.instance_id = _current_instance_id()
         block = configured_block(self.config, self.instance_id)
-        session = build_session("FLOPPY", ctx)
+        session = build_session("FLOPPY", ctx, instance=self.instance_id)
         try:
             rate = _rate_limit_settings(block)
             session._rate_limiter = SimpleRateLimiter(rates_per_sec={"GET": rate["get_per_sec"], "POST": rate["post_per_sec"]})
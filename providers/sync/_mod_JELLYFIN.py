@@ -17,16 +17,6 @@ from cw_platform.value_coercion import coerce_bool
 from ._log import log as cw_log
 
 from .jellyfin._common import normalize as jelly_normalize, key_of as jelly_key_of, _pair_scope as _jf_pair_scope, state_file as _jf_state_file, _is_capture_mode as _jf_capture_mode
-from .jellyfin import _watchlist as feat_watchlist
-from .jellyfin import _history as feat_history
-from .jellyfin import _ratings as feat_ratings
-from .jellyfin import _progress as feat_progress
-try:
-    from .jellyfin import _playlists as feat_playlists
-except Exception as e:
-    feat_playlists = None
-    if os.environ.get("CW_DEBUG") or os.environ.get("CW_JELLYFIN_DEBUG"):
-        cw_log("JELLYFIN", "playlists", "warn", "feature_import_failed", error=str(e))
 from ._mod_common import (
     build_session,
     request_with_retries,
@@ -35,8 +25,19 @@ from ._mod_common import (
     make_snapshot_progress,
     unresolved_keys as _unresolved_keys,
     build_op_result,
+    lazy_module,
 )
 
+feat_watchlist = lazy_module(".jellyfin._watchlist", __package__, required=True)
+feat_history = lazy_module(".jellyfin._history", __package__, required=True)
+feat_ratings = lazy_module(".jellyfin._ratings", __package__, required=True)
+feat_progress = lazy_module(".jellyfin._progress", __package__, required=True)
+try:
+    feat_playlists = lazy_module(".jellyfin._playlists", __package__)
+except Exception as e:
+    feat_playlists = None
+    if os.environ.get("CW_DEBUG") or os.environ.get("CW_JELLYFIN_DEBUG"):
+        cw_log("JELLYFIN", "playlists", "warn", "feature_import_failed", error=str(e))
 
 def _finalize_result(adapter: Any, key_of, feature: str, items, cnt: int, unresolved: Any) -> dict[str, Any]:
     meta = getattr(adapter, "_history_write_meta", None) if feature == "history" else None
@@ -455,6 +456,7 @@ class JELLYFINModule:
             progress_timestamp_tolerance_seconds=_int_value(pr.get("timestamp_tolerance_seconds", jf.get("progress_clock_drift_seconds", 30)), 30),
         )
         self.client = JFClient(self.cfg)
+        self.client.session.cw_instance = inst
 
         def _mk_prog(feature: str):
             try:
@@ -798,7 +800,7 @@ class _JellyfinOPS:
         return self._adapter(cfg).health()
 
     def _pl(self) -> Any:
-        if feat_playlists is None:
+        if not feat_playlists:
             raise RuntimeError("Jellyfin playlists feature is unavailable")
         return feat_playlists
 
@@ -811,7 +813,7 @@ class _JellyfinOPS:
         return ad
 
     def list_playlist_resources(self, cfg: Mapping[str, Any], *, instance: str | None = None):
-        if feat_playlists is None:
+        if not feat_playlists:
             return []
         return list(self._pl().list_resources(self._playlist_adapter(cfg, instance)))
 
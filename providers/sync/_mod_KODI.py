@@ -6,12 +6,13 @@ from __future__ import annotations
 from collections.abc import Iterable, Mapping
 from typing import Any
 
-from providers.sync._mod_common import build_op_result
-from providers.sync.kodi import _history as feat_history
-from providers.sync.kodi import _progress as feat_progress
-from providers.sync.kodi import _ratings as feat_ratings
+from providers.sync._mod_common import build_op_result, lazy_module
 from providers.sync.kodi._common import KodiClient, health_payload, is_configured, item_key, make_config, pick_instance_id
 
+feat_history = lazy_module(".kodi._history", __package__, required=True)
+feat_progress = lazy_module(".kodi._progress", __package__, required=True)
+feat_ratings = lazy_module(".kodi._ratings", __package__, required=True)
+
 __VERSION__ = "0.2"
 __all__ = ["get_manifest", "KODIModule", "OPS"]
 
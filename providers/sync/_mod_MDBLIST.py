@@ -21,6 +21,7 @@ from ._mod_common import (
     request_with_retries,
     parse_rate_limit,
     make_snapshot_progress,
+    lazy_module,
 )
 
 
@@ -173,31 +174,31 @@ def _label_mdblist(*_args: Any, **_kwargs: Any) -> str:
 
 
 try:
-    from .mdblist import _watchlist as feat_watchlist
+    feat_watchlist = lazy_module(".mdblist._watchlist", __package__)
 except Exception as e:
     _warn("feature_import_failed", import_feature="watchlist", error=f"{type(e).__name__}: {e}")
     feat_watchlist = None
 
 try:
-    from .mdblist import _ratings as feat_ratings
+    feat_ratings = lazy_module(".mdblist._ratings", __package__)
 except Exception as e:
     _warn("feature_import_failed", import_feature="ratings", error=f"{type(e).__name__}: {e}")
     feat_ratings = None
 
 try:
-    from .mdblist import _history as feat_history
+    feat_history = lazy_module(".mdblist._history", __package__)
 except Exception as e:
     _warn("feature_import_failed", import_feature="history", error=f"{type(e).__name__}: {e}")
     feat_history = None
 
 try:
-    from .mdblist import _progress as feat_progress
+    feat_progress = lazy_module(".mdblist._progress", __package__)
 except Exception as e:
     _warn("feature_import_failed", import_feature="progress", error=f"{type(e).__name__}: {e}")
     feat_progress = None
 
 try:
-    from .mdblist import _playlists as feat_playlists
+    feat_playlists = lazy_module(".mdblist._playlists", __package__)
 except Exception as e:
     _warn("feature_import_failed", import_feature="playlists", error=f"{type(e).__name__}: {e}")
     feat_playlists = None
@@ -216,13 +217,13 @@ _PLAYLIST_CAPABILITIES: dict[str, Any] = {
 
 
 _FEATURES: dict[str, Any] = {}
-if feat_watchlist:
+if feat_watchlist is not None:
     _FEATURES["watchlist"] = feat_watchlist
-if feat_ratings:
+if feat_ratings is not None:
     _FEATURES["ratings"] = feat_ratings
-if feat_history:
+if feat_history is not None:
     _FEATURES["history"] = feat_history
-if feat_progress:
+if feat_progress is not None:
     _FEATURES["progress"] = feat_progress
 
 
@@ -322,7 +323,9 @@ class MDBLISTClient:
         self.cfg = cfg
         self.raw_cfg = raw_cfg
         self.instance_id = mdblist_auth.normalize_instance_id_value(instance_id)
-        self.session: HitSession = build_session("MDBLIST", ctx, feature_label=_label_mdblist)
+        self.session: HitSession = build_session(
+            "MDBLIST", ctx, feature_label=_label_mdblist, instance=self.instance_id
+        )
 
         try:
             self.session._rate_limiter = SimpleRateLimiter(
@@ -871,7 +874,9 @@ class _MDBLISTOPS:
             if ent and (now - float(ent[0])) < 10.0:
                 return dict(ent[1])
 
-            sess: HitSession = build_session("MDBLIST", ctx, feature_label=_label_mdblist)
+            sess: HitSession = build_session(
+                "MDBLIST", ctx, feature_label=_label_mdblist, instance=_pick_instance_id()
+            )
             # Apply provider rate limits
             rl = m.get("rate_limit")
             if not isinstance(rl, dict):
@@ -1021,7 +1026,7 @@ class _MDBLISTOPS:
         return self._adapter(cfg).fetch_journal(since=since, limit=limit, category=category)
 
     def _pl(self) -> Any:
-        if feat_playlists is None:
+        if not feat_playlists:
             raise MDBLISTError("MDBList playlists feature is unavailable")
         return feat_playlists
 
@@ -1034,7 +1039,7 @@ class _MDBLISTOPS:
         return ad
 
     def list_playlist_resources(self, cfg: Mapping[str, Any], *, instance: str | None = None):
-        if feat_playlists is None:
+        if not feat_playlists:
             return []
         return list(self._pl().list_resources(self._playlist_adapter(cfg, instance)))
 
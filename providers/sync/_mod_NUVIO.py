@@ -20,13 +20,14 @@ from providers.auth._auth_NUVIO import (
     provider_block,
 )
 
-from ._mod_common import SimpleRateLimiter, build_op_result, build_session
-from .nuvio import _history as feat_history
-from .nuvio import _progress as feat_progress
-from .nuvio import _watchlist as feat_watchlist
+from ._mod_common import SimpleRateLimiter, build_op_result, build_session, lazy_module
 from .nuvio._common import pull_library_rows, pull_watch_progress_rows, pull_watched_rows
 from cw_platform.provider_instances import normalize_instance_id
 
+feat_history = lazy_module(".nuvio._history", __package__, required=True)
+feat_progress = lazy_module(".nuvio._progress", __package__, required=True)
+feat_watchlist = lazy_module(".nuvio._watchlist", __package__, required=True)
+
 __VERSION__ = "0.4"
 __all__ = ["get_manifest", "NUVIOModule", "OPS"]
 
@@ -123,7 +124,7 @@ class NUVIOModule:
         self.instance_id = _current_instance_id()
         block = provider_block(self.config, self.instance_id)
         rate = _rate_limit_settings(block)
-        session = build_session("NUVIO", ctx)
+        session = build_session("NUVIO", ctx, instance=self.instance_id)
         try:
             session._rate_limiter = SimpleRateLimiter(rates_per_sec={"GET": rate["get_per_sec"], "POST": rate["post_per_sec"]})
             session._rate_limiter_meta = rate
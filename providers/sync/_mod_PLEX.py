@@ -69,10 +69,12 @@ from .plex._utils import fetch_shared_server_token, resolve_user_scope
 from cw_platform.id_map import canonical_key as _canonical_key
 from ._mod_common import (
     build_session,
+    pick_instance_id,
     request_with_retries,
     parse_rate_limit,
     label_plex,
     make_snapshot_progress,
+    lazy_module,
 )
 
 try:  # type: ignore[name-defined]
@@ -81,35 +83,35 @@ except Exception:
     ctx = None  # type: ignore
 
 try:
-    from .plex import _watchlist as feat_watchlist
+    feat_watchlist = lazy_module(".plex._watchlist", __package__)
 except Exception as e:
     feat_watchlist = None
     if os.environ.get("CW_DEBUG") or os.environ.get("CW_PLEX_DEBUG"):
         _warn("feature_import_failed", feature="watchlist", error=str(e))
 
 try:
-    from .plex import _history as feat_history
+    feat_history = lazy_module(".plex._history", __package__)
 except Exception as e:
     feat_history = None
     if os.environ.get("CW_DEBUG") or os.environ.get("CW_PLEX_DEBUG"):
         _warn("feature_import_failed", feature="history", error=str(e))
 
 try:
-    from .plex import _ratings as feat_ratings
+    feat_ratings = lazy_module(".plex._ratings", __package__)
 except Exception as e:
     feat_ratings = None
     if os.environ.get("CW_DEBUG") or os.environ.get("CW_PLEX_DEBUG"):
         _warn("feature_import_failed", feature="ratings", error=str(e))
 
 try:
-    from .plex import _progress as feat_progress
+    feat_progress = lazy_module(".plex._progress", __package__)
 except Exception as e:
     feat_progress = None
     if os.environ.get("CW_DEBUG") or os.environ.get("CW_PLEX_DEBUG"):
         _warn("feature_import_failed", feature="progress", error=str(e))
 
 try:
-    from .plex import _playlists as feat_playlists
+    feat_playlists = lazy_module(".plex._playlists", __package__)
 except Exception as e:
     feat_playlists = None
     if os.environ.get("CW_DEBUG") or os.environ.get("CW_PLEX_DEBUG"):
@@ -1225,6 +1227,7 @@ class PLEXModule:
 
         self.client = PLEXClient(self.cfg).connect()
         self.instance_id = "default"
+        self.client.session.cw_instance = pick_instance_id("PLEX")
         self.progress_factory = (
             lambda feature, total=None, throttle_ms=300: make_snapshot_progress(
                 ctx,
@@ -1605,7 +1608,7 @@ class _PlexOPS:
         return self._adapter(cfg).health()
 
     def _pl(self) -> Any:
-        if feat_playlists is None:
+        if not feat_playlists:
             raise PLEXError("Plex playlists feature is unavailable")
         return feat_playlists
 
@@ -1620,7 +1623,7 @@ class _PlexOPS:
         return ad
 
     def list_playlist_resources(self, cfg: Mapping[str, Any], *, instance: str | None = None):
-        if feat_playlists is None:
+        if not feat_playlists:
             return []
         return list(self._pl().list_resources(self._playlist_adapter(cfg, instance)))
 
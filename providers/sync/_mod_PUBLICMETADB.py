@@ -12,14 +12,15 @@ from urllib.parse import urljoin
 from cw_platform.id_map import canonical_key, minimal as id_minimal
 
 from ._log import log as cw_log
-from ._mod_common import HitSession, SimpleRateLimiter, build_session, parse_rate_limit, request_with_retries, safe_json
-from .publicmetadb import _history as feat_history
-from .publicmetadb import _playlists as feat_playlists
-from .publicmetadb import _progress as feat_progress
-from .publicmetadb import _ratings as feat_ratings
-from .publicmetadb import _watchlist as feat_watchlist
+from ._mod_common import HitSession, SimpleRateLimiter, build_session, pick_instance_id, parse_rate_limit, request_with_retries, safe_json, lazy_module
 from .publicmetadb._common import enrich_index_metadata
 
+feat_history = lazy_module(".publicmetadb._history", __package__, required=True)
+feat_playlists = lazy_module(".publicmetadb._playlists", __package__, required=True)
+feat_progress = lazy_module(".publicmetadb._progress", __package__, required=True)
+feat_ratings = lazy_module(".publicmetadb._ratings", __package__, required=True)
+feat_watchlist = lazy_module(".publicmetadb._watchlist", __package__, required=True)
+
 try:  # type: ignore[name-defined]
     ctx  # type: ignore[misc]
 except Exception:
@@ -166,7 +167,9 @@ class PUBLICMETADBClient:
     def __init__(self, cfg: PUBLICMETADBConfig, raw_cfg: Mapping[str, Any]):
         self.cfg = cfg
         self.raw_cfg = raw_cfg
-        self.session: HitSession = build_session("PUBLICMETADB", ctx, feature_label=_label_publicmetadb)
+        self.session: HitSession = build_session(
+            "PUBLICMETADB", ctx, feature_label=_label_publicmetadb, instance=pick_instance_id("PUBLICMETADB")
+        )
         self.session.headers.update(
             {
                 "Accept": "application/json",
@@ -10,11 +10,7 @@ from typing import Any
 
 from cw_platform.provider_instances import normalize_instance_id
 from providers.auth._auth_PUNCHPLAY import ME_URL, is_configured as auth_is_configured
-from providers.sync._mod_common import SimpleRateLimiter, build_op_result, build_session, dedup_keys
-from providers.sync.punchplay import _history as feat_history
-from providers.sync.punchplay import _progress as feat_progress
-from providers.sync.punchplay import _ratings as feat_ratings
-from providers.sync.punchplay import _watchlist as feat_watchlist
+from providers.sync._mod_common import SimpleRateLimiter, build_op_result, build_session, dedup_keys, lazy_module
 from providers.sync.punchplay._common import (
     DEFAULT_GET_PER_SEC,
     DEFAULT_POST_PER_SEC,
@@ -24,6 +20,11 @@ from providers.sync.punchplay._common import (
     request_id_of,
 )
 
+feat_history = lazy_module(".punchplay._history", __package__, required=True)
+feat_progress = lazy_module(".punchplay._progress", __package__, required=True)
+feat_ratings = lazy_module(".punchplay._ratings", __package__, required=True)
+feat_watchlist = lazy_module(".punchplay._watchlist", __package__, required=True)
+
 __VERSION__ = "0.3"
 __all__ = ["get_manifest", "PUNCHPLAYModule", "OPS", "feat_history", "feat_progress", "feat_ratings", "feat_watchlist"]
 
@@ -169,7 +170,7 @@ class PUNCHPLAYModule:
             get_rps = cfg_float(rl, "get_per_sec", get_rps)
             post_rps = cfg_float(rl, "post_per_sec", post_rps)
 
-        session = build_session("PUNCHPLAY", ctx)
+        session = build_session("PUNCHPLAY", ctx, instance=self.instance_id)
         try:
             session._rate_limiter = SimpleRateLimiter(rates_per_sec={"GET": get_rps, "POST": post_rps, "DELETE": post_rps})
             session._rate_limiter_meta = {"get_per_sec": get_rps, "post_per_sec": post_rps}
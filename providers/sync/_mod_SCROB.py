@@ -110,7 +110,7 @@ class SCROBModule:
 
         self.config: dict[str, Any] = {**dict(cfg or {}), "scrob": dict(block)}
         self.raw_cfg = self.config
-        self.session: requests.Session = build_session("SCROB", ctx, feature_label=_feature_label)
+        self.session: requests.Session = build_session("SCROB", ctx, feature_label=_feature_label, instance=self.instance_id)
         try:
             self.session.headers.setdefault("User-Agent", os.environ.get("CW_SCROB_UA") or f"CrossWatch/{__VERSION__} (Scrob)")
             self.session.headers.setdefault("Accept", "application/json")
@@ -16,12 +16,14 @@ from cw_platform.id_map import canonical_key, minimal as id_minimal
 from ._log import log as cw_log
 from ._mod_common import (
     build_session,
+    pick_instance_id,
     HitSession,
     label_simkl,
     make_snapshot_progress,
     parse_rate_limit,
     SimpleRateLimiter,
     request_with_retries,
+    lazy_module,
 )
 from .simkl._common import (
     _pair_scope as simkl_pair_scope,
@@ -98,31 +100,31 @@ if "ctx" not in globals():
     ctx = _NullCtx()  # type: ignore[assignment]
 
 try:
-    from .simkl import _watchlist as feat_watchlist
+    feat_watchlist = lazy_module(".simkl._watchlist", __package__)
 except Exception as e:
     feat_watchlist = None
     _log("feature_import_failed", level="warn", import_feature="watchlist", error=str(e))
 
 try:
-    from .simkl import _history as feat_history
+    feat_history = lazy_module(".simkl._history", __package__)
 except Exception as e:
     feat_history = None
     _log("feature_import_failed", level="warn", import_feature="history", error=str(e))
 
 try:
-    from .simkl import _ratings as feat_ratings
+    feat_ratings = lazy_module(".simkl._ratings", __package__)
 except Exception as e:
     feat_ratings = None
     _log("feature_import_failed", level="warn", import_feature="ratings", error=str(e))
 
 try:
-    from .simkl import _progress as feat_progress
+    feat_progress = lazy_module(".simkl._progress", __package__)
 except Exception as e:
     feat_progress = None
     _log("feature_import_failed", level="warn", import_feature="progress", error=str(e))
 
 try:
-    from .simkl import _playlists as feat_playlists
+    feat_playlists = lazy_module(".simkl._playlists", __package__)
 except Exception as e:
     feat_playlists = None
     _log("feature_import_failed", level="warn", import_feature="playlists", error=str(e))
@@ -176,13 +178,13 @@ def _show_identity_tokens(item: Mapping[str, Any]) -> set[str]:
 
 
 _FEATURES: dict[str, Any] = {}
-if feat_watchlist:
+if feat_watchlist is not None:
     _FEATURES["watchlist"] = feat_watchlist
-if feat_history:
+if feat_history is not None:
     _FEATURES["history"] = feat_history
-if feat_ratings:
+if feat_ratings is not None:
     _FEATURES["ratings"] = feat_ratings
-if feat_progress:
+if feat_progress is not None:
     _FEATURES["progress"] = feat_progress
 
 _PLAYLIST_CAPABILITIES = {
@@ -296,7 +298,9 @@ class SIMKLClient:
         self.cfg = cfg
         self.raw_cfg = raw_cfg
         # build_session returns a HitSession
-        self.session: HitSession = build_session("SIMKL", ctx, feature_label=label_simkl)
+        self.session: HitSession = build_session(
+            "SIMKL", ctx, feature_label=label_simkl, instance=pick_instance_id("SIMKL")
+        )
 
         try:
             self.session._rate_limiter = SimpleRateLimiter(
@@ -848,12 +852,12 @@ class _SIMKLOPS:
         return self._adapter(cfg).dropped_show_tokens()
 
     def list_playlist_resources(self, cfg: Mapping[str, Any], *, instance: str | None = None):
-        if feat_playlists is None:
+        if not feat_playlists:
             return []
         return feat_playlists.list_resources(self._playlist_adapter(cfg, instance))
 
     def get_playlist_snapshot(self, cfg: Mapping[str, Any], playlist_id: str, *, instance: str | None = None):
-        if feat_playlists is None:
+        if not feat_playlists:
             raise SIMKLError("SIMKL playlist support is unavailable")
         return feat_playlists.get_snapshot(self._playlist_adapter(cfg, instance), playlist_id)
 
@@ -866,7 +870,7 @@ class _SIMKLOPS:
         instance: str | None = None,
         dry_run: bool = False,
     ):
-        if feat_playlists is None:
+        if not feat_playlists:
             raise SIMKLError("SIMKL playlist support is unavailable")
         return feat_playlists.create(self._playlist_adapter(cfg, instance), name, media_type=media_type, dry_run=dry_run)
 
@@ -882,7 +886,7 @@ class _SIMKLOPS:
         lst = list(items or [])
         if dry_run:
             return {"ok": True, "count": len(lst), "dry_run": True}
-        if feat_playlists is None:
+        if not feat_playlists:
             raise SIMKLError("SIMKL playlist support is unavailable")
         return feat_playlists.add(self._playlist_adapter(cfg, instance), playlist_id, lst)
 
@@ -899,7 +903,7 @@ class _SIMKLOPS:
         warning = _PLAYLIST_CAPABILITIES["remove_warning"]
         if dry_run:
             return {"ok": True, "count": len(lst), "dry_run": True, "warnings": [warning]}
-        if feat_playlists is None:
+        if not feat_playlists:
             raise SIMKLError("SIMKL playlist support is unavailable")
         return feat_playlists.remove(self._playlist_adapter(cfg, instance), playlist_id, lst)
 
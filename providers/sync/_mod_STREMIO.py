@@ -10,13 +10,14 @@ from typing import Any
 
 from cw_platform.provider_instances import normalize_instance_id
 from providers.auth._auth_STREMIO import StremioClient, StremioAuthError
-from providers.sync._mod_common import SimpleRateLimiter, build_op_result, build_session
-from providers.sync.stremio import _history as feat_history
-from providers.sync.stremio import _progress as feat_progress
-from providers.sync.stremio import _ratings as feat_ratings
-from providers.sync.stremio import _watchlist as feat_watchlist
+from providers.sync._mod_common import SimpleRateLimiter, build_op_result, build_session, lazy_module
 from providers.sync.stremio._common import DEFAULT_STREMIO_PROFILE_ID, datastore_meta, is_capture_mode, is_configured, read_drop_unresolved_items
 
+feat_history = lazy_module(".stremio._history", __package__, required=True)
+feat_progress = lazy_module(".stremio._progress", __package__, required=True)
+feat_ratings = lazy_module(".stremio._ratings", __package__, required=True)
+feat_watchlist = lazy_module(".stremio._watchlist", __package__, required=True)
+
 __VERSION__ = "0.2"
 __all__ = ["get_manifest", "STREMIOModule", "OPS", "feat_history", "feat_progress", "feat_ratings", "feat_watchlist"]
 
@@ -129,7 +130,7 @@ class STREMIOModule:
         self.config = cfg or {}
         self.instance_id = _current_instance_id()
         self.stremio_profile_id = DEFAULT_STREMIO_PROFILE_ID
-        session = build_session("STREMIO", ctx)
+        session = build_session("STREMIO", ctx, instance=self.instance_id)
         try:
             session._rate_limiter = SimpleRateLimiter(rates_per_sec={"GET": 20.0, "POST": 20.0})
             session._rate_limiter_meta = {"get_per_sec": 20.0, "post_per_sec": 20.0}
@@ -3,14 +3,14 @@
 # Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from typing import Any
 import os
 import time
 
 from ._log import log as cw_log
-from ._mod_common import build_session, request_with_retries, safe_json
+from ._mod_common import build_session, pick_instance_id, request_with_retries, safe_json
 
 try:  # type: ignore[name-defined]
     ctx  # type: ignore[misc]
@@ -108,7 +108,7 @@ class TAUTULLIClient:
     def __init__(self, cfg: TAUTULLIConfig, raw_cfg: Mapping[str, Any]):
         self.cfg = cfg
         self.raw_cfg = raw_cfg
-        self.session = build_session("TAUTULLI", ctx, feature_label=_label)
+        self.session = build_session("TAUTULLI", ctx, feature_label=_label, instance=pick_instance_id("TAUTULLI"))
         try:
             self.session.headers.setdefault("User-Agent", os.environ.get("CW_TAUTULLI_UA") or f"CrossWatch/{__VERSION__} (Tautulli)")
             self.session.headers.setdefault("Accept", "application/json")
@@ -198,13 +198,22 @@ class TAUTULLIModule:
 
     def build_index(self, feature: str) -> Mapping[str, dict[str, Any]]:
         if feature != "history":
-            _info("index_skipped", feature=feature, reason="disabled_or_missing")
+            _info("index_skipped", reason="disabled_or_missing", requested=feature)
             return {}
         from .tautulli import _history
 
         adapter = _HistoryAdapter(cfg=self.client.raw_cfg, client=self.client)
         return _history.build_index(adapter)
 
+    def iter_index(self, feature: str, *, batch_size: int) -> Iterator[Mapping[str, dict[str, Any]]]:
+        if feature != "history":
+            _info("index_skipped", reason="disabled_or_missing", requested=feature)
+            return iter(())
+        from .tautulli import _history
+
+        adapter = _HistoryAdapter(cfg=self.client.raw_cfg, client=self.client)
+        return _history.iter_index(adapter, batch_size=batch_size)
+
     def add(self, feature: str, items: Iterable[Mapping[str, Any]], *, dry_run: bool = False) -> dict[str, Any]:
         if feature != "history":
             return {"ok": True, "count": 0, "unresolved": [], "reason": "disabled_or_missing"}
@@ -256,6 +265,9 @@ class _TAUTULLIOPS:
     def build_index(self, cfg: Mapping[str, Any], *, feature: str) -> Mapping[str, dict[str, Any]]:
         return self._adapter(cfg).build_index(feature)
 
+    def iter_index(self, cfg: Mapping[str, Any], *, feature: str, batch_size: int) -> Iterator[Mapping[str, dict[str, Any]]]:
+        return self._adapter(cfg).iter_index(feature, batch_size=batch_size)
+
     def add(
         self,
         cfg: Mapping[str, Any],
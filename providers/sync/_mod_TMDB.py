@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from typing import Any, Callable, Iterable, Mapping
 
 from ._log import log as cw_log
-from ._mod_common import build_session, make_snapshot_progress, parse_rate_limit, request_with_retries
+from ._mod_common import build_session, pick_instance_id, make_snapshot_progress, parse_rate_limit, request_with_retries, lazy_module
 
 try:  # type: ignore[name-defined]
     ctx  # type: ignore[misc]
@@ -59,13 +59,13 @@ def _label_tmdb(*_args: Any, **_kwargs: Any) -> str:
 
 
 try:
-    from .tmdb import _watchlist as feat_watchlist
+    feat_watchlist = lazy_module(".tmdb._watchlist", __package__)
 except Exception as e:
     _warn("feature_import_failed", import_feature="watchlist", error=f"{type(e).__name__}: {e}")
     feat_watchlist = None
 
 try:
-    from .tmdb import _ratings as feat_ratings
+    feat_ratings = lazy_module(".tmdb._ratings", __package__)
 except Exception as e:
     _warn("feature_import_failed", import_feature="ratings", error=f"{type(e).__name__}: {e}")
     feat_ratings = None
@@ -89,8 +89,8 @@ def _tmdb_key_of(_obj: Any) -> str:
 
 def _features_flags() -> dict[str, bool]:
     return {
-        "watchlist": bool(feat_watchlist),
-        "ratings": bool(feat_ratings),
+        "watchlist": feat_watchlist is not None,
+        "ratings": feat_ratings is not None,
         "history": False,
         "playlists": False,
     }
@@ -251,9 +251,9 @@ class TMDBClient:
 
 
 _FEATURES: dict[str, Any] = {}
-if feat_watchlist:
+if feat_watchlist is not None:
     _FEATURES["watchlist"] = feat_watchlist
-if feat_ratings:
+if feat_ratings is not None:
     _FEATURES["ratings"] = feat_ratings
 
 
@@ -318,6 +318,7 @@ class TMDBModule:
             raise TMDBAuthError("TMDb not configured (api_key + session_id required)")
 
         self.client = TMDBClient(self.cfg).connect()
+        self.client.session.cw_instance = pick_instance_id("TMDB")
 
         def _mk_prog(feature: str):
             try:
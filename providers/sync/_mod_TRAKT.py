@@ -66,34 +66,36 @@ try:
 except Exception:
     from providers.auth._auth_TRAKT import PROVIDER as AUTH_TRAKT
 
-from .trakt import _watchlist as feat_watchlist
+from ._mod_common import (
+    build_session,
+    pick_instance_id,
+    HitSession,
+    request_with_retries,
+    parse_rate_limit,
+    label_trakt,
+    SimpleRateLimiter,
+    make_snapshot_progress,
+    lazy_module,
+)
+
+feat_watchlist = lazy_module(".trakt._watchlist", __package__, required=True)
 try:
-    from .trakt import _history as feat_history
+    feat_history = lazy_module(".trakt._history", __package__)
 except Exception:
     feat_history = None
 try:
-    from .trakt import _ratings as feat_ratings
+    feat_ratings = lazy_module(".trakt._ratings", __package__)
 except Exception:
     feat_ratings = None
 try:
-    from .trakt import _progress as feat_progress
+    feat_progress = lazy_module(".trakt._progress", __package__)
 except Exception:
     feat_progress = None
 try:
-    from .trakt import _playlists as feat_playlists
+    feat_playlists = lazy_module(".trakt._playlists", __package__)
 except Exception:
     feat_playlists = None
 
-from ._mod_common import (
-    build_session,
-    HitSession,
-    request_with_retries,
-    parse_rate_limit,
-    label_trakt,
-    SimpleRateLimiter,
-    make_snapshot_progress,
-)
-
 try:  # type: ignore[name-defined]
     ctx  # type: ignore[misc]
 except Exception:
@@ -141,13 +143,13 @@ def _error(feature: str, event: str, **fields: Any) -> None:
 
 
 _FEATURES: dict[str, Any] = {}
-if feat_watchlist:
+if feat_watchlist is not None:
     _FEATURES["watchlist"] = feat_watchlist
-if feat_history:
+if feat_history is not None:
     _FEATURES["history"] = feat_history
-if feat_ratings:
+if feat_ratings is not None:
     _FEATURES["ratings"] = feat_ratings
-if feat_progress:
+if feat_progress is not None:
     _FEATURES["progress"] = feat_progress
 
 
@@ -210,6 +212,7 @@ class TRAKTConfig:
     max_retries: int = 3
     rate_get_per_sec: float = 3.33
     rate_post_per_sec: float = 1.0
+    page_concurrency: int = 4
     watchlist_batch_size: int = 100
     ratings_per_page: int = 100
     ratings_max_pages: int = 50
@@ -228,7 +231,9 @@ class TRAKTClient:
     def __init__(self, cfg: TRAKTConfig, raw_cfg: Mapping[str, Any]):
         self.cfg = cfg
         self.raw_cfg = raw_cfg
-        self.session: HitSession = build_session("TRAKT", ctx, feature_label=label_trakt)
+        self.session: HitSession = build_session(
+            "TRAKT", ctx, feature_label=label_trakt, instance=pick_instance_id("TRAKT")
+        )
 
         try:
             self.session._rate_limiter = SimpleRateLimiter(
@@ -396,6 +401,7 @@ class TRAKTModule:
             max_retries=int(t.get("max_retries", cfg.get("max_retries", 3))),
             rate_get_per_sec=rate_get,
             rate_post_per_sec=rate_post,
+            page_concurrency=int(4 if t.get("page_concurrency") is None else t.get("page_concurrency")),
             watchlist_batch_size=int(t.get("watchlist_batch_size", 100) or 100),
             ratings_per_page=int(t.get("ratings_per_page", 100) or 100),
             ratings_max_pages=int(t.get("ratings_max_pages", 50) or 50),
@@ -858,7 +864,7 @@ class _TraktOPS:
         return self._adapter(cfg).dropped_show_tokens()
 
     def _pl(self) -> Any:
-        if feat_playlists is None:
+        if not feat_playlists:
             raise TRAKTError("Trakt playlists feature is unavailable")
         return feat_playlists
 
@@ -873,7 +879,7 @@ class _TraktOPS:
         return ad
 
     def list_playlist_resources(self, cfg: Mapping[str, Any], *, instance: str | None = None):
-        if feat_playlists is None:
+        if not feat_playlists:
             return []
         return list(self._pl().list_resources(self._playlist_adapter(cfg, instance)))
 
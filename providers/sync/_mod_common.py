@@ -3,6 +3,8 @@
 # Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
 from __future__ import annotations
 
+import importlib
+import importlib.util
 import json
 import os
 import time
@@ -12,6 +14,9 @@ from urllib.parse import parse_qs, urlparse
 
 import requests
 
+from cw_platform import http_metrics
+from cw_platform.provider_instances import normalize_instance_id
+
 from ._log import log as cw_log
 
 __VERSION__ = "0.2.1"
@@ -19,6 +24,7 @@ __all__ = [
     "HitSession",
     "make_emitter",
     "build_session",
+    "pick_instance_id",
     "parse_rate_limit",
     "safe_json",
     "request_with_retries",
@@ -34,9 +40,83 @@ __all__ = [
     "unresolved_keys",
     "dedup_keys",
     "build_op_result",
+    "LazyModule",
+    "lazy_module",
 ]
 
 
+class LazyModule:
+    """Feature submodule proxy; the real module is imported on first use.
+
+    A failed import is logged once and leaves the proxy falsy, so the
+    ``if mod:`` guards in the provider modules skip the feature like they
+    did when a broken import bound it to None.
+    """
+
+    __slots__ = ("_lazy_name", "_lazy_mod", "_lazy_error")
+
+    def __init__(self, name: str) -> None:
+        object.__setattr__(self, "_lazy_name", name)
+        object.__setattr__(self, "_lazy_mod", None)
+        object.__setattr__(self, "_lazy_error", None)
+
+    def _load(self) -> Any:
+        mod = self._lazy_mod
+        if mod is None:
+            if self._lazy_error is not None:
+                raise ImportError(f"feature module {self._lazy_name!r} is unavailable") from self._lazy_error
+            try:
+                mod = importlib.import_module(self._lazy_name)
+            except Exception as e:
+                object.__setattr__(self, "_lazy_error", e)
+                parts = self._lazy_name.rsplit(".", 2)
+                cw_log(
+                    parts[-2].upper() if len(parts) > 1 else "SYNC",
+                    parts[-1].lstrip("_"),
+                    "error",
+                    "feature_unavailable",
+                    module=self._lazy_name,
+                    error=f"{type(e).__name__}: {e}",
+                )
+                raise ImportError(f"feature module {self._lazy_name!r} is unavailable") from e
+            object.__setattr__(self, "_lazy_mod", mod)
+        return mod
+
+    def __bool__(self) -> bool:
+        try:
+            self._load()
+        except ImportError:
+            return False
+        return True
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._load(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._lazy_mod is not None else "unavailable" if self._lazy_error is not None else "not loaded"
+        return f"<lazy module {self._lazy_name!r} ({state})>"
+
+
+def lazy_module(name: str, package: str | None = None, *, required: bool = False) -> Any:
+    """Bind a feature submodule; optional ones load on first use, required ones now.
+
+    Required modules are imported eagerly so a broken import fails the provider
+    module at load time, like a plain import, instead of on first attribute use.
+    """
+    full = importlib.util.resolve_name(name, package) if name.startswith(".") else name
+    if required:
+        return importlib.import_module(full)
+    if importlib.util.find_spec(full) is None:
+        raise ModuleNotFoundError(f"No module named {full!r}", name=full)
+    return LazyModule(full)
+
+
 def unresolved_key(entry: Any, key_of: Callable[[Any], Any] | None = None) -> str:
     if isinstance(entry, str):
         return entry
@@ -489,6 +569,15 @@ class HitSession(requests.Session):
         except Exception:
             self._rl_log_min_sleep_s = 0.5
         self._rl_log_state: dict[str, dict[str, float | int]] = {}
+        self._cw_http_metrics = (str(provider).upper(), None)
+
+    @property
+    def cw_instance(self) -> str | None:
+        return self._cw_http_metrics[1]
+
+    @cw_instance.setter
+    def cw_instance(self, value: str | None) -> None:
+        self._cw_http_metrics = (self._cw_http_metrics[0], str(value) if value else None)
 
     def _log_rate_limit_summary(self, bucket: str, slept: float) -> None:
         now = time.monotonic()
@@ -535,10 +624,27 @@ class HitSession(requests.Session):
                     self._log_rate_limit_summary(bucket, slept)
         except Exception:
             pass
+        t0 = time.monotonic()
+        resp: requests.Response | None = None
         try:
             resp = super().request(method, url, **kwargs)
             return resp
         finally:
+            try:
+                body = getattr(getattr(resp, "request", None), "body", None)
+                headers = resp.headers if resp is not None else {}
+                http_metrics.record(
+                    self._provider,
+                    method=str(method),
+                    url=str(url),
+                    status=resp.status_code if resp is not None else None,
+                    ms=(time.monotonic() - t0) * 1000.0,
+                    bytes_in=int(headers.get("Content-Length") or 0),
+                    bytes_out=len(body) if isinstance(body, (str, bytes)) else 0,
+                    instance=self._cw_http_metrics[1],
+                )
+            except Exception:
+                pass
             try:
                 feature = self._label(method.upper(), url, kwargs)
             except Exception:
@@ -550,14 +656,33 @@ class HitSession(requests.Session):
                     pass
 
 
+def pick_instance_id(provider: str) -> str:
+    # The pair runner exports the instance of each side; single-provider runs set CW_PROVIDER_INSTANCE.
+    prov = str(provider or "").upper().strip()
+    for side in ("SRC", "DST"):
+        if str(os.getenv(f"CW_PAIR_{side}") or "").upper().strip() == prov:
+            v = str(os.getenv(f"CW_PAIR_{side}_INSTANCE") or "").strip()
+            if v:
+                return normalize_instance_id(v)
+    for k in ("CW_SNAPSHOT_INSTANCE", "CW_PROVIDER_INSTANCE", "CW_INSTANCE_ID"):
+        v = str(os.getenv(k) or "").strip()
+        if v:
+            return normalize_instance_id(v)
+    return "default"
+
+
 def build_session(
     provider: str,
     ctx: Any,
     *,
     feature_label: FeatureLabelFn | None = None,
     emit_hits: bool | None = None,
+    instance: str | None = None,
 ) -> HitSession:
-    return HitSession(provider, make_emitter(ctx), feature_label, emit_hits)
+    session = HitSession(provider, make_emitter(ctx), feature_label, emit_hits)
+    if instance:
+        session.cw_instance = instance
+    return session
 
 
 def parse_rate_limit(h: Mapping[str, Any]) -> dict[str, int | None]:
@@ -657,6 +782,7 @@ def request_with_retries(
                         dur_ms=dur_ms,
                     )
 
+                http_metrics.note_retry(session, method, url, resp.status_code)
                 time.sleep(wait)
                 last = resp
                 continue
@@ -683,6 +809,7 @@ def request_with_retries(
                     dur_ms=dur_ms,
                     error=f"{type(e).__name__}: {e}",
                 )
+                http_metrics.note_retry(session, method, url, None)
                 time.sleep(wait)
             else:
                 _http_log(
@@ -1,7 +1,7 @@
 # providers/sync/tautulli/_history.py
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from datetime import datetime, timezone
 import re
 from typing import Any
@@ -220,9 +220,23 @@ def _row_ids(row: Mapping[str, Any]) -> tuple[dict[str, str], dict[str, str]]:
 
 
 def build_index(adapter: Any, *, per_page: int = 100, max_pages: int = 5000) -> dict[str, dict[str, Any]]:
+    out: dict[str, dict[str, Any]] = {}
+    for batch in iter_index(adapter, per_page=per_page, max_pages=max_pages):
+        out.update(batch)
+    return out
+
+
+def iter_index(
+    adapter: Any,
+    *,
+    batch_size: int = 5000,
+    per_page: int = 100,
+    max_pages: int = 5000,
+) -> Iterator[dict[str, dict[str, Any]]]:
+    """Yield the history index in batches of about ``batch_size`` items as pages arrive."""
     client = getattr(adapter, "client", None)
     if not client:
-        return {}
+        return
 
     user_id = str(_cfg_get(adapter, "tautulli.history.user_id", "") or "").strip()
     cfg_per_page = max(1, min(500, int(_cfg_get(adapter, "tautulli.history.per_page", per_page) or per_page)))
@@ -232,7 +246,8 @@ def build_index(adapter: Any, *, per_page: int = 100, max_pages: int = 5000) ->
 
     _log("index_fetch_counts", per_page=cfg_per_page, max_pages=cfg_max_pages, has_user_id=bool(user_id))
 
-    out: dict[str, dict[str, Any]] = {}
+    batch: dict[str, dict[str, Any]] = {}
+    seen: set[str] = set()
     meta_cache: dict[str, Mapping[str, Any] | None] = {}
     start = 0
     pages = 0
@@ -377,10 +392,15 @@ def build_index(adapter: Any, *, per_page: int = 100, max_pages: int = 5000) ->
                     item["show_ids"] = show_ids
 
             ck = canonical_key(item)
-            if ck and ck not in out:
-                out[ck] = item
+            if ck and ck not in seen:
+                seen.add(ck)
+                batch[ck] = item
                 rows_kept += 1
 
+        if len(batch) >= batch_size:
+            yield batch
+            batch = {}
+
         start += cfg_per_page
         total_i = _to_int_total(total)
         if total_i is not None and start >= total_i:
@@ -388,10 +408,13 @@ def build_index(adapter: Any, *, per_page: int = 100, max_pages: int = 5000) ->
         if len(rows) < cfg_per_page:
             break
 
+    if batch:
+        yield batch
+
     _log(
         "index_done",
         level="info",
-        count=len(out),
+        count=len(seen),
         pages=pages,
         rows_seen=rows_seen,
         rows_kept=rows_kept,
@@ -400,7 +423,6 @@ def build_index(adapter: Any, *, per_page: int = 100, max_pages: int = 5000) ->
         skipped_no_ids=skipped_no_ids,
         meta_cache=len(meta_cache),
     )
-    return out
 
 
 def add(adapter: Any, items: Iterable[Mapping[str, Any]], *, dry_run: bool = False) -> dict[str, Any]:
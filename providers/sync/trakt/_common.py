@@ -6,9 +6,11 @@ from __future__ import annotations
 import json
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable, Mapping
+from typing import Any, Callable, Iterable, Mapping
 
 from cw_platform.id_map import minimal as id_minimal, canonical_key
 from cw_platform.anime_mapping.service import mapped_or_default_media_type
@@ -222,6 +224,192 @@ def fetch_last_activities(
         return None
 
 
+DEFAULT_PAGE_CONCURRENCY = 4
+MAX_PAGE_CONCURRENCY = 8
+
+
+def page_concurrency(adapter: Any) -> int:
+    try:
+        n = int(getattr(getattr(adapter, "cfg", None), "page_concurrency", DEFAULT_PAGE_CONCURRENCY) or 1)
+    except Exception:
+        n = DEFAULT_PAGE_CONCURRENCY
+    return max(1, min(MAX_PAGE_CONCURRENCY, n))
+
+
+def header_int(headers: Mapping[str, Any] | None, name: str) -> int | None:
+    try:
+        for k, v in (headers or {}).items():
+            if str(k).lower() == name.lower():
+                return int(str(v).strip())
+    except Exception:
+        return None
+    return None
+
+
+@dataclass
+class PagedFetch:
+    status: int | None = None
+    total_pages: int | None = None
+    pages: dict[int, list[Any]] = field(default_factory=dict)
+    timings_ms: dict[int, int] = field(default_factory=dict)
+    failed: list[int] = field(default_factory=list)
+    wall_ms: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 200 and not self.failed
+
+    def rows(self) -> list[Any]:
+        out: list[Any] = []
+        for page in sorted(self.pages):
+            out.extend(self.pages[page])
+        return out
+
+
+def _page_rows(resp: Any) -> list[Any] | None:
+    try:
+        data = resp.json()
+    except Exception:
+        return [] if not (getattr(resp, "text", "") or "").strip() else None
+    if data is None:
+        return []
+    return data if isinstance(data, list) else None
+
+
+def fetch_pages(
+    sess: Any,
+    url: str,
+    *,
+    headers: Mapping[str, Any],
+    per_page: int,
+    max_pages: int,
+    timeout: float,
+    max_retries: int,
+    params: Mapping[str, Any] | None = None,
+    concurrency: int = 1,
+    feature: str = "common",
+    first: Any = None,
+    request: Callable[..., Any] | None = None,
+    on_page: Callable[[int, list[Any]], None] | None = None,
+) -> PagedFetch:
+    req = request or request_with_retries
+    base = {k: v for k, v in dict(params or {}).items() if k not in ("page", "limit")}
+    cap = max(1, int(max_pages or 1))
+    limit = max(1, int(per_page or 1))
+    result = PagedFetch()
+    t_start = time.monotonic()
+
+    def _get(page: int) -> tuple[int, Any, list[Any] | None, int, str | None]:
+        t0 = time.monotonic()
+        try:
+            r = req(
+                sess,
+                "GET",
+                url,
+                headers=dict(headers),
+                params={**base, "page": page, "limit": limit},
+                timeout=timeout,
+                max_retries=max_retries,
+            )
+        except Exception as e:
+            return page, None, None, int((time.monotonic() - t0) * 1000), str(e)
+        ms = int((time.monotonic() - t0) * 1000)
+        if r.status_code != 200:
+            return page, r, None, ms, None
+        return page, r, _page_rows(r), ms, None
+
+    def _accept(page: int, r: Any, rows: list[Any] | None, ms: int, error: str | None) -> bool:
+        result.timings_ms[page] = ms
+        status = getattr(r, "status_code", None)
+        if rows is None:
+            cw_log("TRAKT", feature, "warn", "page_failed", url=url, page=page, status=status, error=error, ms=ms)
+            return False
+        result.pages[page] = rows
+        cw_log("TRAKT", feature, "debug", "page_fetched", url=url, page=page, rows=len(rows), ms=ms)
+        if on_page:
+            on_page(page, rows)
+        return True
+
+    if first is not None:
+        t0 = time.monotonic()
+        fetched = (1, first, _page_rows(first) if first.status_code == 200 else None, 0, None)
+        result.timings_ms[1] = int((time.monotonic() - t0) * 1000)
+    else:
+        fetched = _get(1)
+    result.status = getattr(fetched[1], "status_code", None)
+    if not _accept(*fetched):
+        result.failed.append(1)
+        result.wall_ms = int((time.monotonic() - t_start) * 1000)
+        return result
+
+    first_resp = fetched[1]
+    first_rows = result.pages.get(1) or []
+    limit = header_int(getattr(first_resp, "headers", None), "X-Pagination-Limit") or limit
+    total = header_int(getattr(first_resp, "headers", None), "X-Pagination-Page-Count")
+    result.total_pages = total
+
+    if total is None:
+        page = 1
+        rows = first_rows
+        while rows and len(rows) >= limit:
+            page += 1
+            if page > cap:
+                cw_log("TRAKT", feature, "warn", "index_reconcile", reason="safety_cap_hit", strategy="paged_fetch", max_pages=cap)
+                break
+            got = _get(page)
+            if not _accept(*got):
+                result.failed.append(page)
+                break
+            rows = got[2] or []
+    else:
+        last = min(int(total), cap)
+        if int(total) > cap:
+            cw_log("TRAKT", feature, "warn", "index_reconcile", reason="safety_cap_hit", strategy="paged_fetch", max_pages=cap)
+        remaining = list(range(2, last + 1))
+        workers = max(1, min(int(concurrency or 1), MAX_PAGE_CONCURRENCY, len(remaining) or 1))
+        pending: list[int] = []
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="trakt-pages") as pool:
+                futures = [pool.submit(_get, page) for page in remaining]
+                try:
+                    for fut in as_completed(futures):
+                        got = fut.result()
+                        if not _accept(*got):
+                            pending.append(got[0])
+                except BaseException:
+                    # An on_page failure aborts the fetch; don't keep pulling pages nobody will read.
+                    for fut in futures:
+                        fut.cancel()
+                    raise
+        else:
+            for page in remaining:
+                got = _get(page)
+                if not _accept(*got):
+                    pending.append(got[0])
+        for page in sorted(pending):
+            got = _get(page)
+            if not _accept(*got):
+                result.failed.append(page)
+        if pending:
+            cw_log("TRAKT", feature, "info", "pages_resumed", url=url, retried=len(pending), recovered=len(pending) - len(result.failed))
+
+    result.wall_ms = int((time.monotonic() - t_start) * 1000)
+    cw_log(
+        "TRAKT",
+        feature,
+        "debug",
+        "pages_done",
+        url=url,
+        pages=len(result.pages),
+        total_pages=result.total_pages,
+        failed=result.failed or None,
+        concurrency=max(1, int(concurrency or 1)),
+        wall_ms=result.wall_ms,
+        slowest_ms=max(result.timings_ms.values()) if result.timings_ms else 0,
+    )
+    return result
+
+
 def _pos_int(v: Any) -> int | None:
     if not isinstance(v, (int, str)):
         return None
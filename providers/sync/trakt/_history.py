@@ -25,6 +25,8 @@ from ._common import (
     _record_limit_error,
     headers_for_adapter,
     watch_only_once,
+    fetch_pages,
+    page_concurrency,
 )
 from .._mod_common import request_with_retries
 from cw_platform.id_map import minimal as id_minimal, canonical_key
@@ -1301,6 +1303,43 @@ def _history_params(*, page: int, limit: int, start_at: str | None = None, end_a
         params["extended"] = str(extended)
     return params
 
+def _history_row_minimal(row: Mapping[str, Any]) -> dict[str, Any] | None:
+    hid = row.get("id")
+    w = row.get("watched_at")
+    if not w:
+        return None
+    typ = (row.get("type") or "").lower()
+    if typ == "movie" and isinstance(row.get("movie"), dict):
+        mv = row["movie"]
+        m = id_minimal({"type": "movie", "ids": mv.get("ids") or {}, "title": mv.get("title"), "year": mv.get("year")})
+        m["watched_at"] = w
+        if hid is not None:
+            m["_trakt_history_id"] = str(hid)
+        return m
+    if typ == "episode" and isinstance(row.get("episode"), dict):
+        ep = row["episode"]
+        show = row.get("show") or {}
+        m = id_minimal(
+            {
+                "type": "episode",
+                "ids": ep.get("ids") or {},
+                "show_ids": show.get("ids") or {},
+                "season": ep.get("season"),
+                "episode": ep.get("number"),
+                "series_title": show.get("title"),
+                "title": ep.get("title"),
+            }
+        )
+        m["watched_at"] = w
+        if hid is not None:
+            m["_trakt_history_id"] = str(hid)
+        abs_no = _int_or_none(ep.get("number_abs"))
+        if abs_no is not None and abs_no > 0:
+            m["_trakt_number_abs"] = abs_no
+        return m
+    return None
+
+
 def _fetch_history(
     sess: Any,
     headers: Mapping[str, Any],
@@ -1314,82 +1353,35 @@ def _fetch_history(
     end_at: str | None = None,
     extended: str | None = None,
     bump: Callable[[int], None] | None = None,
+    concurrency: int = 1,
 ) -> list[dict[str, Any]]:
+    converted: dict[int, list[dict[str, Any]]] = {}
+
+    def _on_page(page: int, rows: list[Any]) -> None:
+        items = [m for m in (_history_row_minimal(row) for row in rows if isinstance(row, Mapping)) if m]
+        converted[page] = items
+        if bump and items:
+            bump(len(items))
+
+    res = fetch_pages(
+        sess,
+        url,
+        headers=headers,
+        per_page=per_page,
+        max_pages=max_pages,
+        timeout=timeout,
+        max_retries=max_retries,
+        params=_history_params(page=1, limit=per_page, start_at=start_at, end_at=end_at, extended=extended),
+        concurrency=concurrency,
+        feature="history",
+        request=request_with_retries,
+        on_page=_on_page,
+    )
+    if res.failed:
+        _warn("http_failed", op="index", url=url, pages=res.failed, status=res.status)
     out: list[dict[str, Any]] = []
-    page = 1
-    total_pages: int | None = None
-    while True:
-        r = request_with_retries(
-            sess,
-            "GET",
-            url,
-            headers=headers,
-            params=_history_params(page=page, limit=per_page, start_at=start_at, end_at=end_at, extended=extended),
-            timeout=timeout,
-            max_retries=max_retries,
-        )
-        if r.status_code != 200:
-            _warn("http_failed", op="index", url=url, page=page, status=r.status_code)
-            break
-        if total_pages is None:
-            pc = _hdr_int(r.headers, "X-Pagination-Page-Count")
-            if pc is not None:
-                total_pages = pc
-        rows = r.json() or []
-        if not rows:
-            break
-        added = 0
-        for row in rows:
-            hid = row.get("id")
-            w = row.get("watched_at")
-            if not w:
-                continue
-            typ = (row.get("type") or "").lower()
-            if typ == "movie" and isinstance(row.get("movie"), dict):
-                mv = row["movie"]
-                m = id_minimal(
-                    {"type": "movie", "ids": mv.get("ids") or {}, "title": mv.get("title"), "year": mv.get("year")}
-                )
-                m["watched_at"] = w
-                if hid is not None:
-                    m["_trakt_history_id"] = str(hid)
-                out.append(m)
-                added += 1
-            elif typ == "episode" and isinstance(row.get("episode"), dict):
-                ep = row["episode"]
-                show = row.get("show") or {}
-                m = id_minimal(
-                    {
-                        "type": "episode",
-                        "ids": ep.get("ids") or {},
-                        "show_ids": show.get("ids") or {},
-                        "season": ep.get("season"),
-                        "episode": ep.get("number"),
-                        "series_title": show.get("title"),
-                        "title": ep.get("title"),
-                    }
-                )
-                m["watched_at"] = w
-                if hid is not None:
-                    m["_trakt_history_id"] = str(hid)
-                abs_no = _int_or_none(ep.get("number_abs"))
-                if abs_no is not None and abs_no > 0:
-                    m["_trakt_number_abs"] = abs_no
-                out.append(m)
-                added += 1
-        if bump and added:
-            try:
-                bump(added)
-            except Exception:
-                pass
-        page += 1
-        if total_pages is not None and page > total_pages:
-            break
-        if total_pages is None and len(rows) < per_page:
-            break
-        if max_pages and page > max_pages:
-            _warn("index_reconcile", reason="safety_cap_hit", strategy="paged_fetch", max_pages=max_pages)
-            break
+    for page in sorted(converted):
+        out.extend(converted[page])
     return out
 
 
@@ -1405,6 +1397,7 @@ def build_index(adapter: Any, *, per_page: int = 100, max_pages: int = 100000) -
     cfg_max_pages = int(_cfg_num(adapter, "history_max_pages", max_pages, int))
     if cfg_max_pages <= 0:
         cfg_max_pages = max_pages
+    pages_in_flight = page_concurrency(adapter)
 
     epi_extended = _episodes_extended()
 
@@ -1494,6 +1487,7 @@ def build_index(adapter: Any, *, per_page: int = 100, max_pages: int = 100000) -
                     timeout=timeout,
                     max_retries=retries,
                     start_at=start_at,
+                    concurrency=pages_in_flight,
                 )
                 episodes = _fetch_history(
                     sess,
@@ -1504,6 +1498,7 @@ def build_index(adapter: Any, *, per_page: int = 100, max_pages: int = 100000) -
                     timeout=timeout,
                     max_retries=retries,
                     start_at=start_at,
+                    concurrency=pages_in_flight,
                     extended=epi_extended,
                 )
 
@@ -1625,6 +1620,7 @@ def build_index(adapter: Any, *, per_page: int = 100, max_pages: int = 100000) -
         timeout=timeout,
         max_retries=retries,
         bump=bump,
+        concurrency=pages_in_flight,
     )
     episodes = _fetch_history(
         sess,
@@ -1636,6 +1632,7 @@ def build_index(adapter: Any, *, per_page: int = 100, max_pages: int = 100000) -
         max_retries=retries,
         extended=epi_extended,
         bump=bump,
+        concurrency=pages_in_flight,
     )
     idx: dict[str, dict[str, Any]] = {}
     for m in movies + episodes:
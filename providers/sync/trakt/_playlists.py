@@ -20,6 +20,8 @@ from ._common import (
     normalize_watchlist_row,
     _chunk,
     _record_limit_error,
+    fetch_pages,
+    page_concurrency,
 )
 from . import _watchlist as feat_watchlist
 from ._watchlist import _batch_payload, _record_not_found
@@ -207,49 +209,38 @@ def get_snapshot(adapter: Any, playlist_id: Any) -> PlaylistSnapshot:
             media_types=("movies", "shows", "seasons", "episodes"),
         )
 
+    res = fetch_pages(
+        sess,
+        f"{BASE}/users/me/lists/{lid}/items",
+        headers=headers,
+        per_page=100,
+        max_pages=1000,
+        timeout=adapter.cfg.timeout,
+        max_retries=adapter.cfg.max_retries,
+        params={"extended": "full"},
+        concurrency=page_concurrency(adapter),
+        feature=_FEATURE,
+        request=request_with_retries,
+    )
+    if res.failed:
+        _warn("http_failed", op="get_snapshot", status=res.status, list_id=lid, pages=res.failed)
+
     items: list[PlaylistItem] = []
-    page = 1
-    per_page = 100
-    while page <= 1000:
-        r = request_with_retries(
-            sess,
-            "GET",
-            f"{BASE}/users/me/lists/{lid}/items",
-            headers=headers,
-            params={"page": page, "limit": per_page, "extended": "full"},
-            timeout=adapter.cfg.timeout,
-            max_retries=adapter.cfg.max_retries,
-        )
-        if r.status_code != 200:
-            _warn("http_failed", op="get_snapshot", status=r.status_code, list_id=lid)
-            break
-        rows = r.json() if (r.text or "").strip() else []
-        if not rows:
-            break
-        for row in rows:
-            if not isinstance(row, Mapping):
-                continue
-            typ = str(row.get("type") or "").lower()
-            if typ not in _SUPPORTED_TYPES:
-                continue
-            media = normalize_watchlist_row(row)
-            items.append(
-                PlaylistItem.from_media(
-                    media,
-                    playlist_item_id=row.get("id"),
-                    position=row.get("rank"),
-                    provider_media_id=(dict(media.get("ids") or {}).get("trakt")),
-                )
+    for row in res.rows():
+        if not isinstance(row, Mapping):
+            continue
+        typ = str(row.get("type") or "").lower()
+        if typ not in _SUPPORTED_TYPES:
+            continue
+        media = normalize_watchlist_row(row)
+        items.append(
+            PlaylistItem.from_media(
+                media,
+                playlist_item_id=row.get("id"),
+                position=row.get("rank"),
+                provider_media_id=(dict(media.get("ids") or {}).get("trakt")),
             )
-        try:
-            page_count = int(r.headers.get("X-Pagination-Page-Count") or 0)
-        except Exception:
-            page_count = 0
-        if page_count and page >= page_count:
-            break
-        if len(rows) < per_page:
-            break
-        page += 1
+        )
 
     items.sort(key=lambda it: (it.position is None, it.position if it.position is not None else 0))
     _info("snapshot_done", list_id=lid, count=len(items))
@@ -23,6 +23,8 @@ from ._common import (
     _now_iso,
     _chunk,
     headers_for_adapter,
+    fetch_pages,
+    page_concurrency,
 )
 from cw_platform.id_map import minimal as id_minimal
 from .._log import log as cw_log
@@ -226,6 +228,98 @@ def _accepted_minimal_for_cache(
     return res
 
 
+def _rating_row_minimal(row: Mapping[str, Any], typ_hint: str) -> dict[str, Any] | None:
+    val = _valid_rating(row.get("rating"))
+    if not val:
+        return None
+    t = (row.get("type") or typ_hint).lower()
+    ra = row.get("rated_at") or row.get("user_rated_at")
+
+    if t == "movie" and isinstance(row.get("movie"), dict):
+        m = normalize_watchlist_row({"type": "movie", "movie": row["movie"]})
+    elif t == "show" and isinstance(row.get("show"), dict):
+        m = normalize_watchlist_row({"type": "show", "show": row["show"]})
+    elif t == "season" and isinstance(row.get("season"), dict):
+        se = row["season"]
+        show = row.get("show") or {}
+        show_ids = show.get("ids") or {}
+        season_no = se.get("number")
+        m = id_minimal(
+            {
+                "type": "season",
+                "ids": se.get("ids") or {},
+                "show_ids": show_ids,
+                "season": season_no,
+                "series_title": show.get("title"),
+                "title": show.get("title"),
+            }
+        )
+        if isinstance(show_ids, Mapping) and show_ids:
+            m["show_ids"] = dict(show_ids)
+        if season_no is not None:
+            m["season"] = season_no
+    elif t == "episode" and isinstance(row.get("episode"), dict):
+        ep = row["episode"]
+        show = row.get("show") or {}
+        show_ids = show.get("ids") or {}
+        season_no = ep.get("season")
+        ep_no = ep.get("number")
+        m = id_minimal(
+            {
+                "type": "episode",
+                "ids": ep.get("ids") or {},
+                "show_ids": show_ids,
+                "season": season_no,
+                "episode": ep_no,
+                "series_title": show.get("title"),
+                "title": ep.get("title") or show.get("title"),
+            }
+        )
+        if isinstance(show_ids, Mapping) and show_ids:
+            m["show_ids"] = dict(show_ids)
+        if season_no is not None:
+            m["season"] = season_no
+        if ep_no is not None:
+            m["episode"] = ep_no
+    else:
+        return None
+
+    m["rating"] = val
+    if ra:
+        m["rated_at"] = ra
+    return m
+
+
+def _get_with_backoff(
+    sess: Any,
+    method: str,
+    url: str,
+    *,
+    headers: Mapping[str, Any],
+    params: Mapping[str, Any],
+    timeout: float,
+    max_retries: int,
+) -> Any:
+    page = params.get("page")
+    rr = max(int(max_retries or 0), 0)
+    for attempt in range(rr + 1):
+        try:
+            r = sess.get(url, headers=headers, params=params, timeout=timeout)
+        except Exception as e:
+            if attempt < rr:
+                _warn("http_failed", op="index", url=url, page=page, error=str(e), attempt=attempt + 1, max_attempts=rr, retrying=True)
+                _sleep_backoff(attempt, None)
+                continue
+            raise
+        if r.status_code in _RETRYABLE_STATUS and attempt < rr:
+            _warn("http_failed", op="index", url=url, page=page, status=r.status_code, attempt=attempt + 1, max_attempts=rr, retrying=True)
+            _sleep_backoff(attempt, r.headers.get("Retry-After"))
+            continue
+        if r.status_code != 200:
+            _warn("http_failed", op="index", url=url, page=page, status=r.status_code, body=((r.text or "")[:200]))
+        return r
+
+
 def _fetch_bucket(
     sess: Any,
     headers: Mapping[str, Any],
@@ -235,102 +329,26 @@ def _fetch_bucket(
     max_pages: int,
     tmo: float,
     rr: int,
+    concurrency: int = 1,
 ) -> list[dict[str, Any]]:
+    res = fetch_pages(
+        sess,
+        url,
+        headers=headers,
+        per_page=per_page,
+        max_pages=max_pages,
+        timeout=tmo,
+        max_retries=rr,
+        concurrency=concurrency,
+        feature="ratings",
+        request=_get_with_backoff,
+    )
     out: list[dict[str, Any]] = []
-    for page in range(1, max_pages + 1):
-        last_status: int | None = None
-        for attempt in range(max(int(rr or 0), 0) + 1):
-            try:
-                r = sess.get(url, headers=headers, params={"page": page, "limit": per_page}, timeout=tmo)
-                last_status = r.status_code
-                if r.status_code == 200:
-                    rows = r.json() or []
-                    if not rows:
-                        return out
-                    for row in rows:
-                        val = _valid_rating(row.get("rating"))
-                        if not val:
-                            continue
-                        t = (row.get("type") or typ_hint).lower()
-                        ra = row.get("rated_at") or row.get("user_rated_at")
-
-                        if t == "movie" and isinstance(row.get("movie"), dict):
-                            m = normalize_watchlist_row({"type": "movie", "movie": row["movie"]})
-                        elif t == "show" and isinstance(row.get("show"), dict):
-                            m = normalize_watchlist_row({"type": "show", "show": row["show"]})
-                        elif t == "season" and isinstance(row.get("season"), dict):
-                            se = row["season"]
-                            show = row.get("show") or {}
-                            show_ids = show.get("ids") or {}
-                            season_no = se.get("number")
-                            m = id_minimal(
-                                {
-                                    "type": "season",
-                                    "ids": se.get("ids") or {},
-                                    "show_ids": show_ids,
-                                    "season": season_no,
-                                    "series_title": show.get("title"),
-                                    "title": show.get("title"),
-                                }
-                            )
-                            if isinstance(show_ids, Mapping) and show_ids:
-                                m["show_ids"] = dict(show_ids)
-                            if season_no is not None:
-                                m["season"] = season_no
-                        elif t == "episode" and isinstance(row.get("episode"), dict):
-                            ep = row["episode"]
-                            show = row.get("show") or {}
-                            show_ids = show.get("ids") or {}
-                            season_no = ep.get("season")
-                            ep_no = ep.get("number")
-                            m = id_minimal(
-                                {
-                                    "type": "episode",
-                                    "ids": ep.get("ids") or {},
-                                    "show_ids": show_ids,
-                                    "season": season_no,
-                                    "episode": ep_no,
-                                    "series_title": show.get("title"),
-                                    "title": ep.get("title") or show.get("title"),
-                                }
-                            )
-                            if isinstance(show_ids, Mapping) and show_ids:
-                                m["show_ids"] = dict(show_ids)
-                            if season_no is not None:
-                                m["season"] = season_no
-                            if ep_no is not None:
-                                m["episode"] = ep_no
-                        else:
-                            continue
-
-                        m["rating"] = val
-                        if ra:
-                            m["rated_at"] = ra
-                        out.append(m)
-
-                    if len(rows) < per_page:
-                        return out
-                    break
-
-                if r.status_code in _RETRYABLE_STATUS and attempt < rr:
-                    _warn("http_failed", op="index", url=url, page=page, status=r.status_code, attempt=attempt + 1, max_attempts=rr, retrying=True)
-                    _sleep_backoff(attempt, r.headers.get("Retry-After"))
-                    continue
-
-                _warn("http_failed", op="index", url=url, page=page, status=r.status_code, body=((r.text or "")[:200]))
-                return out
-
-            except Exception as e:
-                if attempt < rr:
-                    _warn("http_failed", op="index", url=url, page=page, error=str(e), attempt=attempt + 1, max_attempts=rr, retrying=True)
-                    _sleep_backoff(attempt, None)
-                    continue
-                _warn("http_failed", op="index", url=url, page=page, error=str(e))
-                return out
-
-        if last_status is not None and last_status != 200:
-            return out
-
+    for row in res.rows():
+        if isinstance(row, Mapping):
+            m = _rating_row_minimal(row, typ_hint)
+            if m:
+                out.append(m)
     return out
 
 
@@ -356,6 +374,7 @@ def build_index(adapter: Any, *, per_page: int = 200, max_pages: int = 50) -> di
     headers = headers_for_adapter(adapter)
     tmo = adapter.cfg.timeout
     rr = int(getattr(adapter.cfg, "max_retries", 3) or 3)
+    pages_in_flight = page_concurrency(adapter)
 
     doc = _load_cache_doc()
     cached_items = dict(doc.get("items") or {})
@@ -378,10 +397,10 @@ def build_index(adapter: Any, *, per_page: int = 200, max_pages: int = 50) -> di
         _info("index_done", count=len(cached_items), source="cache")
         return cached_items
 
-    movies = _fetch_bucket(sess, headers, URL_RAT_MOV, "movie", per_page, max_pages, tmo, rr)
-    shows = _fetch_bucket(sess, headers, URL_RAT_SHO, "show", per_page, max_pages, tmo, rr)
-    seasons = _fetch_bucket(sess, headers, URL_RAT_SEA, "season", per_page, max_pages, tmo, rr)
-    episodes = _fetch_bucket(sess, headers, URL_RAT_EPI, "episode", per_page, max_pages, tmo, rr)
+    movies = _fetch_bucket(sess, headers, URL_RAT_MOV, "movie", per_page, max_pages, tmo, rr, pages_in_flight)
+    shows = _fetch_bucket(sess, headers, URL_RAT_SHO, "show", per_page, max_pages, tmo, rr, pages_in_flight)
+    seasons = _fetch_bucket(sess, headers, URL_RAT_SEA, "season", per_page, max_pages, tmo, rr, pages_in_flight)
+    episodes = _fetch_bucket(sess, headers, URL_RAT_EPI, "episode", per_page, max_pages, tmo, rr, pages_in_flight)
 
     all_items = movies + shows + seasons + episodes
     _dbg("index_fetch_counts", count=len(all_items), movies=len(movies), shows=len(shows), seasons=len(seasons), episodes=len(episodes), source="current")
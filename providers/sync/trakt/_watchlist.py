@@ -23,6 +23,9 @@ from ._common import (
     _record_limit_error,
     headers_for_adapter,
     resolve_watchlist_limit,
+    fetch_pages,
+    header_int,
+    page_concurrency,
 )
 from .._mod_common import request_with_retries
 from cw_platform.id_map import minimal as id_minimal
@@ -216,7 +219,30 @@ def build_index(adapter: Any) -> dict[str, dict[str, Any]]:
         _info("index_done", count=len(idx), source="shadow_fallback")
         return idx
 
-    data = r.json() if (r.text or "").strip() else []
+    page_count = header_int(r.headers, "X-Pagination-Page-Count")
+    if page_count and page_count > 1:
+        headers.pop("If-None-Match", None)
+        res = fetch_pages(
+            sess,
+            URL_ALL,
+            headers=headers,
+            per_page=header_int(r.headers, "X-Pagination-Limit") or 100,
+            max_pages=page_count,
+            timeout=adapter.cfg.timeout,
+            max_retries=adapter.cfg.max_retries,
+            concurrency=page_concurrency(adapter),
+            feature="watchlist",
+            first=r,
+            request=request_with_retries,
+        )
+        if res.failed:
+            _warn("http_failed", op="index", method="GET", url=URL_ALL, pages=res.failed)
+            idx = dict(sh.get("items") or {})
+            _info("index_done", count=len(idx), source="shadow_fallback")
+            return idx
+        data = res.rows()
+    else:
+        data = r.json() if (r.text or "").strip() else []
     items = [normalize_watchlist_row(x) for x in (data or []) if isinstance(x, dict)]
     idx: dict[str, dict[str, Any]] = {key_of(m): m for m in items}
     if use_etag:
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import importlib
+import threading
+import time
+from typing import Any
+
+common = importlib.import_module("providers.sync.trakt._common")
+hist = importlib.import_module("providers.sync.trakt._history")
+
+
+class FakeResp:
+    def __init__(self, status: int, payload: Any = None, headers: dict[str, str] | None = None):
+        self.status_code = status
+        self._payload = payload
+        self.headers = headers or {}
+        self.text = "x" if payload is not None else ""
+
+    def json(self) -> Any:
+        return self._payload
+
+
+class PagedServer:
+    def __init__(self, pages: int, per_page: int = 3, *, header: bool = True, fail_once: set[int] | None = None, delay: float = 0.0):
+        self.pages = pages
+        self.per_page = per_page
+        self.header = header
+        self.fail_once = set(fail_once or ())
+        self.delay = delay
+        self.calls: list[int] = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, sess: Any, method: str, url: str, **kw: Any) -> FakeResp:
+        page = int(kw["params"]["page"])
+        with self._lock:
+            self.calls.append(page)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            if self.delay:
+                time.sleep(self.delay * (self.pages - page + 1))
+            with self._lock:
+                if page in self.fail_once:
+                    self.fail_once.discard(page)
+                    return FakeResp(503, None)
+            rows = [{"page": page, "n": i} for i in range(self.per_page)] if page <= self.pages else []
+            headers = {"X-Pagination-Page-Count": str(self.pages)} if self.header else {}
+            return FakeResp(200, rows, headers=headers)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def _fetch(server: PagedServer, **kw: Any) -> common.PagedFetch:
+    args: dict[str, Any] = dict(headers={}, per_page=server.per_page, max_pages=100, timeout=1.0, max_retries=0, request=server)
+    args.update(kw)
+    return common.fetch_pages(object(), "https://api.trakt.tv/x", **args)
+
+
+def test_parallel_pages_reassemble_in_order_with_bounded_concurrency():
+    server = PagedServer(pages=8, delay=0.01)
+    res = _fetch(server, concurrency=3)
+    assert res.ok and res.total_pages == 8
+    assert [(r["page"], r["n"]) for r in res.rows()] == [(p, i) for p in range(1, 9) for i in range(3)]
+    assert sorted(server.calls) == list(range(1, 9))
+    assert 1 < server.peak <= 3
+    assert set(res.timings_ms) == set(range(1, 9))
+
+
+def test_failed_page_is_resumed_after_parallel_pass():
+    server = PagedServer(pages=5, fail_once={3})
+    res = _fetch(server, concurrency=4)
+    assert res.ok and not res.failed
+    assert server.calls.count(3) == 2
+    assert [r["page"] for r in res.rows()][::3] == [1, 2, 3, 4, 5]
+
+
+def test_unknown_page_count_falls_back_to_sequential_paging():
+    server = PagedServer(pages=3, header=False)
+    res = _fetch(server, concurrency=4)
+    assert res.total_pages is None
+    assert server.calls == [1, 2, 3, 4]
+    assert len(res.rows()) == 9
+
+
+def test_max_pages_caps_fetch():
+    server = PagedServer(pages=10)
+    res = _fetch(server, concurrency=4, max_pages=4)
+    assert sorted(server.calls) == [1, 2, 3, 4]
+    assert len(res.pages) == 4
+
+
+def test_history_fetch_keeps_page_order(monkeypatch):
+    def rwr(sess: Any, method: str, url: str, **kw: Any) -> FakeResp:
+        page = int(kw["params"]["page"])
+        time.sleep(0.01 * (4 - page))
+        rows = [
+            {"id": page * 10 + i, "watched_at": f"2024-01-0{page}T00:00:0{i}.000Z", "type": "movie", "movie": {"title": f"M{page}{i}", "year": 2000, "ids": {"trakt": page * 10 + i}}}
+            for i in range(2)
+        ]
+        return FakeResp(200, rows, headers={"X-Pagination-Page-Count": "3"})
+
+    monkeypatch.setattr(hist, "request_with_retries", rwr)
+    bumped: list[int] = []
+    out = hist._fetch_history(object(), {}, "https://api.trakt.tv/sync/history/movies", per_page=2, max_pages=10, timeout=1.0, max_retries=0, bump=bumped.append, concurrency=3)
+    assert [m["_trakt_history_id"] for m in out] == ["10", "11", "20", "21", "30", "31"]
+    assert sum(bumped) == 6
+
+
+def test_on_page_errors_propagate():
+    server = PagedServer(pages=6)
+
+    def boom(page: int, rows: list[Any]) -> None:
+        if page == 2:
+            raise ValueError("bad row")
+
+    for concurrency in (1, 3):
+        try:
+            _fetch(server, concurrency=concurrency, on_page=boom)
+        except ValueError as e:
+            assert str(e) == "bad row"
+        else:
+            raise AssertionError("on_page error was swallowed")
+
+
+def test_zero_page_concurrency_means_sequential():
+    mod = importlib.import_module("providers.sync._mod_TRAKT")
+    m = mod.TRAKTModule({"trakt": {"access_token": "t", "client_id": "c", "page_concurrency": 0}}, connect=False)
+    assert m.cfg.page_concurrency == 0 and common.page_concurrency(m) == 1
+    assert mod.TRAKTModule({"trakt": {"access_token": "t", "client_id": "c"}}, connect=False).cfg.page_concurrency == 4
@@ -10,6 +10,7 @@ from typing import Any, Callable, Mapping
 import requests
 
 from cw_platform.config_base import load_config, save_config
+from cw_platform.http_metrics import instrument_session
 
 try:
     from _logging import log as BASE_LOG
@@ -29,6 +30,7 @@ except Exception:
 
 
 TRAKT_API = "https://api.trakt.tv"
+_HTTP = instrument_session(requests.Session(), "EMBY")
 
 _SCROBBLE_STATE: dict[str, dict[str, Any]] = {}
 _TRAKT_ID_CACHE: dict[tuple[Any, ...], Any] = {}
@@ -98,7 +100,7 @@ def _emby_headers(tok: str, did: str) -> dict[str, str]:
 
 def _emby_get_json(base: str, tok: str, did: str, *, timeout: float, verify: bool, path: str) -> Any:
     url = f'{base}{path}'
-    r = requests.get(url, headers=_emby_headers(tok, did), timeout=timeout, verify=verify)
+    r = _HTTP.get(url, headers=_emby_headers(tok, did), timeout=timeout, verify=verify)
     if getattr(r, 'status_code', 0) != 200:
         return None
     try:
@@ -327,7 +329,7 @@ def _headers(cfg: dict[str, Any]) -> dict[str, str]:
 
 def _del_trakt(path: str, cfg: dict[str, Any]) -> requests.Response:
     url = f"{TRAKT_API}{path}"
-    r = requests.delete(url, headers=_headers(cfg), timeout=12)
+    r = _HTTP.delete(url, headers=_headers(cfg), timeout=12)
     if r.status_code == 401:
         try:
             from providers.auth._auth_TRAKT import PROVIDER as TRAKT_AUTH
@@ -337,7 +339,7 @@ def _del_trakt(path: str, cfg: dict[str, Any]) -> requests.Response:
         except Exception:
             return r
         try:
-            r = requests.delete(url, headers=_headers(cfg), timeout=12)
+            r = _HTTP.delete(url, headers=_headers(cfg), timeout=12)
         except Exception:
             pass
     return r
@@ -346,7 +348,7 @@ def _del_trakt(path: str, cfg: dict[str, Any]) -> requests.Response:
 def _post_trakt(path: str, body: dict[str, Any], cfg: dict[str, Any]) -> requests.Response:
     url = f"{TRAKT_API}{path}"
     body = {**body, **_app_meta(cfg)}
-    r = requests.post(url, json=body, headers=_headers(cfg), timeout=15)
+    r = _HTTP.post(url, json=body, headers=_headers(cfg), timeout=15)
     if r.status_code == 401:
         try:
             from providers.auth._auth_TRAKT import PROVIDER as TRAKT_AUTH
@@ -355,7 +357,7 @@ def _post_trakt(path: str, body: dict[str, Any], cfg: dict[str, Any]) -> request
             _save_config(cfg)
         except Exception:
             pass
-        r = requests.post(url, json=body, headers=_headers(cfg), timeout=15)
+        r = _HTTP.post(url, json=body, headers=_headers(cfg), timeout=15)
     return r
 
 
@@ -531,7 +533,7 @@ def _guid_search_episode(epi_hint: dict[str, Any], cfg: dict[str, Any], logger:
         q = {k: epi_hint.get(k) for k in ("tmdb", "imdb", "tvdb") if epi_hint.get(k)}
         if not q:
             return {}
-        r = requests.get(f"{TRAKT_API}/search/episode", params=q, headers=_headers(cfg), timeout=10)
+        r = _HTTP.get(f"{TRAKT_API}/search/episode", params=q, headers=_headers(cfg), timeout=10)
         if r.status_code != 200:
             return {}
         arr = r.json() or []
@@ -576,7 +578,7 @@ def _show_ids_from_episode_hint(
         if not val:
             continue
         try:
-            r = requests.get(
+            r = _HTTP.get(
                 f"{TRAKT_API}/search/{key}/{val}",
                 params={"type": "episode", "limit": 1},
                 headers=_headers(cfg),
@@ -611,7 +613,7 @@ def _resolve_episode_by_showids(
         tid = show_ids.get("trakt")
         if not tid:
             return None
-        r = requests.get(f"{TRAKT_API}/shows/{tid}/seasons/{s}", headers=_headers(cfg), timeout=10)
+        r = _HTTP.get(f"{TRAKT_API}/shows/{tid}/seasons/{s}", headers=_headers(cfg), timeout=10)
         if r.status_code != 200:
             return None
         eps = r.json() or []
@@ -724,7 +726,7 @@ def _cw_ids_for_payload(
                 timeout = float(e.get("timeout", 6))
                 verify = bool(e.get("verify_ssl", True))
 
-                r = requests.get(url, headers=headers, timeout=timeout, verify=verify)
+                r = _HTTP.get(url, headers=headers, timeout=timeout, verify=verify)
                 if r.status_code == 200:
                     info = r.json() or {}
                     show_ids = _series_ids_from_payload(info, info) or {}
@@ -0,0 +1,188 @@
+# providers/webhooks/ingest.py
+# CrossWatch - Webhook ingestion queue with per-session coalescing and latency metrics
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from cw_platform.http_metrics import LatencyHistogram
+
+__all__ = ["WebhookQueue", "WEBHOOK_QUEUE", "plex_session_key"]
+
+_MAX_PENDING = 256
+_IDLE_EXIT_SECONDS = 30.0
+# Playback state events; a newer one for the same session replaces one still waiting.
+_PLEX_STATE_EVENTS = frozenset({"media.play", "media.pause", "media.resume"})
+
+
+class _Job:
+    __slots__ = ("fn", "session", "queued_at")
+
+    def __init__(self, fn: Callable[[], Any], session: Hashable | None, queued_at: float) -> None:
+        self.fn = fn
+        self.session = session
+        self.queued_at = queued_at
+
+
+class WebhookQueue:
+    """Bounded FIFO drained by one daemon worker, so events run in arrival order.
+
+    ``submit(..., coalesce=True)`` replaces the session's waiting job instead of
+    queueing another one, as long as nothing for that session was queued after
+    it. When the queue is full the oldest waiting playback-state job (one that
+    could still be coalesced) is dropped to make room; with none to drop the
+    job is refused with ``"rejected"``. Nothing ever runs in the caller.
+    """
+
+    def __init__(self, name: str = "webhook", *, maxsize: int = _MAX_PENDING, clock: Callable[[], float] = time.monotonic) -> None:
+        self.name = name
+        self.maxsize = max(1, int(maxsize))
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._pending: OrderedDict[int, _Job] = OrderedDict()
+        self._open: dict[Hashable, int] = {}
+        self._seq = itertools.count()
+        self._worker: threading.Thread | None = None
+        self._running = 0
+        self.received = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.rejected = 0
+        self.processed = 0
+        self.failed = 0
+        self.max_depth = 0
+        self.ack_ms = LatencyHistogram()
+        self.wait_ms = LatencyHistogram()
+        self.run_ms = LatencyHistogram()
+        self.on_error: Callable[[BaseException], None] | None = None
+
+    def submit(self, fn: Callable[[], Any], *, session: Hashable | None = None, coalesce: bool = False) -> str:
+        with self._cond:
+            self.received += 1
+            seq = self._open.get(session) if coalesce and session is not None else None
+            if seq is not None:
+                self._pending[seq].fn = fn
+                self.coalesced += 1
+                return "coalesced"
+            if len(self._pending) >= self.maxsize:
+                if not self._open:
+                    self.rejected += 1
+                    return "rejected"
+                # A newer state event for that session would have replaced it anyway.
+                oldest = min(self._open.items(), key=lambda kv: kv[1])
+                del self._open[oldest[0]]
+                del self._pending[oldest[1]]
+                self.dropped += 1
+            seq = next(self._seq)
+            self._pending[seq] = _Job(fn, session, self._clock())
+            if session is not None:
+                if coalesce:
+                    self._open[session] = seq
+                else:
+                    self._open.pop(session, None)
+            self.max_depth = max(self.max_depth, len(self._pending))
+            self._ensure_worker()
+            self._cond.notify()
+            return "queued"
+
+    def record_ack(self, started: float) -> None:
+        with self._cond:
+            self.ack_ms.add((self._clock() - started) * 1000.0)
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._drain_forever, name=f"{self.name}-ingest", daemon=True)
+            self._worker.start()
+
+    def _drain_forever(self) -> None:
+        while True:
+            with self._cond:
+                if not self._pending:
+                    self._cond.wait(_IDLE_EXIT_SECONDS)
+                if not self._pending:
+                    if self._worker is threading.current_thread():
+                        self._worker = None
+                    return
+                seq, job = self._pending.popitem(last=False)
+                if job.session is not None and self._open.get(job.session) == seq:
+                    del self._open[job.session]
+                self._running += 1
+                self.wait_ms.add((self._clock() - job.queued_at) * 1000.0)
+            try:
+                self._run(job)
+            finally:
+                with self._cond:
+                    self._running -= 1
+                    self._cond.notify_all()
+
+    def _run(self, job: _Job) -> None:
+        t0 = self._clock()
+        ok = True
+        try:
+            job.fn()
+        except Exception as e:
+            ok = False
+            if self.on_error is not None:
+                try:
+                    self.on_error(e)
+                except Exception:
+                    pass
+        with self._cond:
+            self.run_ms.add((self._clock() - t0) * 1000.0)
+            if ok:
+                self.processed += 1
+            else:
+                self.failed += 1
+
+    def join(self, timeout: float = 10.0) -> bool:
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._running:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    return False
+                self._cond.wait(left)
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        def _hist(h: LatencyHistogram) -> dict[str, Any]:
+            return {"count": h.n, "p50_ms": h.quantile(0.5), "p95_ms": h.quantile(0.95), "max_ms": h.max_ms}
+
+        with self._cond:
+            return {
+                "depth": len(self._pending),
+                "max_depth": self.max_depth,
+                "maxsize": self.maxsize,
+                "received": self.received,
+                "coalesced": self.coalesced,
+                "dropped": self.dropped,
+                "rejected": self.rejected,
+                "processed": self.processed,
+                "failed": self.failed,
+                "ack": _hist(self.ack_ms),
+                "wait": _hist(self.wait_ms),
+                "run": _hist(self.run_ms),
+            }
+
+
+def plex_session_key(payload: dict[str, Any], provider_instance: str) -> tuple[tuple[str, ...], bool]:
+    # Plex payloads carry no session id; account + player + item identifies one playback.
+    acc = payload.get("Account") or {}
+    player = payload.get("Player") or {}
+    md = payload.get("Metadata") or {}
+    key = (
+        "plex",
+        str(provider_instance or "default"),
+        str(acc.get("id") or acc.get("title") or ""),
+        str(player.get("uuid") or ""),
+        str(md.get("ratingKey") or ""),
+    )
+    return key, str(payload.get("event") or "").lower() in _PLEX_STATE_EVENTS
+
+
+WEBHOOK_QUEUE = WebhookQueue("webhook")
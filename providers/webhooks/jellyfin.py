@@ -8,6 +8,7 @@ import requests
 from typing import Any, Mapping, Callable
 
 from cw_platform.config_base import load_config, save_config
+from cw_platform.http_metrics import instrument_session
 
 try:
     from _logging import log as BASE_LOG
@@ -26,6 +27,7 @@ except Exception:
     _rm_across_api = None
 
 TRAKT_API = "https://api.trakt.tv"
+_HTTP = instrument_session(requests.Session(), "JELLYFIN")
 
 _SCROBBLE_STATE: dict[str, dict[str, Any]] = {}
 _TRAKT_ID_CACHE: dict[tuple[Any, ...], Any] = {}
@@ -100,7 +102,7 @@ def _jf_headers(tok: str, did: str) -> dict[str, str]:
 
 def _jf_get_json(base: str, tok: str, did: str, *, timeout: float, verify: bool, path: str) -> Any:
     url = f'{base}{path}'
-    r = requests.get(url, headers=_jf_headers(tok, did), timeout=timeout, verify=verify)
+    r = _HTTP.get(url, headers=_jf_headers(tok, did), timeout=timeout, verify=verify)
     if getattr(r, 'status_code', 0) != 200:
         return None
     try:
@@ -367,7 +369,7 @@ def _headers(cfg: dict[str, Any]) -> dict[str, str]:
 
 def _del_trakt(path: str, cfg: dict[str, Any]) -> requests.Response:
     url = f"{TRAKT_API}{path}"
-    r = requests.delete(url, headers=_headers(cfg), timeout=12)
+    r = _HTTP.delete(url, headers=_headers(cfg), timeout=12)
     if r.status_code == 401:
         try:
             from providers.auth._auth_TRAKT import PROVIDER as TRAKT_AUTH
@@ -377,7 +379,7 @@ def _del_trakt(path: str, cfg: dict[str, Any]) -> requests.Response:
         except Exception:
             return r
         try:
-            r = requests.delete(url, headers=_headers(cfg), timeout=12)
+            r = _HTTP.delete(url, headers=_headers(cfg), timeout=12)
         except Exception:
             pass
     return r
@@ -385,7 +387,7 @@ def _del_trakt(path: str, cfg: dict[str, Any]) -> requests.Response:
 
 def _get_trakt_watching(cfg: dict[str, Any]) -> None:
     try:
-        r = requests.get(f"{TRAKT_API}/users/me/watching", headers=_headers(cfg), timeout=8)
+        r = _HTTP.get(f"{TRAKT_API}/users/me/watching", headers=_headers(cfg), timeout=8)
         try:
             body: Any = r.json()
         except Exception:
@@ -398,7 +400,7 @@ def _get_trakt_watching(cfg: dict[str, Any]) -> None:
 def _post_trakt(path: str, body: dict[str, Any], cfg: dict[str, Any]) -> requests.Response:
     url = f"{TRAKT_API}{path}"
     body = {**body, **_app_meta(cfg)}
-    r = requests.post(url, json=body, headers=_headers(cfg), timeout=15)
+    r = _HTTP.post(url, json=body, headers=_headers(cfg), timeout=15)
 
     if r.status_code == 401:
         try:
@@ -408,7 +410,7 @@ def _post_trakt(path: str, body: dict[str, Any], cfg: dict[str, Any]) -> request
             _save_config(cfg)
         except Exception:
             pass
-        r = requests.post(url, json=body, headers=_headers(cfg), timeout=15)
+        r = _HTTP.post(url, json=body, headers=_headers(cfg), timeout=15)
 
     if r.status_code in (429, 500, 502, 503, 504):
         try:
@@ -416,7 +418,7 @@ def _post_trakt(path: str, body: dict[str, Any], cfg: dict[str, Any]) -> request
         except Exception:
             ra = 1.0
         time.sleep(min(max(ra, 0.5), 3.0))
-        r = requests.post(url, json=body, headers=_headers(cfg), timeout=15)
+        r = _HTTP.post(url, json=body, headers=_headers(cfg), timeout=15)
     return r
 
 
@@ -507,7 +509,7 @@ def _guid_search_episode(ids_hint: dict[str, Any], cfg: dict[str, Any], logger:
         if not val:
             continue
         try:
-            r = requests.get(
+            r = _HTTP.get(
                 f"{TRAKT_API}/search/{key}/{val}",
                 params={"type": "episode", "limit": 1},
                 headers=_headers(cfg),
@@ -540,7 +542,7 @@ def _resolve_trakt_movie_id(ids_all: dict[str, Any], cfg: dict[str, Any], logger
         if not val:
             continue
         try:
-            r = requests.get(
+            r = _HTTP.get(
                 f"{TRAKT_API}/search/{k}/{val}",
                 params={"type": "movie", "limit": 1},
                 headers=_headers(cfg),
@@ -571,7 +573,7 @@ def _resolve_trakt_show_id(ids_all: dict[str, Any], cfg: dict[str, Any], logger:
         if not val:
             continue
         try:
-            r = requests.get(
+            r = _HTTP.get(
                 f"{TRAKT_API}/search/{k}/{val}",
                 params={"type": "show", "limit": 1},
                 headers=_headers(cfg),
@@ -605,7 +607,7 @@ def _trakt_show_ids_from_imdb_show(imdb_show: str, cfg: dict[str, Any], logger:
         return {}
 
     try:
-        r = requests.get(
+        r = _HTTP.get(
             f"{TRAKT_API}/search/imdb/{imdb_show}",
             params={"type": "show", "limit": 1},
             headers=_headers(cfg),
@@ -653,7 +655,7 @@ def _resolve_trakt_episode_id(
     show_tid = _resolve_trakt_show_id(ids_all, cfg, logger=logger)
     if show_tid and isinstance(s, int) and isinstance(e, int):
         try:
-            r = requests.get(
+            r = _HTTP.get(
                 f"{TRAKT_API}/shows/{show_tid}/seasons/{s}/episodes/{e}",
                 headers=_headers(cfg),
                 timeout=10,
@@ -725,7 +727,7 @@ def _show_ids_from_episode_hint(
         if not val:
             continue
         try:
-            r = requests.get(
+            r = _HTTP.get(
                 f"{TRAKT_API}/search/{key}/{val}",
                 params={"type": "episode", "limit": 1},
                 headers=_headers(cfg),
@@ -809,7 +811,7 @@ def _resolve_episode_by_showids(
         if not sid:
             continue
         try:
-            r = requests.get(
+            r = _HTTP.get(
                 f"{TRAKT_API}/shows/{sid}/seasons/{season}/episodes/{number}",
                 headers=_headers(cfg),
                 timeout=10,
@@ -869,7 +871,7 @@ def _build_primary_body(
         try:
             title = (md.get("SeriesName") or (root or {}).get("SeriesName") or (root or {}).get("SeriesTitle") or "").strip()
             if title:
-                r = requests.get(
+                r = _HTTP.get(
                     f"{TRAKT_API}/search/show",
                     params={"query": title, "limit": 1},
                     headers=_headers(cfg),
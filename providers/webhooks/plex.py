@@ -13,7 +13,9 @@ from typing import Any, Callable, Iterable, Mapping
 
 import requests
 
-from cw_platform.config_base import load_config, save_config
+from cw_platform.config_base import config_generation, load_config, save_config
+from cw_platform.http_metrics import instrument_session
+from cw_platform.ttl_cache import TTLCache
 
 try:
     from _logging import log as BASE_LOG
@@ -34,9 +36,11 @@ except Exception:
     _rm_across_api = None
 
 TRAKT_API = "https://api.trakt.tv"
+_HTTP = instrument_session(requests.Session(), "PLEX")
 
 _SCROBBLE_STATE: dict[str, dict[str, Any]] = {}
-_TRAKT_ID_CACHE: dict[tuple[Any, ...], Any] = {}
+_TRAKT_ID_CACHE: TTLCache[Any] = TTLCache(maxsize=2048, ttl=6 * 3600.0)
+_DEBUG_FLAG: TTLCache[bool] = TTLCache(maxsize=4)
 _LAST_FINISH_BY_ACC: dict[str, dict[str, Any]] = {}
 _LAST_RATING_BY_ACC: dict[tuple[str, str, str], dict[str, Any]] = {}
 
@@ -135,8 +139,13 @@ def _save_config(cfg: dict[str, Any]) -> None:
 
 def _is_debug() -> bool:
     try:
-        rt = (_load_config().get("runtime") or {})
-        return bool(rt.get("debug") or rt.get("debug_mods"))
+        gen = config_generation()
+        hit = _DEBUG_FLAG.get(gen)
+        if hit is None:
+            rt = (_load_config().get("runtime") or {})
+            hit = bool(rt.get("debug") or rt.get("debug_mods"))
+            _DEBUG_FLAG.set(gen, hit)
+        return hit
     except Exception:
         return False
 
@@ -296,7 +305,7 @@ def _headers(cfg: dict[str, Any]) -> dict[str, str]:
 
 def _del_trakt(path: str, cfg: dict[str, Any]) -> requests.Response:
     url = f"{TRAKT_API}{path}"
-    r = requests.delete(url, headers=_headers(cfg), timeout=12)
+    r = _HTTP.delete(url, headers=_headers(cfg), timeout=12)
     if r.status_code == 401:
         try:
             from providers.auth._auth_TRAKT import PROVIDER as TRAKT_AUTH
@@ -306,7 +315,7 @@ def _del_trakt(path: str, cfg: dict[str, Any]) -> requests.Response:
         except Exception:
             return r
         try:
-            r = requests.delete(url, headers=_headers(cfg), timeout=12)
+            r = _HTTP.delete(url, headers=_headers(cfg), timeout=12)
         except Exception:
             pass
     return r
@@ -314,7 +323,7 @@ def _del_trakt(path: str, cfg: dict[str, Any]) -> requests.Response:
 
 def _get_trakt_watching(cfg: dict[str, Any]) -> None:
     try:
-        r = requests.get(f"{TRAKT_API}/users/me/watching", headers=_headers(cfg), timeout=8)
+        r = _HTTP.get(f"{TRAKT_API}/users/me/watching", headers=_headers(cfg), timeout=8)
         try:
             body: Any = r.json()
         except Exception:
@@ -327,7 +336,7 @@ def _get_trakt_watching(cfg: dict[str, Any]) -> None:
 def _post_trakt(path: str, body: dict[str, Any], cfg: dict[str, Any]) -> requests.Response:
     url = f"{TRAKT_API}{path}"
     body = {**body, **_app_meta(cfg)}
-    r = requests.post(url, json=body, headers=_headers(cfg), timeout=15)
+    r = _HTTP.post(url, json=body, headers=_headers(cfg), timeout=15)
 
     if r.status_code == 401:
         try:
@@ -337,7 +346,7 @@ def _post_trakt(path: str, body: dict[str, Any], cfg: dict[str, Any]) -> request
             _save_config(cfg)
         except Exception:
             pass
-        r = requests.post(url, json=body, headers=_headers(cfg), timeout=15)
+        r = _HTTP.post(url, json=body, headers=_headers(cfg), timeout=15)
 
     if r.status_code in (429, 500, 502, 503, 504):
         try:
@@ -345,7 +354,7 @@ def _post_trakt(path: str, body: dict[str, Any], cfg: dict[str, Any]) -> request
         except Exception:
             ra = 1.0
         time.sleep(min(max(ra, 0.5), 3.0))
-        r = requests.post(url, json=body, headers=_headers(cfg), timeout=15)
+        r = _HTTP.post(url, json=body, headers=_headers(cfg), timeout=15)
     return r
 
 
@@ -489,7 +498,7 @@ def _plex_show_ids_from_metadata(
 
         for rk in rk_candidates:
             try:
-                r = requests.get(
+                r = _HTTP.get(
                     f"{base}/library/metadata/{rk}",
                     headers={"X-Plex-Token": token},
                     timeout=5,
@@ -600,7 +609,7 @@ def _probe_active_progress(cfg: dict[str, Any], rating_key: Any) -> tuple[int, i
         rk = str(rating_key or "")
         if not token or not rk:
             return None
-        r = requests.get(f"{base}/status/sessions", headers={"X-Plex-Token": token}, timeout=5)
+        r = _HTTP.get(f"{base}/status/sessions", headers={"X-Plex-Token": token}, timeout=5)
         if r.status_code != 200:
             return None
         root = ET.fromstring(r.text or "")
@@ -635,7 +644,7 @@ def _probe_played_status(cfg: dict[str, Any], rating_key: Any) -> bool:
         base, token = _plex_base_token(cfg)
         if not token:
             return False
-        r = requests.get(f"{base}/library/metadata/{rating_key}", headers={"X-Plex-Token": token}, timeout=5)
+        r = _HTTP.get(f"{base}/library/metadata/{rating_key}", headers={"X-Plex-Token": token}, timeout=5)
         if r.status_code != 200:
             return False
         root = ET.fromstring(r.text or "")
@@ -657,9 +666,7 @@ def _cache_get(key: tuple[Any, ...]) -> Any | None:
 
 def _cache_put(key: tuple[Any, ...], value: Any) -> None:
     try:
-        if len(_TRAKT_ID_CACHE) > 2048:
-            _TRAKT_ID_CACHE.clear()
-        _TRAKT_ID_CACHE[key] = value
+        _TRAKT_ID_CACHE.set(key, value)
     except Exception:
         pass
 
@@ -678,7 +685,7 @@ def _resolve_trakt_movie_id(
         if not val:
             continue
         try:
-            r = requests.get(
+            r = _HTTP.get(
                 f"{TRAKT_API}/search/{k}/{val}",
                 params={"type": "movie", "limit": 1},
                 headers=_headers(cfg),
@@ -713,7 +720,7 @@ def _resolve_trakt_show_id(
         if not val:
             continue
         try:
-            r = requests.get(
+            r = _HTTP.get(
                 f"{TRAKT_API}/search/{k}/{val}",
                 params={"type": "show", "limit": 1},
                 headers=_headers(cfg),
@@ -751,7 +758,7 @@ def _trakt_show_ids_from_imdb_show(
         return {}
 
     try:
-        r = requests.get(
+        r = _HTTP.get(
             f"{TRAKT_API}/search/imdb/{imdb_show}",
             params={"type": "show", "limit": 1},
             headers=_headers(cfg),
@@ -788,7 +795,7 @@ def _guid_search_episode(
         if not val:
             continue
         try:
-            r = requests.get(
+            r = _HTTP.get(
                 f"{TRAKT_API}/search/{key}/{val}",
                 params={"type": "episode", "limit": 1},
                 headers=_headers(cfg),
@@ -821,7 +828,7 @@ def _show_ids_from_episode_hint(
         if not val:
             continue
         try:
-            r = requests.get(
+            r = _HTTP.get(
                 f"{TRAKT_API}/search/{key}/{val}",
                 params={"type": "episode", "limit": 1},
                 headers=_headers(cfg),
@@ -849,7 +856,7 @@ def _title_search_show_ids(
     try:
         if not title:
             return {}
-        r = requests.get(
+        r = _HTTP.get(
             f"{TRAKT_API}/search/show",
             params={"query": title, "limit": 1},
             headers=_headers(cfg),
@@ -895,7 +902,7 @@ def _resolve_trakt_episode_id(
     show_tid = _resolve_trakt_show_id(ids_all, cfg, logger=logger)
     if show_tid and isinstance(s, int) and isinstance(e, int):
         try:
-            r = requests.get(
+            r = _HTTP.get(
                 f"{TRAKT_API}/shows/{show_tid}/seasons/{s}/episodes/{e}",
                 headers=_headers(cfg),
                 timeout=10,
@@ -1108,30 +1115,52 @@ def _rating_payload(
 
 
 
-def process_webhook(
+def precheck_webhook(
     payload: dict[str, Any],
     headers: Mapping[str, str],
     raw: bytes | None = None,
     logger: Callable[..., None] | None = None,
     cfg: dict[str, Any] | None = None,
-    provider_instance: str | None = None,
-) -> dict[str, Any]:
-    cfg = _ensure_scrobble(cfg if isinstance(cfg, dict) else _load_config())
-    provider_instance = str(provider_instance or "default").strip() or "default"
+) -> dict[str, Any] | None:
+    # The request-time part of process_webhook; None means the event can be queued.
+    return _reject_request(payload, headers, raw, logger, cfg if isinstance(cfg, dict) else _load_config())
 
-    sc = cfg.get("scrobble") or {}
+
+def _reject_request(
+    payload: dict[str, Any],
+    headers: Mapping[str, str],
+    raw: bytes | None,
+    logger: Callable[..., None] | None,
+    cfg: dict[str, Any],
+) -> dict[str, Any] | None:
     if not source_enabled(cfg, "webhook"):
         _emit(logger, "scrobble webhook disabled by config", "DEBUG")
         return {"ok": True, "ignored": True}
-
     secret = ((cfg.get("plex") or {}).get("webhook_secret") or "").strip()
     if not _verify_signature(raw, headers, secret):
         _emit(logger, "invalid X-Plex-Signature", "WARN")
         return {"ok": False, "error": "invalid_signature"}
-
     if not payload:
         _emit(logger, "empty payload", "WARN")
         return {"ok": True, "ignored": True}
+    return None
+
+
+def process_webhook(
+    payload: dict[str, Any],
+    headers: Mapping[str, str],
+    raw: bytes | None = None,
+    logger: Callable[..., None] | None = None,
+    cfg: dict[str, Any] | None = None,
+    provider_instance: str | None = None,
+) -> dict[str, Any]:
+    cfg = _ensure_scrobble(cfg if isinstance(cfg, dict) else _load_config())
+    provider_instance = str(provider_instance or "default").strip() or "default"
+
+    sc = cfg.get("scrobble") or {}
+    rejected = _reject_request(payload, headers, raw, logger, cfg)
+    if rejected is not None:
+        return rejected
 
     wh = (sc.get("webhook") or {})
     pause_debounce = int(wh.get("pause_debounce_seconds", _DEF_WEBHOOK["pause_debounce_seconds"]) or 0)
@@ -28,6 +28,7 @@ from cw_platform.anime_mapping.history_coords import (
 from cw_platform.anime_mapping.storage import index_ready as anime_index_ready
 from cw_platform.config_base import CONFIG as CONFIG_DIR, load_config
 from cw_platform.orchestrator._history_rewatches import history_event_present
+from cw_platform.local_db import guard_state
 from cw_platform.local_db.legacy_files import DB_MANAGED_ARTIFACTS
 from cw_platform.modules_registry import get_sync_module_path_by_name, sync_provider_names
 from cw_platform.provider_instances import normalize_instance_id
@@ -404,12 +405,15 @@ def _feature_set(features: Iterable[str] | None = None) -> set[str]:
     return {feature for feature in wanted if feature in _ANALYZER_FEATURES}
 
 
-def _load_main_state(features: Iterable[str] | None = None) -> dict[str, Any]:
+def _load_main_state(features: Iterable[str] | None = None, *, mutable: bool = False) -> dict[str, Any]:
     try:
+        from cw_platform.local_db.frozen import mutable_copy
         from cw_platform.orchestrator._state_store import StateStore
 
         state = StateStore(CONFIG_DIR).load_state_features(_feature_set(features))
-        return state if isinstance(state, dict) else {}
+        if not isinstance(state, dict):
+            return {}
+        return mutable_copy(state) if mutable else state
     except Exception:
         raise HTTPException(500, "Failed to load state")
 
@@ -458,7 +462,12 @@ def _load_state_at(path: Path) -> dict[str, Any]:
         raise HTTPException(500, f"Failed to parse {path.name}")
 
 
-def _load_state_handles(pairs_raw: str | None, features: Iterable[str] | None = None) -> list[dict[str, Any]]:
+def _load_state_handles(
+    pairs_raw: str | None,
+    features: Iterable[str] | None = None,
+    *,
+    mutable: bool = False,
+) -> list[dict[str, Any]]:
     strict_pairs = str(pairs_raw or "").startswith(_STRICT_PAIRS_PREFIX)
     pairs = _parse_pairs_raw(pairs_raw)
     handles: list[dict[str, Any]] = []
@@ -475,7 +484,7 @@ def _load_state_handles(pairs_raw: str | None, features: Iterable[str] | None =
             handles.append({"pair": pid, "safe": safe, "path": path, "state": _load_state_at(path)})
         if handles:
             return handles
-    state = _load_main_state(features)
+    state = _load_main_state(features, mutable=mutable)
     if state.get("providers") or _main_state_db_exists():
         return [{"pair": None, "safe": None, "main": True, "state": state}]
     raise HTTPException(404, "No analyzer state found")
@@ -1552,8 +1561,17 @@ def _cw_state_semantic_diagnostics() -> list[dict[str, Any]]:
     except Exception:
         cooldown_days = 30
     active_pairs = _active_pairs_by_scope(cfg)
-    for path in sorted(CWS_DIR.glob("*.json")):
-        data, err = _json_load_file(path)
+    try:
+        guard_state.import_legacy_files(CONFIG_DIR, CWS_DIR)
+    except Exception:
+        pass
+    artifacts: list[tuple[Path, Any, Any]] = [(path, *_json_load_file(path)) for path in sorted(CWS_DIR.glob("*.json"))]
+    try:
+        for kind in (guard_state.UNRESOLVED, guard_state.FLAP, guard_state.BLACKBOX):
+            artifacts.extend((CWS_DIR / name, data, None) for name, data in guard_state.legacy_views(CONFIG_DIR, kind))
+    except Exception:
+        pass
+    for path, data, err in artifacts:
         if err:
             probs.append(_artifact_problem("error", "cw_state_diagnostic_read_failed", path, "Analyzer could not read this state artifact.", error=err))
             continue
@@ -4445,7 +4463,7 @@ def api_patch(payload: dict[str, Any], pairs: str | None = None, request: Reques
             raise HTTPException(400, f"Missing {f}")
 
     feature = str(payload["feature"]).strip().lower()
-    handles = _load_state_handles(pairs, _ANALYZER_FEATURES)
+    handles = _load_state_handles(pairs, _ANALYZER_FEATURES, mutable=True)
     new_key = str(payload["key"])
     touched = 0
 
@@ -4522,7 +4540,7 @@ def api_fix(payload: dict[str, Any], pairs: str | None = None, request: Request
             raise HTTPException(400, f"Missing {f}")
 
     feature = str(payload["feature"]).strip().lower()
-    handles = _load_state_handles(pairs, _ANALYZER_FEATURES)
+    handles = _load_state_handles(pairs, _ANALYZER_FEATURES, mutable=True)
     touched = 0
     out: dict[str, Any] | None = None
 
@@ -4553,7 +4571,7 @@ def api_edit(payload: dict[str, Any], pairs: str | None = None, request: Request
             raise HTTPException(400, f"Missing {f}")
 
     feature = str(payload["feature"]).strip().lower()
-    handles = _load_state_handles(pairs, _ANALYZER_FEATURES)
+    handles = _load_state_handles(pairs, _ANALYZER_FEATURES, mutable=True)
     new_key = str(payload["key"])
     touched = 0
 
@@ -4611,7 +4629,7 @@ def api_delete(payload: dict[str, Any], pairs: str | None = None, request: Reque
             raise HTTPException(400, f"Missing {f}")
 
     feature = str(payload["feature"]).strip().lower()
-    handles = _load_state_handles(pairs, {feature})
+    handles = _load_state_handles(pairs, {feature}, mutable=True)
     touched = 0
 
     for h in handles:
@@ -5,11 +5,15 @@ from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from pathlib import Path
+import copy
+import json
 import re
 from typing import Any, Iterable, Mapping
 
 from services.activity import list_events
 from cw_platform.provider_instances import normalize_instance_id, provider_display_key
+from cw_platform.ttl_cache import TTLCache
 
 try:
     from _logging import log as _cw_log
@@ -18,6 +22,7 @@ except Exception:  # pragma: no cover
 
 
 _DEFAULT_INSTANCE = "default"
+_WIDGET_LIMITS = {"history": 8, "ratings": 12, "progress": 8}
 _HISTORY_BUCKET_SECONDS = 300
 _METADATA_MANAGER: Any | None = None
 _METADATA_MANAGER_FAILED = False
@@ -846,69 +851,99 @@ def _tracker_feature_items(kind: str) -> dict[str, Any]:
     return dict(items) if isinstance(items, Mapping) else {}
 
 
-def latest_ratings_widget(
-    state: Mapping[str, Any],
-    *,
-    limit: int = 12,
-    tracker_items: Mapping[str, Any] | None = None,
-    user_filter: Mapping[str, Any] | None = None,
-) -> dict[str, Any]:
-    rows: dict[str, dict[str, Any]] = {}
+def _rank_ratings(rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    merged: dict[str, dict[str, Any]] = {}
     aliases: dict[str, str] = {}
-
-    def put(row: dict[str, Any]) -> None:
+    for row in rows:
         key = str(row["key"])
         match_key = key
         for alias in _rating_aliases(row):
             if alias in aliases:
                 match_key = aliases[alias]
                 break
-        prev = rows.get(match_key)
+        prev = merged.get(match_key)
         if prev:
-            rows[match_key] = _merge_rating_row(prev, row)
+            merged[match_key] = _merge_rating_row(prev, row)
         else:
-            rows[match_key] = row
-        for alias in _rating_aliases(rows[match_key]):
+            merged[match_key] = row
+        for alias in _rating_aliases(merged[match_key]):
             aliases[alias] = match_key
+    return sorted(
+        merged.values(),
+        key=lambda x: (
+            int(x.get("sort_epoch") or 0),
+            int(x.get("updated_epoch") or 0),
+            str(x.get("title") or ""),
+        ),
+        reverse=True,
+    )
 
-    for raw_key, raw_item in (tracker_items or {}).items():
+
+def _rating_tracker_rows(items: Mapping[str, Any], *, user_filter: Mapping[str, Any] | None = None) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    for raw_key, raw_item in (items or {}).items():
         item = _unwrap_rating_item(raw_item)
         row = _rating_row(str(raw_key), item, _sources_from_item(item))
         if row:
             if not _sources_match_user(row.get("sources"), user_filter):
                 continue
             row[_RATING_TRACKER_FLAG] = True
-            put(row)
+            out.append(row)
+    return out
+
+
+def _rating_block_rows(provider: str, instance: str, items: Mapping[str, Any]) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    for raw_key, raw_item in items.items():
+        item = _unwrap_rating_item(raw_item)
+        row = _rating_row(str(raw_key), item, [_provider_ref(provider, instance)])
+        if row:
+            out.append(row)
+    return out
 
+
+def _state_block_rows(
+    state: Mapping[str, Any],
+    feature: str,
+    build: Any,
+    *,
+    user_filter: Mapping[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
     providers = state.get("providers") if isinstance(state.get("providers"), Mapping) else {}
     provider_keys = sorted({str(p).upper() for p in providers.keys()}) if isinstance(providers, Mapping) else []
     for provider in provider_keys:
         for instance, block in _provider_blocks(state, provider):
             if not _endpoint_matches_user(provider, instance, user_filter):
                 continue
-            for raw_key, raw_item in _feature_items(block, "ratings").items():
-                item = _unwrap_rating_item(raw_item)
-                row = _rating_row(str(raw_key), item, [_provider_ref(provider, instance)])
-                if not row:
-                    continue
-                put(row)
+            out.extend(build(provider, instance, _feature_items(block, feature)))
+    return out
 
-    items = sorted(
-        rows.values(),
-        key=lambda x: (
-            int(x.get("sort_epoch") or 0),
-            int(x.get("updated_epoch") or 0),
-            str(x.get("title") or ""),
-        ),
-        reverse=True,
-    )
-    cap = max(1, min(int(limit or 12), 24))
-    selected = _resolve_missing_art_rows(
-        items[:cap], size="w300", episode_still=True, backdrop_fallback=True, resolve_art_type=True
-    )
-    for row in selected:
-        row.pop(_RATING_TRACKER_FLAG, None)
-    return {"ok": True, "items": selected, "total": len(items)}
+
+def _widget_payload(widget: str, ranked: list[dict[str, Any]], *, limit: int, total: int) -> dict[str, Any]:
+    cap = max(1, min(int(limit or _WIDGET_LIMITS[widget]), 24))
+    if widget == "ratings":
+        selected = _resolve_missing_art_rows(
+            ranked[:cap], size="w300", episode_still=True, backdrop_fallback=True, resolve_art_type=True
+        )
+        for row in selected:
+            row.pop(_RATING_TRACKER_FLAG, None)
+    else:
+        selected = _resolve_missing_art_rows(ranked[:cap], size="w300", episode_still=True)
+    return {"ok": True, "items": selected, "total": total}
+
+
+def latest_ratings_widget(
+    state: Mapping[str, Any],
+    *,
+    limit: int = 12,
+    tracker_items: Mapping[str, Any] | None = None,
+    user_filter: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    rows = _rating_tracker_rows(tracker_items or {}, user_filter=user_filter)
+    rows.extend(_state_block_rows(state, "ratings", _rating_block_rows, user_filter=user_filter))
+    items = _rank_ratings(rows)
+    return _widget_payload("ratings", items, limit=limit, total=len(items))
 
 
 def _activity_row(event: Mapping[str, Any]) -> dict[str, Any]:
@@ -990,16 +1025,47 @@ def _history_state_row(raw_key: str, item: Mapping[str, Any], sources: list[dict
     }
 
 
+_ALIAS_REPS_CACHE: TTLCache[dict[str, str]] = TTLCache(maxsize=4, ttl=600.0)
+
+
 def _history_alias_representatives() -> dict[str, str]:
+    # Cached on the alias files' mtime/size and the config generation; callers must not mutate the result.
+    try:
+        from cw_platform.config_base import config_generation
+        from services.analyzer import CWS_DIR
+    except Exception:
+        return {}
+    if not CWS_DIR.exists() or not CWS_DIR.is_dir():
+        return {}
+    paths = sorted(CWS_DIR.glob("*history.pair_alias*.json"))
+    files: list[tuple[str, int, int]] = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        files.append((path.name, st.st_mtime_ns, st.st_size))
+    try:
+        gen = config_generation()
+    except Exception:
+        gen = None
+    key = (str(CWS_DIR), gen, tuple(files))
+    hit = _ALIAS_REPS_CACHE.get(key)
+    if hit is not None:
+        return hit
+    out = _read_history_alias_representatives(paths)
+    _ALIAS_REPS_CACHE.set(key, out)
+    return out
+
+
+def _read_history_alias_representatives(paths: list[Path]) -> dict[str, str]:
     try:
         import json
 
         from cw_platform.config_base import load_config
-        from services.analyzer import CWS_DIR, _alias_destination_key, _expected_alias_scopes
+        from services.analyzer import _alias_destination_key, _expected_alias_scopes
     except Exception:
         return {}
-    if not CWS_DIR.exists() or not CWS_DIR.is_dir():
-        return {}
     try:
         expected = _expected_alias_scopes(load_config() or {})
     except Exception:
@@ -1008,7 +1074,7 @@ def _history_alias_representatives() -> dict[str, str]:
         return {}
 
     out: dict[str, str] = {}
-    for path in sorted(CWS_DIR.glob("*history.pair_alias*.json")):
+    for path in paths:
         try:
             doc = json.loads(path.read_text("utf-8"))
         except Exception:
@@ -1058,34 +1124,38 @@ def _history_aliases(row: Mapping[str, Any], alias_map: Mapping[str, str] | None
     return aliases
 
 
-def _latest_history_state_rows(state: Mapping[str, Any], *, user_filter: Mapping[str, Any] | None = None) -> list[dict[str, Any]]:
+def _history_block_rows(provider: str, instance: str, items: Mapping[str, Any]) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    for raw_key, raw_item in items.items():
+        item = _unwrap_history_item(raw_item)
+        row = _history_state_row(str(raw_key), item, [_provider_ref(provider, instance)])
+        if row:
+            out.append(row)
+    return out
+
+
+def _collapse_history_rows(state_rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
     rows: dict[str, dict[str, Any]] = {}
-    providers = state.get("providers") if isinstance(state.get("providers"), Mapping) else {}
-    provider_keys = sorted({str(p).upper() for p in providers.keys()}) if isinstance(providers, Mapping) else []
-    for provider in provider_keys:
-        for instance, block in _provider_blocks(state, provider):
-            if not _endpoint_matches_user(provider, instance, user_filter):
-                continue
-            for raw_key, raw_item in _feature_items(block, "history").items():
-                item = _unwrap_history_item(raw_item)
-                row = _history_state_row(str(raw_key), item, [_provider_ref(provider, instance)])
-                if not row:
-                    continue
-                key = str(row["key"])
-                prev = rows.get(key)
-                if not prev:
-                    rows[key] = row
-                    continue
-                prev_sources = prev.setdefault("sources", [])
-                for src in row.get("sources") or []:
-                    if src not in prev_sources:
-                        prev_sources.append(src)
-                if int(row.get("sort_epoch") or 0) >= int(prev.get("sort_epoch") or 0):
-                    row["sources"] = prev_sources
-                    rows[key] = row
+    for row in state_rows:
+        key = str(row["key"])
+        prev = rows.get(key)
+        if not prev:
+            rows[key] = row
+            continue
+        prev_sources = prev.setdefault("sources", [])
+        for src in row.get("sources") or []:
+            if src not in prev_sources:
+                prev_sources.append(src)
+        if int(row.get("sort_epoch") or 0) >= int(prev.get("sort_epoch") or 0):
+            row["sources"] = prev_sources
+            rows[key] = row
     return sorted(rows.values(), key=lambda x: int(x.get("sort_epoch") or 0), reverse=True)
 
 
+def _latest_history_state_rows(state: Mapping[str, Any], *, user_filter: Mapping[str, Any] | None = None) -> list[dict[str, Any]]:
+    return _collapse_history_rows(_state_block_rows(state, "history", _history_block_rows, user_filter=user_filter))
+
+
 def _latest_history_tracker_rows(items: Mapping[str, Any], *, user_filter: Mapping[str, Any] | None = None) -> list[dict[str, Any]]:
     rows: dict[str, dict[str, Any]] = {}
     for raw_key, raw_item in (items or {}).items():
@@ -1135,12 +1205,10 @@ def recent_history_widget(
     tracker_items: Mapping[str, Any] | None = None,
     user_filter: Mapping[str, Any] | None = None,
 ) -> dict[str, Any]:
-    cap = max(1, min(int(limit or 8), 24))
     state_rows = _latest_history_state_rows(state or {}, user_filter=user_filter)
     tracker_rows = _latest_history_tracker_rows(tracker_items or {}, user_filter=user_filter)
     rows = _merge_history_rows(state_rows, tracker_rows, alias_map=_history_alias_representatives())
-    selected = _resolve_missing_art_rows(rows[:cap], size="w300", episode_still=True)
-    return {"ok": True, "items": selected, "total": len(rows)}
+    return _widget_payload("history", rows, limit=limit, total=len(rows))
 
 
 def recent_scrobble_widget(*, limit: int = 8, user_filter: Mapping[str, Any] | None = None) -> dict[str, Any]:
@@ -1255,46 +1323,48 @@ def _progress_row(raw_key: str, item: Mapping[str, Any], sources: list[dict[str,
     }
 
 
-def recent_progress_widget(
-    state: Mapping[str, Any] | None = None,
-    *,
-    limit: int = 8,
-    tracker_items: Mapping[str, Any] | None = None,
-    user_filter: Mapping[str, Any] | None = None,
-) -> dict[str, Any]:
-    rows: dict[str, dict[str, Any]] = {}
-
-    def put(row: dict[str, Any]) -> None:
+def _rank_progress(rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    merged: dict[str, dict[str, Any]] = {}
+    for row in rows:
         key = str(row.get("key") or row.get("id") or "")
         if not key:
-            return
-        prev = rows.get(key)
-        rows[key] = _merge_media_row(prev, row, sort_key="sort_epoch") if prev else row
+            continue
+        prev = merged.get(key)
+        merged[key] = _merge_media_row(prev, row, sort_key="sort_epoch") if prev else row
+    return sorted(merged.values(), key=lambda x: int(x.get("sort_epoch") or 0), reverse=True)
+
 
-    for raw_key, raw_item in (tracker_items or {}).items():
+def _progress_tracker_rows(items: Mapping[str, Any], *, user_filter: Mapping[str, Any] | None = None) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    for raw_key, raw_item in (items or {}).items():
         item = raw_item if isinstance(raw_item, Mapping) else {}
         row = _progress_row(str(raw_key), item, _sources_from_item(item))
+        if row and _sources_match_user(row.get("sources"), user_filter):
+            out.append(row)
+    return out
+
+
+def _progress_block_rows(provider: str, instance: str, items: Mapping[str, Any]) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    for raw_key, raw_item in items.items():
+        item = raw_item if isinstance(raw_item, Mapping) else {}
+        row = _progress_row(str(raw_key), item, [_provider_ref(provider, instance)])
         if row:
-            if not _sources_match_user(row.get("sources"), user_filter):
-                continue
-            put(row)
+            out.append(row)
+    return out
 
-    providers = (state or {}).get("providers") if isinstance((state or {}).get("providers"), Mapping) else {}
-    provider_keys = sorted({str(p).upper() for p in providers.keys()}) if isinstance(providers, Mapping) else []
-    for provider in provider_keys:
-        for instance, block in _provider_blocks(state or {}, provider):
-            if not _endpoint_matches_user(provider, instance, user_filter):
-                continue
-            for raw_key, raw_item in _feature_items(block, "progress").items():
-                item = raw_item if isinstance(raw_item, Mapping) else {}
-                row = _progress_row(str(raw_key), item, [_provider_ref(provider, instance)])
-                if row:
-                    put(row)
 
-    items = sorted(rows.values(), key=lambda x: int(x.get("sort_epoch") or 0), reverse=True)
-    cap = max(1, min(int(limit or 8), 24))
-    selected = _resolve_missing_art_rows(items[:cap], size="w300", episode_still=True)
-    return {"ok": True, "items": selected, "total": len(items)}
+def recent_progress_widget(
+    state: Mapping[str, Any] | None = None,
+    *,
+    limit: int = 8,
+    tracker_items: Mapping[str, Any] | None = None,
+    user_filter: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    rows = _progress_tracker_rows(tracker_items or {}, user_filter=user_filter)
+    rows.extend(_state_block_rows(state or {}, "progress", _progress_block_rows, user_filter=user_filter))
+    items = _rank_progress(rows)
+    return _widget_payload("progress", items, limit=limit, total=len(items))
 
 
 def recent_playlists_widget(*, limit: int = 8, user_filter: Mapping[str, Any] | None = None) -> dict[str, Any]:
@@ -1313,8 +1383,205 @@ def recent_playlists_widget(*, limit: int = 8, user_filter: Mapping[str, Any] |
     return {"ok": True, "items": rows, "total": len(rows)}
 
 
+_TRACKER_PROVIDER = "CROSSWATCH"
+_VIEW_CACHE: TTLCache[tuple[Any, ...]] = TTLCache(maxsize=64, ttl=600.0)
+
+
+def _views_base(base_path: str | Path | None = None) -> Path:
+    if base_path is not None:
+        return Path(base_path)
+    from cw_platform.config_base import CONFIG
+
+    return Path(CONFIG)
+
+
+def _row_key(row: Mapping[str, Any]) -> str:
+    return str(row.get("key") or row.get("id") or "")
+
+
+def _state_view_rows(widget: str, provider: str, instance: str, items: Mapping[str, Any]) -> list[dict[str, Any]]:
+    if widget == "ratings":
+        return _rank_ratings(_rating_block_rows(provider, instance, items))
+    if widget == "history":
+        return _collapse_history_rows(_history_block_rows(provider, instance, items))
+    return _rank_progress(_progress_block_rows(provider, instance, items))
+
+
+def _tracker_view_rows(widget: str, items: Mapping[str, Any]) -> list[dict[str, Any]]:
+    if widget == "ratings":
+        return _rank_ratings(_rating_tracker_rows(items))
+    if widget == "history":
+        return _latest_history_tracker_rows(items)
+    return _rank_progress(_progress_tracker_rows(items))
+
+
+def _tracker_signature(kind: str) -> str:
+    try:
+        from services.editor import _state_path
+
+        st = _state_path(kind).stat()  # type: ignore[arg-type]
+    except OSError:
+        return "missing"
+    except Exception:
+        return "unknown"
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def refresh_dashboard_views(base_path: str | Path | None = None) -> int:
+    """Rebuild the stale top-K view segments; returns how many were rebuilt.
+
+    State segments are marked stale by the local state store whenever a
+    history/ratings/progress block changes. Tracker segments follow the
+    tracker file signature, so scrobble and rating writes are picked up
+    without a hook in every writer.
+    """
+    from cw_platform.local_db import dashboard_views as views
+    from cw_platform.local_db import state as sqlite_state
+
+    base = _views_base(base_path)
+    views.ensure_schema(base)
+    built = 0
+    for seg in views.stale_segments(base, origin="state"):
+        widget = str(seg["widget"])
+        provider, instance = str(seg["provider"]), str(seg["instance"])
+        ref = _provider_ref(provider, instance)
+        ranked = _state_view_rows(widget, provider, instance, sqlite_state.load_feature_items(base, provider, instance, widget))
+        views.replace_segment(
+            base,
+            widget,
+            "state",
+            provider,
+            instance,
+            rows=((ref["provider"], ref["instance"], _row_key(row), row) for row in ranked),
+            totals={(ref["provider"], ref["instance"]): len(ranked)} if ranked else {},
+            version=seg["source_version"],
+        )
+        built += 1
+    for widget in views.WIDGETS:
+        sig = _tracker_signature(widget)
+        if views.built_version(base, widget, "tracker", _TRACKER_PROVIDER, _DEFAULT_INSTANCE) == sig:
+            continue
+        ranked = _tracker_view_rows(widget, _tracker_feature_items(widget))
+        entries: list[tuple[str, str, str, Mapping[str, Any]]] = []
+        totals: dict[tuple[str, str], int] = {}
+        for row in ranked:
+            for src in row.get("sources") or []:
+                if not isinstance(src, Mapping):
+                    continue
+                endpoint = (str(src.get("provider") or ""), str(src.get("instance") or _DEFAULT_INSTANCE))
+                entries.append((endpoint[0], endpoint[1], _row_key(row), row))
+                totals[endpoint] = totals.get(endpoint, 0) + 1
+        views.replace_segment(
+            base,
+            widget,
+            "tracker",
+            _TRACKER_PROVIDER,
+            _DEFAULT_INSTANCE,
+            rows=entries,
+            totals=totals,
+            version=sig,
+        )
+        built += 1
+    return built
+
+
+def _filter_key(user_filter: Mapping[str, Any] | None) -> str:
+    filt = _normalize_user_filter(user_filter)
+    return json.dumps({k: sorted(v) for k, v in sorted(filt.items())}) if filt else ""
+
+
+def _ranked_view(widget: str, base: Path, user_filter: Mapping[str, Any] | None) -> tuple[list[dict[str, Any]], int] | None:
+    from cw_platform.local_db import dashboard_views as views
+
+    version = views.view_version(base)
+    if version is None:
+        return None
+    alias_map = _history_alias_representatives() if widget == "history" else {}
+    cache_key = (str(base), widget, _filter_key(user_filter))
+    stamp = (version, hash(tuple(sorted(alias_map.items()))))
+    hit = _VIEW_CACHE.get(cache_key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1], hit[2]
+
+    entries = views.load_rows(base, widget)
+    if entries is None:
+        return None
+    state_rows: list[dict[str, Any]] = []
+    tracker_rows: list[dict[str, Any]] = []
+    tracker_seen: set[str] = set()
+    for entry in entries:
+        if not _endpoint_matches_user(entry["provider"], entry["instance"], user_filter):
+            continue
+        if entry["origin"] == "tracker":
+            if entry["key"] in tracker_seen:
+                continue
+            tracker_seen.add(entry["key"])
+            tracker_rows.append(entry["row"])
+        else:
+            state_rows.append(entry["row"])
+
+    if widget == "ratings":
+        ranked = _rank_ratings([*tracker_rows, *state_rows])
+    elif widget == "history":
+        tracker_rows.sort(key=lambda x: int(x.get("sort_epoch") or 0), reverse=True)
+        ranked = _merge_history_rows(_collapse_history_rows(state_rows), tracker_rows, alias_map=alias_map)
+    else:
+        ranked = _rank_progress([*tracker_rows, *state_rows])
+
+    # Only the top rows are kept per endpoint, so the exact post-merge count is
+    # unknown; the busiest matching endpoint is the closest cheap estimate.
+    total = len(ranked)
+    for row in views.load_totals(base, widget):
+        if _endpoint_matches_user(row["provider"], row["instance"], user_filter):
+            total = max(total, int(row["total"] or 0))
+    _VIEW_CACHE.set(cache_key, (stamp, ranked, total))
+    return ranked, total
+
+
+def materialized_widget(
+    widget: str,
+    *,
+    limit: int | None = None,
+    user_filter: Mapping[str, Any] | None = None,
+    base_path: str | Path | None = None,
+) -> dict[str, Any] | None:
+    """Serve a state widget from the top-K views; ``None`` when the local DB is unavailable."""
+    base = _views_base(base_path)
+    try:
+        refresh_dashboard_views(base)
+        view = _ranked_view(widget, base, user_filter)
+    except Exception as e:
+        if _cw_log is not None:
+            _cw_log(f"dashboard {widget} view failed: {e}", level="WARNING", module="DASH")
+        return None
+    if view is None:
+        return None
+    ranked, total = view
+    cap = max(1, min(int(limit or _WIDGET_LIMITS[widget]), 24))
+    return _widget_payload(widget, copy.deepcopy(ranked[:cap]), limit=cap, total=total)
+
+
+def _state_widget(
+    widget: str,
+    state: Mapping[str, Any] | None,
+    *,
+    limit: int,
+    user_filter: Mapping[str, Any] | None,
+    base_path: str | Path | None,
+) -> dict[str, Any]:
+    if state is None:
+        payload = materialized_widget(widget, limit=limit, user_filter=user_filter, base_path=base_path)
+        if payload is not None:
+            return payload
+        from cw_platform.orchestrator._state_store import StateStore
+
+        state = StateStore(_views_base(base_path)).load_state_features({widget})
+    build = {"history": recent_history_widget, "ratings": latest_ratings_widget, "progress": recent_progress_widget}[widget]
+    return build(state, limit=limit, tracker_items=_tracker_feature_items(widget), user_filter=user_filter)
+
+
 def dashboard_widgets_payload(
-    state: Mapping[str, Any],
+    state: Mapping[str, Any] | None,
     *,
     history_limit: int = 8,
     ratings_limit: int = 12,
@@ -1323,7 +1590,13 @@ def dashboard_widgets_payload(
     playlists_limit: int = 8,
     include: set[str] | None = None,
     user_filter: Mapping[str, Any] | None = None,
+    base_path: str | Path | None = None,
 ) -> dict[str, Any]:
+    """Build the dashboard widgets.
+
+    With ``state=None`` the history, ratings and progress widgets are read from
+    the materialized top-K views instead of walking the full state.
+    """
     requested = {str(key).strip().lower() for key in include} if include is not None else {
         "history",
         "ratings",
@@ -1333,27 +1606,18 @@ def dashboard_widgets_payload(
     }
     payload: dict[str, Any] = {"ok": True}
     if "history" in requested:
-        payload["recent_history"] = recent_history_widget(
-            state,
-            limit=history_limit,
-            tracker_items=_tracker_feature_items("history"),
-            user_filter=user_filter,
+        payload["recent_history"] = _state_widget(
+            "history", state, limit=history_limit, user_filter=user_filter, base_path=base_path
         )
     if "scrobble" in requested:
         payload["recent_scrobble"] = recent_scrobble_widget(limit=scrobble_limit, user_filter=user_filter)
     if "ratings" in requested:
-        payload["latest_ratings"] = latest_ratings_widget(
-            state,
-            limit=ratings_limit,
-            tracker_items=_tracker_feature_items("ratings"),
-            user_filter=user_filter,
+        payload["latest_ratings"] = _state_widget(
+            "ratings", state, limit=ratings_limit, user_filter=user_filter, base_path=base_path
         )
     if "progress" in requested:
-        payload["recent_progress"] = recent_progress_widget(
-            state,
-            limit=progress_limit,
-            tracker_items=_tracker_feature_items("progress"),
-            user_filter=user_filter,
+        payload["recent_progress"] = _state_widget(
+            "progress", state, limit=progress_limit, user_filter=user_filter, base_path=base_path
         )
     if "playlists" in requested:
         payload["recent_playlists"] = recent_playlists_widget(limit=playlists_limit, user_filter=user_filter)
@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from io import BytesIO
 from pathlib import Path, PurePosixPath, PureWindowsPath
 from typing import Any, IO, Literal, cast
@@ -21,6 +21,9 @@ from cw_platform.provider_instances import get_provider_block, normalize_instanc
 Kind = Literal["watchlist", "history", "ratings", "progress"]
 
 _JSON_FILE_SUFFIX = ".json"
+_JOURNAL_SUFFIX = ".journal.jsonl"
+_JOURNAL_CHECKPOINT_EVERY = 16
+_MISSING = object()
 
 def _tracker_base_root(cfg: Mapping[str, Any]) -> Path:
     node = cfg.get("crosswatch") if isinstance(cfg, Mapping) else {}
@@ -180,16 +183,114 @@ def _snapshot_meta_for_file(path: Path, kind: Kind) -> dict[str, Any]:
         "size": path.stat().st_size,
     }
 
+def _journal_path(kind: Kind, provider_instance: Any = None) -> Path:
+    return _snapshots_dir(provider_instance) / f"{kind}{_JOURNAL_SUFFIX}"
+
+
+def _read_journal(kind: Kind, provider_instance: Any = None) -> list[dict[str, Any]]:
+    path = _journal_path(kind, provider_instance)
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except Exception:
+        return []
+    out: list[dict[str, Any]] = []
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except Exception:
+            continue
+        if isinstance(entry, dict) and entry.get("name"):
+            out.append(entry)
+    return out
+
+
+def _write_journal(kind: Kind, entries: list[dict[str, Any]], provider_instance: Any = None) -> None:
+    path = _journal_path(kind, provider_instance)
+    if not entries:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        return
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            for entry in entries:
+                handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(tmp_name, path)
+    except Exception:
+        try:
+            os.unlink(tmp_name)
+        except Exception:
+            pass
+        raise
+
+
+def _file_stamp(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _items_delta(old: Mapping[str, Any], new: Mapping[str, Any]) -> tuple[dict[str, Any], list[str]]:
+    changed = {k: v for k, v in new.items() if old.get(k, _MISSING) != v}
+    removed = [k for k in old if k not in new]
+    return changed, removed
+
+
+def _replay_journal(kind: Kind, entries: list[dict[str, Any]], upto: int, provider_instance: Any = None) -> dict[str, Any] | None:
+    start = next((i for i in range(upto, -1, -1) if entries[i].get("checkpoint")), None)
+    if start is None:
+        return None
+    try:
+        data = json.loads(_resolve_snapshot_name(str(entries[start]["name"]), provider_instance).read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    items = data.get("items") if isinstance(data, dict) else None
+    items = dict(items) if isinstance(items, dict) else {}
+    for entry in entries[start:upto]:
+        for key in entry.get("del") or []:
+            items.pop(key, None)
+        items.update(entry.get("set") or {})
+    return {"items": items, "ts": entries[upto].get("state_ts")}
+
+
+def _snapshot_meta_for_entry(entry: Mapping[str, Any], kind: Kind) -> dict[str, Any]:
+    name = str(entry.get("name") or "")
+    dt = _parse_ts_from_name(name) or datetime.fromtimestamp(int(entry.get("ts") or 0), tz=timezone.utc)
+    return {
+        "name": name,
+        "kind": kind,
+        "ts": int(dt.timestamp()),
+        "iso": dt.isoformat(),
+        "size": int(entry.get("size") or 0),
+        "delta": True,
+    }
+
+
 def list_snapshots(kind: Kind, provider_instance: Any = None) -> list[dict[str, Any]]:
     snaps_dir = _snapshots_dir(provider_instance)
     suffix = f"-{kind}.json"
     items: list[tuple[int, dict[str, Any]]] = []
+    seen: set[str] = set()
     for p in snaps_dir.glob(f"*{suffix}"):
         try:
             meta = _snapshot_meta_for_file(p, kind)
             items.append((meta["ts"], meta))
+            seen.add(p.name)
         except Exception:
             continue
+    for entry in _read_journal(kind, provider_instance):
+        if entry.get("checkpoint") or str(entry["name"]) in seen:
+            continue
+        try:
+            meta = _snapshot_meta_for_entry(entry, kind)
+        except Exception:
+            continue
+        items.append((meta["ts"], meta))
+        seen.add(meta["name"])
     items.sort(key=lambda t: t[0], reverse=True)
     return [m for _, m in items]
 
@@ -203,28 +304,91 @@ def _snapshot_limits(provider_instance: Any = None) -> tuple[int, int]:
     retention_days = int(cw.get("retention_days", 30) or 0)
     return max_snaps, retention_days
 
-def _make_snapshot(kind: Kind, provider_instance: Any = None) -> None:
+def _snapshot_name(kind: Kind, taken: list[dict[str, Any]]) -> str:
+    # Names stay unique and in save order, so journal replay order matches the listing.
+    dt = datetime.now(timezone.utc).replace(microsecond=0)
+    newest = max((int(m["ts"]) for m in taken), default=None)
+    if newest is not None and newest >= int(dt.timestamp()):
+        dt = datetime.fromtimestamp(newest, tz=timezone.utc) + timedelta(seconds=1)
+    return dt.strftime("%Y%m%dT%H%M%SZ") + f"-{kind}.json"
+
+def _make_snapshot(kind: Kind, provider_instance: Any = None, name: str | None = None) -> str | None:
     if not _snapshot_enabled(provider_instance):
-        return
+        return None
     path = _state_path(kind, provider_instance)
     if not path.exists():
-        return
+        return None
     try:
         payload = path.read_text(encoding="utf-8")
     except Exception:
-        return
+        return None
     if not payload:
-        return
+        return None
 
-    dt = datetime.now(timezone.utc)
-    name = dt.strftime("%Y%m%dT%H%M%SZ") + f"-{kind}.json"
+    if name is None:
+        name = _snapshot_name(kind, list_snapshots(kind, provider_instance))
     snaps_dir = _snapshots_dir(provider_instance)
     dest = snaps_dir / name
     try:
         dest.write_text(payload, encoding="utf-8")
     except Exception:
+        return None
+    return name
+
+def _journal_snapshot(kind: Kind, old: Mapping[str, Any], new: Mapping[str, Any], provider_instance: Any = None) -> dict[str, Any] | None:
+    """Record the pre-save state as a journal entry; a full checkpoint file is only written
+    every _JOURNAL_CHECKPOINT_EVERY saves or when the state file changed outside save_state."""
+    if not _snapshot_enabled(provider_instance):
+        return None
+    path = _state_path(kind, provider_instance)
+    stamp = _file_stamp(path)
+    if stamp is None or not stamp[0]:
+        return None
+    entries = _read_journal(kind, provider_instance)
+    since = next((n for n, e in enumerate(reversed(entries)) if e.get("checkpoint")), None)
+    name = _snapshot_name(kind, list_snapshots(kind, provider_instance))
+    checkpoint = (
+        not entries
+        or entries[-1].get("after") != stamp
+        or since is None
+        or since + 1 >= _JOURNAL_CHECKPOINT_EVERY
+    )
+    if checkpoint and _make_snapshot(kind, provider_instance, name=name) is None:
+        return None
+    changed, removed = _items_delta(old, new)
+    return {
+        "name": name,
+        "ts": int(datetime.now(timezone.utc).timestamp()),
+        "state_ts": None,
+        "checkpoint": checkpoint,
+        "set": changed,
+        "del": removed,
+    }
+
+def _materialize_entry(kind: Kind, entries: list[dict[str, Any]], index: int, provider_instance: Any = None) -> bool:
+    state = _replay_journal(kind, entries, index, provider_instance)
+    if state is None:
+        return False
+    try:
+        _write_json_atomic(_resolve_snapshot_name(str(entries[index]["name"]), provider_instance), state)
+    except Exception:
+        return False
+    entries[index]["checkpoint"] = True
+    return True
+
+def _detach_journal_entry(kind: Kind, name: str, provider_instance: Any = None) -> None:
+    """Drop the journal entry called ``name`` before a file of that name is imported,
+    rebasing the entry after it so later snapshots no longer replay through it."""
+    entries = _read_journal(kind, provider_instance)
+    index = next((i for i, e in enumerate(entries) if str(e["name"]) == name), None)
+    if index is None:
         return
-    _enforce_snapshot_retention(kind, provider_instance)
+    nxt = index + 1
+    if nxt < len(entries) and not entries[nxt].get("checkpoint"):
+        if not _materialize_entry(kind, entries, nxt, provider_instance):
+            entries = entries[:nxt]
+    del entries[index]
+    _write_journal(kind, entries, provider_instance)
 
 def _enforce_snapshot_retention(kind: Kind, provider_instance: Any = None) -> None:
     max_snaps, retention_days = _snapshot_limits(provider_instance)
@@ -242,6 +406,18 @@ def _enforce_snapshot_retention(kind: Kind, provider_instance: Any = None) -> No
         keep = keep[:max_snaps]
 
     keep_set = set(keep)
+    entries = _read_journal(kind, provider_instance)
+    # Journal entries retire a whole checkpoint segment at a time, so a segment whose
+    # newest entries are still kept holds on to its older ones instead of being rebased.
+    first = next((i for i, e in enumerate(entries) if str(e["name"]) in keep_set), len(entries))
+    start = next((i for i in range(min(first, len(entries) - 1), -1, -1) if entries[i].get("checkpoint")), None)
+    if start is None:
+        start = next((i for i in range(first, len(entries)) if entries[i].get("checkpoint")), len(entries))
+    if start:
+        entries = entries[start:]
+        _write_journal(kind, entries, provider_instance)
+    keep_set.update(str(e["name"]) for e in entries)
+
     snaps_dir = _snapshots_dir(provider_instance)
     suffix = f"-{kind}.json"
     for p in snaps_dir.glob(f"*{suffix}"):
@@ -251,6 +427,13 @@ def _enforce_snapshot_retention(kind: Kind, provider_instance: Any = None) -> No
             except Exception:
                 continue
 
+def _read_state_file(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        data = {}
+    return data if isinstance(data, dict) else {}
+
 def load_state(kind: Kind | None = None, snapshot: str | None = None, provider_instance: Any = None) -> dict[str, Any]:
     if kind is None:
         kind_val: Kind = "watchlist"
@@ -259,12 +442,16 @@ def load_state(kind: Kind | None = None, snapshot: str | None = None, provider_i
     else:
         raise ValueError(f"Unsupported kind: {kind!r}")
 
-    path = _selected_snapshot_path(kind_val, snapshot, provider_instance)
-
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        data = {}
+    data: dict[str, Any] | None = None
+    if snapshot:
+        target = _validated_json_filename(snapshot, label="snapshot name")
+        entries = _read_journal(kind_val, provider_instance)
+        for i in range(len(entries) - 1, -1, -1):
+            if str(entries[i]["name"]) == target and not entries[i].get("checkpoint"):
+                data = _replay_journal(kind_val, entries, i, provider_instance) or {}
+                break
+    if data is None:
+        data = _read_state_file(_selected_snapshot_path(kind_val, snapshot, provider_instance))
 
     items = data.get("items") or {}
     if not isinstance(items, dict):
@@ -283,17 +470,29 @@ def save_state(kind: Kind | None, items: dict[str, Any], provider_instance: Any
     else:
         raise ValueError(f"Unsupported kind: {kind!r}")
 
-    _make_snapshot(kind_val, provider_instance)
+    path = _state_path(kind_val, provider_instance)
+    previous = _read_state_file(path)
+    old_items = previous.get("items") if isinstance(previous.get("items"), dict) else {}
+    entry = _journal_snapshot(kind_val, old_items, items or {}, provider_instance)
 
     state = {
         "items": items or {},
         "ts": int(datetime.now(timezone.utc).timestamp()),
     }
-    path = _state_path(kind_val, provider_instance)
     try:
         _write_json_atomic(path, state)
     except Exception:
-        pass
+        return state
+    if entry is not None:
+        entry["state_ts"] = previous.get("ts") if isinstance(previous.get("ts"), int) else None
+        entry["after"] = _file_stamp(path)
+        entry["size"] = len(json.dumps(entry["set"], ensure_ascii=False)) + len(json.dumps(entry["del"]))
+        try:
+            with _journal_path(kind_val, provider_instance).open("a", encoding="utf-8") as handle:
+                handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except Exception:
+            return state
+        _enforce_snapshot_retention(kind_val, provider_instance)
     return state
 
 TrackerImportStats = dict[str, Any]
@@ -304,7 +503,7 @@ def export_tracker_zip(provider_instance: Any = None) -> bytes:
 
     buf = BytesIO()
     with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for path in root.rglob("*.json"):
+        for path in [*root.rglob("*.json"), *root.rglob(f"*{_JOURNAL_SUFFIX}")]:
             try:
                 rel = path.relative_to(root)
             except ValueError:
@@ -421,6 +620,8 @@ def import_tracker_json(payload: bytes, filename: str, provider_instance: Any =
 
     dest.parent.mkdir(parents=True, exist_ok=True)
     existed = dest.exists()
+    if target == "snapshot" and kind is not None:
+        _detach_journal_entry(kind, dest.name, provider_instance)
     _write_json_atomic(dest, state)
 
     if target == "snapshot" and kind is not None:
@@ -3,15 +3,23 @@
 # Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
 from __future__ import annotations
 
+import asyncio
+import codecs
 import csv
 import hashlib
 import io
 import json
+import os
+import re
+import tempfile
 import time
 import zipfile
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import date as dt_date, datetime, timezone
-from typing import Any, Literal, cast
+from itertools import islice
+from typing import IO, Any, Literal, cast
 
 from fastapi import APIRouter, Body, File, Form, HTTPException, Query, Request, UploadFile
 from fastapi.responses import JSONResponse
@@ -20,7 +28,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from cw_platform.access_policy import request_user, user_can_access_instance
 from cw_platform.config_base import load_config
 from cw_platform.history_events import history_sync_key
-from cw_platform.id_map import canonical_key, coalesce_ids, minimal as id_minimal
+from cw_platform.id_map import canonical_key, coalesce_ids, ids_from, minimal as id_minimal, unified_keys_from_ids
 from cw_platform.modules_registry import load_sync_ops
 from cw_platform.provider_instances import (
     build_provider_config_view,
@@ -39,6 +47,10 @@ MAX_ZIP_TOTAL_BYTES = 60 * 1024 * 1024
 MAX_ROWS = 50_000
 MAX_PREVIEW_ROWS = 500
 PREVIEW_TTL_SECONDS = 30 * 60
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+TEXT_SNIFF_BYTES = 64 * 1024
+JSON_READ_CHARS = 256 * 1024
+MATCH_BATCH_SIZE = 500
 ALLOWED_EXTENSIONS = {".zip", ".json", ".csv", ".txt"}
 IMPORT_SOURCES = {"auto", "trakt", "letterboxd", "simkl", "imdb", "tvtime", "yamtrack", "generic"}
 FEATURES = {"history", "ratings", "watchlist"}
@@ -88,8 +100,12 @@ ERROR_PREVIEW_NOT_FOUND = "import_preview_not_found"
 ERROR_NO_ROWS = "import_no_rows"
 ERROR_TARGET_UNAVAILABLE = "import_target_unavailable"
 ERROR_SOURCE_MISMATCH = "import_source_mismatch"
+ERROR_PROGRESS_NOT_FOUND = "import_progress_not_found"
 
 _PREVIEWS: dict[str, dict[str, Any]] = {}
+_PROGRESS: dict[str, dict[str, Any]] = {}
+_PROGRESS_ID_RE = re.compile(r"^[A-Za-z0-9_-]{8,64}$")
+_JSON_WS_RE = re.compile(r"[ \t\n\r]*")
 
 SOURCE_EXPECTATIONS: dict[str, dict[str, Any]] = {
     "trakt": {
@@ -198,6 +214,63 @@ class ImportCommitRequest(BaseModel):
     features: list[str] = Field(default_factory=lambda: ["history", "ratings", "watchlist"])
     media_types: list[str] = Field(default_factory=lambda: list(DEFAULT_MEDIA_TYPES))
     include_existing: bool = False
+    progress_id: str = Field(default="", max_length=64)
+
+
+@dataclass(frozen=True)
+class _ImportMember:
+    name: str
+    opener: Callable[[], IO[bytes]]
+    size: int = 0
+
+    def open(self) -> IO[bytes]:
+        return self.opener()
+
+    def head(self, size: int = 2048) -> bytes:
+        with self.open() as fh:
+            return fh.read(size)
+
+    def read(self) -> bytes:
+        with self.open() as fh:
+            return fh.read()
+
+
+class _ImportProgress:
+    def __init__(self, progress_id: str, kind: str, target_instance: str) -> None:
+        now = time.time()
+        self.state: dict[str, Any] = {
+            "id": progress_id,
+            "kind": kind,
+            "target_instance": target_instance,
+            "stage": "upload",
+            "files_total": 0,
+            "files_done": 0,
+            "rows": 0,
+            "ready": 0,
+            "exists": 0,
+            "applied": 0,
+            "done": False,
+            "error": None,
+            "started_at": now,
+            "updated_at": now,
+        }
+        if progress_id:
+            _PROGRESS[progress_id] = self.state
+
+    def update(self, **fields: Any) -> None:
+        self.state.update(fields)
+        self.state["updated_at"] = time.time()
+
+    def finish(self, error: str | None = None) -> None:
+        self.update(stage="error" if error else "done", done=True, error=error)
+
+    def snapshot(self) -> dict[str, Any]:
+        return dict(self.state)
+
+
+def _start_progress(progress_id: str, kind: str, target_instance: str) -> _ImportProgress:
+    pid = str(progress_id or "").strip()
+    return _ImportProgress(pid if _PROGRESS_ID_RE.match(pid) else "", kind, target_instance)
 
 
 def _clean_cache() -> None:
@@ -205,6 +278,9 @@ def _clean_cache() -> None:
     stale = [key for key, value in _PREVIEWS.items() if now - float(value.get("created_at") or 0) > PREVIEW_TTL_SECONDS]
     for key in stale:
         _PREVIEWS.pop(key, None)
+    stale = [key for key, value in _PROGRESS.items() if now - float(value.get("updated_at") or 0) > PREVIEW_TTL_SECONDS]
+    for key in stale:
+        _PROGRESS.pop(key, None)
 
 
 def _api_error(code: str, status_code: int = 400, detail: str | None = None, **extra: Any) -> HTTPException:
@@ -272,9 +348,25 @@ def _matches_expected_file(source: str, name: str) -> bool:
     return True
 
 
-def _validate_source_files(source: str, files: list[tuple[str, bytes]], *, requested: str) -> dict[str, Any]:
+def _as_members(files: Iterable[_ImportMember | tuple[str, bytes]]) -> list[_ImportMember]:
+    out: list[_ImportMember] = []
+    for entry in files:
+        if isinstance(entry, _ImportMember):
+            out.append(entry)
+            continue
+        name, data = entry
+        out.append(_ImportMember(str(name or ""), lambda data=data: io.BytesIO(data), len(data)))
+    return out
+
+
+def _validate_source_files(
+    source: str,
+    files: Iterable[_ImportMember | tuple[str, bytes]],
+    *,
+    requested: str,
+) -> dict[str, Any]:
     src = str(source or "").lower()
-    names = [str(name or "") for name, _data in files]
+    names = [member.name for member in _as_members(files)]
     expected = _expected_files(src)
     matched = [name for name in names if _matches_expected_file(src, name)]
     warnings: list[str] = []
@@ -294,23 +386,35 @@ def _validate_source_files(source: str, files: list[tuple[str, bytes]], *, reque
     return {"source": src, "expected_files": expected, "matched_files": matched, "warnings": warnings}
 
 
-async def _read_upload(file: UploadFile) -> bytes:
+async def _spool_upload(file: UploadFile) -> str:
     name = str(file.filename or "").strip()
     ext = _suffix(name)
     if ext not in ALLOWED_EXTENSIONS:
         raise _api_error(ERROR_UNSUPPORTED_FILE_TYPE, detail="Upload a ZIP, JSON or CSV export.")
 
-    chunks: list[bytes] = []
+    fd, path = tempfile.mkstemp(prefix="cw-import-", suffix=ext)
     total = 0
-    while True:
-        chunk = await file.read(1024 * 1024)
-        if not chunk:
-            break
-        total += len(chunk)
-        if total > MAX_UPLOAD_BYTES:
-            raise _api_error(ERROR_FILE_TOO_LARGE, detail="The import file is too large.")
-        chunks.append(chunk)
-    return b"".join(chunks)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_BYTES)
+                if not chunk:
+                    break
+                total += len(chunk)
+                if total > MAX_UPLOAD_BYTES:
+                    raise _api_error(ERROR_FILE_TOO_LARGE, detail="The import file is too large.")
+                out.write(chunk)
+    except BaseException:
+        _discard_spool(path)
+        raise
+    return path
+
+
+def _discard_spool(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
 
 
 def _decode_text(data: bytes) -> str:
@@ -324,55 +428,153 @@ def _decode_text(data: bytes) -> str:
     raise _api_error(ERROR_PARSE_FAILED, detail="Could not decode the export file.")
 
 
+def _member_document(member: _ImportMember) -> str:
+    if member.size > MAX_TEXT_BYTES:
+        raise _api_error(ERROR_FILE_TOO_LARGE, detail="Text exports must be 8 MB or smaller.")
+    return _decode_text(member.read())
+
+
+def _member_encoding(member: _ImportMember) -> str:
+    # Sniff the whole member in chunks; a bad byte past any fixed window must still flip it to latin-1.
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        with member.open() as fh:
+            while chunk := fh.read(TEXT_SNIFF_BYTES):
+                decoder.decode(chunk)
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return "latin-1"
+    return "utf-8-sig"
+
+
+@contextmanager
+def _member_text(member: _ImportMember) -> Iterator[IO[str]]:
+    text = io.TextIOWrapper(member.open(), encoding=_member_encoding(member), newline="")
+    try:
+        yield text
+    finally:
+        text.close()
+
+
+def _zip_member_infos(zf: zipfile.ZipFile) -> list[zipfile.ZipInfo]:
+    out: list[zipfile.ZipInfo] = []
+    total_size = 0
+    infos = [info for info in zf.infolist() if not info.is_dir()]
+    if len(infos) > MAX_ZIP_FILES:
+        raise _api_error(ERROR_ZIP_TOO_MANY_FILES, detail="The ZIP contains too many files.")
+    for info in infos:
+        if info.flag_bits & 0x1:
+            raise _api_error(ERROR_ZIP_ENCRYPTED, detail="Encrypted ZIP files are not supported.")
+        ext = _suffix(str(info.filename or ""))
+        if ext not in {".csv", ".json", ".txt"}:
+            continue
+        if info.file_size > MAX_ZIP_MEMBER_BYTES:
+            raise _api_error(ERROR_ZIP_TOO_LARGE, detail="A file inside the ZIP is too large.")
+        total_size += int(info.file_size or 0)
+        if total_size > MAX_ZIP_TOTAL_BYTES:
+            raise _api_error(ERROR_ZIP_TOO_LARGE, detail="The ZIP expands to too much data.")
+        out.append(info)
+    if not out:
+        raise _api_error(ERROR_ZIP_UNSUPPORTED_MEMBER, detail="The ZIP did not contain supported CSV or JSON files.")
+    return out
+
+
+def _zip_members(zf: zipfile.ZipFile) -> list[_ImportMember]:
+    try:
+        infos = _zip_member_infos(zf)
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise _api_error(ERROR_PARSE_FAILED, detail="The ZIP file could not be parsed.") from exc
+    return [
+        _ImportMember(str(info.filename or ""), lambda info=info: zf.open(info), int(info.file_size or 0))
+        for info in infos
+    ]
+
+
 def _safe_zip_members(data: bytes) -> list[tuple[str, bytes]]:
     if not zipfile.is_zipfile(io.BytesIO(data)):
         raise _api_error(ERROR_PARSE_FAILED, detail="The ZIP file could not be opened.")
-
-    out: list[tuple[str, bytes]] = []
-    total_size = 0
     try:
         with zipfile.ZipFile(io.BytesIO(data)) as zf:
-            infos = [info for info in zf.infolist() if not info.is_dir()]
-            if len(infos) > MAX_ZIP_FILES:
-                raise _api_error(ERROR_ZIP_TOO_MANY_FILES, detail="The ZIP contains too many files.")
-            for info in infos:
-                if info.flag_bits & 0x1:
-                    raise _api_error(ERROR_ZIP_ENCRYPTED, detail="Encrypted ZIP files are not supported.")
-                name = str(info.filename or "")
-                ext = _suffix(name)
-                if ext not in {".csv", ".json", ".txt"}:
-                    continue
-                if info.file_size > MAX_ZIP_MEMBER_BYTES:
-                    raise _api_error(ERROR_ZIP_TOO_LARGE, detail="A file inside the ZIP is too large.")
-                total_size += int(info.file_size or 0)
-                if total_size > MAX_ZIP_TOTAL_BYTES:
-                    raise _api_error(ERROR_ZIP_TOO_LARGE, detail="The ZIP expands to too much data.")
-                out.append((name, zf.read(info)))
+            return [(member.name, member.read()) for member in _zip_members(zf)]
     except HTTPException:
         raise
     except Exception as exc:
         raise _api_error(ERROR_PARSE_FAILED, detail="The ZIP file could not be parsed.") from exc
 
-    if not out:
-        raise _api_error(ERROR_ZIP_UNSUPPORTED_MEMBER, detail="The ZIP did not contain supported CSV or JSON files.")
-    return out
 
+@contextmanager
+def _spooled_members(path: str, filename: str) -> Iterator[list[_ImportMember]]:
+    if not zipfile.is_zipfile(path):
+        yield [_ImportMember(filename, lambda: open(path, "rb"), os.path.getsize(path))]
+        return
+    try:
+        zf = zipfile.ZipFile(path)
+    except Exception as exc:
+        raise _api_error(ERROR_PARSE_FAILED, detail="The ZIP file could not be opened.") from exc
+    with zf:
+        yield _zip_members(zf)
 
-def _csv_rows(text: str) -> list[dict[str, Any]]:
-    sample = text[:4096]
+
+def _csv_rows(text: IO[str]) -> Iterator[dict[str, Any]]:
+    sample = text.read(4096)
     try:
         dialect = csv.Sniffer().sniff(sample)
     except Exception:
         dialect = csv.excel
-    reader = csv.DictReader(io.StringIO(text), dialect=dialect)
-    rows: list[dict[str, Any]] = []
-    for row in reader:
-        if len(rows) >= MAX_ROWS:
-            break
+    text.seek(0)
+    reader = csv.DictReader(text, dialect=dialect)
+    for row in islice(reader, MAX_ROWS):
         if not isinstance(row, Mapping):
             continue
-        rows.append({str(k or "").strip(): v for k, v in row.items() if str(k or "").strip()})
-    return rows
+        yield {str(k or "").strip(): v for k, v in row.items() if str(k or "").strip()}
+
+
+def _json_array_items(text: IO[str], buf: str, pos: int) -> Iterator[Any]:
+    decoder = json.JSONDecoder()
+    eof = False
+    while True:
+        match = _JSON_WS_RE.match(buf, pos)
+        pos = match.end() if match else pos
+        if pos >= len(buf):
+            if eof:
+                raise ValueError("unterminated JSON array")
+            chunk = text.read(JSON_READ_CHARS)
+            eof = not chunk
+            buf, pos = buf[pos:] + chunk, 0
+            continue
+        if buf[pos] == "]":
+            return
+        if buf[pos] == ",":
+            pos += 1
+            continue
+        try:
+            value, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            end = -1
+        if end < 0 or (end >= len(buf) and not eof):
+            chunk = text.read(JSON_READ_CHARS)
+            eof = not chunk
+            buf, pos = buf[pos:] + chunk, 0
+            continue
+        yield value
+        pos = end
+
+
+def _json_member_rows(member: _ImportMember) -> Iterator[Mapping[str, Any]]:
+    with _member_text(member) as text:
+        head = text.read(JSON_READ_CHARS)
+        match = _JSON_WS_RE.match(head)
+        pos = match.end() if match else 0
+        if head[pos : pos + 1] == "[":
+            for row in _json_array_items(text, head, pos + 1):
+                if isinstance(row, Mapping):
+                    yield row
+            return
+    yield from _json_rows(json.loads(_member_document(member)))
 
 
 def _json_rows(data: Any) -> Iterable[Mapping[str, Any]]:
@@ -842,18 +1044,19 @@ def _tvtime_track_row(raw: Mapping[str, Any]) -> tuple[dict[str, Any], str] | No
     )
 
 
-def _tvtime_gdpr_expand(path: str, rows: list[dict[str, Any]]) -> list[tuple[str, Mapping[str, Any], str | None]] | None:
+def _is_tvtime_gdpr_file(path: str) -> bool:
     base = _base_name(path)
-    if not (base.startswith(TVTIME_TRACKING_PREFIX) or base in TVTIME_GDPR_FILES):
-        return None
-    out: list[tuple[str, Mapping[str, Any], str | None]] = []
+    return base.startswith(TVTIME_TRACKING_PREFIX) or base in TVTIME_GDPR_FILES
+
 
+def _tvtime_gdpr_expand(path: str, rows: Iterable[Mapping[str, Any]]) -> Iterator[tuple[str, Mapping[str, Any], str | None]]:
+    base = _base_name(path)
     if base.startswith(TVTIME_TRACKING_PREFIX):
         for raw in rows:
             built = _tvtime_track_row(raw)
             if built:
-                out.append((path, built[0], built[1]))
-        return out
+                yield path, built[0], built[1]
+        return
 
     if base == TVTIME_FOLLOW_FILE:
         for raw in rows:
@@ -862,12 +1065,12 @@ def _tvtime_gdpr_expand(path: str, rows: list[dict[str, Any]]) -> list[tuple[str
             active = _first(row, ["active"])
             if not title or (active is not None and not _as_bool(active)):
                 continue
-            out.append((path, {"type": "show", "title": title, "ids": _tvtime_show_ids(title), "listed_at": _first(row, ["created_at"])}, "watchlist"))
-        return out
+            yield path, {"type": "show", "title": title, "ids": _tvtime_show_ids(title), "listed_at": _first(row, ["created_at"])}, "watchlist"
+        return
 
     is_movie_ratings = base in TVTIME_MOVIE_RATING_FILES
     if not is_movie_ratings and base not in TVTIME_EPISODE_RATING_FILES:
-        return out
+        return
 
     for raw in rows:
         row = _lower_map(raw)
@@ -879,43 +1082,84 @@ def _tvtime_gdpr_expand(path: str, rows: list[dict[str, Any]]) -> list[tuple[str
         if is_movie_ratings:
             title = str(_first(row, ["movie_name"]) or "").strip()
             if title:
-                out.append((path, {"type": "movie", "title": title, "rating": rating, "rated_at": when}, "ratings"))
+                yield path, {"type": "movie", "title": title, "rating": rating, "rated_at": when}, "ratings"
             continue
         series_title = str(_first(row, ["series_name", "tv_show_name"]) or "").strip()
         season = _first(row, ["season_number"])
         episode = _first(row, ["episode_number"])
         if not series_title or season in (None, "") or episode in (None, ""):
             continue
-        out.append(
-            (
-                path,
-                {
-                    "type": "episode",
-                    "series_title": series_title,
-                    "season": season,
-                    "episode": episode,
-                    "show_ids": _tvtime_show_ids(series_title),
-                    "rating": rating,
-                    "rated_at": when,
-                },
-                "ratings",
-            )
+        yield (
+            path,
+            {
+                "type": "episode",
+                "series_title": series_title,
+                "season": season,
+                "episode": episode,
+                "show_ids": _tvtime_show_ids(series_title),
+                "rating": rating,
+                "rated_at": when,
+            },
+            "ratings",
         )
-    return out
 
 
-def _parse_files(source: str, files: list[tuple[str, bytes]]) -> list[dict[str, Any]]:
-    parsed: list[dict[str, Any]] = []
-    trakt_has_history = source == "trakt" and any(_base_name(path).startswith("watched-history-") for path, _data in files)
+def _member_rows(source: str, member: _ImportMember) -> Iterator[tuple[str, Mapping[str, Any], str | None]]:
+    path = member.name
+    ext = _suffix(path)
+    if ext == ".csv":
+        with _member_text(member) as text:
+            csv_rows = _csv_rows(text)
+            if source == "tvtime" and _is_tvtime_gdpr_file(path):
+                yield from _tvtime_gdpr_expand(path, csv_rows)
+            else:
+                for row in csv_rows:
+                    yield path, row, None
+        return
+    if ext not in {".json", ".txt"}:
+        return
+    if ext == ".json" and source not in {"simkl", "tvtime"}:
+        for row in _json_member_rows(member):
+            yield path, row, None
+        return
+    text = _member_document(member)
+    try:
+        loaded = json.loads(text)
+    except Exception:
+        if ext == ".txt":
+            return
+        raise
+    if source == "simkl":
+        yield from _simkl_expand(loaded)
+    elif source == "tvtime":
+        yield from _tvtime_expand(loaded, path)
+    else:
+        for row in _json_rows(loaded):
+            yield path, row, None
+
+
+def _iter_parsed(
+    source: str,
+    members: list[_ImportMember],
+    progress: _ImportProgress | None = None,
+) -> Iterator[dict[str, Any]]:
+    emitted = 0
+    trakt_has_history = source == "trakt" and any(_base_name(member.name).startswith("watched-history-") for member in members)
 
-    letterboxd_has_diary = source == "letterboxd" and any(_base_name(path) == "diary.csv" for path, _data in files)
+    letterboxd_has_diary = source == "letterboxd" and any(_base_name(member.name) == "diary.csv" for member in members)
     letterboxd_seen: set[str] = set()
     if letterboxd_has_diary:
         priority = {"diary.csv": 0, "ratings.csv": 1, "watchlist.csv": 2, "watched.csv": 3}
-        files = sorted(files, key=lambda item: priority.get(_base_name(item[0]), 4))
+        members = sorted(members, key=lambda member: priority.get(_base_name(member.name), 4))
 
-    for path, data in files:
-        base_name = _base_name(path)
+    if progress:
+        progress.update(stage="parsing", files_total=len(members), files_done=0)
+    for done, member in enumerate(members):
+        if emitted >= MAX_ROWS:
+            break
+        if progress:
+            progress.update(files_done=done, current_file=member.name)
+        base_name = _base_name(member.name)
         if letterboxd_has_diary and base_name == "reviews.csv":
             continue
         if source == "trakt":
@@ -939,28 +1183,8 @@ def _parse_files(source: str, files: list[tuple[str, bytes]]) -> list[dict[str,
                 continue
             if trakt_has_history and base_name.startswith(("watched-movies-", "watched-shows")):
                 continue
-        rows: list[tuple[str, Mapping[str, Any], str | None]] = []
-        ext = _suffix(path)
-        if ext == ".csv":
-            csv_rows = _csv_rows(_decode_text(data))
-            expanded = _tvtime_gdpr_expand(path, csv_rows) if source == "tvtime" else None
-            rows = expanded if expanded is not None else [(path, row, None) for row in csv_rows]
-        elif ext in {".json", ".txt"}:
-            text = _decode_text(data)
-            try:
-                loaded = json.loads(text)
-            except Exception:
-                if ext == ".txt":
-                    continue
-                raise
-            if source == "simkl":
-                rows = _simkl_expand(loaded)
-            elif source == "tvtime":
-                rows = _tvtime_expand(loaded, path)
-            else:
-                rows = [(path, row, None) for row in _json_rows(loaded)]
-        for row_path, row, hint in rows:
-            if len(parsed) >= MAX_ROWS:
+        for row_path, row, hint in _member_rows(source, member):
+            if emitted >= MAX_ROWS:
                 break
             feature, item = _minimal_item(row_path, row, source, hint)
             if not feature:
@@ -972,19 +1196,28 @@ def _parse_files(source: str, files: list[tuple[str, bytes]]) -> list[dict[str,
                         continue
                 else:
                     letterboxd_seen.add(base)
-            parsed.append({"source_path": row_path, "feature": feature, "item": item})
+            emitted += 1
+            yield {"source_path": row_path, "feature": feature, "item": item}
             if feature in {"history", "watchlist"} and item.get("rating") not in (None, ""):
-                parsed.append({"source_path": row_path, "feature": "ratings", "item": item})
-    return parsed
+                emitted += 1
+                yield {"source_path": row_path, "feature": "ratings", "item": item}
+    if progress:
+        progress.update(files_done=len(members), current_file=None)
+
 
+def _parse_files(source: str, files: Iterable[_ImportMember | tuple[str, bytes]]) -> list[dict[str, Any]]:
+    return list(_iter_parsed(source, _as_members(files)))
 
-def _detect_source(requested: str, filename: str, files: list[tuple[str, bytes]]) -> str:
+
+def _detect_source(requested: str, filename: str, files: Iterable[_ImportMember | tuple[str, bytes]]) -> str:
     wanted = str(requested or "auto").strip().lower()
     if wanted in IMPORT_SOURCES and wanted != "auto":
         return wanted
-    hay = " ".join([filename, *(name for name, _ in files)]).lower()
-    sample = " ".join((data[:2048].decode("utf-8", "ignore") for _name, data in files[:5])).lower()
-    if "letterboxd" in hay or any(name.lower().endswith(("watched.csv", "diary.csv")) for name, _ in files):
+    members = _as_members(files)
+    names = [member.name for member in members]
+    hay = " ".join([filename, *names]).lower()
+    sample = " ".join(member.head(2048).decode("utf-8", "ignore") for member in members[:5]).lower()
+    if "letterboxd" in hay or any(name.lower().endswith(("watched.csv", "diary.csv")) for name in names):
         return "letterboxd"
     if "simkl" in hay:
         return "simkl"
@@ -993,7 +1226,7 @@ def _detect_source(requested: str, filename: str, files: list[tuple[str, bytes]]
     if (
         "tvtime" in hay
         or "tv-time" in hay
-        or any(_base_name(name).startswith(TVTIME_TRACKING_PREFIX) or _base_name(name) in TVTIME_GDPR_FILES for name, _ in files)
+        or any(_is_tvtime_gdpr_file(name) for name in names)
         or "series_tvdb_id" in sample
         or "is_watched" in sample
     ):
@@ -1057,7 +1290,7 @@ def _existing_keys(cfg: Mapping[str, Any], instance: str) -> dict[str, Any]:
             if feature == "history":
                 view["_cw_history_rewatches"] = True
             idx = ops.build_index(view, feature=feature) or {}
-            out[feature] = {str(k): dict(v or {}) for k, v in idx.items()}
+            out[feature] = {str(k): v if isinstance(v, Mapping) else {} for k, v in idx.items()}
         except Exception:
             out[feature] = set()
     return out
@@ -1075,6 +1308,38 @@ def _existing_item(existing: Mapping[str, Any], feature: str, key: str) -> Mappi
     return None
 
 
+def _id_tokens(item: Mapping[str, Any]) -> set[str]:
+    media_type = str(item.get("type") or "").lower()
+    return {f"{media_type}|{token}" for token in unified_keys_from_ids(ids_from(item))}
+
+
+class _ExistingIndex:
+    def __init__(self, existing: Mapping[str, Any]) -> None:
+        self.existing = existing
+        self.tokens: dict[str, dict[str, str]] = {}
+        for feature in ("ratings", "watchlist"):
+            bucket = existing.get(feature)
+            if not isinstance(bucket, Mapping):
+                continue
+            tokens: dict[str, str] = {}
+            for key, item in bucket.items():
+                if isinstance(item, Mapping):
+                    for token in _id_tokens(item):
+                        tokens.setdefault(token, key)
+            self.tokens[feature] = tokens
+
+    def match(self, feature: str, key: str, item: Mapping[str, Any]) -> Mapping[str, Any] | None:
+        found = _existing_item(self.existing, feature, key)
+        tokens = self.tokens.get(feature)
+        if found is not None or not tokens:
+            return found
+        for token in _id_tokens(item):
+            other = tokens.get(token)
+            if other is not None:
+                return _existing_item(self.existing, feature, other)
+        return None
+
+
 def _same_rating(a: Any, b: Any) -> bool:
     ra = _rating(a)
     rb = _rating(b)
@@ -1102,55 +1367,75 @@ def _display_title(item: Mapping[str, Any], key: str = "") -> str:
     return str(series_title or title or key or "").strip()
 
 
-def _shape_rows(raw_rows: list[dict[str, Any]], cfg: Mapping[str, Any], target_instance: str, source: str) -> list[dict[str, Any]]:
-    existing = _existing_keys(cfg, target_instance)
+def _shape_row(index: _ExistingIndex, seen: set[tuple[str, str]], i: int, row: Mapping[str, Any], source: str) -> dict[str, Any]:
+    feature = str(row.get("feature") or "").lower()
+    item = dict(row.get("item") or {})
+    media_type = str(item.get("type") or "").lower()
+    key = _key_for(feature, item) if feature in FEATURES else ""
+    status = STATUS_READY
+    reason = ""
+    if feature not in FEATURES:
+        status, reason = STATUS_UNSUPPORTED, "unsupported_feature"
+    elif media_type not in MEDIA_TYPES:
+        status, reason = STATUS_UNSUPPORTED, "unsupported_media_type"
+    elif not key or key == "unknown:":
+        status, reason = STATUS_MISSING_IDENTITY, "missing_identity"
+    elif feature == "history" and not item.get("watched_at"):
+        status, reason = STATUS_INVALID, "missing_watched_at"
+    elif feature == "ratings" and item.get("rating") in (None, ""):
+        status, reason = STATUS_INVALID, "missing_rating"
+    elif (feature, key) in seen:
+        status, reason = STATUS_DUPLICATE, "duplicate_in_file"
+    else:
+        existing_item = index.match(feature, key, item)
+        if existing_item is not None:
+            if feature == "ratings" and not _same_rating(item.get("rating"), existing_item.get("rating")):
+                reason = "rating_update"
+            else:
+                status, reason = STATUS_EXISTS, "already_exists"
+    seen.add((feature, key))
+    title = _display_title(item, key)
+    row_id = hashlib.sha256(f"{source}|{feature}|{key}|{i}".encode("utf-8")).hexdigest()[:16]
+    return {
+        "id": row_id,
+        "feature": feature,
+        "media_type": media_type,
+        "title": title,
+        "year": item.get("year"),
+        "key": key,
+        "status": status,
+        "reason": reason,
+        "default_included": status == STATUS_READY,
+        "importable": status in (STATUS_READY, STATUS_EXISTS),
+        "source_path": row.get("source_path"),
+        "item": item,
+    }
+
+
+def _shape_rows(
+    raw_rows: Iterable[Mapping[str, Any]],
+    cfg: Mapping[str, Any],
+    target_instance: str,
+    source: str,
+    progress: _ImportProgress | None = None,
+) -> list[dict[str, Any]]:
+    index: _ExistingIndex | None = None
     seen: set[tuple[str, str]] = set()
     rows: list[dict[str, Any]] = []
-    for i, row in enumerate(raw_rows):
-        feature = str(row.get("feature") or "").lower()
-        item = dict(row.get("item") or {})
-        media_type = str(item.get("type") or "").lower()
-        key = _key_for(feature, item) if feature in FEATURES else ""
-        status = STATUS_READY
-        reason = ""
-        if feature not in FEATURES:
-            status, reason = STATUS_UNSUPPORTED, "unsupported_feature"
-        elif media_type not in MEDIA_TYPES:
-            status, reason = STATUS_UNSUPPORTED, "unsupported_media_type"
-        elif not key or key == "unknown:":
-            status, reason = STATUS_MISSING_IDENTITY, "missing_identity"
-        elif feature == "history" and not item.get("watched_at"):
-            status, reason = STATUS_INVALID, "missing_watched_at"
-        elif feature == "ratings" and item.get("rating") in (None, ""):
-            status, reason = STATUS_INVALID, "missing_rating"
-        elif (feature, key) in seen:
-            status, reason = STATUS_DUPLICATE, "duplicate_in_file"
-        else:
-            existing_item = _existing_item(existing, feature, key)
-            if existing_item is not None:
-                if feature == "ratings" and not _same_rating(item.get("rating"), existing_item.get("rating")):
-                    reason = "rating_update"
-                else:
-                    status, reason = STATUS_EXISTS, "already_exists"
-        seen.add((feature, key))
-        title = _display_title(item, key)
-        row_id = hashlib.sha256(f"{source}|{feature}|{key}|{i}".encode("utf-8")).hexdigest()[:16]
-        rows.append(
-            {
-                "id": row_id,
-                "feature": feature,
-                "media_type": media_type,
-                "title": title,
-                "year": item.get("year"),
-                "key": key,
-                "status": status,
-                "reason": reason,
-                "default_included": status == STATUS_READY,
-                "importable": status in (STATUS_READY, STATUS_EXISTS),
-                "source_path": row.get("source_path"),
-                "item": item,
-            }
-        )
+    ready = exists = 0
+    it = iter(raw_rows)
+    while batch := list(islice(it, MATCH_BATCH_SIZE)):
+        if index is None:
+            if progress:
+                progress.update(stage="indexing")
+            index = _ExistingIndex(_existing_keys(cfg, target_instance))
+        for row in batch:
+            shaped = _shape_row(index, seen, len(rows), row, source)
+            ready += shaped["status"] == STATUS_READY
+            exists += shaped["status"] == STATUS_EXISTS
+            rows.append(shaped)
+        if progress:
+            progress.update(stage="matching", rows=len(rows), ready=ready, exists=exists)
     return rows
 
 
@@ -1293,11 +1578,34 @@ def api_import_options(request: Request = cast(Request, None)) -> dict[str, Any]
     }
 
 
+def _build_preview(
+    path: str,
+    filename: str,
+    requested: str,
+    cfg: Mapping[str, Any],
+    instance: str,
+    progress: _ImportProgress,
+) -> dict[str, Any]:
+    with _spooled_members(path, filename) as members:
+        detected = _detect_source(requested, filename, members)
+        validation = _validate_source_files(detected, members, requested=requested)
+        try:
+            rows = _shape_rows(_iter_parsed(detected, members, progress), cfg, instance, detected, progress)
+        except HTTPException:
+            raise
+        except Exception as exc:
+            raise _api_error(ERROR_PARSE_FAILED, detail="Could not parse this export.") from exc
+    if not rows:
+        raise _api_error(ERROR_NO_ROWS, detail="No importable rows were found.")
+    return {"source": detected, "validation": validation, "rows": rows}
+
+
 @router.post("/preview", response_class=JSONResponse)
 async def api_import_preview(
     file: UploadFile = File(...),
     source: str = Form("auto"),
     target_instance: str = Form("default"),
+    progress_id: str = Form(""),
     request: Request = cast(Request, None),
 ) -> dict[str, Any]:
     _clean_cache()
@@ -1308,22 +1616,24 @@ async def api_import_preview(
     cfg = load_config() or {}
     if not user_can_access_instance(cfg, request_user(request), "CROSSWATCH", instance):
         raise _api_error(ERROR_TARGET_UNAVAILABLE, status_code=403, detail="profile_scope_denied")
-    data = await _read_upload(file)
+    progress = _start_progress(progress_id, "preview", instance)
     filename = str(file.filename or "upload").strip()
-    files = _safe_zip_members(data) if zipfile.is_zipfile(io.BytesIO(data)) else [(filename, data)]
-    detected = _detect_source(requested, filename, files)
-    validation = _validate_source_files(detected, files, requested=requested)
     try:
-        raw_rows = _parse_files(detected, files)
-    except HTTPException:
+        path = await _spool_upload(file)
+        try:
+            size = os.path.getsize(path)
+            built = await asyncio.to_thread(_build_preview, path, filename, requested, cfg, instance, progress)
+        finally:
+            _discard_spool(path)
+    except HTTPException as exc:
+        detail = exc.detail if isinstance(exc.detail, Mapping) else {}
+        progress.finish(str(detail.get("code") or ERROR_PARSE_FAILED))
         raise
-    except Exception as exc:
-        raise _api_error(ERROR_PARSE_FAILED, detail="Could not parse this export.") from exc
-    if not raw_rows:
-        raise _api_error(ERROR_NO_ROWS, detail="No importable rows were found.")
 
-    rows = _shape_rows(raw_rows, cfg, instance, detected)
-    import_id = hashlib.sha256(f"{time.time_ns()}|{filename}|{len(data)}".encode("utf-8")).hexdigest()[:32]
+    rows = built["rows"]
+    detected = built["source"]
+    validation = built["validation"]
+    import_id = hashlib.sha256(f"{time.time_ns()}|{filename}|{size}".encode("utf-8")).hexdigest()[:32]
     _PREVIEWS[import_id] = {
         "created_at": time.time(),
         "source": detected,
@@ -1332,6 +1642,8 @@ async def api_import_preview(
         "validation": validation,
         "rows": rows,
     }
+    progress.update(import_id=import_id)
+    progress.finish()
     filtered = _filtered_rows(rows, features=set(), media_types=set(), status="ready", q="")
     return {
         "ok": True,
@@ -1344,9 +1656,22 @@ async def api_import_preview(
         "rows": _public_rows(filtered, 200, 0),
         "total": len(rows),
         "filtered_total": len(filtered),
+        "progress": progress.snapshot(),
     }
 
 
+@router.get("/progress/{progress_id}", response_class=JSONResponse)
+def api_import_progress(progress_id: str, request: Request = cast(Request, None)) -> dict[str, Any]:
+    _clean_cache()
+    state = _PROGRESS.get(progress_id)
+    if not state:
+        raise _api_error(ERROR_PROGRESS_NOT_FOUND, status_code=404, detail="No import is running under this id.")
+    cfg = load_config() or {}
+    if not user_can_access_instance(cfg, request_user(request), "CROSSWATCH", state.get("target_instance") or "default"):
+        raise _api_error(ERROR_TARGET_UNAVAILABLE, status_code=403, detail="profile_scope_denied")
+    return {"ok": True, **state}
+
+
 @router.get("/preview/{import_id}", response_class=JSONResponse)
 def api_import_preview_rows(
     import_id: str,
@@ -1399,6 +1724,7 @@ def api_import_commit(payload: ImportCommitRequest = Body(...), request: Request
     if not _target_connected(cfg, instance):
         raise _api_error(ERROR_TARGET_UNAVAILABLE, status_code=503, detail="Connect the CrossWatch tracker before importing.")
     cfg_view = build_provider_config_view(cfg, "CROSSWATCH", instance)
+    progress = _start_progress(payload.progress_id, "commit", instance)
     wanted_features = {str(f).strip() for f in payload.features if str(f).strip() in FEATURES}
     wanted_media = {str(m).strip() for m in payload.media_types if str(m).strip() in MEDIA_TYPES}
     selected = {str(x).strip() for x in payload.row_ids if str(x).strip()}
@@ -1429,6 +1755,7 @@ def api_import_commit(payload: ImportCommitRequest = Body(...), request: Request
     results: dict[str, Any] = {}
     applied = 0
     unresolved_total = 0
+    progress.update(stage="writing", rows=len(rows) - skipped)
     for feature in ("watchlist", "history", "ratings"):
         items = grouped.get(feature) or []
         if not items:
@@ -1436,12 +1763,20 @@ def api_import_commit(payload: ImportCommitRequest = Body(...), request: Request
         view = dict(cfg_view)
         if feature == "history":
             view["_cw_history_rewatches"] = True
-        res = ops.add(view, items, feature=feature)
+        progress.update(current_feature=feature)
+        try:
+            res = ops.add(view, items, feature=feature)
+        except Exception:
+            progress.finish("import_commit_failed")
+            raise
         result = dict(res) if isinstance(res, Mapping) else {"ok": bool(res)}
         unresolved = result.get("unresolved")
         applied += int(result.get("count") or 0)
         unresolved_total += len(unresolved) if isinstance(unresolved, (list, tuple)) else 0
         results[feature] = result
+        progress.update(applied=applied)
+    progress.update(current_feature=None)
+    progress.finish()
 
     return {
         "ok": unresolved_total == 0,
@@ -3,7 +3,7 @@
 # Copyright (c) 2025-2026 CrossWatch / Cenodude
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass as dc_dataclass, field
+from dataclasses import asdict, dataclass as dc_dataclass, field, fields
 from typing import Any, Mapping
 
 
@@ -113,6 +113,11 @@ class PlaybackRecord:
         data["provider_metadata"] = clean_mapping(self.provider_metadata)
         return data
 
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "PlaybackRecord":
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
 
 @dc_dataclass
 class PlaybackActionResult:
@@ -162,3 +167,14 @@ class PlaybackListResult:
             "retryable": self.retryable,
             "remote_status": self.remote_status,
         }
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["items"] = [item.to_dict() for item in self.items]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "PlaybackListResult":
+        names = {f.name for f in fields(cls)} - {"items"}
+        items = [PlaybackRecord.from_dict(item) for item in data.get("items") or [] if isinstance(item, Mapping)]
+        return cls(items=items, **{k: v for k, v in data.items() if k in names})
@@ -3,32 +3,24 @@
 # Copyright (c) 2025-2026 CrossWatch / Cenodude
 from __future__ import annotations
 
+import importlib
 import math
 import re
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, wait
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
 from datetime import datetime, timedelta, timezone
-from typing import Any, Mapping, cast
+from pathlib import Path
+from typing import Any, Iterator, Mapping, cast
 
 from _logging import log as BASE_LOG
 from cw_platform.config_base import load_config, save_config
 from cw_platform.id_map import canonical_key, minimal as id_minimal
+from cw_platform.local_db import playback_progress as progress_store
 from cw_platform.orchestrator._progress_completion import progress_caps_from_ops, progress_write_completion_policy
 from cw_platform.provider_instances import build_provider_config_view, get_instance_block, get_provider_block, list_instance_ids, normalize_instance_id
 
 from .adapters.base import PlaybackProgressAdapter, configured_label
-from .adapters.crosswatch import CrossWatchPlaybackAdapter
-from .adapters.floppy import FloppyPlaybackAdapter
-from .adapters.media_servers import EmbyPlaybackAdapter, JellyfinPlaybackAdapter, KodiPlaybackAdapter, PlexPlaybackAdapter
-from .adapters.mdblist import MDBListPlaybackAdapter
-from .adapters.nuvio import NuvioPlaybackAdapter
-from .adapters.publicmetadb import PublicMetaDBPlaybackAdapter
-from .adapters.punchplay import PunchPlayPlaybackAdapter
-from .adapters.scrob import ScrobPlaybackAdapter
-from .adapters.simkl import SimklPlaybackAdapter
-from .adapters.stremio import StremioPlaybackAdapter
-from .adapters.trakt import TraktPlaybackAdapter
 from .models import PlaybackActionResult, PlaybackCapabilities, PlaybackListResult, clean_mapping, utc_now_iso
 
 
@@ -822,26 +814,51 @@ def _enrich_list_error(error: dict[str, Any], cap: PlaybackCapabilities | None)
     return out
 
 
+# Adapters import their provider's sync module, so each one is only loaded the
+# first time its provider is listed or written to.
+_ADAPTERS: dict[str, tuple[str, str]] = {
+    "trakt": (".adapters.trakt", "TraktPlaybackAdapter"),
+    "simkl": (".adapters.simkl", "SimklPlaybackAdapter"),
+    "mdblist": (".adapters.mdblist", "MDBListPlaybackAdapter"),
+    "publicmetadb": (".adapters.publicmetadb", "PublicMetaDBPlaybackAdapter"),
+    "plex": (".adapters.media_servers", "PlexPlaybackAdapter"),
+    "emby": (".adapters.media_servers", "EmbyPlaybackAdapter"),
+    "jellyfin": (".adapters.media_servers", "JellyfinPlaybackAdapter"),
+    "nuvio": (".adapters.nuvio", "NuvioPlaybackAdapter"),
+    "kodi": (".adapters.media_servers", "KodiPlaybackAdapter"),
+    "stremio": (".adapters.stremio", "StremioPlaybackAdapter"),
+    "floppy": (".adapters.floppy", "FloppyPlaybackAdapter"),
+    "punchplay": (".adapters.punchplay", "PunchPlayPlaybackAdapter"),
+    "scrob": (".adapters.scrob", "ScrobPlaybackAdapter"),
+    "crosswatch": (".adapters.crosswatch", "CrossWatchPlaybackAdapter"),
+}
+
+
+class _AdapterRegistry(dict):
+    def __missing__(self, provider: str) -> PlaybackProgressAdapter:
+        spec = _ADAPTERS.get(provider)
+        if spec is None:
+            raise KeyError(provider)
+        cls = getattr(importlib.import_module(spec[0], __package__), spec[1])
+        return self.setdefault(provider, cls())
+
+    def get(self, provider: str, default: Any = None) -> Any:  # type: ignore[override]
+        try:
+            return self[provider]
+        except KeyError:
+            return default
+
+
 class PlaybackProgressService:
-    def __init__(self) -> None:
-        self.adapters: dict[str, PlaybackProgressAdapter] = {
-            "trakt": TraktPlaybackAdapter(),
-            "simkl": SimklPlaybackAdapter(),
-            "mdblist": MDBListPlaybackAdapter(),
-            "publicmetadb": PublicMetaDBPlaybackAdapter(),
-            "plex": PlexPlaybackAdapter(),
-            "emby": EmbyPlaybackAdapter(),
-            "jellyfin": JellyfinPlaybackAdapter(),
-            "nuvio": NuvioPlaybackAdapter(),
-            "kodi": KodiPlaybackAdapter(),
-            "stremio": StremioPlaybackAdapter(),
-            "floppy": FloppyPlaybackAdapter(),
-            "punchplay": PunchPlayPlaybackAdapter(),
-            "scrob": ScrobPlaybackAdapter(),
-            "crosswatch": CrossWatchPlaybackAdapter(),
-        }
+    def __init__(self, *, persist: bool = False, store_path: str | Path | None = None) -> None:
+        self.adapters: dict[str, PlaybackProgressAdapter] = _AdapterRegistry()
         self._cache: dict[tuple[str, str, str], dict[str, Any]] = {}
         self._lock = threading.RLock()
+        self._persist = persist
+        self._store_path = store_path
+        self._hydrated = not persist
+        self._inflight: dict[tuple[str, str, str], Future[PlaybackListResult]] = {}
+        self._pool: ThreadPoolExecutor | None = None
 
     def _adapter(self, provider: str) -> PlaybackProgressAdapter | None:
         provider_key = str(provider or "").strip().lower()
@@ -912,6 +929,11 @@ class PlaybackProgressService:
             prefix = (str(provider).lower(), normalize_instance_id(instance_id))
             for key in [key for key in self._cache if key[:2] == prefix]:
                 self._cache.pop(key, None)
+        if self._persist:
+            try:
+                progress_store.delete_entries(self._store_path, prefix[0], prefix[1])
+            except Exception as exc:
+                LOG.debug(f"persisted cache delete failed provider={provider} error={exc}")
         LOG.debug(f"cache invalidated provider={provider} instance={normalize_instance_id(instance_id)}")
 
     def _activity_marker(self, adapter: PlaybackProgressAdapter, config_view: Mapping[str, Any], *, instance_id: str) -> str:
@@ -971,6 +993,7 @@ class PlaybackProgressService:
             ):
                 result = cached.get("result")
                 if isinstance(result, PlaybackListResult):
+                    cached["ts"] = time.time()
                     LOG.debug(f"activity unchanged provider={provider} instance={instance_id}")
                     return result
 
@@ -987,13 +1010,177 @@ class PlaybackProgressService:
         stored_at = time.time()
         with self._lock:
             if result.ok:
-                self._cache[key] = {"ts": stored_at, "result": result, "activity_marker": marker, "refreshed_at": result.refreshed_at}
+                entry = {"ts": stored_at, "result": result, "activity_marker": marker, "refreshed_at": result.refreshed_at, "latency_ms": elapsed_ms}
                 LOG.debug(f"provider listed provider={provider} instance={instance_id} items={len(result.items)} elapsed_ms={elapsed_ms}")
             else:
-                self._cache[key] = {"ts": stored_at, "result": result, "activity_marker": marker, "error": result.to_error()}
+                previous = self._cache.get(key) or {}
+                last_good = previous.get("result")
+                if isinstance(last_good, PlaybackListResult) and last_good.ok:
+                    # A failed revalidation keeps serving the last good list.
+                    entry = {**previous, "ts": stored_at, "error": result.to_error(), "latency_ms": elapsed_ms}
+                else:
+                    entry = {"ts": stored_at, "result": result, "activity_marker": marker, "error": result.to_error(), "latency_ms": elapsed_ms}
                 LOG.warn(f"provider list failed provider={provider} instance={instance_id} error={result.error_code or 'provider_error'} status={result.remote_status or ''} elapsed_ms={elapsed_ms}")
+            self._cache[key] = entry
+        self._persist_entry(key, entry)
         return result
 
+    def _persist_entry(self, key: tuple[str, str, str], entry: Mapping[str, Any]) -> None:
+        result = entry.get("result")
+        if not self._persist or not isinstance(result, PlaybackListResult) or not result.ok:
+            return
+        try:
+            progress_store.save_entry(
+                self._store_path,
+                *key,
+                payload=result.to_dict(),
+                error=entry.get("error"),
+                activity_marker=str(entry.get("activity_marker") or ""),
+                refreshed_at=entry.get("refreshed_at"),
+                fetched_at=float(entry.get("ts") or 0),
+                latency_ms=entry.get("latency_ms"),
+            )
+        except Exception as exc:
+            LOG.debug(f"persisted cache write failed provider={key[0]} instance={key[1]} error={exc}")
+
+    def _hydrate(self) -> None:
+        if self._hydrated:
+            return
+        with self._lock:
+            if self._hydrated:
+                return
+            self._hydrated = True
+            try:
+                rows = progress_store.load_entries(self._store_path)
+            except Exception as exc:
+                LOG.debug(f"persisted cache load failed error={exc}")
+                return
+            for row in rows:
+                key = (row["provider"], row["instance"], row["profile"])
+                if key in self._cache:
+                    continue
+                try:
+                    result = PlaybackListResult.from_dict(row["payload"])
+                except Exception:
+                    continue
+                self._cache[key] = {
+                    "ts": row["fetched_at"],
+                    "result": result,
+                    "activity_marker": row["activity_marker"],
+                    "refreshed_at": row["refreshed_at"],
+                    "latency_ms": row["latency_ms"],
+                    **({"error": row["error"]} if row["error"] else {}),
+                }
+        LOG.debug(f"persisted cache loaded entries={len(rows)}")
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="playback-progress")
+            return self._pool
+
+    def _submit(self, cfg: Mapping[str, Any], spec: Mapping[str, str], key: tuple[str, str, str], force_refresh: bool) -> Future[PlaybackListResult]:
+        """Start listing one adapter, joining a listing that is already running."""
+        with self._lock:
+            running = self._inflight.get(key)
+            if running is not None and not running.done():
+                return running
+            future = self._executor().submit(self._list_one, cfg, spec, force_refresh)
+            self._inflight[key] = future
+
+        def _done(fut: Future[PlaybackListResult]) -> None:
+            with self._lock:
+                if self._inflight.get(key) is fut:
+                    self._inflight.pop(key, None)
+
+        future.add_done_callback(_done)
+        return future
+
+    def _source(self, spec: Mapping[str, str], key: tuple[str, str, str], state: str) -> dict[str, Any]:
+        with self._lock:
+            entry = dict(self._cache.get(key) or {})
+            refreshing = key in self._inflight
+        ts = float(entry.get("ts") or 0)
+        err = entry.get("error")
+        return {
+            "provider": spec["provider"],
+            "instance_id": spec["instance_id"],
+            "state": "refreshing" if state == "stale" and refreshing else state,
+            "age_seconds": round(max(0.0, time.time() - ts), 3) if ts else None,
+            "latency_ms": entry.get("latency_ms"),
+            "refreshed_at": entry.get("refreshed_at"),
+            "last_error": str(err.get("message") or err.get("error_code") or "") if isinstance(err, Mapping) else None,
+        }
+
+    def _collect(self, cfg: Mapping[str, Any], specs: list[dict[str, str]], force_refresh: bool) -> Iterator[tuple[PlaybackListResult, dict[str, Any]]]:
+        """Yield ``(result, source)`` per adapter, cached lists first, then live ones as they finish."""
+        self._hydrate()
+        now = time.time()
+        pending: dict[Future[PlaybackListResult], tuple[dict[str, str], tuple[str, str, str]]] = {}
+        for spec in specs:
+            key = self._cache_key(spec["provider"], spec["instance_id"], self._adapter(spec["provider"]))
+            with self._lock:
+                entry = None if force_refresh else self._cache.get(key)
+            cached = entry.get("result") if entry else None
+            if entry and isinstance(cached, PlaybackListResult):
+                stale = (now - float(entry.get("ts") or 0)) >= CACHE_TTL_SECONDS
+                if cached.ok or not stale:
+                    if stale:
+                        self._submit(cfg, spec, key, False)
+                    state = "stale" if stale else ("error" if entry.get("error") else "fresh")
+                    yield cached, self._source(spec, key, state)
+                    continue
+            pending[self._submit(cfg, spec, key, force_refresh)] = (spec, key)
+        if not pending:
+            return
+        timeout = _provider_timeout_seconds(cfg)
+        try:
+            for future in as_completed(pending, timeout=timeout):
+                spec, key = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception:
+                    result = PlaybackListResult(ok=False, provider=spec["provider"], instance_id=spec["instance_id"], error_code="provider_error", message="Provider request failed.", retryable=True)
+                yield result, self._source(spec, key, "fresh" if result.ok else "error")
+        except FuturesTimeout:
+            for spec, key in pending.values():
+                # The listing keeps running and fills the cache for the next request.
+                LOG.warn(f"provider timeout provider={spec['provider']} instance={spec['instance_id']} timeout_s={timeout:g}")
+                result = PlaybackListResult(
+                    ok=False,
+                    provider=spec["provider"],
+                    instance_id=spec["instance_id"],
+                    error_code="provider_timeout",
+                    message="Provider did not respond quickly enough. Its list keeps loading in the background.",
+                    retryable=True,
+                )
+                yield result, self._source(spec, key, "cold")
+
+    def _plan(
+        self,
+        cfg: Mapping[str, Any],
+        provider_filter: str,
+        instance_filter: str,
+        user_filter: Mapping[str, Any] | None,
+    ) -> tuple[list[dict[str, str]], list[dict[str, Any]], list[PlaybackCapabilities]]:
+        specs = [
+            spec
+            for spec in self.provider_instances(cfg, user_filter=user_filter)
+            if (not provider_filter or spec["provider"] == provider_filter)
+            and (not instance_filter or spec["instance_id"] == instance_filter)
+        ]
+        readable_specs: list[dict[str, str]] = []
+        skipped_errors: list[dict[str, Any]] = []
+        capabilities = self.capabilities(cfg, user_filter=user_filter)
+        cap_by_key = {(cap.provider, cap.instance_id): cap for cap in capabilities}
+        for spec in specs:
+            cap = cap_by_key.get((spec["provider"], spec["instance_id"]))
+            if cap and cap.read and cap.included:
+                readable_specs.append(dict(spec))
+            elif cap and cap.included and cap.configured:
+                skipped_errors.append(_capability_error(cap))
+        return readable_specs, skipped_errors, capabilities
+
     def items(
         self,
         *,
@@ -1014,58 +1201,91 @@ class PlaybackProgressService:
         cfg = load_config()
         provider_filter = str(provider or "").strip().lower()
         instance_filter = normalize_instance_id(instance_id) if instance_id else ""
-        specs = [
-            spec
-            for spec in self.provider_instances(cfg, user_filter=user_filter)
-            if (not provider_filter or spec["provider"] == provider_filter)
-            and (not instance_filter or spec["instance_id"] == instance_filter)
-        ]
-        readable_specs: list[dict[str, str]] = []
-        skipped_errors: list[dict[str, Any]] = []
-        capabilities = self.capabilities(cfg, user_filter=user_filter)
-        cap_by_key = {(cap.provider, cap.instance_id): cap for cap in capabilities}
-        for spec in specs:
-            cap = cap_by_key.get((spec["provider"], spec["instance_id"]))
-            if cap and cap.read and cap.included:
-                readable_specs.append(dict(spec))
-            elif cap and cap.included and cap.configured:
-                skipped_errors.append(_capability_error(cap))
-
+        readable_specs, skipped_errors, capabilities = self._plan(cfg, provider_filter, instance_filter, user_filter)
         LOG.info(
             f"list requested providers={len(readable_specs)} force_refresh={bool(force_refresh)} "
             f"provider_filter={provider_filter or 'all'} instance_filter={instance_filter or 'all'}"
         )
+        collected = list(self._collect(cfg, readable_specs, force_refresh))
+        return self._payload(
+            [result for result, _ in collected],
+            [source for _, source in collected],
+            skipped_errors,
+            capabilities,
+            grouped=not provider_filter,
+            filters={"media_type": media_type, "progress_min": progress_min, "progress_max": progress_max, "age": age, "rating_min": rating_min, "search": search},
+            sort=sort,
+            page=page,
+            page_size=page_size,
+        )
+
+    def items_stream(
+        self,
+        *,
+        provider: str | None = None,
+        instance_id: str | None = None,
+        media_type: str | None = None,
+        progress_min: float | None = None,
+        progress_max: float | None = None,
+        age: str | None = None,
+        rating_min: float | None = None,
+        search: str | None = None,
+        sort: str = "last_updated",
+        page: int = 1,
+        page_size: int = 50,
+        force_refresh: bool = False,
+        user_filter: Mapping[str, Any] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield one ``source`` event per adapter as it completes, then the full ``items`` payload."""
+        cfg = load_config()
+        provider_filter = str(provider or "").strip().lower()
+        instance_filter = normalize_instance_id(instance_id) if instance_id else ""
+        readable_specs, skipped_errors, capabilities = self._plan(cfg, provider_filter, instance_filter, user_filter)
+        LOG.info(f"list stream requested providers={len(readable_specs)} force_refresh={bool(force_refresh)}")
+        cap_by_key = {(cap.provider, cap.instance_id): cap for cap in capabilities}
+        filters = {"media_type": media_type, "progress_min": progress_min, "progress_max": progress_max, "age": age, "rating_min": rating_min, "search": search}
         results: list[PlaybackListResult] = []
-        if readable_specs:
-            pool = ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(readable_specs)))
-            future_specs = {pool.submit(self._list_one, cfg, spec, force_refresh): spec for spec in readable_specs}
-            try:
-                done, pending = wait(future_specs, timeout=_provider_timeout_seconds(cfg))
-                for future in done:
-                    try:
-                        results.append(future.result())
-                    except Exception:
-                        results.append(PlaybackListResult(ok=False, provider="unknown", instance_id="", error_code="provider_error", message="Provider request failed.", retryable=True))
-                for future in pending:
-                    spec = future_specs[future]
-                    future.cancel()
-                    LOG.warn(
-                        f"provider timeout provider={spec['provider']} instance={spec['instance_id']} "
-                        f"timeout_s={_provider_timeout_seconds(cfg):g}"
-                    )
-                    results.append(
-                        PlaybackListResult(
-                            ok=False,
-                            provider=spec["provider"],
-                            instance_id=spec["instance_id"],
-                            error_code="provider_timeout",
-                            message="Provider did not respond quickly enough. It was skipped for this refresh.",
-                            retryable=True,
-                        )
-                    )
-            finally:
-                pool.shutdown(wait=False, cancel_futures=True)
+        sources: list[dict[str, Any]] = []
+        for result, source in self._collect(cfg, readable_specs, force_refresh):
+            results.append(result)
+            sources.append(source)
+            event: dict[str, Any] = {"event": "source", "source": source, "items": [], "total": 0}
+            if result.ok:
+                # Same filters and page window as the final payload, applied to this source only.
+                items = [_with_remaining_fallback(item.to_dict()) for item in result.items]
+                _overlay_live_streams(items)
+                window = self._window(items, grouped=not provider_filter, filters=filters, sort=sort, page=page, page_size=page_size)
+                event["items"], event["total"] = window["items"], window["total"]
+            else:
+                event["error"] = _enrich_list_error(result.to_error(), cap_by_key.get((result.provider, result.instance_id)))
+            yield event
+        payload = self._payload(
+            results,
+            sources,
+            skipped_errors,
+            capabilities,
+            grouped=not provider_filter,
+            filters=filters,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+        )
+        yield {"event": "complete", **payload}
 
+    def _payload(
+        self,
+        results: list[PlaybackListResult],
+        sources: list[dict[str, Any]],
+        skipped_errors: list[dict[str, Any]],
+        capabilities: list[PlaybackCapabilities],
+        *,
+        grouped: bool,
+        filters: Mapping[str, Any],
+        sort: str,
+        page: int,
+        page_size: int,
+    ) -> dict[str, Any]:
+        cap_by_key = {(cap.provider, cap.instance_id): cap for cap in capabilities}
         errors = skipped_errors + [
             _enrich_list_error(r.to_error(), cap_by_key.get((r.provider, r.instance_id)))
             for r in results
@@ -1074,27 +1294,37 @@ class PlaybackProgressService:
         items = [_with_remaining_fallback(item.to_dict()) for result in results if result.ok for item in result.items]
         _share_artwork_metadata(items)
         _overlay_live_streams(items)
-        filtered = self._apply_filters(items, media_type=media_type, progress_min=progress_min, progress_max=progress_max, age=age, rating_min=rating_min, search=search)
-        if not provider_filter:
-            filtered = _group_records(filtered)
-        sorted_items = self._sort(filtered, sort)
-        page = max(1, int(page or 1))
-        page_size = max(1, min(250, int(page_size or 50)))
-        total = len(sorted_items)
-        start = (page - 1) * page_size
-        end = start + page_size
-        LOG.debug(f"list completed total={total} errors={len(errors)} page={page} page_size={page_size}")
+        window = self._window(items, grouped=grouped, filters=filters, sort=sort, page=page, page_size=page_size)
+        LOG.debug(f"list completed total={window['total']} errors={len(errors)} page={window['page']} page_size={window['page_size']}")
         return {
-            "items": sorted_items[start:end],
-            "page": page,
-            "page_size": page_size,
-            "total": total,
+            **window,
             "providers": [cap.to_dict() for cap in capabilities],
+            "sources": sources,
             "errors": errors,
             "partial": bool(errors and items),
             "refreshed_at": utc_now_iso(),
         }
 
+    def _window(
+        self,
+        items: list[dict[str, Any]],
+        *,
+        grouped: bool,
+        filters: Mapping[str, Any],
+        sort: str,
+        page: int,
+        page_size: int,
+    ) -> dict[str, Any]:
+        filtered = self._apply_filters(items, **filters)
+        if grouped:
+            filtered = _group_records(filtered)
+        sorted_items = self._sort(filtered, sort)
+        page = max(1, int(page or 1))
+        page_size = max(1, min(250, int(page_size or 50)))
+        start = (page - 1) * page_size
+        end = start + page_size
+        return {"items": sorted_items[start:end], "page": page, "page_size": page_size, "total": len(sorted_items)}
+
     def settings(self, cfg: Mapping[str, Any] | None = None, user_filter: Mapping[str, Any] | None = None) -> dict[str, Any]:
         config = cfg or load_config()
         disabled = _disabled_profiles(config)
@@ -1374,7 +1604,7 @@ class PlaybackProgressService:
         return result.to_dict()
 
 
-_SERVICE = PlaybackProgressService()
+_SERVICE = PlaybackProgressService(persist=True)
 
 
 def get_service() -> PlaybackProgressService:
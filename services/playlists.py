@@ -75,7 +75,7 @@ def _clean_target_ids(payload: Mapping[str, Any]) -> list[str]:
 
 
 
-def _providers() -> dict[str, Any]:
+def _providers() -> Mapping[str, Any]:
     from cw_platform.orchestrator._providers import load_sync_providers
 
     return load_sync_providers()
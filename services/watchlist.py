@@ -3,29 +3,37 @@
 # Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
 from __future__ import annotations
 
+import hashlib
+import importlib.util
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Mapping, cast
+from typing import Any, Callable, Hashable, Mapping, cast
 from urllib.parse import urlencode
 
 import requests
 
 from cw_platform.config_base import CONFIG
 from cw_platform.local_db import watchlist_hide as sqlite_watchlist_hide
+from cw_platform.local_db import manual_policy as sqlite_manual_policy
+from cw_platform.local_db import state as sqlite_state
+from cw_platform.local_db.frozen import FrozenDict, freeze, mutable_copy
 from cw_platform.modules_registry import load_sync_ops, sync_provider_names
 from cw_platform.orchestrator._state_store import StateStore
 from cw_platform.provider_instances import build_config_view, list_instance_ids, normalize_instance_id
 
 _LOG = logging.getLogger("crosswatch.services.watchlist")
 
-try:
-    from plexapi.myplex import MyPlexAccount
+# plexapi is only needed to delete from the Plex watchlist; import it there.
+_HAVE_PLEXAPI = importlib.util.find_spec("plexapi") is not None
 
-    _HAVE_PLEXAPI = True
-except Exception:
-    MyPlexAccount = None  # type: ignore[assignment]
-    _HAVE_PLEXAPI = False
+# build_watchlist memo (provider refs and group rows) and the materialized view.
+_BUILD_LOCK = threading.Lock()
+_BUILD_MEMO: dict[str, Any] = {"providers": {}, "rows": {}, "stats": {}}
+_VIEW_LOCK = threading.Lock()
+_VIEW: dict[str, Any] = {"key": None, "view": None, "projections": {}}
+_VIEW_PROJECTIONS = 32
 
 
 def _sync_state_base(state_path: Path | None = None) -> Path:
@@ -41,8 +49,9 @@ def _load_hide_set() -> set[str]:
 
 
 def _load_sync_state(base_path: Path = CONFIG) -> dict[str, Any]:
+    # Deletes edit this state in place before saving it back.
     raw = StateStore(base_path).load_state_features({"watchlist"})
-    return raw if isinstance(raw, dict) else {}
+    return mutable_copy(raw) if isinstance(raw, dict) else {}
 
 
 def _save_sync_state(base_path: Path, state: dict[str, Any]) -> None:
@@ -917,130 +926,189 @@ def _get_items(state: dict[str, Any], prov: str) -> dict[str, Any]:
     return _get_provider_items(state, prov)
 
 
-def build_watchlist(state: dict[str, Any], tmdb_ok: bool) -> list[dict[str, Any]]:
-    providers = _registry_sync_providers()
-    hidden = _load_hide_set()
-    raw_refs: list[tuple[str, str, str, dict[str, Any]]] = []
+def _watchlist_row(group: list[tuple[str, str, str, dict[str, Any]]]) -> dict[str, Any] | None:
+    if not group:
+        return None
+    alias_keys = sorted({key for key, _, _, _ in group})
+    key = alias_keys[0] if alias_keys else ""
+    candidates = [(prov, inst, it) for _key, prov, inst, it in group]
+    if not candidates:
+        return None
 
-    for p in providers:
-        refs = _get_provider_item_refs(state, p, instance_id="all")
-        for k, arr in refs.items():
-            if str(k) in hidden:
-                continue
-            for it in arr or []:
-                inst = str((it or {}).get("_cw_instance") or _DEFAULT_INSTANCE)
-                raw_refs.append((str(k), p.lower(), inst, it))
+    sources = sorted({n for n, _, _ in candidates})
+    if not sources:
+        return None
 
-    out: list[dict[str, Any]] = []
-    for group in _group_watchlist_refs(raw_refs):
-        if not group:
-            continue
-        alias_keys = sorted({key for key, _, _, _ in group})
-        key = alias_keys[0] if alias_keys else ""
-        candidates = [(prov, inst, it) for _key, prov, inst, it in group]
-        if not candidates:
-            continue
+    sources_by_provider: dict[str, list[str]] = {}
+    info_best: dict[str, Any] = {}
+    declared = {_norm_type((it or {}).get("type")) for _, _, it in candidates if it}
+    declared.discard("")
+
+    added_src = sources[0]
+    added_instance = _DEFAULT_INSTANCE
+    added_epoch = 0
+    added_when: str | None = None
+
+    for n, inst, it in candidates:
+        sources_by_provider.setdefault(n, [])
+        if inst not in sources_by_provider[n]:
+            sources_by_provider[n].append(inst)
+
+        info_best = _pick_best_item(info_best, it or {})
+
+        ep = _iso_to_epoch(_pick_added(it or {}))
+        if ep and ep > added_epoch:
+            added_src, added_instance, added_epoch = n, inst, ep
+            added_when = _pick_added(it or {})
+
+    for n in sources_by_provider:
+        insts = sources_by_provider[n]
+        sources_by_provider[n] = sorted(insts, key=lambda x: (x != _DEFAULT_INSTANCE, x))
+
+    info = dict(info_best or {})
+    info.pop("_cw_instance", None)
+
+    if "anime" in declared:
+        typ = "anime"
+    elif "tv" in declared:
+        typ = "tv"
+    elif "movie" in declared:
+        typ = "movie"
+    else:
+        ids_ = (info.get("ids") or {}) | {k: info.get(k) for k in ("tmdb", "imdb", "tvdb", "trakt", "slug", "anilist", "mal")}
+        pref = (key or "").split(":", 1)[0].lower().strip()
+        if ids_.get("anilist") or ids_.get("mal") or pref in {"anilist", "mal"}:
+            typ = "anime"
+        else:
+            typ = "tv" if ids_.get("tvdb") else "movie"
+
+    key = _preferred_watchlist_key(alias_keys, info, typ)
+
+    title = info.get("title") or info.get("name") or ""
+    year = info.get("year") or info.get("release_year")
+    tmdb_id = (info.get("ids") or {}).get("tmdb") or info.get("tmdb")
+    season = _season_number(info)
+    episode = _episode_number(info)
+    episode_label = _episode_label(info)
+
+    if not added_epoch:
+        added_when = _pick_added(info)
+        added_epoch = _iso_to_epoch(added_when)
+
+    status = f"{sources[0]}_only" if len(sources) == 1 else "both"
+
+    tmdb_str = str(tmdb_id)
+    tmdb_value = int(tmdb_str) if tmdb_str.isdigit() else tmdb_id
+    extra_meta = {
+        k: info.get(k)
+        for k in (
+            "genres",
+            "genre",
+            "release_date",
+            "first_air_date",
+            "released",
+            "release",
+        )
+        if info.get(k) not in (None, "", [], {})
+    }
 
-        sources = sorted({n for n, _, _ in candidates})
-        if not sources:
-            continue
+    return {
+        "key": key,
+        "aliases": alias_keys,
+        "type": typ,
+        "title": title,
+        "year": year,
+        "season": season,
+        "episode": episode,
+        "episode_label": episode_label,
+        "tmdb": tmdb_value,
+        "status": status,
+        "sources": sources,
+        "sources_by_provider": sources_by_provider,
+        "added_epoch": added_epoch,
+        "added_when": added_when,
+        "added_src": added_src,
+        "added_instance": added_instance,
+        "categories": [],
+        "ids": _ids_from_key_or_item(key, info),
+        **extra_meta,
+    }
 
-        sources_by_provider: dict[str, list[str]] = {}
-        info_best: dict[str, Any] = {}
-        declared = {_norm_type((it or {}).get("type")) for _, _, it in candidates if it}
-        declared.discard("")
 
-        added_src = sources[0]
-        added_instance = _DEFAULT_INSTANCE
-        added_epoch = 0
-        added_when: str | None = None
+def _watchlist_blocks(state: dict[str, Any], provider: str) -> tuple[tuple[str, Any], ...] | None:
+    # Frozen state views hand out the same items object until that provider's
+    # rows change; plain dicts may be edited in place and are never reused.
+    blocks: list[tuple[str, Any]] = []
+    for inst_id, blk in _iter_provider_instance_blocks(state, provider):
+        items = _items_from_block(blk)
+        if not items:
+            continue
+        if not isinstance(items, FrozenDict):
+            return None
+        blocks.append((inst_id, items))
+    return tuple(blocks)
 
-        for n, inst, it in candidates:
-            sources_by_provider.setdefault(n, [])
-            if inst not in sources_by_provider[n]:
-                sources_by_provider[n].append(inst)
 
-            info_best = _pick_best_item(info_best, it or {})
+def _same_blocks(a: tuple[tuple[str, Any], ...], b: tuple[tuple[str, Any], ...]) -> bool:
+    return len(a) == len(b) and all(x[0] == y[0] and x[1] is y[1] for x, y in zip(a, b))
 
-            ep = _iso_to_epoch(_pick_added(it or {}))
-            if ep and ep > added_epoch:
-                added_src, added_instance, added_epoch = n, inst, ep
-                added_when = _pick_added(it or {})
 
-        for n in sources_by_provider:
-            insts = sources_by_provider[n]
-            sources_by_provider[n] = sorted(insts, key=lambda x: (x != _DEFAULT_INSTANCE, x))
+def _provider_watchlist_refs(
+    state: dict[str, Any],
+    provider: str,
+    memo: dict[str, Any],
+) -> list[tuple[str, str, str, dict[str, Any]]]:
+    blocks = _watchlist_blocks(state, provider)
+    prev = memo.get(provider)
+    if blocks is not None and prev is not None and _same_blocks(prev[0], blocks):
+        return prev[1]
+    refs: list[tuple[str, str, str, dict[str, Any]]] = []
+    for k, arr in _get_provider_item_refs(state, provider, instance_id="all").items():
+        for it in arr or []:
+            inst = str((it or {}).get("_cw_instance") or _DEFAULT_INSTANCE)
+            refs.append((str(k), provider.lower(), inst, it))
+    if blocks is None:
+        memo.pop(provider, None)
+    else:
+        memo[provider] = (blocks, refs)
+    return refs
 
-        info = dict(info_best or {})
-        info.pop("_cw_instance", None)
 
-        if "anime" in declared:
-            typ = "anime"
-        elif "tv" in declared:
-            typ = "tv"
-        elif "movie" in declared:
-            typ = "movie"
-        else:
-            ids_ = (info.get("ids") or {}) | {k: info.get(k) for k in ("tmdb", "imdb", "tvdb", "trakt", "slug", "anilist", "mal")}
-            pref = (key or "").split(":", 1)[0].lower().strip()
-            if ids_.get("anilist") or ids_.get("mal") or pref in {"anilist", "mal"}:
-                typ = "anime"
-            else:
-                typ = "tv" if ids_.get("tvdb") else "movie"
-
-        key = _preferred_watchlist_key(alias_keys, info, typ)
-
-        title = info.get("title") or info.get("name") or ""
-        year = info.get("year") or info.get("release_year")
-        tmdb_id = (info.get("ids") or {}).get("tmdb") or info.get("tmdb")
-        season = _season_number(info)
-        episode = _episode_number(info)
-        episode_label = _episode_label(info)
-
-        if not added_epoch:
-            added_when = _pick_added(info)
-            added_epoch = _iso_to_epoch(added_when)
-
-        status = f"{sources[0]}_only" if len(sources) == 1 else "both"
-
-        tmdb_str = str(tmdb_id)
-        tmdb_value = int(tmdb_str) if tmdb_str.isdigit() else tmdb_id
-        extra_meta = {
-            k: info.get(k)
-            for k in (
-                "genres",
-                "genre",
-                "release_date",
-                "first_air_date",
-                "released",
-                "release",
-            )
-            if info.get(k) not in (None, "", [], {})
-        }
+def build_watchlist(state: dict[str, Any], tmdb_ok: bool) -> list[dict[str, Any]]:
+    """Unified watchlist rows, newest first.
 
-        out.append(
-            {
-                "key": key,
-                "aliases": alias_keys,
-                "type": typ,
-                "title": title,
-                "year": year,
-                "season": season,
-                "episode": episode,
-                "episode_label": episode_label,
-                "tmdb": tmdb_value,
-                "status": status,
-                "sources": sources,
-                "sources_by_provider": sources_by_provider,
-                "added_epoch": added_epoch,
-                "added_when": added_when,
-                "added_src": added_src,
-                "added_instance": added_instance,
-                "categories": [],
-                "ids": _ids_from_key_or_item(key, info),
-                **extra_meta,
-            }
-        )
+    Refs of providers whose state blocks are unchanged since the last build are
+    reused, and so is every group made only of those refs; only groups touched
+    by a changed provider are rebuilt.
+    """
+    providers = _registry_sync_providers()
+    hidden = _load_hide_set()
+    with _BUILD_LOCK:
+        memo: dict[str, Any] = _BUILD_MEMO["providers"]
+        raw_refs: list[tuple[str, str, str, dict[str, Any]]] = []
+        for p in providers:
+            raw_refs.extend(ref for ref in _provider_watchlist_refs(state, p, memo) if ref[0] not in hidden)
+        for p in set(memo) - set(providers):
+            memo.pop(p, None)
+
+        # Entries keep their group alive, so an id in a signature cannot be
+        # reused by another item while the entry exists.
+        prev_rows: dict[tuple[Any, ...], tuple[Any, dict[str, Any] | None]] = _BUILD_MEMO["rows"]
+        rows: dict[tuple[Any, ...], tuple[Any, dict[str, Any] | None]] = {}
+        reused = 0
+        out: list[dict[str, Any]] = []
+        for group in _group_watchlist_refs(raw_refs):
+            sig = tuple((key, prov, inst, id(it)) for key, prov, inst, it in group)
+            hit = prev_rows.get(sig)
+            if hit is None:
+                hit = (group, _watchlist_row(group))
+            else:
+                reused += 1
+            rows[sig] = hit
+            if hit[1] is not None:
+                out.append(mutable_copy(hit[1]))
+        _BUILD_MEMO["rows"] = rows
+        _BUILD_MEMO["stats"] = {"groups": len(rows), "reused": reused}
 
     out.sort(
         key=lambda x: (x.get("added_epoch") or 0, _year_sort_value(x.get("year"))),
@@ -1048,6 +1116,90 @@ def build_watchlist(state: dict[str, Any], tmdb_ok: bool) -> list[dict[str, Any]
     )
     return out
 
+
+# Materialized unified watchlist
+def watchlist_version(base_path: Path | None = None) -> tuple[Any, ...]:
+    base = base_path or CONFIG
+    return (
+        sqlite_state.fingerprint(base, {"watchlist"}),
+        sqlite_manual_policy.fingerprint(base, {"watchlist"}),
+        sqlite_watchlist_hide.fingerprint(base),
+        tuple(_registry_sync_providers()),
+    )
+
+
+def _etag(*parts: Any) -> str:
+    return 'W/"' + hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:24] + '"'
+
+
+def materialized_watchlist(
+    load_state: Callable[[], dict[str, Any]],
+    build: Callable[..., list[dict[str, Any]]],
+    *,
+    tmdb_ok: bool,
+) -> dict[str, Any]:
+    """Unified watchlist shared by the wall and watchlist APIs.
+
+    Rebuilt only when the watchlist state generation, manual policy or hide set
+    moves. ``items`` is a read-only list; ``etag`` names the version.
+    """
+    version = watchlist_version()
+    key = (version, bool(tmdb_ok), build)
+    with _VIEW_LOCK:
+        view = _VIEW["view"]
+        if view is not None and _VIEW["key"] == key:
+            return view
+
+    state = load_state() or {}
+    items = (build(state, tmdb_ok=tmdb_ok) or []) if state else []
+    view = {
+        "etag": _etag(version, bool(tmdb_ok)),
+        "items": freeze(list(items)),
+        "empty": not state,
+        "last_sync_epoch": state.get("last_sync_epoch") if isinstance(state, dict) else None,
+    }
+    with _VIEW_LOCK:
+        _VIEW["key"] = key
+        _VIEW["view"] = view
+        _VIEW["projections"] = {}
+    return view
+
+
+def watchlist_projection(
+    view: dict[str, Any],
+    name: Hashable,
+    project: Callable[[list[dict[str, Any]]], list[dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """``project(view["items"])``, cached per view under ``name`` (e.g. a user scope)."""
+    with _VIEW_LOCK:
+        if _VIEW["view"] is view and name in _VIEW["projections"]:
+            return _VIEW["projections"][name]
+    items = freeze(list(project(view["items"])))
+    with _VIEW_LOCK:
+        if _VIEW["view"] is view:
+            projections: dict[Hashable, Any] = _VIEW["projections"]
+            if len(projections) >= _VIEW_PROJECTIONS:
+                projections.clear()
+            projections[name] = items
+    return items
+
+
+def page_watchlist(items: list[dict[str, Any]], offset: int = 0, limit: int = 0) -> list[dict[str, Any]]:
+    start = max(0, int(offset or 0))
+    return list(items[start : start + limit] if limit else items[start:])
+
+
+def watchlist_etag(view: dict[str, Any], *parts: Any) -> str:
+    return _etag(view.get("etag"), *parts)
+
+
+def clear_watchlist_cache() -> None:
+    with _BUILD_LOCK:
+        _BUILD_MEMO.update({"providers": {}, "rows": {}, "stats": {}})
+    with _VIEW_LOCK:
+        _VIEW.update({"key": None, "view": None, "projections": {}})
+
+
 def _del_key_from_provider_items(
     state: dict[str, Any],
     provider: str,
@@ -1147,6 +1299,8 @@ def _delete_on_plex_single(
     token = (cfg.get("plex") or {}).get("account_token", "").strip()
     if not token:
         raise RuntimeError("missing plex token")
+    from plexapi.myplex import MyPlexAccount
+
     account = cast(Any, MyPlexAccount)(token=token)
 
     item = _find_item_in_state(state, key) or {}
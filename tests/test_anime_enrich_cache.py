@@ -0,0 +1,101 @@
+# tests/test_anime_enrich_cache.py
+# CrossWatch - Memoized anime enrichment and batched edge expansion tests
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cw_platform.anime_mapping import service, storage
+from cw_platform.anime_mapping.service import AnimeMappingService, enrich_index_for_pair
+
+MAPPINGS: dict[str, Any] = {
+    "mal:813": {"tmdb_show:12971": {}, "tvdb_show:81472": {}},
+    "anidb:1530": {"mal:813": {}, "tvdb_show:81472:s1": {}},
+    "mal:21": {"tmdb_show:37854": {}},
+    "anilist:20": {"mal:20": {}},
+    "mal:20": {"tvdb_show:79824": {}, "tmdb_show:46260:s0": {}},
+}
+IDENTITY_TSV = "\n".join(
+    [
+        "\t".join(["title", "anidb", "anilist", "kitsu", "myanimelist", "simkl", "themoviedb", "thetvdb"]),
+        "\t".join(["Clean", "1530", "813", "720", "813", "41487", "12971", "81472"]),
+    ]
+)
+_CFG = {"anime_mapping": {"enabled": True, "release_tag": "v3", "use_for_pairs": ["*"]}}
+
+
+@pytest.fixture()
+def index(config_base: Path) -> Path:
+    paths = storage.paths("v3")
+    paths["root"].mkdir(parents=True, exist_ok=True)
+    paths["mappings"].write_text(json.dumps(MAPPINGS), encoding="utf-8")
+    paths["identity"].write_text(IDENTITY_TSV, encoding="utf-8")
+    storage.rebuild_sqlite_from_mappings(release_tag="v3")
+    service.clear_enrich_cache()
+    return paths["db"]
+
+
+def _point_lookups(release_tag: str, sources: list[tuple[str, str]], *, stats: dict[str, int] | None = None) -> dict:
+    return {src: storage.query_edges(release_tag, *src) for src in sources}
+
+
+_SAMPLES = [
+    ({"tvdb": "81472"}, "show"),
+    ({"anidb": "1530"}, "show"),
+    ({"anilist": "20"}, "show"),
+    ({"mal": "21", "imdb": "tt0"}, "show"),
+    ({"simkl": "41487"}, "show"),
+    ({"tmdb": "404"}, "movie"),
+]
+
+
+def test_batched_walk_matches_point_lookups(index: Path, monkeypatch) -> None:
+    batched = [AnimeMappingService(_CFG).enrich_ids(ids, media_type=mt) for ids, mt in _SAMPLES]
+    service.clear_enrich_cache()
+    monkeypatch.setattr(service, "query_edges_many", _point_lookups)
+    reference = [AnimeMappingService(_CFG).enrich_ids(ids, media_type=mt) for ids, mt in _SAMPLES]
+    assert batched == reference
+    assert batched[2]["ids"]["tvdb"] == "79824"
+
+
+def test_edges_many_matches_single_queries_and_caches(index: Path) -> None:
+    sources = [("mal", "813"), ("anidb", "1530"), ("mal", "404"), ("MAL", " 21 ")]
+    stats: dict[str, int] = {}
+    many = storage.query_edges_many("v3", sources, stats=stats)
+    for provider, ident in sources:
+        assert many[(provider, ident)] == storage.query_edges("v3", provider, ident)
+    assert stats == {"edge_cache_hits": 0, "edge_queries": 2}
+
+    many[("mal", "813")].clear()
+    again = storage.query_edges_many("v3", sources, stats=stats)
+    assert again[("mal", "813")] and stats["edge_queries"] == 2 and stats["edge_cache_hits"] == 4
+
+
+def test_repeated_items_hit_the_shared_cache_across_pairs(index: Path) -> None:
+    idx = {f"item{i}": {"type": "show", "ids": {"tvdb": "81472"} if i % 2 else {"anilist": "20"}} for i in range(20)}
+    first: dict[str, int] = {}
+    out = enrich_index_for_pair(idx, _CFG, "ANILIST", "PLEX", stats=first)
+    assert first["items"] == 20 and first["cache_misses"] == 2 and first["cache_hits"] == 18
+    assert first["cache_hit_pct"] == 90 and first["edge_queries"] > 0 and first["ms"] >= 0
+
+    second: dict[str, int] = {}
+    assert enrich_index_for_pair(idx, _CFG, "ANILIST", "TRAKT", stats=second) == out
+    assert second["cache_hits"] == 20 and second["edge_queries"] == 0
+
+    merged = next(v for v in out.values() if v["ids"].get("tvdb") == "81472")
+    merged["ids"]["mal"] = "changed"
+    third = enrich_index_for_pair(idx, _CFG, "ANILIST", "PLEX")
+    assert all(v["ids"].get("mal") != "changed" for v in third.values())
+
+
+def test_rebuilt_index_starts_a_fresh_cache(index: Path) -> None:
+    svc = AnimeMappingService(_CFG)
+    assert svc.enrich_ids({"mal": "21"}, media_type="show")["ids"]["tmdb"] == "37854"
+    paths = storage.paths("v3")
+    paths["mappings"].write_text(json.dumps({**MAPPINGS, "mal:21": {"tmdb_show:99999": {}}}), encoding="utf-8")
+    storage.rebuild_sqlite_from_mappings(release_tag="v3")
+    assert AnimeMappingService(_CFG).enrich_ids({"mal": "21"}, media_type="show")["ids"]["tmdb"] == "99999"
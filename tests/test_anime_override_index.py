@@ -0,0 +1,100 @@
+# tests/test_anime_override_index.py
+# CrossWatch - Indexed anime override lookups vs the plain rule scan
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import Any
+
+from cw_platform.anime_mapping import overrides as ov
+
+
+def _scan_episode(rows: list[dict[str, Any]], ids: dict[str, str], s_num: int, e_num: int) -> ov.EpisodeOverride | None:
+    for row in rows:
+        if not row.get("enabled", True) or row.get("media_type") != "show":
+            continue
+        if not row["match_id"] or ids.get(row["match_provider"]) != row["match_id"]:
+            continue
+        if row.get("match_season") is not None and int(row["match_season"]) != s_num:
+            continue
+        if row.get("episode_from") is None or row.get("episode_start_at") is None:
+            continue
+        if e_num < row["episode_from"] or (row.get("episode_to") is not None and e_num > row["episode_to"]):
+            continue
+        return ov.EpisodeOverride(row["episode_start_at"] + e_num - row["episode_from"], row["target_namespace"], row["target_id"], row["id"])
+    return None
+
+
+def _scan_identity(rows: list[dict[str, Any]], ids: dict[str, str], wanted: str) -> dict[str, str]:
+    out: dict[str, str] = {}
+    for row in rows:
+        if not row.get("enabled", True) or (wanted in ov.MEDIA_TYPES and row.get("media_type") != wanted):
+            continue
+        if ids.get(row["match_provider"]) == row["match_id"] and row["target_namespace"] not in out:
+            out[row["target_namespace"]] = row["target_id"]
+    return out
+
+
+def _random_rules(rng: random.Random, n: int) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    for i in range(n):
+        show = rng.random() < 0.8
+        ep_from = rng.randint(1, 30)
+        episodic = show and rng.random() < 0.7
+        rows.append(
+            ov.normalize_override(
+                {
+                    "id": f"r{i}",
+                    "enabled": rng.random() < 0.9,
+                    "media_type": "show" if show else "movie",
+                    "match_provider": rng.choice(["tvdb", "tmdb", "imdb"]),
+                    "match_id": str(rng.randint(1, 6)),
+                    "match_season": rng.randint(0, 2) if episodic else None,
+                    "target_namespace": rng.choice(["mal", "anilist", "anidb"]),
+                    "target_id": str(rng.randint(100, 104)),
+                    "episode_from": ep_from if episodic else None,
+                    "episode_to": ep_from + rng.randint(0, 12) if episodic and rng.random() < 0.8 else None,
+                    "episode_start_at": rng.randint(1, 60) if episodic else None,
+                }
+            )
+        )
+    return rows
+
+
+def test_index_matches_the_scan_on_random_rule_sets() -> None:
+    rng = random.Random(44)
+    for _ in range(20):
+        rows = _random_rules(rng, 60)
+        for _ in range(60):
+            ids = {p: str(rng.randint(1, 6)) for p in rng.sample(["tvdb", "tmdb", "imdb", "simkl"], rng.randint(1, 3))}
+            season, episode = rng.randint(0, 2), rng.randint(1, 45)
+            assert ov.find_episode_override(ids, season, episode, rows=rows) == _scan_episode(rows, ids, season, episode)
+            wanted = rng.choice(["show", "movie", "", "episode"])
+            assert ov.find_identity_overrides(ids, media_type=wanted, rows=rows) == _scan_identity(rows, ids, wanted)
+
+
+def test_first_rule_in_file_order_wins_across_overlaps() -> None:
+    rows = [
+        ov.normalize_override({"id": "wide", "match_provider": "tvdb", "match_id": "7", "match_season": 1, "target_namespace": "mal", "target_id": "1", "episode_from": 1, "episode_start_at": 1}),
+        ov.normalize_override({"id": "narrow", "match_provider": "tmdb", "match_id": "8", "match_season": 1, "target_namespace": "mal", "target_id": "2", "episode_from": 5, "episode_to": 6, "episode_start_at": 50}),
+        ov.normalize_override({"id": "id-a", "media_type": "show", "match_provider": "tmdb", "match_id": "8", "target_namespace": "anilist", "target_id": "20"}),
+        ov.normalize_override({"id": "id-b", "media_type": "show", "match_provider": "tvdb", "match_id": "7", "target_namespace": "anilist", "target_id": "10"}),
+    ]
+    ids = {"tmdb": "8", "tvdb": "7"}
+    assert ov.find_episode_override(ids, 1, 5, rows=rows).rule_id == "wide"
+    assert ov.find_episode_override({"tmdb": "8"}, 1, 5, rows=rows).absolute == 50
+    assert ov.find_identity_overrides(ids, media_type="show", rows=rows) == {"mal": "1", "anilist": "20"}
+    assert ov.find_source_override("mal", "1", 9, rows=rows) == ov.SourceOverride("tvdb", "7", 1, 9, "wide")
+
+
+def test_cached_index_follows_the_overrides_file(config_base: Path) -> None:
+    ov.upsert_override({"id": "a", "match_provider": "tvdb", "match_id": "7", "match_season": 1, "target_namespace": "mal", "target_id": "1", "episode_from": 1, "episode_start_at": 10})
+    assert ov.find_episode_override({"tvdb": "7"}, 1, 3).absolute == 12
+    index = ov._override_index(None)
+    assert ov._override_index(None) is index
+
+    ov.upsert_override({"id": "a", "match_provider": "tvdb", "match_id": "7", "match_season": 1, "target_namespace": "mal", "target_id": "1", "episode_from": 1, "episode_start_at": 20})
+    assert ov._override_index(None) is not index
+    assert ov.find_episode_override({"tvdb": "7"}, 1, 3).absolute == 22
+    assert ov.find_source_override("mal", "1", 22) == ov.SourceOverride("tvdb", "7", 1, 3, "a")
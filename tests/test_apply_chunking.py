@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from cw_platform.orchestrator import _applier, _chunking
+from cw_platform.orchestrator._pairs_metrics import ApiMetrics
+
+
+@pytest.fixture(autouse=True)
+def _state_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(_chunking, "STATE_DIR", tmp_path)
+    monkeypatch.setattr(_applier.time, "sleep", lambda *_: None)
+    return tmp_path
+
+
+def _ctx(size: int = 10, **runtime):
+    return SimpleNamespace(
+        apply_chunk_size=size,
+        apply_chunk_size_by_provider={},
+        config={"runtime": {"apply_chunk_min": 2, "apply_chunk_max": 100, **runtime}},
+    )
+
+
+class _Ops:
+    def __init__(self, caps=None):
+        self._caps = caps or {}
+
+    def capabilities(self):
+        return self._caps
+
+
+class Throttled(Exception):
+    status_code = 429
+
+
+def test_controller_grows_when_healthy_and_halves_on_throttle():
+    ch = _chunking.adaptive_chunker(_ctx(8), "TRAKT", "watchlist", ops=_Ops({"watchlist": {"max_chunk": 100}}))
+    assert ch is not None and ch.size == 8
+    ch.observe(8, 50)
+    ch.observe(10, 50)
+    assert ch.size == 12
+    cooldown = ch.observe(12, 50, throttled=True)
+    assert ch.size == 6 and cooldown > 0
+    ch.observe(6, 10_000)
+    assert ch.size == 4
+
+
+def test_controller_honours_declared_max_and_disable_flag():
+    ch = _chunking.adaptive_chunker(_ctx(40), "PLEX", "history", ops=_Ops({"history": {"max_chunk": 50}}))
+    for _ in range(10):
+        ch.observe(ch.size, 5)
+    assert ch.size == 50
+    assert _chunking.adaptive_chunker(_ctx(40, apply_chunk_adaptive=False), "PLEX", "history") is None
+    assert _chunking.adaptive_chunker(_ctx(0), "PLEX", "history") is None
+
+
+def test_controller_never_grows_past_the_configured_size_without_a_declared_max():
+    ch = _chunking.adaptive_chunker(_ctx(8), "SIMKL", "watchlist", ops=_Ops())
+    for _ in range(5):
+        ch.observe(ch.size, 5)
+    assert ch.size == 8
+    ch.observe(8, 5, throttled=True)
+    assert ch.size == 4
+    ch.observe(4, 5)
+    ch.observe(4, 5)
+    ch.observe(6, 5)
+    assert ch.size == 8
+    ch.save()
+    # A size learned under a larger ceiling is clamped back to the configured one.
+    _chunking._write_state({"SIMKL:ratings": {"size": 900}})
+    assert _chunking.adaptive_chunker(_ctx(8), "SIMKL", "ratings").size == 8
+
+
+def test_learned_size_is_remembered_across_runs():
+    ch = _chunking.adaptive_chunker(_ctx(10), "SIMKL", "ratings", ops=_Ops({"ratings": {"max_chunk": 100}}))
+    ch.observe(10, 5)
+    ch.observe(12, 5)
+    ch.save()
+    again = _chunking.adaptive_chunker(_ctx(10), "SIMKL", "ratings", ops=_Ops({"ratings": {"max_chunk": 100}}))
+    assert again.size == 14
+    assert _chunking.adaptive_chunker(_ctx(10), "SIMKL", "history").size == 10
+
+
+def test_apply_chunked_adapts_sizes_and_reports_chunks():
+    items = [{"n": i} for i in range(60)]
+    seen: list[int] = []
+    failed_once = {"done": False}
+
+    def call(chunk):
+        seen.append(len(chunk))
+        if len(seen) == 3 and not failed_once["done"]:
+            failed_once["done"] = True
+            raise Throttled("429 Too Many Requests")
+        return {"ok": True, "count": len(chunk)}
+
+    events: list[tuple[str, dict]] = []
+    metrics = ApiMetrics(lambda ev, **kw: events.append((ev, kw)))
+    res = _applier._apply_chunked(
+        "apply:add",
+        dst="TRAKT",
+        feature="watchlist",
+        items=items,
+        call=call,
+        emit=metrics.emit,
+        dbg=lambda *a, **k: None,
+        chunk_size=8,
+        chunk_pause_ms=0,
+        adaptive=_chunking.adaptive_chunker(_ctx(8), "TRAKT", "watchlist", ops=_Ops({"watchlist": {"max_chunk": 100}})),
+    )
+
+    assert res["confirmed"] == 60
+    assert seen[:4] == [8, 10, 12, 12]
+    assert seen[4] == 6
+    assert res["chunking"]["throttled"] == 1
+    assert [c["size"] for c in res["chunking"]["per_chunk"]][:3] == [8, 10, 12]
+    summary = metrics.chunking()["TRAKT:watchlist"]
+    assert summary["items"] == 60 and summary["throttled"] == 1
+    assert sum(c["size"] for c in summary["per_chunk"]) == 60
+
+
+def test_retry_prefers_retry_after(monkeypatch):
+    slept: list[float] = []
+    monkeypatch.setattr(_applier.time, "sleep", slept.append)
+
+    class Resp:
+        headers = {"Retry-After": "2"}
+
+    err = Throttled("slow down")
+    err.response = Resp()  # type: ignore[attr-defined]
+    calls = {"n": 0}
+
+    def fn():
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise err
+        return {"ok": True}
+
+    assert _applier._retry(fn) == {"ok": True}
+    assert slept == [2.0]
+
+
+def test_throttling_is_classified_by_status_and_type_not_message():
+    import requests
+
+    class Upstream(Exception):
+        def __init__(self, status):
+            super().__init__("boom")
+            self.response = SimpleNamespace(status_code=status)
+
+    assert _chunking.is_throttle_error(Upstream(503))
+    assert _chunking.is_throttle_error(requests.exceptions.ReadTimeout("read"))
+    assert not _chunking.is_throttle_error(ValueError("timeout=30 rejected; 503 items"))
+    assert not _chunking.is_throttle_error(Upstream(404))
+    try:
+        try:
+            raise Throttled("x")
+        except Throttled as inner:
+            raise RuntimeError("wrapped") from inner
+    except RuntimeError as outer:
+        assert _chunking.is_throttle_error(outer)
+
+
+def test_dry_run_does_not_train_or_persist_chunk_size(_state_dir):
+    class Dst:
+        def add(self, cfg, items, *, feature, dry_run):
+            return {"ok": True, "count": len(items)}
+
+    adaptive = _chunking.adaptive_chunker(_ctx(8), "TRAKT", "watchlist")
+    res = _applier.apply_add(
+        dst_ops=Dst(),
+        cfg={},
+        dst_name="TRAKT",
+        feature="watchlist",
+        items=[{"n": i} for i in range(40)],
+        dry_run=True,
+        emit=lambda *a, **k: None,
+        dbg=lambda *a, **k: None,
+        chunk_size=8,
+        chunk_pause_ms=0,
+        adaptive=adaptive,
+    )
+    assert res["ok"] and not adaptive.chunks
+    assert not (_state_dir / "apply_chunks.json").exists()
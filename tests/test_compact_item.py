@@ -0,0 +1,134 @@
+# tests/test_compact_item.py
+# CrossWatch - Compact read-only items for pair baselines
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+import sys
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from cw_platform import id_map
+from cw_platform.compact_item import CompactItem, compact_index, json_default, plain
+from cw_platform.local_db.frozen import mutable_copy
+from cw_platform.orchestrator import _planner
+from cw_platform.orchestrator._pairs_oneway import load_feature_state
+from cw_platform.orchestrator._snapshots import canonicalize_index
+from cw_platform.orchestrator._state_store import StateStore
+
+MOVIE = {"type": "movie", "title": "Heat", "year": 1995, "ids": {"imdb": "tt0113277", "tmdb": 949}, "rating": 9}
+EPISODE = {
+    "type": "episode",
+    "title": "Pilot",
+    "season": 1,
+    "episode": 1,
+    "ids": {"tvdb": "349232"},
+    "show_ids": {"imdb": "tt0903747", "tmdb": "1396"},
+    "watched_at": "2025-01-02T03:04:05Z",
+}
+GUID_ONLY = {"type": "movie", "title": "Local", "year": 2001, "guid": "plex://movie/5d7768"}
+
+
+def _library(n: int, provider: str) -> dict[str, dict[str, Any]]:
+    out: dict[str, dict[str, Any]] = {}
+    for i in range(n):
+        if i % 2:
+            out[f"k{i}"] = {
+                "type": "episode", "title": f"Show {i // 40}", "season": 1 + i % 5, "episode": 1 + i % 20,
+                "ids": {"tmdb": str(900000 + i)}, "show_ids": {"tmdb": str(i // 40), "imdb": f"tt{i // 40:07d}"},
+                "provider": provider,
+            }
+        else:
+            out[f"k{i}"] = {
+                "type": "movie", "title": f"Movie {i}", "year": 1990 + i % 30,
+                "ids": {"tmdb": str(i), "imdb": f"tt{i:07d}"}, "rating": 1 + i % 10, "provider": provider,
+            }
+    return json.loads(json.dumps(out))
+
+
+def test_compact_item_is_a_read_only_mapping_with_plain_copies() -> None:
+    item = CompactItem(MOVIE)
+    assert item == MOVIE and dict(item) == MOVIE and item.to_dict() == MOVIE
+    assert list(item) == list(MOVIE) and len(item) == len(MOVIE)
+    assert item["ids"]["tmdb"] == 949 and item.get("missing", 1) == 1 and "year" in item
+    assert isinstance(item["ids"], CompactItem)
+
+    with pytest.raises(TypeError, match="mutable_copy"):
+        item["title"] = "x"
+    with pytest.raises(TypeError):
+        item.update(title="x")
+
+    for copied in (mutable_copy(item), copy.deepcopy(item), pickle.loads(pickle.dumps(item)), item | {"x": 1}):
+        assert type(copied) is dict and type(copied["ids"]) is dict
+        copied["ids"]["tmdb"] = 1
+    assert item["ids"]["tmdb"] == 949
+
+    assert json.loads(json.dumps({"a": item}, default=json_default)) == {"a": MOVIE}
+    assert plain({"a": item})["a"] == MOVIE and type(plain({"a": item})["a"]) is dict
+    state = {"a": MOVIE}
+    assert plain(state) is state
+
+
+def test_items_share_key_layout_and_interned_ids() -> None:
+    a = CompactItem(json.loads(json.dumps(MOVIE)))
+    b = CompactItem(json.loads(json.dumps(MOVIE)))
+    assert a._shape is b._shape
+    assert a["ids"]["imdb"] is b["ids"]["imdb"]
+    idx = compact_index({"imdb:tt0113277": MOVIE})
+    assert next(iter(idx)) is sys.intern("imdb:tt0113277")
+
+
+@pytest.mark.parametrize("item", [MOVIE, EPISODE, GUID_ONLY])
+def test_id_map_helpers_match_plain_items(item: dict[str, Any]) -> None:
+    ci = CompactItem(item)
+    assert id_map.canonical_key(ci) == id_map.canonical_key(item)
+    assert id_map.canonical_key(ci) == ci.ckey
+    assert id_map.ids_from(ci) == id_map.ids_from(item)
+    assert id_map.minimal(ci) == id_map.minimal(item)
+    assert ci.norm_ids is not None and id_map.ids_from(ci) == id_map.ids_from(item)
+
+
+def test_compact_baseline_index_plans_like_dicts() -> None:
+    src = canonicalize_index(_library(400, "PLEX"), feature="history")
+    dst = canonicalize_index(_library(330, "TRAKT"), feature="history")
+    csrc, cdst = compact_index(src), compact_index(dst)
+    assert csrc == src and list(csrc) == list(src)
+    assert all(type(v) is CompactItem for v in csrc.values())
+
+    adds, removes = _planner.diff(csrc, cdst)
+    assert (adds, removes) == _planner.diff(src, dst) and adds and not removes
+    assert _planner.diff_ratings(csrc, cdst) == _planner.diff_ratings(src, dst)
+
+
+def test_pair_state_keeps_baseline_items_compact(tmp_path) -> None:
+    store = StateStore(tmp_path)
+    store.save_feature_baseline(provider="PLEX", feature="watchlist", items={"imdb:tt0113277": MOVIE}, last_sync_epoch=1)
+    state = load_feature_state(store, "watchlist")
+    items = state["providers"]["PLEX"]["watchlist"]["baseline"]["items"]
+    shared = store.load_state_features({"watchlist"})["providers"]["PLEX"]["watchlist"]["baseline"]["items"]
+    assert type(items["imdb:tt0113277"]) is CompactItem and items == shared
+    items["imdb:tt1"] = dict(MOVIE)
+    assert "imdb:tt1" not in shared
+
+
+def test_compact_index_memory_per_item() -> None:
+    n = 4000
+
+    def _retained(compact: bool) -> int:
+        tracemalloc.start()
+        try:
+            idx = _library(n, "PLEX")
+            if compact:
+                idx = compact_index(idx)
+            # Per-item objects only: a resize of the index or of the interpreter's intern table is one big block.
+            small = sum(t.size for t in tracemalloc.take_snapshot().traces if t.size < 64 * 1024)
+            return small // len(idx)
+        finally:
+            tracemalloc.stop()
+
+    plain_bytes, compact_bytes = _retained(False), _retained(True)
+    assert compact_bytes * 1.5 < plain_bytes
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from cw_platform.local_db import close_conn
+from cw_platform.local_db import dashboard_views as views
+from cw_platform.local_db import state as sqlite_state
+from cw_platform.orchestrator._state_store import StateStore
+from services import dashboard_widgets
+
+
+def _movie(n: int, *, when: int, **extra: Any) -> dict[str, Any]:
+    return {"type": "movie", "title": f"Movie {n}", "year": 2000 + n % 20, "ids": {"tmdb": n}, **extra, "_when": when}
+
+
+def _history(items: dict[int, int]) -> dict[str, Any]:
+    return {f"tmdb:{n}@{when}": {k: v for k, v in _movie(n, when=when, watched_at=when).items() if k != "_when"} for n, when in items.items()}
+
+
+def _ratings(items: dict[int, int]) -> dict[str, Any]:
+    return {
+        f"tmdb:{n}": {"type": "movie", "title": f"Movie {n}", "ids": {"tmdb": n}, "rating": 1 + n % 10, "rated_at": when}
+        for n, when in items.items()
+    }
+
+
+def _progress(items: dict[int, int]) -> dict[str, Any]:
+    return {
+        f"tmdb:{n}": {"type": "movie", "title": f"Movie {n}", "ids": {"tmdb": n}, "progress_percent": 40, "progress_at": when}
+        for n, when in items.items()
+    }
+
+
+@pytest.fixture()
+def store(monkeypatch, tmp_path):
+    monkeypatch.setenv("CROSSWATCH_DB", str(tmp_path / "cw.sqlite3"))
+    close_conn()
+    tracker: dict[str, dict[str, Any]] = {"history": {}, "ratings": {}, "progress": {}}
+    monkeypatch.setattr(dashboard_widgets, "_tracker_feature_items", lambda kind: dict(tracker[kind]))
+    monkeypatch.setattr(dashboard_widgets, "_tracker_signature", lambda kind: str(len(tracker[kind])))
+    monkeypatch.setattr(dashboard_widgets, "_history_alias_representatives", lambda: {})
+    monkeypatch.setattr(dashboard_widgets, "_resolve_missing_art_rows", lambda rows, **_kw: rows)
+    dashboard_widgets._VIEW_CACHE.clear()
+    s = StateStore(tmp_path)
+    s.tracker = tracker  # type: ignore[attr-defined]
+    yield s
+    close_conn()
+
+
+def _seed(store: StateStore) -> None:
+    base = 1767225600
+    for provider, instance, offset in (("PLEX", "default", 0), ("PLEX", "PLEX-P02", 7), ("TRAKT", "default", 3)):
+        span = range(offset, offset + 150)
+        store.save_feature_baseline(provider=provider, instance=instance, feature="history", items=_history({n: base + n * 60 for n in span}))
+        store.save_feature_baseline(provider=provider, instance=instance, feature="ratings", items=_ratings({n: base + n * 90 for n in span}))
+        store.save_feature_baseline(provider=provider, instance=instance, feature="progress", items=_progress({n: base + n * 30 for n in span}))
+    store.tracker["ratings"] = {  # type: ignore[attr-defined]
+        "tmdb:9001": {"type": "movie", "title": "Tracker Only", "ids": {"tmdb": 9001}, "rating": 8, "rated_at": base + 10**6}
+    }
+
+
+def _full(store: StateStore, widget: str, limit: int, user_filter: dict[str, Any] | None) -> dict[str, Any]:
+    state = store.load_state_features({widget})
+    return dashboard_widgets._state_widget(widget, state, limit=limit, user_filter=user_filter, base_path=store.base_path)
+
+
+@pytest.mark.parametrize("widget", ["history", "ratings", "progress"])
+@pytest.mark.parametrize("user_filter", [None, {"PLEX": ["PLEX-P02"]}, {"TRAKT": ["default"], "PLEX": ["default"]}])
+def test_materialized_views_match_the_full_state_walk(store, widget, user_filter):
+    _seed(store)
+    limit = 24
+    view = dashboard_widgets.materialized_widget(widget, limit=limit, user_filter=user_filter, base_path=store.base_path)
+    full = _full(store, widget, limit, user_filter)
+    assert view is not None
+    assert view["items"] == full["items"]
+    assert view["total"] <= full["total"]
+
+
+def test_reads_do_not_touch_the_library_once_views_are_built(store, monkeypatch):
+    _seed(store)
+    assert dashboard_widgets.refresh_dashboard_views(store.base_path) == 12
+
+    def boom(*_a, **_kw):
+        raise AssertionError("dashboard read walked the state")
+
+    monkeypatch.setattr(sqlite_state, "load_feature_items", boom)
+    monkeypatch.setattr(sqlite_state, "load_state_features", boom)
+    payload = dashboard_widgets.dashboard_widgets_payload(None, include={"history", "ratings", "progress"}, base_path=store.base_path)
+    assert payload["latest_ratings"]["items"][0]["title"] == "Tracker Only"
+    assert len(payload["recent_history"]["items"]) == 8
+
+
+def test_only_changed_blocks_and_tracker_files_are_rebuilt(store, monkeypatch):
+    _seed(store)
+    dashboard_widgets.refresh_dashboard_views(store.base_path)
+    assert dashboard_widgets.refresh_dashboard_views(store.base_path) == 0
+
+    loads: list[tuple[str, str, str]] = []
+    real = sqlite_state.load_feature_items
+    monkeypatch.setattr(sqlite_state, "load_feature_items", lambda b, p, i, f: loads.append((p, i, f)) or real(b, p, i, f))
+
+    items = _history({n: 1767225600 + n * 60 for n in range(3, 153)})
+    items.update(_history({500: 1800000000}))
+    store.save_feature_baseline(provider="TRAKT", feature="history", items=items)
+    assert dashboard_widgets.refresh_dashboard_views(store.base_path) == 1
+    assert loads == [("TRAKT", "default", "history")]
+
+    history = dashboard_widgets.materialized_widget("history", limit=3, base_path=store.base_path)
+    assert history is not None and history["items"][0]["title"] == "Movie 500"
+
+    store.tracker["progress"] = {"tmdb:7": {"type": "movie", "title": "Resume", "ids": {"tmdb": 7}, "progress_percent": 10, "progress_at": 1900000000}}  # type: ignore[attr-defined]
+    progress = dashboard_widgets.materialized_widget("progress", limit=3, base_path=store.base_path)
+    assert progress is not None and progress["items"][0]["title"] == "Resume"
+    assert len(loads) == 1
+
+
+def test_removed_blocks_and_schema_changes_rebuild_views(store, monkeypatch):
+    _seed(store)
+    dashboard_widgets.refresh_dashboard_views(store.base_path)
+    store.clear_state()
+    history = dashboard_widgets.materialized_widget("history", base_path=store.base_path)
+    assert history == {"ok": True, "items": [], "total": 0}
+
+    _seed(store)
+    dashboard_widgets.refresh_dashboard_views(store.base_path)
+    monkeypatch.setattr(views, "VIEW_SCHEMA", views.VIEW_SCHEMA + 1)
+    assert dashboard_widgets.refresh_dashboard_views(store.base_path) == 12
+    assert dashboard_widgets.refresh_dashboard_views(store.base_path) == 0
@@ -477,6 +477,43 @@ def test_history_alias_representatives_rejects_foreign_scope(monkeypatch, tmp_pa
     assert dashboard_widgets._history_alias_representatives() == {}
 
 
+def test_history_alias_representatives_rereads_only_when_files_change(monkeypatch, tmp_path) -> None:
+    import os
+
+    sandbox = _alias_sandbox(monkeypatch, tmp_path, [_ALIAS_PAIR])
+    _write_pair_alias(sandbox, _ALIAS_SCOPE, {"tmdb:1#s01e02@1": {"destination_key": "tmdb:1#s02e01"}})
+    reads: list[int] = []
+    real = dashboard_widgets._read_history_alias_representatives
+    monkeypatch.setattr(dashboard_widgets, "_read_history_alias_representatives", lambda paths: reads.append(1) or real(paths))
+
+    first = dashboard_widgets._history_alias_representatives()
+    assert dashboard_widgets._history_alias_representatives() is first and len(reads) == 1
+
+    path = sandbox / "trakt_history.pair_alias.p1.json"
+    _write_pair_alias(sandbox, _ALIAS_SCOPE, {"tmdb:1#s01e03@1": {"destination_key": "tmdb:1#s02e02"}})
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert dashboard_widgets._history_alias_representatives()["tmdb:1#s01e03"] == "tmdb:1#s02e02"
+    assert len(reads) == 2
+
+
+def test_recent_history_widget_merges_translated_episode_from_alias_file(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(
+        dashboard_widgets,
+        "list_events",
+        lambda **_kwargs: {"ok": True, "total": 0, "items": []},
+    )
+    sandbox = _alias_sandbox(monkeypatch, tmp_path, [_ALIAS_PAIR])
+    _write_pair_alias(sandbox, _ALIAS_SCOPE, {
+        "tmdb:12971#s01e291@1767229200": {"destination_key": "tmdb:12971#s09e01"}
+    })
+
+    payload = dashboard_widgets.recent_history_widget(_translated_anime_state(), limit=5)
+
+    assert payload["total"] == 1
+    assert {source["provider"] for source in payload["items"][0]["sources"]} == {"SIMKL", "TRAKT"}
+
+
 def test_recent_history_widget_resolves_missing_art_from_metadata(monkeypatch) -> None:
     fake = FakeMetadataManager()
     monkeypatch.setattr(dashboard_widgets, "_METADATA_MANAGER", fake)
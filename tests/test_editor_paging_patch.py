@@ -0,0 +1,197 @@
+# tests/test_editor_paging_patch.py
+# CrossWatch - Editor paging, patch and tracker snapshot journal tests
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi import HTTPException
+
+import services.editor as editor_service
+from api import editorAPI as api
+from cw_platform.local_db import state as sqlite_state
+
+
+def _page(**kw: Any) -> dict[str, Any]:
+    args: dict[str, Any] = {
+        "kind": "ratings",
+        "source": "state",
+        "provider": "TRAKT",
+        "provider_instance": "default",
+        "q": None,
+        "media_type": None,
+        "sort": "key",
+        "order": "asc",
+        "offset": 0,
+        "limit": 100,
+        "cursor": None,
+    }
+    args.update(kw)
+    return api.api_editor_get_items(**args)
+
+
+@pytest.fixture()
+def base(tmp_path, monkeypatch) -> Path:
+    monkeypatch.setattr(api, "_STATE_BASE", tmp_path)
+    items = {
+        f"tmdb:{i}": {"type": "movie" if i % 2 else "show", "title": f"Title {i:02d}", "rating": i % 7, "ids": {"tmdb": str(i)}}
+        for i in range(30)
+    }
+    items["tmdb:0"].pop("rating")
+    sqlite_state.save_state(tmp_path, {"providers": {"TRAKT": {"ratings": {"baseline": {"items": items}}}}})
+    return tmp_path
+
+
+def test_items_endpoint_pages_filters_and_sorts(base) -> None:
+    first = _page(limit=10)
+    assert first["total"] == 30 and list(first["items"]) == sorted(f"tmdb:{i}" for i in range(30))[:10]
+    rest = _page(offset=10, limit=100)
+    assert len(rest["items"]) == 20 and not set(rest["items"]) & set(first["items"])
+
+    movies = _page(media_type="movie", q="title 1")
+    assert movies["total"] == 5 and all(v["type"] == "movie" for v in movies["items"].values())
+
+    desc = _page(sort="rating", order="desc")
+    ratings = [v.get("rating") for v in desc["items"].values()]
+    assert ratings[0] == 6 and ratings[-1] is None
+    with pytest.raises(HTTPException):
+        _page(sort="nope")
+
+
+def test_items_endpoint_walks_baseline_pages_by_cursor(base, monkeypatch) -> None:
+    def whole_state(*_a: Any, **_k: Any) -> None:
+        raise AssertionError("paged reads must not load the whole feature")
+
+    monkeypatch.setattr(api, "_load_current_state_features", whole_state)
+    monkeypatch.setattr(sqlite_state, "load_feature_items", whole_state)
+    seen: list[str] = []
+    cursor = None
+    while True:
+        page = _page(limit=7, cursor=cursor, media_type="show")
+        assert page["total"] == 15
+        seen.extend(page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert seen == sorted(f"tmdb:{i}" for i in range(0, 30, 2))
+    desc = _page(limit=3, order="desc")
+    assert list(desc["items"]) == sorted((f"tmdb:{i}" for i in range(30)), reverse=True)[:3]
+
+
+def test_patch_applies_item_level_changes_to_manual_policy(base) -> None:
+    api.api_editor_save_state(
+        {"source": "manual", "kind": "ratings", "provider": "TRAKT", "items": {"tmdb:1": {"type": "movie", "title": "One", "rating": 5, "ids": {"tmdb": "1"}}}}
+    )
+    res = api.api_editor_patch_state(
+        {
+            "source": "manual",
+            "kind": "ratings",
+            "provider": "TRAKT",
+            "ops": [
+                {"op": "replace", "path": "/items/tmdb:1/rating", "value": 9},
+                {"op": "add", "path": "/items/tmdb:2", "value": {"type": "movie", "title": "Two", "rating": 7, "ids": {"tmdb": "2"}}},
+                {"op": "add", "path": "/blocks/tmdb:3"},
+            ],
+        }
+    )
+    assert res["applied"] == 3 and res["count"] == 2 and res["blocks"] == 1
+    page = _page(source="manual")
+    assert page["items"]["tmdb:1"]["rating"] == 9 and page["items"]["tmdb:2"]["title"] == "Two"
+    assert page["manual_blocks"] == ["tmdb:3"]
+
+    with pytest.raises(HTTPException) as exc:
+        api.api_editor_patch_state(
+            {
+                "source": "manual",
+                "kind": "ratings",
+                "provider": "TRAKT",
+                "ops": [{"op": "remove", "path": "/items/tmdb:2"}, {"op": "remove", "path": "/items/tmdb:404"}],
+            }
+        )
+    assert exc.value.status_code == 409
+    assert "tmdb:2" in _page(source="manual")["items"]
+
+
+def test_tracker_snapshots_are_delta_journals_with_checkpoints(tmp_path, monkeypatch) -> None:
+    root = tmp_path / "cw_provider"
+    monkeypatch.setattr(editor_service, "load_config", lambda: {"crosswatch": {"root_dir": str(root), "max_snapshots": 0, "retention_days": 0}})
+    monkeypatch.setattr(editor_service, "_JOURNAL_CHECKPOINT_EVERY", 4)
+    items = {f"movie:{i}": {"title": f"M{i}"} for i in range(50)}
+    history = []
+    for n in range(10):
+        history.append(json.loads(json.dumps(items)))
+        editor_service.save_state("watchlist", items)
+        items = dict(items)
+        items[f"movie:{n}"] = {"title": f"edited {n}"}
+        items.pop(f"movie:{49 - n}")
+
+    snaps = editor_service.list_snapshots("watchlist")
+    assert len(snaps) == 9
+    checkpoints = list((root / "snapshots").glob("*-watchlist.json"))
+    assert len(checkpoints) == 3
+    for meta, expected in zip(reversed(snaps), history[:-1]):
+        assert editor_service.load_state("watchlist", snapshot=meta["name"])["items"] == expected
+
+    (root / "watchlist.json").write_text(json.dumps({"items": {"x": {}}, "ts": 1}), encoding="utf-8")
+    editor_service.save_state("watchlist", {"y": {}})
+    newest = editor_service.list_snapshots("watchlist")[0]
+    assert "delta" not in newest
+    assert editor_service.load_state("watchlist", snapshot=newest["name"])["items"] == {"x": {}}
+
+
+def test_snapshot_retention_retires_whole_checkpoint_segments(tmp_path, monkeypatch) -> None:
+    root = tmp_path / "cw_provider"
+    cfg = {"crosswatch": {"root_dir": str(root), "max_snapshots": 3, "retention_days": 0}}
+    monkeypatch.setattr(editor_service, "load_config", lambda: cfg)
+    monkeypatch.setattr(editor_service, "_JOURNAL_CHECKPOINT_EVERY", 4)
+    states = [{f"movie:{i}": {"n": n} for i in range(n + 1)} for n in range(8)]
+    for state in states:
+        editor_service.save_state("watchlist", state)
+
+    snaps = editor_service.list_snapshots("watchlist")
+    assert len(snaps) == 3
+    assert [editor_service.load_state("watchlist", snapshot=m["name"])["items"] for m in reversed(snaps)] == states[4:7]
+    assert len(list((root / "snapshots").glob("*-watchlist.json"))) == 1
+
+    # Over the limit mid-segment: nothing is rebased, the journal is left alone.
+    journal = root / "snapshots" / "watchlist.journal.jsonl"
+    cfg["crosswatch"]["max_snapshots"] = 2
+    before = journal.read_text(encoding="utf-8")
+    states.append({"movie:0": {"n": 8}})
+    editor_service.save_state("watchlist", states[-1])
+    assert journal.read_text(encoding="utf-8").startswith(before)
+    assert len(list((root / "snapshots").glob("*-watchlist.json"))) == 1
+    snaps = editor_service.list_snapshots("watchlist")
+    assert [editor_service.load_state("watchlist", snapshot=m["name"])["items"] for m in reversed(snaps)] == states[4:8]
+
+    # Once the kept window starts at the next checkpoint, the older segment retires as a whole.
+    states.append({"movie:1": {"n": 9}})
+    editor_service.save_state("watchlist", states[-1])
+    assert len(editor_service.list_snapshots("watchlist")) == 5
+    editor_service.save_state("watchlist", {"movie:2": {"n": 10}})
+    snaps = editor_service.list_snapshots("watchlist")
+    assert [editor_service.load_state("watchlist", snapshot=m["name"])["items"] for m in reversed(snaps)] == states[8:10]
+    assert "delta" not in snaps[-1]
+    assert len(list((root / "snapshots").glob("*-watchlist.json"))) == 1
+
+
+def test_imported_snapshot_replaces_a_journal_entry_of_the_same_name(tmp_path, monkeypatch) -> None:
+    root = tmp_path / "cw_provider"
+    monkeypatch.setattr(editor_service, "load_config", lambda: {"crosswatch": {"root_dir": str(root), "max_snapshots": 0, "retention_days": 0}})
+    states = [{f"movie:{i}": {"n": n} for i in range(n + 1)} for n in range(5)]
+    for state in states:
+        editor_service.save_state("watchlist", state)
+    names = [m["name"] for m in reversed(editor_service.list_snapshots("watchlist"))]
+    assert len(names) == 4
+
+    editor_service.import_tracker_json(json.dumps({"items": {"imported": {}}}).encode(), names[1])
+    assert editor_service.load_state("watchlist", snapshot=names[1])["items"] == {"imported": {}}
+    for name, expected in zip(names[2:], states[2:4]):
+        assert editor_service.load_state("watchlist", snapshot=name)["items"] == expected
+
+    editor_service.import_tracker_json(json.dumps({"items": {"again": {}}}).encode(), names[0])
+    assert editor_service.load_state("watchlist", snapshot=names[0])["items"] == {"again": {}}
+    assert editor_service.load_state("watchlist", snapshot=names[3])["items"] == states[3]
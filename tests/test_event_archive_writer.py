@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from cw_platform.event_archive import RunRecorder, connect, make_event, writer as writer_mod
+from cw_platform.event_archive.writer import EventWriter
+
+
+@pytest.fixture()
+def conn(tmp_path):
+    c = connect(tmp_path / "events.sqlite3")
+    yield c
+    c.close()
+
+
+def _rows(n: int, run_id: str = "run-1") -> list[dict]:
+    return [make_event(event_hash=f"h{i}", run_id=run_id, event_type="write_attempted", created_at=1767225600 + i) for i in range(n)]
+
+
+def _count(conn, table: str = "events") -> int:
+    return int(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0])
+
+
+def test_writer_applies_events_and_runs_in_one_batch(conn):
+    w = EventWriter(conn=conn, batch_size=10_000, interval=60)
+    w.run_started("run-1", started_at=1767225600, mode="sync")
+    w.events(_rows(250))
+    w.run_finished("run-1", finished_at=1767225700, summary={"added": 3})
+    assert _count(conn) == 0
+    assert w.flush(wait=True, timeout=10)
+    assert _count(conn) == 250
+    run = conn.execute("SELECT status, added, finished_at - started_at FROM sync_runs WHERE run_id='run-1'").fetchone()
+    assert tuple(run) == ("done", 3, 100)
+    stats = w.stats()
+    assert stats["flushes"] == 1 and stats["rows"] == 250 and stats["queue_depth"] == 0
+    assert stats["max_depth"] == 252
+    w.close()
+
+
+def test_size_trigger_flushes_without_an_explicit_flush(conn):
+    w = EventWriter(conn=conn, batch_size=50, interval=60)
+    w.events(_rows(120))
+    # The worker may wake anywhere past 50 queued ops; whatever is left after
+    # its batches is always below batch_size and waits for the interval.
+    deadline = time.monotonic() + 10
+    while _count(conn) <= 120 - w.batch_size and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert _count(conn) > 120 - w.batch_size
+    w.close()
+    assert _count(conn) == 120
+
+
+def test_journal_replays_ops_queued_before_a_crash(conn, tmp_path, monkeypatch):
+    journal = tmp_path / "events.queue"
+    crashed = EventWriter(conn=conn, journal=journal, start=False)
+    crashed.run_started("run-9", started_at=1767225600)
+    crashed.events(_rows(40, "run-9"))
+    assert not journal.exists() or journal.read_text() == ""
+
+    def failing_insert(c, prepared):
+        raise RuntimeError("disk I/O error")
+
+    monkeypatch.setattr(writer_mod, "insert_events", failing_insert)
+    assert crashed.drain() == 0
+    assert journal.read_text().count("\n") == 41
+    assert _count(conn) == 0
+    monkeypatch.undo()
+
+    revived = EventWriter(conn=conn, journal=journal)
+    assert revived.flush(wait=True, timeout=10)
+    assert _count(conn) == 40
+    assert _count(conn, "sync_runs") == 1
+    assert revived.stats()["replayed"] == 41
+    assert journal.read_text() == ""
+    revived.close()
+
+
+def test_run_recorder_keeps_archive_writes_off_the_emit_path(conn, monkeypatch):
+    real = writer_mod.insert_events
+
+    def slow_insert(c, prepared):
+        time.sleep(0.2)
+        return real(c, prepared)
+
+    monkeypatch.setattr(writer_mod, "insert_events", slow_insert)
+    seen: list[str] = []
+    rec = RunRecorder(lambda event, **f: seen.append(event), run_id="run-2", conn=conn)
+    t0 = time.perf_counter()
+    rec.emit("run:start", mode="sync")
+    rec.emit("feature:start", src="PLEX", dst="TRAKT", feature="watchlist")
+    for _ in range(30):
+        rec.emit("one:plan", adds=1, removes=0)
+        rec.emit("apply:add:done", dst="TRAKT", attempted=1, added=1)
+    rec.emit("run:done", pairs=1, added=30)
+    assert time.perf_counter() - t0 < 0.2
+    assert len(seen) == 63
+
+    rec.close()
+    assert _count(conn) == 62
+    assert conn.execute("SELECT status FROM sync_runs WHERE run_id='run-2'").fetchone()[0] == "done"
+    assert conn.execute("SELECT COUNT(*) FROM events WHERE group_id IS NOT NULL").fetchone()[0] > 0
+
+
+def test_bounded_queue_applies_backpressure(conn, monkeypatch):
+    real = writer_mod.insert_events
+
+    def slow_insert(c, prepared):
+        time.sleep(0.01)
+        return real(c, prepared)
+
+    monkeypatch.setattr(writer_mod, "insert_events", slow_insert)
+    w = EventWriter(conn=conn, max_queue=20, batch_size=5, interval=0.01)
+    for row in _rows(200):
+        w.events([row])
+        assert w.stats()["queue_depth"] <= 20
+    w.close()
+    assert _count(conn) == 200
+    assert w.stats()["dropped"] == 0
+
+
+def test_journal_is_written_in_batches_and_compacted_after_commits(conn, tmp_path, monkeypatch):
+    journal = tmp_path / "events.queue"
+    writes: list[int] = []
+    w = EventWriter(conn=conn, journal=journal, batch_size=10_000, interval=60, start=False)
+    real_file = w._journal_file
+
+    def counting_file():
+        f = real_file()
+        if f is not None and not hasattr(f, "_counted"):
+            raw_write = f.write
+            monkeypatch.setattr(f, "write", lambda text: writes.append(text.count("\n")) or raw_write(text), raising=False)
+            f._counted = True  # type: ignore[attr-defined]
+        return f
+
+    monkeypatch.setattr(w, "_journal_file", counting_file)
+    w.events(_rows(300))
+    assert writes == []
+    w.drain()
+    assert writes == [300] and journal.read_text() == ""
+    assert _count(conn) == 300
+    w.close()
+
+
+def test_dropped_batch_survives_a_kill_and_restart(conn, tmp_path, monkeypatch):
+    journal = tmp_path / "events.queue"
+    w = EventWriter(conn=conn, journal=journal, start=False)
+    w.events(_rows(30, "run-a"))
+
+    def failing_insert(c, prepared):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(writer_mod, "insert_events", failing_insert)
+    for _ in range(writer_mod.MAX_ATTEMPTS):
+        assert w.drain() == 0
+    assert w.stats()["dropped"] == 30
+    monkeypatch.undo()
+
+    # A later commit empties the queue and truncates the journal; the dropped
+    # batch must still be on disk when the process dies without close().
+    w.events([make_event(event_hash="later", run_id="run-b", event_type="write_attempted", created_at=1767225700)])
+    assert w.drain() == 1
+    assert journal.read_text() == ""
+    del w
+
+    revived = EventWriter(conn=conn, journal=journal)
+    assert revived.stats()["replayed"] == 30
+    assert revived.flush(wait=True, timeout=10)
+    assert _count(conn) == 31
+    assert journal.read_text() == ""
+    assert not (tmp_path / "events.queue.failed").exists()
+    revived.close()
+
+
+def test_journal_is_fsynced_shortly_after_enqueue_without_a_flush(conn, tmp_path, monkeypatch):
+    journal = tmp_path / "events.queue"
+    synced: list[int] = []
+    real_fsync = writer_mod.os.fsync
+    monkeypatch.setattr(writer_mod.os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+    w = EventWriter(conn=conn, journal=journal, batch_size=10_000, interval=60)
+    w.events(_rows(3))
+    deadline = time.monotonic() + 5
+    while (not journal.exists() or journal.read_text().count("\n") < 3) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert journal.read_text().count("\n") == 3
+    assert synced
+    assert _count(conn) == 0
+    w.close()
+    assert _count(conn) == 3
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import random
+from typing import Any
+
+import pytest
+
+from cw_platform.event_archive import connect, groups, make_event, record_events
+
+TYPES = (
+    "plan_created", "write_attempted", "write_succeeded", "write_failed", "unresolved_recorded",
+    "unresolved_cleared", "blackbox_promoted", "blackbox_blocked", "tombstone_created",
+    "sync_run_started", "sync_run_finished", "provider_health",
+)
+RUN_LEVEL = {"plan_created", "sync_run_started", "sync_run_finished", "provider_health"}
+COLUMNS = [c for c in groups._GROUP_COLUMNS if c not in ("id", "created_at", "updated_at")]
+
+
+def _events(seed: int, n: int) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        et = rng.choice(TYPES)
+        detail: dict[str, Any] = {}
+        if et == "sync_run_finished":
+            detail = {"errors": rng.choice([0, 0, 1]), "unresolved": rng.choice([0, 2])}
+        elif et == "blackbox_blocked":
+            detail = {"blocked": rng.randint(1, 3)}
+        elif et == "plan_created":
+            detail = {"adds": rng.choice([0, 1])}
+        out.append(
+            make_event(
+                event_hash=f"e{seed}-{i}",
+                created_at=1767225600 + rng.randint(0, 20),
+                run_id=rng.choice(["run-1", "run-2"]),
+                event_type=et,
+                severity=rng.choice(["info", "error"]),
+                feature=rng.choice(["watchlist", "ratings", "history"]),
+                operation=rng.choice(["add", "remove", "rate"]),
+                pair_key=rng.choice(["PLEX-TRAKT", "TRAKT-SIMKL", None]),
+                source_provider=rng.choice(["PLEX", "TRAKT"]),
+                destination_provider=rng.choice(["SIMKL", "TRAKT", None]),
+                item_key=None if et in RUN_LEVEL else rng.choice(["tmdb:1", "tmdb:2", "tmdb:3", None]),
+                title=rng.choice(["Heat", "Ronin", None]),
+                old_value=rng.choice([None, "6"]),
+                new_value=rng.choice([None, "8"]),
+                reason_code=rng.choice([None, "http_404", "not_found"]),
+                detail=detail,
+            )
+        )
+    return out
+
+
+@pytest.fixture()
+def conn(tmp_path):
+    c = connect(tmp_path / "events.sqlite3")
+    yield c
+    c.close()
+
+
+def _snapshot(conn) -> dict[str, tuple[Any, ...]]:
+    rows = conn.execute(f"SELECT group_hash,{','.join(COLUMNS)} FROM event_groups").fetchall()
+    return {r["group_hash"]: tuple(r[c] for c in COLUMNS) for r in rows}
+
+
+def _repair_all(conn) -> None:
+    with conn:
+        for (gid,) in conn.execute("SELECT id FROM event_groups").fetchall():
+            groups._recompute(conn, int(gid), 0)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_incremental_aggregation_matches_full_recompute(conn, seed):
+    events = _events(seed, 160)
+    random.Random(seed).shuffle(events)
+    for start in range(0, len(events), 37):
+        record_events(events[start:start + 37], conn=conn)
+        groups.correlate(conn=conn)
+
+    incremental = _snapshot(conn)
+    _repair_all(conn)
+    assert _snapshot(conn) == incremental
+
+
+def test_correlate_only_reads_new_events(conn, monkeypatch):
+    record_events(_events(1, 120), conn=conn)
+    groups.correlate(conn=conn)
+
+    def boom(*_a, **_kw):
+        raise AssertionError("full recompute on an incremental correlate")
+
+    monkeypatch.setattr(groups, "_recompute", boom)
+    folded: list[int] = []
+    real = groups._fold
+    monkeypatch.setattr(groups, "_fold", lambda agg, e: folded.append(e["id"]) or real(agg, e))
+    record_events(_events(2, 5), conn=conn)
+    assert groups.correlate(conn=conn)["grouped"] == 5
+    assert len(folded) == 5
+
+
+def test_groups_without_an_aggregate_are_rebuilt(conn):
+    record_events(_events(3, 60), conn=conn)
+    groups.correlate(conn=conn)
+    expected = _snapshot(conn)
+    with conn:
+        conn.execute("UPDATE event_groups SET aggregate=NULL, event_count=0, summary=NULL")
+    route = ("item_key", "feature", "operation", "source_provider", "destination_provider", "pair_key")
+    row = conn.execute(f"SELECT {','.join(route)} FROM events WHERE item_key IS NOT NULL LIMIT 1").fetchone()
+    extra = make_event(event_hash="late", created_at=1767225600, event_type="write_succeeded", **{k: row[k] for k in route})
+    record_events([extra], conn=conn)
+    groups.correlate(conn=conn)
+    gid = conn.execute("SELECT group_id FROM events WHERE event_hash='late'").fetchone()[0]
+    agg = json.loads(conn.execute("SELECT aggregate FROM event_groups WHERE id=?", (gid,)).fetchone()[0])
+    total = conn.execute("SELECT COUNT(*) FROM events WHERE group_id=?", (gid,)).fetchone()[0]
+    assert total > 1
+    assert agg["count"] == total == sum(n for _, n in agg["types"].values())
+    assert len(_snapshot(conn)) == len(expected)
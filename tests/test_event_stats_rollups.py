@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import math
+import random
+from typing import Any
+
+import pytest
+
+from cw_platform.event_archive import connect, make_event, record_events, record_run_finished, record_run_started, rollups
+from cw_platform.event_archive.stats import _compute
+
+T0 = 1767225600
+SPAN = 9 * rollups.DAY
+TYPES = (
+    "scrobble_completed", "scrobble_failed", "rating_applied", "rating_failed", "sync_run_finished",
+    "write_failed", "unresolved_recorded", "plan_created", "blackbox_blocked",
+)
+
+
+@pytest.fixture()
+def conn(tmp_path):
+    c = connect(tmp_path / "events.sqlite3")
+    yield c
+    c.close()
+
+
+def _seed(conn, seed: int, n: int = 600) -> None:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        rows.append(
+            make_event(
+                event_hash=f"s{seed}-{i}",
+                created_at=T0 + rng.randint(0, SPAN),
+                run_id=rng.choice(["r1", "r2", "r3", None]),
+                event_type=rng.choice(TYPES),
+                domain=rng.choice(["sync", "scrobble"]),
+                source_kind=rng.choice([None, "webhook", "watcher"]),
+                severity=rng.choice(["info", "error"]),
+                reason_code=rng.choice([None, "", "http_404", "not_found", "rate_limited"]),
+                source_provider="PLEX",
+                destination_provider=rng.choice(["TRAKT", "SIMKL"]),
+            )
+        )
+    for start in range(0, n, 97):
+        record_events(rows[start:start + 97], conn=conn)
+    for i in range(40):
+        started = T0 + rng.randint(0, SPAN)
+        record_run_started(f"run-{i}", started_at=started, conn=conn)
+        if rng.random() < 0.8:
+            dur = rng.choice([rng.randint(0, 60), rng.randint(60, 4000)])
+            record_run_finished(f"run-{i}", finished_at=started + dur, summary={"errors": rng.choice([0, 0, 2])}, conn=conn)
+
+
+def _raw(conn, since: int, until: int, bucket: int, monkeypatch) -> dict[str, Any]:
+    with monkeypatch.context() as m:
+        m.setattr(rollups, "windows", lambda a, b, bs=None: [(0, int(a), int(b))] if a < b else [])
+        return _compute(conn, since, until, bucket)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_rollups_match_raw_scans_on_unaligned_ranges(conn, monkeypatch, seed):
+    _seed(conn, seed)
+    rng = random.Random(seed)
+    for _ in range(6):
+        since = T0 + rng.randint(-rollups.HOUR, SPAN // 2)
+        until = since + rng.randint(rollups.HOUR // 2, SPAN)
+        bucket = rng.choice([rollups.HOUR, rollups.DAY, 900, 7 * rollups.DAY])
+        assert _compute(conn, since, until, bucket) == _raw(conn, since, until, bucket, monkeypatch)
+
+
+def test_windows_cover_the_range_with_aligned_rollups():
+    since, until = T0 + 1234, T0 + 3 * rollups.DAY + 7 * rollups.HOUR + 5
+    spans = rollups.windows(since, until)
+    assert spans[0][1] == since and spans[-1][2] == until
+    assert all(a[2] == b[1] for a, b in zip(spans, spans[1:]))
+    assert {g for g, _, _ in spans} == {0, rollups.HOUR, rollups.DAY}
+    assert all(a % g == 0 and b % g == 0 for g, a, b in spans if g)
+    assert {g for g, _, _ in rollups.windows(since, until, rollups.HOUR)} == {0, rollups.HOUR}
+    assert {g for g, _, _ in rollups.windows(since, until, 900)} == {0}
+
+
+def test_percentiles_are_exact_for_short_runs_and_close_for_long_ones(conn):
+    rng = random.Random(7)
+    short = [rng.randint(0, 60) for _ in range(150)]
+    long = [rng.randint(120, 20000) for _ in range(150)]
+    for i, dur in enumerate(short + long):
+        started = T0 + i * 600
+        record_run_started(f"run-{i}", started_at=started, conn=conn)
+        record_run_finished(f"run-{i}", finished_at=started + dur, conn=conn)
+
+    def exact(values: list[int], p: float) -> int:
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(math.floor(p * (len(ordered) - 1))))]
+
+    half = T0 + 150 * 600
+    p_short = _compute(conn, T0, half, rollups.HOUR)["duration_percentiles"]
+    assert p_short == {"p50": exact(short, 0.5), "p90": exact(short, 0.9), "p99": exact(short, 0.99)}
+    p_long = _compute(conn, half, T0 + 300 * 600, rollups.HOUR)["duration_percentiles"]
+    for key, p in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+        assert abs(p_long[key] - exact(long, p)) <= exact(long, p) * 0.02
+
+
+def test_incremental_rollups_equal_a_rebuild(conn):
+    _seed(conn, 11, 300)
+    record_run_started("run-0", started_at=T0 + 5 * rollups.DAY, conn=conn)
+    snapshot = lambda: (  # noqa: E731
+        sorted(tuple(r) for r in conn.execute("SELECT * FROM stats_event_rollups")),
+        sorted(tuple(r) for r in conn.execute("SELECT * FROM stats_run_rollups")),
+    )
+    incremental = snapshot()
+    with conn:
+        rollups.reset(conn)
+    rollups.sync(conn)
+    assert snapshot() == incremental
+
+
+def test_failed_fold_keeps_the_events_but_none_of_its_rollups(conn, monkeypatch):
+    real = rollups.fold_new_events
+
+    def _half_fold(c):
+        real(c)
+        raise RuntimeError("boom after writing rollups")
+
+    monkeypatch.setattr(rollups, "fold_new_events", _half_fold)
+    ev = make_event(event_hash="h1", created_at=T0, event_type="scrobble_completed", domain="scrobble")
+    assert record_events([ev], conn=conn) == 1
+    assert conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 1
+    assert conn.execute("SELECT COUNT(*) FROM stats_event_rollups").fetchone()[0] == 0
+
+    monkeypatch.setattr(rollups, "fold_new_events", real)
+    assert rollups.fold_new_events(conn) == 1
+    assert conn.execute("SELECT COUNT(*) FROM stats_event_rollups").fetchone()[0] > 0
@@ -0,0 +1,147 @@
+# tests/test_guard_state_store.py
+# CrossWatch - SQLite guard state (tombstones, blackbox, phantoms, unresolved) tests
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from cw_platform.local_db import guard_state
+from cw_platform.local_db.legacy_files import legacy_root
+from cw_platform.orchestrator import _blackbox, _phantoms, _tombstones, _unresolved
+from cw_platform.orchestrator._state_store import StateStore
+
+
+@pytest.fixture()
+def state_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    d = tmp_path / ".cw_state"
+    d.mkdir()
+    monkeypatch.setattr(_blackbox, "STATE_DIR", d)
+    monkeypatch.setattr(_unresolved, "STATE_DIR", d)
+    monkeypatch.setattr(_phantoms, "_DIR", str(d))
+    monkeypatch.setenv("CW_PAIR_SCOPE", "p1")
+    return d
+
+
+def _dbg(*_a, **_k) -> None:
+    return None
+
+
+def test_legacy_files_are_imported_once_and_moved(state_dir: Path) -> None:
+    now = int(time.time())
+    files = {
+        "tombstones.json": {"keys": {"watchlist:A-B|imdb:tt1": now, "watchlist:A-B|movie|title:x|year:2000": now}},
+        "dst_watchlist.p1.blackbox.json": {"imdb:tt2": {"reason": "flapper", "since": now}},
+        "dst_watchlist.p1.flap.json": {"imdb:tt3": {"consecutive": 2, "last_op": "add", "last_attempt_ts": now}},
+        "dst_watchlist.unresolved.pending.p1.json": {
+            "keys": ["imdb:tt4"],
+            "items": {"imdb:tt4": {"type": "movie", "title": "Four", "ids": {"imdb": "tt4"}}},
+            "hints": {"imdb:tt4": {"reason": "not_found", "ts": now}},
+        },
+        "watchlist.src-dst.p1.last_success.json": {"imdb:tt5": now},
+        "dst_watchlist.unresolved.json": {"imdb:tt6": {"reason": "provider"}},
+    }
+    for name, data in files.items():
+        (state_dir / name).write_text(json.dumps(data), encoding="utf-8")
+
+    assert _blackbox.load_blackbox_keys("DST", "watchlist") == {"imdb:tt2"}
+    assert _blackbox.load_flap_counters("DST", "watchlist")["imdb:tt3"]["consecutive"] == 2
+    pending = _unresolved.load_unresolved_pending("DST", "watchlist")
+    assert pending == [{"key": "imdb:tt4", "reason": "not_found", "feature": "watchlist", "item": files["dst_watchlist.unresolved.pending.p1.json"]["items"]["imdb:tt4"]}]
+    assert _unresolved.load_unresolved_keys("DST") == {"imdb:tt4", "imdb:tt6"}
+
+    store = StateStore(state_dir.parent)
+    assert set(_tombstones.keys_for_feature(store, "watchlist", pair="a-b")) == {"imdb:tt1", "movie|title:x|year:2000"}
+    guard = _phantoms.PhantomGuard("SRC", "DST", "watchlist", ttl_days=7)
+    adds = [{"ids": {"imdb": "tt5"}}, {"ids": {"imdb": "tt7"}}]
+    keep, blocked = guard.filter_adds(adds, lambda it: f"imdb:{it['ids']['imdb']}", dict, _dbg, store, "SRC-DST")
+    assert blocked == 1 and keep == [adds[1]]
+
+    moved = legacy_root(state_dir.parent) / ".cw_state"
+    # Provider-written blocking files stay on disk (and keep their scoped copy).
+    assert sorted(p.name for p in state_dir.iterdir()) == ["dst_watchlist.unresolved.json", "dst_watchlist.unresolved.p1.json"]
+    assert {p.name for p in moved.iterdir()} == set(files) - {"dst_watchlist.unresolved.json"}
+    assert guard_state.import_legacy_files(state_dir.parent, state_dir, force=True) == 0
+
+
+def test_provider_owned_blackbox_files_are_left_in_place(state_dir: Path) -> None:
+    now = int(time.time())
+    owned = [
+        "jellyfin_history.jellyfin.blackbox.json",
+        "jellyfin_history.jellyfin-plex.blackbox.json",
+        "emby_history.emby.blackbox.json",
+        "emby_history.emby.p1.blackbox.json",
+        "plex_watched.p1.blackbox.json",
+    ]
+    for name in owned:
+        (state_dir / name).write_text(json.dumps({"tmdb:1": {"reason": "provider", "since": now}}), encoding="utf-8")
+    (state_dir / "jellyfin_history.p1.blackbox.json").write_text(json.dumps({"tmdb:2": {"since": now}}), encoding="utf-8")
+
+    assert guard_state.import_legacy_files(state_dir.parent, state_dir, force=True) == 1
+    assert sorted(p.name for p in state_dir.iterdir()) == sorted(owned)
+    assert _blackbox.load_blackbox_keys("JELLYFIN", "history") == {"tmdb:2"}
+    for prov in ("jellyfin", "emby", "plex"):
+        assert guard_state.load_keys(state_dir.parent, guard_state.BLACKBOX, provider=prov, feature="history", scopes=["jellyfin", "jellyfin-plex", "emby"]) == set()
+    assert guard_state.count_groups(state_dir.parent, guard_state.BLACKBOX) == 1
+
+
+def test_attempts_promote_in_batches_and_prune_is_one_delete(state_dir: Path) -> None:
+    cfg = {"promote_after": 2, "pair_scoped": True, "enabled": True}
+    keys = [f"imdb:tt{i}" for i in range(600)]
+    first = _blackbox.record_attempts("DST", "history", keys + keys[:3], pair="SRC-DST", cfg=cfg)
+    assert first["count"] == 603 and first["promoted"] == 0
+    second = _blackbox.record_attempts("DST", "history", keys[:450], pair="SRC-DST", cfg=cfg)
+    assert second["promoted"] == 450 and second["promoted_keys"][:2] == ["imdb:tt0", "imdb:tt1"]
+    assert _blackbox.record_attempts("DST", "history", keys[:2], pair="SRC-DST", cfg=cfg)["promoted"] == 0
+
+    assert _blackbox.load_blackbox_keys("DST", "history", pair="SRC-DST") == set(keys[:450])
+    assert _blackbox.load_blackbox_keys("DST", "history") == set()
+    _blackbox.record_success("DST", "history", keys[:1])
+    flaps = _blackbox.load_flap_counters("DST", "history")
+    assert flaps["imdb:tt0"]["consecutive"] == 0 and flaps["imdb:tt0"]["last_op"] == "add"
+    assert flaps["imdb:tt1"]["consecutive"] == 3
+
+    base = state_dir.parent
+    conn = guard_state.get_conn(base)
+    with conn:
+        conn.execute("UPDATE sync_guard_entries SET ts=? WHERE kind='blackbox' AND item_key IN ('imdb:tt0','imdb:tt1')", (int(time.time()) - 40 * 86400,))
+    assert _blackbox.prune_blackbox(cooldown_days=30) == (1, 2)
+    assert len(_blackbox.load_blackbox_keys("DST", "history", pair="SRC-DST")) == 448
+    assert not list(state_dir.glob("*.json"))
+
+
+def test_tombstones_use_row_level_store_methods(state_dir: Path) -> None:
+    store = StateStore(state_dir.parent)
+    item = {"type": "movie", "title": "A", "year": 2000, "ids": {"imdb": "tt1"}}
+    assert _tombstones.add_keys_for_feature(store, _dbg, "Watchlist", ["imdb:tt1", "imdb:tt2"], pair="a-b") == 2
+    assert _tombstones.add_keys_for_feature(store, _dbg, "watchlist", ["imdb:tt1"], pair="A-B") == 0
+    assert _tombstones.add_keys_for_feature(store, _dbg, "watchlist", ["imdb:tt9"]) == 0
+    assert set(store.tomb_keys("watchlist", "A-B", keys=["imdb:tt2", "imdb:tt404"])) == {"imdb:tt2"}
+    assert _tombstones.clear_items_for_feature(store, _dbg, "watchlist", [item], pair="A-B") == 1
+
+    tomb = store.load_tomb()
+    assert set(tomb["keys"]) == {"watchlist:A-B|imdb:tt2"}
+    tomb["keys"]["history:A-B|imdb:tt3"] = 1
+    store.save_tomb(tomb)
+    assert _tombstones.keys_for_feature(store, "history", pair="A-B") == {"imdb:tt3": 1}
+    assert _tombstones.prune(store, _dbg, older_than_secs=3600) == 1
+    assert set(store.load_tomb()["keys"]) == {"watchlist:A-B|imdb:tt2"}
+    assert store.load_tomb()["pruned_at"]
+
+
+def test_unresolved_pending_rows_keep_specific_hints(state_dir: Path) -> None:
+    item = {"type": "movie", "title": "C", "year": 2002, "ids": {"imdb": "tt3"}}
+    res = _unresolved.record_unresolved("DST", "watchlist", [item, "imdb:tt4"], hint="not_found")
+    assert res["ok"] and res["count"] == 2
+    again = _unresolved.record_unresolved("DST", "watchlist", [item], hint="apply:add:failed")
+    assert again["count"] == 0
+    hints = _unresolved.load_unresolved_map("DST", "watchlist", cross_features=False)
+    assert hints["imdb:tt3"]["reason"] == "not_found" and set(hints) == {"imdb:tt3", "imdb:tt4"}
+    assert [r["key"] for r in _unresolved.load_unresolved_items("DST")] == ["imdb:tt3", "imdb:tt4"]
+
+    assert _unresolved.clear_unresolved("DST", "watchlist", ["imdb:tt3"])["count"] == 1
+    assert _unresolved.load_unresolved_keys("DST") == {"imdb:tt4"}
+    assert not list(state_dir.glob("*.json"))
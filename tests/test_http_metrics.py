@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from cw_platform import http_metrics
+from cw_platform.local_db import close_conn
+from cw_platform.local_db.http_latency import load_http_latency
+
+
+@pytest.fixture()
+def isolated_db(tmp_path, monkeypatch):
+    monkeypatch.setenv("CROSSWATCH_DB", str(tmp_path / "crosswatch.sqlite3"))
+    close_conn()
+    yield tmp_path
+    close_conn()
+
+
+@pytest.fixture()
+def metrics(monkeypatch):
+    m = http_metrics.HttpMetrics()
+    monkeypatch.setattr(http_metrics, "METRICS", m)
+    return m
+
+
+def test_histogram_quantiles_stay_within_bucket_error():
+    h = http_metrics.LatencyHistogram()
+    for ms in range(1, 1001):
+        h.add(ms)
+    assert h.n == 1000 and h.max_ms == 1000
+    for q, want in ((0.5, 500), (0.95, 950), (0.99, 990)):
+        got = h.quantile(q)
+        assert got is not None and abs(got - want) / want < 0.2
+    again = http_metrics.LatencyHistogram.decode(h.encode(), n=h.n, sum_ms=h.sum_ms, max_ms=h.max_ms)
+    assert again.quantile(0.95) == h.quantile(0.95)
+    assert http_metrics.LatencyHistogram().quantile(0.5) is None
+
+
+@pytest.mark.parametrize(
+    "url,route",
+    [
+        ("https://api.trakt.tv/sync/history/movies?page=2", "/sync/history/movies"),
+        ("https://api.themoviedb.org/3/movie/603", "/3/movie/:id"),
+        ("http://plex:32400/library/metadata/12345/children", "/library/metadata/:id/children"),
+        ("https://api.trakt.tv/search/imdb/tt0133093", "/search/imdb/:id"),
+        ("http://jf/Users/0f8fad5bd9cb469fa16570867728950e/Items", "/Users/:id/Items"),
+    ],
+)
+def test_route_template_collapses_ids(url: str, route: str):
+    assert http_metrics.route_template(url) == route
+
+
+def test_summary_groups_per_endpoint(metrics):
+    for ms in (10, 20, 30, 40, 400):
+        metrics.record("TRAKT", method="get", url="https://api.trakt.tv/users/me/watchlist", status=200, ms=ms)
+    metrics.record("TRAKT", method="GET", url="https://api.trakt.tv/users/me/watchlist", status=429, ms=5)
+    metrics.note_retry("TRAKT", method="GET", url="https://api.trakt.tv/users/me/watchlist", status=429)
+    metrics.record("SIMKL", method="POST", url="https://api.simkl.com/sync/add-to-list", status=201, ms=100, instance="P01")
+
+    rows = http_metrics.summary(minutes=5)
+    ok = next(r for r in rows if r["provider"] == "TRAKT" and r["status_class"] == "2xx")
+    assert ok["count"] == 5 and ok["route"] == "/users/me/watchlist" and ok["max_ms"] == 400
+    assert ok["p50_ms"] <= ok["p95_ms"] <= ok["p99_ms"]
+    throttled = next(r for r in rows if r["provider"] == "TRAKT" and r["status_class"] == "4xx")
+    assert throttled["errors"] == 1 and throttled["retries"] == 1
+    assert [r["instance"] for r in http_metrics.summary(minutes=5, provider="simkl")] == ["P01"]
+
+
+def test_flush_persists_and_merges_rollups(isolated_db, metrics):
+    metrics.enable_persistence(background=False)
+    past = time.time() - 120
+    for ms in (10, 20):
+        metrics.record("PLEX", method="GET", url="http://plex/library/sections/1/all", status=200, ms=ms, ts=past)
+    assert metrics.flush() == 1
+    metrics.record("PLEX", method="GET", url="http://plex/library/sections/2/all", status=200, ms=30, ts=past)
+    metrics.flush()
+
+    stored = load_http_latency(None, since_minute=int(past // 60) - 1, provider="PLEX", instance=None)
+    assert len(stored) == 1
+    assert stored[0]["count"] == 3 and stored[0]["ms_max"] == 30 and stored[0]["route"] == "/library/sections/:id/all"
+
+    metrics.record("PLEX", method="GET", url="http://plex/library/sections/3/all", status=200, ms=40)
+    rows = http_metrics.summary(minutes=10, provider="PLEX")
+    assert sum(r["count"] for r in rows) == 4
+
+
+def test_hit_session_records_requests_and_retries(metrics, monkeypatch):
+    from providers.sync import _mod_common
+
+    class _Resp:
+        def __init__(self, status: int) -> None:
+            self.status_code = status
+            self.headers = {"Content-Length": "12"}
+            self.request = None
+
+    statuses = iter((503, 200))
+    monkeypatch.setattr(_mod_common.requests.Session, "request", lambda self, method, url, **kw: _Resp(next(statuses)))
+    monkeypatch.setattr(_mod_common.time, "sleep", lambda *_: None)
+
+    sess = _mod_common.build_session("TRAKT", None, instance="P02")
+    resp = _mod_common.request_with_retries(sess, "GET", "https://api.trakt.tv/sync/watchlist/movies", max_retries=2)
+    assert resp.status_code == 200
+
+    rows = {r["status_class"]: r for r in http_metrics.summary(minutes=5, provider="TRAKT")}
+    assert rows["5xx"]["count"] == 1 and rows["5xx"]["retries"] == 1
+    assert rows["2xx"]["count"] == 1 and rows["2xx"]["bytes_in"] == 12
+    assert {r["instance"] for r in rows.values()} == {"P02"}
+
+
+def test_provider_sessions_report_the_selected_instance(monkeypatch):
+    from cw_platform.provider_instances import build_pair_config_view
+    from providers.sync._mod_TRAKT import TRAKTModule
+
+    cfg = {
+        "trakt": {"client_id": "c", "access_token": "t", "instances": {"P02": {"access_token": "t2"}}},
+        "simkl": {"access_token": "s"},
+    }
+    pair = build_pair_config_view(cfg, "SIMKL", None, "TRAKT", "P02")
+    assert set(pair) == set(cfg)
+    monkeypatch.setenv("CW_PAIR_SRC", "SIMKL")
+    monkeypatch.setenv("CW_PAIR_SRC_INSTANCE", "default")
+    monkeypatch.setenv("CW_PAIR_DST", "TRAKT")
+    monkeypatch.setenv("CW_PAIR_DST_INSTANCE", "P02")
+    assert TRAKTModule(pair, connect=False).client.session.cw_instance == "P02"
+    monkeypatch.setenv("CW_PAIR_DST", "PLEX")
+    assert TRAKTModule(cfg, connect=False).client.session.cw_instance == "default"
+
+
+def test_plex_watcher_token_discovery_is_recorded(metrics, monkeypatch):
+    import requests
+    from requests.adapters import BaseAdapter
+
+    from providers.scrobble.plex import watch
+
+    class _Adapter(BaseAdapter):
+        def send(self, request, **kwargs):
+            resp = requests.Response()
+            resp.status_code, resp.request, resp.url = 200, request, request.url
+            resp._content = b'<MediaContainer><Device provides="server" clientIdentifier="m1" accessToken="pms"/></MediaContainer>'
+            return resp
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(watch._HTTP, "adapters", {"https://": _Adapter()})
+    cfg = {"plex": {"machine_id": "m1"}}
+    assert watch._try_discover_pms_token(cfg, "https://pms.local:32400", "cloud") == ("pms", "m1")
+    rows = http_metrics.summary(minutes=5)
+    assert [(r["provider"], r["route"], r["count"]) for r in rows] == [("PLEX", "/api/resources", 1)]
+
+
+def test_retry_only_series_respect_the_series_cap(metrics, monkeypatch):
+    monkeypatch.setattr(http_metrics, "_MAX_SERIES", 3)
+    old = time.time() - 600
+    metrics.record("TRAKT", method="GET", url="https://api.trakt.tv/a", status=200, ms=1, ts=old)
+    for i in range(5):
+        metrics.note_retry("TRAKT", method="GET", url=f"https://api.trakt.tv/r{i}", status=429)
+    assert len(metrics._series) <= 3
+    assert all(k[0] > int(old // 60) for k in metrics._series)
+
+
+def test_flush_merges_buckets_with_one_read(isolated_db, metrics):
+    from cw_platform.local_db import get_conn
+    from cw_platform.local_db.http_latency import merge_http_latency
+
+    row = {"minute": 5, "provider": "PLEX", "instance": "default", "method": "GET", "route": "/a", "status_class": "2xx",
+           "count": 1, "ms_sum": 10, "ms_max": 10, "buckets": "3:1"}
+    merge_http_latency(None, [row, {**row, "route": "/b"}])
+    statements: list[str] = []
+    get_conn(None).set_trace_callback(statements.append)
+    try:
+        assert merge_http_latency(None, [row, {**row, "route": "/b"}, {**row, "route": "/c", "buckets": "4:2"}]) == 3
+    finally:
+        get_conn(None).set_trace_callback(None)
+    assert sum(1 for q in statements if q.lstrip().upper().startswith("SELECT")) == 1
+    stored = {r["route"]: r for r in load_http_latency(None, provider="PLEX")}
+    assert stored["/a"]["count"] == 2 and stored["/a"]["buckets"] == "3:2" and stored["/c"]["buckets"] == "4:2"
+
+
+def test_insights_http_endpoint(metrics):
+    from api.insightAPI import register_insights
+
+    metrics.record("TMDB", method="GET", url="https://api.themoviedb.org/3/tv/1399", status=200, ms=80)
+    app = FastAPI()
+    register_insights(app)
+    body: dict[str, Any] = TestClient(app).get("/api/insights/http", params={"minutes": 15}).json()
+    assert body["ok"] is True
+    assert body["endpoints"][0]["route"] == "/3/tv/:id"
+    assert body["endpoints"][0]["count"] == 1
@@ -1224,3 +1224,99 @@ def test_options_reports_whether_each_target_is_connected(monkeypatch: pytest.Mo
 
     monkeypatch.setattr(importer, "load_config", lambda: {"crosswatch": {"connected": True}})
     assert importer.api_import_options()["targets"] == [{"id": "default", "label": "Default", "connected": True}]
+
+
+def test_json_array_rows_stream_across_read_boundaries(monkeypatch: pytest.MonkeyPatch) -> None:
+    import json
+
+    import services.importer as importer
+
+    monkeypatch.setattr(importer, "JSON_READ_CHARS", 7)
+    rows = [{"title": f"Movie {i}", "ids": {"tmdb": 1000 + i}, "rating": 7.5, "note": "a, b ] c"} for i in range(25)]
+    member = importer._as_members([("ratings.json", json.dumps(rows, indent=1).encode("utf-8"))])[0]
+
+    assert list(importer._json_member_rows(member)) == rows
+
+
+def test_shape_rows_builds_the_existing_index_once_and_matches_on_any_id(monkeypatch: pytest.MonkeyPatch) -> None:
+    import services.importer as importer
+
+    calls: list[str] = []
+
+    def existing(_cfg: Any, inst: str) -> dict[str, Any]:
+        calls.append(inst)
+        return {
+            "history": {},
+            "ratings": {"tmdb:949": {"type": "movie", "ids": {"tmdb": "949", "imdb": "tt0113277"}, "rating": 8}},
+            "watchlist": {},
+        }
+
+    monkeypatch.setattr(importer, "_existing_keys", existing)
+    monkeypatch.setattr(importer, "MATCH_BATCH_SIZE", 2)
+
+    assert importer._shape_rows(iter([]), {}, "default", "imdb") == []
+    assert calls == []
+
+    raw = [
+        {"feature": "ratings", "item": {"type": "movie", "title": "Heat", "ids": {"imdb": "tt0113277"}, "rating": 8}},
+        {"feature": "watchlist", "item": {"type": "movie", "title": "Heat", "ids": {"imdb": "tt0113277"}}},
+        {"feature": "ratings", "item": {"type": "movie", "title": "New", "ids": {"imdb": "tt0000001"}, "rating": 5}},
+    ]
+    rows = importer._shape_rows(iter(raw), {}, "default", "imdb")
+
+    assert calls == ["default"]
+    assert [row["status"] for row in rows] == ["exists", "ready", "ready"]
+
+
+def test_preview_spools_upload_and_reports_progress(monkeypatch: pytest.MonkeyPatch) -> None:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    import services.importer as importer
+
+    monkeypatch.setattr(importer, "load_config", lambda: {})
+    monkeypatch.setattr(importer, "_existing_keys", lambda _cfg, _inst: {f: {} for f in importer.FEATURES})
+    app = FastAPI()
+    app.include_router(importer.router)
+    client = TestClient(app)
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(
+            "watched-history-1.json",
+            b'[{"id": 1, "watched_at": "2026-01-01T00:00:00Z", "type": "movie", "movie": {"title": "Heat", "ids": {"tmdb": 949}}}]',
+        )
+        zf.writestr("ratings-movies.json", b'[{"rated_at": "2026-01-02T00:00:00Z", "rating": 9, "type": "movie", "movie": {"title": "Heat", "ids": {"tmdb": 949}}}]')
+
+    try:
+        res = client.post(
+            "/api/import/preview",
+            files={"file": ("trakt-export.zip", buf.getvalue(), "application/zip")},
+            data={"source": "trakt", "progress_id": "progress-test-01"},
+        )
+        assert res.status_code == 200, res.text
+        data = res.json()
+        assert data["total"] == 2
+        assert data["progress"]["done"] is True
+
+        progress = client.get("/api/import/progress/progress-test-01").json()
+        assert progress["import_id"] == data["import_id"]
+        assert progress["files_total"] == progress["files_done"] == 2
+        assert progress["rows"] == 2
+        assert progress["ready"] == 2
+        assert client.get("/api/import/progress/unknown-progress").status_code == 404
+    finally:
+        importer._PREVIEWS.clear()
+        importer._PROGRESS.clear()
+
+
+def test_member_encoding_sees_latin1_bytes_past_the_sniff_window() -> None:
+    import services.importer as importer
+
+    data = b"title,year\n" + b"a,2000\n" * (importer.TEXT_SNIFF_BYTES // 7 + 10) + "Amélie,2001\n".encode("latin-1")
+    member = importer._ImportMember(name="w.csv", opener=lambda: io.BytesIO(data), size=len(data))
+    assert importer._member_encoding(member) == "latin-1"
+    with importer._member_text(member) as text:
+        assert text.read().endswith("Amélie,2001\n")
+    utf8 = importer._ImportMember(name="u.csv", opener=lambda: io.BytesIO("Amélie,2001\n".encode()), size=13)
+    assert importer._member_encoding(utf8) == "utf-8-sig"
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import json
+import threading
+import time
 from typing import Any
 
 import pytest
+from websockets.sync.server import serve
 
 from providers.auth._auth_KODI import KodiAuthError
 from providers.scrobble.mdblist import sink as mdblist_sink
@@ -496,3 +500,125 @@ def test_anidb_scraped_episode_scrobbles_as_anime(monkeypatch):
     assert ev.ids["anidb_show"] == "17969"
     assert ev.ids["tvdb_show"] == "393478"
     assert simkl_sink._show_ids(ev)["anidb"] == "17969"
+
+
+class FakeKodi:
+    """Stateful JSON-RPC stand-in; the notification server flips its player state."""
+
+    def __init__(self) -> None:
+        self.playing: dict[str, Any] | None = None
+        self.calls: list[str] = []
+
+    def __call__(self, method: str, params: dict[str, Any] | None = None) -> Any:
+        self.calls.append(method)
+        if method == "Player.GetActivePlayers":
+            return active() if self.playing else []
+        if method == "Player.GetItem":
+            return {"item": movie_item()}
+        if method == "Player.GetProperties":
+            return props(**self.playing) if self.playing else props(0, 0)
+        if method == "Profiles.GetCurrentProfile":
+            return profile()
+        raise AssertionError(f"Unexpected Kodi RPC call: {method}")
+
+    def count(self, method: str) -> int:
+        return self.calls.count(method)
+
+
+class StubKodiNotifier:
+    """Local Kodi websocket that applies each state change and then announces it."""
+
+    def __init__(self, kodi: FakeKodi, script: list[tuple[float, str, dict[str, Any] | None]]) -> None:
+        self.kodi = kodi
+        self.script = script
+        self.connections = 0
+        self._server = serve(self._handle, "127.0.0.1", 0)
+        self.port = self._server.socket.getsockname()[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def _handle(self, conn: Any) -> None:
+        self.connections += 1
+        t0 = time.monotonic()
+        for offset, method, state in self.script:
+            time.sleep(max(0.0, t0 + offset - time.monotonic()))
+            self.kodi.playing = state
+            data: dict[str, Any] = {"item": {"id": 42, "type": "movie"}}
+            if method != "Player.OnStop":
+                data["player"] = {"playerid": 1, "speed": (state or {}).get("speed", 0)}
+            conn.send(json.dumps({"jsonrpc": "2.0", "method": method, "params": {"data": data, "sender": "xbmc"}}))
+        try:
+            conn.recv(timeout=10)
+        except Exception:
+            return
+
+    def close(self) -> None:
+        self._server.shutdown()
+
+
+def _notify_service(kodi: FakeKodi, port: int, transport: str = "auto") -> tuple[KodiWatchService, FakeDispatcher]:
+    overrides = {"server": "http://127.0.0.1:8080", "notification_port": port, "watch_transport": transport}
+    service, disp = svc(kodi, kodi_overrides=overrides)  # type: ignore[arg-type]
+    return service, disp
+
+
+def _run_for(service: KodiWatchService, seconds: float) -> None:
+    service.start_async()
+    time.sleep(seconds)
+    service.stop()
+
+
+def test_notifications_drive_transitions_without_polling(monkeypatch):
+    monkeypatch.setattr(kodi_watch, "_cw_update", lambda *a, **k: None)
+    monkeypatch.setattr(kodi_watch, "_cw_update_payload", lambda *a, **k: None)
+    kodi = FakeKodi()
+    server = StubKodiNotifier(
+        kodi,
+        [
+            (0.2, "Player.OnPlay", {"speed": 1, "percentage": 10.0}),
+            (0.4, "Player.OnPause", {"speed": 0, "percentage": 11.0}),
+            (0.6, "Player.OnResume", {"speed": 1, "percentage": 11.0}),
+            (0.8, "Player.OnStop", None),
+        ],
+    )
+    try:
+        service, disp = _notify_service(kodi, server.port)
+        _run_for(service, 1.4)
+    finally:
+        server.close()
+
+    assert [e.action for e in disp.events] == ["start", "pause", "start", "stop"]
+    # One resync on connect and one check on OnStop; no per-tick polling in between.
+    assert kodi.count("Player.GetActivePlayers") == 2
+    assert kodi.count("Player.GetItem") == 1
+    assert kodi.count("Player.GetProperties") == 3
+    assert not service._sessions
+
+
+def test_notifications_refresh_progress_while_playing(monkeypatch):
+    monkeypatch.setattr(kodi_watch, "_cw_update", lambda *a, **k: None)
+    monkeypatch.setattr(kodi_watch, "NOTIFY_PROGRESS_REFRESH_SECONDS", 0.3)
+    kodi = FakeKodi()
+    server = StubKodiNotifier(kodi, [(0.1, "Player.OnAVStart", {"speed": 1, "percentage": 10.0})])
+    try:
+        service, disp = _notify_service(kodi, server.port, "websocket")
+        _run_for(service, 1.1)
+    finally:
+        server.close()
+
+    assert [e.action for e in disp.events] == ["start"]
+    assert 2 <= kodi.count("Player.GetProperties") - 1 <= 4
+    assert kodi.count("Player.GetActivePlayers") == 1
+
+
+def test_notification_socket_refused_falls_back_to_polling(monkeypatch):
+    monkeypatch.setattr(kodi_watch, "_cw_update", lambda *a, **k: None)
+    kodi = FakeKodi()
+    kodi.playing = {"speed": 1, "percentage": 20.0}
+    service, disp = _notify_service(kodi, 9)
+    _run_for(service, 0.5)
+
+    assert service._notify_failures == 1
+    assert service._notify_retry_at > time.monotonic()
+    assert service.transport == "poll"
+    assert kodi.count("Player.GetActivePlayers") >= 1
+    assert [e.action for e in disp.events] == ["start"]
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping
+from typing import Any
+
+import pytest
+
+from cw_platform import startup_profile
+from cw_platform.orchestrator import _providers, _snapshots
+from providers.sync._mod_common import lazy_module
+from services.playback_progress.service import PlaybackProgressService
+
+
+class _Ops:
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def name(self) -> str:
+        return self._name
+
+    def label(self) -> str:
+        return self._name.title()
+
+    def features(self) -> Mapping[str, bool]:
+        return {"watchlist": True}
+
+    def capabilities(self) -> Mapping[str, Any]:
+        return {}
+
+    def build_index(self, cfg: Mapping[str, Any], *, feature: str) -> Mapping[str, dict[str, Any]]:
+        return {f"imdb:tt{self._name}": {"type": "movie", "ids": {"imdb": f"tt{self._name}"}}}
+
+    def add(self, *a: Any, **k: Any) -> Any:
+        return {}
+
+    def remove(self, *a: Any, **k: Any) -> Any:
+        return {}
+
+
+@pytest.fixture()
+def registry(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    loads: list[str] = []
+
+    def load(name: str) -> Any:
+        loads.append(name)
+        return None if name == "BROKEN" else _Ops(name)
+
+    monkeypatch.setattr(_providers, "sync_provider_names", lambda upper=True: ["PLEX", "TRAKT", "SIMKL", "BROKEN"])
+    monkeypatch.setattr(_providers, "load_sync_ops", load)
+    return loads
+
+
+def test_lazy_module_imports_on_first_attribute(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pkg = tmp_path / "cw_lazy_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "_feat.py").write_text("def answer():\n    return 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    feat = lazy_module("._feat", "cw_lazy_pkg")
+    assert "cw_lazy_pkg._feat" not in sys.modules
+    assert feat.answer() == 42
+    assert "cw_lazy_pkg._feat" in sys.modules
+    with pytest.raises(ModuleNotFoundError):
+        lazy_module("cw_lazy_pkg._missing")
+
+
+def test_required_lazy_module_fails_at_bind_time(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pkg = tmp_path / "cw_lazy_req"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "_ok.py").write_text("VALUE = 1\n")
+    (pkg / "_broken.py").write_text("import cw_lazy_req_dependency_that_is_missing\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    ok = lazy_module("._ok", "cw_lazy_req", required=True)
+    assert "cw_lazy_req._ok" in sys.modules and ok.VALUE == 1
+    with pytest.raises(ModuleNotFoundError, match="cw_lazy_req_dependency_that_is_missing"):
+        lazy_module("._broken", "cw_lazy_req", required=True)
+
+
+def test_broken_optional_feature_degrades_instead_of_raising_mid_sync(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from providers.sync import _mod_TRAKT
+
+    pkg = tmp_path / "cw_lazy_opt"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "_history.py").write_text("import cw_lazy_opt_dependency_that_is_missing\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    logged: list[tuple[Any, ...]] = []
+    monkeypatch.setattr("providers.sync._mod_common.cw_log", lambda *a, **k: logged.append((*a, k.get("module"))))
+
+    feat = lazy_module("._history", "cw_lazy_opt")
+    assert "cw_lazy_opt._history" not in sys.modules
+    monkeypatch.setitem(_mod_TRAKT._FEATURES, "history", feat)
+    trakt = _mod_TRAKT.TRAKTModule({"trakt": {"client_id": "c", "access_token": "t"}}, connect=False)
+    monkeypatch.setattr(trakt, "_is_enabled", lambda feature: True)
+
+    assert trakt.build_index("history") == {}
+    assert trakt.add("history", [{"type": "movie", "ids": {"imdb": "tt1"}}])["count"] == 0
+    assert not feat and "unavailable" in repr(feat)
+    with pytest.raises(ImportError, match="unavailable"):
+        feat.build_index
+    assert logged == [("CW_LAZY_OPT", "history", "error", "feature_unavailable", "cw_lazy_opt._history")]
+
+
+def test_sync_providers_load_only_what_is_looked_up(registry: list[str]) -> None:
+    provs = _providers.load_sync_providers()
+    assert list(provs) == ["PLEX", "TRAKT", "SIMKL", "BROKEN"]
+    assert "trakt" in provs and "BROKEN" in provs and "NOPE" not in provs and 1 not in provs
+    assert registry == []
+    assert provs.get("trakt").name() == "TRAKT"
+    assert provs.get("BROKEN") is None and provs.get("NOPE") is None
+    assert "PLEX" not in registry
+    provs.get("TRAKT")
+    assert registry == ["TRAKT", "BROKEN"]
+    assert sorted(dict(provs.items())) == ["PLEX", "SIMKL", "TRAKT"]
+
+
+def test_snapshots_skip_providers_outside_the_pairs(registry: list[str], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_snapshots, "provider_configured", lambda _cfg, _name: True)
+    cfg = {"pairs": [{"source": "PLEX", "target": "TRAKT", "enabled": True, "features": {"watchlist": True}}]}
+    snaps = _snapshots.build_snapshots_for_feature(
+        feature="watchlist",
+        config=cfg,
+        providers=_providers.load_sync_providers(),
+        snap_cache={},
+        snap_ttl_sec=0,
+        dbg=lambda *a, **k: None,
+        emit_info=lambda _m: None,
+    )
+    assert sorted(snaps) == ["PLEX", "TRAKT"]
+    assert sorted(registry) == ["PLEX", "TRAKT"]
+
+
+def test_playback_adapters_are_imported_on_first_use() -> None:
+    svc = PlaybackProgressService()
+    assert dict(svc.adapters) == {}
+    assert svc.adapters.get("trakt") is svc.adapters["trakt"]
+    assert svc.adapters.get("nope") is None
+    assert list(svc.adapters) == ["trakt"]
+
+
+def test_startup_profile_parses_importtime_and_records_steps() -> None:
+    text = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   api.eventsAPI\n"
+        "import time:        80 |        300 | providers.sync._mod_PLEX\n"
+        "noise\n"
+    )
+    rows = startup_profile.parse_importtime(text)
+    assert rows == [("api.eventsAPI", 120, 120), ("providers.sync._mod_PLEX", 80, 300)]
+    assert [startup_profile.group_of(r[0]) for r in rows] == ["api.eventsAPI", "providers.sync"]
+
+    before = len(startup_profile.steps())
+    with startup_profile.step("probe"):
+        pass
+    assert startup_profile.steps()[before]["step"] == "probe"
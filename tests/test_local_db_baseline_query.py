@@ -0,0 +1,151 @@
+# tests/test_local_db_baseline_query.py
+# CrossWatch - Baseline item query layer tests
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from cw_platform.local_db import baseline_query as bq
+from cw_platform.local_db import get_conn
+from cw_platform.local_db import state as sqlite_state
+
+
+def _history(n: int) -> dict[str, dict]:
+    return {
+        f"tmdb:{i}@{1767225600 + i}": {
+            "type": "episode" if i % 3 else "movie",
+            "title": f"Title {i}",
+            "ids": {"tmdb": str(i)},
+            "watched_at": f"2026-01-{1 + i % 28:02d}T00:00:{i % 60:02d}Z",
+        }
+        for i in range(n)
+    }
+
+
+@pytest.fixture()
+def base(tmp_path):
+    sqlite_state.save_state(
+        tmp_path,
+        {
+            "providers": {
+                "PLEX": {
+                    "history": {"baseline": {"items": _history(50)}},
+                    "instances": {"Den": {"history": {"baseline": {"items": _history(7)}}}},
+                },
+                "TRAKT": {
+                    "watchlist": {"baseline": {"items": {"imdb:tt1": {"type": "movie", "title": "One", "ids": {"imdb": "tt1"}}}}},
+                    "ratings": {"baseline": {"items": {"imdb:tt1": {"type": "movie", "rating": 8, "rated_at": "2026-02-01T00:00:00Z", "ids": {"imdb": "tt1"}}}}},
+                },
+            }
+        },
+    )
+    return tmp_path
+
+
+def test_pages_walk_every_row_once_with_opaque_cursors(base) -> None:
+    seen: list[str] = []
+    cursor = None
+    pages = 0
+    while True:
+        page = bq.page_items(base, provider="plex", instance="default", feature="history", limit=12, cursor=cursor)
+        seen.extend(row["key"] for row in page["items"])
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert pages == 5
+    assert seen == sorted(_history(50))
+    assert seen == list(sqlite_state.load_feature_items(base, "PLEX", "default", "history"))
+    with pytest.raises(ValueError):
+        bq.page_items(base, cursor="not-a-cursor")
+
+
+def test_streams_filter_by_type_instance_and_id_token(base) -> None:
+    movies = list(bq.iter_items(base, feature="history", media_type="movie", batch_size=4))
+    assert {row["item"]["type"] for row in movies} == {"movie"}
+    assert len(movies) == 17 + 3
+
+    den = list(bq.iter_items(base, instance="Den"))
+    assert {(row["provider"], row["instance"]) for row in den} == {("PLEX", "Den")} and len(den) == 7
+
+    hits = list(bq.iter_items(base, id_token="imdb:tt1"))
+    assert sorted(row["feature"] for row in hits) == ["ratings", "watchlist"]
+    with pytest.raises(ValueError):
+        list(bq.iter_items(base, id_token="nope:1"))
+
+
+def test_newest_rows_follow_the_timestamp_with_bounds(base) -> None:
+    newest = bq.newest_items(base, "history", provider="PLEX", instance="default", limit=10)
+    stamps = [row["item"]["watched_at"] for row in newest]
+    everything = sorted((it["watched_at"] for it in _history(50).values()), reverse=True)
+    assert stamps == everything[:10]
+
+    streamed = [row["item"]["watched_at"] for row in bq.iter_items(base, feature="history", order="watched_at", since="2026-01-20", until="2026-01-25", batch_size=3)]
+    assert streamed == sorted(streamed) and streamed
+    assert all("2026-01-20" <= s < "2026-01-25" for s in streamed)
+
+
+def test_counts_and_aggregates(base) -> None:
+    assert bq.count_items(base) == 59
+    assert bq.count_items(base, provider="PLEX", media_type="movie") == 20
+    rows = bq.count_by(base, ("provider", "feature"), span="watched_at")
+    by = {(r["provider"], r["feature"]): r for r in rows}
+    assert by[("PLEX", "history")]["count"] == 57
+    assert by[("PLEX", "history")]["newest"] == max(it["watched_at"] for it in _history(50).values())
+    assert by[("TRAKT", "ratings")]["oldest"] is None
+    with pytest.raises(ValueError):
+        bq.count_by(base, ("title",))
+
+
+def test_readers_never_see_a_save_in_progress(base) -> None:
+    # The connection is shared, so a writer's open transaction is visible to any
+    # unlocked read on it; readers must wait for the save to commit or roll back.
+    conn = get_conn(base)
+    started, release = threading.Event(), threading.Event()
+
+    def writer() -> None:
+        with sqlite_state._LOCK:
+            conn.execute("DELETE FROM baseline_items")
+            started.set()
+            release.wait(5)
+            conn.rollback()
+
+    seen: dict[str, object] = {}
+
+    def reader() -> None:
+        seen["count"] = bq.count_items(base)
+        seen["items"] = sqlite_state.load_feature_items(base, "PLEX", "default", "history")
+        seen["page"] = bq.page_items(base, provider="TRAKT")["items"]
+
+    w = threading.Thread(target=writer)
+    w.start()
+    assert started.wait(5)
+    r = threading.Thread(target=reader)
+    r.start()
+    r.join(0.2)
+    assert r.is_alive() and not seen
+    release.set()
+    w.join(5)
+    r.join(5)
+    assert seen["count"] == 59
+    assert len(seen["items"]) == 50
+    assert len(seen["page"]) == 2
+
+
+def test_queries_use_the_new_indexes(base) -> None:
+    conn = get_conn(base)
+    plan = " ".join(
+        str(row[-1])
+        for row in conn.execute("EXPLAIN QUERY PLAN SELECT provider_state_id FROM baseline_items WHERE ids_imdb=?", ("tt1",))
+    )
+    assert "idx_bi_ids_imdb" in plan
+    plan = " ".join(
+        str(row[-1])
+        for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM baseline_items WHERE provider_state_id=? AND media_type=?",
+            (1, "movie"),
+        )
+    )
+    assert "COVERING INDEX idx_bi_state_type" in plan
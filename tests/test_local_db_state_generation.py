@@ -0,0 +1,135 @@
+# tests/test_local_db_state_generation.py
+# CrossWatch - State generation counter and read-only view tests
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import copy
+import json
+import time
+
+import pytest
+
+from cw_platform.local_db import get_conn
+from cw_platform.local_db import state as sqlite_state
+from cw_platform.local_db.frozen import mutable_copy
+from cw_platform.orchestrator._state_store import StateStore
+
+
+def _items(n: int, prefix: str = "movie") -> dict[str, dict]:
+    return {f"{prefix}:{i}": {"type": "movie", "title": f"Title {i}", "year": 2000 + i % 25, "ids": {"tmdb": str(i)}} for i in range(n)}
+
+
+def _seed(base, n: int = 3) -> None:
+    sqlite_state.save_state(
+        base,
+        {
+            "providers": {
+                "TRAKT": {"watchlist": {"baseline": {"items": _items(n)}}},
+                "SIMKL": {"ratings": {"baseline": {"items": _items(n, "show")}}},
+            },
+            "last_sync_epoch": 100,
+        },
+    )
+
+
+def test_every_writer_bumps_the_generation(tmp_path) -> None:
+    _seed(tmp_path)
+    token, gen = sqlite_state.generation(tmp_path)
+    seen = [gen]
+
+    sqlite_state.save_feature_baseline(tmp_path, provider="TRAKT", instance="default", feature="watchlist", items=_items(1))
+    seen.append(sqlite_state.generation(tmp_path)[1])
+    sqlite_state.save_feature_blocks(tmp_path, {("PLEX", "default", "history"): {"baseline": {"items": _items(2)}}})
+    seen.append(sqlite_state.generation(tmp_path)[1])
+    sqlite_state.set_last_sync_epoch(tmp_path, 200)
+    seen.append(sqlite_state.generation(tmp_path)[1])
+    sqlite_state.clear_state(tmp_path)
+    seen.append(sqlite_state.generation(tmp_path)[1])
+
+    assert seen == sorted(set(seen)) and len(seen) == 5
+    assert sqlite_state.generation(tmp_path)[0] == token
+    assert sqlite_state.load_state(tmp_path)["providers"] == {}
+
+
+def test_reads_share_one_read_only_view_until_the_next_write(tmp_path) -> None:
+    _seed(tmp_path)
+    first = sqlite_state.load_state(tmp_path)
+    assert sqlite_state.load_state(tmp_path) is first
+    assert sqlite_state.load_state_features(tmp_path, {"WATCHLIST"}) is sqlite_state.load_state_features(tmp_path, ["watchlist"])
+
+    items = first["providers"]["TRAKT"]["watchlist"]["baseline"]["items"]
+    with pytest.raises(TypeError, match="mutable_copy"):
+        items["movie:9"] = {}
+    with pytest.raises(TypeError):
+        items["movie:0"]["ids"].update({"imdb": "tt1"})
+    with pytest.raises(TypeError):
+        first["wall"].append({})
+    assert isinstance(items, dict) and json.loads(json.dumps(first)) == first
+
+    own = mutable_copy(first)
+    own["providers"]["TRAKT"]["watchlist"]["baseline"]["items"]["movie:0"]["title"] = "Edited"
+    deep = copy.deepcopy(first)
+    deep["providers"].pop("SIMKL")
+    assert items["movie:0"]["title"] == "Title 0"
+
+    sqlite_state.save_feature_baseline(tmp_path, provider="TRAKT", instance="default", feature="watchlist", items=_items(1))
+    fresh = sqlite_state.load_state(tmp_path)
+    assert fresh is not first
+    assert list(fresh["providers"]["TRAKT"]["watchlist"]["baseline"]["items"]) == ["movie:0"]
+
+
+def test_generation_notices_writes_from_another_connection(tmp_path) -> None:
+    _seed(tmp_path)
+    before = sqlite_state.load_state(tmp_path)
+    fp = sqlite_state.fingerprint(tmp_path, {"watchlist"})
+    conn = get_conn(tmp_path)
+    with conn:
+        sqlite_state._bump_generation(conn, 1)
+    assert sqlite_state.fingerprint(tmp_path, {"watchlist"}) != fp
+    assert sqlite_state.load_state(tmp_path) is not before
+
+
+def test_generation_reads_never_write(tmp_path) -> None:
+    conn = get_conn(tmp_path)
+    before = conn.total_changes
+    token, gen = sqlite_state.generation(tmp_path)
+    assert token and gen == 0
+    sqlite_state.fingerprint(tmp_path, {"watchlist"})
+    sqlite_state.load_state(tmp_path)
+    assert conn.total_changes == before
+    _seed(tmp_path)
+    assert sqlite_state.generation(tmp_path) == (token, 1)
+
+
+def test_policy_merge_leaves_the_cached_view_untouched(tmp_path, monkeypatch) -> None:
+    _seed(tmp_path)
+    policy = {"providers": {"TRAKT": {"watchlist": {"blocks": ["movie:0"], "adds": {"items": {"movie:x": {"title": "X"}}}}}}}
+    monkeypatch.setattr("cw_platform.local_db.manual_policy.load_policy", lambda _base: policy)
+
+    merged = StateStore(tmp_path).load_state()
+    manual = merged["providers"]["TRAKT"]["manual"]["watchlist"]
+    assert manual["blocks"] == ["movie:0"] and "movie:x" in manual["adds"]["items"]
+    assert "manual" not in sqlite_state.load_state(tmp_path)["providers"]["TRAKT"]
+
+
+def test_benchmark_repeated_load_state(tmp_path) -> None:
+    _seed(tmp_path, 5000)
+    t0 = time.perf_counter()
+    sqlite_state.load_state(tmp_path)
+    cold = time.perf_counter() - t0
+
+    rounds = 200
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        sqlite_state.load_state(tmp_path)
+    warm = (time.perf_counter() - t0) / rounds
+
+    t0 = time.perf_counter()
+    for _ in range(5):
+        copy.deepcopy(mutable_copy(sqlite_state.load_state(tmp_path)))
+    deepcopy_read = (time.perf_counter() - t0) / 5
+
+    # A warm read returns the cached view, so it must be far cheaper than
+    # decoding the rows again or handing out a private deep copy.
+    assert warm * 20 < cold
+    assert warm * 20 < deepcopy_read
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import Any
+
+import pytest
+from websockets.sync.server import serve
+
+from providers.scrobble import _session_socket as session_socket
+from providers.scrobble.emby import watch as emby_watch
+from providers.scrobble.jellyfin import watch as jellyfin_watch
+
+MODULES = {"jellyfin": (jellyfin_watch, "JellyfinWatchService", "/socket"), "emby": (emby_watch, "EmbyWatchService", "/embywebsocket")}
+
+RUNTIME_TICKS = 20 * 10_000_000
+
+
+def _session(pct: int, paused: bool = False) -> dict[str, Any]:
+    return {
+        "Id": "sess-1",
+        "UserName": "alice",
+        "NowPlayingItem": {
+            "Id": "item-1",
+            "Type": "Movie",
+            "Name": "Heat",
+            "ProductionYear": 1995,
+            "RunTimeTicks": RUNTIME_TICKS,
+            "ProviderIds": {"Tmdb": "949"},
+        },
+        "PlayState": {"PositionTicks": RUNTIME_TICKS * pct // 100, "IsPaused": paused},
+    }
+
+
+# Recorded session stream: (offset seconds, sessions list, expected action)
+STREAM: list[tuple[float, list[dict[str, Any]], str]] = [
+    (0.0, [_session(10)], "start"),
+    (0.6, [_session(10, paused=True)], "pause"),
+    (1.2, [_session(96)], "start"),
+    (1.8, [], "stop"),
+]
+STREAM_END = 2.6
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.events: list[tuple[str, float]] = []
+
+    def dispatch(self, event: Any) -> bool:
+        self.events.append((event.action, time.monotonic()))
+        return True
+
+
+class StubSessionServer:
+    """Local MediaBrowser-style websocket that replays STREAM once SessionsStart arrives."""
+
+    def __init__(self, stream: list[tuple[float, list[dict[str, Any]], str]], *, drop_after: int | None = None) -> None:
+        self.stream = stream
+        self.drop_after = drop_after
+        self.paths: list[str] = []
+        self.received: list[str] = []
+        self.sent_at: list[float] = []
+        self.connections = 0
+        self._server = serve(self._handle, "127.0.0.1", 0)
+        self.port = self._server.socket.getsockname()[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def _handle(self, conn: Any) -> None:
+        self.connections += 1
+        self.paths.append(conn.request.path)
+        first = json.loads(conn.recv(timeout=5))
+        self.received.append(first["MessageType"])
+        conn.send(json.dumps({"MessageType": "ForceKeepAlive", "Data": 60}))
+        frames = self.stream if self.connections == 1 else self.stream[self.drop_after or 0 :]
+        t0 = time.monotonic() - frames[0][0]
+        for n, (offset, sessions, _action) in enumerate(frames):
+            if self.drop_after is not None and self.connections == 1 and n >= self.drop_after:
+                return
+            time.sleep(max(0.0, t0 + offset - time.monotonic()))
+            self.sent_at.append(time.monotonic())
+            conn.send(json.dumps({"MessageType": "Sessions", "Data": sessions}))
+        try:
+            while True:
+                self.received.append(json.loads(conn.recv(timeout=10))["MessageType"])
+        except Exception:
+            return
+
+    def close(self) -> None:
+        self._server.shutdown()
+
+
+def _service(name: str, monkeypatch: pytest.MonkeyPatch, base: str, transport: str) -> tuple[Any, Recorder, list[str]]:
+    mod, cls_name, _ = MODULES[name]
+    monkeypatch.setattr(mod, "_server_id", lambda *a, **k: "server")
+    monkeypatch.setattr(mod, "_cw_update", lambda *a, **k: None)
+    cfg = {
+        name: {"server": base, "access_token": "tok", "timeout": 2, "scrobble": {"watch_transport": transport}},
+        "scrobble": {"enabled": True, "mode": "watch", "watch": {"pause_debounce_seconds": 0}},
+    }
+    rec = Recorder()
+    svc = getattr(mod, cls_name)(dispatcher=rec, cfg_provider=lambda: cfg, poll_secs=0.5, quiet_startup=True)
+    svc._log = lambda *a, **k: None
+    return svc, rec, []
+
+
+def _run_for(svc: Any, seconds: float) -> None:
+    svc.start_async()
+    time.sleep(seconds)
+    svc.stop()
+    svc._bg.join(3)
+
+
+def _actions(events: list[tuple[str, float]]) -> list[str]:
+    return [a for a, _ in events]
+
+
+@pytest.mark.parametrize("name", sorted(MODULES))
+def test_websocket_replay_delivers_every_change_without_polling(name, monkeypatch):
+    mod, _, sock_path = MODULES[name]
+
+    # Polling against the same recorded stream.
+    poll_calls: list[str] = []
+    t0 = {"v": 0.0}
+
+    def fake_get_json(base: str, tok: str, path: str, *a: Any, **k: Any) -> Any:
+        poll_calls.append(path)
+        elapsed = time.monotonic() - t0["v"]
+        current: list[dict[str, Any]] = []
+        for offset, sessions, _ in STREAM:
+            if elapsed >= offset:
+                current = sessions
+        return current
+
+    monkeypatch.setattr(mod, "_get_json", fake_get_json)
+    svc, rec_poll, _ = _service(name, monkeypatch, "http://media.invalid", "poll")
+    t0["v"] = time.monotonic()
+    _run_for(svc, STREAM_END)
+    assert _actions(rec_poll.events) == [a for _, _, a in STREAM]
+
+    # Websocket replay of the same stream.
+    ws_calls: list[str] = []
+    monkeypatch.setattr(mod, "_get_json", lambda base, tok, path, *a, **k: ws_calls.append(path) or [])
+    server = StubSessionServer(STREAM)
+    try:
+        svc, rec_ws, _ = _service(name, monkeypatch, f"http://127.0.0.1:{server.port}", "websocket")
+        _run_for(svc, STREAM_END)
+    finally:
+        server.close()
+    assert _actions(rec_ws.events) == [a for _, _, a in STREAM]
+
+    assert server.paths[0].startswith(f"{sock_path}?api_key=tok")
+    assert server.received[0] == "SessionsStart"
+    assert "KeepAlive" in server.received
+    assert not [p for p in ws_calls if p.startswith("/Sessions")]
+    assert len([p for p in poll_calls if p.startswith("/Sessions")]) >= 4
+    # One pushed session message per change and one dispatch per message: nothing waited on a poll.
+    assert len(server.sent_at) == len(STREAM) == len(rec_ws.events)
+
+
+def test_auto_transport_falls_back_to_polling_when_socket_is_refused(monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setattr(jellyfin_watch, "_get_json", lambda base, tok, path, *a, **k: calls.append(path) or [_session(10)])
+    svc, rec, _ = _service("jellyfin", monkeypatch, "http://127.0.0.1:9", "auto")
+    _run_for(svc, 0.8)
+
+    assert svc._socket_failures >= 1
+    assert svc._socket_retry_at > time.monotonic()
+    assert [a for a, _ in rec.events] == ["start"]
+    assert any(p.startswith("/Sessions") for p in calls)
+
+
+def test_socket_reconnects_with_backoff_after_drop(monkeypatch):
+    monkeypatch.setattr(jellyfin_watch, "_get_json", lambda *a, **k: [])
+    monkeypatch.setattr(session_socket, "RECONNECT_INITIAL_SECONDS", 0.2)
+    server = StubSessionServer(STREAM, drop_after=2)
+    try:
+        svc, rec, _ = _service("jellyfin", monkeypatch, f"http://127.0.0.1:{server.port}", "websocket")
+        svc._socket_backoff = 0.2
+        _run_for(svc, 1.8)
+    finally:
+        server.close()
+
+    assert server.connections >= 2
+    assert [a for a, _ in rec.events] == [a for _, _, a in STREAM]
+
+
+def test_session_cache_applies_push_messages():
+    cache = session_socket.SessionCache()
+    assert cache.apply({"MessageType": "Sessions", "Data": [_session(5), {"Id": "idle", "NowPlayingItem": {}}]})
+    assert [s["Id"] for s in cache.playing()] == ["sess-1"]
+    assert cache.apply({"MessageType": "PlaybackProgress", "Data": _session(40)})
+    assert cache.playing()[0]["PlayState"]["PositionTicks"] == RUNTIME_TICKS * 40 // 100
+    assert cache.apply({"MessageType": "PlaybackStopped", "Data": {"Id": "sess-1"}})
+    assert cache.playing() == []
+    assert session_socket.socket_url("https://jf.local/base", "t", "/socket") == "wss://jf.local/base/socket?api_key=t&deviceId=crosswatch"
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+import services.playback_progress.service as playback_service
+from cw_platform.local_db import close_conn
+from services.playback_progress.models import PlaybackCapabilities, PlaybackListResult, PlaybackRecord
+from services.playback_progress.service import PlaybackProgressService
+
+CFG = {"trakt": {"access_token": "t"}, "simkl": {"access_token": "t"}}
+
+
+class _Adapter:
+    def __init__(self, provider: str) -> None:
+        self.provider = provider
+        self.provider_label = provider.title()
+        self.calls = 0
+        self.title = "First"
+        self.delay = 0.0
+        self.gate: threading.Event | None = None
+        self.fail = False
+
+    def capabilities(self, config_view: Any, *, instance_id: str, instance_label: str) -> PlaybackCapabilities:
+        return PlaybackCapabilities(self.provider, self.provider_label, instance_id, instance_label, configured=True, read=True)
+
+    def list_progress(self, config_view: Any, *, instance_id: str, instance_label: str, force_refresh: bool = False) -> PlaybackListResult:
+        self.calls += 1
+        if self.gate is not None:
+            self.gate.wait(5)
+        time.sleep(self.delay)
+        if self.fail:
+            return PlaybackListResult(False, self.provider, instance_id, error_code="provider_error", message="Remote down.")
+        record = PlaybackRecord(
+            provider=self.provider,
+            provider_label=self.provider_label,
+            instance_id=instance_id,
+            instance_label=instance_label,
+            remote_id=f"{self.provider}-1",
+            canonical_key=f"imdb:tt{self.provider}",
+            media_type="movie",
+            title=self.title,
+            ids={"imdb": f"tt{self.provider}"},
+            progress_percent=40.0,
+        )
+        return PlaybackListResult(True, self.provider, instance_id, items=[record], refreshed_at="2026-10-18T10:00:00Z")
+
+
+@pytest.fixture()
+def env(monkeypatch, tmp_path):
+    monkeypatch.setenv("CROSSWATCH_DB", str(tmp_path / "cw.sqlite3"))
+    close_conn()
+    monkeypatch.setattr(playback_service, "load_config", lambda: CFG)
+    monkeypatch.setattr(playback_service, "_load_live_streams", lambda now=None: [])
+    yield tmp_path
+    close_conn()
+
+
+def _service(*, persist: bool = False, **adapters: _Adapter) -> PlaybackProgressService:
+    service = PlaybackProgressService(persist=persist)
+    service.adapters = dict(adapters)  # type: ignore[assignment]
+    return service
+
+
+def _age(service: PlaybackProgressService, seconds: float) -> None:
+    for entry in service._cache.values():
+        entry["ts"] = float(entry["ts"]) - seconds
+
+
+def _idle(service: PlaybackProgressService, timeout: float = 3.0) -> bool:
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if not service._inflight:
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def _titles(payload: dict[str, Any]) -> list[str]:
+    return [item["title"] for item in payload["items"]]
+
+
+def test_stale_list_is_served_immediately_and_revalidated_once(env):
+    trakt = _Adapter("trakt")
+    service = _service(trakt=trakt)
+    assert _titles(service.items(provider="trakt")) == ["First"]
+    assert service.items(provider="trakt")["sources"][0]["state"] == "fresh"
+
+    _age(service, playback_service.CACHE_TTL_SECONDS + 1)
+    trakt.title, trakt.gate = "Second", threading.Event()
+    t0 = time.monotonic()
+    first = service.items(provider="trakt")
+    second = service.items(provider="trakt")
+    assert time.monotonic() - t0 < 1.0
+    assert _titles(first) == _titles(second) == ["First"]
+    assert second["sources"][0]["state"] == "refreshing"
+    assert second["sources"][0]["age_seconds"] >= playback_service.CACHE_TTL_SECONDS
+
+    trakt.gate.set()
+    assert _idle(service)
+    assert trakt.calls == 2
+    fresh = service.items(provider="trakt")
+    assert _titles(fresh) == ["Second"]
+    assert fresh["sources"][0]["state"] == "fresh" and fresh["sources"][0]["latency_ms"] is not None
+
+
+def test_failed_revalidation_keeps_the_last_good_list(env):
+    trakt = _Adapter("trakt")
+    service = _service(trakt=trakt)
+    service.items(provider="trakt")
+    _age(service, playback_service.CACHE_TTL_SECONDS + 1)
+    trakt.fail = True
+    service.items(provider="trakt")
+    assert _idle(service)
+
+    payload = service.items(provider="trakt")
+    assert _titles(payload) == ["First"]
+    assert payload["sources"][0]["state"] == "error"
+    assert payload["sources"][0]["last_error"] == "Remote down."
+
+
+def test_persisted_lists_survive_a_restart(env):
+    service = _service(persist=True, trakt=_Adapter("trakt"))
+    service.items(provider="trakt")
+
+    again = _Adapter("trakt")
+    restarted = _service(persist=True, trakt=again)
+    payload = restarted.items(provider="trakt")
+    assert _titles(payload) == ["First"]
+    assert again.calls == 0
+
+    restarted.invalidate("trakt", "default")
+    assert _service(persist=True, trakt=again).items(provider="trakt")["sources"][0]["state"] == "fresh"
+    assert again.calls == 1
+
+
+def test_slow_adapter_keeps_loading_after_the_deadline(env, monkeypatch):
+    monkeypatch.setattr(playback_service, "_provider_timeout_seconds", lambda cfg: 0.1)
+    trakt, simkl = _Adapter("trakt"), _Adapter("simkl")
+    simkl.delay = 0.4
+    service = _service(trakt=trakt, simkl=simkl)
+
+    payload = service.items()
+    states = {s["provider"]: s["state"] for s in payload["sources"]}
+    assert states == {"trakt": "fresh", "simkl": "cold"}
+    assert [e["error_code"] for e in payload["errors"]] == ["provider_timeout"]
+
+    assert _idle(service)
+    payload = service.items()
+    assert sorted(s["provider"] for s in payload["sources"]) == ["simkl", "trakt"]
+    assert payload["errors"] == [] and simkl.calls == 1
+
+
+def test_stream_emits_each_adapter_as_it_completes(env):
+    trakt, simkl = _Adapter("trakt"), _Adapter("simkl")
+    simkl.delay, simkl.title = 0.2, "Other"
+    service = _service(trakt=trakt, simkl=simkl)
+
+    events = list(service.items_stream())
+    assert [e["event"] for e in events] == ["source", "source", "complete"]
+    assert [e["source"]["provider"] for e in events[:2]] == ["trakt", "simkl"]
+    assert events[0]["items"][0]["title"] == "First"
+    assert events[-1]["total"] == 2
+
+
+def test_stream_source_events_use_the_list_filters_and_page(env):
+    trakt, simkl = _Adapter("trakt"), _Adapter("simkl")
+    simkl.title = "Other"
+    service = _service(trakt=trakt, simkl=simkl)
+
+    events = list(service.items_stream(search="first"))
+    by_provider = {e["source"]["provider"]: e for e in events if e["event"] == "source"}
+    assert [i["title"] for i in by_provider["trakt"]["items"]] == ["First"] and by_provider["trakt"]["total"] == 1
+    assert by_provider["simkl"]["items"] == [] and by_provider["simkl"]["total"] == 0
+    assert events[-1]["total"] == 1
+
+    paged = [e for e in service.items_stream(page=2, page_size=1) if e["event"] == "source"]
+    assert all(e["items"] == [] and e["total"] == 1 for e in paged)
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import Any
+
+from cw_platform.ttl_cache import TTLCache
+from providers.scrobble import _compiled_filters as compiled
+from providers.scrobble.scrobble import SESSION_STATE_MAX, Dispatcher, ScrobbleEvent
+
+
+def _event(session: str = "s1", *, action: str = "start", progress: float = 10.0, account: str = "dad", raw: dict[str, Any] | None = None) -> ScrobbleEvent:
+    return ScrobbleEvent(
+        action=action,  # type: ignore[arg-type]
+        media_type="movie",
+        ids={"imdb": "tt1"},
+        title="Movie",
+        year=2020,
+        season=None,
+        number=None,
+        progress=progress,
+        account=account,
+        server_uuid="srv-1",
+        session_key=session,
+        raw=raw or {},
+    )
+
+
+def _cfg(**filters: Any) -> dict[str, Any]:
+    return {"scrobble": {"watch": {"filters": dict(filters), "pause_debounce_seconds": 0}}}
+
+
+class Sink:
+    def __init__(self) -> None:
+        self.events: list[ScrobbleEvent] = []
+
+    def send(self, event: ScrobbleEvent) -> None:
+        self.events.append(event)
+
+
+def test_compiled_filter_is_reused_until_config_changes():
+    a = compiled.compile_filters(_cfg(username_whitelist=["dad"], server_uuid_whitelist="srv-1, srv-2"))
+    b = compiled.compile_filters(_cfg(username_whitelist=["dad"], server_uuid_whitelist="srv-1, srv-2"))
+    c = compiled.compile_filters(_cfg(username_whitelist=["kid"], server_uuid_whitelist="srv-1, srv-2"))
+    assert a is b and c is not a
+    assert a.server_allow == frozenset({"srv-1", "srv-2"})
+    assert a.server_allowed("srv-2") and not a.server_allowed("srv-9") and not a.server_allowed(None)
+
+
+def test_payload_fields_are_extracted_once_per_raw(monkeypatch):
+    raw = {
+        "Session": {"Player": {"UserId": "deep"}, "NowPlayingItem": {"Path": "/movies/a.mkv"}},
+        "UserId": "Top",
+        "NotificationContainer": {"PlaySessionStateNotification": [{"accountID": "7", "accountUUID": "ABC"}]},
+    }
+    calls: list[int] = []
+    real = compiled.extract_payload_fields
+    monkeypatch.setattr(compiled, "extract_payload_fields", lambda r: calls.append(1) or real(r))
+
+    fields = compiled.event_fields(_event(raw=raw))
+    again = compiled.event_fields(_event("s2", progress=50, raw=raw))
+    assert fields is again and len(calls) == 1
+    assert (fields.user_id, fields.account_id, fields.account_uuid) == ("top", "7", "abc")
+    assert fields.paths == ("/movies/a.mkv",)
+
+
+def test_dispatcher_filters_match_previous_semantics():
+    deep = {"a": {"b": {"c": {"user_id": "U-1"}}}}
+    sink = Sink()
+    disp = Dispatcher([sink], cfg_provider=lambda: _cfg(user_id="u-1"))
+    assert disp.dispatch(_event(raw=deep)) is True
+    assert disp.dispatch(_event("s2", raw={"a": {"user_id": "u-2"}})) is False
+
+    psn = {"PlaySessionStateNotification": {"accountID": "42"}}
+    by_id = Dispatcher([Sink()], cfg_provider=lambda: _cfg(username_whitelist=["id:42"]))
+    assert by_id.accepts(_event(account="someone", raw=psn)) is True
+    assert by_id.accepts(_event("s2", account="someone", raw={})) is False
+
+    media = Dispatcher([Sink()], cfg_provider=lambda: _cfg(ignored_path_prefixes=["/trailers"]))
+    assert media.accepts(_event(raw={"Item": {"file": "/trailers/x.mkv"}})) is False
+
+
+def test_session_state_stays_bounded_for_long_running_watchers():
+    sink = Sink()
+    disp = Dispatcher([sink], cfg_provider=lambda: _cfg())
+    total = SESSION_STATE_MAX * 3
+    for n in range(total):
+        disp.dispatch(_event(f"sess-{n}", raw={"n": n}))
+
+    stats = disp.stats()
+    assert len(sink.events) == total
+    assert stats["sessions"]["size"] == SESSION_STATE_MAX
+    assert stats["sessions"]["evicted_lru"] == total - SESSION_STATE_MAX
+    assert stats["filter_ok"]["size"] == SESSION_STATE_MAX
+
+    # Recent sessions keep their dedupe state.
+    assert disp.dispatch(_event(f"sess-{total - 1}")) is False
+
+
+def test_ttl_cache_expires_idle_entries_and_counts_evictions():
+    now = [0.0]
+    cache: TTLCache[int] = TTLCache(maxsize=2, ttl=10.0, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert "b" not in cache and cache.stats()["evicted_lru"] == 1
+
+    now[0] = 11.0
+    assert cache.get("a") is None
+    cache.set("d", 4)
+    assert list(cache.keys()) == ["d"]
+    assert cache.stats()["evicted_ttl"] == 2
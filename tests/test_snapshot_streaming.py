@@ -0,0 +1,118 @@
+# tests/test_snapshot_streaming.py
+# CrossWatch - Streaming provider indexes into orchestrator snapshots
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from cw_platform.orchestrator import _snapshots as snapshots
+from cw_platform.orchestrator._snapshots import build_snapshots_for_feature, canonicalize_index, stream_canonical_index
+from providers.sync import _mod_TAUTULLI
+
+_CFG = {"tautulli": {"server_url": "http://tautulli.local:8181", "api_key": "k", "history": {"per_page": 500}}}
+
+
+def _row(i: int) -> dict[str, Any]:
+    if i % 3:
+        return {
+            "row_id": i,
+            "media_type": "episode",
+            "date": 1767225600 - i * 60,
+            "rating_key": str(100000 + i),
+            "grandparent_rating_key": str(500 + i % 40),
+            "title": f"Episode {i}",
+            "grandparent_title": f"Show {i % 40}",
+            "parent_media_index": 1 + i // 40,
+            "media_index": 1 + i % 40,
+            "guids": [f"imdb://tt{9000000 + i}", f"tmdb://{700000 + i}"],
+            "grandparent_guids": [f"tvdb://{80000 + i % 40}", f"tmdb://{60000 + i % 40}"],
+        }
+    return {
+        "row_id": i,
+        "media_type": "movie",
+        "date": 1767225600 - i * 60,
+        "rating_key": str(100000 + i),
+        "title": f"Movie {i}",
+        "year": 1990 + i % 30,
+        "guids": [f"imdb://tt{1000000 + i}", f"tmdb://{200000 + i}"],
+    }
+
+
+@pytest.fixture()
+def tautulli(monkeypatch) -> Any:
+    total = {"n": 0}
+
+    def call(self: Any, cmd: str, **params: Any) -> Any:
+        assert cmd == "get_history"
+        start, length = int(params["start"]), int(params["length"])
+        rows = [_row(i) for i in range(start, min(start + length, total["n"]))]
+        return {"data": rows, "recordsFiltered": total["n"]}
+
+    monkeypatch.setattr(_mod_TAUTULLI.TAUTULLIClient, "call", call)
+
+    def sized(n: int) -> Any:
+        total["n"] = n
+        return _mod_TAUTULLI.OPS
+
+    return sized
+
+
+class _BuildOnly:
+    """The same provider without iter_index, as every provider was before streaming."""
+
+    def __init__(self, ops: Any) -> None:
+        self._ops = ops
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "iter_index":
+            raise AttributeError(name)
+        return getattr(self._ops, name)
+
+
+def test_tautulli_history_streams_the_same_index_in_batches(tautulli) -> None:
+    ops = tautulli(2600)
+    whole = ops.build_index(_CFG, feature="history")
+    batches = list(ops.iter_index(_CFG, feature="history", batch_size=1000))
+    assert [len(b) for b in batches] == [1000, 1000, 600]
+    merged: dict[str, Any] = {}
+    for batch in batches:
+        assert not set(batch) & set(merged)
+        merged.update(batch)
+    assert list(merged) == list(whole) and merged == whole
+    assert list(ops.iter_index(_CFG, feature="watchlist", batch_size=1000)) == []
+
+    streamed = stream_canonical_index(ops, _CFG, feature="history", batch_size=1000)
+    assert streamed == canonicalize_index(whole, feature="history")
+
+
+def test_streaming_history_snapshot_lowers_the_production_peak(tautulli, monkeypatch) -> None:
+    # Scaled down: a 500-item batch over a 4000-play history instead of 5000 over tens of thousands.
+    monkeypatch.setattr(snapshots, "_STREAM_BATCH", 500)
+    ops = tautulli(4000)
+
+    def _snapshot(provider: Any) -> tuple[dict[str, Any], int, int]:
+        tracemalloc.start()
+        try:
+            snaps = build_snapshots_for_feature(
+                feature="history",
+                config=_CFG,
+                providers={"TAUTULLI": provider},
+                snap_cache={},
+                snap_ttl_sec=0,
+                dbg=lambda *_a, **_k: None,
+                emit_info=lambda _m: None,
+            )
+            kept, peak = tracemalloc.get_traced_memory()
+            return snaps, kept, peak
+        finally:
+            tracemalloc.stop()
+
+    materialized, build_kept, build_peak = _snapshot(_BuildOnly(ops))
+    streamed, stream_kept, stream_peak = _snapshot(ops)
+    assert len(streamed["TAUTULLI"]) == 4000
+    assert {k: dict(v) for k, v in streamed["TAUTULLI"].items()} == {k: dict(v) for k, v in materialized["TAUTULLI"].items()}
+    # Both keep the same snapshot; streaming drops the transient full raw index on top of it.
+    assert (stream_peak - stream_kept) * 1.25 < build_peak - build_kept
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import copy
+import time
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import api.probesAPI as probes
+import providers.auth._auth_SCROB as scrob_auth
+from cw_platform import http_metrics
+
+PROFILE = "SCROB-P01"
+
+CONNECTED = {
+    "server_url": "http://host:7330",
+    "api_key": "KEY",
+    "username": "frank",
+    "password": "pw",
+    "api_prefix": "/api/proxy",
+    "access_token": "TOKEN",
+    "expires_at": 4102444800,
+}
+
+
+def _cfg(instance: dict[str, Any]) -> dict[str, Any]:
+    return {"scrob": {"server_url": "", "api_key": "", "instances": {PROFILE: dict(instance)}}, "pairs": []}
+
+
+class _Resp:
+    def __init__(self, status: int) -> None:
+        self.status_code = status
+
+    def json(self) -> dict[str, Any]:
+        return {"id": 42, "username": "frank"}
+
+
+@pytest.fixture()
+def scrob(monkeypatch):
+    state: dict[str, Any] = {"cfg": _cfg(CONNECTED), "status": 200, "delay": 0.0, "calls": 0}
+
+    def request(self, method, path, **kw):
+        state["calls"] += 1
+        time.sleep(state["delay"])
+        return _Resp(state["status"])
+
+    monkeypatch.setattr(scrob_auth.ScrobClient, "request", request)
+    monkeypatch.setattr(probes, "STATUS_REFRESHER", probes.StatusRefresher(interval=60))
+    probes.STATUS_CACHE["data"] = None
+    probes.STATUS_CACHE["ts"] = 0
+    probes.PROBE_DETAIL_CACHE.clear()
+    probes._USERINFO_CACHE.clear()
+    app = FastAPI()
+    probes.register_probes(app, lambda: copy.deepcopy(state["cfg"]))
+    state["client"] = TestClient(app)
+    yield state
+    probes.STATUS_CACHE["data"] = None
+    probes.STATUS_CACHE["ts"] = 0
+
+
+def _connected(resp: Any) -> Any:
+    return ((resp.json().get("providers") or {}).get("SCROB") or {}).get("connected")
+
+
+def _wait_for(pred, timeout: float = 3.0) -> bool:
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if pred():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_stale_status_is_served_immediately_and_revalidated_in_background(scrob, monkeypatch):
+    client = scrob["client"]
+    assert _connected(client.get("/api/status")) is True
+
+    probes.STATUS_CACHE["ts"] = time.time() - probes.STATUS_TTL - 1
+    probes.PROBE_DETAIL_CACHE.clear()
+    scrob["status"], scrob["delay"] = 401, 0.4
+
+    t0 = time.monotonic()
+    resp = client.get("/api/status")
+    assert time.monotonic() - t0 < 0.3
+    assert _connected(resp) is True
+    assert int(resp.headers["X-CW-Status-Age"]) >= probes.STATUS_TTL
+
+    assert _wait_for(lambda: probes.STATUS_REFRESHER.runs == 1)
+    assert _connected(client.get("/api/status")) is False
+
+
+def test_slow_probe_is_cut_off_at_the_deadline(scrob, monkeypatch):
+    monkeypatch.setattr(probes, "PROBE_DEADLINE", 0.2)
+    scrob["delay"] = 1.0
+
+    t0 = time.monotonic()
+    resp = scrob["client"].get("/api/status?fresh=1")
+    assert time.monotonic() - t0 < 0.8
+    body = resp.json()["providers"]["SCROB"]
+    assert body["connected"] is False
+    assert body["instances"][PROFILE]["reason"] == "probe timed out"
+
+
+def test_refresher_reuses_cached_probes_for_providers_a_sync_is_hammering(scrob, monkeypatch):
+    scrob["client"].get("/api/status")
+    calls = scrob["calls"]
+    probes.STATUS_CACHE["ts"] = 0
+    for key in list(probes.PROBE_DETAIL_CACHE):
+        ts, ok, rsn = probes.PROBE_DETAIL_CACHE[key]
+        probes.PROBE_DETAIL_CACHE[key] = (ts - 3600, ok, rsn)
+
+    monkeypatch.setattr(probes, "_busy_providers", lambda: frozenset({"SCROB"}))
+    data = probes.STATUS_REFRESHER.refresh()
+    assert data is not None and data["providers"]["SCROB"]["connected"] is True
+    assert scrob["calls"] == calls
+    assert probes.STATUS_REFRESHER.stats()["skipped_busy"] == {"SCROB": 1}
+
+    monkeypatch.setattr(probes, "_busy_providers", lambda: frozenset())
+    probes.STATUS_REFRESHER.refresh()
+    assert scrob["calls"] > calls
+
+
+def test_refresher_schedule_is_jittered():
+    r = probes.StatusRefresher(interval=40, jitter=0.15)
+    delays = {round(r._next_delay(), 3) for _ in range(50)}
+    assert len(delays) > 1
+    assert all(34 <= d <= 46 for d in delays)
+
+
+def test_recent_requests_counts_the_last_minute_per_provider(monkeypatch):
+    m = http_metrics.HttpMetrics()
+    for _ in range(3):
+        m.record("TRAKT", method="GET", url="https://api.trakt.tv/sync/history", status=200, ms=5)
+    m.record("PLEX", method="GET", url="http://plex/library", status=200, ms=5)
+    m.record("PLEX", method="GET", url="http://plex/library", status=200, ms=5, ts=time.time() - 600)
+    assert m.recent_requests(within=60) == {"TRAKT": 3, "PLEX": 1}
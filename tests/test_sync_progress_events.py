@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import Any
+
+from cw_platform.orchestrator._events import ProgressChannel, ProgressEvent
+from cw_platform.orchestrator._logging import Emitter
+
+
+def test_channel_coalesces_ticks_and_keeps_every_other_event():
+    seen: list[ProgressEvent] = []
+    ch = ProgressChannel(seen.extend)
+    ch.put("feature:start", {"feature": "watchlist"})
+    for done in range(1, 101):
+        ch.put("apply:add:progress", {"dst": "TRAKT", "feature": "watchlist", "done": done, "total": 100})
+    ch.put("apply:add:progress", {"dst": "SIMKL", "feature": "watchlist", "done": 7, "total": 100})
+    ch.put("apply:add:done", {"dst": "TRAKT", "feature": "watchlist", "count": 100})
+    ch.close()
+
+    names = [e.event for e in seen]
+    assert names.count("feature:start") == 1 and names.count("apply:add:done") == 1
+    ticks = {e.get("dst"): e.get("done") for e in seen if e.event == "apply:add:progress"}
+    assert ticks == {"TRAKT": 100, "SIMKL": 7}
+    assert ch.stats()["coalesced"] == 99
+
+
+def test_channel_is_bounded_and_applies_backpressure():
+    gate = threading.Event()
+    delivered: list[int] = []
+
+    def slow(batch: list[ProgressEvent]) -> None:
+        gate.wait(2)
+        delivered.extend(int(e.get("n")) for e in batch)
+
+    ch = ProgressChannel(slow, maxsize=4, tick_interval=0).start()
+    t0 = time.monotonic()
+    producer = threading.Thread(target=lambda: [ch.put("feature:done", {"n": i}) for i in range(20)])
+    producer.start()
+    time.sleep(0.1)
+    assert producer.is_alive()
+    assert len(ch._queue) <= 4
+    gate.set()
+    producer.join(3)
+    ch.close()
+    assert delivered == list(range(20))
+    assert time.monotonic() - t0 < 3
+
+
+def test_channel_without_consumer_drains_inline_when_full():
+    seen: list[ProgressEvent] = []
+    ch = ProgressChannel(seen.extend, maxsize=3)
+    for i in range(7):
+        ch.put("feature:done", {"n": i})
+    assert len(seen) == 6
+    ch.drain()
+    assert [e.get("n") for e in seen] == list(range(7))
+
+
+def test_emitter_feeds_sink_before_the_log_callback():
+    order: list[Any] = []
+    em = Emitter(lambda line: order.append(("log", json.loads(line)["event"])), lambda ev, data: order.append(("event", ev, dict(data))))
+    em.emit("apply:add:done", feature="watchlist", count=3)
+    assert order == [("event", "apply:add:done", {"feature": "watchlist", "count": 3}), ("log", "apply:add:done")]
+    Emitter(None, lambda ev, data: order.append(ev)).emit("run:done")
+    assert order[-1] == "run:done"
+
+
+def test_reducer_updates_summary_and_publishes_versions(monkeypatch):
+    import api.syncAPI as sync
+
+    monkeypatch.setattr(sync, "_spotlight_items_from_keys", lambda keys, **_: [{"key": k, "title": k} for k in keys])
+    sync._summary_reset()
+    v0 = sync._summary_version()
+
+    def ev(name: str, **data: Any) -> ProgressEvent:
+        return ProgressEvent(name, data)
+
+    sync._on_sync_events(
+        [
+            ev("one:plan", adds=3, removes=1, updates=0),
+            ev("apply:add:progress", dst="TRAKT", feature="watchlist", done=2, total=3),
+        ]
+    )
+    mid = sync._summary_snapshot()
+    assert sync._summary_version() == v0 + 1 == mid["seq"]
+    assert mid["_phase"]["apply"] == {"total": 4, "done": 0, "final": False, "live": 2}
+
+    sync._on_sync_events(
+        [
+            ev("apply:add:done", dst="TRAKT", feature="watchlist", attempted=3, added=3, result={"count": 3, "confirmed_keys": ["imdb:tt1"]}),
+            ev("apply:remove:done", dst="TRAKT", feature="watchlist", attempted=1, removed=1, result={"count": 1}),
+            ev("apply:unresolved", feature="history", provider="SIMKL", items=[{"title": "X"}]),
+            ev("debug", msg="blocked.counts", blocked_blackbox=2, blocked_manual=1),
+        ]
+    )
+    snap = sync._summary_snapshot()
+    lane = snap["features"]["watchlist"]
+    assert (lane["added"], lane["removed"]) == (3, 1)
+    assert [it["key"] for it in lane["spotlight_add"]] == ["imdb:tt1"]
+    assert snap["_phase"]["apply"]["done"] == 4 and snap["_phase"]["apply"]["live"] == 0
+    assert snap["unresolved_items"] == [{"title": "X", "feature": "history", "provider": "SIMKL"}]
+    totals = sync._run_totals()
+    assert (totals["added"], totals["removed"], totals["attempted"], totals["blocked"]) == (3, 1, 4, 3)
+
+    snap["features"]["watchlist"]["added"] = 999
+    snap["timeline"]["done"] = True
+    again = sync._summary_snapshot()
+    assert again["features"]["watchlist"]["added"] == 3
+    assert again["timeline"]["done"] is False
+
+
+def test_channel_delivers_pending_ticks_before_the_next_event():
+    seen: list[ProgressEvent] = []
+    ch = ProgressChannel(seen.extend)
+    ch.put("apply:add:progress", {"dst": "TRAKT", "feature": "watchlist", "done": 3})
+    ch.put("apply:add:done", {"dst": "TRAKT", "feature": "watchlist", "count": 3})
+    ch.put("apply:add:progress", {"dst": "TRAKT", "feature": "history", "done": 1})
+    ch.close()
+    assert [(e.event, e.get("feature")) for e in seen] == [
+        ("apply:add:progress", "watchlist"),
+        ("apply:add:done", "watchlist"),
+        ("apply:add:progress", "history"),
+    ]
+
+
+def test_done_clears_live_count_and_publishes_only_changed_fields(monkeypatch):
+    import api.syncAPI as sync
+
+    sync._summary_reset()
+    sync._summary_set("features", {"watchlist": {"added": 0, "removed": 0, "updated": 0}})
+    sync._on_sync_events([ProgressEvent("apply:add:progress", {"dst": "TRAKT", "feature": "Watchlist", "done": 2})])
+    before = sync._SUMMARY_VIEW[1]
+    assert before["_phase"]["apply"]["live"] == 2
+
+    sync._on_sync_events([ProgressEvent("apply:add:done", {"dst": "TRAKT", "feature": "Watchlist", "count": 2})])
+    sync._on_sync_events([ProgressEvent("apply:remove:done", {"dst": "TRAKT", "feature": "unknown", "count": 0})])
+    after = sync._SUMMARY_VIEW[1]
+    assert after["_phase"]["apply"]["live"] == 0 and not sync._APPLY_LIVE
+    assert after["timeline"] is before["timeline"]
+    assert after["_phase"] is not before["_phase"] and after["features"] is not before["features"]
+
+    calls: list[Any] = []
+    monkeypatch.setattr(sync, "_copy_summary_value", lambda v: calls.append(v) or v)
+    sync._summary_set_timeline("pre")
+    assert calls == [sync.SUMMARY["timeline"]] and sync._summary_snapshot()["timeline"]["pre"] is True
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from typing import Any, cast
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from api import wallAPI
+from cw_platform.local_db import watchlist_hide
+from cw_platform.orchestrator._state_store import StateStore
+from services import watchlist
+
+
+def _items(prefix: str, n: int, start: int = 0) -> dict[str, dict[str, Any]]:
+    return {
+        f"tmdb:{i}": {"type": "movie", "title": f"{prefix} {i}", "ids": {"tmdb": str(i)}, "added_at": f"2026-01-{1 + i % 28:02d}T00:00:00Z"}
+        for i in range(start, start + n)
+    }
+
+
+def _setup(tmp_path, monkeypatch) -> StateStore:
+    monkeypatch.setattr(watchlist, "CONFIG", tmp_path)
+    monkeypatch.setattr(wallAPI, "CONFIG", tmp_path)
+    monkeypatch.setattr(watchlist, "_registry_sync_providers", lambda: ["TRAKT", "PLEX", "SIMKL"])
+    watchlist.clear_watchlist_cache()
+    store = StateStore(tmp_path)
+    store.save_feature_baseline(provider="TRAKT", feature="watchlist", items=_items("T", 40), last_sync_epoch=1)
+    store.save_feature_baseline(provider="PLEX", feature="watchlist", items=_items("P", 20, start=30), last_sync_epoch=1)
+    store.save_feature_baseline(provider="SIMKL", feature="watchlist", items=_items("S", 10, start=100), last_sync_epoch=1)
+    return store
+
+
+def test_only_groups_of_the_changed_provider_are_rebuilt(tmp_path, monkeypatch) -> None:
+    store = _setup(tmp_path, monkeypatch)
+    first_state = store.load_state_features({"watchlist"})
+    watchlist.build_watchlist(first_state, tmdb_ok=False)
+
+    store.save_feature_baseline(provider="SIMKL", feature="watchlist", items=_items("S2", 12, start=100), last_sync_epoch=2)
+    state = store.load_state_features({"watchlist"})
+    assert state["providers"]["TRAKT"]["watchlist"] is first_state["providers"]["TRAKT"]["watchlist"]
+    assert state["providers"]["SIMKL"]["watchlist"] is not first_state["providers"]["SIMKL"]["watchlist"]
+
+    rows = watchlist.build_watchlist(state, tmdb_ok=False)
+    assert watchlist._BUILD_MEMO["stats"] == {"groups": 62, "reused": 50}
+    watchlist.clear_watchlist_cache()
+    assert rows == watchlist.build_watchlist(watchlist.mutable_copy(state), tmdb_ok=False)
+    assert next(r for r in rows if r["key"] == "tmdb:35")["sources"] == ["plex", "trakt"]
+
+    rows[0]["title"] = "edited"
+    rows[0]["sources"].append("nope")
+    again = watchlist.build_watchlist(state, tmdb_ok=False)
+    assert again[0]["title"] != "edited" and "nope" not in again[0]["sources"]
+
+
+def test_materialized_view_follows_state_and_hide_set(tmp_path, monkeypatch) -> None:
+    store = _setup(tmp_path, monkeypatch)
+    calls: list[int] = []
+
+    def build(state: dict[str, Any], tmdb_ok: bool) -> list[dict[str, Any]]:
+        calls.append(1)
+        return watchlist.build_watchlist(state, tmdb_ok)
+
+    def load() -> dict[str, Any]:
+        return store.load_state_features({"watchlist"})
+
+    view = watchlist.materialized_watchlist(load, build, tmdb_ok=False)
+    assert len(view["items"]) == 60 and view["last_sync_epoch"] == 1
+    assert watchlist.materialized_watchlist(load, build, tmdb_ok=False) is view and len(calls) == 1
+
+    movies = watchlist.watchlist_projection(view, "even", lambda rows: [r for r in rows if int(r["tmdb"]) % 2 == 0])
+    assert watchlist.watchlist_projection(view, "even", lambda rows: []) is movies
+    assert [r["key"] for r in watchlist.page_watchlist(movies, 5, 3)] == [r["key"] for r in movies[5:8]]
+
+    watchlist_hide.save_hidden(tmp_path, ["tmdb:0"])
+    hidden = watchlist.materialized_watchlist(load, build, tmdb_ok=False)
+    assert len(calls) == 2 and hidden["etag"] != view["etag"]
+    assert "tmdb:0" not in {r["key"] for r in hidden["items"]}
+
+    store.save_feature_baseline(provider="PLEX", feature="watchlist", items={}, last_sync_epoch=3)
+    emptied = watchlist.materialized_watchlist(load, build, tmdb_ok=False)
+    assert len(emptied["items"]) == 49 and emptied["last_sync_epoch"] == 3
+
+
+def _request(etag: str = "") -> Request:
+    headers = [(b"host", b"testserver")]
+    if etag:
+        headers.append((b"if-none-match", etag.encode("latin-1")))
+    return Request({"type": "http", "method": "GET", "path": "/api/state/wall", "query_string": b"", "headers": headers})
+
+
+def test_wall_pages_and_answers_not_modified(tmp_path, monkeypatch) -> None:
+    _setup(tmp_path, monkeypatch)
+    monkeypatch.setattr(wallAPI, "load_config", lambda: {"tmdb": {"api_key": "tmdb-key"}})
+    monkeypatch.setattr(wallAPI, "config_path", lambda: tmp_path / "config.json")
+    wallAPI._WALL_CACHE.update({"key": None, "data": None})
+    app = FastAPI()
+    wallAPI.register_wall(app)
+    endpoint = next(cast(APIRoute, route).endpoint for route in app.routes if getattr(route, "path", "") == "/api/state/wall")
+
+    first = endpoint(request=_request(), both_only=False, active_only=False, limit=25, offset=0, user_profile="")
+    second = endpoint(request=_request(), both_only=False, active_only=False, limit=25, offset=25, user_profile="")
+    assert first["total"] == second["total"] == 60
+    assert len(first["items"]) == 25 and not {r["key"] for r in first["items"]} & {r["key"] for r in second["items"]}
+    assert first["etag"] != second["etag"]
+
+    wallAPI._WALL_CACHE.update({"key": None, "data": None})
+    res = endpoint(request=_request(first["etag"]), both_only=False, active_only=False, limit=25, offset=0, user_profile="")
+    assert getattr(res, "status_code", None) == 304
+    both = endpoint(request=_request(), both_only=True, active_only=False, limit=100, offset=0, user_profile="")
+    assert both["total"] == 10 and all(r["status"] == "both" for r in both["items"])
+
+
+def test_wall_sends_the_etag_header_and_honours_if_none_match(tmp_path, monkeypatch) -> None:
+    _setup(tmp_path, monkeypatch)
+    monkeypatch.setattr(wallAPI, "load_config", lambda: {"tmdb": {"api_key": "tmdb-key"}})
+    monkeypatch.setattr(wallAPI, "config_path", lambda: tmp_path / "config.json")
+    wallAPI._WALL_CACHE.update({"key": None, "data": None})
+    app = FastAPI()
+    wallAPI.register_wall(app)
+    client = TestClient(app)
+
+    first = client.get("/api/state/wall", params={"limit": 25})
+    etag = first.headers.get("etag")
+    assert first.status_code == 200 and etag == first.json()["etag"]
+    cached = client.get("/api/state/wall", params={"limit": 25})
+    assert cached.headers.get("etag") == etag
+    again = client.get("/api/state/wall", params={"limit": 25}, headers={"If-None-Match": etag})
+    assert again.status_code == 304 and again.headers.get("etag") == etag
+    wallAPI._WALL_CACHE.update({"key": None, "data": None})
+    fresh = client.get("/api/state/wall", params={"limit": 25}, headers={"If-None-Match": etag})
+    assert fresh.status_code == 304
@@ -0,0 +1,167 @@
+# tests/test_webhook_ingest.py
+# CrossWatch - Webhook ingest queue, Plex request checks and the acked webhook endpoint
+# Copyright (c) 2025-2026 CrossWatch / Cenodude (https://github.com/cenodude/CrossWatch)
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import threading
+from typing import Any
+
+from starlette.requests import Request
+
+from cw_platform.ttl_cache import TTLCache
+from providers.webhooks.ingest import WebhookQueue, plex_session_key
+
+
+def _blocked_queue(**kw: Any) -> tuple[WebhookQueue, threading.Event, list[str]]:
+    q = WebhookQueue("test", **kw)
+    gate = threading.Event()
+    running = threading.Event()
+    ran: list[str] = []
+    q.submit(lambda: (running.set(), gate.wait(5), ran.append("blocker")))
+    assert running.wait(5)
+    return q, gate, ran
+
+
+def test_state_events_coalesce_per_session_without_reordering() -> None:
+    q, gate, ran = _blocked_queue()
+    a, b = ("plex", "a"), ("plex", "b")
+    assert q.submit(lambda: ran.append("a:play"), session=a, coalesce=True) == "queued"
+    assert q.submit(lambda: ran.append("b:play"), session=b, coalesce=True) == "queued"
+    assert q.submit(lambda: ran.append("a:pause"), session=a, coalesce=True) == "coalesced"
+    assert q.submit(lambda: ran.append("a:stop"), session=a) == "queued"
+    # Queued after the stop, so it must not fold into the earlier play.
+    assert q.submit(lambda: ran.append("a:play2"), session=a, coalesce=True) == "queued"
+    gate.set()
+    assert q.join()
+
+    assert ran == ["blocker", "a:pause", "b:play", "a:stop", "a:play2"]
+    stats = q.stats()
+    assert stats["received"] == 6 and stats["coalesced"] == 1 and stats["processed"] == 5
+    assert stats["depth"] == 0 and stats["max_depth"] >= 4 and stats["wait"]["count"] == 5
+
+
+def test_full_queue_drops_the_oldest_state_event_then_rejects_and_counts_failures() -> None:
+    q, gate, ran = _blocked_queue(maxsize=2)
+    errors: list[BaseException] = []
+    q.on_error = errors.append
+    assert q.submit(lambda: ran.append("a:play"), session=("plex", "a"), coalesce=True) == "queued"
+    assert q.submit(lambda: ran.append("b:play"), session=("plex", "b"), coalesce=True) == "queued"
+    # Full: the oldest waiting state event makes room, then the next one does.
+    assert q.submit(lambda: 1 / 0, session=("plex", "x")) == "queued"
+    assert q.stats()["dropped"] == 1 and q.stats()["depth"] == 2
+    assert q.submit(lambda: ran.append("late"), session=("plex", "y")) == "queued"
+    assert q.submit(lambda: ran.append("refused"), session=("plex", "z"), coalesce=True) == "rejected"
+
+    gate.set()
+    assert q.join()
+    assert ran == ["blocker", "late"]
+    stats = q.stats()
+    assert stats["rejected"] == 1 and stats["dropped"] == 2 and stats["failed"] == 1
+    assert isinstance(errors[0], ZeroDivisionError)
+
+
+def test_plex_session_key_only_coalesces_playback_state() -> None:
+    payload = {"event": "media.pause", "Account": {"id": 1}, "Player": {"uuid": "p"}, "Metadata": {"ratingKey": "9"}}
+    key, coalesce = plex_session_key(payload, "default")
+    assert key == ("plex", "default", "1", "p", "9") and coalesce
+    assert plex_session_key({**payload, "event": "media.scrobble"}, "default") == (key, False)
+
+
+def test_trakt_id_cache_evicts_least_recent_and_expires(monkeypatch) -> None:
+    from providers.webhooks import plex
+
+    now = [0.0]
+    monkeypatch.setattr(plex, "_TRAKT_ID_CACHE", TTLCache(maxsize=2, ttl=60.0, clock=lambda: now[0]))
+    plex._cache_put(("movie", "a"), 1)
+    plex._cache_put(("movie", "b"), 2)
+    assert plex._cache_get(("movie", "a")) == 1
+    plex._cache_put(("movie", "c"), 3)
+    assert plex._cache_get(("movie", "b")) is None and plex._cache_get(("movie", "a")) == 1
+    now[0] = 61.0
+    assert plex._cache_get(("movie", "c")) is None
+
+
+def test_plex_precheck_validates_signature_before_queueing() -> None:
+    from providers.webhooks import plex
+
+    cfg = {"scrobble": {"enabled": True, "sources": {"webhook": True}}, "plex": {"webhook_secret": "s3"}}
+    raw = b'{"event": "media.play"}'
+    sig = base64.b64encode(hmac.new(b"s3", raw, hashlib.sha1).digest()).decode("ascii")
+    assert plex.precheck_webhook({"event": "media.play"}, {"X-Plex-Signature": sig}, raw, cfg=cfg) is None
+    assert plex.precheck_webhook({"event": "media.play"}, {"X-Plex-Signature": "bad"}, raw, cfg=cfg) == {"ok": False, "error": "invalid_signature"}
+    assert plex.precheck_webhook({}, {"X-Plex-Signature": sig}, raw, cfg=cfg) == {"ok": True, "ignored": True}
+
+
+def test_webhook_routes_are_resolved_once_per_config_generation(monkeypatch) -> None:
+    from api import scrobbleAPI
+
+    gen = [1]
+    calls: list[str] = []
+
+    def resolve(request: Request, provider: str, legacy_key: str) -> tuple[dict[str, Any], str, None]:
+        calls.append(provider)
+        return {"scrobble": {"webhook": {"sinks": ["trakt"]}}}, "default", None
+
+    monkeypatch.setattr(scrobbleAPI, "_WEBHOOK_ROUTES", TTLCache(maxsize=8))
+    monkeypatch.setattr(scrobbleAPI, "_resolve_media_webhook_request", resolve)
+    monkeypatch.setattr(scrobbleAPI, "config_generation", lambda: (gen[0], "cfg", 0))
+    request = Request({"type": "http", "method": "POST", "path": "/webhook/plex", "query_string": b"token=abc", "headers": []})
+
+    first, inst, err = scrobbleAPI._cached_media_webhook_route(request, "plex", "plextrakt")
+    first["scrobble"]["webhook"]["sinks"].append("simkl")
+    second, _, _ = scrobbleAPI._cached_media_webhook_route(request, "plex", "plextrakt")
+    assert calls == ["plex"] and inst == "default" and err is None
+    assert second["scrobble"]["webhook"]["sinks"] == ["trakt"]
+
+    gen[0] = 2
+    scrobbleAPI._cached_media_webhook_route(request, "plex", "plextrakt")
+    assert calls == ["plex", "plex"]
+
+
+def test_plex_webhook_acks_before_processing_and_refuses_when_full(monkeypatch) -> None:
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from api import scrobbleAPI
+    from providers.webhooks import plex
+
+    cfg = {"scrobble": {"enabled": True, "sources": {"webhook": True}}, "plex": {}}
+    started, gate = threading.Event(), threading.Event()
+    seen: list[str] = []
+
+    def process(payload: dict[str, Any], **_kw: Any) -> dict[str, Any]:
+        seen.append(payload["event"])
+        started.set()
+        gate.wait(5)
+        return {"ok": True, "action": "none"}
+
+    queue = WebhookQueue("test", maxsize=1)
+    monkeypatch.setattr(scrobbleAPI, "WEBHOOK_QUEUE", queue)
+    monkeypatch.setattr(scrobbleAPI, "_cached_media_webhook_route", lambda *_a: (cfg, "default", None))
+    monkeypatch.setattr(scrobbleAPI, "_emit_scheduler_webhook_event", lambda *_a: None)
+    monkeypatch.setattr(scrobbleAPI, "_emit_activity_webhook_event", lambda *_a: None)
+    monkeypatch.setattr(plex, "process_webhook", process)
+    app = FastAPI()
+    app.include_router(scrobbleAPI.router)
+    client = TestClient(app)
+
+    def event(name: str) -> dict[str, Any]:
+        return {"event": name, "Account": {"id": 1}, "Player": {"uuid": "p"}, "Metadata": {"ratingKey": "9", "type": "movie"}}
+
+    first = client.post("/webhook/plex", json=event("media.play"))
+    # Acked while the event is still being processed on the worker.
+    assert first.status_code == 200 and first.json() == {"ok": True, "queued": "queued"}
+    assert started.wait(5) and not gate.is_set()
+
+    assert client.post("/webhook/plex", json=event("media.scrobble")).json()["queued"] == "queued"
+    full = client.post("/webhook/plex", json=event("media.stop"))
+    assert full.status_code == 503 and full.headers.get("retry-after") == "5"
+    assert client.post("/webhook/plex", json={}).json() == {"ok": True, "ignored": True}
+
+    gate.set()
+    assert queue.join()
+    assert seen == ["media.play", "media.scrobble"]
+    assert queue.stats()["rejected"] == 1 and queue.stats()["processed"] == 2